@@ -144,6 +144,8 @@ rst_epilog = """
 
 .. |_Cell| replace:: :class:`_Cell`
 
+.. |_CellRange| replace:: :class:`_CellRange`
+
 .. |Chart| replace:: :class:`.Chart`
 
 .. |ChartData| replace:: :class:`.ChartData`
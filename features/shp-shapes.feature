@@ -6,7 +6,7 @@ Feature: Access a shape on a slide
 
   Scenario: _BaseShapes.turbo_add_enabled default
     Given a _BaseShapes object as shapes
-     Then shapes.turbo_add_enabled is False
+     Then shapes.turbo_add_enabled is True
 
 
   Scenario: _BaseShapes.turbo_add_enabled turned on
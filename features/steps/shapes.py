@@ -325,10 +325,10 @@ def then_shapes_title_is_the_title_placeholder(context):
     assert title_placeholder.shape_id == 4
 
 
-@then('shapes.turbo_add_enabled is False')
-def then_shapes_turbo_add_enabled_is_False(context):
+@then('shapes.turbo_add_enabled is True')
+def then_shapes_turbo_add_enabled_is_True(context):
     shapes = context.shapes
-    assert shapes.turbo_add_enabled is False
+    assert shapes.turbo_add_enabled is True
 
 
 @then('the table appears in the slide')
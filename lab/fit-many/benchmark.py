@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Time fitting the text of many textboxes with TextFrame.fit_text() one at a
+time against pptx.text.fit_many() serially and in thread and process pools.
+
+Run from the repository root:
+
+    python lab/fit-many/benchmark.py [--frames N] [--workers N]
+"""
+
+from __future__ import absolute_import, print_function
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..')
+)
+
+from pptx import Presentation  # noqa: E402
+from pptx.text import fit_many  # noqa: E402
+from pptx.util import Inches  # noqa: E402
+
+FONT_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'tests',
+    'test_files', 'calibriz.ttf'
+)
+MAX_SIZE = 28
+WORDS = (
+    'lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod '
+    'tempor'
+).split()
+
+
+def build_text_frames(count, seed=0):
+    """
+    Return a list of *count* text frames, ten textboxes to a slide, each
+    holding a random run of words in a randomly-sized box.
+    """
+    rng = random.Random(seed)
+    prs = Presentation()
+    text_frames = []
+    for _ in range((count + 9) // 10):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        for _ in range(10):
+            textbox = slide.shapes.add_textbox(
+                Inches(1), Inches(1), Inches(rng.choice([2, 3, 4])),
+                Inches(rng.choice([1, 2]))
+            )
+            textbox.text_frame.text = ' '.join(
+                rng.choice(WORDS) for _ in range(rng.randint(5, 80))
+            )
+            text_frames.append(textbox.text_frame)
+    return text_frames[:count]
+
+
+def timed(fit, count):
+    """Return seconds taken by *fit* on a freshly built set of frames."""
+    text_frames = build_text_frames(count)
+    start = time.time()
+    fit(text_frames)
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--frames', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+    count, workers = args.frames, args.workers
+
+    cases = (
+        ('fit_text, one at a time', lambda tfs: [
+            tf.fit_text(max_size=MAX_SIZE, font_file=FONT_FILE) for tf in tfs
+        ]),
+        ('fit_many, default', lambda tfs: fit_many(
+            tfs, max_size=MAX_SIZE, font_file=FONT_FILE
+        )),
+        ('fit_many, workers=1', lambda tfs: fit_many(
+            tfs, max_size=MAX_SIZE, font_file=FONT_FILE, workers=1
+        )),
+        ('fit_many, %d threads' % workers, lambda tfs: fit_many(
+            tfs, max_size=MAX_SIZE, font_file=FONT_FILE, workers=workers,
+            use_threads=True
+        )),
+        ('fit_many, %d processes' % workers, lambda tfs: fit_many(
+            tfs, max_size=MAX_SIZE, font_file=FONT_FILE, workers=workers
+        )),
+    )
+    print('%d text frames' % count)
+    for label, fit in cases:
+        print('  %-26s %6.2fs' % (label, timed(fit, count)))
+
+
+if __name__ == '__main__':
+    main()
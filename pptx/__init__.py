@@ -10,7 +10,7 @@ import sys
 sys.modules['pptx.exceptions'] = exceptions
 del sys
 
-from pptx.api import Presentation  # noqa
+from pptx.api import Presentation, cached_proxies, fast_writes  # noqa
 
 from pptx.opc.constants import CONTENT_TYPE as CT  # noqa: E402
 from pptx.opc.package import PartFactory  # noqa: E402
@@ -1,10 +1,11 @@
 # encoding: utf-8
 
 """
-Directly exposed API classes, Presentation for now. Provides some syntactic
-sugar for interacting with the pptx.presentation.Package graph and also
-provides some insulation so not so many classes in the other modules need to
-be named as internal (leading underscore).
+Directly exposed API classes and functions, Presentation, fast_writes and
+cached_proxies for now. Provides some syntactic sugar for interacting with
+the pptx.presentation.Package graph and also provides some insulation so not
+so many classes in the other modules need to be named as internal (leading
+underscore).
 """
 
 from __future__ import (
@@ -14,7 +15,9 @@ from __future__ import (
 import os
 
 from .opc.constants import CONTENT_TYPE as CT
+from .oxml.simpletypes import fast_writes  # noqa: F401
 from .package import Package
+from .shared import cached_proxies  # noqa: F401
 
 
 def Presentation(pptx=None):
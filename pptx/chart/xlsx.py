@@ -8,8 +8,6 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 from contextlib import contextmanager
 
-from xlsxwriter import Workbook
-
 from ..compat import BytesIO
 
 
@@ -39,7 +37,12 @@ class _BaseWorkbookWriter(object):
         then automatically closed within a `with` statement. A filename or
         stream object (such as a ``BytesIO`` instance) is expected as
         *xlsx_file*.
+
+        XlsxWriter is imported on first use so that loading the chart
+        subsystem does not require it until a workbook is actually written.
         """
+        from xlsxwriter import Workbook
+
         workbook = Workbook(xlsx_file, {'in_memory': True})
         worksheet = workbook.add_worksheet()
         yield workbook, worksheet
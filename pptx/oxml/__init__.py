@@ -11,6 +11,8 @@ from __future__ import (
 
 import os
 
+from copy import deepcopy
+
 from lxml import etree
 
 from .ns import NamespacePrefixedTag
@@ -21,19 +23,55 @@ element_class_lookup = etree.ElementNamespaceClassLookup()
 oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
 oxml_parser.set_element_class_lookup(element_class_lookup)
 
+# ---prototype elements copied by clone_prototype(), keyed by caller
+_prototypes = {}
+
+
+def escape_xml(text):
+    """
+    Return *text* with the characters ``&``, ``<``, ``>`` and ``"`` replaced
+    by entity references, suitable for an element's text or a double-quoted
+    attribute value in generated XML. Used in preference to
+    :func:`xml.sax.saxutils.escape`, which imports the urllib and email
+    packages and so adds considerably to the time taken by ``import pptx``.
+    """
+    return (
+        text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        .replace('"', '&quot;')
+    )
+
+
+def clone_prototype(key, xml_factory):
+    """
+    Return a new copy of the prototype element registered under *key*.
+
+    The first time *key* is seen, *xml_factory* is called with no arguments
+    and the XML it returns is parsed to produce the prototype. Later calls
+    skip the parser entirely and just deep-copy the prototype, which is
+    considerably faster. *key* must identify the XML uniquely, so variable
+    values that are not patched by the caller need to be part of it. The
+    prototype itself is never handed out and so cannot be changed.
+    """
+    prototype = _prototypes.get(key)
+    if prototype is None:
+        prototype = _prototypes[key] = parse_xml(xml_factory())
+    return deepcopy(prototype)
+
 
 def parse_from_template(template_name):
     """
     Return an element loaded from the XML in the template file identified by
-    *template_name*.
+    *template_name*. The file is only read and parsed on first use.
     """
-    thisdir = os.path.split(__file__)[0]
-    filename = os.path.join(
-        thisdir, '..', 'templates', '%s.xml' % template_name
-    )
-    with open(filename, 'rb') as f:
-        xml = f.read()
-    return parse_xml(xml)
+    def read_template():
+        thisdir = os.path.split(__file__)[0]
+        filename = os.path.join(
+            thisdir, '..', 'templates', '%s.xml' % template_name
+        )
+        with open(filename, 'rb') as f:
+            return f.read()
+
+    return clone_prototype(('template', template_name), read_template)
 
 
 def parse_xml(xml):
@@ -0,0 +1,13389 @@
+# encoding: utf-8
+# flake8: noqa
+
+"""
+Pre-generated members for the custom element classes in |pptx.oxml|.
+
+GENERATED by ``python -m pptx.oxml.codegen``; do not edit by hand. Each
+entry in ``members`` maps a custom element class to the member operations
+that reproduce what the |MetaOxmlElement| metaclass would otherwise build
+from its declarations.
+"""
+
+from __future__ import absolute_import, print_function
+
+from pptx.enum.chart import (
+    XL_AXIS_CROSSES, XL_DATA_LABEL_POSITION, XL_LEGEND_POSITION,
+    XL_MARKER_STYLE, XL_TICK_LABEL_POSITION, XL_TICK_MARK
+)
+from pptx.enum.dml import (
+    MSO_LINE_DASH_STYLE, MSO_PATTERN_TYPE, MSO_THEME_COLOR_INDEX
+)
+from pptx.enum.lang import MSO_LANGUAGE_ID
+from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE, PP_PLACEHOLDER_TYPE
+from pptx.enum.text import (
+    MSO_TEXT_UNDERLINE_TYPE, MSO_VERTICAL_ANCHOR, PP_PARAGRAPH_ALIGNMENT
+)
+from pptx.exc import InvalidXmlError
+from pptx.oxml import oxml_parser
+from pptx.oxml.simpletypes import (
+    ST_Angle, ST_AxisUnit, ST_BarDir, ST_BubbleScale, ST_ContentType,
+    ST_Coordinate, ST_Coordinate32, ST_Direction, ST_DrawingElementId,
+    ST_Extension, ST_GapAmount, ST_Grouping, ST_HexColorRGB, ST_LayoutMode,
+    ST_LblOffset, ST_LineWidth, ST_MarkerSize, ST_Overlap, ST_Percentage,
+    ST_PlaceholderSize, ST_PositiveCoordinate, ST_PositiveFixedAngle,
+    ST_PositiveFixedPercentage, ST_RelationshipId, ST_SlideId,
+    ST_SlideSizeCoordinate, ST_Style, ST_TargetMode,
+    ST_TextFontScalePercentOrPercentString, ST_TextFontSize,
+    ST_TextIndentLevelType, ST_TextSpacingPercentOrPercentString,
+    ST_TextSpacingPoint, ST_TextTypeface, ST_TextWrappingType, XsdAnyUri,
+    XsdBoolean, XsdDouble, XsdId, XsdInt, XsdString, XsdUnsignedInt
+)
+from pptx.util import Emu
+
+_nsmap_a = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
+_nsmap_c = {'c': 'http://schemas.openxmlformats.org/drawingml/2006/chart'}
+_nsmap_cp = {'cp': 'http://schemas.openxmlformats.org/package/2006/metadata/core-properties'}
+_nsmap_ct = {'ct': 'http://schemas.openxmlformats.org/package/2006/content-types'}
+_nsmap_dc = {'dc': 'http://purl.org/dc/elements/1.1/'}
+_nsmap_dcterms = {'dcterms': 'http://purl.org/dc/terms/'}
+_nsmap_p = {'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'}
+_nsmap_pr = {'pr': 'http://schemas.openxmlformats.org/package/2006/relationships'}
+
+members = {}
+
+
+# pptx.opc.oxml.CT_Default --------------------------------------------------
+
+def _CT_Default_extension_get(obj):
+    'ST_Extension type-converted value of ``Extension`` attribute.'
+    attr_str_value = obj.get('Extension')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'Extension' attribute not present on element %s" % obj.tag
+        )
+    return ST_Extension.from_xml(attr_str_value)
+
+def _CT_Default_extension_set(obj, value):
+    str_value = ST_Extension.to_xml(value)
+    obj.set('Extension', str_value)
+
+def _CT_Default_contentType_get(obj):
+    'ST_ContentType type-converted value of ``ContentType`` attribute.'
+    attr_str_value = obj.get('ContentType')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'ContentType' attribute not present on element %s" % obj.tag
+        )
+    return ST_ContentType.from_xml(attr_str_value)
+
+def _CT_Default_contentType_set(obj, value):
+    str_value = ST_ContentType.to_xml(value)
+    obj.set('ContentType', str_value)
+
+
+members['pptx.opc.oxml.CT_Default'] = (
+    ('set', 'extension', property(_CT_Default_extension_get, _CT_Default_extension_set, None)),
+    ('set', 'contentType', property(_CT_Default_contentType_get, _CT_Default_contentType_set, None)),
+)
+
+
+# pptx.opc.oxml.CT_Override -------------------------------------------------
+
+def _CT_Override_partName_get(obj):
+    'XsdAnyUri type-converted value of ``PartName`` attribute.'
+    attr_str_value = obj.get('PartName')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'PartName' attribute not present on element %s" % obj.tag
+        )
+    return XsdAnyUri.from_xml(attr_str_value)
+
+def _CT_Override_partName_set(obj, value):
+    str_value = XsdAnyUri.to_xml(value)
+    obj.set('PartName', str_value)
+
+def _CT_Override_contentType_get(obj):
+    'ST_ContentType type-converted value of ``ContentType`` attribute.'
+    attr_str_value = obj.get('ContentType')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'ContentType' attribute not present on element %s" % obj.tag
+        )
+    return ST_ContentType.from_xml(attr_str_value)
+
+def _CT_Override_contentType_set(obj, value):
+    str_value = ST_ContentType.to_xml(value)
+    obj.set('ContentType', str_value)
+
+
+members['pptx.opc.oxml.CT_Override'] = (
+    ('set', 'partName', property(_CT_Override_partName_get, _CT_Override_partName_set, None)),
+    ('set', 'contentType', property(_CT_Override_contentType_get, _CT_Override_contentType_set, None)),
+)
+
+
+# pptx.opc.oxml.CT_Relationship ---------------------------------------------
+
+def _CT_Relationship_rId_get(obj):
+    'XsdId type-converted value of ``Id`` attribute.'
+    attr_str_value = obj.get('Id')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'Id' attribute not present on element %s" % obj.tag
+        )
+    return XsdId.from_xml(attr_str_value)
+
+def _CT_Relationship_rId_set(obj, value):
+    str_value = XsdId.to_xml(value)
+    obj.set('Id', str_value)
+
+def _CT_Relationship_reltype_get(obj):
+    'XsdAnyUri type-converted value of ``Type`` attribute.'
+    attr_str_value = obj.get('Type')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'Type' attribute not present on element %s" % obj.tag
+        )
+    return XsdAnyUri.from_xml(attr_str_value)
+
+def _CT_Relationship_reltype_set(obj, value):
+    str_value = XsdAnyUri.to_xml(value)
+    obj.set('Type', str_value)
+
+def _CT_Relationship_target_ref_get(obj):
+    'XsdAnyUri type-converted value of ``Target`` attribute.'
+    attr_str_value = obj.get('Target')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'Target' attribute not present on element %s" % obj.tag
+        )
+    return XsdAnyUri.from_xml(attr_str_value)
+
+def _CT_Relationship_target_ref_set(obj, value):
+    str_value = XsdAnyUri.to_xml(value)
+    obj.set('Target', str_value)
+
+def _CT_Relationship_targetMode_get(obj):
+    'ST_TargetMode type-converted value of ``TargetMode`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('TargetMode')
+    if attr_str_value is None:
+        return 'Internal'
+    return ST_TargetMode.from_xml(attr_str_value)
+
+def _CT_Relationship_targetMode_set(obj, value):
+    if value == 'Internal':
+        if 'TargetMode' in obj.attrib:
+            del obj.attrib['TargetMode']
+        return
+    str_value = ST_TargetMode.to_xml(value)
+    obj.set('TargetMode', str_value)
+
+
+members['pptx.opc.oxml.CT_Relationship'] = (
+    ('set', 'rId', property(_CT_Relationship_rId_get, _CT_Relationship_rId_set, None)),
+    ('set', 'reltype', property(_CT_Relationship_reltype_get, _CT_Relationship_reltype_set, None)),
+    ('set', 'target_ref', property(_CT_Relationship_target_ref_get, _CT_Relationship_target_ref_set, None)),
+    ('set', 'targetMode', property(_CT_Relationship_targetMode_get, _CT_Relationship_targetMode_set, None)),
+)
+
+
+# pptx.opc.oxml.CT_Relationships --------------------------------------------
+
+def _CT_Relationships_relationship_lst(obj):
+    'A list containing each of the ``<pr:Relationship>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/package/2006/relationships}Relationship')
+
+def _CT_Relationships_new_relationship(obj):
+    'Return a "loose", newly created ``<pr:Relationship>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/package/2006/relationships}Relationship', nsmap=_nsmap_pr)
+
+def _CT_Relationships_insert_relationship(obj, child):
+    'Return the passed ``<pr:Relationship>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Relationships_add_relationship(obj, **attrs):
+    'Add a new ``<pr:Relationship>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_relationship()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_relationship(child)
+    return child
+
+
+members['pptx.opc.oxml.CT_Relationships'] = (
+    ('set', 'relationship_lst', property(_CT_Relationships_relationship_lst, None, None)),
+    ('add', '_new_relationship', _CT_Relationships_new_relationship),
+    ('add', '_insert_relationship', _CT_Relationships_insert_relationship),
+    ('add', '_add_relationship', _CT_Relationships_add_relationship),
+    ('del', 'relationship'),
+)
+
+
+# pptx.opc.oxml.CT_Types ----------------------------------------------------
+
+def _CT_Types_default_lst(obj):
+    'A list containing each of the ``<ct:Default>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/package/2006/content-types}Default')
+
+def _CT_Types_new_default(obj):
+    'Return a "loose", newly created ``<ct:Default>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/package/2006/content-types}Default', nsmap=_nsmap_ct)
+
+def _CT_Types_insert_default(obj, child):
+    'Return the passed ``<ct:Default>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Types_add_default(obj, **attrs):
+    'Add a new ``<ct:Default>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_default()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_default(child)
+    return child
+
+def _CT_Types_override_lst(obj):
+    'A list containing each of the ``<ct:Override>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/package/2006/content-types}Override')
+
+def _CT_Types_new_override(obj):
+    'Return a "loose", newly created ``<ct:Override>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/package/2006/content-types}Override', nsmap=_nsmap_ct)
+
+def _CT_Types_insert_override(obj, child):
+    'Return the passed ``<ct:Override>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Types_add_override(obj, **attrs):
+    'Add a new ``<ct:Override>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_override()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_override(child)
+    return child
+
+
+members['pptx.opc.oxml.CT_Types'] = (
+    ('set', 'default_lst', property(_CT_Types_default_lst, None, None)),
+    ('add', '_new_default', _CT_Types_new_default),
+    ('add', '_insert_default', _CT_Types_insert_default),
+    ('add', '_add_default', _CT_Types_add_default),
+    ('del', 'default'),
+    ('set', 'override_lst', property(_CT_Types_override_lst, None, None)),
+    ('add', '_new_override', _CT_Types_new_override),
+    ('add', '_insert_override', _CT_Types_insert_override),
+    ('add', '_add_override', _CT_Types_add_override),
+    ('del', 'override'),
+)
+
+
+# pptx.oxml.action.CT_Hyperlink ---------------------------------------------
+
+def _CT_Hyperlink_rId_get(obj):
+    'XsdString type-converted value of ``r:id`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id')
+    if attr_str_value is None:
+        return None
+    return XsdString.from_xml(attr_str_value)
+
+def _CT_Hyperlink_rId_set(obj, value):
+    if value == None:
+        if '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id' in obj.attrib:
+            del obj.attrib['{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id']
+        return
+    str_value = XsdString.to_xml(value)
+    obj.set('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id', str_value)
+
+def _CT_Hyperlink_action_get(obj):
+    'XsdString type-converted value of ``action`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('action')
+    if attr_str_value is None:
+        return None
+    return XsdString.from_xml(attr_str_value)
+
+def _CT_Hyperlink_action_set(obj, value):
+    if value == None:
+        if 'action' in obj.attrib:
+            del obj.attrib['action']
+        return
+    str_value = XsdString.to_xml(value)
+    obj.set('action', str_value)
+
+
+members['pptx.oxml.action.CT_Hyperlink'] = (
+    ('set', 'rId', property(_CT_Hyperlink_rId_get, _CT_Hyperlink_rId_set, None)),
+    ('set', 'action', property(_CT_Hyperlink_action_get, _CT_Hyperlink_action_set, None)),
+)
+
+
+# pptx.oxml.chart.axis.CT_AxisUnit ------------------------------------------
+
+def _CT_AxisUnit_val_get(obj):
+    'ST_AxisUnit type-converted value of ``val`` attribute.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'val' attribute not present on element %s" % obj.tag
+        )
+    return ST_AxisUnit.from_xml(attr_str_value)
+
+def _CT_AxisUnit_val_set(obj, value):
+    str_value = ST_AxisUnit.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.axis.CT_AxisUnit'] = (
+    ('set', 'val', property(_CT_AxisUnit_val_get, _CT_AxisUnit_val_set, None)),
+)
+
+
+# pptx.oxml.chart.axis.CT_CatAx ---------------------------------------------
+
+def _CT_CatAx_scaling(obj):
+    'Required ``<c:scaling>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}scaling')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<c:scaling>`` child element not present'
+        )
+    return child
+
+def _CT_CatAx_delete_(obj):
+    '``<c:delete>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}delete')
+
+def _CT_CatAx_new_delete_(obj):
+    'Return a "loose", newly created ``<c:delete>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}delete', nsmap=_nsmap_c)
+
+def _CT_CatAx_insert_delete_(obj, child):
+    'Return the passed ``<c:delete>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}axPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorGridlines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorGridlines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}title', '{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblAlgn', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickMarkSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}noMultiLvlLbl', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_CatAx_add_delete_(obj, **attrs):
+    'Add a new ``<c:delete>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_delete_()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_delete_(child)
+    return child
+
+def _CT_CatAx_get_or_add_delete_(obj):
+    'Return the ``<c:delete>`` child element, newly added if not present.'
+    child = obj.delete_
+    if child is None:
+        child = obj._add_delete_()
+    return child
+
+def _CT_CatAx_remove_delete_(obj):
+    'Remove all ``<c:delete>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}delete'):
+        obj.remove(child)
+
+def _CT_CatAx_majorGridlines(obj):
+    '``<c:majorGridlines>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorGridlines')
+
+def _CT_CatAx_new_majorGridlines(obj):
+    'Return a "loose", newly created ``<c:majorGridlines>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorGridlines', nsmap=_nsmap_c)
+
+def _CT_CatAx_insert_majorGridlines(obj, child):
+    'Return the passed ``<c:majorGridlines>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorGridlines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}title', '{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblAlgn', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickMarkSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}noMultiLvlLbl', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_CatAx_add_majorGridlines(obj, **attrs):
+    'Add a new ``<c:majorGridlines>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_majorGridlines()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_majorGridlines(child)
+    return child
+
+def _CT_CatAx_get_or_add_majorGridlines(obj):
+    'Return the ``<c:majorGridlines>`` child element, newly added if not present.'
+    child = obj.majorGridlines
+    if child is None:
+        child = obj._add_majorGridlines()
+    return child
+
+def _CT_CatAx_remove_majorGridlines(obj):
+    'Remove all ``<c:majorGridlines>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorGridlines'):
+        obj.remove(child)
+
+def _CT_CatAx_minorGridlines(obj):
+    '``<c:minorGridlines>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorGridlines')
+
+def _CT_CatAx_new_minorGridlines(obj):
+    'Return a "loose", newly created ``<c:minorGridlines>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorGridlines', nsmap=_nsmap_c)
+
+def _CT_CatAx_insert_minorGridlines(obj, child):
+    'Return the passed ``<c:minorGridlines>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}title', '{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblAlgn', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickMarkSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}noMultiLvlLbl', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_CatAx_add_minorGridlines(obj, **attrs):
+    'Add a new ``<c:minorGridlines>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_minorGridlines()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_minorGridlines(child)
+    return child
+
+def _CT_CatAx_get_or_add_minorGridlines(obj):
+    'Return the ``<c:minorGridlines>`` child element, newly added if not present.'
+    child = obj.minorGridlines
+    if child is None:
+        child = obj._add_minorGridlines()
+    return child
+
+def _CT_CatAx_remove_minorGridlines(obj):
+    'Remove all ``<c:minorGridlines>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorGridlines'):
+        obj.remove(child)
+
+def _CT_CatAx_title(obj):
+    '``<c:title>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}title')
+
+def _CT_CatAx_new_title(obj):
+    'Return a "loose", newly created ``<c:title>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}title', nsmap=_nsmap_c)
+
+def _CT_CatAx_insert_title(obj, child):
+    'Return the passed ``<c:title>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblAlgn', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickMarkSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}noMultiLvlLbl', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_CatAx_add_title(obj, **attrs):
+    'Add a new ``<c:title>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_title()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_title(child)
+    return child
+
+def _CT_CatAx_get_or_add_title(obj):
+    'Return the ``<c:title>`` child element, newly added if not present.'
+    child = obj.title
+    if child is None:
+        child = obj._add_title()
+    return child
+
+def _CT_CatAx_remove_title(obj):
+    'Remove all ``<c:title>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}title'):
+        obj.remove(child)
+
+def _CT_CatAx_numFmt(obj):
+    '``<c:numFmt>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt')
+
+def _CT_CatAx_new_numFmt(obj):
+    'Return a "loose", newly created ``<c:numFmt>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt', nsmap=_nsmap_c)
+
+def _CT_CatAx_insert_numFmt(obj, child):
+    'Return the passed ``<c:numFmt>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblAlgn', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickMarkSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}noMultiLvlLbl', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_CatAx_add_numFmt(obj, **attrs):
+    'Add a new ``<c:numFmt>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_numFmt()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_numFmt(child)
+    return child
+
+def _CT_CatAx_get_or_add_numFmt(obj):
+    'Return the ``<c:numFmt>`` child element, newly added if not present.'
+    child = obj.numFmt
+    if child is None:
+        child = obj._add_numFmt()
+    return child
+
+def _CT_CatAx_remove_numFmt(obj):
+    'Remove all ``<c:numFmt>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt'):
+        obj.remove(child)
+
+def _CT_CatAx_majorTickMark(obj):
+    '``<c:majorTickMark>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark')
+
+def _CT_CatAx_new_majorTickMark(obj):
+    'Return a "loose", newly created ``<c:majorTickMark>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark', nsmap=_nsmap_c)
+
+def _CT_CatAx_insert_majorTickMark(obj, child):
+    'Return the passed ``<c:majorTickMark>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblAlgn', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickMarkSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}noMultiLvlLbl', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_CatAx_add_majorTickMark(obj, **attrs):
+    'Add a new ``<c:majorTickMark>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_majorTickMark()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_majorTickMark(child)
+    return child
+
+def _CT_CatAx_get_or_add_majorTickMark(obj):
+    'Return the ``<c:majorTickMark>`` child element, newly added if not present.'
+    child = obj.majorTickMark
+    if child is None:
+        child = obj._add_majorTickMark()
+    return child
+
+def _CT_CatAx_remove_majorTickMark(obj):
+    'Remove all ``<c:majorTickMark>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark'):
+        obj.remove(child)
+
+def _CT_CatAx_minorTickMark(obj):
+    '``<c:minorTickMark>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark')
+
+def _CT_CatAx_new_minorTickMark(obj):
+    'Return a "loose", newly created ``<c:minorTickMark>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', nsmap=_nsmap_c)
+
+def _CT_CatAx_insert_minorTickMark(obj, child):
+    'Return the passed ``<c:minorTickMark>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblAlgn', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickMarkSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}noMultiLvlLbl', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_CatAx_add_minorTickMark(obj, **attrs):
+    'Add a new ``<c:minorTickMark>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_minorTickMark()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_minorTickMark(child)
+    return child
+
+def _CT_CatAx_get_or_add_minorTickMark(obj):
+    'Return the ``<c:minorTickMark>`` child element, newly added if not present.'
+    child = obj.minorTickMark
+    if child is None:
+        child = obj._add_minorTickMark()
+    return child
+
+def _CT_CatAx_remove_minorTickMark(obj):
+    'Remove all ``<c:minorTickMark>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark'):
+        obj.remove(child)
+
+def _CT_CatAx_tickLblPos(obj):
+    '``<c:tickLblPos>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos')
+
+def _CT_CatAx_new_tickLblPos(obj):
+    'Return a "loose", newly created ``<c:tickLblPos>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', nsmap=_nsmap_c)
+
+def _CT_CatAx_insert_tickLblPos(obj, child):
+    'Return the passed ``<c:tickLblPos>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblAlgn', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickMarkSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}noMultiLvlLbl', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_CatAx_add_tickLblPos(obj, **attrs):
+    'Add a new ``<c:tickLblPos>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_tickLblPos()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_tickLblPos(child)
+    return child
+
+def _CT_CatAx_get_or_add_tickLblPos(obj):
+    'Return the ``<c:tickLblPos>`` child element, newly added if not present.'
+    child = obj.tickLblPos
+    if child is None:
+        child = obj._add_tickLblPos()
+    return child
+
+def _CT_CatAx_remove_tickLblPos(obj):
+    'Remove all ``<c:tickLblPos>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos'):
+        obj.remove(child)
+
+def _CT_CatAx_spPr(obj):
+    '``<c:spPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr')
+
+def _CT_CatAx_new_spPr(obj):
+    'Return a "loose", newly created ``<c:spPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', nsmap=_nsmap_c)
+
+def _CT_CatAx_insert_spPr(obj, child):
+    'Return the passed ``<c:spPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblAlgn', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickMarkSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}noMultiLvlLbl', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_CatAx_add_spPr(obj, **attrs):
+    'Add a new ``<c:spPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_spPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_spPr(child)
+    return child
+
+def _CT_CatAx_get_or_add_spPr(obj):
+    'Return the ``<c:spPr>`` child element, newly added if not present.'
+    child = obj.spPr
+    if child is None:
+        child = obj._add_spPr()
+    return child
+
+def _CT_CatAx_remove_spPr(obj):
+    'Remove all ``<c:spPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr'):
+        obj.remove(child)
+
+def _CT_CatAx_txPr(obj):
+    '``<c:txPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr')
+
+def _CT_CatAx_new_txPr(obj):
+    'Return a "loose", newly created ``<c:txPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', nsmap=_nsmap_c)
+
+def _CT_CatAx_insert_txPr(obj, child):
+    'Return the passed ``<c:txPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblAlgn', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickMarkSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}noMultiLvlLbl', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_CatAx_add_txPr(obj, **attrs):
+    'Add a new ``<c:txPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_txPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_txPr(child)
+    return child
+
+def _CT_CatAx_get_or_add_txPr(obj):
+    'Return the ``<c:txPr>`` child element, newly added if not present.'
+    child = obj.txPr
+    if child is None:
+        child = obj._add_txPr()
+    return child
+
+def _CT_CatAx_remove_txPr(obj):
+    'Remove all ``<c:txPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr'):
+        obj.remove(child)
+
+def _CT_CatAx_crosses(obj):
+    '``<c:crosses>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses')
+
+def _CT_CatAx_new_crosses(obj):
+    'Return a "loose", newly created ``<c:crosses>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', nsmap=_nsmap_c)
+
+def _CT_CatAx_insert_crosses(obj, child):
+    'Return the passed ``<c:crosses>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblAlgn', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickMarkSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}noMultiLvlLbl', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_CatAx_add_crosses(obj, **attrs):
+    'Add a new ``<c:crosses>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_crosses()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_crosses(child)
+    return child
+
+def _CT_CatAx_get_or_add_crosses(obj):
+    'Return the ``<c:crosses>`` child element, newly added if not present.'
+    child = obj.crosses
+    if child is None:
+        child = obj._add_crosses()
+    return child
+
+def _CT_CatAx_remove_crosses(obj):
+    'Remove all ``<c:crosses>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses'):
+        obj.remove(child)
+
+def _CT_CatAx_crossesAt(obj):
+    '``<c:crossesAt>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt')
+
+def _CT_CatAx_new_crossesAt(obj):
+    'Return a "loose", newly created ``<c:crossesAt>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', nsmap=_nsmap_c)
+
+def _CT_CatAx_insert_crossesAt(obj, child):
+    'Return the passed ``<c:crossesAt>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblAlgn', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickMarkSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}noMultiLvlLbl', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_CatAx_add_crossesAt(obj, **attrs):
+    'Add a new ``<c:crossesAt>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_crossesAt()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_crossesAt(child)
+    return child
+
+def _CT_CatAx_get_or_add_crossesAt(obj):
+    'Return the ``<c:crossesAt>`` child element, newly added if not present.'
+    child = obj.crossesAt
+    if child is None:
+        child = obj._add_crossesAt()
+    return child
+
+def _CT_CatAx_remove_crossesAt(obj):
+    'Remove all ``<c:crossesAt>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt'):
+        obj.remove(child)
+
+def _CT_CatAx_lblOffset(obj):
+    '``<c:lblOffset>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset')
+
+def _CT_CatAx_new_lblOffset(obj):
+    'Return a "loose", newly created ``<c:lblOffset>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', nsmap=_nsmap_c)
+
+def _CT_CatAx_insert_lblOffset(obj, child):
+    'Return the passed ``<c:lblOffset>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickMarkSkip', '{http://schemas.openxmlformats.org/drawingml/2006/chart}noMultiLvlLbl', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_CatAx_add_lblOffset(obj, **attrs):
+    'Add a new ``<c:lblOffset>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_lblOffset()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_lblOffset(child)
+    return child
+
+def _CT_CatAx_get_or_add_lblOffset(obj):
+    'Return the ``<c:lblOffset>`` child element, newly added if not present.'
+    child = obj.lblOffset
+    if child is None:
+        child = obj._add_lblOffset()
+    return child
+
+def _CT_CatAx_remove_lblOffset(obj):
+    'Remove all ``<c:lblOffset>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.axis.CT_CatAx'] = (
+    ('set', 'scaling', property(_CT_CatAx_scaling, None, None)),
+    ('set', 'delete_', property(_CT_CatAx_delete_, None, None)),
+    ('add', '_new_delete_', _CT_CatAx_new_delete_),
+    ('add', '_insert_delete_', _CT_CatAx_insert_delete_),
+    ('add', '_add_delete_', _CT_CatAx_add_delete_),
+    ('add', 'get_or_add_delete_', _CT_CatAx_get_or_add_delete_),
+    ('add', '_remove_delete_', _CT_CatAx_remove_delete_),
+    ('set', 'majorGridlines', property(_CT_CatAx_majorGridlines, None, None)),
+    ('add', '_new_majorGridlines', _CT_CatAx_new_majorGridlines),
+    ('add', '_insert_majorGridlines', _CT_CatAx_insert_majorGridlines),
+    ('add', '_add_majorGridlines', _CT_CatAx_add_majorGridlines),
+    ('add', 'get_or_add_majorGridlines', _CT_CatAx_get_or_add_majorGridlines),
+    ('add', '_remove_majorGridlines', _CT_CatAx_remove_majorGridlines),
+    ('set', 'minorGridlines', property(_CT_CatAx_minorGridlines, None, None)),
+    ('add', '_new_minorGridlines', _CT_CatAx_new_minorGridlines),
+    ('add', '_insert_minorGridlines', _CT_CatAx_insert_minorGridlines),
+    ('add', '_add_minorGridlines', _CT_CatAx_add_minorGridlines),
+    ('add', 'get_or_add_minorGridlines', _CT_CatAx_get_or_add_minorGridlines),
+    ('add', '_remove_minorGridlines', _CT_CatAx_remove_minorGridlines),
+    ('set', 'title', property(_CT_CatAx_title, None, None)),
+    ('add', '_new_title', _CT_CatAx_new_title),
+    ('add', '_insert_title', _CT_CatAx_insert_title),
+    ('add', '_add_title', _CT_CatAx_add_title),
+    ('add', 'get_or_add_title', _CT_CatAx_get_or_add_title),
+    ('add', '_remove_title', _CT_CatAx_remove_title),
+    ('set', 'numFmt', property(_CT_CatAx_numFmt, None, None)),
+    ('add', '_new_numFmt', _CT_CatAx_new_numFmt),
+    ('add', '_insert_numFmt', _CT_CatAx_insert_numFmt),
+    ('add', '_add_numFmt', _CT_CatAx_add_numFmt),
+    ('add', 'get_or_add_numFmt', _CT_CatAx_get_or_add_numFmt),
+    ('add', '_remove_numFmt', _CT_CatAx_remove_numFmt),
+    ('set', 'majorTickMark', property(_CT_CatAx_majorTickMark, None, None)),
+    ('add', '_new_majorTickMark', _CT_CatAx_new_majorTickMark),
+    ('add', '_insert_majorTickMark', _CT_CatAx_insert_majorTickMark),
+    ('add', '_add_majorTickMark', _CT_CatAx_add_majorTickMark),
+    ('add', 'get_or_add_majorTickMark', _CT_CatAx_get_or_add_majorTickMark),
+    ('add', '_remove_majorTickMark', _CT_CatAx_remove_majorTickMark),
+    ('set', 'minorTickMark', property(_CT_CatAx_minorTickMark, None, None)),
+    ('add', '_new_minorTickMark', _CT_CatAx_new_minorTickMark),
+    ('add', '_insert_minorTickMark', _CT_CatAx_insert_minorTickMark),
+    ('add', '_add_minorTickMark', _CT_CatAx_add_minorTickMark),
+    ('add', 'get_or_add_minorTickMark', _CT_CatAx_get_or_add_minorTickMark),
+    ('add', '_remove_minorTickMark', _CT_CatAx_remove_minorTickMark),
+    ('set', 'tickLblPos', property(_CT_CatAx_tickLblPos, None, None)),
+    ('add', '_new_tickLblPos', _CT_CatAx_new_tickLblPos),
+    ('add', '_insert_tickLblPos', _CT_CatAx_insert_tickLblPos),
+    ('add', '_add_tickLblPos', _CT_CatAx_add_tickLblPos),
+    ('add', 'get_or_add_tickLblPos', _CT_CatAx_get_or_add_tickLblPos),
+    ('add', '_remove_tickLblPos', _CT_CatAx_remove_tickLblPos),
+    ('set', 'spPr', property(_CT_CatAx_spPr, None, None)),
+    ('add', '_new_spPr', _CT_CatAx_new_spPr),
+    ('add', '_insert_spPr', _CT_CatAx_insert_spPr),
+    ('add', '_add_spPr', _CT_CatAx_add_spPr),
+    ('add', 'get_or_add_spPr', _CT_CatAx_get_or_add_spPr),
+    ('add', '_remove_spPr', _CT_CatAx_remove_spPr),
+    ('set', 'txPr', property(_CT_CatAx_txPr, None, None)),
+    ('add', '_new_txPr', _CT_CatAx_new_txPr),
+    ('add', '_insert_txPr', _CT_CatAx_insert_txPr),
+    ('add', '_add_txPr', _CT_CatAx_add_txPr),
+    ('add', 'get_or_add_txPr', _CT_CatAx_get_or_add_txPr),
+    ('add', '_remove_txPr', _CT_CatAx_remove_txPr),
+    ('set', 'crosses', property(_CT_CatAx_crosses, None, None)),
+    ('add', '_new_crosses', _CT_CatAx_new_crosses),
+    ('add', '_insert_crosses', _CT_CatAx_insert_crosses),
+    ('add', '_add_crosses', _CT_CatAx_add_crosses),
+    ('add', 'get_or_add_crosses', _CT_CatAx_get_or_add_crosses),
+    ('add', '_remove_crosses', _CT_CatAx_remove_crosses),
+    ('set', 'crossesAt', property(_CT_CatAx_crossesAt, None, None)),
+    ('add', '_new_crossesAt', _CT_CatAx_new_crossesAt),
+    ('add', '_insert_crossesAt', _CT_CatAx_insert_crossesAt),
+    ('add', '_add_crossesAt', _CT_CatAx_add_crossesAt),
+    ('add', 'get_or_add_crossesAt', _CT_CatAx_get_or_add_crossesAt),
+    ('add', '_remove_crossesAt', _CT_CatAx_remove_crossesAt),
+    ('set', 'lblOffset', property(_CT_CatAx_lblOffset, None, None)),
+    ('add', '_new_lblOffset', _CT_CatAx_new_lblOffset),
+    ('add', '_insert_lblOffset', _CT_CatAx_insert_lblOffset),
+    ('add', '_add_lblOffset', _CT_CatAx_add_lblOffset),
+    ('add', 'get_or_add_lblOffset', _CT_CatAx_get_or_add_lblOffset),
+    ('add', '_remove_lblOffset', _CT_CatAx_remove_lblOffset),
+)
+
+
+# pptx.oxml.chart.axis.CT_ChartLines ----------------------------------------
+
+def _CT_ChartLines_spPr(obj):
+    '``<c:spPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr')
+
+def _CT_ChartLines_new_spPr(obj):
+    'Return a "loose", newly created ``<c:spPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', nsmap=_nsmap_c)
+
+def _CT_ChartLines_insert_spPr(obj, child):
+    'Return the passed ``<c:spPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_ChartLines_add_spPr(obj, **attrs):
+    'Add a new ``<c:spPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_spPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_spPr(child)
+    return child
+
+def _CT_ChartLines_get_or_add_spPr(obj):
+    'Return the ``<c:spPr>`` child element, newly added if not present.'
+    child = obj.spPr
+    if child is None:
+        child = obj._add_spPr()
+    return child
+
+def _CT_ChartLines_remove_spPr(obj):
+    'Remove all ``<c:spPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.axis.CT_ChartLines'] = (
+    ('set', 'spPr', property(_CT_ChartLines_spPr, None, None)),
+    ('add', '_new_spPr', _CT_ChartLines_new_spPr),
+    ('add', '_insert_spPr', _CT_ChartLines_insert_spPr),
+    ('add', '_add_spPr', _CT_ChartLines_add_spPr),
+    ('add', 'get_or_add_spPr', _CT_ChartLines_get_or_add_spPr),
+    ('add', '_remove_spPr', _CT_ChartLines_remove_spPr),
+)
+
+
+# pptx.oxml.chart.axis.CT_Crosses -------------------------------------------
+
+def _CT_Crosses_val_get(obj):
+    'XL_AXIS_CROSSES type-converted value of ``val`` attribute.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'val' attribute not present on element %s" % obj.tag
+        )
+    return XL_AXIS_CROSSES.from_xml(attr_str_value)
+
+def _CT_Crosses_val_set(obj, value):
+    str_value = XL_AXIS_CROSSES.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.axis.CT_Crosses'] = (
+    ('set', 'val', property(_CT_Crosses_val_get, _CT_Crosses_val_set, None)),
+)
+
+
+# pptx.oxml.chart.axis.CT_DateAx --------------------------------------------
+
+def _CT_DateAx_scaling(obj):
+    'Required ``<c:scaling>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}scaling')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<c:scaling>`` child element not present'
+        )
+    return child
+
+def _CT_DateAx_delete_(obj):
+    '``<c:delete>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}delete')
+
+def _CT_DateAx_new_delete_(obj):
+    'Return a "loose", newly created ``<c:delete>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}delete', nsmap=_nsmap_c)
+
+def _CT_DateAx_insert_delete_(obj, child):
+    'Return the passed ``<c:delete>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}axPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorGridlines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorGridlines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}title', '{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}baseTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DateAx_add_delete_(obj, **attrs):
+    'Add a new ``<c:delete>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_delete_()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_delete_(child)
+    return child
+
+def _CT_DateAx_get_or_add_delete_(obj):
+    'Return the ``<c:delete>`` child element, newly added if not present.'
+    child = obj.delete_
+    if child is None:
+        child = obj._add_delete_()
+    return child
+
+def _CT_DateAx_remove_delete_(obj):
+    'Remove all ``<c:delete>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}delete'):
+        obj.remove(child)
+
+def _CT_DateAx_majorGridlines(obj):
+    '``<c:majorGridlines>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorGridlines')
+
+def _CT_DateAx_new_majorGridlines(obj):
+    'Return a "loose", newly created ``<c:majorGridlines>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorGridlines', nsmap=_nsmap_c)
+
+def _CT_DateAx_insert_majorGridlines(obj, child):
+    'Return the passed ``<c:majorGridlines>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorGridlines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}title', '{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}baseTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DateAx_add_majorGridlines(obj, **attrs):
+    'Add a new ``<c:majorGridlines>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_majorGridlines()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_majorGridlines(child)
+    return child
+
+def _CT_DateAx_get_or_add_majorGridlines(obj):
+    'Return the ``<c:majorGridlines>`` child element, newly added if not present.'
+    child = obj.majorGridlines
+    if child is None:
+        child = obj._add_majorGridlines()
+    return child
+
+def _CT_DateAx_remove_majorGridlines(obj):
+    'Remove all ``<c:majorGridlines>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorGridlines'):
+        obj.remove(child)
+
+def _CT_DateAx_minorGridlines(obj):
+    '``<c:minorGridlines>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorGridlines')
+
+def _CT_DateAx_new_minorGridlines(obj):
+    'Return a "loose", newly created ``<c:minorGridlines>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorGridlines', nsmap=_nsmap_c)
+
+def _CT_DateAx_insert_minorGridlines(obj, child):
+    'Return the passed ``<c:minorGridlines>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}title', '{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}baseTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DateAx_add_minorGridlines(obj, **attrs):
+    'Add a new ``<c:minorGridlines>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_minorGridlines()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_minorGridlines(child)
+    return child
+
+def _CT_DateAx_get_or_add_minorGridlines(obj):
+    'Return the ``<c:minorGridlines>`` child element, newly added if not present.'
+    child = obj.minorGridlines
+    if child is None:
+        child = obj._add_minorGridlines()
+    return child
+
+def _CT_DateAx_remove_minorGridlines(obj):
+    'Remove all ``<c:minorGridlines>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorGridlines'):
+        obj.remove(child)
+
+def _CT_DateAx_title(obj):
+    '``<c:title>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}title')
+
+def _CT_DateAx_new_title(obj):
+    'Return a "loose", newly created ``<c:title>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}title', nsmap=_nsmap_c)
+
+def _CT_DateAx_insert_title(obj, child):
+    'Return the passed ``<c:title>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}baseTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DateAx_add_title(obj, **attrs):
+    'Add a new ``<c:title>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_title()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_title(child)
+    return child
+
+def _CT_DateAx_get_or_add_title(obj):
+    'Return the ``<c:title>`` child element, newly added if not present.'
+    child = obj.title
+    if child is None:
+        child = obj._add_title()
+    return child
+
+def _CT_DateAx_remove_title(obj):
+    'Remove all ``<c:title>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}title'):
+        obj.remove(child)
+
+def _CT_DateAx_numFmt(obj):
+    '``<c:numFmt>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt')
+
+def _CT_DateAx_new_numFmt(obj):
+    'Return a "loose", newly created ``<c:numFmt>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt', nsmap=_nsmap_c)
+
+def _CT_DateAx_insert_numFmt(obj, child):
+    'Return the passed ``<c:numFmt>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}baseTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DateAx_add_numFmt(obj, **attrs):
+    'Add a new ``<c:numFmt>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_numFmt()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_numFmt(child)
+    return child
+
+def _CT_DateAx_get_or_add_numFmt(obj):
+    'Return the ``<c:numFmt>`` child element, newly added if not present.'
+    child = obj.numFmt
+    if child is None:
+        child = obj._add_numFmt()
+    return child
+
+def _CT_DateAx_remove_numFmt(obj):
+    'Remove all ``<c:numFmt>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt'):
+        obj.remove(child)
+
+def _CT_DateAx_majorTickMark(obj):
+    '``<c:majorTickMark>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark')
+
+def _CT_DateAx_new_majorTickMark(obj):
+    'Return a "loose", newly created ``<c:majorTickMark>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark', nsmap=_nsmap_c)
+
+def _CT_DateAx_insert_majorTickMark(obj, child):
+    'Return the passed ``<c:majorTickMark>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}baseTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DateAx_add_majorTickMark(obj, **attrs):
+    'Add a new ``<c:majorTickMark>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_majorTickMark()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_majorTickMark(child)
+    return child
+
+def _CT_DateAx_get_or_add_majorTickMark(obj):
+    'Return the ``<c:majorTickMark>`` child element, newly added if not present.'
+    child = obj.majorTickMark
+    if child is None:
+        child = obj._add_majorTickMark()
+    return child
+
+def _CT_DateAx_remove_majorTickMark(obj):
+    'Remove all ``<c:majorTickMark>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark'):
+        obj.remove(child)
+
+def _CT_DateAx_minorTickMark(obj):
+    '``<c:minorTickMark>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark')
+
+def _CT_DateAx_new_minorTickMark(obj):
+    'Return a "loose", newly created ``<c:minorTickMark>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', nsmap=_nsmap_c)
+
+def _CT_DateAx_insert_minorTickMark(obj, child):
+    'Return the passed ``<c:minorTickMark>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}baseTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DateAx_add_minorTickMark(obj, **attrs):
+    'Add a new ``<c:minorTickMark>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_minorTickMark()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_minorTickMark(child)
+    return child
+
+def _CT_DateAx_get_or_add_minorTickMark(obj):
+    'Return the ``<c:minorTickMark>`` child element, newly added if not present.'
+    child = obj.minorTickMark
+    if child is None:
+        child = obj._add_minorTickMark()
+    return child
+
+def _CT_DateAx_remove_minorTickMark(obj):
+    'Remove all ``<c:minorTickMark>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark'):
+        obj.remove(child)
+
+def _CT_DateAx_tickLblPos(obj):
+    '``<c:tickLblPos>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos')
+
+def _CT_DateAx_new_tickLblPos(obj):
+    'Return a "loose", newly created ``<c:tickLblPos>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', nsmap=_nsmap_c)
+
+def _CT_DateAx_insert_tickLblPos(obj, child):
+    'Return the passed ``<c:tickLblPos>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}baseTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DateAx_add_tickLblPos(obj, **attrs):
+    'Add a new ``<c:tickLblPos>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_tickLblPos()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_tickLblPos(child)
+    return child
+
+def _CT_DateAx_get_or_add_tickLblPos(obj):
+    'Return the ``<c:tickLblPos>`` child element, newly added if not present.'
+    child = obj.tickLblPos
+    if child is None:
+        child = obj._add_tickLblPos()
+    return child
+
+def _CT_DateAx_remove_tickLblPos(obj):
+    'Remove all ``<c:tickLblPos>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos'):
+        obj.remove(child)
+
+def _CT_DateAx_spPr(obj):
+    '``<c:spPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr')
+
+def _CT_DateAx_new_spPr(obj):
+    'Return a "loose", newly created ``<c:spPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', nsmap=_nsmap_c)
+
+def _CT_DateAx_insert_spPr(obj, child):
+    'Return the passed ``<c:spPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}baseTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DateAx_add_spPr(obj, **attrs):
+    'Add a new ``<c:spPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_spPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_spPr(child)
+    return child
+
+def _CT_DateAx_get_or_add_spPr(obj):
+    'Return the ``<c:spPr>`` child element, newly added if not present.'
+    child = obj.spPr
+    if child is None:
+        child = obj._add_spPr()
+    return child
+
+def _CT_DateAx_remove_spPr(obj):
+    'Remove all ``<c:spPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr'):
+        obj.remove(child)
+
+def _CT_DateAx_txPr(obj):
+    '``<c:txPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr')
+
+def _CT_DateAx_new_txPr(obj):
+    'Return a "loose", newly created ``<c:txPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', nsmap=_nsmap_c)
+
+def _CT_DateAx_insert_txPr(obj, child):
+    'Return the passed ``<c:txPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}baseTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DateAx_add_txPr(obj, **attrs):
+    'Add a new ``<c:txPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_txPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_txPr(child)
+    return child
+
+def _CT_DateAx_get_or_add_txPr(obj):
+    'Return the ``<c:txPr>`` child element, newly added if not present.'
+    child = obj.txPr
+    if child is None:
+        child = obj._add_txPr()
+    return child
+
+def _CT_DateAx_remove_txPr(obj):
+    'Remove all ``<c:txPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr'):
+        obj.remove(child)
+
+def _CT_DateAx_crosses(obj):
+    '``<c:crosses>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses')
+
+def _CT_DateAx_new_crosses(obj):
+    'Return a "loose", newly created ``<c:crosses>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', nsmap=_nsmap_c)
+
+def _CT_DateAx_insert_crosses(obj, child):
+    'Return the passed ``<c:crosses>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}baseTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DateAx_add_crosses(obj, **attrs):
+    'Add a new ``<c:crosses>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_crosses()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_crosses(child)
+    return child
+
+def _CT_DateAx_get_or_add_crosses(obj):
+    'Return the ``<c:crosses>`` child element, newly added if not present.'
+    child = obj.crosses
+    if child is None:
+        child = obj._add_crosses()
+    return child
+
+def _CT_DateAx_remove_crosses(obj):
+    'Remove all ``<c:crosses>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses'):
+        obj.remove(child)
+
+def _CT_DateAx_crossesAt(obj):
+    '``<c:crossesAt>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt')
+
+def _CT_DateAx_new_crossesAt(obj):
+    'Return a "loose", newly created ``<c:crossesAt>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', nsmap=_nsmap_c)
+
+def _CT_DateAx_insert_crossesAt(obj, child):
+    'Return the passed ``<c:crossesAt>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}auto', '{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', '{http://schemas.openxmlformats.org/drawingml/2006/chart}baseTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DateAx_add_crossesAt(obj, **attrs):
+    'Add a new ``<c:crossesAt>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_crossesAt()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_crossesAt(child)
+    return child
+
+def _CT_DateAx_get_or_add_crossesAt(obj):
+    'Return the ``<c:crossesAt>`` child element, newly added if not present.'
+    child = obj.crossesAt
+    if child is None:
+        child = obj._add_crossesAt()
+    return child
+
+def _CT_DateAx_remove_crossesAt(obj):
+    'Remove all ``<c:crossesAt>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt'):
+        obj.remove(child)
+
+def _CT_DateAx_lblOffset(obj):
+    '``<c:lblOffset>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset')
+
+def _CT_DateAx_new_lblOffset(obj):
+    'Return a "loose", newly created ``<c:lblOffset>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset', nsmap=_nsmap_c)
+
+def _CT_DateAx_insert_lblOffset(obj, child):
+    'Return the passed ``<c:lblOffset>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}baseTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTimeUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DateAx_add_lblOffset(obj, **attrs):
+    'Add a new ``<c:lblOffset>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_lblOffset()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_lblOffset(child)
+    return child
+
+def _CT_DateAx_get_or_add_lblOffset(obj):
+    'Return the ``<c:lblOffset>`` child element, newly added if not present.'
+    child = obj.lblOffset
+    if child is None:
+        child = obj._add_lblOffset()
+    return child
+
+def _CT_DateAx_remove_lblOffset(obj):
+    'Remove all ``<c:lblOffset>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}lblOffset'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.axis.CT_DateAx'] = (
+    ('set', 'scaling', property(_CT_DateAx_scaling, None, None)),
+    ('set', 'delete_', property(_CT_DateAx_delete_, None, None)),
+    ('add', '_new_delete_', _CT_DateAx_new_delete_),
+    ('add', '_insert_delete_', _CT_DateAx_insert_delete_),
+    ('add', '_add_delete_', _CT_DateAx_add_delete_),
+    ('add', 'get_or_add_delete_', _CT_DateAx_get_or_add_delete_),
+    ('add', '_remove_delete_', _CT_DateAx_remove_delete_),
+    ('set', 'majorGridlines', property(_CT_DateAx_majorGridlines, None, None)),
+    ('add', '_new_majorGridlines', _CT_DateAx_new_majorGridlines),
+    ('add', '_insert_majorGridlines', _CT_DateAx_insert_majorGridlines),
+    ('add', '_add_majorGridlines', _CT_DateAx_add_majorGridlines),
+    ('add', 'get_or_add_majorGridlines', _CT_DateAx_get_or_add_majorGridlines),
+    ('add', '_remove_majorGridlines', _CT_DateAx_remove_majorGridlines),
+    ('set', 'minorGridlines', property(_CT_DateAx_minorGridlines, None, None)),
+    ('add', '_new_minorGridlines', _CT_DateAx_new_minorGridlines),
+    ('add', '_insert_minorGridlines', _CT_DateAx_insert_minorGridlines),
+    ('add', '_add_minorGridlines', _CT_DateAx_add_minorGridlines),
+    ('add', 'get_or_add_minorGridlines', _CT_DateAx_get_or_add_minorGridlines),
+    ('add', '_remove_minorGridlines', _CT_DateAx_remove_minorGridlines),
+    ('set', 'title', property(_CT_DateAx_title, None, None)),
+    ('add', '_new_title', _CT_DateAx_new_title),
+    ('add', '_insert_title', _CT_DateAx_insert_title),
+    ('add', '_add_title', _CT_DateAx_add_title),
+    ('add', 'get_or_add_title', _CT_DateAx_get_or_add_title),
+    ('add', '_remove_title', _CT_DateAx_remove_title),
+    ('set', 'numFmt', property(_CT_DateAx_numFmt, None, None)),
+    ('add', '_new_numFmt', _CT_DateAx_new_numFmt),
+    ('add', '_insert_numFmt', _CT_DateAx_insert_numFmt),
+    ('add', '_add_numFmt', _CT_DateAx_add_numFmt),
+    ('add', 'get_or_add_numFmt', _CT_DateAx_get_or_add_numFmt),
+    ('add', '_remove_numFmt', _CT_DateAx_remove_numFmt),
+    ('set', 'majorTickMark', property(_CT_DateAx_majorTickMark, None, None)),
+    ('add', '_new_majorTickMark', _CT_DateAx_new_majorTickMark),
+    ('add', '_insert_majorTickMark', _CT_DateAx_insert_majorTickMark),
+    ('add', '_add_majorTickMark', _CT_DateAx_add_majorTickMark),
+    ('add', 'get_or_add_majorTickMark', _CT_DateAx_get_or_add_majorTickMark),
+    ('add', '_remove_majorTickMark', _CT_DateAx_remove_majorTickMark),
+    ('set', 'minorTickMark', property(_CT_DateAx_minorTickMark, None, None)),
+    ('add', '_new_minorTickMark', _CT_DateAx_new_minorTickMark),
+    ('add', '_insert_minorTickMark', _CT_DateAx_insert_minorTickMark),
+    ('add', '_add_minorTickMark', _CT_DateAx_add_minorTickMark),
+    ('add', 'get_or_add_minorTickMark', _CT_DateAx_get_or_add_minorTickMark),
+    ('add', '_remove_minorTickMark', _CT_DateAx_remove_minorTickMark),
+    ('set', 'tickLblPos', property(_CT_DateAx_tickLblPos, None, None)),
+    ('add', '_new_tickLblPos', _CT_DateAx_new_tickLblPos),
+    ('add', '_insert_tickLblPos', _CT_DateAx_insert_tickLblPos),
+    ('add', '_add_tickLblPos', _CT_DateAx_add_tickLblPos),
+    ('add', 'get_or_add_tickLblPos', _CT_DateAx_get_or_add_tickLblPos),
+    ('add', '_remove_tickLblPos', _CT_DateAx_remove_tickLblPos),
+    ('set', 'spPr', property(_CT_DateAx_spPr, None, None)),
+    ('add', '_new_spPr', _CT_DateAx_new_spPr),
+    ('add', '_insert_spPr', _CT_DateAx_insert_spPr),
+    ('add', '_add_spPr', _CT_DateAx_add_spPr),
+    ('add', 'get_or_add_spPr', _CT_DateAx_get_or_add_spPr),
+    ('add', '_remove_spPr', _CT_DateAx_remove_spPr),
+    ('set', 'txPr', property(_CT_DateAx_txPr, None, None)),
+    ('add', '_new_txPr', _CT_DateAx_new_txPr),
+    ('add', '_insert_txPr', _CT_DateAx_insert_txPr),
+    ('add', '_add_txPr', _CT_DateAx_add_txPr),
+    ('add', 'get_or_add_txPr', _CT_DateAx_get_or_add_txPr),
+    ('add', '_remove_txPr', _CT_DateAx_remove_txPr),
+    ('set', 'crosses', property(_CT_DateAx_crosses, None, None)),
+    ('add', '_new_crosses', _CT_DateAx_new_crosses),
+    ('add', '_insert_crosses', _CT_DateAx_insert_crosses),
+    ('add', '_add_crosses', _CT_DateAx_add_crosses),
+    ('add', 'get_or_add_crosses', _CT_DateAx_get_or_add_crosses),
+    ('add', '_remove_crosses', _CT_DateAx_remove_crosses),
+    ('set', 'crossesAt', property(_CT_DateAx_crossesAt, None, None)),
+    ('add', '_new_crossesAt', _CT_DateAx_new_crossesAt),
+    ('add', '_insert_crossesAt', _CT_DateAx_insert_crossesAt),
+    ('add', '_add_crossesAt', _CT_DateAx_add_crossesAt),
+    ('add', 'get_or_add_crossesAt', _CT_DateAx_get_or_add_crossesAt),
+    ('add', '_remove_crossesAt', _CT_DateAx_remove_crossesAt),
+    ('set', 'lblOffset', property(_CT_DateAx_lblOffset, None, None)),
+    ('add', '_new_lblOffset', _CT_DateAx_new_lblOffset),
+    ('add', '_insert_lblOffset', _CT_DateAx_insert_lblOffset),
+    ('add', '_add_lblOffset', _CT_DateAx_add_lblOffset),
+    ('add', 'get_or_add_lblOffset', _CT_DateAx_get_or_add_lblOffset),
+    ('add', '_remove_lblOffset', _CT_DateAx_remove_lblOffset),
+)
+
+
+# pptx.oxml.chart.axis.CT_LblOffset -----------------------------------------
+
+def _CT_LblOffset_val_get(obj):
+    'ST_LblOffset type-converted value of ``val`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        return 100
+    return ST_LblOffset.from_xml(attr_str_value)
+
+def _CT_LblOffset_val_set(obj, value):
+    if value == 100:
+        if 'val' in obj.attrib:
+            del obj.attrib['val']
+        return
+    str_value = ST_LblOffset.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.axis.CT_LblOffset'] = (
+    ('set', 'val', property(_CT_LblOffset_val_get, _CT_LblOffset_val_set, None)),
+)
+
+
+# pptx.oxml.chart.axis.CT_Scaling -------------------------------------------
+
+def _CT_Scaling_max(obj):
+    '``<c:max>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}max')
+
+def _CT_Scaling_new_max(obj):
+    'Return a "loose", newly created ``<c:max>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}max', nsmap=_nsmap_c)
+
+def _CT_Scaling_insert_max(obj, child):
+    'Return the passed ``<c:max>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}min', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_Scaling_add_max(obj, **attrs):
+    'Add a new ``<c:max>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_max()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_max(child)
+    return child
+
+def _CT_Scaling_get_or_add_max(obj):
+    'Return the ``<c:max>`` child element, newly added if not present.'
+    child = obj.max
+    if child is None:
+        child = obj._add_max()
+    return child
+
+def _CT_Scaling_remove_max(obj):
+    'Remove all ``<c:max>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}max'):
+        obj.remove(child)
+
+def _CT_Scaling_min(obj):
+    '``<c:min>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}min')
+
+def _CT_Scaling_new_min(obj):
+    'Return a "loose", newly created ``<c:min>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}min', nsmap=_nsmap_c)
+
+def _CT_Scaling_insert_min(obj, child):
+    'Return the passed ``<c:min>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst',))
+    return child
+
+def _CT_Scaling_add_min(obj, **attrs):
+    'Add a new ``<c:min>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_min()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_min(child)
+    return child
+
+def _CT_Scaling_get_or_add_min(obj):
+    'Return the ``<c:min>`` child element, newly added if not present.'
+    child = obj.min
+    if child is None:
+        child = obj._add_min()
+    return child
+
+def _CT_Scaling_remove_min(obj):
+    'Remove all ``<c:min>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}min'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.axis.CT_Scaling'] = (
+    ('set', 'max', property(_CT_Scaling_max, None, None)),
+    ('add', '_new_max', _CT_Scaling_new_max),
+    ('add', '_insert_max', _CT_Scaling_insert_max),
+    ('add', '_add_max', _CT_Scaling_add_max),
+    ('add', 'get_or_add_max', _CT_Scaling_get_or_add_max),
+    ('add', '_remove_max', _CT_Scaling_remove_max),
+    ('set', 'min', property(_CT_Scaling_min, None, None)),
+    ('add', '_new_min', _CT_Scaling_new_min),
+    ('add', '_insert_min', _CT_Scaling_insert_min),
+    ('add', '_add_min', _CT_Scaling_add_min),
+    ('add', 'get_or_add_min', _CT_Scaling_get_or_add_min),
+    ('add', '_remove_min', _CT_Scaling_remove_min),
+)
+
+
+# pptx.oxml.chart.axis.CT_TickLblPos ----------------------------------------
+
+def _CT_TickLblPos_val_get(obj):
+    'XL_TICK_LABEL_POSITION type-converted value of ``val`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        return None
+    return XL_TICK_LABEL_POSITION.from_xml(attr_str_value)
+
+def _CT_TickLblPos_val_set(obj, value):
+    if value == None:
+        if 'val' in obj.attrib:
+            del obj.attrib['val']
+        return
+    str_value = XL_TICK_LABEL_POSITION.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.axis.CT_TickLblPos'] = (
+    ('set', 'val', property(_CT_TickLblPos_val_get, _CT_TickLblPos_val_set, None)),
+)
+
+
+# pptx.oxml.chart.axis.CT_TickMark ------------------------------------------
+
+_CT_TickMark_val_default = XL_TICK_MARK.CROSS
+
+def _CT_TickMark_val_get(obj):
+    'XL_TICK_MARK type-converted value of ``val`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        return _CT_TickMark_val_default
+    return XL_TICK_MARK.from_xml(attr_str_value)
+
+def _CT_TickMark_val_set(obj, value):
+    if value == _CT_TickMark_val_default:
+        if 'val' in obj.attrib:
+            del obj.attrib['val']
+        return
+    str_value = XL_TICK_MARK.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.axis.CT_TickMark'] = (
+    ('set', 'val', property(_CT_TickMark_val_get, _CT_TickMark_val_set, None)),
+)
+
+
+# pptx.oxml.chart.axis.CT_ValAx ---------------------------------------------
+
+def _CT_ValAx_scaling(obj):
+    'Required ``<c:scaling>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}scaling')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<c:scaling>`` child element not present'
+        )
+    return child
+
+def _CT_ValAx_delete_(obj):
+    '``<c:delete>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}delete')
+
+def _CT_ValAx_new_delete_(obj):
+    'Return a "loose", newly created ``<c:delete>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}delete', nsmap=_nsmap_c)
+
+def _CT_ValAx_insert_delete_(obj, child):
+    'Return the passed ``<c:delete>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}axPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorGridlines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorGridlines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}title', '{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossBetween', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dispUnits', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ValAx_add_delete_(obj, **attrs):
+    'Add a new ``<c:delete>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_delete_()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_delete_(child)
+    return child
+
+def _CT_ValAx_get_or_add_delete_(obj):
+    'Return the ``<c:delete>`` child element, newly added if not present.'
+    child = obj.delete_
+    if child is None:
+        child = obj._add_delete_()
+    return child
+
+def _CT_ValAx_remove_delete_(obj):
+    'Remove all ``<c:delete>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}delete'):
+        obj.remove(child)
+
+def _CT_ValAx_majorGridlines(obj):
+    '``<c:majorGridlines>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorGridlines')
+
+def _CT_ValAx_new_majorGridlines(obj):
+    'Return a "loose", newly created ``<c:majorGridlines>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorGridlines', nsmap=_nsmap_c)
+
+def _CT_ValAx_insert_majorGridlines(obj, child):
+    'Return the passed ``<c:majorGridlines>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorGridlines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}title', '{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossBetween', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dispUnits', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ValAx_add_majorGridlines(obj, **attrs):
+    'Add a new ``<c:majorGridlines>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_majorGridlines()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_majorGridlines(child)
+    return child
+
+def _CT_ValAx_get_or_add_majorGridlines(obj):
+    'Return the ``<c:majorGridlines>`` child element, newly added if not present.'
+    child = obj.majorGridlines
+    if child is None:
+        child = obj._add_majorGridlines()
+    return child
+
+def _CT_ValAx_remove_majorGridlines(obj):
+    'Remove all ``<c:majorGridlines>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorGridlines'):
+        obj.remove(child)
+
+def _CT_ValAx_minorGridlines(obj):
+    '``<c:minorGridlines>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorGridlines')
+
+def _CT_ValAx_new_minorGridlines(obj):
+    'Return a "loose", newly created ``<c:minorGridlines>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorGridlines', nsmap=_nsmap_c)
+
+def _CT_ValAx_insert_minorGridlines(obj, child):
+    'Return the passed ``<c:minorGridlines>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}title', '{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossBetween', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dispUnits', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ValAx_add_minorGridlines(obj, **attrs):
+    'Add a new ``<c:minorGridlines>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_minorGridlines()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_minorGridlines(child)
+    return child
+
+def _CT_ValAx_get_or_add_minorGridlines(obj):
+    'Return the ``<c:minorGridlines>`` child element, newly added if not present.'
+    child = obj.minorGridlines
+    if child is None:
+        child = obj._add_minorGridlines()
+    return child
+
+def _CT_ValAx_remove_minorGridlines(obj):
+    'Remove all ``<c:minorGridlines>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorGridlines'):
+        obj.remove(child)
+
+def _CT_ValAx_title(obj):
+    '``<c:title>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}title')
+
+def _CT_ValAx_new_title(obj):
+    'Return a "loose", newly created ``<c:title>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}title', nsmap=_nsmap_c)
+
+def _CT_ValAx_insert_title(obj, child):
+    'Return the passed ``<c:title>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossBetween', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dispUnits', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ValAx_add_title(obj, **attrs):
+    'Add a new ``<c:title>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_title()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_title(child)
+    return child
+
+def _CT_ValAx_get_or_add_title(obj):
+    'Return the ``<c:title>`` child element, newly added if not present.'
+    child = obj.title
+    if child is None:
+        child = obj._add_title()
+    return child
+
+def _CT_ValAx_remove_title(obj):
+    'Remove all ``<c:title>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}title'):
+        obj.remove(child)
+
+def _CT_ValAx_numFmt(obj):
+    '``<c:numFmt>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt')
+
+def _CT_ValAx_new_numFmt(obj):
+    'Return a "loose", newly created ``<c:numFmt>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt', nsmap=_nsmap_c)
+
+def _CT_ValAx_insert_numFmt(obj, child):
+    'Return the passed ``<c:numFmt>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossBetween', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dispUnits', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ValAx_add_numFmt(obj, **attrs):
+    'Add a new ``<c:numFmt>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_numFmt()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_numFmt(child)
+    return child
+
+def _CT_ValAx_get_or_add_numFmt(obj):
+    'Return the ``<c:numFmt>`` child element, newly added if not present.'
+    child = obj.numFmt
+    if child is None:
+        child = obj._add_numFmt()
+    return child
+
+def _CT_ValAx_remove_numFmt(obj):
+    'Remove all ``<c:numFmt>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt'):
+        obj.remove(child)
+
+def _CT_ValAx_majorTickMark(obj):
+    '``<c:majorTickMark>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark')
+
+def _CT_ValAx_new_majorTickMark(obj):
+    'Return a "loose", newly created ``<c:majorTickMark>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark', nsmap=_nsmap_c)
+
+def _CT_ValAx_insert_majorTickMark(obj, child):
+    'Return the passed ``<c:majorTickMark>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', '{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossBetween', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dispUnits', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ValAx_add_majorTickMark(obj, **attrs):
+    'Add a new ``<c:majorTickMark>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_majorTickMark()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_majorTickMark(child)
+    return child
+
+def _CT_ValAx_get_or_add_majorTickMark(obj):
+    'Return the ``<c:majorTickMark>`` child element, newly added if not present.'
+    child = obj.majorTickMark
+    if child is None:
+        child = obj._add_majorTickMark()
+    return child
+
+def _CT_ValAx_remove_majorTickMark(obj):
+    'Remove all ``<c:majorTickMark>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorTickMark'):
+        obj.remove(child)
+
+def _CT_ValAx_minorTickMark(obj):
+    '``<c:minorTickMark>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark')
+
+def _CT_ValAx_new_minorTickMark(obj):
+    'Return a "loose", newly created ``<c:minorTickMark>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark', nsmap=_nsmap_c)
+
+def _CT_ValAx_insert_minorTickMark(obj, child):
+    'Return the passed ``<c:minorTickMark>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossBetween', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dispUnits', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ValAx_add_minorTickMark(obj, **attrs):
+    'Add a new ``<c:minorTickMark>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_minorTickMark()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_minorTickMark(child)
+    return child
+
+def _CT_ValAx_get_or_add_minorTickMark(obj):
+    'Return the ``<c:minorTickMark>`` child element, newly added if not present.'
+    child = obj.minorTickMark
+    if child is None:
+        child = obj._add_minorTickMark()
+    return child
+
+def _CT_ValAx_remove_minorTickMark(obj):
+    'Remove all ``<c:minorTickMark>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorTickMark'):
+        obj.remove(child)
+
+def _CT_ValAx_tickLblPos(obj):
+    '``<c:tickLblPos>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos')
+
+def _CT_ValAx_new_tickLblPos(obj):
+    'Return a "loose", newly created ``<c:tickLblPos>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos', nsmap=_nsmap_c)
+
+def _CT_ValAx_insert_tickLblPos(obj, child):
+    'Return the passed ``<c:tickLblPos>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossBetween', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dispUnits', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ValAx_add_tickLblPos(obj, **attrs):
+    'Add a new ``<c:tickLblPos>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_tickLblPos()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_tickLblPos(child)
+    return child
+
+def _CT_ValAx_get_or_add_tickLblPos(obj):
+    'Return the ``<c:tickLblPos>`` child element, newly added if not present.'
+    child = obj.tickLblPos
+    if child is None:
+        child = obj._add_tickLblPos()
+    return child
+
+def _CT_ValAx_remove_tickLblPos(obj):
+    'Remove all ``<c:tickLblPos>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}tickLblPos'):
+        obj.remove(child)
+
+def _CT_ValAx_spPr(obj):
+    '``<c:spPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr')
+
+def _CT_ValAx_new_spPr(obj):
+    'Return a "loose", newly created ``<c:spPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', nsmap=_nsmap_c)
+
+def _CT_ValAx_insert_spPr(obj, child):
+    'Return the passed ``<c:spPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossBetween', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dispUnits', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ValAx_add_spPr(obj, **attrs):
+    'Add a new ``<c:spPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_spPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_spPr(child)
+    return child
+
+def _CT_ValAx_get_or_add_spPr(obj):
+    'Return the ``<c:spPr>`` child element, newly added if not present.'
+    child = obj.spPr
+    if child is None:
+        child = obj._add_spPr()
+    return child
+
+def _CT_ValAx_remove_spPr(obj):
+    'Remove all ``<c:spPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr'):
+        obj.remove(child)
+
+def _CT_ValAx_txPr(obj):
+    '``<c:txPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr')
+
+def _CT_ValAx_new_txPr(obj):
+    'Return a "loose", newly created ``<c:txPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', nsmap=_nsmap_c)
+
+def _CT_ValAx_insert_txPr(obj, child):
+    'Return the passed ``<c:txPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossBetween', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dispUnits', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ValAx_add_txPr(obj, **attrs):
+    'Add a new ``<c:txPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_txPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_txPr(child)
+    return child
+
+def _CT_ValAx_get_or_add_txPr(obj):
+    'Return the ``<c:txPr>`` child element, newly added if not present.'
+    child = obj.txPr
+    if child is None:
+        child = obj._add_txPr()
+    return child
+
+def _CT_ValAx_remove_txPr(obj):
+    'Remove all ``<c:txPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr'):
+        obj.remove(child)
+
+def _CT_ValAx_crossAx(obj):
+    '``<c:crossAx>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx')
+
+def _CT_ValAx_new_crossAx(obj):
+    'Return a "loose", newly created ``<c:crossAx>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx', nsmap=_nsmap_c)
+
+def _CT_ValAx_insert_crossAx(obj, child):
+    'Return the passed ``<c:crossAx>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossBetween', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dispUnits', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ValAx_add_crossAx(obj, **attrs):
+    'Add a new ``<c:crossAx>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_crossAx()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_crossAx(child)
+    return child
+
+def _CT_ValAx_get_or_add_crossAx(obj):
+    'Return the ``<c:crossAx>`` child element, newly added if not present.'
+    child = obj.crossAx
+    if child is None:
+        child = obj._add_crossAx()
+    return child
+
+def _CT_ValAx_remove_crossAx(obj):
+    'Remove all ``<c:crossAx>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}crossAx'):
+        obj.remove(child)
+
+def _CT_ValAx_crosses(obj):
+    '``<c:crosses>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses')
+
+def _CT_ValAx_new_crosses(obj):
+    'Return a "loose", newly created ``<c:crosses>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses', nsmap=_nsmap_c)
+
+def _CT_ValAx_insert_crosses(obj, child):
+    'Return the passed ``<c:crosses>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}crossBetween', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dispUnits', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ValAx_add_crosses(obj, **attrs):
+    'Add a new ``<c:crosses>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_crosses()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_crosses(child)
+    return child
+
+def _CT_ValAx_get_or_add_crosses(obj):
+    'Return the ``<c:crosses>`` child element, newly added if not present.'
+    child = obj.crosses
+    if child is None:
+        child = obj._add_crosses()
+    return child
+
+def _CT_ValAx_remove_crosses(obj):
+    'Remove all ``<c:crosses>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}crosses'):
+        obj.remove(child)
+
+def _CT_ValAx_crossesAt(obj):
+    '``<c:crossesAt>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt')
+
+def _CT_ValAx_new_crossesAt(obj):
+    'Return a "loose", newly created ``<c:crossesAt>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt', nsmap=_nsmap_c)
+
+def _CT_ValAx_insert_crossesAt(obj, child):
+    'Return the passed ``<c:crossesAt>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}crossBetween', '{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dispUnits', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ValAx_add_crossesAt(obj, **attrs):
+    'Add a new ``<c:crossesAt>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_crossesAt()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_crossesAt(child)
+    return child
+
+def _CT_ValAx_get_or_add_crossesAt(obj):
+    'Return the ``<c:crossesAt>`` child element, newly added if not present.'
+    child = obj.crossesAt
+    if child is None:
+        child = obj._add_crossesAt()
+    return child
+
+def _CT_ValAx_remove_crossesAt(obj):
+    'Remove all ``<c:crossesAt>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}crossesAt'):
+        obj.remove(child)
+
+def _CT_ValAx_majorUnit(obj):
+    '``<c:majorUnit>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit')
+
+def _CT_ValAx_new_majorUnit(obj):
+    'Return a "loose", newly created ``<c:majorUnit>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit', nsmap=_nsmap_c)
+
+def _CT_ValAx_insert_majorUnit(obj, child):
+    'Return the passed ``<c:majorUnit>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dispUnits', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ValAx_add_majorUnit(obj, **attrs):
+    'Add a new ``<c:majorUnit>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_majorUnit()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_majorUnit(child)
+    return child
+
+def _CT_ValAx_get_or_add_majorUnit(obj):
+    'Return the ``<c:majorUnit>`` child element, newly added if not present.'
+    child = obj.majorUnit
+    if child is None:
+        child = obj._add_majorUnit()
+    return child
+
+def _CT_ValAx_remove_majorUnit(obj):
+    'Remove all ``<c:majorUnit>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}majorUnit'):
+        obj.remove(child)
+
+def _CT_ValAx_minorUnit(obj):
+    '``<c:minorUnit>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit')
+
+def _CT_ValAx_new_minorUnit(obj):
+    'Return a "loose", newly created ``<c:minorUnit>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit', nsmap=_nsmap_c)
+
+def _CT_ValAx_insert_minorUnit(obj, child):
+    'Return the passed ``<c:minorUnit>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}dispUnits', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ValAx_add_minorUnit(obj, **attrs):
+    'Add a new ``<c:minorUnit>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_minorUnit()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_minorUnit(child)
+    return child
+
+def _CT_ValAx_get_or_add_minorUnit(obj):
+    'Return the ``<c:minorUnit>`` child element, newly added if not present.'
+    child = obj.minorUnit
+    if child is None:
+        child = obj._add_minorUnit()
+    return child
+
+def _CT_ValAx_remove_minorUnit(obj):
+    'Remove all ``<c:minorUnit>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}minorUnit'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.axis.CT_ValAx'] = (
+    ('set', 'scaling', property(_CT_ValAx_scaling, None, None)),
+    ('set', 'delete_', property(_CT_ValAx_delete_, None, None)),
+    ('add', '_new_delete_', _CT_ValAx_new_delete_),
+    ('add', '_insert_delete_', _CT_ValAx_insert_delete_),
+    ('add', '_add_delete_', _CT_ValAx_add_delete_),
+    ('add', 'get_or_add_delete_', _CT_ValAx_get_or_add_delete_),
+    ('add', '_remove_delete_', _CT_ValAx_remove_delete_),
+    ('set', 'majorGridlines', property(_CT_ValAx_majorGridlines, None, None)),
+    ('add', '_new_majorGridlines', _CT_ValAx_new_majorGridlines),
+    ('add', '_insert_majorGridlines', _CT_ValAx_insert_majorGridlines),
+    ('add', '_add_majorGridlines', _CT_ValAx_add_majorGridlines),
+    ('add', 'get_or_add_majorGridlines', _CT_ValAx_get_or_add_majorGridlines),
+    ('add', '_remove_majorGridlines', _CT_ValAx_remove_majorGridlines),
+    ('set', 'minorGridlines', property(_CT_ValAx_minorGridlines, None, None)),
+    ('add', '_new_minorGridlines', _CT_ValAx_new_minorGridlines),
+    ('add', '_insert_minorGridlines', _CT_ValAx_insert_minorGridlines),
+    ('add', '_add_minorGridlines', _CT_ValAx_add_minorGridlines),
+    ('add', 'get_or_add_minorGridlines', _CT_ValAx_get_or_add_minorGridlines),
+    ('add', '_remove_minorGridlines', _CT_ValAx_remove_minorGridlines),
+    ('set', 'title', property(_CT_ValAx_title, None, None)),
+    ('add', '_new_title', _CT_ValAx_new_title),
+    ('add', '_insert_title', _CT_ValAx_insert_title),
+    ('add', '_add_title', _CT_ValAx_add_title),
+    ('add', 'get_or_add_title', _CT_ValAx_get_or_add_title),
+    ('add', '_remove_title', _CT_ValAx_remove_title),
+    ('set', 'numFmt', property(_CT_ValAx_numFmt, None, None)),
+    ('add', '_new_numFmt', _CT_ValAx_new_numFmt),
+    ('add', '_insert_numFmt', _CT_ValAx_insert_numFmt),
+    ('add', '_add_numFmt', _CT_ValAx_add_numFmt),
+    ('add', 'get_or_add_numFmt', _CT_ValAx_get_or_add_numFmt),
+    ('add', '_remove_numFmt', _CT_ValAx_remove_numFmt),
+    ('set', 'majorTickMark', property(_CT_ValAx_majorTickMark, None, None)),
+    ('add', '_new_majorTickMark', _CT_ValAx_new_majorTickMark),
+    ('add', '_insert_majorTickMark', _CT_ValAx_insert_majorTickMark),
+    ('add', '_add_majorTickMark', _CT_ValAx_add_majorTickMark),
+    ('add', 'get_or_add_majorTickMark', _CT_ValAx_get_or_add_majorTickMark),
+    ('add', '_remove_majorTickMark', _CT_ValAx_remove_majorTickMark),
+    ('set', 'minorTickMark', property(_CT_ValAx_minorTickMark, None, None)),
+    ('add', '_new_minorTickMark', _CT_ValAx_new_minorTickMark),
+    ('add', '_insert_minorTickMark', _CT_ValAx_insert_minorTickMark),
+    ('add', '_add_minorTickMark', _CT_ValAx_add_minorTickMark),
+    ('add', 'get_or_add_minorTickMark', _CT_ValAx_get_or_add_minorTickMark),
+    ('add', '_remove_minorTickMark', _CT_ValAx_remove_minorTickMark),
+    ('set', 'tickLblPos', property(_CT_ValAx_tickLblPos, None, None)),
+    ('add', '_new_tickLblPos', _CT_ValAx_new_tickLblPos),
+    ('add', '_insert_tickLblPos', _CT_ValAx_insert_tickLblPos),
+    ('add', '_add_tickLblPos', _CT_ValAx_add_tickLblPos),
+    ('add', 'get_or_add_tickLblPos', _CT_ValAx_get_or_add_tickLblPos),
+    ('add', '_remove_tickLblPos', _CT_ValAx_remove_tickLblPos),
+    ('set', 'spPr', property(_CT_ValAx_spPr, None, None)),
+    ('add', '_new_spPr', _CT_ValAx_new_spPr),
+    ('add', '_insert_spPr', _CT_ValAx_insert_spPr),
+    ('add', '_add_spPr', _CT_ValAx_add_spPr),
+    ('add', 'get_or_add_spPr', _CT_ValAx_get_or_add_spPr),
+    ('add', '_remove_spPr', _CT_ValAx_remove_spPr),
+    ('set', 'txPr', property(_CT_ValAx_txPr, None, None)),
+    ('add', '_new_txPr', _CT_ValAx_new_txPr),
+    ('add', '_insert_txPr', _CT_ValAx_insert_txPr),
+    ('add', '_add_txPr', _CT_ValAx_add_txPr),
+    ('add', 'get_or_add_txPr', _CT_ValAx_get_or_add_txPr),
+    ('add', '_remove_txPr', _CT_ValAx_remove_txPr),
+    ('set', 'crossAx', property(_CT_ValAx_crossAx, None, None)),
+    ('add', '_new_crossAx', _CT_ValAx_new_crossAx),
+    ('add', '_insert_crossAx', _CT_ValAx_insert_crossAx),
+    ('add', '_add_crossAx', _CT_ValAx_add_crossAx),
+    ('add', 'get_or_add_crossAx', _CT_ValAx_get_or_add_crossAx),
+    ('add', '_remove_crossAx', _CT_ValAx_remove_crossAx),
+    ('set', 'crosses', property(_CT_ValAx_crosses, None, None)),
+    ('add', '_new_crosses', _CT_ValAx_new_crosses),
+    ('add', '_insert_crosses', _CT_ValAx_insert_crosses),
+    ('add', '_add_crosses', _CT_ValAx_add_crosses),
+    ('add', 'get_or_add_crosses', _CT_ValAx_get_or_add_crosses),
+    ('add', '_remove_crosses', _CT_ValAx_remove_crosses),
+    ('set', 'crossesAt', property(_CT_ValAx_crossesAt, None, None)),
+    ('add', '_new_crossesAt', _CT_ValAx_new_crossesAt),
+    ('add', '_insert_crossesAt', _CT_ValAx_insert_crossesAt),
+    ('add', '_add_crossesAt', _CT_ValAx_add_crossesAt),
+    ('add', 'get_or_add_crossesAt', _CT_ValAx_get_or_add_crossesAt),
+    ('add', '_remove_crossesAt', _CT_ValAx_remove_crossesAt),
+    ('set', 'majorUnit', property(_CT_ValAx_majorUnit, None, None)),
+    ('add', '_new_majorUnit', _CT_ValAx_new_majorUnit),
+    ('add', '_insert_majorUnit', _CT_ValAx_insert_majorUnit),
+    ('add', '_add_majorUnit', _CT_ValAx_add_majorUnit),
+    ('add', 'get_or_add_majorUnit', _CT_ValAx_get_or_add_majorUnit),
+    ('add', '_remove_majorUnit', _CT_ValAx_remove_majorUnit),
+    ('set', 'minorUnit', property(_CT_ValAx_minorUnit, None, None)),
+    ('add', '_new_minorUnit', _CT_ValAx_new_minorUnit),
+    ('add', '_insert_minorUnit', _CT_ValAx_insert_minorUnit),
+    ('add', '_add_minorUnit', _CT_ValAx_add_minorUnit),
+    ('add', 'get_or_add_minorUnit', _CT_ValAx_get_or_add_minorUnit),
+    ('add', '_remove_minorUnit', _CT_ValAx_remove_minorUnit),
+)
+
+
+# pptx.oxml.chart.chart.CT_Chart --------------------------------------------
+
+def _CT_Chart_title(obj):
+    '``<c:title>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}title')
+
+def _CT_Chart_new_title(obj):
+    'Return a "loose", newly created ``<c:title>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}title', nsmap=_nsmap_c)
+
+def _CT_Chart_insert_title(obj, child):
+    'Return the passed ``<c:title>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}autoTitleDeleted', '{http://schemas.openxmlformats.org/drawingml/2006/chart}pivotFmts', '{http://schemas.openxmlformats.org/drawingml/2006/chart}view3D', '{http://schemas.openxmlformats.org/drawingml/2006/chart}floor', '{http://schemas.openxmlformats.org/drawingml/2006/chart}sideWall', '{http://schemas.openxmlformats.org/drawingml/2006/chart}backWall', '{http://schemas.openxmlformats.org/drawingml/2006/chart}plotArea', '{http://schemas.openxmlformats.org/drawingml/2006/chart}legend', '{http://schemas.openxmlformats.org/drawingml/2006/chart}plotVisOnly', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dispBlanksAs', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showDLblsOverMax', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_Chart_add_title(obj, **attrs):
+    'Add a new ``<c:title>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_title()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_title(child)
+    return child
+
+def _CT_Chart_get_or_add_title(obj):
+    'Return the ``<c:title>`` child element, newly added if not present.'
+    child = obj.title
+    if child is None:
+        child = obj._add_title()
+    return child
+
+def _CT_Chart_remove_title(obj):
+    'Remove all ``<c:title>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}title'):
+        obj.remove(child)
+
+def _CT_Chart_autoTitleDeleted(obj):
+    '``<c:autoTitleDeleted>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}autoTitleDeleted')
+
+def _CT_Chart_new_autoTitleDeleted(obj):
+    'Return a "loose", newly created ``<c:autoTitleDeleted>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}autoTitleDeleted', nsmap=_nsmap_c)
+
+def _CT_Chart_insert_autoTitleDeleted(obj, child):
+    'Return the passed ``<c:autoTitleDeleted>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}pivotFmts', '{http://schemas.openxmlformats.org/drawingml/2006/chart}view3D', '{http://schemas.openxmlformats.org/drawingml/2006/chart}floor', '{http://schemas.openxmlformats.org/drawingml/2006/chart}sideWall', '{http://schemas.openxmlformats.org/drawingml/2006/chart}backWall', '{http://schemas.openxmlformats.org/drawingml/2006/chart}plotArea', '{http://schemas.openxmlformats.org/drawingml/2006/chart}legend', '{http://schemas.openxmlformats.org/drawingml/2006/chart}plotVisOnly', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dispBlanksAs', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showDLblsOverMax', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_Chart_add_autoTitleDeleted(obj, **attrs):
+    'Add a new ``<c:autoTitleDeleted>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_autoTitleDeleted()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_autoTitleDeleted(child)
+    return child
+
+def _CT_Chart_get_or_add_autoTitleDeleted(obj):
+    'Return the ``<c:autoTitleDeleted>`` child element, newly added if not present.'
+    child = obj.autoTitleDeleted
+    if child is None:
+        child = obj._add_autoTitleDeleted()
+    return child
+
+def _CT_Chart_remove_autoTitleDeleted(obj):
+    'Remove all ``<c:autoTitleDeleted>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}autoTitleDeleted'):
+        obj.remove(child)
+
+def _CT_Chart_plotArea(obj):
+    'Required ``<c:plotArea>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}plotArea')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<c:plotArea>`` child element not present'
+        )
+    return child
+
+def _CT_Chart_legend(obj):
+    '``<c:legend>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}legend')
+
+def _CT_Chart_new_legend(obj):
+    'Return a "loose", newly created ``<c:legend>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}legend', nsmap=_nsmap_c)
+
+def _CT_Chart_insert_legend(obj, child):
+    'Return the passed ``<c:legend>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}plotVisOnly', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dispBlanksAs', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showDLblsOverMax', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_Chart_add_legend(obj, **attrs):
+    'Add a new ``<c:legend>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_legend()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_legend(child)
+    return child
+
+def _CT_Chart_get_or_add_legend(obj):
+    'Return the ``<c:legend>`` child element, newly added if not present.'
+    child = obj.legend
+    if child is None:
+        child = obj._add_legend()
+    return child
+
+def _CT_Chart_remove_legend(obj):
+    'Remove all ``<c:legend>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}legend'):
+        obj.remove(child)
+
+def _CT_Chart_rId_get(obj):
+    'XsdString type-converted value of ``r:id`` attribute.'
+    attr_str_value = obj.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'r:id' attribute not present on element %s" % obj.tag
+        )
+    return XsdString.from_xml(attr_str_value)
+
+def _CT_Chart_rId_set(obj, value):
+    str_value = XsdString.to_xml(value)
+    obj.set('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id', str_value)
+
+
+members['pptx.oxml.chart.chart.CT_Chart'] = (
+    ('set', 'title', property(_CT_Chart_title, None, None)),
+    ('add', '_new_title', _CT_Chart_new_title),
+    ('add', '_insert_title', _CT_Chart_insert_title),
+    ('add', '_add_title', _CT_Chart_add_title),
+    ('add', 'get_or_add_title', _CT_Chart_get_or_add_title),
+    ('add', '_remove_title', _CT_Chart_remove_title),
+    ('set', 'autoTitleDeleted', property(_CT_Chart_autoTitleDeleted, None, None)),
+    ('add', '_new_autoTitleDeleted', _CT_Chart_new_autoTitleDeleted),
+    ('add', '_insert_autoTitleDeleted', _CT_Chart_insert_autoTitleDeleted),
+    ('add', '_add_autoTitleDeleted', _CT_Chart_add_autoTitleDeleted),
+    ('add', 'get_or_add_autoTitleDeleted', _CT_Chart_get_or_add_autoTitleDeleted),
+    ('add', '_remove_autoTitleDeleted', _CT_Chart_remove_autoTitleDeleted),
+    ('set', 'plotArea', property(_CT_Chart_plotArea, None, None)),
+    ('set', 'legend', property(_CT_Chart_legend, None, None)),
+    ('add', '_new_legend', _CT_Chart_new_legend),
+    ('add', '_insert_legend', _CT_Chart_insert_legend),
+    ('add', '_add_legend', _CT_Chart_add_legend),
+    ('add', 'get_or_add_legend', _CT_Chart_get_or_add_legend),
+    ('add', '_remove_legend', _CT_Chart_remove_legend),
+    ('set', 'rId', property(_CT_Chart_rId_get, _CT_Chart_rId_set, None)),
+)
+
+
+# pptx.oxml.chart.chart.CT_ChartSpace ---------------------------------------
+
+def _CT_ChartSpace_date1904(obj):
+    '``<c:date1904>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}date1904')
+
+def _CT_ChartSpace_new_date1904(obj):
+    'Return a "loose", newly created ``<c:date1904>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}date1904', nsmap=_nsmap_c)
+
+def _CT_ChartSpace_insert_date1904(obj, child):
+    'Return the passed ``<c:date1904>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}lang', '{http://schemas.openxmlformats.org/drawingml/2006/chart}roundedCorners', '{http://schemas.openxmlformats.org/drawingml/2006/chart}style', '{http://schemas.openxmlformats.org/drawingml/2006/chart}clrMapOvr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}pivotSource', '{http://schemas.openxmlformats.org/drawingml/2006/chart}protection', '{http://schemas.openxmlformats.org/drawingml/2006/chart}chart', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}externalData', '{http://schemas.openxmlformats.org/drawingml/2006/chart}printSettings', '{http://schemas.openxmlformats.org/drawingml/2006/chart}userShapes', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ChartSpace_add_date1904(obj, **attrs):
+    'Add a new ``<c:date1904>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_date1904()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_date1904(child)
+    return child
+
+def _CT_ChartSpace_get_or_add_date1904(obj):
+    'Return the ``<c:date1904>`` child element, newly added if not present.'
+    child = obj.date1904
+    if child is None:
+        child = obj._add_date1904()
+    return child
+
+def _CT_ChartSpace_remove_date1904(obj):
+    'Remove all ``<c:date1904>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}date1904'):
+        obj.remove(child)
+
+def _CT_ChartSpace_style(obj):
+    '``<c:style>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}style')
+
+def _CT_ChartSpace_new_style(obj):
+    'Return a "loose", newly created ``<c:style>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}style', nsmap=_nsmap_c)
+
+def _CT_ChartSpace_insert_style(obj, child):
+    'Return the passed ``<c:style>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}clrMapOvr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}pivotSource', '{http://schemas.openxmlformats.org/drawingml/2006/chart}protection', '{http://schemas.openxmlformats.org/drawingml/2006/chart}chart', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}externalData', '{http://schemas.openxmlformats.org/drawingml/2006/chart}printSettings', '{http://schemas.openxmlformats.org/drawingml/2006/chart}userShapes', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ChartSpace_add_style(obj, **attrs):
+    'Add a new ``<c:style>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_style()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_style(child)
+    return child
+
+def _CT_ChartSpace_get_or_add_style(obj):
+    'Return the ``<c:style>`` child element, newly added if not present.'
+    child = obj.style
+    if child is None:
+        child = obj._add_style()
+    return child
+
+def _CT_ChartSpace_remove_style(obj):
+    'Remove all ``<c:style>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}style'):
+        obj.remove(child)
+
+def _CT_ChartSpace_chart(obj):
+    'Required ``<c:chart>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}chart')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<c:chart>`` child element not present'
+        )
+    return child
+
+def _CT_ChartSpace_txPr(obj):
+    '``<c:txPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr')
+
+def _CT_ChartSpace_new_txPr(obj):
+    'Return a "loose", newly created ``<c:txPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', nsmap=_nsmap_c)
+
+def _CT_ChartSpace_insert_txPr(obj, child):
+    'Return the passed ``<c:txPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}externalData', '{http://schemas.openxmlformats.org/drawingml/2006/chart}printSettings', '{http://schemas.openxmlformats.org/drawingml/2006/chart}userShapes', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ChartSpace_add_txPr(obj, **attrs):
+    'Add a new ``<c:txPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_txPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_txPr(child)
+    return child
+
+def _CT_ChartSpace_get_or_add_txPr(obj):
+    'Return the ``<c:txPr>`` child element, newly added if not present.'
+    child = obj.txPr
+    if child is None:
+        child = obj._add_txPr()
+    return child
+
+def _CT_ChartSpace_remove_txPr(obj):
+    'Remove all ``<c:txPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr'):
+        obj.remove(child)
+
+def _CT_ChartSpace_externalData(obj):
+    '``<c:externalData>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}externalData')
+
+def _CT_ChartSpace_new_externalData(obj):
+    'Return a "loose", newly created ``<c:externalData>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}externalData', nsmap=_nsmap_c)
+
+def _CT_ChartSpace_insert_externalData(obj, child):
+    'Return the passed ``<c:externalData>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}printSettings', '{http://schemas.openxmlformats.org/drawingml/2006/chart}userShapes', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ChartSpace_add_externalData(obj, **attrs):
+    'Add a new ``<c:externalData>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_externalData()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_externalData(child)
+    return child
+
+def _CT_ChartSpace_get_or_add_externalData(obj):
+    'Return the ``<c:externalData>`` child element, newly added if not present.'
+    child = obj.externalData
+    if child is None:
+        child = obj._add_externalData()
+    return child
+
+def _CT_ChartSpace_remove_externalData(obj):
+    'Remove all ``<c:externalData>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}externalData'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.chart.CT_ChartSpace'] = (
+    ('set', 'date1904', property(_CT_ChartSpace_date1904, None, None)),
+    ('add', '_new_date1904', _CT_ChartSpace_new_date1904),
+    ('add', '_insert_date1904', _CT_ChartSpace_insert_date1904),
+    ('add', '_add_date1904', _CT_ChartSpace_add_date1904),
+    ('add', 'get_or_add_date1904', _CT_ChartSpace_get_or_add_date1904),
+    ('add', '_remove_date1904', _CT_ChartSpace_remove_date1904),
+    ('set', 'style', property(_CT_ChartSpace_style, None, None)),
+    ('add', '_new_style', _CT_ChartSpace_new_style),
+    ('add', '_insert_style', _CT_ChartSpace_insert_style),
+    ('add', '_add_style', _CT_ChartSpace_add_style),
+    ('add', 'get_or_add_style', _CT_ChartSpace_get_or_add_style),
+    ('add', '_remove_style', _CT_ChartSpace_remove_style),
+    ('set', 'chart', property(_CT_ChartSpace_chart, None, None)),
+    ('set', 'txPr', property(_CT_ChartSpace_txPr, None, None)),
+    ('add', '_new_txPr', _CT_ChartSpace_new_txPr),
+    ('add', '_insert_txPr', _CT_ChartSpace_insert_txPr),
+    ('add', '_add_txPr', _CT_ChartSpace_add_txPr),
+    ('add', 'get_or_add_txPr', _CT_ChartSpace_get_or_add_txPr),
+    ('add', '_remove_txPr', _CT_ChartSpace_remove_txPr),
+    ('set', 'externalData', property(_CT_ChartSpace_externalData, None, None)),
+    ('add', '_new_externalData', _CT_ChartSpace_new_externalData),
+    ('add', '_insert_externalData', _CT_ChartSpace_insert_externalData),
+    ('add', '_add_externalData', _CT_ChartSpace_add_externalData),
+    ('add', 'get_or_add_externalData', _CT_ChartSpace_get_or_add_externalData),
+    ('add', '_remove_externalData', _CT_ChartSpace_remove_externalData),
+)
+
+
+# pptx.oxml.chart.chart.CT_ExternalData -------------------------------------
+
+def _CT_ExternalData_autoUpdate(obj):
+    '``<c:autoUpdate>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}autoUpdate')
+
+def _CT_ExternalData_new_autoUpdate(obj):
+    'Return a "loose", newly created ``<c:autoUpdate>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}autoUpdate', nsmap=_nsmap_c)
+
+def _CT_ExternalData_insert_autoUpdate(obj, child):
+    'Return the passed ``<c:autoUpdate>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_ExternalData_add_autoUpdate(obj, **attrs):
+    'Add a new ``<c:autoUpdate>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_autoUpdate()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_autoUpdate(child)
+    return child
+
+def _CT_ExternalData_get_or_add_autoUpdate(obj):
+    'Return the ``<c:autoUpdate>`` child element, newly added if not present.'
+    child = obj.autoUpdate
+    if child is None:
+        child = obj._add_autoUpdate()
+    return child
+
+def _CT_ExternalData_remove_autoUpdate(obj):
+    'Remove all ``<c:autoUpdate>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}autoUpdate'):
+        obj.remove(child)
+
+def _CT_ExternalData_rId_get(obj):
+    'XsdString type-converted value of ``r:id`` attribute.'
+    attr_str_value = obj.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'r:id' attribute not present on element %s" % obj.tag
+        )
+    return XsdString.from_xml(attr_str_value)
+
+def _CT_ExternalData_rId_set(obj, value):
+    str_value = XsdString.to_xml(value)
+    obj.set('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id', str_value)
+
+
+members['pptx.oxml.chart.chart.CT_ExternalData'] = (
+    ('set', 'autoUpdate', property(_CT_ExternalData_autoUpdate, None, None)),
+    ('add', '_new_autoUpdate', _CT_ExternalData_new_autoUpdate),
+    ('add', '_insert_autoUpdate', _CT_ExternalData_insert_autoUpdate),
+    ('add', '_add_autoUpdate', _CT_ExternalData_add_autoUpdate),
+    ('add', 'get_or_add_autoUpdate', _CT_ExternalData_get_or_add_autoUpdate),
+    ('add', '_remove_autoUpdate', _CT_ExternalData_remove_autoUpdate),
+    ('set', 'rId', property(_CT_ExternalData_rId_get, _CT_ExternalData_rId_set, None)),
+)
+
+
+# pptx.oxml.chart.chart.CT_PlotArea -----------------------------------------
+
+def _CT_PlotArea_catAx_lst(obj):
+    'A list containing each of the ``<c:catAx>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}catAx')
+
+def _CT_PlotArea_new_catAx(obj):
+    'Return a "loose", newly created ``<c:catAx>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}catAx', nsmap=_nsmap_c)
+
+def _CT_PlotArea_insert_catAx(obj, child):
+    'Return the passed ``<c:catAx>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_PlotArea_add_catAx(obj, **attrs):
+    'Add a new ``<c:catAx>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_catAx()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_catAx(child)
+    return child
+
+def _CT_PlotArea_valAx_lst(obj):
+    'A list containing each of the ``<c:valAx>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}valAx')
+
+def _CT_PlotArea_new_valAx(obj):
+    'Return a "loose", newly created ``<c:valAx>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}valAx', nsmap=_nsmap_c)
+
+def _CT_PlotArea_insert_valAx(obj, child):
+    'Return the passed ``<c:valAx>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_PlotArea_add_valAx(obj, **attrs):
+    'Add a new ``<c:valAx>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_valAx()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_valAx(child)
+    return child
+
+
+members['pptx.oxml.chart.chart.CT_PlotArea'] = (
+    ('set', 'catAx_lst', property(_CT_PlotArea_catAx_lst, None, None)),
+    ('add', '_new_catAx', _CT_PlotArea_new_catAx),
+    ('add', '_insert_catAx', _CT_PlotArea_insert_catAx),
+    ('add', '_add_catAx', _CT_PlotArea_add_catAx),
+    ('del', 'catAx'),
+    ('set', 'valAx_lst', property(_CT_PlotArea_valAx_lst, None, None)),
+    ('add', '_new_valAx', _CT_PlotArea_new_valAx),
+    ('add', '_insert_valAx', _CT_PlotArea_insert_valAx),
+    ('add', '_add_valAx', _CT_PlotArea_add_valAx),
+    ('del', 'valAx'),
+)
+
+
+# pptx.oxml.chart.chart.CT_Style --------------------------------------------
+
+def _CT_Style_val_get(obj):
+    'ST_Style type-converted value of ``val`` attribute.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'val' attribute not present on element %s" % obj.tag
+        )
+    return ST_Style.from_xml(attr_str_value)
+
+def _CT_Style_val_set(obj, value):
+    str_value = ST_Style.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.chart.CT_Style'] = (
+    ('set', 'val', property(_CT_Style_val_get, _CT_Style_val_set, None)),
+)
+
+
+# pptx.oxml.chart.datalabel.CT_DLbl -----------------------------------------
+
+def _CT_DLbl_idx(obj):
+    'Required ``<c:idx>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}idx')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<c:idx>`` child element not present'
+        )
+    return child
+
+def _CT_DLbl_tx(obj):
+    '``<c:tx>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}tx')
+
+def _CT_DLbl_new_tx(obj):
+    'Return a "loose", newly created ``<c:tx>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}tx', nsmap=_nsmap_c)
+
+def _CT_DLbl_insert_tx(obj, child):
+    'Return the passed ``<c:tx>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showLegendKey', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showCatName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showSerName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showPercent', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showBubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}separator', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DLbl_add_tx(obj, **attrs):
+    'Add a new ``<c:tx>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_tx()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_tx(child)
+    return child
+
+def _CT_DLbl_get_or_add_tx(obj):
+    'Return the ``<c:tx>`` child element, newly added if not present.'
+    child = obj.tx
+    if child is None:
+        child = obj._add_tx()
+    return child
+
+def _CT_DLbl_remove_tx(obj):
+    'Remove all ``<c:tx>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}tx'):
+        obj.remove(child)
+
+def _CT_DLbl_spPr(obj):
+    '``<c:spPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr')
+
+def _CT_DLbl_new_spPr(obj):
+    'Return a "loose", newly created ``<c:spPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', nsmap=_nsmap_c)
+
+def _CT_DLbl_insert_spPr(obj, child):
+    'Return the passed ``<c:spPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showLegendKey', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showCatName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showSerName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showPercent', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showBubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}separator', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DLbl_add_spPr(obj, **attrs):
+    'Add a new ``<c:spPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_spPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_spPr(child)
+    return child
+
+def _CT_DLbl_get_or_add_spPr(obj):
+    'Return the ``<c:spPr>`` child element, newly added if not present.'
+    child = obj.spPr
+    if child is None:
+        child = obj._add_spPr()
+    return child
+
+def _CT_DLbl_remove_spPr(obj):
+    'Remove all ``<c:spPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr'):
+        obj.remove(child)
+
+def _CT_DLbl_txPr(obj):
+    '``<c:txPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr')
+
+def _CT_DLbl_new_txPr(obj):
+    'Return a "loose", newly created ``<c:txPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', nsmap=_nsmap_c)
+
+def _CT_DLbl_insert_txPr(obj, child):
+    'Return the passed ``<c:txPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showLegendKey', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showCatName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showSerName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showPercent', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showBubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}separator', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DLbl_add_txPr(obj, **attrs):
+    'Add a new ``<c:txPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_txPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_txPr(child)
+    return child
+
+def _CT_DLbl_get_or_add_txPr(obj):
+    'Return the ``<c:txPr>`` child element, newly added if not present.'
+    child = obj.txPr
+    if child is None:
+        child = obj._add_txPr()
+    return child
+
+def _CT_DLbl_remove_txPr(obj):
+    'Remove all ``<c:txPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr'):
+        obj.remove(child)
+
+def _CT_DLbl_dLblPos(obj):
+    '``<c:dLblPos>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLblPos')
+
+def _CT_DLbl_new_dLblPos(obj):
+    'Return a "loose", newly created ``<c:dLblPos>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLblPos', nsmap=_nsmap_c)
+
+def _CT_DLbl_insert_dLblPos(obj, child):
+    'Return the passed ``<c:dLblPos>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}showLegendKey', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showCatName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showSerName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showPercent', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showBubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}separator', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DLbl_add_dLblPos(obj, **attrs):
+    'Add a new ``<c:dLblPos>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_dLblPos()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_dLblPos(child)
+    return child
+
+def _CT_DLbl_get_or_add_dLblPos(obj):
+    'Return the ``<c:dLblPos>`` child element, newly added if not present.'
+    child = obj.dLblPos
+    if child is None:
+        child = obj._add_dLblPos()
+    return child
+
+def _CT_DLbl_remove_dLblPos(obj):
+    'Remove all ``<c:dLblPos>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLblPos'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.datalabel.CT_DLbl'] = (
+    ('set', 'idx', property(_CT_DLbl_idx, None, None)),
+    ('set', 'tx', property(_CT_DLbl_tx, None, None)),
+    ('add', '_new_tx', _CT_DLbl_new_tx),
+    ('add', '_insert_tx', _CT_DLbl_insert_tx),
+    ('add', '_add_tx', _CT_DLbl_add_tx),
+    ('add', 'get_or_add_tx', _CT_DLbl_get_or_add_tx),
+    ('add', '_remove_tx', _CT_DLbl_remove_tx),
+    ('set', 'spPr', property(_CT_DLbl_spPr, None, None)),
+    ('add', '_new_spPr', _CT_DLbl_new_spPr),
+    ('add', '_insert_spPr', _CT_DLbl_insert_spPr),
+    ('add', '_add_spPr', _CT_DLbl_add_spPr),
+    ('add', 'get_or_add_spPr', _CT_DLbl_get_or_add_spPr),
+    ('add', '_remove_spPr', _CT_DLbl_remove_spPr),
+    ('set', 'txPr', property(_CT_DLbl_txPr, None, None)),
+    ('add', '_new_txPr', _CT_DLbl_new_txPr),
+    ('add', '_insert_txPr', _CT_DLbl_insert_txPr),
+    ('add', '_add_txPr', _CT_DLbl_add_txPr),
+    ('add', 'get_or_add_txPr', _CT_DLbl_get_or_add_txPr),
+    ('add', '_remove_txPr', _CT_DLbl_remove_txPr),
+    ('set', 'dLblPos', property(_CT_DLbl_dLblPos, None, None)),
+    ('add', '_new_dLblPos', _CT_DLbl_new_dLblPos),
+    ('add', '_insert_dLblPos', _CT_DLbl_insert_dLblPos),
+    ('add', '_add_dLblPos', _CT_DLbl_add_dLblPos),
+    ('add', 'get_or_add_dLblPos', _CT_DLbl_get_or_add_dLblPos),
+    ('add', '_remove_dLblPos', _CT_DLbl_remove_dLblPos),
+)
+
+
+# pptx.oxml.chart.datalabel.CT_DLblPos --------------------------------------
+
+def _CT_DLblPos_val_get(obj):
+    'XL_DATA_LABEL_POSITION type-converted value of ``val`` attribute.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'val' attribute not present on element %s" % obj.tag
+        )
+    return XL_DATA_LABEL_POSITION.from_xml(attr_str_value)
+
+def _CT_DLblPos_val_set(obj, value):
+    str_value = XL_DATA_LABEL_POSITION.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.datalabel.CT_DLblPos'] = (
+    ('set', 'val', property(_CT_DLblPos_val_get, _CT_DLblPos_val_set, None)),
+)
+
+
+# pptx.oxml.chart.datalabel.CT_DLbls ----------------------------------------
+
+def _CT_DLbls_dLbl_lst(obj):
+    'A list containing each of the ``<c:dLbl>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbl')
+
+def _CT_DLbls_new_dLbl(obj):
+    'Return a "loose", newly created ``<c:dLbl>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbl', nsmap=_nsmap_c)
+
+def _CT_DLbls_insert_dLbl(obj, child):
+    'Return the passed ``<c:dLbl>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showLegendKey', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showCatName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showSerName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showPercent', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showBubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}separator', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showLeaderLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}leaderLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DLbls_add_dLbl(obj, **attrs):
+    'Add a new ``<c:dLbl>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_dLbl()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_dLbl(child)
+    return child
+
+def _CT_DLbls_numFmt(obj):
+    '``<c:numFmt>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt')
+
+def _CT_DLbls_new_numFmt(obj):
+    'Return a "loose", newly created ``<c:numFmt>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt', nsmap=_nsmap_c)
+
+def _CT_DLbls_insert_numFmt(obj, child):
+    'Return the passed ``<c:numFmt>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showLegendKey', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showCatName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showSerName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showPercent', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showBubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}separator', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showLeaderLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}leaderLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DLbls_add_numFmt(obj, **attrs):
+    'Add a new ``<c:numFmt>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_numFmt()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_numFmt(child)
+    return child
+
+def _CT_DLbls_get_or_add_numFmt(obj):
+    'Return the ``<c:numFmt>`` child element, newly added if not present.'
+    child = obj.numFmt
+    if child is None:
+        child = obj._add_numFmt()
+    return child
+
+def _CT_DLbls_remove_numFmt(obj):
+    'Remove all ``<c:numFmt>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}numFmt'):
+        obj.remove(child)
+
+def _CT_DLbls_txPr(obj):
+    '``<c:txPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr')
+
+def _CT_DLbls_new_txPr(obj):
+    'Return a "loose", newly created ``<c:txPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', nsmap=_nsmap_c)
+
+def _CT_DLbls_insert_txPr(obj, child):
+    'Return the passed ``<c:txPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLblPos', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showLegendKey', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showCatName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showSerName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showPercent', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showBubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}separator', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showLeaderLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}leaderLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DLbls_add_txPr(obj, **attrs):
+    'Add a new ``<c:txPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_txPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_txPr(child)
+    return child
+
+def _CT_DLbls_get_or_add_txPr(obj):
+    'Return the ``<c:txPr>`` child element, newly added if not present.'
+    child = obj.txPr
+    if child is None:
+        child = obj._add_txPr()
+    return child
+
+def _CT_DLbls_remove_txPr(obj):
+    'Remove all ``<c:txPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr'):
+        obj.remove(child)
+
+def _CT_DLbls_dLblPos(obj):
+    '``<c:dLblPos>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLblPos')
+
+def _CT_DLbls_new_dLblPos(obj):
+    'Return a "loose", newly created ``<c:dLblPos>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLblPos', nsmap=_nsmap_c)
+
+def _CT_DLbls_insert_dLblPos(obj, child):
+    'Return the passed ``<c:dLblPos>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}showLegendKey', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showCatName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showSerName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showPercent', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showBubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}separator', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showLeaderLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}leaderLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DLbls_add_dLblPos(obj, **attrs):
+    'Add a new ``<c:dLblPos>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_dLblPos()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_dLblPos(child)
+    return child
+
+def _CT_DLbls_get_or_add_dLblPos(obj):
+    'Return the ``<c:dLblPos>`` child element, newly added if not present.'
+    child = obj.dLblPos
+    if child is None:
+        child = obj._add_dLblPos()
+    return child
+
+def _CT_DLbls_remove_dLblPos(obj):
+    'Remove all ``<c:dLblPos>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLblPos'):
+        obj.remove(child)
+
+def _CT_DLbls_showLegendKey(obj):
+    '``<c:showLegendKey>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}showLegendKey')
+
+def _CT_DLbls_new_showLegendKey(obj):
+    'Return a "loose", newly created ``<c:showLegendKey>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}showLegendKey', nsmap=_nsmap_c)
+
+def _CT_DLbls_insert_showLegendKey(obj, child):
+    'Return the passed ``<c:showLegendKey>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}showVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showCatName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showSerName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showPercent', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showBubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}separator', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showLeaderLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}leaderLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DLbls_add_showLegendKey(obj, **attrs):
+    'Add a new ``<c:showLegendKey>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_showLegendKey()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_showLegendKey(child)
+    return child
+
+def _CT_DLbls_get_or_add_showLegendKey(obj):
+    'Return the ``<c:showLegendKey>`` child element, newly added if not present.'
+    child = obj.showLegendKey
+    if child is None:
+        child = obj._add_showLegendKey()
+    return child
+
+def _CT_DLbls_remove_showLegendKey(obj):
+    'Remove all ``<c:showLegendKey>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}showLegendKey'):
+        obj.remove(child)
+
+def _CT_DLbls_showVal(obj):
+    '``<c:showVal>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}showVal')
+
+def _CT_DLbls_new_showVal(obj):
+    'Return a "loose", newly created ``<c:showVal>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}showVal', nsmap=_nsmap_c)
+
+def _CT_DLbls_insert_showVal(obj, child):
+    'Return the passed ``<c:showVal>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}showCatName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showSerName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showPercent', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showBubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}separator', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showLeaderLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}leaderLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DLbls_add_showVal(obj, **attrs):
+    'Add a new ``<c:showVal>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_showVal()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_showVal(child)
+    return child
+
+def _CT_DLbls_get_or_add_showVal(obj):
+    'Return the ``<c:showVal>`` child element, newly added if not present.'
+    child = obj.showVal
+    if child is None:
+        child = obj._add_showVal()
+    return child
+
+def _CT_DLbls_remove_showVal(obj):
+    'Remove all ``<c:showVal>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}showVal'):
+        obj.remove(child)
+
+def _CT_DLbls_showCatName(obj):
+    '``<c:showCatName>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}showCatName')
+
+def _CT_DLbls_new_showCatName(obj):
+    'Return a "loose", newly created ``<c:showCatName>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}showCatName', nsmap=_nsmap_c)
+
+def _CT_DLbls_insert_showCatName(obj, child):
+    'Return the passed ``<c:showCatName>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}showSerName', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showPercent', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showBubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}separator', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showLeaderLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}leaderLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DLbls_add_showCatName(obj, **attrs):
+    'Add a new ``<c:showCatName>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_showCatName()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_showCatName(child)
+    return child
+
+def _CT_DLbls_get_or_add_showCatName(obj):
+    'Return the ``<c:showCatName>`` child element, newly added if not present.'
+    child = obj.showCatName
+    if child is None:
+        child = obj._add_showCatName()
+    return child
+
+def _CT_DLbls_remove_showCatName(obj):
+    'Remove all ``<c:showCatName>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}showCatName'):
+        obj.remove(child)
+
+def _CT_DLbls_showSerName(obj):
+    '``<c:showSerName>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}showSerName')
+
+def _CT_DLbls_new_showSerName(obj):
+    'Return a "loose", newly created ``<c:showSerName>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}showSerName', nsmap=_nsmap_c)
+
+def _CT_DLbls_insert_showSerName(obj, child):
+    'Return the passed ``<c:showSerName>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}showPercent', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showBubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}separator', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showLeaderLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}leaderLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DLbls_add_showSerName(obj, **attrs):
+    'Add a new ``<c:showSerName>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_showSerName()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_showSerName(child)
+    return child
+
+def _CT_DLbls_get_or_add_showSerName(obj):
+    'Return the ``<c:showSerName>`` child element, newly added if not present.'
+    child = obj.showSerName
+    if child is None:
+        child = obj._add_showSerName()
+    return child
+
+def _CT_DLbls_remove_showSerName(obj):
+    'Remove all ``<c:showSerName>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}showSerName'):
+        obj.remove(child)
+
+def _CT_DLbls_showPercent(obj):
+    '``<c:showPercent>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}showPercent')
+
+def _CT_DLbls_new_showPercent(obj):
+    'Return a "loose", newly created ``<c:showPercent>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}showPercent', nsmap=_nsmap_c)
+
+def _CT_DLbls_insert_showPercent(obj, child):
+    'Return the passed ``<c:showPercent>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}showBubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}separator', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showLeaderLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}leaderLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DLbls_add_showPercent(obj, **attrs):
+    'Add a new ``<c:showPercent>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_showPercent()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_showPercent(child)
+    return child
+
+def _CT_DLbls_get_or_add_showPercent(obj):
+    'Return the ``<c:showPercent>`` child element, newly added if not present.'
+    child = obj.showPercent
+    if child is None:
+        child = obj._add_showPercent()
+    return child
+
+def _CT_DLbls_remove_showPercent(obj):
+    'Remove all ``<c:showPercent>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}showPercent'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.datalabel.CT_DLbls'] = (
+    ('set', 'dLbl_lst', property(_CT_DLbls_dLbl_lst, None, None)),
+    ('add', '_new_dLbl', _CT_DLbls_new_dLbl),
+    ('add', '_insert_dLbl', _CT_DLbls_insert_dLbl),
+    ('add', '_add_dLbl', _CT_DLbls_add_dLbl),
+    ('del', 'dLbl'),
+    ('set', 'numFmt', property(_CT_DLbls_numFmt, None, None)),
+    ('add', '_new_numFmt', _CT_DLbls_new_numFmt),
+    ('add', '_insert_numFmt', _CT_DLbls_insert_numFmt),
+    ('add', '_add_numFmt', _CT_DLbls_add_numFmt),
+    ('add', 'get_or_add_numFmt', _CT_DLbls_get_or_add_numFmt),
+    ('add', '_remove_numFmt', _CT_DLbls_remove_numFmt),
+    ('set', 'txPr', property(_CT_DLbls_txPr, None, None)),
+    ('add', '_new_txPr', _CT_DLbls_new_txPr),
+    ('add', '_insert_txPr', _CT_DLbls_insert_txPr),
+    ('add', '_add_txPr', _CT_DLbls_add_txPr),
+    ('add', 'get_or_add_txPr', _CT_DLbls_get_or_add_txPr),
+    ('add', '_remove_txPr', _CT_DLbls_remove_txPr),
+    ('set', 'dLblPos', property(_CT_DLbls_dLblPos, None, None)),
+    ('add', '_new_dLblPos', _CT_DLbls_new_dLblPos),
+    ('add', '_insert_dLblPos', _CT_DLbls_insert_dLblPos),
+    ('add', '_add_dLblPos', _CT_DLbls_add_dLblPos),
+    ('add', 'get_or_add_dLblPos', _CT_DLbls_get_or_add_dLblPos),
+    ('add', '_remove_dLblPos', _CT_DLbls_remove_dLblPos),
+    ('set', 'showLegendKey', property(_CT_DLbls_showLegendKey, None, None)),
+    ('add', '_new_showLegendKey', _CT_DLbls_new_showLegendKey),
+    ('add', '_insert_showLegendKey', _CT_DLbls_insert_showLegendKey),
+    ('add', '_add_showLegendKey', _CT_DLbls_add_showLegendKey),
+    ('add', 'get_or_add_showLegendKey', _CT_DLbls_get_or_add_showLegendKey),
+    ('add', '_remove_showLegendKey', _CT_DLbls_remove_showLegendKey),
+    ('set', 'showVal', property(_CT_DLbls_showVal, None, None)),
+    ('add', '_new_showVal', _CT_DLbls_new_showVal),
+    ('add', '_insert_showVal', _CT_DLbls_insert_showVal),
+    ('add', '_add_showVal', _CT_DLbls_add_showVal),
+    ('add', 'get_or_add_showVal', _CT_DLbls_get_or_add_showVal),
+    ('add', '_remove_showVal', _CT_DLbls_remove_showVal),
+    ('set', 'showCatName', property(_CT_DLbls_showCatName, None, None)),
+    ('add', '_new_showCatName', _CT_DLbls_new_showCatName),
+    ('add', '_insert_showCatName', _CT_DLbls_insert_showCatName),
+    ('add', '_add_showCatName', _CT_DLbls_add_showCatName),
+    ('add', 'get_or_add_showCatName', _CT_DLbls_get_or_add_showCatName),
+    ('add', '_remove_showCatName', _CT_DLbls_remove_showCatName),
+    ('set', 'showSerName', property(_CT_DLbls_showSerName, None, None)),
+    ('add', '_new_showSerName', _CT_DLbls_new_showSerName),
+    ('add', '_insert_showSerName', _CT_DLbls_insert_showSerName),
+    ('add', '_add_showSerName', _CT_DLbls_add_showSerName),
+    ('add', 'get_or_add_showSerName', _CT_DLbls_get_or_add_showSerName),
+    ('add', '_remove_showSerName', _CT_DLbls_remove_showSerName),
+    ('set', 'showPercent', property(_CT_DLbls_showPercent, None, None)),
+    ('add', '_new_showPercent', _CT_DLbls_new_showPercent),
+    ('add', '_insert_showPercent', _CT_DLbls_insert_showPercent),
+    ('add', '_add_showPercent', _CT_DLbls_add_showPercent),
+    ('add', 'get_or_add_showPercent', _CT_DLbls_get_or_add_showPercent),
+    ('add', '_remove_showPercent', _CT_DLbls_remove_showPercent),
+)
+
+
+# pptx.oxml.chart.legend.CT_Legend ------------------------------------------
+
+def _CT_Legend_legendPos(obj):
+    '``<c:legendPos>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}legendPos')
+
+def _CT_Legend_new_legendPos(obj):
+    'Return a "loose", newly created ``<c:legendPos>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}legendPos', nsmap=_nsmap_c)
+
+def _CT_Legend_insert_legendPos(obj, child):
+    'Return the passed ``<c:legendPos>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}legendEntry', '{http://schemas.openxmlformats.org/drawingml/2006/chart}layout', '{http://schemas.openxmlformats.org/drawingml/2006/chart}overlay', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_Legend_add_legendPos(obj, **attrs):
+    'Add a new ``<c:legendPos>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_legendPos()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_legendPos(child)
+    return child
+
+def _CT_Legend_get_or_add_legendPos(obj):
+    'Return the ``<c:legendPos>`` child element, newly added if not present.'
+    child = obj.legendPos
+    if child is None:
+        child = obj._add_legendPos()
+    return child
+
+def _CT_Legend_remove_legendPos(obj):
+    'Remove all ``<c:legendPos>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}legendPos'):
+        obj.remove(child)
+
+def _CT_Legend_layout(obj):
+    '``<c:layout>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}layout')
+
+def _CT_Legend_new_layout(obj):
+    'Return a "loose", newly created ``<c:layout>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}layout', nsmap=_nsmap_c)
+
+def _CT_Legend_insert_layout(obj, child):
+    'Return the passed ``<c:layout>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}overlay', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_Legend_add_layout(obj, **attrs):
+    'Add a new ``<c:layout>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_layout()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_layout(child)
+    return child
+
+def _CT_Legend_get_or_add_layout(obj):
+    'Return the ``<c:layout>`` child element, newly added if not present.'
+    child = obj.layout
+    if child is None:
+        child = obj._add_layout()
+    return child
+
+def _CT_Legend_remove_layout(obj):
+    'Remove all ``<c:layout>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}layout'):
+        obj.remove(child)
+
+def _CT_Legend_overlay(obj):
+    '``<c:overlay>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}overlay')
+
+def _CT_Legend_new_overlay(obj):
+    'Return a "loose", newly created ``<c:overlay>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}overlay', nsmap=_nsmap_c)
+
+def _CT_Legend_insert_overlay(obj, child):
+    'Return the passed ``<c:overlay>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_Legend_add_overlay(obj, **attrs):
+    'Add a new ``<c:overlay>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_overlay()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_overlay(child)
+    return child
+
+def _CT_Legend_get_or_add_overlay(obj):
+    'Return the ``<c:overlay>`` child element, newly added if not present.'
+    child = obj.overlay
+    if child is None:
+        child = obj._add_overlay()
+    return child
+
+def _CT_Legend_remove_overlay(obj):
+    'Remove all ``<c:overlay>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}overlay'):
+        obj.remove(child)
+
+def _CT_Legend_txPr(obj):
+    '``<c:txPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr')
+
+def _CT_Legend_new_txPr(obj):
+    'Return a "loose", newly created ``<c:txPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', nsmap=_nsmap_c)
+
+def _CT_Legend_insert_txPr(obj, child):
+    'Return the passed ``<c:txPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst',))
+    return child
+
+def _CT_Legend_add_txPr(obj, **attrs):
+    'Add a new ``<c:txPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_txPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_txPr(child)
+    return child
+
+def _CT_Legend_get_or_add_txPr(obj):
+    'Return the ``<c:txPr>`` child element, newly added if not present.'
+    child = obj.txPr
+    if child is None:
+        child = obj._add_txPr()
+    return child
+
+def _CT_Legend_remove_txPr(obj):
+    'Remove all ``<c:txPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.legend.CT_Legend'] = (
+    ('set', 'legendPos', property(_CT_Legend_legendPos, None, None)),
+    ('add', '_new_legendPos', _CT_Legend_new_legendPos),
+    ('add', '_insert_legendPos', _CT_Legend_insert_legendPos),
+    ('add', '_add_legendPos', _CT_Legend_add_legendPos),
+    ('add', 'get_or_add_legendPos', _CT_Legend_get_or_add_legendPos),
+    ('add', '_remove_legendPos', _CT_Legend_remove_legendPos),
+    ('set', 'layout', property(_CT_Legend_layout, None, None)),
+    ('add', '_new_layout', _CT_Legend_new_layout),
+    ('add', '_insert_layout', _CT_Legend_insert_layout),
+    ('add', '_add_layout', _CT_Legend_add_layout),
+    ('add', 'get_or_add_layout', _CT_Legend_get_or_add_layout),
+    ('add', '_remove_layout', _CT_Legend_remove_layout),
+    ('set', 'overlay', property(_CT_Legend_overlay, None, None)),
+    ('add', '_new_overlay', _CT_Legend_new_overlay),
+    ('add', '_insert_overlay', _CT_Legend_insert_overlay),
+    ('add', '_add_overlay', _CT_Legend_add_overlay),
+    ('add', 'get_or_add_overlay', _CT_Legend_get_or_add_overlay),
+    ('add', '_remove_overlay', _CT_Legend_remove_overlay),
+    ('set', 'txPr', property(_CT_Legend_txPr, None, None)),
+    ('add', '_new_txPr', _CT_Legend_new_txPr),
+    ('add', '_insert_txPr', _CT_Legend_insert_txPr),
+    ('add', '_add_txPr', _CT_Legend_add_txPr),
+    ('add', 'get_or_add_txPr', _CT_Legend_get_or_add_txPr),
+    ('add', '_remove_txPr', _CT_Legend_remove_txPr),
+)
+
+
+# pptx.oxml.chart.legend.CT_LegendPos ---------------------------------------
+
+_CT_LegendPos_val_default = XL_LEGEND_POSITION.RIGHT
+
+def _CT_LegendPos_val_get(obj):
+    'XL_LEGEND_POSITION type-converted value of ``val`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        return _CT_LegendPos_val_default
+    return XL_LEGEND_POSITION.from_xml(attr_str_value)
+
+def _CT_LegendPos_val_set(obj, value):
+    if value == _CT_LegendPos_val_default:
+        if 'val' in obj.attrib:
+            del obj.attrib['val']
+        return
+    str_value = XL_LEGEND_POSITION.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.legend.CT_LegendPos'] = (
+    ('set', 'val', property(_CT_LegendPos_val_get, _CT_LegendPos_val_set, None)),
+)
+
+
+# pptx.oxml.chart.marker.CT_Marker ------------------------------------------
+
+def _CT_Marker_symbol(obj):
+    '``<c:symbol>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}symbol')
+
+def _CT_Marker_new_symbol(obj):
+    'Return a "loose", newly created ``<c:symbol>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}symbol', nsmap=_nsmap_c)
+
+def _CT_Marker_insert_symbol(obj, child):
+    'Return the passed ``<c:symbol>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}size', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_Marker_add_symbol(obj, **attrs):
+    'Add a new ``<c:symbol>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_symbol()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_symbol(child)
+    return child
+
+def _CT_Marker_get_or_add_symbol(obj):
+    'Return the ``<c:symbol>`` child element, newly added if not present.'
+    child = obj.symbol
+    if child is None:
+        child = obj._add_symbol()
+    return child
+
+def _CT_Marker_remove_symbol(obj):
+    'Remove all ``<c:symbol>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}symbol'):
+        obj.remove(child)
+
+def _CT_Marker_size(obj):
+    '``<c:size>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}size')
+
+def _CT_Marker_new_size(obj):
+    'Return a "loose", newly created ``<c:size>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}size', nsmap=_nsmap_c)
+
+def _CT_Marker_insert_size(obj, child):
+    'Return the passed ``<c:size>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_Marker_add_size(obj, **attrs):
+    'Add a new ``<c:size>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_size()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_size(child)
+    return child
+
+def _CT_Marker_get_or_add_size(obj):
+    'Return the ``<c:size>`` child element, newly added if not present.'
+    child = obj.size
+    if child is None:
+        child = obj._add_size()
+    return child
+
+def _CT_Marker_remove_size(obj):
+    'Remove all ``<c:size>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}size'):
+        obj.remove(child)
+
+def _CT_Marker_spPr(obj):
+    '``<c:spPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr')
+
+def _CT_Marker_new_spPr(obj):
+    'Return a "loose", newly created ``<c:spPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', nsmap=_nsmap_c)
+
+def _CT_Marker_insert_spPr(obj, child):
+    'Return the passed ``<c:spPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst',))
+    return child
+
+def _CT_Marker_add_spPr(obj, **attrs):
+    'Add a new ``<c:spPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_spPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_spPr(child)
+    return child
+
+def _CT_Marker_get_or_add_spPr(obj):
+    'Return the ``<c:spPr>`` child element, newly added if not present.'
+    child = obj.spPr
+    if child is None:
+        child = obj._add_spPr()
+    return child
+
+def _CT_Marker_remove_spPr(obj):
+    'Remove all ``<c:spPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.marker.CT_Marker'] = (
+    ('set', 'symbol', property(_CT_Marker_symbol, None, None)),
+    ('add', '_new_symbol', _CT_Marker_new_symbol),
+    ('add', '_insert_symbol', _CT_Marker_insert_symbol),
+    ('add', '_add_symbol', _CT_Marker_add_symbol),
+    ('add', 'get_or_add_symbol', _CT_Marker_get_or_add_symbol),
+    ('add', '_remove_symbol', _CT_Marker_remove_symbol),
+    ('set', 'size', property(_CT_Marker_size, None, None)),
+    ('add', '_new_size', _CT_Marker_new_size),
+    ('add', '_insert_size', _CT_Marker_insert_size),
+    ('add', '_add_size', _CT_Marker_add_size),
+    ('add', 'get_or_add_size', _CT_Marker_get_or_add_size),
+    ('add', '_remove_size', _CT_Marker_remove_size),
+    ('set', 'spPr', property(_CT_Marker_spPr, None, None)),
+    ('add', '_new_spPr', _CT_Marker_new_spPr),
+    ('add', '_insert_spPr', _CT_Marker_insert_spPr),
+    ('add', '_add_spPr', _CT_Marker_add_spPr),
+    ('add', 'get_or_add_spPr', _CT_Marker_get_or_add_spPr),
+    ('add', '_remove_spPr', _CT_Marker_remove_spPr),
+)
+
+
+# pptx.oxml.chart.marker.CT_MarkerSize --------------------------------------
+
+def _CT_MarkerSize_val_get(obj):
+    'ST_MarkerSize type-converted value of ``val`` attribute.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'val' attribute not present on element %s" % obj.tag
+        )
+    return ST_MarkerSize.from_xml(attr_str_value)
+
+def _CT_MarkerSize_val_set(obj, value):
+    str_value = ST_MarkerSize.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.marker.CT_MarkerSize'] = (
+    ('set', 'val', property(_CT_MarkerSize_val_get, _CT_MarkerSize_val_set, None)),
+)
+
+
+# pptx.oxml.chart.marker.CT_MarkerStyle -------------------------------------
+
+def _CT_MarkerStyle_val_get(obj):
+    'XL_MARKER_STYLE type-converted value of ``val`` attribute.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'val' attribute not present on element %s" % obj.tag
+        )
+    return XL_MARKER_STYLE.from_xml(attr_str_value)
+
+def _CT_MarkerStyle_val_set(obj, value):
+    str_value = XL_MARKER_STYLE.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.marker.CT_MarkerStyle'] = (
+    ('set', 'val', property(_CT_MarkerStyle_val_get, _CT_MarkerStyle_val_set, None)),
+)
+
+
+# pptx.oxml.chart.plot.CT_Area3DChart ---------------------------------------
+
+def _CT_Area3DChart_grouping(obj):
+    '``<c:grouping>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}grouping')
+
+def _CT_Area3DChart_new_grouping(obj):
+    'Return a "loose", newly created ``<c:grouping>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}grouping', nsmap=_nsmap_c)
+
+def _CT_Area3DChart_insert_grouping(obj, child):
+    'Return the passed ``<c:grouping>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors', '{http://schemas.openxmlformats.org/drawingml/2006/chart}ser', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dropLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}gapDepth', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId'))
+    return child
+
+def _CT_Area3DChart_add_grouping(obj, **attrs):
+    'Add a new ``<c:grouping>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_grouping()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_grouping(child)
+    return child
+
+def _CT_Area3DChart_get_or_add_grouping(obj):
+    'Return the ``<c:grouping>`` child element, newly added if not present.'
+    child = obj.grouping
+    if child is None:
+        child = obj._add_grouping()
+    return child
+
+def _CT_Area3DChart_remove_grouping(obj):
+    'Remove all ``<c:grouping>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}grouping'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.plot.CT_Area3DChart'] = (
+    ('set', 'grouping', property(_CT_Area3DChart_grouping, None, None)),
+    ('add', '_new_grouping', _CT_Area3DChart_new_grouping),
+    ('add', '_insert_grouping', _CT_Area3DChart_insert_grouping),
+    ('add', '_add_grouping', _CT_Area3DChart_add_grouping),
+    ('add', 'get_or_add_grouping', _CT_Area3DChart_get_or_add_grouping),
+    ('add', '_remove_grouping', _CT_Area3DChart_remove_grouping),
+)
+
+
+# pptx.oxml.chart.plot.CT_AreaChart -----------------------------------------
+
+def _CT_AreaChart_grouping(obj):
+    '``<c:grouping>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}grouping')
+
+def _CT_AreaChart_new_grouping(obj):
+    'Return a "loose", newly created ``<c:grouping>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}grouping', nsmap=_nsmap_c)
+
+def _CT_AreaChart_insert_grouping(obj, child):
+    'Return the passed ``<c:grouping>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors', '{http://schemas.openxmlformats.org/drawingml/2006/chart}ser', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dropLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_AreaChart_add_grouping(obj, **attrs):
+    'Add a new ``<c:grouping>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_grouping()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_grouping(child)
+    return child
+
+def _CT_AreaChart_get_or_add_grouping(obj):
+    'Return the ``<c:grouping>`` child element, newly added if not present.'
+    child = obj.grouping
+    if child is None:
+        child = obj._add_grouping()
+    return child
+
+def _CT_AreaChart_remove_grouping(obj):
+    'Remove all ``<c:grouping>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}grouping'):
+        obj.remove(child)
+
+def _CT_AreaChart_varyColors(obj):
+    '``<c:varyColors>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors')
+
+def _CT_AreaChart_new_varyColors(obj):
+    'Return a "loose", newly created ``<c:varyColors>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors', nsmap=_nsmap_c)
+
+def _CT_AreaChart_insert_varyColors(obj, child):
+    'Return the passed ``<c:varyColors>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dropLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_AreaChart_add_varyColors(obj, **attrs):
+    'Add a new ``<c:varyColors>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_varyColors()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_varyColors(child)
+    return child
+
+def _CT_AreaChart_get_or_add_varyColors(obj):
+    'Return the ``<c:varyColors>`` child element, newly added if not present.'
+    child = obj.varyColors
+    if child is None:
+        child = obj._add_varyColors()
+    return child
+
+def _CT_AreaChart_remove_varyColors(obj):
+    'Remove all ``<c:varyColors>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors'):
+        obj.remove(child)
+
+def _CT_AreaChart_ser_lst(obj):
+    'A list containing each of the ``<c:ser>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser')
+
+def _CT_AreaChart_new_ser(obj):
+    'Return a "loose", newly created ``<c:ser>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser', nsmap=_nsmap_c)
+
+def _CT_AreaChart_insert_ser(obj, child):
+    'Return the passed ``<c:ser>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dropLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_AreaChart_add_ser(obj, **attrs):
+    'Add a new ``<c:ser>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_ser()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_ser(child)
+    return child
+
+def _CT_AreaChart_dLbls(obj):
+    '``<c:dLbls>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls')
+
+def _CT_AreaChart_new_dLbls(obj):
+    'Return a "loose", newly created ``<c:dLbls>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', nsmap=_nsmap_c)
+
+def _CT_AreaChart_insert_dLbls(obj, child):
+    'Return the passed ``<c:dLbls>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}dropLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_AreaChart_add_dLbls(obj, **attrs):
+    'Add a new ``<c:dLbls>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_dLbls()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_dLbls(child)
+    return child
+
+def _CT_AreaChart_get_or_add_dLbls(obj):
+    'Return the ``<c:dLbls>`` child element, newly added if not present.'
+    child = obj.dLbls
+    if child is None:
+        child = obj._add_dLbls()
+    return child
+
+def _CT_AreaChart_remove_dLbls(obj):
+    'Remove all ``<c:dLbls>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.plot.CT_AreaChart'] = (
+    ('set', 'grouping', property(_CT_AreaChart_grouping, None, None)),
+    ('add', '_new_grouping', _CT_AreaChart_new_grouping),
+    ('add', '_insert_grouping', _CT_AreaChart_insert_grouping),
+    ('add', '_add_grouping', _CT_AreaChart_add_grouping),
+    ('add', 'get_or_add_grouping', _CT_AreaChart_get_or_add_grouping),
+    ('add', '_remove_grouping', _CT_AreaChart_remove_grouping),
+    ('set', 'varyColors', property(_CT_AreaChart_varyColors, None, None)),
+    ('add', '_new_varyColors', _CT_AreaChart_new_varyColors),
+    ('add', '_insert_varyColors', _CT_AreaChart_insert_varyColors),
+    ('add', '_add_varyColors', _CT_AreaChart_add_varyColors),
+    ('add', 'get_or_add_varyColors', _CT_AreaChart_get_or_add_varyColors),
+    ('add', '_remove_varyColors', _CT_AreaChart_remove_varyColors),
+    ('set', 'ser_lst', property(_CT_AreaChart_ser_lst, None, None)),
+    ('add', '_new_ser', _CT_AreaChart_new_ser),
+    ('add', '_insert_ser', _CT_AreaChart_insert_ser),
+    ('add', '_add_ser', _CT_AreaChart_add_ser),
+    ('del', 'ser'),
+    ('set', 'dLbls', property(_CT_AreaChart_dLbls, None, None)),
+    ('add', '_new_dLbls', _CT_AreaChart_new_dLbls),
+    ('add', '_insert_dLbls', _CT_AreaChart_insert_dLbls),
+    ('add', '_add_dLbls', _CT_AreaChart_add_dLbls),
+    ('add', 'get_or_add_dLbls', _CT_AreaChart_get_or_add_dLbls),
+    ('add', '_remove_dLbls', _CT_AreaChart_remove_dLbls),
+)
+
+
+# pptx.oxml.chart.plot.CT_BarChart ------------------------------------------
+
+def _CT_BarChart_barDir(obj):
+    'Required ``<c:barDir>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}barDir')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<c:barDir>`` child element not present'
+        )
+    return child
+
+def _CT_BarChart_grouping(obj):
+    '``<c:grouping>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}grouping')
+
+def _CT_BarChart_new_grouping(obj):
+    'Return a "loose", newly created ``<c:grouping>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}grouping', nsmap=_nsmap_c)
+
+def _CT_BarChart_insert_grouping(obj, child):
+    'Return the passed ``<c:grouping>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors', '{http://schemas.openxmlformats.org/drawingml/2006/chart}ser', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}gapWidth', '{http://schemas.openxmlformats.org/drawingml/2006/chart}overlap', '{http://schemas.openxmlformats.org/drawingml/2006/chart}serLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_BarChart_add_grouping(obj, **attrs):
+    'Add a new ``<c:grouping>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_grouping()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_grouping(child)
+    return child
+
+def _CT_BarChart_get_or_add_grouping(obj):
+    'Return the ``<c:grouping>`` child element, newly added if not present.'
+    child = obj.grouping
+    if child is None:
+        child = obj._add_grouping()
+    return child
+
+def _CT_BarChart_remove_grouping(obj):
+    'Remove all ``<c:grouping>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}grouping'):
+        obj.remove(child)
+
+def _CT_BarChart_varyColors(obj):
+    '``<c:varyColors>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors')
+
+def _CT_BarChart_new_varyColors(obj):
+    'Return a "loose", newly created ``<c:varyColors>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors', nsmap=_nsmap_c)
+
+def _CT_BarChart_insert_varyColors(obj, child):
+    'Return the passed ``<c:varyColors>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}gapWidth', '{http://schemas.openxmlformats.org/drawingml/2006/chart}overlap', '{http://schemas.openxmlformats.org/drawingml/2006/chart}serLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_BarChart_add_varyColors(obj, **attrs):
+    'Add a new ``<c:varyColors>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_varyColors()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_varyColors(child)
+    return child
+
+def _CT_BarChart_get_or_add_varyColors(obj):
+    'Return the ``<c:varyColors>`` child element, newly added if not present.'
+    child = obj.varyColors
+    if child is None:
+        child = obj._add_varyColors()
+    return child
+
+def _CT_BarChart_remove_varyColors(obj):
+    'Remove all ``<c:varyColors>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors'):
+        obj.remove(child)
+
+def _CT_BarChart_ser_lst(obj):
+    'A list containing each of the ``<c:ser>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser')
+
+def _CT_BarChart_new_ser(obj):
+    'Return a "loose", newly created ``<c:ser>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser', nsmap=_nsmap_c)
+
+def _CT_BarChart_insert_ser(obj, child):
+    'Return the passed ``<c:ser>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}gapWidth', '{http://schemas.openxmlformats.org/drawingml/2006/chart}overlap', '{http://schemas.openxmlformats.org/drawingml/2006/chart}serLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_BarChart_add_ser(obj, **attrs):
+    'Add a new ``<c:ser>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_ser()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_ser(child)
+    return child
+
+def _CT_BarChart_dLbls(obj):
+    '``<c:dLbls>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls')
+
+def _CT_BarChart_new_dLbls(obj):
+    'Return a "loose", newly created ``<c:dLbls>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', nsmap=_nsmap_c)
+
+def _CT_BarChart_insert_dLbls(obj, child):
+    'Return the passed ``<c:dLbls>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}gapWidth', '{http://schemas.openxmlformats.org/drawingml/2006/chart}overlap', '{http://schemas.openxmlformats.org/drawingml/2006/chart}serLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_BarChart_add_dLbls(obj, **attrs):
+    'Add a new ``<c:dLbls>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_dLbls()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_dLbls(child)
+    return child
+
+def _CT_BarChart_get_or_add_dLbls(obj):
+    'Return the ``<c:dLbls>`` child element, newly added if not present.'
+    child = obj.dLbls
+    if child is None:
+        child = obj._add_dLbls()
+    return child
+
+def _CT_BarChart_remove_dLbls(obj):
+    'Remove all ``<c:dLbls>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls'):
+        obj.remove(child)
+
+def _CT_BarChart_gapWidth(obj):
+    '``<c:gapWidth>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}gapWidth')
+
+def _CT_BarChart_new_gapWidth(obj):
+    'Return a "loose", newly created ``<c:gapWidth>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}gapWidth', nsmap=_nsmap_c)
+
+def _CT_BarChart_insert_gapWidth(obj, child):
+    'Return the passed ``<c:gapWidth>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}overlap', '{http://schemas.openxmlformats.org/drawingml/2006/chart}serLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_BarChart_add_gapWidth(obj, **attrs):
+    'Add a new ``<c:gapWidth>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_gapWidth()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_gapWidth(child)
+    return child
+
+def _CT_BarChart_get_or_add_gapWidth(obj):
+    'Return the ``<c:gapWidth>`` child element, newly added if not present.'
+    child = obj.gapWidth
+    if child is None:
+        child = obj._add_gapWidth()
+    return child
+
+def _CT_BarChart_remove_gapWidth(obj):
+    'Remove all ``<c:gapWidth>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}gapWidth'):
+        obj.remove(child)
+
+def _CT_BarChart_overlap(obj):
+    '``<c:overlap>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}overlap')
+
+def _CT_BarChart_new_overlap(obj):
+    'Return a "loose", newly created ``<c:overlap>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}overlap', nsmap=_nsmap_c)
+
+def _CT_BarChart_insert_overlap(obj, child):
+    'Return the passed ``<c:overlap>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}serLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_BarChart_add_overlap(obj, **attrs):
+    'Add a new ``<c:overlap>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_overlap()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_overlap(child)
+    return child
+
+def _CT_BarChart_get_or_add_overlap(obj):
+    'Return the ``<c:overlap>`` child element, newly added if not present.'
+    child = obj.overlap
+    if child is None:
+        child = obj._add_overlap()
+    return child
+
+def _CT_BarChart_remove_overlap(obj):
+    'Remove all ``<c:overlap>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}overlap'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.plot.CT_BarChart'] = (
+    ('set', 'barDir', property(_CT_BarChart_barDir, None, None)),
+    ('set', 'grouping', property(_CT_BarChart_grouping, None, None)),
+    ('add', '_new_grouping', _CT_BarChart_new_grouping),
+    ('add', '_insert_grouping', _CT_BarChart_insert_grouping),
+    ('add', '_add_grouping', _CT_BarChart_add_grouping),
+    ('add', 'get_or_add_grouping', _CT_BarChart_get_or_add_grouping),
+    ('add', '_remove_grouping', _CT_BarChart_remove_grouping),
+    ('set', 'varyColors', property(_CT_BarChart_varyColors, None, None)),
+    ('add', '_new_varyColors', _CT_BarChart_new_varyColors),
+    ('add', '_insert_varyColors', _CT_BarChart_insert_varyColors),
+    ('add', '_add_varyColors', _CT_BarChart_add_varyColors),
+    ('add', 'get_or_add_varyColors', _CT_BarChart_get_or_add_varyColors),
+    ('add', '_remove_varyColors', _CT_BarChart_remove_varyColors),
+    ('set', 'ser_lst', property(_CT_BarChart_ser_lst, None, None)),
+    ('add', '_new_ser', _CT_BarChart_new_ser),
+    ('add', '_insert_ser', _CT_BarChart_insert_ser),
+    ('add', '_add_ser', _CT_BarChart_add_ser),
+    ('del', 'ser'),
+    ('set', 'dLbls', property(_CT_BarChart_dLbls, None, None)),
+    ('add', '_new_dLbls', _CT_BarChart_new_dLbls),
+    ('add', '_insert_dLbls', _CT_BarChart_insert_dLbls),
+    ('add', '_add_dLbls', _CT_BarChart_add_dLbls),
+    ('add', 'get_or_add_dLbls', _CT_BarChart_get_or_add_dLbls),
+    ('add', '_remove_dLbls', _CT_BarChart_remove_dLbls),
+    ('set', 'gapWidth', property(_CT_BarChart_gapWidth, None, None)),
+    ('add', '_new_gapWidth', _CT_BarChart_new_gapWidth),
+    ('add', '_insert_gapWidth', _CT_BarChart_insert_gapWidth),
+    ('add', '_add_gapWidth', _CT_BarChart_add_gapWidth),
+    ('add', 'get_or_add_gapWidth', _CT_BarChart_get_or_add_gapWidth),
+    ('add', '_remove_gapWidth', _CT_BarChart_remove_gapWidth),
+    ('set', 'overlap', property(_CT_BarChart_overlap, None, None)),
+    ('add', '_new_overlap', _CT_BarChart_new_overlap),
+    ('add', '_insert_overlap', _CT_BarChart_insert_overlap),
+    ('add', '_add_overlap', _CT_BarChart_add_overlap),
+    ('add', 'get_or_add_overlap', _CT_BarChart_get_or_add_overlap),
+    ('add', '_remove_overlap', _CT_BarChart_remove_overlap),
+)
+
+
+# pptx.oxml.chart.plot.CT_BarDir --------------------------------------------
+
+def _CT_BarDir_val_get(obj):
+    'ST_BarDir type-converted value of ``val`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        return 'col'
+    return ST_BarDir.from_xml(attr_str_value)
+
+def _CT_BarDir_val_set(obj, value):
+    if value == 'col':
+        if 'val' in obj.attrib:
+            del obj.attrib['val']
+        return
+    str_value = ST_BarDir.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.plot.CT_BarDir'] = (
+    ('set', 'val', property(_CT_BarDir_val_get, _CT_BarDir_val_set, None)),
+)
+
+
+# pptx.oxml.chart.plot.CT_BubbleChart ---------------------------------------
+
+def _CT_BubbleChart_ser_lst(obj):
+    'A list containing each of the ``<c:ser>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser')
+
+def _CT_BubbleChart_new_ser(obj):
+    'Return a "loose", newly created ``<c:ser>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser', nsmap=_nsmap_c)
+
+def _CT_BubbleChart_insert_ser(obj, child):
+    'Return the passed ``<c:ser>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubble3D', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleScale', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showNegBubbles', '{http://schemas.openxmlformats.org/drawingml/2006/chart}sizeRepresents', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_BubbleChart_add_ser(obj, **attrs):
+    'Add a new ``<c:ser>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_ser()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_ser(child)
+    return child
+
+def _CT_BubbleChart_dLbls(obj):
+    '``<c:dLbls>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls')
+
+def _CT_BubbleChart_new_dLbls(obj):
+    'Return a "loose", newly created ``<c:dLbls>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', nsmap=_nsmap_c)
+
+def _CT_BubbleChart_insert_dLbls(obj, child):
+    'Return the passed ``<c:dLbls>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubble3D', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleScale', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showNegBubbles', '{http://schemas.openxmlformats.org/drawingml/2006/chart}sizeRepresents', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_BubbleChart_add_dLbls(obj, **attrs):
+    'Add a new ``<c:dLbls>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_dLbls()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_dLbls(child)
+    return child
+
+def _CT_BubbleChart_get_or_add_dLbls(obj):
+    'Return the ``<c:dLbls>`` child element, newly added if not present.'
+    child = obj.dLbls
+    if child is None:
+        child = obj._add_dLbls()
+    return child
+
+def _CT_BubbleChart_remove_dLbls(obj):
+    'Remove all ``<c:dLbls>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls'):
+        obj.remove(child)
+
+def _CT_BubbleChart_bubble3D(obj):
+    '``<c:bubble3D>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}bubble3D')
+
+def _CT_BubbleChart_new_bubble3D(obj):
+    'Return a "loose", newly created ``<c:bubble3D>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}bubble3D', nsmap=_nsmap_c)
+
+def _CT_BubbleChart_insert_bubble3D(obj, child):
+    'Return the passed ``<c:bubble3D>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleScale', '{http://schemas.openxmlformats.org/drawingml/2006/chart}showNegBubbles', '{http://schemas.openxmlformats.org/drawingml/2006/chart}sizeRepresents', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_BubbleChart_add_bubble3D(obj, **attrs):
+    'Add a new ``<c:bubble3D>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_bubble3D()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_bubble3D(child)
+    return child
+
+def _CT_BubbleChart_get_or_add_bubble3D(obj):
+    'Return the ``<c:bubble3D>`` child element, newly added if not present.'
+    child = obj.bubble3D
+    if child is None:
+        child = obj._add_bubble3D()
+    return child
+
+def _CT_BubbleChart_remove_bubble3D(obj):
+    'Remove all ``<c:bubble3D>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}bubble3D'):
+        obj.remove(child)
+
+def _CT_BubbleChart_bubbleScale(obj):
+    '``<c:bubbleScale>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleScale')
+
+def _CT_BubbleChart_new_bubbleScale(obj):
+    'Return a "loose", newly created ``<c:bubbleScale>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleScale', nsmap=_nsmap_c)
+
+def _CT_BubbleChart_insert_bubbleScale(obj, child):
+    'Return the passed ``<c:bubbleScale>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}showNegBubbles', '{http://schemas.openxmlformats.org/drawingml/2006/chart}sizeRepresents', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_BubbleChart_add_bubbleScale(obj, **attrs):
+    'Add a new ``<c:bubbleScale>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_bubbleScale()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_bubbleScale(child)
+    return child
+
+def _CT_BubbleChart_get_or_add_bubbleScale(obj):
+    'Return the ``<c:bubbleScale>`` child element, newly added if not present.'
+    child = obj.bubbleScale
+    if child is None:
+        child = obj._add_bubbleScale()
+    return child
+
+def _CT_BubbleChart_remove_bubbleScale(obj):
+    'Remove all ``<c:bubbleScale>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleScale'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.plot.CT_BubbleChart'] = (
+    ('set', 'ser_lst', property(_CT_BubbleChart_ser_lst, None, None)),
+    ('add', '_new_ser', _CT_BubbleChart_new_ser),
+    ('add', '_insert_ser', _CT_BubbleChart_insert_ser),
+    ('add', '_add_ser', _CT_BubbleChart_add_ser),
+    ('del', 'ser'),
+    ('set', 'dLbls', property(_CT_BubbleChart_dLbls, None, None)),
+    ('add', '_new_dLbls', _CT_BubbleChart_new_dLbls),
+    ('add', '_insert_dLbls', _CT_BubbleChart_insert_dLbls),
+    ('add', '_add_dLbls', _CT_BubbleChart_add_dLbls),
+    ('add', 'get_or_add_dLbls', _CT_BubbleChart_get_or_add_dLbls),
+    ('add', '_remove_dLbls', _CT_BubbleChart_remove_dLbls),
+    ('set', 'bubble3D', property(_CT_BubbleChart_bubble3D, None, None)),
+    ('add', '_new_bubble3D', _CT_BubbleChart_new_bubble3D),
+    ('add', '_insert_bubble3D', _CT_BubbleChart_insert_bubble3D),
+    ('add', '_add_bubble3D', _CT_BubbleChart_add_bubble3D),
+    ('add', 'get_or_add_bubble3D', _CT_BubbleChart_get_or_add_bubble3D),
+    ('add', '_remove_bubble3D', _CT_BubbleChart_remove_bubble3D),
+    ('set', 'bubbleScale', property(_CT_BubbleChart_bubbleScale, None, None)),
+    ('add', '_new_bubbleScale', _CT_BubbleChart_new_bubbleScale),
+    ('add', '_insert_bubbleScale', _CT_BubbleChart_insert_bubbleScale),
+    ('add', '_add_bubbleScale', _CT_BubbleChart_add_bubbleScale),
+    ('add', 'get_or_add_bubbleScale', _CT_BubbleChart_get_or_add_bubbleScale),
+    ('add', '_remove_bubbleScale', _CT_BubbleChart_remove_bubbleScale),
+)
+
+
+# pptx.oxml.chart.plot.CT_BubbleScale ---------------------------------------
+
+def _CT_BubbleScale_val_get(obj):
+    'ST_BubbleScale type-converted value of ``val`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        return 100
+    return ST_BubbleScale.from_xml(attr_str_value)
+
+def _CT_BubbleScale_val_set(obj, value):
+    if value == 100:
+        if 'val' in obj.attrib:
+            del obj.attrib['val']
+        return
+    str_value = ST_BubbleScale.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.plot.CT_BubbleScale'] = (
+    ('set', 'val', property(_CT_BubbleScale_val_get, _CT_BubbleScale_val_set, None)),
+)
+
+
+# pptx.oxml.chart.plot.CT_DoughnutChart -------------------------------------
+
+def _CT_DoughnutChart_varyColors(obj):
+    '``<c:varyColors>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors')
+
+def _CT_DoughnutChart_new_varyColors(obj):
+    'Return a "loose", newly created ``<c:varyColors>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors', nsmap=_nsmap_c)
+
+def _CT_DoughnutChart_insert_varyColors(obj, child):
+    'Return the passed ``<c:varyColors>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}firstSliceAng', '{http://schemas.openxmlformats.org/drawingml/2006/chart}holeSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DoughnutChart_add_varyColors(obj, **attrs):
+    'Add a new ``<c:varyColors>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_varyColors()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_varyColors(child)
+    return child
+
+def _CT_DoughnutChart_get_or_add_varyColors(obj):
+    'Return the ``<c:varyColors>`` child element, newly added if not present.'
+    child = obj.varyColors
+    if child is None:
+        child = obj._add_varyColors()
+    return child
+
+def _CT_DoughnutChart_remove_varyColors(obj):
+    'Remove all ``<c:varyColors>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors'):
+        obj.remove(child)
+
+def _CT_DoughnutChart_ser_lst(obj):
+    'A list containing each of the ``<c:ser>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser')
+
+def _CT_DoughnutChart_new_ser(obj):
+    'Return a "loose", newly created ``<c:ser>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser', nsmap=_nsmap_c)
+
+def _CT_DoughnutChart_insert_ser(obj, child):
+    'Return the passed ``<c:ser>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}firstSliceAng', '{http://schemas.openxmlformats.org/drawingml/2006/chart}holeSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DoughnutChart_add_ser(obj, **attrs):
+    'Add a new ``<c:ser>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_ser()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_ser(child)
+    return child
+
+def _CT_DoughnutChart_dLbls(obj):
+    '``<c:dLbls>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls')
+
+def _CT_DoughnutChart_new_dLbls(obj):
+    'Return a "loose", newly created ``<c:dLbls>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', nsmap=_nsmap_c)
+
+def _CT_DoughnutChart_insert_dLbls(obj, child):
+    'Return the passed ``<c:dLbls>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}firstSliceAng', '{http://schemas.openxmlformats.org/drawingml/2006/chart}holeSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DoughnutChart_add_dLbls(obj, **attrs):
+    'Add a new ``<c:dLbls>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_dLbls()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_dLbls(child)
+    return child
+
+def _CT_DoughnutChart_get_or_add_dLbls(obj):
+    'Return the ``<c:dLbls>`` child element, newly added if not present.'
+    child = obj.dLbls
+    if child is None:
+        child = obj._add_dLbls()
+    return child
+
+def _CT_DoughnutChart_remove_dLbls(obj):
+    'Remove all ``<c:dLbls>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.plot.CT_DoughnutChart'] = (
+    ('set', 'varyColors', property(_CT_DoughnutChart_varyColors, None, None)),
+    ('add', '_new_varyColors', _CT_DoughnutChart_new_varyColors),
+    ('add', '_insert_varyColors', _CT_DoughnutChart_insert_varyColors),
+    ('add', '_add_varyColors', _CT_DoughnutChart_add_varyColors),
+    ('add', 'get_or_add_varyColors', _CT_DoughnutChart_get_or_add_varyColors),
+    ('add', '_remove_varyColors', _CT_DoughnutChart_remove_varyColors),
+    ('set', 'ser_lst', property(_CT_DoughnutChart_ser_lst, None, None)),
+    ('add', '_new_ser', _CT_DoughnutChart_new_ser),
+    ('add', '_insert_ser', _CT_DoughnutChart_insert_ser),
+    ('add', '_add_ser', _CT_DoughnutChart_add_ser),
+    ('del', 'ser'),
+    ('set', 'dLbls', property(_CT_DoughnutChart_dLbls, None, None)),
+    ('add', '_new_dLbls', _CT_DoughnutChart_new_dLbls),
+    ('add', '_insert_dLbls', _CT_DoughnutChart_insert_dLbls),
+    ('add', '_add_dLbls', _CT_DoughnutChart_add_dLbls),
+    ('add', 'get_or_add_dLbls', _CT_DoughnutChart_get_or_add_dLbls),
+    ('add', '_remove_dLbls', _CT_DoughnutChart_remove_dLbls),
+)
+
+
+# pptx.oxml.chart.plot.CT_GapAmount -----------------------------------------
+
+def _CT_GapAmount_val_get(obj):
+    'ST_GapAmount type-converted value of ``val`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        return 150
+    return ST_GapAmount.from_xml(attr_str_value)
+
+def _CT_GapAmount_val_set(obj, value):
+    if value == 150:
+        if 'val' in obj.attrib:
+            del obj.attrib['val']
+        return
+    str_value = ST_GapAmount.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.plot.CT_GapAmount'] = (
+    ('set', 'val', property(_CT_GapAmount_val_get, _CT_GapAmount_val_set, None)),
+)
+
+
+# pptx.oxml.chart.plot.CT_Grouping ------------------------------------------
+
+def _CT_Grouping_val_get(obj):
+    'ST_Grouping type-converted value of ``val`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        return None
+    return ST_Grouping.from_xml(attr_str_value)
+
+def _CT_Grouping_val_set(obj, value):
+    if value == None:
+        if 'val' in obj.attrib:
+            del obj.attrib['val']
+        return
+    str_value = ST_Grouping.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.plot.CT_Grouping'] = (
+    ('set', 'val', property(_CT_Grouping_val_get, _CT_Grouping_val_set, None)),
+)
+
+
+# pptx.oxml.chart.plot.CT_LineChart -----------------------------------------
+
+def _CT_LineChart_grouping(obj):
+    '``<c:grouping>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}grouping')
+
+def _CT_LineChart_new_grouping(obj):
+    'Return a "loose", newly created ``<c:grouping>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}grouping', nsmap=_nsmap_c)
+
+def _CT_LineChart_insert_grouping(obj, child):
+    'Return the passed ``<c:grouping>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors', '{http://schemas.openxmlformats.org/drawingml/2006/chart}ser', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dropLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}hiLowLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}upDownBars', '{http://schemas.openxmlformats.org/drawingml/2006/chart}marker', '{http://schemas.openxmlformats.org/drawingml/2006/chart}smooth', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_LineChart_add_grouping(obj, **attrs):
+    'Add a new ``<c:grouping>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_grouping()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_grouping(child)
+    return child
+
+def _CT_LineChart_get_or_add_grouping(obj):
+    'Return the ``<c:grouping>`` child element, newly added if not present.'
+    child = obj.grouping
+    if child is None:
+        child = obj._add_grouping()
+    return child
+
+def _CT_LineChart_remove_grouping(obj):
+    'Remove all ``<c:grouping>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}grouping'):
+        obj.remove(child)
+
+def _CT_LineChart_varyColors(obj):
+    '``<c:varyColors>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors')
+
+def _CT_LineChart_new_varyColors(obj):
+    'Return a "loose", newly created ``<c:varyColors>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors', nsmap=_nsmap_c)
+
+def _CT_LineChart_insert_varyColors(obj, child):
+    'Return the passed ``<c:varyColors>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dropLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}hiLowLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}upDownBars', '{http://schemas.openxmlformats.org/drawingml/2006/chart}marker', '{http://schemas.openxmlformats.org/drawingml/2006/chart}smooth', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_LineChart_add_varyColors(obj, **attrs):
+    'Add a new ``<c:varyColors>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_varyColors()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_varyColors(child)
+    return child
+
+def _CT_LineChart_get_or_add_varyColors(obj):
+    'Return the ``<c:varyColors>`` child element, newly added if not present.'
+    child = obj.varyColors
+    if child is None:
+        child = obj._add_varyColors()
+    return child
+
+def _CT_LineChart_remove_varyColors(obj):
+    'Remove all ``<c:varyColors>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors'):
+        obj.remove(child)
+
+def _CT_LineChart_ser_lst(obj):
+    'A list containing each of the ``<c:ser>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser')
+
+def _CT_LineChart_new_ser(obj):
+    'Return a "loose", newly created ``<c:ser>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser', nsmap=_nsmap_c)
+
+def _CT_LineChart_insert_ser(obj, child):
+    'Return the passed ``<c:ser>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dropLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}hiLowLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}upDownBars', '{http://schemas.openxmlformats.org/drawingml/2006/chart}marker', '{http://schemas.openxmlformats.org/drawingml/2006/chart}smooth', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_LineChart_add_ser(obj, **attrs):
+    'Add a new ``<c:ser>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_ser()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_ser(child)
+    return child
+
+def _CT_LineChart_dLbls(obj):
+    '``<c:dLbls>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls')
+
+def _CT_LineChart_new_dLbls(obj):
+    'Return a "loose", newly created ``<c:dLbls>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', nsmap=_nsmap_c)
+
+def _CT_LineChart_insert_dLbls(obj, child):
+    'Return the passed ``<c:dLbls>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}dropLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}hiLowLines', '{http://schemas.openxmlformats.org/drawingml/2006/chart}upDownBars', '{http://schemas.openxmlformats.org/drawingml/2006/chart}marker', '{http://schemas.openxmlformats.org/drawingml/2006/chart}smooth', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_LineChart_add_dLbls(obj, **attrs):
+    'Add a new ``<c:dLbls>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_dLbls()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_dLbls(child)
+    return child
+
+def _CT_LineChart_get_or_add_dLbls(obj):
+    'Return the ``<c:dLbls>`` child element, newly added if not present.'
+    child = obj.dLbls
+    if child is None:
+        child = obj._add_dLbls()
+    return child
+
+def _CT_LineChart_remove_dLbls(obj):
+    'Remove all ``<c:dLbls>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.plot.CT_LineChart'] = (
+    ('set', 'grouping', property(_CT_LineChart_grouping, None, None)),
+    ('add', '_new_grouping', _CT_LineChart_new_grouping),
+    ('add', '_insert_grouping', _CT_LineChart_insert_grouping),
+    ('add', '_add_grouping', _CT_LineChart_add_grouping),
+    ('add', 'get_or_add_grouping', _CT_LineChart_get_or_add_grouping),
+    ('add', '_remove_grouping', _CT_LineChart_remove_grouping),
+    ('set', 'varyColors', property(_CT_LineChart_varyColors, None, None)),
+    ('add', '_new_varyColors', _CT_LineChart_new_varyColors),
+    ('add', '_insert_varyColors', _CT_LineChart_insert_varyColors),
+    ('add', '_add_varyColors', _CT_LineChart_add_varyColors),
+    ('add', 'get_or_add_varyColors', _CT_LineChart_get_or_add_varyColors),
+    ('add', '_remove_varyColors', _CT_LineChart_remove_varyColors),
+    ('set', 'ser_lst', property(_CT_LineChart_ser_lst, None, None)),
+    ('add', '_new_ser', _CT_LineChart_new_ser),
+    ('add', '_insert_ser', _CT_LineChart_insert_ser),
+    ('add', '_add_ser', _CT_LineChart_add_ser),
+    ('del', 'ser'),
+    ('set', 'dLbls', property(_CT_LineChart_dLbls, None, None)),
+    ('add', '_new_dLbls', _CT_LineChart_new_dLbls),
+    ('add', '_insert_dLbls', _CT_LineChart_insert_dLbls),
+    ('add', '_add_dLbls', _CT_LineChart_add_dLbls),
+    ('add', 'get_or_add_dLbls', _CT_LineChart_get_or_add_dLbls),
+    ('add', '_remove_dLbls', _CT_LineChart_remove_dLbls),
+)
+
+
+# pptx.oxml.chart.plot.CT_Overlap -------------------------------------------
+
+def _CT_Overlap_val_get(obj):
+    'ST_Overlap type-converted value of ``val`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        return 0
+    return ST_Overlap.from_xml(attr_str_value)
+
+def _CT_Overlap_val_set(obj, value):
+    if value == 0:
+        if 'val' in obj.attrib:
+            del obj.attrib['val']
+        return
+    str_value = ST_Overlap.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.plot.CT_Overlap'] = (
+    ('set', 'val', property(_CT_Overlap_val_get, _CT_Overlap_val_set, None)),
+)
+
+
+# pptx.oxml.chart.plot.CT_PieChart ------------------------------------------
+
+def _CT_PieChart_varyColors(obj):
+    '``<c:varyColors>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors')
+
+def _CT_PieChart_new_varyColors(obj):
+    'Return a "loose", newly created ``<c:varyColors>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors', nsmap=_nsmap_c)
+
+def _CT_PieChart_insert_varyColors(obj, child):
+    'Return the passed ``<c:varyColors>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}firstSliceAng', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_PieChart_add_varyColors(obj, **attrs):
+    'Add a new ``<c:varyColors>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_varyColors()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_varyColors(child)
+    return child
+
+def _CT_PieChart_get_or_add_varyColors(obj):
+    'Return the ``<c:varyColors>`` child element, newly added if not present.'
+    child = obj.varyColors
+    if child is None:
+        child = obj._add_varyColors()
+    return child
+
+def _CT_PieChart_remove_varyColors(obj):
+    'Remove all ``<c:varyColors>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors'):
+        obj.remove(child)
+
+def _CT_PieChart_ser_lst(obj):
+    'A list containing each of the ``<c:ser>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser')
+
+def _CT_PieChart_new_ser(obj):
+    'Return a "loose", newly created ``<c:ser>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser', nsmap=_nsmap_c)
+
+def _CT_PieChart_insert_ser(obj, child):
+    'Return the passed ``<c:ser>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}firstSliceAng', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_PieChart_add_ser(obj, **attrs):
+    'Add a new ``<c:ser>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_ser()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_ser(child)
+    return child
+
+def _CT_PieChart_dLbls(obj):
+    '``<c:dLbls>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls')
+
+def _CT_PieChart_new_dLbls(obj):
+    'Return a "loose", newly created ``<c:dLbls>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', nsmap=_nsmap_c)
+
+def _CT_PieChart_insert_dLbls(obj, child):
+    'Return the passed ``<c:dLbls>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}firstSliceAng', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_PieChart_add_dLbls(obj, **attrs):
+    'Add a new ``<c:dLbls>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_dLbls()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_dLbls(child)
+    return child
+
+def _CT_PieChart_get_or_add_dLbls(obj):
+    'Return the ``<c:dLbls>`` child element, newly added if not present.'
+    child = obj.dLbls
+    if child is None:
+        child = obj._add_dLbls()
+    return child
+
+def _CT_PieChart_remove_dLbls(obj):
+    'Remove all ``<c:dLbls>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.plot.CT_PieChart'] = (
+    ('set', 'varyColors', property(_CT_PieChart_varyColors, None, None)),
+    ('add', '_new_varyColors', _CT_PieChart_new_varyColors),
+    ('add', '_insert_varyColors', _CT_PieChart_insert_varyColors),
+    ('add', '_add_varyColors', _CT_PieChart_add_varyColors),
+    ('add', 'get_or_add_varyColors', _CT_PieChart_get_or_add_varyColors),
+    ('add', '_remove_varyColors', _CT_PieChart_remove_varyColors),
+    ('set', 'ser_lst', property(_CT_PieChart_ser_lst, None, None)),
+    ('add', '_new_ser', _CT_PieChart_new_ser),
+    ('add', '_insert_ser', _CT_PieChart_insert_ser),
+    ('add', '_add_ser', _CT_PieChart_add_ser),
+    ('del', 'ser'),
+    ('set', 'dLbls', property(_CT_PieChart_dLbls, None, None)),
+    ('add', '_new_dLbls', _CT_PieChart_new_dLbls),
+    ('add', '_insert_dLbls', _CT_PieChart_insert_dLbls),
+    ('add', '_add_dLbls', _CT_PieChart_add_dLbls),
+    ('add', 'get_or_add_dLbls', _CT_PieChart_get_or_add_dLbls),
+    ('add', '_remove_dLbls', _CT_PieChart_remove_dLbls),
+)
+
+
+# pptx.oxml.chart.plot.CT_RadarChart ----------------------------------------
+
+def _CT_RadarChart_varyColors(obj):
+    '``<c:varyColors>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors')
+
+def _CT_RadarChart_new_varyColors(obj):
+    'Return a "loose", newly created ``<c:varyColors>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors', nsmap=_nsmap_c)
+
+def _CT_RadarChart_insert_varyColors(obj, child):
+    'Return the passed ``<c:varyColors>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_RadarChart_add_varyColors(obj, **attrs):
+    'Add a new ``<c:varyColors>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_varyColors()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_varyColors(child)
+    return child
+
+def _CT_RadarChart_get_or_add_varyColors(obj):
+    'Return the ``<c:varyColors>`` child element, newly added if not present.'
+    child = obj.varyColors
+    if child is None:
+        child = obj._add_varyColors()
+    return child
+
+def _CT_RadarChart_remove_varyColors(obj):
+    'Remove all ``<c:varyColors>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors'):
+        obj.remove(child)
+
+def _CT_RadarChart_ser_lst(obj):
+    'A list containing each of the ``<c:ser>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser')
+
+def _CT_RadarChart_new_ser(obj):
+    'Return a "loose", newly created ``<c:ser>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser', nsmap=_nsmap_c)
+
+def _CT_RadarChart_insert_ser(obj, child):
+    'Return the passed ``<c:ser>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_RadarChart_add_ser(obj, **attrs):
+    'Add a new ``<c:ser>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_ser()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_ser(child)
+    return child
+
+def _CT_RadarChart_dLbls(obj):
+    '``<c:dLbls>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls')
+
+def _CT_RadarChart_new_dLbls(obj):
+    'Return a "loose", newly created ``<c:dLbls>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', nsmap=_nsmap_c)
+
+def _CT_RadarChart_insert_dLbls(obj, child):
+    'Return the passed ``<c:dLbls>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_RadarChart_add_dLbls(obj, **attrs):
+    'Add a new ``<c:dLbls>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_dLbls()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_dLbls(child)
+    return child
+
+def _CT_RadarChart_get_or_add_dLbls(obj):
+    'Return the ``<c:dLbls>`` child element, newly added if not present.'
+    child = obj.dLbls
+    if child is None:
+        child = obj._add_dLbls()
+    return child
+
+def _CT_RadarChart_remove_dLbls(obj):
+    'Remove all ``<c:dLbls>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.plot.CT_RadarChart'] = (
+    ('set', 'varyColors', property(_CT_RadarChart_varyColors, None, None)),
+    ('add', '_new_varyColors', _CT_RadarChart_new_varyColors),
+    ('add', '_insert_varyColors', _CT_RadarChart_insert_varyColors),
+    ('add', '_add_varyColors', _CT_RadarChart_add_varyColors),
+    ('add', 'get_or_add_varyColors', _CT_RadarChart_get_or_add_varyColors),
+    ('add', '_remove_varyColors', _CT_RadarChart_remove_varyColors),
+    ('set', 'ser_lst', property(_CT_RadarChart_ser_lst, None, None)),
+    ('add', '_new_ser', _CT_RadarChart_new_ser),
+    ('add', '_insert_ser', _CT_RadarChart_insert_ser),
+    ('add', '_add_ser', _CT_RadarChart_add_ser),
+    ('del', 'ser'),
+    ('set', 'dLbls', property(_CT_RadarChart_dLbls, None, None)),
+    ('add', '_new_dLbls', _CT_RadarChart_new_dLbls),
+    ('add', '_insert_dLbls', _CT_RadarChart_insert_dLbls),
+    ('add', '_add_dLbls', _CT_RadarChart_add_dLbls),
+    ('add', 'get_or_add_dLbls', _CT_RadarChart_get_or_add_dLbls),
+    ('add', '_remove_dLbls', _CT_RadarChart_remove_dLbls),
+)
+
+
+# pptx.oxml.chart.plot.CT_ScatterChart --------------------------------------
+
+def _CT_ScatterChart_varyColors(obj):
+    '``<c:varyColors>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors')
+
+def _CT_ScatterChart_new_varyColors(obj):
+    'Return a "loose", newly created ``<c:varyColors>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors', nsmap=_nsmap_c)
+
+def _CT_ScatterChart_insert_varyColors(obj, child):
+    'Return the passed ``<c:varyColors>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ScatterChart_add_varyColors(obj, **attrs):
+    'Add a new ``<c:varyColors>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_varyColors()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_varyColors(child)
+    return child
+
+def _CT_ScatterChart_get_or_add_varyColors(obj):
+    'Return the ``<c:varyColors>`` child element, newly added if not present.'
+    child = obj.varyColors
+    if child is None:
+        child = obj._add_varyColors()
+    return child
+
+def _CT_ScatterChart_remove_varyColors(obj):
+    'Remove all ``<c:varyColors>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}varyColors'):
+        obj.remove(child)
+
+def _CT_ScatterChart_ser_lst(obj):
+    'A list containing each of the ``<c:ser>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser')
+
+def _CT_ScatterChart_new_ser(obj):
+    'Return a "loose", newly created ``<c:ser>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}ser', nsmap=_nsmap_c)
+
+def _CT_ScatterChart_insert_ser(obj, child):
+    'Return the passed ``<c:ser>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}axId', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ScatterChart_add_ser(obj, **attrs):
+    'Add a new ``<c:ser>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_ser()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_ser(child)
+    return child
+
+
+members['pptx.oxml.chart.plot.CT_ScatterChart'] = (
+    ('set', 'varyColors', property(_CT_ScatterChart_varyColors, None, None)),
+    ('add', '_new_varyColors', _CT_ScatterChart_new_varyColors),
+    ('add', '_insert_varyColors', _CT_ScatterChart_insert_varyColors),
+    ('add', '_add_varyColors', _CT_ScatterChart_add_varyColors),
+    ('add', 'get_or_add_varyColors', _CT_ScatterChart_get_or_add_varyColors),
+    ('add', '_remove_varyColors', _CT_ScatterChart_remove_varyColors),
+    ('set', 'ser_lst', property(_CT_ScatterChart_ser_lst, None, None)),
+    ('add', '_new_ser', _CT_ScatterChart_new_ser),
+    ('add', '_insert_ser', _CT_ScatterChart_insert_ser),
+    ('add', '_add_ser', _CT_ScatterChart_add_ser),
+    ('del', 'ser'),
+)
+
+
+# pptx.oxml.chart.series.CT_AxDataSource ------------------------------------
+
+def _CT_AxDataSource_multiLvlStrRef(obj):
+    '``<c:multiLvlStrRef>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}multiLvlStrRef')
+
+def _CT_AxDataSource_new_multiLvlStrRef(obj):
+    'Return a "loose", newly created ``<c:multiLvlStrRef>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}multiLvlStrRef', nsmap=_nsmap_c)
+
+def _CT_AxDataSource_insert_multiLvlStrRef(obj, child):
+    'Return the passed ``<c:multiLvlStrRef>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_AxDataSource_add_multiLvlStrRef(obj, **attrs):
+    'Add a new ``<c:multiLvlStrRef>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_multiLvlStrRef()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_multiLvlStrRef(child)
+    return child
+
+def _CT_AxDataSource_get_or_add_multiLvlStrRef(obj):
+    'Return the ``<c:multiLvlStrRef>`` child element, newly added if not present.'
+    child = obj.multiLvlStrRef
+    if child is None:
+        child = obj._add_multiLvlStrRef()
+    return child
+
+def _CT_AxDataSource_remove_multiLvlStrRef(obj):
+    'Remove all ``<c:multiLvlStrRef>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}multiLvlStrRef'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.series.CT_AxDataSource'] = (
+    ('set', 'multiLvlStrRef', property(_CT_AxDataSource_multiLvlStrRef, None, None)),
+    ('add', '_new_multiLvlStrRef', _CT_AxDataSource_new_multiLvlStrRef),
+    ('add', '_insert_multiLvlStrRef', _CT_AxDataSource_insert_multiLvlStrRef),
+    ('add', '_add_multiLvlStrRef', _CT_AxDataSource_add_multiLvlStrRef),
+    ('add', 'get_or_add_multiLvlStrRef', _CT_AxDataSource_get_or_add_multiLvlStrRef),
+    ('add', '_remove_multiLvlStrRef', _CT_AxDataSource_remove_multiLvlStrRef),
+)
+
+
+# pptx.oxml.chart.series.CT_DPt ---------------------------------------------
+
+def _CT_DPt_idx(obj):
+    'Required ``<c:idx>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}idx')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<c:idx>`` child element not present'
+        )
+    return child
+
+def _CT_DPt_marker(obj):
+    '``<c:marker>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}marker')
+
+def _CT_DPt_new_marker(obj):
+    'Return a "loose", newly created ``<c:marker>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}marker', nsmap=_nsmap_c)
+
+def _CT_DPt_insert_marker(obj, child):
+    'Return the passed ``<c:marker>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}bubble3D', '{http://schemas.openxmlformats.org/drawingml/2006/chart}explosion', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}pictureOptions', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DPt_add_marker(obj, **attrs):
+    'Add a new ``<c:marker>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_marker()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_marker(child)
+    return child
+
+def _CT_DPt_get_or_add_marker(obj):
+    'Return the ``<c:marker>`` child element, newly added if not present.'
+    child = obj.marker
+    if child is None:
+        child = obj._add_marker()
+    return child
+
+def _CT_DPt_remove_marker(obj):
+    'Remove all ``<c:marker>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}marker'):
+        obj.remove(child)
+
+def _CT_DPt_spPr(obj):
+    '``<c:spPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr')
+
+def _CT_DPt_new_spPr(obj):
+    'Return a "loose", newly created ``<c:spPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', nsmap=_nsmap_c)
+
+def _CT_DPt_insert_spPr(obj, child):
+    'Return the passed ``<c:spPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}pictureOptions', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_DPt_add_spPr(obj, **attrs):
+    'Add a new ``<c:spPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_spPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_spPr(child)
+    return child
+
+def _CT_DPt_get_or_add_spPr(obj):
+    'Return the ``<c:spPr>`` child element, newly added if not present.'
+    child = obj.spPr
+    if child is None:
+        child = obj._add_spPr()
+    return child
+
+def _CT_DPt_remove_spPr(obj):
+    'Remove all ``<c:spPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.series.CT_DPt'] = (
+    ('set', 'idx', property(_CT_DPt_idx, None, None)),
+    ('set', 'marker', property(_CT_DPt_marker, None, None)),
+    ('add', '_new_marker', _CT_DPt_new_marker),
+    ('add', '_insert_marker', _CT_DPt_insert_marker),
+    ('add', '_add_marker', _CT_DPt_add_marker),
+    ('add', 'get_or_add_marker', _CT_DPt_get_or_add_marker),
+    ('add', '_remove_marker', _CT_DPt_remove_marker),
+    ('set', 'spPr', property(_CT_DPt_spPr, None, None)),
+    ('add', '_new_spPr', _CT_DPt_new_spPr),
+    ('add', '_insert_spPr', _CT_DPt_insert_spPr),
+    ('add', '_add_spPr', _CT_DPt_add_spPr),
+    ('add', 'get_or_add_spPr', _CT_DPt_get_or_add_spPr),
+    ('add', '_remove_spPr', _CT_DPt_remove_spPr),
+)
+
+
+# pptx.oxml.chart.series.CT_Lvl ---------------------------------------------
+
+def _CT_Lvl_pt_lst(obj):
+    'A list containing each of the ``<c:pt>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}pt')
+
+def _CT_Lvl_new_pt(obj):
+    'Return a "loose", newly created ``<c:pt>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}pt', nsmap=_nsmap_c)
+
+def _CT_Lvl_insert_pt(obj, child):
+    'Return the passed ``<c:pt>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Lvl_add_pt(obj, **attrs):
+    'Add a new ``<c:pt>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_pt()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_pt(child)
+    return child
+
+
+members['pptx.oxml.chart.series.CT_Lvl'] = (
+    ('set', 'pt_lst', property(_CT_Lvl_pt_lst, None, None)),
+    ('add', '_new_pt', _CT_Lvl_new_pt),
+    ('add', '_insert_pt', _CT_Lvl_insert_pt),
+    ('add', '_add_pt', _CT_Lvl_add_pt),
+    ('del', 'pt'),
+)
+
+
+# pptx.oxml.chart.series.CT_NumDataSource -----------------------------------
+
+def _CT_NumDataSource_numRef(obj):
+    'Required ``<c:numRef>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}numRef')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<c:numRef>`` child element not present'
+        )
+    return child
+
+
+members['pptx.oxml.chart.series.CT_NumDataSource'] = (
+    ('set', 'numRef', property(_CT_NumDataSource_numRef, None, None)),
+)
+
+
+# pptx.oxml.chart.series.CT_SeriesComposite ---------------------------------
+
+def _CT_SeriesComposite_idx(obj):
+    'Required ``<c:idx>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}idx')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<c:idx>`` child element not present'
+        )
+    return child
+
+def _CT_SeriesComposite_order(obj):
+    'Required ``<c:order>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}order')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<c:order>`` child element not present'
+        )
+    return child
+
+def _CT_SeriesComposite_tx(obj):
+    '``<c:tx>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}tx')
+
+def _CT_SeriesComposite_new_tx(obj):
+    'Return a "loose", newly created ``<c:tx>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}tx', nsmap=_nsmap_c)
+
+def _CT_SeriesComposite_insert_tx(obj, child):
+    'Return the passed ``<c:tx>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}invertIfNegative', '{http://schemas.openxmlformats.org/drawingml/2006/chart}pictureOptions', '{http://schemas.openxmlformats.org/drawingml/2006/chart}marker', '{http://schemas.openxmlformats.org/drawingml/2006/chart}explosion', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dPt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}trendline', '{http://schemas.openxmlformats.org/drawingml/2006/chart}errBars', '{http://schemas.openxmlformats.org/drawingml/2006/chart}cat', '{http://schemas.openxmlformats.org/drawingml/2006/chart}val', '{http://schemas.openxmlformats.org/drawingml/2006/chart}xVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}yVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}shape', '{http://schemas.openxmlformats.org/drawingml/2006/chart}smooth', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubble3D', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_SeriesComposite_add_tx(obj, **attrs):
+    'Add a new ``<c:tx>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_tx()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_tx(child)
+    return child
+
+def _CT_SeriesComposite_get_or_add_tx(obj):
+    'Return the ``<c:tx>`` child element, newly added if not present.'
+    child = obj.tx
+    if child is None:
+        child = obj._add_tx()
+    return child
+
+def _CT_SeriesComposite_remove_tx(obj):
+    'Remove all ``<c:tx>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}tx'):
+        obj.remove(child)
+
+def _CT_SeriesComposite_spPr(obj):
+    '``<c:spPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr')
+
+def _CT_SeriesComposite_new_spPr(obj):
+    'Return a "loose", newly created ``<c:spPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', nsmap=_nsmap_c)
+
+def _CT_SeriesComposite_insert_spPr(obj, child):
+    'Return the passed ``<c:spPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}invertIfNegative', '{http://schemas.openxmlformats.org/drawingml/2006/chart}pictureOptions', '{http://schemas.openxmlformats.org/drawingml/2006/chart}marker', '{http://schemas.openxmlformats.org/drawingml/2006/chart}explosion', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dPt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}trendline', '{http://schemas.openxmlformats.org/drawingml/2006/chart}errBars', '{http://schemas.openxmlformats.org/drawingml/2006/chart}cat', '{http://schemas.openxmlformats.org/drawingml/2006/chart}val', '{http://schemas.openxmlformats.org/drawingml/2006/chart}xVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}yVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}shape', '{http://schemas.openxmlformats.org/drawingml/2006/chart}smooth', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubble3D', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_SeriesComposite_add_spPr(obj, **attrs):
+    'Add a new ``<c:spPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_spPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_spPr(child)
+    return child
+
+def _CT_SeriesComposite_get_or_add_spPr(obj):
+    'Return the ``<c:spPr>`` child element, newly added if not present.'
+    child = obj.spPr
+    if child is None:
+        child = obj._add_spPr()
+    return child
+
+def _CT_SeriesComposite_remove_spPr(obj):
+    'Remove all ``<c:spPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr'):
+        obj.remove(child)
+
+def _CT_SeriesComposite_invertIfNegative(obj):
+    '``<c:invertIfNegative>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}invertIfNegative')
+
+def _CT_SeriesComposite_new_invertIfNegative(obj):
+    'Return a "loose", newly created ``<c:invertIfNegative>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}invertIfNegative', nsmap=_nsmap_c)
+
+def _CT_SeriesComposite_insert_invertIfNegative(obj, child):
+    'Return the passed ``<c:invertIfNegative>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}pictureOptions', '{http://schemas.openxmlformats.org/drawingml/2006/chart}marker', '{http://schemas.openxmlformats.org/drawingml/2006/chart}explosion', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dPt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}trendline', '{http://schemas.openxmlformats.org/drawingml/2006/chart}errBars', '{http://schemas.openxmlformats.org/drawingml/2006/chart}cat', '{http://schemas.openxmlformats.org/drawingml/2006/chart}val', '{http://schemas.openxmlformats.org/drawingml/2006/chart}xVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}yVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}shape', '{http://schemas.openxmlformats.org/drawingml/2006/chart}smooth', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubble3D', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_SeriesComposite_add_invertIfNegative(obj, **attrs):
+    'Add a new ``<c:invertIfNegative>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_invertIfNegative()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_invertIfNegative(child)
+    return child
+
+def _CT_SeriesComposite_get_or_add_invertIfNegative(obj):
+    'Return the ``<c:invertIfNegative>`` child element, newly added if not present.'
+    child = obj.invertIfNegative
+    if child is None:
+        child = obj._add_invertIfNegative()
+    return child
+
+def _CT_SeriesComposite_remove_invertIfNegative(obj):
+    'Remove all ``<c:invertIfNegative>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}invertIfNegative'):
+        obj.remove(child)
+
+def _CT_SeriesComposite_marker(obj):
+    '``<c:marker>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}marker')
+
+def _CT_SeriesComposite_new_marker(obj):
+    'Return a "loose", newly created ``<c:marker>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}marker', nsmap=_nsmap_c)
+
+def _CT_SeriesComposite_insert_marker(obj, child):
+    'Return the passed ``<c:marker>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}explosion', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dPt', '{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}trendline', '{http://schemas.openxmlformats.org/drawingml/2006/chart}errBars', '{http://schemas.openxmlformats.org/drawingml/2006/chart}cat', '{http://schemas.openxmlformats.org/drawingml/2006/chart}val', '{http://schemas.openxmlformats.org/drawingml/2006/chart}xVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}yVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}shape', '{http://schemas.openxmlformats.org/drawingml/2006/chart}smooth', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubble3D', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_SeriesComposite_add_marker(obj, **attrs):
+    'Add a new ``<c:marker>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_marker()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_marker(child)
+    return child
+
+def _CT_SeriesComposite_get_or_add_marker(obj):
+    'Return the ``<c:marker>`` child element, newly added if not present.'
+    child = obj.marker
+    if child is None:
+        child = obj._add_marker()
+    return child
+
+def _CT_SeriesComposite_remove_marker(obj):
+    'Remove all ``<c:marker>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}marker'):
+        obj.remove(child)
+
+def _CT_SeriesComposite_dPt_lst(obj):
+    'A list containing each of the ``<c:dPt>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}dPt')
+
+def _CT_SeriesComposite_new_dPt(obj):
+    'Return a "loose", newly created ``<c:dPt>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}dPt', nsmap=_nsmap_c)
+
+def _CT_SeriesComposite_insert_dPt(obj, child):
+    'Return the passed ``<c:dPt>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', '{http://schemas.openxmlformats.org/drawingml/2006/chart}trendline', '{http://schemas.openxmlformats.org/drawingml/2006/chart}errBars', '{http://schemas.openxmlformats.org/drawingml/2006/chart}cat', '{http://schemas.openxmlformats.org/drawingml/2006/chart}val', '{http://schemas.openxmlformats.org/drawingml/2006/chart}xVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}yVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}shape', '{http://schemas.openxmlformats.org/drawingml/2006/chart}smooth', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubble3D', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_SeriesComposite_add_dPt(obj, **attrs):
+    'Add a new ``<c:dPt>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_dPt()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_dPt(child)
+    return child
+
+def _CT_SeriesComposite_dLbls(obj):
+    '``<c:dLbls>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls')
+
+def _CT_SeriesComposite_new_dLbls(obj):
+    'Return a "loose", newly created ``<c:dLbls>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls', nsmap=_nsmap_c)
+
+def _CT_SeriesComposite_insert_dLbls(obj, child):
+    'Return the passed ``<c:dLbls>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}trendline', '{http://schemas.openxmlformats.org/drawingml/2006/chart}errBars', '{http://schemas.openxmlformats.org/drawingml/2006/chart}cat', '{http://schemas.openxmlformats.org/drawingml/2006/chart}val', '{http://schemas.openxmlformats.org/drawingml/2006/chart}xVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}yVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}shape', '{http://schemas.openxmlformats.org/drawingml/2006/chart}smooth', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubble3D', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_SeriesComposite_add_dLbls(obj, **attrs):
+    'Add a new ``<c:dLbls>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_dLbls()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_dLbls(child)
+    return child
+
+def _CT_SeriesComposite_get_or_add_dLbls(obj):
+    'Return the ``<c:dLbls>`` child element, newly added if not present.'
+    child = obj.dLbls
+    if child is None:
+        child = obj._add_dLbls()
+    return child
+
+def _CT_SeriesComposite_remove_dLbls(obj):
+    'Remove all ``<c:dLbls>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}dLbls'):
+        obj.remove(child)
+
+def _CT_SeriesComposite_cat(obj):
+    '``<c:cat>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}cat')
+
+def _CT_SeriesComposite_new_cat(obj):
+    'Return a "loose", newly created ``<c:cat>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}cat', nsmap=_nsmap_c)
+
+def _CT_SeriesComposite_insert_cat(obj, child):
+    'Return the passed ``<c:cat>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}val', '{http://schemas.openxmlformats.org/drawingml/2006/chart}xVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}yVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}shape', '{http://schemas.openxmlformats.org/drawingml/2006/chart}smooth', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubble3D', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_SeriesComposite_add_cat(obj, **attrs):
+    'Add a new ``<c:cat>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_cat()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_cat(child)
+    return child
+
+def _CT_SeriesComposite_get_or_add_cat(obj):
+    'Return the ``<c:cat>`` child element, newly added if not present.'
+    child = obj.cat
+    if child is None:
+        child = obj._add_cat()
+    return child
+
+def _CT_SeriesComposite_remove_cat(obj):
+    'Remove all ``<c:cat>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}cat'):
+        obj.remove(child)
+
+def _CT_SeriesComposite_val(obj):
+    '``<c:val>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}val')
+
+def _CT_SeriesComposite_new_val(obj):
+    'Return a "loose", newly created ``<c:val>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}val', nsmap=_nsmap_c)
+
+def _CT_SeriesComposite_insert_val(obj, child):
+    'Return the passed ``<c:val>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}xVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}yVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}shape', '{http://schemas.openxmlformats.org/drawingml/2006/chart}smooth', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubble3D', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_SeriesComposite_add_val(obj, **attrs):
+    'Add a new ``<c:val>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_val()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_val(child)
+    return child
+
+def _CT_SeriesComposite_get_or_add_val(obj):
+    'Return the ``<c:val>`` child element, newly added if not present.'
+    child = obj.val
+    if child is None:
+        child = obj._add_val()
+    return child
+
+def _CT_SeriesComposite_remove_val(obj):
+    'Remove all ``<c:val>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}val'):
+        obj.remove(child)
+
+def _CT_SeriesComposite_xVal(obj):
+    '``<c:xVal>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}xVal')
+
+def _CT_SeriesComposite_new_xVal(obj):
+    'Return a "loose", newly created ``<c:xVal>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}xVal', nsmap=_nsmap_c)
+
+def _CT_SeriesComposite_insert_xVal(obj, child):
+    'Return the passed ``<c:xVal>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}yVal', '{http://schemas.openxmlformats.org/drawingml/2006/chart}shape', '{http://schemas.openxmlformats.org/drawingml/2006/chart}smooth', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubble3D', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_SeriesComposite_add_xVal(obj, **attrs):
+    'Add a new ``<c:xVal>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_xVal()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_xVal(child)
+    return child
+
+def _CT_SeriesComposite_get_or_add_xVal(obj):
+    'Return the ``<c:xVal>`` child element, newly added if not present.'
+    child = obj.xVal
+    if child is None:
+        child = obj._add_xVal()
+    return child
+
+def _CT_SeriesComposite_remove_xVal(obj):
+    'Remove all ``<c:xVal>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}xVal'):
+        obj.remove(child)
+
+def _CT_SeriesComposite_yVal(obj):
+    '``<c:yVal>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}yVal')
+
+def _CT_SeriesComposite_new_yVal(obj):
+    'Return a "loose", newly created ``<c:yVal>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}yVal', nsmap=_nsmap_c)
+
+def _CT_SeriesComposite_insert_yVal(obj, child):
+    'Return the passed ``<c:yVal>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}shape', '{http://schemas.openxmlformats.org/drawingml/2006/chart}smooth', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubble3D', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_SeriesComposite_add_yVal(obj, **attrs):
+    'Add a new ``<c:yVal>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_yVal()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_yVal(child)
+    return child
+
+def _CT_SeriesComposite_get_or_add_yVal(obj):
+    'Return the ``<c:yVal>`` child element, newly added if not present.'
+    child = obj.yVal
+    if child is None:
+        child = obj._add_yVal()
+    return child
+
+def _CT_SeriesComposite_remove_yVal(obj):
+    'Remove all ``<c:yVal>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}yVal'):
+        obj.remove(child)
+
+def _CT_SeriesComposite_smooth(obj):
+    '``<c:smooth>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}smooth')
+
+def _CT_SeriesComposite_new_smooth(obj):
+    'Return a "loose", newly created ``<c:smooth>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}smooth', nsmap=_nsmap_c)
+
+def _CT_SeriesComposite_insert_smooth(obj, child):
+    'Return the passed ``<c:smooth>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleSize', '{http://schemas.openxmlformats.org/drawingml/2006/chart}bubble3D', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_SeriesComposite_add_smooth(obj, **attrs):
+    'Add a new ``<c:smooth>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_smooth()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_smooth(child)
+    return child
+
+def _CT_SeriesComposite_get_or_add_smooth(obj):
+    'Return the ``<c:smooth>`` child element, newly added if not present.'
+    child = obj.smooth
+    if child is None:
+        child = obj._add_smooth()
+    return child
+
+def _CT_SeriesComposite_remove_smooth(obj):
+    'Remove all ``<c:smooth>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}smooth'):
+        obj.remove(child)
+
+def _CT_SeriesComposite_bubbleSize(obj):
+    '``<c:bubbleSize>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleSize')
+
+def _CT_SeriesComposite_new_bubbleSize(obj):
+    'Return a "loose", newly created ``<c:bubbleSize>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleSize', nsmap=_nsmap_c)
+
+def _CT_SeriesComposite_insert_bubbleSize(obj, child):
+    'Return the passed ``<c:bubbleSize>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}bubble3D', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_SeriesComposite_add_bubbleSize(obj, **attrs):
+    'Add a new ``<c:bubbleSize>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_bubbleSize()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_bubbleSize(child)
+    return child
+
+def _CT_SeriesComposite_get_or_add_bubbleSize(obj):
+    'Return the ``<c:bubbleSize>`` child element, newly added if not present.'
+    child = obj.bubbleSize
+    if child is None:
+        child = obj._add_bubbleSize()
+    return child
+
+def _CT_SeriesComposite_remove_bubbleSize(obj):
+    'Remove all ``<c:bubbleSize>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}bubbleSize'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.series.CT_SeriesComposite'] = (
+    ('set', 'idx', property(_CT_SeriesComposite_idx, None, None)),
+    ('set', 'order', property(_CT_SeriesComposite_order, None, None)),
+    ('set', 'tx', property(_CT_SeriesComposite_tx, None, None)),
+    ('add', '_new_tx', _CT_SeriesComposite_new_tx),
+    ('add', '_insert_tx', _CT_SeriesComposite_insert_tx),
+    ('add', '_add_tx', _CT_SeriesComposite_add_tx),
+    ('add', 'get_or_add_tx', _CT_SeriesComposite_get_or_add_tx),
+    ('add', '_remove_tx', _CT_SeriesComposite_remove_tx),
+    ('set', 'spPr', property(_CT_SeriesComposite_spPr, None, None)),
+    ('add', '_new_spPr', _CT_SeriesComposite_new_spPr),
+    ('add', '_insert_spPr', _CT_SeriesComposite_insert_spPr),
+    ('add', '_add_spPr', _CT_SeriesComposite_add_spPr),
+    ('add', 'get_or_add_spPr', _CT_SeriesComposite_get_or_add_spPr),
+    ('add', '_remove_spPr', _CT_SeriesComposite_remove_spPr),
+    ('set', 'invertIfNegative', property(_CT_SeriesComposite_invertIfNegative, None, None)),
+    ('add', '_new_invertIfNegative', _CT_SeriesComposite_new_invertIfNegative),
+    ('add', '_insert_invertIfNegative', _CT_SeriesComposite_insert_invertIfNegative),
+    ('add', '_add_invertIfNegative', _CT_SeriesComposite_add_invertIfNegative),
+    ('add', 'get_or_add_invertIfNegative', _CT_SeriesComposite_get_or_add_invertIfNegative),
+    ('add', '_remove_invertIfNegative', _CT_SeriesComposite_remove_invertIfNegative),
+    ('set', 'marker', property(_CT_SeriesComposite_marker, None, None)),
+    ('add', '_new_marker', _CT_SeriesComposite_new_marker),
+    ('add', '_insert_marker', _CT_SeriesComposite_insert_marker),
+    ('add', '_add_marker', _CT_SeriesComposite_add_marker),
+    ('add', 'get_or_add_marker', _CT_SeriesComposite_get_or_add_marker),
+    ('add', '_remove_marker', _CT_SeriesComposite_remove_marker),
+    ('set', 'dPt_lst', property(_CT_SeriesComposite_dPt_lst, None, None)),
+    ('add', '_new_dPt', _CT_SeriesComposite_new_dPt),
+    ('add', '_insert_dPt', _CT_SeriesComposite_insert_dPt),
+    ('add', '_add_dPt', _CT_SeriesComposite_add_dPt),
+    ('del', 'dPt'),
+    ('set', 'dLbls', property(_CT_SeriesComposite_dLbls, None, None)),
+    ('add', '_new_dLbls', _CT_SeriesComposite_new_dLbls),
+    ('add', '_insert_dLbls', _CT_SeriesComposite_insert_dLbls),
+    ('add', '_add_dLbls', _CT_SeriesComposite_add_dLbls),
+    ('add', 'get_or_add_dLbls', _CT_SeriesComposite_get_or_add_dLbls),
+    ('add', '_remove_dLbls', _CT_SeriesComposite_remove_dLbls),
+    ('set', 'cat', property(_CT_SeriesComposite_cat, None, None)),
+    ('add', '_new_cat', _CT_SeriesComposite_new_cat),
+    ('add', '_insert_cat', _CT_SeriesComposite_insert_cat),
+    ('add', '_add_cat', _CT_SeriesComposite_add_cat),
+    ('add', 'get_or_add_cat', _CT_SeriesComposite_get_or_add_cat),
+    ('add', '_remove_cat', _CT_SeriesComposite_remove_cat),
+    ('set', 'val', property(_CT_SeriesComposite_val, None, None)),
+    ('add', '_new_val', _CT_SeriesComposite_new_val),
+    ('add', '_insert_val', _CT_SeriesComposite_insert_val),
+    ('add', '_add_val', _CT_SeriesComposite_add_val),
+    ('add', 'get_or_add_val', _CT_SeriesComposite_get_or_add_val),
+    ('add', '_remove_val', _CT_SeriesComposite_remove_val),
+    ('set', 'xVal', property(_CT_SeriesComposite_xVal, None, None)),
+    ('add', '_new_xVal', _CT_SeriesComposite_new_xVal),
+    ('add', '_insert_xVal', _CT_SeriesComposite_insert_xVal),
+    ('add', '_add_xVal', _CT_SeriesComposite_add_xVal),
+    ('add', 'get_or_add_xVal', _CT_SeriesComposite_get_or_add_xVal),
+    ('add', '_remove_xVal', _CT_SeriesComposite_remove_xVal),
+    ('set', 'yVal', property(_CT_SeriesComposite_yVal, None, None)),
+    ('add', '_new_yVal', _CT_SeriesComposite_new_yVal),
+    ('add', '_insert_yVal', _CT_SeriesComposite_insert_yVal),
+    ('add', '_add_yVal', _CT_SeriesComposite_add_yVal),
+    ('add', 'get_or_add_yVal', _CT_SeriesComposite_get_or_add_yVal),
+    ('add', '_remove_yVal', _CT_SeriesComposite_remove_yVal),
+    ('set', 'smooth', property(_CT_SeriesComposite_smooth, None, None)),
+    ('add', '_new_smooth', _CT_SeriesComposite_new_smooth),
+    ('add', '_insert_smooth', _CT_SeriesComposite_insert_smooth),
+    ('add', '_add_smooth', _CT_SeriesComposite_add_smooth),
+    ('add', 'get_or_add_smooth', _CT_SeriesComposite_get_or_add_smooth),
+    ('add', '_remove_smooth', _CT_SeriesComposite_remove_smooth),
+    ('set', 'bubbleSize', property(_CT_SeriesComposite_bubbleSize, None, None)),
+    ('add', '_new_bubbleSize', _CT_SeriesComposite_new_bubbleSize),
+    ('add', '_insert_bubbleSize', _CT_SeriesComposite_insert_bubbleSize),
+    ('add', '_add_bubbleSize', _CT_SeriesComposite_add_bubbleSize),
+    ('add', 'get_or_add_bubbleSize', _CT_SeriesComposite_get_or_add_bubbleSize),
+    ('add', '_remove_bubbleSize', _CT_SeriesComposite_remove_bubbleSize),
+)
+
+
+# pptx.oxml.chart.series.CT_StrVal_NumVal_Composite -------------------------
+
+def _CT_StrVal_NumVal_Composite_v(obj):
+    'Required ``<c:v>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}v')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<c:v>`` child element not present'
+        )
+    return child
+
+def _CT_StrVal_NumVal_Composite_idx_get(obj):
+    'XsdUnsignedInt type-converted value of ``idx`` attribute.'
+    attr_str_value = obj.get('idx')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'idx' attribute not present on element %s" % obj.tag
+        )
+    return XsdUnsignedInt.from_xml(attr_str_value)
+
+def _CT_StrVal_NumVal_Composite_idx_set(obj, value):
+    str_value = XsdUnsignedInt.to_xml(value)
+    obj.set('idx', str_value)
+
+
+members['pptx.oxml.chart.series.CT_StrVal_NumVal_Composite'] = (
+    ('set', 'v', property(_CT_StrVal_NumVal_Composite_v, None, None)),
+    ('set', 'idx', property(_CT_StrVal_NumVal_Composite_idx_get, _CT_StrVal_NumVal_Composite_idx_set, None)),
+)
+
+
+# pptx.oxml.chart.shared.CT_Boolean -----------------------------------------
+
+def _CT_Boolean_val_get(obj):
+    'XsdBoolean type-converted value of ``val`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        return True
+    return XsdBoolean.from_xml(attr_str_value)
+
+def _CT_Boolean_val_set(obj, value):
+    if value == True:
+        if 'val' in obj.attrib:
+            del obj.attrib['val']
+        return
+    str_value = XsdBoolean.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.shared.CT_Boolean'] = (
+    ('set', 'val', property(_CT_Boolean_val_get, _CT_Boolean_val_set, None)),
+)
+
+
+# pptx.oxml.chart.shared.CT_Boolean_Explicit --------------------------------
+
+def _CT_Boolean_Explicit_val_get(obj):
+    'XsdBoolean type-converted value of ``val`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        return True
+    return XsdBoolean.from_xml(attr_str_value)
+
+def _CT_Boolean_Explicit_val_set(obj, value):
+    if value == True:
+        if 'val' in obj.attrib:
+            del obj.attrib['val']
+        return
+    str_value = XsdBoolean.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.shared.CT_Boolean_Explicit'] = (
+    ('set', '_val', property(_CT_Boolean_Explicit_val_get, _CT_Boolean_Explicit_val_set, None)),
+)
+
+
+# pptx.oxml.chart.shared.CT_Double ------------------------------------------
+
+def _CT_Double_val_get(obj):
+    'XsdDouble type-converted value of ``val`` attribute.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'val' attribute not present on element %s" % obj.tag
+        )
+    return XsdDouble.from_xml(attr_str_value)
+
+def _CT_Double_val_set(obj, value):
+    str_value = XsdDouble.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.shared.CT_Double'] = (
+    ('set', 'val', property(_CT_Double_val_get, _CT_Double_val_set, None)),
+)
+
+
+# pptx.oxml.chart.shared.CT_Layout ------------------------------------------
+
+def _CT_Layout_manualLayout(obj):
+    '``<c:manualLayout>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}manualLayout')
+
+def _CT_Layout_new_manualLayout(obj):
+    'Return a "loose", newly created ``<c:manualLayout>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}manualLayout', nsmap=_nsmap_c)
+
+def _CT_Layout_insert_manualLayout(obj, child):
+    'Return the passed ``<c:manualLayout>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst',))
+    return child
+
+def _CT_Layout_add_manualLayout(obj, **attrs):
+    'Add a new ``<c:manualLayout>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_manualLayout()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_manualLayout(child)
+    return child
+
+def _CT_Layout_get_or_add_manualLayout(obj):
+    'Return the ``<c:manualLayout>`` child element, newly added if not present.'
+    child = obj.manualLayout
+    if child is None:
+        child = obj._add_manualLayout()
+    return child
+
+def _CT_Layout_remove_manualLayout(obj):
+    'Remove all ``<c:manualLayout>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}manualLayout'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.shared.CT_Layout'] = (
+    ('set', 'manualLayout', property(_CT_Layout_manualLayout, None, None)),
+    ('add', '_new_manualLayout', _CT_Layout_new_manualLayout),
+    ('add', '_insert_manualLayout', _CT_Layout_insert_manualLayout),
+    ('add', '_add_manualLayout', _CT_Layout_add_manualLayout),
+    ('add', 'get_or_add_manualLayout', _CT_Layout_get_or_add_manualLayout),
+    ('add', '_remove_manualLayout', _CT_Layout_remove_manualLayout),
+)
+
+
+# pptx.oxml.chart.shared.CT_LayoutMode --------------------------------------
+
+def _CT_LayoutMode_val_get(obj):
+    'ST_LayoutMode type-converted value of ``val`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        return 'factor'
+    return ST_LayoutMode.from_xml(attr_str_value)
+
+def _CT_LayoutMode_val_set(obj, value):
+    if value == 'factor':
+        if 'val' in obj.attrib:
+            del obj.attrib['val']
+        return
+    str_value = ST_LayoutMode.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.shared.CT_LayoutMode'] = (
+    ('set', 'val', property(_CT_LayoutMode_val_get, _CT_LayoutMode_val_set, None)),
+)
+
+
+# pptx.oxml.chart.shared.CT_ManualLayout ------------------------------------
+
+def _CT_ManualLayout_xMode(obj):
+    '``<c:xMode>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}xMode')
+
+def _CT_ManualLayout_new_xMode(obj):
+    'Return a "loose", newly created ``<c:xMode>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}xMode', nsmap=_nsmap_c)
+
+def _CT_ManualLayout_insert_xMode(obj, child):
+    'Return the passed ``<c:xMode>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}yMode', '{http://schemas.openxmlformats.org/drawingml/2006/chart}wMode', '{http://schemas.openxmlformats.org/drawingml/2006/chart}hMode', '{http://schemas.openxmlformats.org/drawingml/2006/chart}x', '{http://schemas.openxmlformats.org/drawingml/2006/chart}y', '{http://schemas.openxmlformats.org/drawingml/2006/chart}w', '{http://schemas.openxmlformats.org/drawingml/2006/chart}h', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ManualLayout_add_xMode(obj, **attrs):
+    'Add a new ``<c:xMode>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_xMode()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_xMode(child)
+    return child
+
+def _CT_ManualLayout_get_or_add_xMode(obj):
+    'Return the ``<c:xMode>`` child element, newly added if not present.'
+    child = obj.xMode
+    if child is None:
+        child = obj._add_xMode()
+    return child
+
+def _CT_ManualLayout_remove_xMode(obj):
+    'Remove all ``<c:xMode>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}xMode'):
+        obj.remove(child)
+
+def _CT_ManualLayout_x(obj):
+    '``<c:x>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}x')
+
+def _CT_ManualLayout_new_x(obj):
+    'Return a "loose", newly created ``<c:x>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}x', nsmap=_nsmap_c)
+
+def _CT_ManualLayout_insert_x(obj, child):
+    'Return the passed ``<c:x>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}y', '{http://schemas.openxmlformats.org/drawingml/2006/chart}w', '{http://schemas.openxmlformats.org/drawingml/2006/chart}h', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_ManualLayout_add_x(obj, **attrs):
+    'Add a new ``<c:x>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_x()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_x(child)
+    return child
+
+def _CT_ManualLayout_get_or_add_x(obj):
+    'Return the ``<c:x>`` child element, newly added if not present.'
+    child = obj.x
+    if child is None:
+        child = obj._add_x()
+    return child
+
+def _CT_ManualLayout_remove_x(obj):
+    'Remove all ``<c:x>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}x'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.shared.CT_ManualLayout'] = (
+    ('set', 'xMode', property(_CT_ManualLayout_xMode, None, None)),
+    ('add', '_new_xMode', _CT_ManualLayout_new_xMode),
+    ('add', '_insert_xMode', _CT_ManualLayout_insert_xMode),
+    ('add', '_add_xMode', _CT_ManualLayout_add_xMode),
+    ('add', 'get_or_add_xMode', _CT_ManualLayout_get_or_add_xMode),
+    ('add', '_remove_xMode', _CT_ManualLayout_remove_xMode),
+    ('set', 'x', property(_CT_ManualLayout_x, None, None)),
+    ('add', '_new_x', _CT_ManualLayout_new_x),
+    ('add', '_insert_x', _CT_ManualLayout_insert_x),
+    ('add', '_add_x', _CT_ManualLayout_add_x),
+    ('add', 'get_or_add_x', _CT_ManualLayout_get_or_add_x),
+    ('add', '_remove_x', _CT_ManualLayout_remove_x),
+)
+
+
+# pptx.oxml.chart.shared.CT_NumFmt ------------------------------------------
+
+def _CT_NumFmt_formatCode_get(obj):
+    'XsdString type-converted value of ``formatCode`` attribute.'
+    attr_str_value = obj.get('formatCode')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'formatCode' attribute not present on element %s" % obj.tag
+        )
+    return XsdString.from_xml(attr_str_value)
+
+def _CT_NumFmt_formatCode_set(obj, value):
+    str_value = XsdString.to_xml(value)
+    obj.set('formatCode', str_value)
+
+def _CT_NumFmt_sourceLinked_get(obj):
+    'XsdBoolean type-converted value of ``sourceLinked`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('sourceLinked')
+    if attr_str_value is None:
+        return None
+    return XsdBoolean.from_xml(attr_str_value)
+
+def _CT_NumFmt_sourceLinked_set(obj, value):
+    if value == None:
+        if 'sourceLinked' in obj.attrib:
+            del obj.attrib['sourceLinked']
+        return
+    str_value = XsdBoolean.to_xml(value)
+    obj.set('sourceLinked', str_value)
+
+
+members['pptx.oxml.chart.shared.CT_NumFmt'] = (
+    ('set', 'formatCode', property(_CT_NumFmt_formatCode_get, _CT_NumFmt_formatCode_set, None)),
+    ('set', 'sourceLinked', property(_CT_NumFmt_sourceLinked_get, _CT_NumFmt_sourceLinked_set, None)),
+)
+
+
+# pptx.oxml.chart.shared.CT_Title -------------------------------------------
+
+def _CT_Title_tx(obj):
+    '``<c:tx>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}tx')
+
+def _CT_Title_new_tx(obj):
+    'Return a "loose", newly created ``<c:tx>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}tx', nsmap=_nsmap_c)
+
+def _CT_Title_insert_tx(obj, child):
+    'Return the passed ``<c:tx>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}layout', '{http://schemas.openxmlformats.org/drawingml/2006/chart}overlay', '{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_Title_add_tx(obj, **attrs):
+    'Add a new ``<c:tx>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_tx()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_tx(child)
+    return child
+
+def _CT_Title_get_or_add_tx(obj):
+    'Return the ``<c:tx>`` child element, newly added if not present.'
+    child = obj.tx
+    if child is None:
+        child = obj._add_tx()
+    return child
+
+def _CT_Title_remove_tx(obj):
+    'Remove all ``<c:tx>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}tx'):
+        obj.remove(child)
+
+def _CT_Title_spPr(obj):
+    '``<c:spPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr')
+
+def _CT_Title_new_spPr(obj):
+    'Return a "loose", newly created ``<c:spPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr', nsmap=_nsmap_c)
+
+def _CT_Title_insert_spPr(obj, child):
+    'Return the passed ``<c:spPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/chart}txPr', '{http://schemas.openxmlformats.org/drawingml/2006/chart}extLst'))
+    return child
+
+def _CT_Title_add_spPr(obj, **attrs):
+    'Add a new ``<c:spPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_spPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_spPr(child)
+    return child
+
+def _CT_Title_get_or_add_spPr(obj):
+    'Return the ``<c:spPr>`` child element, newly added if not present.'
+    child = obj.spPr
+    if child is None:
+        child = obj._add_spPr()
+    return child
+
+def _CT_Title_remove_spPr(obj):
+    'Remove all ``<c:spPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}spPr'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.shared.CT_Title'] = (
+    ('set', 'tx', property(_CT_Title_tx, None, None)),
+    ('add', '_new_tx', _CT_Title_new_tx),
+    ('add', '_insert_tx', _CT_Title_insert_tx),
+    ('add', '_add_tx', _CT_Title_add_tx),
+    ('add', 'get_or_add_tx', _CT_Title_get_or_add_tx),
+    ('add', '_remove_tx', _CT_Title_remove_tx),
+    ('set', 'spPr', property(_CT_Title_spPr, None, None)),
+    ('add', '_new_spPr', _CT_Title_new_spPr),
+    ('add', '_insert_spPr', _CT_Title_insert_spPr),
+    ('add', '_add_spPr', _CT_Title_add_spPr),
+    ('add', 'get_or_add_spPr', _CT_Title_get_or_add_spPr),
+    ('add', '_remove_spPr', _CT_Title_remove_spPr),
+)
+
+
+# pptx.oxml.chart.shared.CT_Tx ----------------------------------------------
+
+def _CT_Tx_strRef(obj):
+    '``<c:strRef>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}strRef')
+
+def _CT_Tx_new_strRef(obj):
+    'Return a "loose", newly created ``<c:strRef>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}strRef', nsmap=_nsmap_c)
+
+def _CT_Tx_insert_strRef(obj, child):
+    'Return the passed ``<c:strRef>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Tx_add_strRef(obj, **attrs):
+    'Add a new ``<c:strRef>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_strRef()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_strRef(child)
+    return child
+
+def _CT_Tx_get_or_add_strRef(obj):
+    'Return the ``<c:strRef>`` child element, newly added if not present.'
+    child = obj.strRef
+    if child is None:
+        child = obj._add_strRef()
+    return child
+
+def _CT_Tx_remove_strRef(obj):
+    'Remove all ``<c:strRef>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}strRef'):
+        obj.remove(child)
+
+def _CT_Tx_rich(obj):
+    '``<c:rich>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}rich')
+
+def _CT_Tx_new_rich(obj):
+    'Return a "loose", newly created ``<c:rich>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}rich', nsmap=_nsmap_c)
+
+def _CT_Tx_insert_rich(obj, child):
+    'Return the passed ``<c:rich>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Tx_add_rich(obj, **attrs):
+    'Add a new ``<c:rich>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_rich()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_rich(child)
+    return child
+
+def _CT_Tx_get_or_add_rich(obj):
+    'Return the ``<c:rich>`` child element, newly added if not present.'
+    child = obj.rich
+    if child is None:
+        child = obj._add_rich()
+    return child
+
+def _CT_Tx_remove_rich(obj):
+    'Remove all ``<c:rich>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}rich'):
+        obj.remove(child)
+
+
+members['pptx.oxml.chart.shared.CT_Tx'] = (
+    ('set', 'strRef', property(_CT_Tx_strRef, None, None)),
+    ('add', '_new_strRef', _CT_Tx_new_strRef),
+    ('add', '_insert_strRef', _CT_Tx_insert_strRef),
+    ('add', '_add_strRef', _CT_Tx_add_strRef),
+    ('add', 'get_or_add_strRef', _CT_Tx_get_or_add_strRef),
+    ('add', '_remove_strRef', _CT_Tx_remove_strRef),
+    ('set', 'rich', property(_CT_Tx_rich, None, None)),
+    ('add', '_new_rich', _CT_Tx_new_rich),
+    ('add', '_insert_rich', _CT_Tx_insert_rich),
+    ('add', '_add_rich', _CT_Tx_add_rich),
+    ('add', 'get_or_add_rich', _CT_Tx_get_or_add_rich),
+    ('add', '_remove_rich', _CT_Tx_remove_rich),
+)
+
+
+# pptx.oxml.chart.shared.CT_UnsignedInt -------------------------------------
+
+def _CT_UnsignedInt_val_get(obj):
+    'XsdUnsignedInt type-converted value of ``val`` attribute.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'val' attribute not present on element %s" % obj.tag
+        )
+    return XsdUnsignedInt.from_xml(attr_str_value)
+
+def _CT_UnsignedInt_val_set(obj, value):
+    str_value = XsdUnsignedInt.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.chart.shared.CT_UnsignedInt'] = (
+    ('set', 'val', property(_CT_UnsignedInt_val_get, _CT_UnsignedInt_val_set, None)),
+)
+
+
+# pptx.oxml.coreprops.CT_CoreProperties -------------------------------------
+
+def _CT_CoreProperties_category(obj):
+    '``<cp:category>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}category')
+
+def _CT_CoreProperties_new_category(obj):
+    'Return a "loose", newly created ``<cp:category>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}category', nsmap=_nsmap_cp)
+
+def _CT_CoreProperties_insert_category(obj, child):
+    'Return the passed ``<cp:category>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_CoreProperties_add_category(obj, **attrs):
+    'Add a new ``<cp:category>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_category()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_category(child)
+    return child
+
+def _CT_CoreProperties_get_or_add_category(obj):
+    'Return the ``<cp:category>`` child element, newly added if not present.'
+    child = obj.category
+    if child is None:
+        child = obj._add_category()
+    return child
+
+def _CT_CoreProperties_remove_category(obj):
+    'Remove all ``<cp:category>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}category'):
+        obj.remove(child)
+
+def _CT_CoreProperties_contentStatus(obj):
+    '``<cp:contentStatus>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}contentStatus')
+
+def _CT_CoreProperties_new_contentStatus(obj):
+    'Return a "loose", newly created ``<cp:contentStatus>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}contentStatus', nsmap=_nsmap_cp)
+
+def _CT_CoreProperties_insert_contentStatus(obj, child):
+    'Return the passed ``<cp:contentStatus>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_CoreProperties_add_contentStatus(obj, **attrs):
+    'Add a new ``<cp:contentStatus>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_contentStatus()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_contentStatus(child)
+    return child
+
+def _CT_CoreProperties_get_or_add_contentStatus(obj):
+    'Return the ``<cp:contentStatus>`` child element, newly added if not present.'
+    child = obj.contentStatus
+    if child is None:
+        child = obj._add_contentStatus()
+    return child
+
+def _CT_CoreProperties_remove_contentStatus(obj):
+    'Remove all ``<cp:contentStatus>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}contentStatus'):
+        obj.remove(child)
+
+def _CT_CoreProperties_created(obj):
+    '``<dcterms:created>`` child element or |None| if not present.'
+    return obj.find('{http://purl.org/dc/terms/}created')
+
+def _CT_CoreProperties_new_created(obj):
+    'Return a "loose", newly created ``<dcterms:created>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://purl.org/dc/terms/}created', nsmap=_nsmap_dcterms)
+
+def _CT_CoreProperties_insert_created(obj, child):
+    'Return the passed ``<dcterms:created>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_CoreProperties_add_created(obj, **attrs):
+    'Add a new ``<dcterms:created>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_created()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_created(child)
+    return child
+
+def _CT_CoreProperties_get_or_add_created(obj):
+    'Return the ``<dcterms:created>`` child element, newly added if not present.'
+    child = obj.created
+    if child is None:
+        child = obj._add_created()
+    return child
+
+def _CT_CoreProperties_remove_created(obj):
+    'Remove all ``<dcterms:created>`` child elements.'
+    for child in obj.findall('{http://purl.org/dc/terms/}created'):
+        obj.remove(child)
+
+def _CT_CoreProperties_creator(obj):
+    '``<dc:creator>`` child element or |None| if not present.'
+    return obj.find('{http://purl.org/dc/elements/1.1/}creator')
+
+def _CT_CoreProperties_new_creator(obj):
+    'Return a "loose", newly created ``<dc:creator>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://purl.org/dc/elements/1.1/}creator', nsmap=_nsmap_dc)
+
+def _CT_CoreProperties_insert_creator(obj, child):
+    'Return the passed ``<dc:creator>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_CoreProperties_add_creator(obj, **attrs):
+    'Add a new ``<dc:creator>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_creator()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_creator(child)
+    return child
+
+def _CT_CoreProperties_get_or_add_creator(obj):
+    'Return the ``<dc:creator>`` child element, newly added if not present.'
+    child = obj.creator
+    if child is None:
+        child = obj._add_creator()
+    return child
+
+def _CT_CoreProperties_remove_creator(obj):
+    'Remove all ``<dc:creator>`` child elements.'
+    for child in obj.findall('{http://purl.org/dc/elements/1.1/}creator'):
+        obj.remove(child)
+
+def _CT_CoreProperties_description(obj):
+    '``<dc:description>`` child element or |None| if not present.'
+    return obj.find('{http://purl.org/dc/elements/1.1/}description')
+
+def _CT_CoreProperties_new_description(obj):
+    'Return a "loose", newly created ``<dc:description>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://purl.org/dc/elements/1.1/}description', nsmap=_nsmap_dc)
+
+def _CT_CoreProperties_insert_description(obj, child):
+    'Return the passed ``<dc:description>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_CoreProperties_add_description(obj, **attrs):
+    'Add a new ``<dc:description>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_description()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_description(child)
+    return child
+
+def _CT_CoreProperties_get_or_add_description(obj):
+    'Return the ``<dc:description>`` child element, newly added if not present.'
+    child = obj.description
+    if child is None:
+        child = obj._add_description()
+    return child
+
+def _CT_CoreProperties_remove_description(obj):
+    'Remove all ``<dc:description>`` child elements.'
+    for child in obj.findall('{http://purl.org/dc/elements/1.1/}description'):
+        obj.remove(child)
+
+def _CT_CoreProperties_identifier(obj):
+    '``<dc:identifier>`` child element or |None| if not present.'
+    return obj.find('{http://purl.org/dc/elements/1.1/}identifier')
+
+def _CT_CoreProperties_new_identifier(obj):
+    'Return a "loose", newly created ``<dc:identifier>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://purl.org/dc/elements/1.1/}identifier', nsmap=_nsmap_dc)
+
+def _CT_CoreProperties_insert_identifier(obj, child):
+    'Return the passed ``<dc:identifier>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_CoreProperties_add_identifier(obj, **attrs):
+    'Add a new ``<dc:identifier>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_identifier()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_identifier(child)
+    return child
+
+def _CT_CoreProperties_get_or_add_identifier(obj):
+    'Return the ``<dc:identifier>`` child element, newly added if not present.'
+    child = obj.identifier
+    if child is None:
+        child = obj._add_identifier()
+    return child
+
+def _CT_CoreProperties_remove_identifier(obj):
+    'Remove all ``<dc:identifier>`` child elements.'
+    for child in obj.findall('{http://purl.org/dc/elements/1.1/}identifier'):
+        obj.remove(child)
+
+def _CT_CoreProperties_keywords(obj):
+    '``<cp:keywords>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}keywords')
+
+def _CT_CoreProperties_new_keywords(obj):
+    'Return a "loose", newly created ``<cp:keywords>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}keywords', nsmap=_nsmap_cp)
+
+def _CT_CoreProperties_insert_keywords(obj, child):
+    'Return the passed ``<cp:keywords>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_CoreProperties_add_keywords(obj, **attrs):
+    'Add a new ``<cp:keywords>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_keywords()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_keywords(child)
+    return child
+
+def _CT_CoreProperties_get_or_add_keywords(obj):
+    'Return the ``<cp:keywords>`` child element, newly added if not present.'
+    child = obj.keywords
+    if child is None:
+        child = obj._add_keywords()
+    return child
+
+def _CT_CoreProperties_remove_keywords(obj):
+    'Remove all ``<cp:keywords>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}keywords'):
+        obj.remove(child)
+
+def _CT_CoreProperties_language(obj):
+    '``<dc:language>`` child element or |None| if not present.'
+    return obj.find('{http://purl.org/dc/elements/1.1/}language')
+
+def _CT_CoreProperties_new_language(obj):
+    'Return a "loose", newly created ``<dc:language>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://purl.org/dc/elements/1.1/}language', nsmap=_nsmap_dc)
+
+def _CT_CoreProperties_insert_language(obj, child):
+    'Return the passed ``<dc:language>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_CoreProperties_add_language(obj, **attrs):
+    'Add a new ``<dc:language>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_language()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_language(child)
+    return child
+
+def _CT_CoreProperties_get_or_add_language(obj):
+    'Return the ``<dc:language>`` child element, newly added if not present.'
+    child = obj.language
+    if child is None:
+        child = obj._add_language()
+    return child
+
+def _CT_CoreProperties_remove_language(obj):
+    'Remove all ``<dc:language>`` child elements.'
+    for child in obj.findall('{http://purl.org/dc/elements/1.1/}language'):
+        obj.remove(child)
+
+def _CT_CoreProperties_lastModifiedBy(obj):
+    '``<cp:lastModifiedBy>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}lastModifiedBy')
+
+def _CT_CoreProperties_new_lastModifiedBy(obj):
+    'Return a "loose", newly created ``<cp:lastModifiedBy>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}lastModifiedBy', nsmap=_nsmap_cp)
+
+def _CT_CoreProperties_insert_lastModifiedBy(obj, child):
+    'Return the passed ``<cp:lastModifiedBy>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_CoreProperties_add_lastModifiedBy(obj, **attrs):
+    'Add a new ``<cp:lastModifiedBy>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_lastModifiedBy()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_lastModifiedBy(child)
+    return child
+
+def _CT_CoreProperties_get_or_add_lastModifiedBy(obj):
+    'Return the ``<cp:lastModifiedBy>`` child element, newly added if not present.'
+    child = obj.lastModifiedBy
+    if child is None:
+        child = obj._add_lastModifiedBy()
+    return child
+
+def _CT_CoreProperties_remove_lastModifiedBy(obj):
+    'Remove all ``<cp:lastModifiedBy>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}lastModifiedBy'):
+        obj.remove(child)
+
+def _CT_CoreProperties_lastPrinted(obj):
+    '``<cp:lastPrinted>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}lastPrinted')
+
+def _CT_CoreProperties_new_lastPrinted(obj):
+    'Return a "loose", newly created ``<cp:lastPrinted>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}lastPrinted', nsmap=_nsmap_cp)
+
+def _CT_CoreProperties_insert_lastPrinted(obj, child):
+    'Return the passed ``<cp:lastPrinted>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_CoreProperties_add_lastPrinted(obj, **attrs):
+    'Add a new ``<cp:lastPrinted>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_lastPrinted()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_lastPrinted(child)
+    return child
+
+def _CT_CoreProperties_get_or_add_lastPrinted(obj):
+    'Return the ``<cp:lastPrinted>`` child element, newly added if not present.'
+    child = obj.lastPrinted
+    if child is None:
+        child = obj._add_lastPrinted()
+    return child
+
+def _CT_CoreProperties_remove_lastPrinted(obj):
+    'Remove all ``<cp:lastPrinted>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}lastPrinted'):
+        obj.remove(child)
+
+def _CT_CoreProperties_modified(obj):
+    '``<dcterms:modified>`` child element or |None| if not present.'
+    return obj.find('{http://purl.org/dc/terms/}modified')
+
+def _CT_CoreProperties_new_modified(obj):
+    'Return a "loose", newly created ``<dcterms:modified>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://purl.org/dc/terms/}modified', nsmap=_nsmap_dcterms)
+
+def _CT_CoreProperties_insert_modified(obj, child):
+    'Return the passed ``<dcterms:modified>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_CoreProperties_add_modified(obj, **attrs):
+    'Add a new ``<dcterms:modified>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_modified()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_modified(child)
+    return child
+
+def _CT_CoreProperties_get_or_add_modified(obj):
+    'Return the ``<dcterms:modified>`` child element, newly added if not present.'
+    child = obj.modified
+    if child is None:
+        child = obj._add_modified()
+    return child
+
+def _CT_CoreProperties_remove_modified(obj):
+    'Remove all ``<dcterms:modified>`` child elements.'
+    for child in obj.findall('{http://purl.org/dc/terms/}modified'):
+        obj.remove(child)
+
+def _CT_CoreProperties_revision(obj):
+    '``<cp:revision>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}revision')
+
+def _CT_CoreProperties_new_revision(obj):
+    'Return a "loose", newly created ``<cp:revision>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}revision', nsmap=_nsmap_cp)
+
+def _CT_CoreProperties_insert_revision(obj, child):
+    'Return the passed ``<cp:revision>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_CoreProperties_add_revision(obj, **attrs):
+    'Add a new ``<cp:revision>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_revision()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_revision(child)
+    return child
+
+def _CT_CoreProperties_get_or_add_revision(obj):
+    'Return the ``<cp:revision>`` child element, newly added if not present.'
+    child = obj.revision
+    if child is None:
+        child = obj._add_revision()
+    return child
+
+def _CT_CoreProperties_remove_revision(obj):
+    'Remove all ``<cp:revision>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}revision'):
+        obj.remove(child)
+
+def _CT_CoreProperties_subject(obj):
+    '``<dc:subject>`` child element or |None| if not present.'
+    return obj.find('{http://purl.org/dc/elements/1.1/}subject')
+
+def _CT_CoreProperties_new_subject(obj):
+    'Return a "loose", newly created ``<dc:subject>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://purl.org/dc/elements/1.1/}subject', nsmap=_nsmap_dc)
+
+def _CT_CoreProperties_insert_subject(obj, child):
+    'Return the passed ``<dc:subject>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_CoreProperties_add_subject(obj, **attrs):
+    'Add a new ``<dc:subject>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_subject()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_subject(child)
+    return child
+
+def _CT_CoreProperties_get_or_add_subject(obj):
+    'Return the ``<dc:subject>`` child element, newly added if not present.'
+    child = obj.subject
+    if child is None:
+        child = obj._add_subject()
+    return child
+
+def _CT_CoreProperties_remove_subject(obj):
+    'Remove all ``<dc:subject>`` child elements.'
+    for child in obj.findall('{http://purl.org/dc/elements/1.1/}subject'):
+        obj.remove(child)
+
+def _CT_CoreProperties_title(obj):
+    '``<dc:title>`` child element or |None| if not present.'
+    return obj.find('{http://purl.org/dc/elements/1.1/}title')
+
+def _CT_CoreProperties_new_title(obj):
+    'Return a "loose", newly created ``<dc:title>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://purl.org/dc/elements/1.1/}title', nsmap=_nsmap_dc)
+
+def _CT_CoreProperties_insert_title(obj, child):
+    'Return the passed ``<dc:title>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_CoreProperties_add_title(obj, **attrs):
+    'Add a new ``<dc:title>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_title()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_title(child)
+    return child
+
+def _CT_CoreProperties_get_or_add_title(obj):
+    'Return the ``<dc:title>`` child element, newly added if not present.'
+    child = obj.title
+    if child is None:
+        child = obj._add_title()
+    return child
+
+def _CT_CoreProperties_remove_title(obj):
+    'Remove all ``<dc:title>`` child elements.'
+    for child in obj.findall('{http://purl.org/dc/elements/1.1/}title'):
+        obj.remove(child)
+
+def _CT_CoreProperties_version(obj):
+    '``<cp:version>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}version')
+
+def _CT_CoreProperties_new_version(obj):
+    'Return a "loose", newly created ``<cp:version>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}version', nsmap=_nsmap_cp)
+
+def _CT_CoreProperties_insert_version(obj, child):
+    'Return the passed ``<cp:version>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_CoreProperties_add_version(obj, **attrs):
+    'Add a new ``<cp:version>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_version()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_version(child)
+    return child
+
+def _CT_CoreProperties_get_or_add_version(obj):
+    'Return the ``<cp:version>`` child element, newly added if not present.'
+    child = obj.version
+    if child is None:
+        child = obj._add_version()
+    return child
+
+def _CT_CoreProperties_remove_version(obj):
+    'Remove all ``<cp:version>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}version'):
+        obj.remove(child)
+
+
+members['pptx.oxml.coreprops.CT_CoreProperties'] = (
+    ('set', 'category', property(_CT_CoreProperties_category, None, None)),
+    ('add', '_new_category', _CT_CoreProperties_new_category),
+    ('add', '_insert_category', _CT_CoreProperties_insert_category),
+    ('add', '_add_category', _CT_CoreProperties_add_category),
+    ('add', 'get_or_add_category', _CT_CoreProperties_get_or_add_category),
+    ('add', '_remove_category', _CT_CoreProperties_remove_category),
+    ('set', 'contentStatus', property(_CT_CoreProperties_contentStatus, None, None)),
+    ('add', '_new_contentStatus', _CT_CoreProperties_new_contentStatus),
+    ('add', '_insert_contentStatus', _CT_CoreProperties_insert_contentStatus),
+    ('add', '_add_contentStatus', _CT_CoreProperties_add_contentStatus),
+    ('add', 'get_or_add_contentStatus', _CT_CoreProperties_get_or_add_contentStatus),
+    ('add', '_remove_contentStatus', _CT_CoreProperties_remove_contentStatus),
+    ('set', 'created', property(_CT_CoreProperties_created, None, None)),
+    ('add', '_new_created', _CT_CoreProperties_new_created),
+    ('add', '_insert_created', _CT_CoreProperties_insert_created),
+    ('add', '_add_created', _CT_CoreProperties_add_created),
+    ('add', 'get_or_add_created', _CT_CoreProperties_get_or_add_created),
+    ('add', '_remove_created', _CT_CoreProperties_remove_created),
+    ('set', 'creator', property(_CT_CoreProperties_creator, None, None)),
+    ('add', '_new_creator', _CT_CoreProperties_new_creator),
+    ('add', '_insert_creator', _CT_CoreProperties_insert_creator),
+    ('add', '_add_creator', _CT_CoreProperties_add_creator),
+    ('add', 'get_or_add_creator', _CT_CoreProperties_get_or_add_creator),
+    ('add', '_remove_creator', _CT_CoreProperties_remove_creator),
+    ('set', 'description', property(_CT_CoreProperties_description, None, None)),
+    ('add', '_new_description', _CT_CoreProperties_new_description),
+    ('add', '_insert_description', _CT_CoreProperties_insert_description),
+    ('add', '_add_description', _CT_CoreProperties_add_description),
+    ('add', 'get_or_add_description', _CT_CoreProperties_get_or_add_description),
+    ('add', '_remove_description', _CT_CoreProperties_remove_description),
+    ('set', 'identifier', property(_CT_CoreProperties_identifier, None, None)),
+    ('add', '_new_identifier', _CT_CoreProperties_new_identifier),
+    ('add', '_insert_identifier', _CT_CoreProperties_insert_identifier),
+    ('add', '_add_identifier', _CT_CoreProperties_add_identifier),
+    ('add', 'get_or_add_identifier', _CT_CoreProperties_get_or_add_identifier),
+    ('add', '_remove_identifier', _CT_CoreProperties_remove_identifier),
+    ('set', 'keywords', property(_CT_CoreProperties_keywords, None, None)),
+    ('add', '_new_keywords', _CT_CoreProperties_new_keywords),
+    ('add', '_insert_keywords', _CT_CoreProperties_insert_keywords),
+    ('add', '_add_keywords', _CT_CoreProperties_add_keywords),
+    ('add', 'get_or_add_keywords', _CT_CoreProperties_get_or_add_keywords),
+    ('add', '_remove_keywords', _CT_CoreProperties_remove_keywords),
+    ('set', 'language', property(_CT_CoreProperties_language, None, None)),
+    ('add', '_new_language', _CT_CoreProperties_new_language),
+    ('add', '_insert_language', _CT_CoreProperties_insert_language),
+    ('add', '_add_language', _CT_CoreProperties_add_language),
+    ('add', 'get_or_add_language', _CT_CoreProperties_get_or_add_language),
+    ('add', '_remove_language', _CT_CoreProperties_remove_language),
+    ('set', 'lastModifiedBy', property(_CT_CoreProperties_lastModifiedBy, None, None)),
+    ('add', '_new_lastModifiedBy', _CT_CoreProperties_new_lastModifiedBy),
+    ('add', '_insert_lastModifiedBy', _CT_CoreProperties_insert_lastModifiedBy),
+    ('add', '_add_lastModifiedBy', _CT_CoreProperties_add_lastModifiedBy),
+    ('add', 'get_or_add_lastModifiedBy', _CT_CoreProperties_get_or_add_lastModifiedBy),
+    ('add', '_remove_lastModifiedBy', _CT_CoreProperties_remove_lastModifiedBy),
+    ('set', 'lastPrinted', property(_CT_CoreProperties_lastPrinted, None, None)),
+    ('add', '_new_lastPrinted', _CT_CoreProperties_new_lastPrinted),
+    ('add', '_insert_lastPrinted', _CT_CoreProperties_insert_lastPrinted),
+    ('add', '_add_lastPrinted', _CT_CoreProperties_add_lastPrinted),
+    ('add', 'get_or_add_lastPrinted', _CT_CoreProperties_get_or_add_lastPrinted),
+    ('add', '_remove_lastPrinted', _CT_CoreProperties_remove_lastPrinted),
+    ('set', 'modified', property(_CT_CoreProperties_modified, None, None)),
+    ('add', '_new_modified', _CT_CoreProperties_new_modified),
+    ('add', '_insert_modified', _CT_CoreProperties_insert_modified),
+    ('add', '_add_modified', _CT_CoreProperties_add_modified),
+    ('add', 'get_or_add_modified', _CT_CoreProperties_get_or_add_modified),
+    ('add', '_remove_modified', _CT_CoreProperties_remove_modified),
+    ('set', 'revision', property(_CT_CoreProperties_revision, None, None)),
+    ('add', '_new_revision', _CT_CoreProperties_new_revision),
+    ('add', '_insert_revision', _CT_CoreProperties_insert_revision),
+    ('add', '_add_revision', _CT_CoreProperties_add_revision),
+    ('add', 'get_or_add_revision', _CT_CoreProperties_get_or_add_revision),
+    ('add', '_remove_revision', _CT_CoreProperties_remove_revision),
+    ('set', 'subject', property(_CT_CoreProperties_subject, None, None)),
+    ('add', '_new_subject', _CT_CoreProperties_new_subject),
+    ('add', '_insert_subject', _CT_CoreProperties_insert_subject),
+    ('add', '_add_subject', _CT_CoreProperties_add_subject),
+    ('add', 'get_or_add_subject', _CT_CoreProperties_get_or_add_subject),
+    ('add', '_remove_subject', _CT_CoreProperties_remove_subject),
+    ('set', 'title', property(_CT_CoreProperties_title, None, None)),
+    ('add', '_new_title', _CT_CoreProperties_new_title),
+    ('add', '_insert_title', _CT_CoreProperties_insert_title),
+    ('add', '_add_title', _CT_CoreProperties_add_title),
+    ('add', 'get_or_add_title', _CT_CoreProperties_get_or_add_title),
+    ('add', '_remove_title', _CT_CoreProperties_remove_title),
+    ('set', 'version', property(_CT_CoreProperties_version, None, None)),
+    ('add', '_new_version', _CT_CoreProperties_new_version),
+    ('add', '_insert_version', _CT_CoreProperties_insert_version),
+    ('add', '_add_version', _CT_CoreProperties_add_version),
+    ('add', 'get_or_add_version', _CT_CoreProperties_get_or_add_version),
+    ('add', '_remove_version', _CT_CoreProperties_remove_version),
+)
+
+
+# pptx.oxml.dml.color.CT_Color ----------------------------------------------
+
+def _CT_Color_eg_colorChoice(obj):
+    'Return the child element belonging to this element group, or |None| if no member child is present.'
+    for clark_name in ('{http://schemas.openxmlformats.org/drawingml/2006/main}scrgbClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}srgbClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}hslClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}sysClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}schemeClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}prstClr'):
+        child = obj.find(clark_name)
+        if child is not None:
+            return child
+    return None
+
+def _CT_Color_scrgbClr(obj):
+    '``<a:scrgbClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}scrgbClr')
+
+def _CT_Color_new_scrgbClr(obj):
+    'Return a "loose", newly created ``<a:scrgbClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}scrgbClr', nsmap=_nsmap_a)
+
+def _CT_Color_insert_scrgbClr(obj, child):
+    'Return the passed ``<a:scrgbClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Color_add_scrgbClr(obj, **attrs):
+    'Add a new ``<a:scrgbClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_scrgbClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_scrgbClr(child)
+    return child
+
+def _CT_Color_get_or_change_to_scrgbClr(obj):
+    'Return the ``<a:scrgbClr>`` child, replacing any other group element if found.'
+    child = obj.scrgbClr
+    if child is not None:
+        return child
+    obj._remove_eg_colorChoice()
+    child = obj._add_scrgbClr()
+    return child
+
+def _CT_Color_srgbClr(obj):
+    '``<a:srgbClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}srgbClr')
+
+def _CT_Color_new_srgbClr(obj):
+    'Return a "loose", newly created ``<a:srgbClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}srgbClr', nsmap=_nsmap_a)
+
+def _CT_Color_insert_srgbClr(obj, child):
+    'Return the passed ``<a:srgbClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Color_add_srgbClr(obj, **attrs):
+    'Add a new ``<a:srgbClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_srgbClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_srgbClr(child)
+    return child
+
+def _CT_Color_get_or_change_to_srgbClr(obj):
+    'Return the ``<a:srgbClr>`` child, replacing any other group element if found.'
+    child = obj.srgbClr
+    if child is not None:
+        return child
+    obj._remove_eg_colorChoice()
+    child = obj._add_srgbClr()
+    return child
+
+def _CT_Color_hslClr(obj):
+    '``<a:hslClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}hslClr')
+
+def _CT_Color_new_hslClr(obj):
+    'Return a "loose", newly created ``<a:hslClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}hslClr', nsmap=_nsmap_a)
+
+def _CT_Color_insert_hslClr(obj, child):
+    'Return the passed ``<a:hslClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Color_add_hslClr(obj, **attrs):
+    'Add a new ``<a:hslClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_hslClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_hslClr(child)
+    return child
+
+def _CT_Color_get_or_change_to_hslClr(obj):
+    'Return the ``<a:hslClr>`` child, replacing any other group element if found.'
+    child = obj.hslClr
+    if child is not None:
+        return child
+    obj._remove_eg_colorChoice()
+    child = obj._add_hslClr()
+    return child
+
+def _CT_Color_sysClr(obj):
+    '``<a:sysClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}sysClr')
+
+def _CT_Color_new_sysClr(obj):
+    'Return a "loose", newly created ``<a:sysClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}sysClr', nsmap=_nsmap_a)
+
+def _CT_Color_insert_sysClr(obj, child):
+    'Return the passed ``<a:sysClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Color_add_sysClr(obj, **attrs):
+    'Add a new ``<a:sysClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_sysClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_sysClr(child)
+    return child
+
+def _CT_Color_get_or_change_to_sysClr(obj):
+    'Return the ``<a:sysClr>`` child, replacing any other group element if found.'
+    child = obj.sysClr
+    if child is not None:
+        return child
+    obj._remove_eg_colorChoice()
+    child = obj._add_sysClr()
+    return child
+
+def _CT_Color_schemeClr(obj):
+    '``<a:schemeClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}schemeClr')
+
+def _CT_Color_new_schemeClr(obj):
+    'Return a "loose", newly created ``<a:schemeClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}schemeClr', nsmap=_nsmap_a)
+
+def _CT_Color_insert_schemeClr(obj, child):
+    'Return the passed ``<a:schemeClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Color_add_schemeClr(obj, **attrs):
+    'Add a new ``<a:schemeClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_schemeClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_schemeClr(child)
+    return child
+
+def _CT_Color_get_or_change_to_schemeClr(obj):
+    'Return the ``<a:schemeClr>`` child, replacing any other group element if found.'
+    child = obj.schemeClr
+    if child is not None:
+        return child
+    obj._remove_eg_colorChoice()
+    child = obj._add_schemeClr()
+    return child
+
+def _CT_Color_prstClr(obj):
+    '``<a:prstClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}prstClr')
+
+def _CT_Color_new_prstClr(obj):
+    'Return a "loose", newly created ``<a:prstClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}prstClr', nsmap=_nsmap_a)
+
+def _CT_Color_insert_prstClr(obj, child):
+    'Return the passed ``<a:prstClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Color_add_prstClr(obj, **attrs):
+    'Add a new ``<a:prstClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_prstClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_prstClr(child)
+    return child
+
+def _CT_Color_get_or_change_to_prstClr(obj):
+    'Return the ``<a:prstClr>`` child, replacing any other group element if found.'
+    child = obj.prstClr
+    if child is not None:
+        return child
+    obj._remove_eg_colorChoice()
+    child = obj._add_prstClr()
+    return child
+
+def _CT_Color_remove_eg_colorChoice(obj):
+    'Remove the current choice group child element if present.'
+    for clark_name in ('{http://schemas.openxmlformats.org/drawingml/2006/main}scrgbClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}srgbClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}hslClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}sysClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}schemeClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}prstClr'):
+        for child in obj.findall(clark_name):
+            obj.remove(child)
+
+
+members['pptx.oxml.dml.color.CT_Color'] = (
+    ('set', 'eg_colorChoice', property(_CT_Color_eg_colorChoice, None, None)),
+    ('set', 'scrgbClr', property(_CT_Color_scrgbClr, None, None)),
+    ('add', '_new_scrgbClr', _CT_Color_new_scrgbClr),
+    ('add', '_insert_scrgbClr', _CT_Color_insert_scrgbClr),
+    ('add', '_add_scrgbClr', _CT_Color_add_scrgbClr),
+    ('add', 'get_or_change_to_scrgbClr', _CT_Color_get_or_change_to_scrgbClr),
+    ('set', 'srgbClr', property(_CT_Color_srgbClr, None, None)),
+    ('add', '_new_srgbClr', _CT_Color_new_srgbClr),
+    ('add', '_insert_srgbClr', _CT_Color_insert_srgbClr),
+    ('add', '_add_srgbClr', _CT_Color_add_srgbClr),
+    ('add', 'get_or_change_to_srgbClr', _CT_Color_get_or_change_to_srgbClr),
+    ('set', 'hslClr', property(_CT_Color_hslClr, None, None)),
+    ('add', '_new_hslClr', _CT_Color_new_hslClr),
+    ('add', '_insert_hslClr', _CT_Color_insert_hslClr),
+    ('add', '_add_hslClr', _CT_Color_add_hslClr),
+    ('add', 'get_or_change_to_hslClr', _CT_Color_get_or_change_to_hslClr),
+    ('set', 'sysClr', property(_CT_Color_sysClr, None, None)),
+    ('add', '_new_sysClr', _CT_Color_new_sysClr),
+    ('add', '_insert_sysClr', _CT_Color_insert_sysClr),
+    ('add', '_add_sysClr', _CT_Color_add_sysClr),
+    ('add', 'get_or_change_to_sysClr', _CT_Color_get_or_change_to_sysClr),
+    ('set', 'schemeClr', property(_CT_Color_schemeClr, None, None)),
+    ('add', '_new_schemeClr', _CT_Color_new_schemeClr),
+    ('add', '_insert_schemeClr', _CT_Color_insert_schemeClr),
+    ('add', '_add_schemeClr', _CT_Color_add_schemeClr),
+    ('add', 'get_or_change_to_schemeClr', _CT_Color_get_or_change_to_schemeClr),
+    ('set', 'prstClr', property(_CT_Color_prstClr, None, None)),
+    ('add', '_new_prstClr', _CT_Color_new_prstClr),
+    ('add', '_insert_prstClr', _CT_Color_insert_prstClr),
+    ('add', '_add_prstClr', _CT_Color_add_prstClr),
+    ('add', 'get_or_change_to_prstClr', _CT_Color_get_or_change_to_prstClr),
+    ('add', '_remove_eg_colorChoice', _CT_Color_remove_eg_colorChoice),
+)
+
+
+# pptx.oxml.dml.color.CT_Percentage -----------------------------------------
+
+def _CT_Percentage_val_get(obj):
+    'ST_Percentage type-converted value of ``val`` attribute.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'val' attribute not present on element %s" % obj.tag
+        )
+    return ST_Percentage.from_xml(attr_str_value)
+
+def _CT_Percentage_val_set(obj, value):
+    str_value = ST_Percentage.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.dml.color.CT_Percentage'] = (
+    ('set', 'val', property(_CT_Percentage_val_get, _CT_Percentage_val_set, None)),
+)
+
+
+# pptx.oxml.dml.color.CT_SRgbColor ------------------------------------------
+
+def _CT_SRgbColor_val_get(obj):
+    'ST_HexColorRGB type-converted value of ``val`` attribute.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'val' attribute not present on element %s" % obj.tag
+        )
+    return ST_HexColorRGB.from_xml(attr_str_value)
+
+def _CT_SRgbColor_val_set(obj, value):
+    str_value = ST_HexColorRGB.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.dml.color.CT_SRgbColor'] = (
+    ('set', 'val', property(_CT_SRgbColor_val_get, _CT_SRgbColor_val_set, None)),
+)
+
+
+# pptx.oxml.dml.color.CT_SchemeColor ----------------------------------------
+
+def _CT_SchemeColor_val_get(obj):
+    'MSO_THEME_COLOR_INDEX type-converted value of ``val`` attribute.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'val' attribute not present on element %s" % obj.tag
+        )
+    return MSO_THEME_COLOR_INDEX.from_xml(attr_str_value)
+
+def _CT_SchemeColor_val_set(obj, value):
+    str_value = MSO_THEME_COLOR_INDEX.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.dml.color.CT_SchemeColor'] = (
+    ('set', 'val', property(_CT_SchemeColor_val_get, _CT_SchemeColor_val_set, None)),
+)
+
+
+# pptx.oxml.dml.color._BaseColorElement -------------------------------------
+
+def __BaseColorElement_lumMod(obj):
+    '``<a:lumMod>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}lumMod')
+
+def __BaseColorElement_new_lumMod(obj):
+    'Return a "loose", newly created ``<a:lumMod>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}lumMod', nsmap=_nsmap_a)
+
+def __BaseColorElement_insert_lumMod(obj, child):
+    'Return the passed ``<a:lumMod>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def __BaseColorElement_add_lumMod(obj, **attrs):
+    'Add a new ``<a:lumMod>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_lumMod()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_lumMod(child)
+    return child
+
+def __BaseColorElement_get_or_add_lumMod(obj):
+    'Return the ``<a:lumMod>`` child element, newly added if not present.'
+    child = obj.lumMod
+    if child is None:
+        child = obj._add_lumMod()
+    return child
+
+def __BaseColorElement_remove_lumMod(obj):
+    'Remove all ``<a:lumMod>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}lumMod'):
+        obj.remove(child)
+
+def __BaseColorElement_lumOff(obj):
+    '``<a:lumOff>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}lumOff')
+
+def __BaseColorElement_new_lumOff(obj):
+    'Return a "loose", newly created ``<a:lumOff>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}lumOff', nsmap=_nsmap_a)
+
+def __BaseColorElement_insert_lumOff(obj, child):
+    'Return the passed ``<a:lumOff>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def __BaseColorElement_add_lumOff(obj, **attrs):
+    'Add a new ``<a:lumOff>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_lumOff()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_lumOff(child)
+    return child
+
+def __BaseColorElement_get_or_add_lumOff(obj):
+    'Return the ``<a:lumOff>`` child element, newly added if not present.'
+    child = obj.lumOff
+    if child is None:
+        child = obj._add_lumOff()
+    return child
+
+def __BaseColorElement_remove_lumOff(obj):
+    'Remove all ``<a:lumOff>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}lumOff'):
+        obj.remove(child)
+
+
+members['pptx.oxml.dml.color._BaseColorElement'] = (
+    ('set', 'lumMod', property(__BaseColorElement_lumMod, None, None)),
+    ('add', '_new_lumMod', __BaseColorElement_new_lumMod),
+    ('add', '_insert_lumMod', __BaseColorElement_insert_lumMod),
+    ('add', '_add_lumMod', __BaseColorElement_add_lumMod),
+    ('add', 'get_or_add_lumMod', __BaseColorElement_get_or_add_lumMod),
+    ('add', '_remove_lumMod', __BaseColorElement_remove_lumMod),
+    ('set', 'lumOff', property(__BaseColorElement_lumOff, None, None)),
+    ('add', '_new_lumOff', __BaseColorElement_new_lumOff),
+    ('add', '_insert_lumOff', __BaseColorElement_insert_lumOff),
+    ('add', '_add_lumOff', __BaseColorElement_add_lumOff),
+    ('add', 'get_or_add_lumOff', __BaseColorElement_get_or_add_lumOff),
+    ('add', '_remove_lumOff', __BaseColorElement_remove_lumOff),
+)
+
+
+# pptx.oxml.dml.fill.CT_Blip ------------------------------------------------
+
+def _CT_Blip_rEmbed_get(obj):
+    'ST_RelationshipId type-converted value of ``r:embed`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed')
+    if attr_str_value is None:
+        return None
+    return ST_RelationshipId.from_xml(attr_str_value)
+
+def _CT_Blip_rEmbed_set(obj, value):
+    if value == None:
+        if '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed' in obj.attrib:
+            del obj.attrib['{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed']
+        return
+    str_value = ST_RelationshipId.to_xml(value)
+    obj.set('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed', str_value)
+
+
+members['pptx.oxml.dml.fill.CT_Blip'] = (
+    ('set', 'rEmbed', property(_CT_Blip_rEmbed_get, _CT_Blip_rEmbed_set, None)),
+)
+
+
+# pptx.oxml.dml.fill.CT_BlipFillProperties ----------------------------------
+
+def _CT_BlipFillProperties_blip(obj):
+    '``<a:blip>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}blip')
+
+def _CT_BlipFillProperties_new_blip(obj):
+    'Return a "loose", newly created ``<a:blip>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}blip', nsmap=_nsmap_a)
+
+def _CT_BlipFillProperties_insert_blip(obj, child):
+    'Return the passed ``<a:blip>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}srcRect', '{http://schemas.openxmlformats.org/drawingml/2006/main}tile', '{http://schemas.openxmlformats.org/drawingml/2006/main}stretch'))
+    return child
+
+def _CT_BlipFillProperties_add_blip(obj, **attrs):
+    'Add a new ``<a:blip>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_blip()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_blip(child)
+    return child
+
+def _CT_BlipFillProperties_get_or_add_blip(obj):
+    'Return the ``<a:blip>`` child element, newly added if not present.'
+    child = obj.blip
+    if child is None:
+        child = obj._add_blip()
+    return child
+
+def _CT_BlipFillProperties_remove_blip(obj):
+    'Remove all ``<a:blip>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}blip'):
+        obj.remove(child)
+
+def _CT_BlipFillProperties_srcRect(obj):
+    '``<a:srcRect>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}srcRect')
+
+def _CT_BlipFillProperties_new_srcRect(obj):
+    'Return a "loose", newly created ``<a:srcRect>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}srcRect', nsmap=_nsmap_a)
+
+def _CT_BlipFillProperties_insert_srcRect(obj, child):
+    'Return the passed ``<a:srcRect>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}tile', '{http://schemas.openxmlformats.org/drawingml/2006/main}stretch'))
+    return child
+
+def _CT_BlipFillProperties_add_srcRect(obj, **attrs):
+    'Add a new ``<a:srcRect>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_srcRect()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_srcRect(child)
+    return child
+
+def _CT_BlipFillProperties_get_or_add_srcRect(obj):
+    'Return the ``<a:srcRect>`` child element, newly added if not present.'
+    child = obj.srcRect
+    if child is None:
+        child = obj._add_srcRect()
+    return child
+
+def _CT_BlipFillProperties_remove_srcRect(obj):
+    'Remove all ``<a:srcRect>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}srcRect'):
+        obj.remove(child)
+
+
+members['pptx.oxml.dml.fill.CT_BlipFillProperties'] = (
+    ('set', 'blip', property(_CT_BlipFillProperties_blip, None, None)),
+    ('add', '_new_blip', _CT_BlipFillProperties_new_blip),
+    ('add', '_insert_blip', _CT_BlipFillProperties_insert_blip),
+    ('add', '_add_blip', _CT_BlipFillProperties_add_blip),
+    ('add', 'get_or_add_blip', _CT_BlipFillProperties_get_or_add_blip),
+    ('add', '_remove_blip', _CT_BlipFillProperties_remove_blip),
+    ('set', 'srcRect', property(_CT_BlipFillProperties_srcRect, None, None)),
+    ('add', '_new_srcRect', _CT_BlipFillProperties_new_srcRect),
+    ('add', '_insert_srcRect', _CT_BlipFillProperties_insert_srcRect),
+    ('add', '_add_srcRect', _CT_BlipFillProperties_add_srcRect),
+    ('add', 'get_or_add_srcRect', _CT_BlipFillProperties_get_or_add_srcRect),
+    ('add', '_remove_srcRect', _CT_BlipFillProperties_remove_srcRect),
+)
+
+
+# pptx.oxml.dml.fill.CT_GradientFillProperties ------------------------------
+
+def _CT_GradientFillProperties_gsLst(obj):
+    '``<a:gsLst>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}gsLst')
+
+def _CT_GradientFillProperties_new_gsLst(obj):
+    'Return a "loose", newly created ``<a:gsLst>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}gsLst', nsmap=_nsmap_a)
+
+def _CT_GradientFillProperties_insert_gsLst(obj, child):
+    'Return the passed ``<a:gsLst>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}lin', '{http://schemas.openxmlformats.org/drawingml/2006/main}path', '{http://schemas.openxmlformats.org/drawingml/2006/main}tileRect'))
+    return child
+
+def _CT_GradientFillProperties_add_gsLst(obj, **attrs):
+    'Add a new ``<a:gsLst>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_gsLst()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_gsLst(child)
+    return child
+
+def _CT_GradientFillProperties_get_or_add_gsLst(obj):
+    'Return the ``<a:gsLst>`` child element, newly added if not present.'
+    child = obj.gsLst
+    if child is None:
+        child = obj._add_gsLst()
+    return child
+
+def _CT_GradientFillProperties_remove_gsLst(obj):
+    'Remove all ``<a:gsLst>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}gsLst'):
+        obj.remove(child)
+
+def _CT_GradientFillProperties_lin(obj):
+    '``<a:lin>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}lin')
+
+def _CT_GradientFillProperties_new_lin(obj):
+    'Return a "loose", newly created ``<a:lin>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}lin', nsmap=_nsmap_a)
+
+def _CT_GradientFillProperties_insert_lin(obj, child):
+    'Return the passed ``<a:lin>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}path', '{http://schemas.openxmlformats.org/drawingml/2006/main}tileRect'))
+    return child
+
+def _CT_GradientFillProperties_add_lin(obj, **attrs):
+    'Add a new ``<a:lin>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_lin()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_lin(child)
+    return child
+
+def _CT_GradientFillProperties_get_or_add_lin(obj):
+    'Return the ``<a:lin>`` child element, newly added if not present.'
+    child = obj.lin
+    if child is None:
+        child = obj._add_lin()
+    return child
+
+def _CT_GradientFillProperties_remove_lin(obj):
+    'Remove all ``<a:lin>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}lin'):
+        obj.remove(child)
+
+def _CT_GradientFillProperties_path(obj):
+    '``<a:path>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}path')
+
+def _CT_GradientFillProperties_new_path(obj):
+    'Return a "loose", newly created ``<a:path>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}path', nsmap=_nsmap_a)
+
+def _CT_GradientFillProperties_insert_path(obj, child):
+    'Return the passed ``<a:path>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}tileRect',))
+    return child
+
+def _CT_GradientFillProperties_add_path(obj, **attrs):
+    'Add a new ``<a:path>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_path()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_path(child)
+    return child
+
+def _CT_GradientFillProperties_get_or_add_path(obj):
+    'Return the ``<a:path>`` child element, newly added if not present.'
+    child = obj.path
+    if child is None:
+        child = obj._add_path()
+    return child
+
+def _CT_GradientFillProperties_remove_path(obj):
+    'Remove all ``<a:path>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}path'):
+        obj.remove(child)
+
+
+members['pptx.oxml.dml.fill.CT_GradientFillProperties'] = (
+    ('set', 'gsLst', property(_CT_GradientFillProperties_gsLst, None, None)),
+    ('add', '_new_gsLst', _CT_GradientFillProperties_new_gsLst),
+    ('add', '_insert_gsLst', _CT_GradientFillProperties_insert_gsLst),
+    ('add', '_add_gsLst', _CT_GradientFillProperties_add_gsLst),
+    ('add', 'get_or_add_gsLst', _CT_GradientFillProperties_get_or_add_gsLst),
+    ('add', '_remove_gsLst', _CT_GradientFillProperties_remove_gsLst),
+    ('set', 'lin', property(_CT_GradientFillProperties_lin, None, None)),
+    ('add', '_new_lin', _CT_GradientFillProperties_new_lin),
+    ('add', '_insert_lin', _CT_GradientFillProperties_insert_lin),
+    ('add', '_add_lin', _CT_GradientFillProperties_add_lin),
+    ('add', 'get_or_add_lin', _CT_GradientFillProperties_get_or_add_lin),
+    ('add', '_remove_lin', _CT_GradientFillProperties_remove_lin),
+    ('set', 'path', property(_CT_GradientFillProperties_path, None, None)),
+    ('add', '_new_path', _CT_GradientFillProperties_new_path),
+    ('add', '_insert_path', _CT_GradientFillProperties_insert_path),
+    ('add', '_add_path', _CT_GradientFillProperties_add_path),
+    ('add', 'get_or_add_path', _CT_GradientFillProperties_get_or_add_path),
+    ('add', '_remove_path', _CT_GradientFillProperties_remove_path),
+)
+
+
+# pptx.oxml.dml.fill.CT_GradientStop ----------------------------------------
+
+def _CT_GradientStop_eg_colorChoice(obj):
+    'Return the child element belonging to this element group, or |None| if no member child is present.'
+    for clark_name in ('{http://schemas.openxmlformats.org/drawingml/2006/main}scrgbClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}srgbClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}hslClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}sysClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}schemeClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}prstClr'):
+        child = obj.find(clark_name)
+        if child is not None:
+            return child
+    return None
+
+def _CT_GradientStop_scrgbClr(obj):
+    '``<a:scrgbClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}scrgbClr')
+
+def _CT_GradientStop_new_scrgbClr(obj):
+    'Return a "loose", newly created ``<a:scrgbClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}scrgbClr', nsmap=_nsmap_a)
+
+def _CT_GradientStop_insert_scrgbClr(obj, child):
+    'Return the passed ``<a:scrgbClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_GradientStop_add_scrgbClr(obj, **attrs):
+    'Add a new ``<a:scrgbClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_scrgbClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_scrgbClr(child)
+    return child
+
+def _CT_GradientStop_get_or_change_to_scrgbClr(obj):
+    'Return the ``<a:scrgbClr>`` child, replacing any other group element if found.'
+    child = obj.scrgbClr
+    if child is not None:
+        return child
+    obj._remove_eg_colorChoice()
+    child = obj._add_scrgbClr()
+    return child
+
+def _CT_GradientStop_srgbClr(obj):
+    '``<a:srgbClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}srgbClr')
+
+def _CT_GradientStop_new_srgbClr(obj):
+    'Return a "loose", newly created ``<a:srgbClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}srgbClr', nsmap=_nsmap_a)
+
+def _CT_GradientStop_insert_srgbClr(obj, child):
+    'Return the passed ``<a:srgbClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_GradientStop_add_srgbClr(obj, **attrs):
+    'Add a new ``<a:srgbClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_srgbClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_srgbClr(child)
+    return child
+
+def _CT_GradientStop_get_or_change_to_srgbClr(obj):
+    'Return the ``<a:srgbClr>`` child, replacing any other group element if found.'
+    child = obj.srgbClr
+    if child is not None:
+        return child
+    obj._remove_eg_colorChoice()
+    child = obj._add_srgbClr()
+    return child
+
+def _CT_GradientStop_hslClr(obj):
+    '``<a:hslClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}hslClr')
+
+def _CT_GradientStop_new_hslClr(obj):
+    'Return a "loose", newly created ``<a:hslClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}hslClr', nsmap=_nsmap_a)
+
+def _CT_GradientStop_insert_hslClr(obj, child):
+    'Return the passed ``<a:hslClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_GradientStop_add_hslClr(obj, **attrs):
+    'Add a new ``<a:hslClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_hslClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_hslClr(child)
+    return child
+
+def _CT_GradientStop_get_or_change_to_hslClr(obj):
+    'Return the ``<a:hslClr>`` child, replacing any other group element if found.'
+    child = obj.hslClr
+    if child is not None:
+        return child
+    obj._remove_eg_colorChoice()
+    child = obj._add_hslClr()
+    return child
+
+def _CT_GradientStop_sysClr(obj):
+    '``<a:sysClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}sysClr')
+
+def _CT_GradientStop_new_sysClr(obj):
+    'Return a "loose", newly created ``<a:sysClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}sysClr', nsmap=_nsmap_a)
+
+def _CT_GradientStop_insert_sysClr(obj, child):
+    'Return the passed ``<a:sysClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_GradientStop_add_sysClr(obj, **attrs):
+    'Add a new ``<a:sysClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_sysClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_sysClr(child)
+    return child
+
+def _CT_GradientStop_get_or_change_to_sysClr(obj):
+    'Return the ``<a:sysClr>`` child, replacing any other group element if found.'
+    child = obj.sysClr
+    if child is not None:
+        return child
+    obj._remove_eg_colorChoice()
+    child = obj._add_sysClr()
+    return child
+
+def _CT_GradientStop_schemeClr(obj):
+    '``<a:schemeClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}schemeClr')
+
+def _CT_GradientStop_new_schemeClr(obj):
+    'Return a "loose", newly created ``<a:schemeClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}schemeClr', nsmap=_nsmap_a)
+
+def _CT_GradientStop_insert_schemeClr(obj, child):
+    'Return the passed ``<a:schemeClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_GradientStop_add_schemeClr(obj, **attrs):
+    'Add a new ``<a:schemeClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_schemeClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_schemeClr(child)
+    return child
+
+def _CT_GradientStop_get_or_change_to_schemeClr(obj):
+    'Return the ``<a:schemeClr>`` child, replacing any other group element if found.'
+    child = obj.schemeClr
+    if child is not None:
+        return child
+    obj._remove_eg_colorChoice()
+    child = obj._add_schemeClr()
+    return child
+
+def _CT_GradientStop_prstClr(obj):
+    '``<a:prstClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}prstClr')
+
+def _CT_GradientStop_new_prstClr(obj):
+    'Return a "loose", newly created ``<a:prstClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}prstClr', nsmap=_nsmap_a)
+
+def _CT_GradientStop_insert_prstClr(obj, child):
+    'Return the passed ``<a:prstClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_GradientStop_add_prstClr(obj, **attrs):
+    'Add a new ``<a:prstClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_prstClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_prstClr(child)
+    return child
+
+def _CT_GradientStop_get_or_change_to_prstClr(obj):
+    'Return the ``<a:prstClr>`` child, replacing any other group element if found.'
+    child = obj.prstClr
+    if child is not None:
+        return child
+    obj._remove_eg_colorChoice()
+    child = obj._add_prstClr()
+    return child
+
+def _CT_GradientStop_remove_eg_colorChoice(obj):
+    'Remove the current choice group child element if present.'
+    for clark_name in ('{http://schemas.openxmlformats.org/drawingml/2006/main}scrgbClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}srgbClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}hslClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}sysClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}schemeClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}prstClr'):
+        for child in obj.findall(clark_name):
+            obj.remove(child)
+
+def _CT_GradientStop_pos_get(obj):
+    'ST_PositiveFixedPercentage type-converted value of ``pos`` attribute.'
+    attr_str_value = obj.get('pos')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'pos' attribute not present on element %s" % obj.tag
+        )
+    return ST_PositiveFixedPercentage.from_xml(attr_str_value)
+
+def _CT_GradientStop_pos_set(obj, value):
+    str_value = ST_PositiveFixedPercentage.to_xml(value)
+    obj.set('pos', str_value)
+
+
+members['pptx.oxml.dml.fill.CT_GradientStop'] = (
+    ('set', 'eg_colorChoice', property(_CT_GradientStop_eg_colorChoice, None, None)),
+    ('set', 'scrgbClr', property(_CT_GradientStop_scrgbClr, None, None)),
+    ('add', '_new_scrgbClr', _CT_GradientStop_new_scrgbClr),
+    ('add', '_insert_scrgbClr', _CT_GradientStop_insert_scrgbClr),
+    ('add', '_add_scrgbClr', _CT_GradientStop_add_scrgbClr),
+    ('add', 'get_or_change_to_scrgbClr', _CT_GradientStop_get_or_change_to_scrgbClr),
+    ('set', 'srgbClr', property(_CT_GradientStop_srgbClr, None, None)),
+    ('add', '_new_srgbClr', _CT_GradientStop_new_srgbClr),
+    ('add', '_insert_srgbClr', _CT_GradientStop_insert_srgbClr),
+    ('add', '_add_srgbClr', _CT_GradientStop_add_srgbClr),
+    ('add', 'get_or_change_to_srgbClr', _CT_GradientStop_get_or_change_to_srgbClr),
+    ('set', 'hslClr', property(_CT_GradientStop_hslClr, None, None)),
+    ('add', '_new_hslClr', _CT_GradientStop_new_hslClr),
+    ('add', '_insert_hslClr', _CT_GradientStop_insert_hslClr),
+    ('add', '_add_hslClr', _CT_GradientStop_add_hslClr),
+    ('add', 'get_or_change_to_hslClr', _CT_GradientStop_get_or_change_to_hslClr),
+    ('set', 'sysClr', property(_CT_GradientStop_sysClr, None, None)),
+    ('add', '_new_sysClr', _CT_GradientStop_new_sysClr),
+    ('add', '_insert_sysClr', _CT_GradientStop_insert_sysClr),
+    ('add', '_add_sysClr', _CT_GradientStop_add_sysClr),
+    ('add', 'get_or_change_to_sysClr', _CT_GradientStop_get_or_change_to_sysClr),
+    ('set', 'schemeClr', property(_CT_GradientStop_schemeClr, None, None)),
+    ('add', '_new_schemeClr', _CT_GradientStop_new_schemeClr),
+    ('add', '_insert_schemeClr', _CT_GradientStop_insert_schemeClr),
+    ('add', '_add_schemeClr', _CT_GradientStop_add_schemeClr),
+    ('add', 'get_or_change_to_schemeClr', _CT_GradientStop_get_or_change_to_schemeClr),
+    ('set', 'prstClr', property(_CT_GradientStop_prstClr, None, None)),
+    ('add', '_new_prstClr', _CT_GradientStop_new_prstClr),
+    ('add', '_insert_prstClr', _CT_GradientStop_insert_prstClr),
+    ('add', '_add_prstClr', _CT_GradientStop_add_prstClr),
+    ('add', 'get_or_change_to_prstClr', _CT_GradientStop_get_or_change_to_prstClr),
+    ('add', '_remove_eg_colorChoice', _CT_GradientStop_remove_eg_colorChoice),
+    ('set', 'pos', property(_CT_GradientStop_pos_get, _CT_GradientStop_pos_set, None)),
+)
+
+
+# pptx.oxml.dml.fill.CT_GradientStopList ------------------------------------
+
+def _CT_GradientStopList_gs_lst(obj):
+    'A list containing each of the ``<a:gs>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}gs')
+
+def _CT_GradientStopList_new_gs(obj):
+    'Return a "loose", newly created ``<a:gs>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}gs', nsmap=_nsmap_a)
+
+def _CT_GradientStopList_insert_gs(obj, child):
+    'Return the passed ``<a:gs>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_GradientStopList_add_gs(obj, **attrs):
+    'Add a new ``<a:gs>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_gs()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_gs(child)
+    return child
+
+def _CT_GradientStopList_add_gs_2(obj):
+    'Add a new ``<a:gs>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._add_gs()
+    return child
+
+
+members['pptx.oxml.dml.fill.CT_GradientStopList'] = (
+    ('set', 'gs_lst', property(_CT_GradientStopList_gs_lst, None, None)),
+    ('add', '_new_gs', _CT_GradientStopList_new_gs),
+    ('add', '_insert_gs', _CT_GradientStopList_insert_gs),
+    ('add', '_add_gs', _CT_GradientStopList_add_gs),
+    ('add', 'add_gs', _CT_GradientStopList_add_gs_2),
+    ('del', 'gs'),
+)
+
+
+# pptx.oxml.dml.fill.CT_LinearShadeProperties -------------------------------
+
+def _CT_LinearShadeProperties_ang_get(obj):
+    'ST_PositiveFixedAngle type-converted value of ``ang`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('ang')
+    if attr_str_value is None:
+        return None
+    return ST_PositiveFixedAngle.from_xml(attr_str_value)
+
+def _CT_LinearShadeProperties_ang_set(obj, value):
+    if value == None:
+        if 'ang' in obj.attrib:
+            del obj.attrib['ang']
+        return
+    str_value = ST_PositiveFixedAngle.to_xml(value)
+    obj.set('ang', str_value)
+
+
+members['pptx.oxml.dml.fill.CT_LinearShadeProperties'] = (
+    ('set', 'ang', property(_CT_LinearShadeProperties_ang_get, _CT_LinearShadeProperties_ang_set, None)),
+)
+
+
+# pptx.oxml.dml.fill.CT_PatternFillProperties -------------------------------
+
+def _CT_PatternFillProperties_fgClr(obj):
+    '``<a:fgClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}fgClr')
+
+def _CT_PatternFillProperties_new_fgClr(obj):
+    'Return a "loose", newly created ``<a:fgClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}fgClr', nsmap=_nsmap_a)
+
+def _CT_PatternFillProperties_insert_fgClr(obj, child):
+    'Return the passed ``<a:fgClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}bgClr',))
+    return child
+
+def _CT_PatternFillProperties_add_fgClr(obj, **attrs):
+    'Add a new ``<a:fgClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_fgClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_fgClr(child)
+    return child
+
+def _CT_PatternFillProperties_get_or_add_fgClr(obj):
+    'Return the ``<a:fgClr>`` child element, newly added if not present.'
+    child = obj.fgClr
+    if child is None:
+        child = obj._add_fgClr()
+    return child
+
+def _CT_PatternFillProperties_remove_fgClr(obj):
+    'Remove all ``<a:fgClr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}fgClr'):
+        obj.remove(child)
+
+def _CT_PatternFillProperties_bgClr(obj):
+    '``<a:bgClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}bgClr')
+
+def _CT_PatternFillProperties_new_bgClr(obj):
+    'Return a "loose", newly created ``<a:bgClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}bgClr', nsmap=_nsmap_a)
+
+def _CT_PatternFillProperties_insert_bgClr(obj, child):
+    'Return the passed ``<a:bgClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_PatternFillProperties_add_bgClr(obj, **attrs):
+    'Add a new ``<a:bgClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_bgClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_bgClr(child)
+    return child
+
+def _CT_PatternFillProperties_get_or_add_bgClr(obj):
+    'Return the ``<a:bgClr>`` child element, newly added if not present.'
+    child = obj.bgClr
+    if child is None:
+        child = obj._add_bgClr()
+    return child
+
+def _CT_PatternFillProperties_remove_bgClr(obj):
+    'Remove all ``<a:bgClr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}bgClr'):
+        obj.remove(child)
+
+def _CT_PatternFillProperties_prst_get(obj):
+    'MSO_PATTERN_TYPE type-converted value of ``prst`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('prst')
+    if attr_str_value is None:
+        return None
+    return MSO_PATTERN_TYPE.from_xml(attr_str_value)
+
+def _CT_PatternFillProperties_prst_set(obj, value):
+    if value == None:
+        if 'prst' in obj.attrib:
+            del obj.attrib['prst']
+        return
+    str_value = MSO_PATTERN_TYPE.to_xml(value)
+    obj.set('prst', str_value)
+
+
+members['pptx.oxml.dml.fill.CT_PatternFillProperties'] = (
+    ('set', 'fgClr', property(_CT_PatternFillProperties_fgClr, None, None)),
+    ('add', '_new_fgClr', _CT_PatternFillProperties_new_fgClr),
+    ('add', '_insert_fgClr', _CT_PatternFillProperties_insert_fgClr),
+    ('add', '_add_fgClr', _CT_PatternFillProperties_add_fgClr),
+    ('add', 'get_or_add_fgClr', _CT_PatternFillProperties_get_or_add_fgClr),
+    ('add', '_remove_fgClr', _CT_PatternFillProperties_remove_fgClr),
+    ('set', 'bgClr', property(_CT_PatternFillProperties_bgClr, None, None)),
+    ('add', '_new_bgClr', _CT_PatternFillProperties_new_bgClr),
+    ('add', '_insert_bgClr', _CT_PatternFillProperties_insert_bgClr),
+    ('add', '_add_bgClr', _CT_PatternFillProperties_add_bgClr),
+    ('add', 'get_or_add_bgClr', _CT_PatternFillProperties_get_or_add_bgClr),
+    ('add', '_remove_bgClr', _CT_PatternFillProperties_remove_bgClr),
+    ('set', 'prst', property(_CT_PatternFillProperties_prst_get, _CT_PatternFillProperties_prst_set, None)),
+)
+
+
+# pptx.oxml.dml.fill.CT_RelativeRect ----------------------------------------
+
+def _CT_RelativeRect_l_get(obj):
+    'ST_Percentage type-converted value of ``l`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('l')
+    if attr_str_value is None:
+        return 0.0
+    return ST_Percentage.from_xml(attr_str_value)
+
+def _CT_RelativeRect_l_set(obj, value):
+    if value == 0.0:
+        if 'l' in obj.attrib:
+            del obj.attrib['l']
+        return
+    str_value = ST_Percentage.to_xml(value)
+    obj.set('l', str_value)
+
+def _CT_RelativeRect_t_get(obj):
+    'ST_Percentage type-converted value of ``t`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('t')
+    if attr_str_value is None:
+        return 0.0
+    return ST_Percentage.from_xml(attr_str_value)
+
+def _CT_RelativeRect_t_set(obj, value):
+    if value == 0.0:
+        if 't' in obj.attrib:
+            del obj.attrib['t']
+        return
+    str_value = ST_Percentage.to_xml(value)
+    obj.set('t', str_value)
+
+def _CT_RelativeRect_r_get(obj):
+    'ST_Percentage type-converted value of ``r`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('r')
+    if attr_str_value is None:
+        return 0.0
+    return ST_Percentage.from_xml(attr_str_value)
+
+def _CT_RelativeRect_r_set(obj, value):
+    if value == 0.0:
+        if 'r' in obj.attrib:
+            del obj.attrib['r']
+        return
+    str_value = ST_Percentage.to_xml(value)
+    obj.set('r', str_value)
+
+def _CT_RelativeRect_b_get(obj):
+    'ST_Percentage type-converted value of ``b`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('b')
+    if attr_str_value is None:
+        return 0.0
+    return ST_Percentage.from_xml(attr_str_value)
+
+def _CT_RelativeRect_b_set(obj, value):
+    if value == 0.0:
+        if 'b' in obj.attrib:
+            del obj.attrib['b']
+        return
+    str_value = ST_Percentage.to_xml(value)
+    obj.set('b', str_value)
+
+
+members['pptx.oxml.dml.fill.CT_RelativeRect'] = (
+    ('set', 'l', property(_CT_RelativeRect_l_get, _CT_RelativeRect_l_set, None)),
+    ('set', 't', property(_CT_RelativeRect_t_get, _CT_RelativeRect_t_set, None)),
+    ('set', 'r', property(_CT_RelativeRect_r_get, _CT_RelativeRect_r_set, None)),
+    ('set', 'b', property(_CT_RelativeRect_b_get, _CT_RelativeRect_b_set, None)),
+)
+
+
+# pptx.oxml.dml.fill.CT_SolidColorFillProperties ----------------------------
+
+def _CT_SolidColorFillProperties_eg_colorChoice(obj):
+    'Return the child element belonging to this element group, or |None| if no member child is present.'
+    for clark_name in ('{http://schemas.openxmlformats.org/drawingml/2006/main}scrgbClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}srgbClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}hslClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}sysClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}schemeClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}prstClr'):
+        child = obj.find(clark_name)
+        if child is not None:
+            return child
+    return None
+
+def _CT_SolidColorFillProperties_scrgbClr(obj):
+    '``<a:scrgbClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}scrgbClr')
+
+def _CT_SolidColorFillProperties_new_scrgbClr(obj):
+    'Return a "loose", newly created ``<a:scrgbClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}scrgbClr', nsmap=_nsmap_a)
+
+def _CT_SolidColorFillProperties_insert_scrgbClr(obj, child):
+    'Return the passed ``<a:scrgbClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_SolidColorFillProperties_add_scrgbClr(obj, **attrs):
+    'Add a new ``<a:scrgbClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_scrgbClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_scrgbClr(child)
+    return child
+
+def _CT_SolidColorFillProperties_get_or_change_to_scrgbClr(obj):
+    'Return the ``<a:scrgbClr>`` child, replacing any other group element if found.'
+    child = obj.scrgbClr
+    if child is not None:
+        return child
+    obj._remove_eg_colorChoice()
+    child = obj._add_scrgbClr()
+    return child
+
+def _CT_SolidColorFillProperties_srgbClr(obj):
+    '``<a:srgbClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}srgbClr')
+
+def _CT_SolidColorFillProperties_new_srgbClr(obj):
+    'Return a "loose", newly created ``<a:srgbClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}srgbClr', nsmap=_nsmap_a)
+
+def _CT_SolidColorFillProperties_insert_srgbClr(obj, child):
+    'Return the passed ``<a:srgbClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_SolidColorFillProperties_add_srgbClr(obj, **attrs):
+    'Add a new ``<a:srgbClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_srgbClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_srgbClr(child)
+    return child
+
+def _CT_SolidColorFillProperties_get_or_change_to_srgbClr(obj):
+    'Return the ``<a:srgbClr>`` child, replacing any other group element if found.'
+    child = obj.srgbClr
+    if child is not None:
+        return child
+    obj._remove_eg_colorChoice()
+    child = obj._add_srgbClr()
+    return child
+
+def _CT_SolidColorFillProperties_hslClr(obj):
+    '``<a:hslClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}hslClr')
+
+def _CT_SolidColorFillProperties_new_hslClr(obj):
+    'Return a "loose", newly created ``<a:hslClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}hslClr', nsmap=_nsmap_a)
+
+def _CT_SolidColorFillProperties_insert_hslClr(obj, child):
+    'Return the passed ``<a:hslClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_SolidColorFillProperties_add_hslClr(obj, **attrs):
+    'Add a new ``<a:hslClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_hslClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_hslClr(child)
+    return child
+
+def _CT_SolidColorFillProperties_get_or_change_to_hslClr(obj):
+    'Return the ``<a:hslClr>`` child, replacing any other group element if found.'
+    child = obj.hslClr
+    if child is not None:
+        return child
+    obj._remove_eg_colorChoice()
+    child = obj._add_hslClr()
+    return child
+
+def _CT_SolidColorFillProperties_sysClr(obj):
+    '``<a:sysClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}sysClr')
+
+def _CT_SolidColorFillProperties_new_sysClr(obj):
+    'Return a "loose", newly created ``<a:sysClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}sysClr', nsmap=_nsmap_a)
+
+def _CT_SolidColorFillProperties_insert_sysClr(obj, child):
+    'Return the passed ``<a:sysClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_SolidColorFillProperties_add_sysClr(obj, **attrs):
+    'Add a new ``<a:sysClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_sysClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_sysClr(child)
+    return child
+
+def _CT_SolidColorFillProperties_get_or_change_to_sysClr(obj):
+    'Return the ``<a:sysClr>`` child, replacing any other group element if found.'
+    child = obj.sysClr
+    if child is not None:
+        return child
+    obj._remove_eg_colorChoice()
+    child = obj._add_sysClr()
+    return child
+
+def _CT_SolidColorFillProperties_schemeClr(obj):
+    '``<a:schemeClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}schemeClr')
+
+def _CT_SolidColorFillProperties_new_schemeClr(obj):
+    'Return a "loose", newly created ``<a:schemeClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}schemeClr', nsmap=_nsmap_a)
+
+def _CT_SolidColorFillProperties_insert_schemeClr(obj, child):
+    'Return the passed ``<a:schemeClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_SolidColorFillProperties_add_schemeClr(obj, **attrs):
+    'Add a new ``<a:schemeClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_schemeClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_schemeClr(child)
+    return child
+
+def _CT_SolidColorFillProperties_get_or_change_to_schemeClr(obj):
+    'Return the ``<a:schemeClr>`` child, replacing any other group element if found.'
+    child = obj.schemeClr
+    if child is not None:
+        return child
+    obj._remove_eg_colorChoice()
+    child = obj._add_schemeClr()
+    return child
+
+def _CT_SolidColorFillProperties_prstClr(obj):
+    '``<a:prstClr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}prstClr')
+
+def _CT_SolidColorFillProperties_new_prstClr(obj):
+    'Return a "loose", newly created ``<a:prstClr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}prstClr', nsmap=_nsmap_a)
+
+def _CT_SolidColorFillProperties_insert_prstClr(obj, child):
+    'Return the passed ``<a:prstClr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_SolidColorFillProperties_add_prstClr(obj, **attrs):
+    'Add a new ``<a:prstClr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_prstClr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_prstClr(child)
+    return child
+
+def _CT_SolidColorFillProperties_get_or_change_to_prstClr(obj):
+    'Return the ``<a:prstClr>`` child, replacing any other group element if found.'
+    child = obj.prstClr
+    if child is not None:
+        return child
+    obj._remove_eg_colorChoice()
+    child = obj._add_prstClr()
+    return child
+
+def _CT_SolidColorFillProperties_remove_eg_colorChoice(obj):
+    'Remove the current choice group child element if present.'
+    for clark_name in ('{http://schemas.openxmlformats.org/drawingml/2006/main}scrgbClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}srgbClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}hslClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}sysClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}schemeClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}prstClr'):
+        for child in obj.findall(clark_name):
+            obj.remove(child)
+
+
+members['pptx.oxml.dml.fill.CT_SolidColorFillProperties'] = (
+    ('set', 'eg_colorChoice', property(_CT_SolidColorFillProperties_eg_colorChoice, None, None)),
+    ('set', 'scrgbClr', property(_CT_SolidColorFillProperties_scrgbClr, None, None)),
+    ('add', '_new_scrgbClr', _CT_SolidColorFillProperties_new_scrgbClr),
+    ('add', '_insert_scrgbClr', _CT_SolidColorFillProperties_insert_scrgbClr),
+    ('add', '_add_scrgbClr', _CT_SolidColorFillProperties_add_scrgbClr),
+    ('add', 'get_or_change_to_scrgbClr', _CT_SolidColorFillProperties_get_or_change_to_scrgbClr),
+    ('set', 'srgbClr', property(_CT_SolidColorFillProperties_srgbClr, None, None)),
+    ('add', '_new_srgbClr', _CT_SolidColorFillProperties_new_srgbClr),
+    ('add', '_insert_srgbClr', _CT_SolidColorFillProperties_insert_srgbClr),
+    ('add', '_add_srgbClr', _CT_SolidColorFillProperties_add_srgbClr),
+    ('add', 'get_or_change_to_srgbClr', _CT_SolidColorFillProperties_get_or_change_to_srgbClr),
+    ('set', 'hslClr', property(_CT_SolidColorFillProperties_hslClr, None, None)),
+    ('add', '_new_hslClr', _CT_SolidColorFillProperties_new_hslClr),
+    ('add', '_insert_hslClr', _CT_SolidColorFillProperties_insert_hslClr),
+    ('add', '_add_hslClr', _CT_SolidColorFillProperties_add_hslClr),
+    ('add', 'get_or_change_to_hslClr', _CT_SolidColorFillProperties_get_or_change_to_hslClr),
+    ('set', 'sysClr', property(_CT_SolidColorFillProperties_sysClr, None, None)),
+    ('add', '_new_sysClr', _CT_SolidColorFillProperties_new_sysClr),
+    ('add', '_insert_sysClr', _CT_SolidColorFillProperties_insert_sysClr),
+    ('add', '_add_sysClr', _CT_SolidColorFillProperties_add_sysClr),
+    ('add', 'get_or_change_to_sysClr', _CT_SolidColorFillProperties_get_or_change_to_sysClr),
+    ('set', 'schemeClr', property(_CT_SolidColorFillProperties_schemeClr, None, None)),
+    ('add', '_new_schemeClr', _CT_SolidColorFillProperties_new_schemeClr),
+    ('add', '_insert_schemeClr', _CT_SolidColorFillProperties_insert_schemeClr),
+    ('add', '_add_schemeClr', _CT_SolidColorFillProperties_add_schemeClr),
+    ('add', 'get_or_change_to_schemeClr', _CT_SolidColorFillProperties_get_or_change_to_schemeClr),
+    ('set', 'prstClr', property(_CT_SolidColorFillProperties_prstClr, None, None)),
+    ('add', '_new_prstClr', _CT_SolidColorFillProperties_new_prstClr),
+    ('add', '_insert_prstClr', _CT_SolidColorFillProperties_insert_prstClr),
+    ('add', '_add_prstClr', _CT_SolidColorFillProperties_add_prstClr),
+    ('add', 'get_or_change_to_prstClr', _CT_SolidColorFillProperties_get_or_change_to_prstClr),
+    ('add', '_remove_eg_colorChoice', _CT_SolidColorFillProperties_remove_eg_colorChoice),
+)
+
+
+# pptx.oxml.dml.line.CT_PresetLineDashProperties ----------------------------
+
+def _CT_PresetLineDashProperties_val_get(obj):
+    'MSO_LINE_DASH_STYLE type-converted value of ``val`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        return None
+    return MSO_LINE_DASH_STYLE.from_xml(attr_str_value)
+
+def _CT_PresetLineDashProperties_val_set(obj, value):
+    if value == None:
+        if 'val' in obj.attrib:
+            del obj.attrib['val']
+        return
+    str_value = MSO_LINE_DASH_STYLE.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.dml.line.CT_PresetLineDashProperties'] = (
+    ('set', 'val', property(_CT_PresetLineDashProperties_val_get, _CT_PresetLineDashProperties_val_set, None)),
+)
+
+
+# pptx.oxml.presentation.CT_Presentation ------------------------------------
+
+def _CT_Presentation_sldMasterIdLst(obj):
+    '``<p:sldMasterIdLst>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}sldMasterIdLst')
+
+def _CT_Presentation_new_sldMasterIdLst(obj):
+    'Return a "loose", newly created ``<p:sldMasterIdLst>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/presentationml/2006/main}sldMasterIdLst', nsmap=_nsmap_p)
+
+def _CT_Presentation_insert_sldMasterIdLst(obj, child):
+    'Return the passed ``<p:sldMasterIdLst>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/presentationml/2006/main}notesMasterIdLst', '{http://schemas.openxmlformats.org/presentationml/2006/main}handoutMasterIdLst', '{http://schemas.openxmlformats.org/presentationml/2006/main}sldIdLst', '{http://schemas.openxmlformats.org/presentationml/2006/main}sldSz', '{http://schemas.openxmlformats.org/presentationml/2006/main}notesSz'))
+    return child
+
+def _CT_Presentation_add_sldMasterIdLst(obj, **attrs):
+    'Add a new ``<p:sldMasterIdLst>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_sldMasterIdLst()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_sldMasterIdLst(child)
+    return child
+
+def _CT_Presentation_get_or_add_sldMasterIdLst(obj):
+    'Return the ``<p:sldMasterIdLst>`` child element, newly added if not present.'
+    child = obj.sldMasterIdLst
+    if child is None:
+        child = obj._add_sldMasterIdLst()
+    return child
+
+def _CT_Presentation_remove_sldMasterIdLst(obj):
+    'Remove all ``<p:sldMasterIdLst>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/presentationml/2006/main}sldMasterIdLst'):
+        obj.remove(child)
+
+def _CT_Presentation_sldIdLst(obj):
+    '``<p:sldIdLst>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}sldIdLst')
+
+def _CT_Presentation_new_sldIdLst(obj):
+    'Return a "loose", newly created ``<p:sldIdLst>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/presentationml/2006/main}sldIdLst', nsmap=_nsmap_p)
+
+def _CT_Presentation_insert_sldIdLst(obj, child):
+    'Return the passed ``<p:sldIdLst>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/presentationml/2006/main}sldSz', '{http://schemas.openxmlformats.org/presentationml/2006/main}notesSz'))
+    return child
+
+def _CT_Presentation_add_sldIdLst(obj, **attrs):
+    'Add a new ``<p:sldIdLst>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_sldIdLst()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_sldIdLst(child)
+    return child
+
+def _CT_Presentation_get_or_add_sldIdLst(obj):
+    'Return the ``<p:sldIdLst>`` child element, newly added if not present.'
+    child = obj.sldIdLst
+    if child is None:
+        child = obj._add_sldIdLst()
+    return child
+
+def _CT_Presentation_remove_sldIdLst(obj):
+    'Remove all ``<p:sldIdLst>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/presentationml/2006/main}sldIdLst'):
+        obj.remove(child)
+
+def _CT_Presentation_sldSz(obj):
+    '``<p:sldSz>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}sldSz')
+
+def _CT_Presentation_new_sldSz(obj):
+    'Return a "loose", newly created ``<p:sldSz>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/presentationml/2006/main}sldSz', nsmap=_nsmap_p)
+
+def _CT_Presentation_insert_sldSz(obj, child):
+    'Return the passed ``<p:sldSz>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/presentationml/2006/main}notesSz',))
+    return child
+
+def _CT_Presentation_add_sldSz(obj, **attrs):
+    'Add a new ``<p:sldSz>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_sldSz()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_sldSz(child)
+    return child
+
+def _CT_Presentation_get_or_add_sldSz(obj):
+    'Return the ``<p:sldSz>`` child element, newly added if not present.'
+    child = obj.sldSz
+    if child is None:
+        child = obj._add_sldSz()
+    return child
+
+def _CT_Presentation_remove_sldSz(obj):
+    'Remove all ``<p:sldSz>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/presentationml/2006/main}sldSz'):
+        obj.remove(child)
+
+
+members['pptx.oxml.presentation.CT_Presentation'] = (
+    ('set', 'sldMasterIdLst', property(_CT_Presentation_sldMasterIdLst, None, None)),
+    ('add', '_new_sldMasterIdLst', _CT_Presentation_new_sldMasterIdLst),
+    ('add', '_insert_sldMasterIdLst', _CT_Presentation_insert_sldMasterIdLst),
+    ('add', '_add_sldMasterIdLst', _CT_Presentation_add_sldMasterIdLst),
+    ('add', 'get_or_add_sldMasterIdLst', _CT_Presentation_get_or_add_sldMasterIdLst),
+    ('add', '_remove_sldMasterIdLst', _CT_Presentation_remove_sldMasterIdLst),
+    ('set', 'sldIdLst', property(_CT_Presentation_sldIdLst, None, None)),
+    ('add', '_new_sldIdLst', _CT_Presentation_new_sldIdLst),
+    ('add', '_insert_sldIdLst', _CT_Presentation_insert_sldIdLst),
+    ('add', '_add_sldIdLst', _CT_Presentation_add_sldIdLst),
+    ('add', 'get_or_add_sldIdLst', _CT_Presentation_get_or_add_sldIdLst),
+    ('add', '_remove_sldIdLst', _CT_Presentation_remove_sldIdLst),
+    ('set', 'sldSz', property(_CT_Presentation_sldSz, None, None)),
+    ('add', '_new_sldSz', _CT_Presentation_new_sldSz),
+    ('add', '_insert_sldSz', _CT_Presentation_insert_sldSz),
+    ('add', '_add_sldSz', _CT_Presentation_add_sldSz),
+    ('add', 'get_or_add_sldSz', _CT_Presentation_get_or_add_sldSz),
+    ('add', '_remove_sldSz', _CT_Presentation_remove_sldSz),
+)
+
+
+# pptx.oxml.presentation.CT_SlideId -----------------------------------------
+
+def _CT_SlideId_id_get(obj):
+    'ST_SlideId type-converted value of ``id`` attribute.'
+    attr_str_value = obj.get('id')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'id' attribute not present on element %s" % obj.tag
+        )
+    return ST_SlideId.from_xml(attr_str_value)
+
+def _CT_SlideId_id_set(obj, value):
+    str_value = ST_SlideId.to_xml(value)
+    obj.set('id', str_value)
+
+def _CT_SlideId_rId_get(obj):
+    'XsdString type-converted value of ``r:id`` attribute.'
+    attr_str_value = obj.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'r:id' attribute not present on element %s" % obj.tag
+        )
+    return XsdString.from_xml(attr_str_value)
+
+def _CT_SlideId_rId_set(obj, value):
+    str_value = XsdString.to_xml(value)
+    obj.set('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id', str_value)
+
+
+members['pptx.oxml.presentation.CT_SlideId'] = (
+    ('set', 'id', property(_CT_SlideId_id_get, _CT_SlideId_id_set, None)),
+    ('set', 'rId', property(_CT_SlideId_rId_get, _CT_SlideId_rId_set, None)),
+)
+
+
+# pptx.oxml.presentation.CT_SlideIdList -------------------------------------
+
+def _CT_SlideIdList_sldId_lst(obj):
+    'A list containing each of the ``<p:sldId>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/presentationml/2006/main}sldId')
+
+def _CT_SlideIdList_new_sldId(obj):
+    'Return a "loose", newly created ``<p:sldId>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/presentationml/2006/main}sldId', nsmap=_nsmap_p)
+
+def _CT_SlideIdList_insert_sldId(obj, child):
+    'Return the passed ``<p:sldId>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_SlideIdList_add_sldId(obj, **attrs):
+    'Add a new ``<p:sldId>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_sldId()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_sldId(child)
+    return child
+
+
+members['pptx.oxml.presentation.CT_SlideIdList'] = (
+    ('set', 'sldId_lst', property(_CT_SlideIdList_sldId_lst, None, None)),
+    ('add', '_new_sldId', _CT_SlideIdList_new_sldId),
+    ('add', '_insert_sldId', _CT_SlideIdList_insert_sldId),
+    ('add', '_add_sldId', _CT_SlideIdList_add_sldId),
+    ('del', 'sldId'),
+)
+
+
+# pptx.oxml.presentation.CT_SlideMasterIdList -------------------------------
+
+def _CT_SlideMasterIdList_sldMasterId_lst(obj):
+    'A list containing each of the ``<p:sldMasterId>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/presentationml/2006/main}sldMasterId')
+
+def _CT_SlideMasterIdList_new_sldMasterId(obj):
+    'Return a "loose", newly created ``<p:sldMasterId>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/presentationml/2006/main}sldMasterId', nsmap=_nsmap_p)
+
+def _CT_SlideMasterIdList_insert_sldMasterId(obj, child):
+    'Return the passed ``<p:sldMasterId>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_SlideMasterIdList_add_sldMasterId(obj, **attrs):
+    'Add a new ``<p:sldMasterId>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_sldMasterId()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_sldMasterId(child)
+    return child
+
+
+members['pptx.oxml.presentation.CT_SlideMasterIdList'] = (
+    ('set', 'sldMasterId_lst', property(_CT_SlideMasterIdList_sldMasterId_lst, None, None)),
+    ('add', '_new_sldMasterId', _CT_SlideMasterIdList_new_sldMasterId),
+    ('add', '_insert_sldMasterId', _CT_SlideMasterIdList_insert_sldMasterId),
+    ('add', '_add_sldMasterId', _CT_SlideMasterIdList_add_sldMasterId),
+    ('del', 'sldMasterId'),
+)
+
+
+# pptx.oxml.presentation.CT_SlideMasterIdListEntry --------------------------
+
+def _CT_SlideMasterIdListEntry_rId_get(obj):
+    'XsdString type-converted value of ``r:id`` attribute.'
+    attr_str_value = obj.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'r:id' attribute not present on element %s" % obj.tag
+        )
+    return XsdString.from_xml(attr_str_value)
+
+def _CT_SlideMasterIdListEntry_rId_set(obj, value):
+    str_value = XsdString.to_xml(value)
+    obj.set('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id', str_value)
+
+
+members['pptx.oxml.presentation.CT_SlideMasterIdListEntry'] = (
+    ('set', 'rId', property(_CT_SlideMasterIdListEntry_rId_get, _CT_SlideMasterIdListEntry_rId_set, None)),
+)
+
+
+# pptx.oxml.presentation.CT_SlideSize ---------------------------------------
+
+def _CT_SlideSize_cx_get(obj):
+    'ST_SlideSizeCoordinate type-converted value of ``cx`` attribute.'
+    attr_str_value = obj.get('cx')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'cx' attribute not present on element %s" % obj.tag
+        )
+    return ST_SlideSizeCoordinate.from_xml(attr_str_value)
+
+def _CT_SlideSize_cx_set(obj, value):
+    str_value = ST_SlideSizeCoordinate.to_xml(value)
+    obj.set('cx', str_value)
+
+def _CT_SlideSize_cy_get(obj):
+    'ST_SlideSizeCoordinate type-converted value of ``cy`` attribute.'
+    attr_str_value = obj.get('cy')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'cy' attribute not present on element %s" % obj.tag
+        )
+    return ST_SlideSizeCoordinate.from_xml(attr_str_value)
+
+def _CT_SlideSize_cy_set(obj, value):
+    str_value = ST_SlideSizeCoordinate.to_xml(value)
+    obj.set('cy', str_value)
+
+
+members['pptx.oxml.presentation.CT_SlideSize'] = (
+    ('set', 'cx', property(_CT_SlideSize_cx_get, _CT_SlideSize_cx_set, None)),
+    ('set', 'cy', property(_CT_SlideSize_cy_get, _CT_SlideSize_cy_set, None)),
+)
+
+
+# pptx.oxml.shapes.autoshape.CT_AdjPoint2D ----------------------------------
+
+def _CT_AdjPoint2D_x_get(obj):
+    'ST_Coordinate type-converted value of ``x`` attribute.'
+    attr_str_value = obj.get('x')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'x' attribute not present on element %s" % obj.tag
+        )
+    return ST_Coordinate.from_xml(attr_str_value)
+
+def _CT_AdjPoint2D_x_set(obj, value):
+    str_value = ST_Coordinate.to_xml(value)
+    obj.set('x', str_value)
+
+def _CT_AdjPoint2D_y_get(obj):
+    'ST_Coordinate type-converted value of ``y`` attribute.'
+    attr_str_value = obj.get('y')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'y' attribute not present on element %s" % obj.tag
+        )
+    return ST_Coordinate.from_xml(attr_str_value)
+
+def _CT_AdjPoint2D_y_set(obj, value):
+    str_value = ST_Coordinate.to_xml(value)
+    obj.set('y', str_value)
+
+
+members['pptx.oxml.shapes.autoshape.CT_AdjPoint2D'] = (
+    ('set', 'x', property(_CT_AdjPoint2D_x_get, _CT_AdjPoint2D_x_set, None)),
+    ('set', 'y', property(_CT_AdjPoint2D_y_get, _CT_AdjPoint2D_y_set, None)),
+)
+
+
+# pptx.oxml.shapes.autoshape.CT_CustomGeometry2D ----------------------------
+
+def _CT_CustomGeometry2D_pathLst(obj):
+    '``<a:pathLst>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}pathLst')
+
+def _CT_CustomGeometry2D_new_pathLst(obj):
+    'Return a "loose", newly created ``<a:pathLst>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}pathLst', nsmap=_nsmap_a)
+
+def _CT_CustomGeometry2D_insert_pathLst(obj, child):
+    'Return the passed ``<a:pathLst>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_CustomGeometry2D_add_pathLst(obj, **attrs):
+    'Add a new ``<a:pathLst>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_pathLst()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_pathLst(child)
+    return child
+
+def _CT_CustomGeometry2D_get_or_add_pathLst(obj):
+    'Return the ``<a:pathLst>`` child element, newly added if not present.'
+    child = obj.pathLst
+    if child is None:
+        child = obj._add_pathLst()
+    return child
+
+def _CT_CustomGeometry2D_remove_pathLst(obj):
+    'Remove all ``<a:pathLst>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}pathLst'):
+        obj.remove(child)
+
+
+members['pptx.oxml.shapes.autoshape.CT_CustomGeometry2D'] = (
+    ('set', 'pathLst', property(_CT_CustomGeometry2D_pathLst, None, None)),
+    ('add', '_new_pathLst', _CT_CustomGeometry2D_new_pathLst),
+    ('add', '_insert_pathLst', _CT_CustomGeometry2D_insert_pathLst),
+    ('add', '_add_pathLst', _CT_CustomGeometry2D_add_pathLst),
+    ('add', 'get_or_add_pathLst', _CT_CustomGeometry2D_get_or_add_pathLst),
+    ('add', '_remove_pathLst', _CT_CustomGeometry2D_remove_pathLst),
+)
+
+
+# pptx.oxml.shapes.autoshape.CT_GeomGuide -----------------------------------
+
+def _CT_GeomGuide_name_get(obj):
+    'XsdString type-converted value of ``name`` attribute.'
+    attr_str_value = obj.get('name')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'name' attribute not present on element %s" % obj.tag
+        )
+    return XsdString.from_xml(attr_str_value)
+
+def _CT_GeomGuide_name_set(obj, value):
+    str_value = XsdString.to_xml(value)
+    obj.set('name', str_value)
+
+def _CT_GeomGuide_fmla_get(obj):
+    'XsdString type-converted value of ``fmla`` attribute.'
+    attr_str_value = obj.get('fmla')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'fmla' attribute not present on element %s" % obj.tag
+        )
+    return XsdString.from_xml(attr_str_value)
+
+def _CT_GeomGuide_fmla_set(obj, value):
+    str_value = XsdString.to_xml(value)
+    obj.set('fmla', str_value)
+
+
+members['pptx.oxml.shapes.autoshape.CT_GeomGuide'] = (
+    ('set', 'name', property(_CT_GeomGuide_name_get, _CT_GeomGuide_name_set, None)),
+    ('set', 'fmla', property(_CT_GeomGuide_fmla_get, _CT_GeomGuide_fmla_set, None)),
+)
+
+
+# pptx.oxml.shapes.autoshape.CT_GeomGuideList -------------------------------
+
+def _CT_GeomGuideList_gd_lst(obj):
+    'A list containing each of the ``<a:gd>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}gd')
+
+def _CT_GeomGuideList_new_gd(obj):
+    'Return a "loose", newly created ``<a:gd>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}gd', nsmap=_nsmap_a)
+
+def _CT_GeomGuideList_insert_gd(obj, child):
+    'Return the passed ``<a:gd>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_GeomGuideList_add_gd(obj, **attrs):
+    'Add a new ``<a:gd>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_gd()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_gd(child)
+    return child
+
+
+members['pptx.oxml.shapes.autoshape.CT_GeomGuideList'] = (
+    ('set', 'gd_lst', property(_CT_GeomGuideList_gd_lst, None, None)),
+    ('add', '_new_gd', _CT_GeomGuideList_new_gd),
+    ('add', '_insert_gd', _CT_GeomGuideList_insert_gd),
+    ('add', '_add_gd', _CT_GeomGuideList_add_gd),
+    ('del', 'gd'),
+)
+
+
+# pptx.oxml.shapes.autoshape.CT_NonVisualDrawingShapeProps ------------------
+
+def _CT_NonVisualDrawingShapeProps_spLocks(obj):
+    '``<a:spLocks>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}spLocks')
+
+def _CT_NonVisualDrawingShapeProps_new_spLocks(obj):
+    'Return a "loose", newly created ``<a:spLocks>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}spLocks', nsmap=_nsmap_a)
+
+def _CT_NonVisualDrawingShapeProps_insert_spLocks(obj, child):
+    'Return the passed ``<a:spLocks>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_NonVisualDrawingShapeProps_add_spLocks(obj, **attrs):
+    'Add a new ``<a:spLocks>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_spLocks()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_spLocks(child)
+    return child
+
+def _CT_NonVisualDrawingShapeProps_get_or_add_spLocks(obj):
+    'Return the ``<a:spLocks>`` child element, newly added if not present.'
+    child = obj.spLocks
+    if child is None:
+        child = obj._add_spLocks()
+    return child
+
+def _CT_NonVisualDrawingShapeProps_remove_spLocks(obj):
+    'Remove all ``<a:spLocks>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}spLocks'):
+        obj.remove(child)
+
+def _CT_NonVisualDrawingShapeProps_txBox_get(obj):
+    'XsdBoolean type-converted value of ``txBox`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('txBox')
+    if attr_str_value is None:
+        return None
+    return XsdBoolean.from_xml(attr_str_value)
+
+def _CT_NonVisualDrawingShapeProps_txBox_set(obj, value):
+    if value == None:
+        if 'txBox' in obj.attrib:
+            del obj.attrib['txBox']
+        return
+    str_value = XsdBoolean.to_xml(value)
+    obj.set('txBox', str_value)
+
+
+members['pptx.oxml.shapes.autoshape.CT_NonVisualDrawingShapeProps'] = (
+    ('set', 'spLocks', property(_CT_NonVisualDrawingShapeProps_spLocks, None, None)),
+    ('add', '_new_spLocks', _CT_NonVisualDrawingShapeProps_new_spLocks),
+    ('add', '_insert_spLocks', _CT_NonVisualDrawingShapeProps_insert_spLocks),
+    ('add', '_add_spLocks', _CT_NonVisualDrawingShapeProps_add_spLocks),
+    ('add', 'get_or_add_spLocks', _CT_NonVisualDrawingShapeProps_get_or_add_spLocks),
+    ('add', '_remove_spLocks', _CT_NonVisualDrawingShapeProps_remove_spLocks),
+    ('set', 'txBox', property(_CT_NonVisualDrawingShapeProps_txBox_get, _CT_NonVisualDrawingShapeProps_txBox_set, None)),
+)
+
+
+# pptx.oxml.shapes.autoshape.CT_Path2D --------------------------------------
+
+def _CT_Path2D_close_lst(obj):
+    'A list containing each of the ``<a:close>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}close')
+
+def _CT_Path2D_new_close(obj):
+    'Return a "loose", newly created ``<a:close>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}close', nsmap=_nsmap_a)
+
+def _CT_Path2D_insert_close(obj, child):
+    'Return the passed ``<a:close>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Path2D_add_close(obj, **attrs):
+    'Add a new ``<a:close>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_close()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_close(child)
+    return child
+
+def _CT_Path2D_lnTo_lst(obj):
+    'A list containing each of the ``<a:lnTo>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}lnTo')
+
+def _CT_Path2D_new_lnTo(obj):
+    'Return a "loose", newly created ``<a:lnTo>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}lnTo', nsmap=_nsmap_a)
+
+def _CT_Path2D_insert_lnTo(obj, child):
+    'Return the passed ``<a:lnTo>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Path2D_add_lnTo(obj, **attrs):
+    'Add a new ``<a:lnTo>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_lnTo()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_lnTo(child)
+    return child
+
+def _CT_Path2D_moveTo_lst(obj):
+    'A list containing each of the ``<a:moveTo>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}moveTo')
+
+def _CT_Path2D_new_moveTo(obj):
+    'Return a "loose", newly created ``<a:moveTo>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}moveTo', nsmap=_nsmap_a)
+
+def _CT_Path2D_insert_moveTo(obj, child):
+    'Return the passed ``<a:moveTo>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Path2D_add_moveTo(obj, **attrs):
+    'Add a new ``<a:moveTo>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_moveTo()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_moveTo(child)
+    return child
+
+def _CT_Path2D_w_get(obj):
+    'ST_PositiveCoordinate type-converted value of ``w`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('w')
+    if attr_str_value is None:
+        return None
+    return ST_PositiveCoordinate.from_xml(attr_str_value)
+
+def _CT_Path2D_w_set(obj, value):
+    if value == None:
+        if 'w' in obj.attrib:
+            del obj.attrib['w']
+        return
+    str_value = ST_PositiveCoordinate.to_xml(value)
+    obj.set('w', str_value)
+
+def _CT_Path2D_h_get(obj):
+    'ST_PositiveCoordinate type-converted value of ``h`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('h')
+    if attr_str_value is None:
+        return None
+    return ST_PositiveCoordinate.from_xml(attr_str_value)
+
+def _CT_Path2D_h_set(obj, value):
+    if value == None:
+        if 'h' in obj.attrib:
+            del obj.attrib['h']
+        return
+    str_value = ST_PositiveCoordinate.to_xml(value)
+    obj.set('h', str_value)
+
+
+members['pptx.oxml.shapes.autoshape.CT_Path2D'] = (
+    ('set', 'close_lst', property(_CT_Path2D_close_lst, None, None)),
+    ('add', '_new_close', _CT_Path2D_new_close),
+    ('add', '_insert_close', _CT_Path2D_insert_close),
+    ('add', '_add_close', _CT_Path2D_add_close),
+    ('del', 'close'),
+    ('set', 'lnTo_lst', property(_CT_Path2D_lnTo_lst, None, None)),
+    ('add', '_new_lnTo', _CT_Path2D_new_lnTo),
+    ('add', '_insert_lnTo', _CT_Path2D_insert_lnTo),
+    ('add', '_add_lnTo', _CT_Path2D_add_lnTo),
+    ('del', 'lnTo'),
+    ('set', 'moveTo_lst', property(_CT_Path2D_moveTo_lst, None, None)),
+    ('add', '_new_moveTo', _CT_Path2D_new_moveTo),
+    ('add', '_insert_moveTo', _CT_Path2D_insert_moveTo),
+    ('add', '_add_moveTo', _CT_Path2D_add_moveTo),
+    ('del', 'moveTo'),
+    ('set', 'w', property(_CT_Path2D_w_get, _CT_Path2D_w_set, None)),
+    ('set', 'h', property(_CT_Path2D_h_get, _CT_Path2D_h_set, None)),
+)
+
+
+# pptx.oxml.shapes.autoshape.CT_Path2DLineTo --------------------------------
+
+def _CT_Path2DLineTo_pt(obj):
+    '``<a:pt>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}pt')
+
+def _CT_Path2DLineTo_new_pt(obj):
+    'Return a "loose", newly created ``<a:pt>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}pt', nsmap=_nsmap_a)
+
+def _CT_Path2DLineTo_insert_pt(obj, child):
+    'Return the passed ``<a:pt>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Path2DLineTo_add_pt(obj, **attrs):
+    'Add a new ``<a:pt>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_pt()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_pt(child)
+    return child
+
+def _CT_Path2DLineTo_get_or_add_pt(obj):
+    'Return the ``<a:pt>`` child element, newly added if not present.'
+    child = obj.pt
+    if child is None:
+        child = obj._add_pt()
+    return child
+
+def _CT_Path2DLineTo_remove_pt(obj):
+    'Remove all ``<a:pt>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}pt'):
+        obj.remove(child)
+
+
+members['pptx.oxml.shapes.autoshape.CT_Path2DLineTo'] = (
+    ('set', 'pt', property(_CT_Path2DLineTo_pt, None, None)),
+    ('add', '_new_pt', _CT_Path2DLineTo_new_pt),
+    ('add', '_insert_pt', _CT_Path2DLineTo_insert_pt),
+    ('add', '_add_pt', _CT_Path2DLineTo_add_pt),
+    ('add', 'get_or_add_pt', _CT_Path2DLineTo_get_or_add_pt),
+    ('add', '_remove_pt', _CT_Path2DLineTo_remove_pt),
+)
+
+
+# pptx.oxml.shapes.autoshape.CT_Path2DList ----------------------------------
+
+def _CT_Path2DList_path_lst(obj):
+    'A list containing each of the ``<a:path>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}path')
+
+def _CT_Path2DList_new_path(obj):
+    'Return a "loose", newly created ``<a:path>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}path', nsmap=_nsmap_a)
+
+def _CT_Path2DList_insert_path(obj, child):
+    'Return the passed ``<a:path>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Path2DList_add_path(obj, **attrs):
+    'Add a new ``<a:path>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_path()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_path(child)
+    return child
+
+
+members['pptx.oxml.shapes.autoshape.CT_Path2DList'] = (
+    ('set', 'path_lst', property(_CT_Path2DList_path_lst, None, None)),
+    ('add', '_new_path', _CT_Path2DList_new_path),
+    ('add', '_insert_path', _CT_Path2DList_insert_path),
+    ('add', '_add_path', _CT_Path2DList_add_path),
+    ('del', 'path'),
+)
+
+
+# pptx.oxml.shapes.autoshape.CT_Path2DMoveTo --------------------------------
+
+def _CT_Path2DMoveTo_pt(obj):
+    '``<a:pt>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}pt')
+
+def _CT_Path2DMoveTo_new_pt(obj):
+    'Return a "loose", newly created ``<a:pt>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}pt', nsmap=_nsmap_a)
+
+def _CT_Path2DMoveTo_insert_pt(obj, child):
+    'Return the passed ``<a:pt>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Path2DMoveTo_add_pt(obj, **attrs):
+    'Add a new ``<a:pt>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_pt()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_pt(child)
+    return child
+
+def _CT_Path2DMoveTo_get_or_add_pt(obj):
+    'Return the ``<a:pt>`` child element, newly added if not present.'
+    child = obj.pt
+    if child is None:
+        child = obj._add_pt()
+    return child
+
+def _CT_Path2DMoveTo_remove_pt(obj):
+    'Remove all ``<a:pt>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}pt'):
+        obj.remove(child)
+
+
+members['pptx.oxml.shapes.autoshape.CT_Path2DMoveTo'] = (
+    ('set', 'pt', property(_CT_Path2DMoveTo_pt, None, None)),
+    ('add', '_new_pt', _CT_Path2DMoveTo_new_pt),
+    ('add', '_insert_pt', _CT_Path2DMoveTo_insert_pt),
+    ('add', '_add_pt', _CT_Path2DMoveTo_add_pt),
+    ('add', 'get_or_add_pt', _CT_Path2DMoveTo_get_or_add_pt),
+    ('add', '_remove_pt', _CT_Path2DMoveTo_remove_pt),
+)
+
+
+# pptx.oxml.shapes.autoshape.CT_PresetGeometry2D ----------------------------
+
+def _CT_PresetGeometry2D_avLst(obj):
+    '``<a:avLst>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}avLst')
+
+def _CT_PresetGeometry2D_new_avLst(obj):
+    'Return a "loose", newly created ``<a:avLst>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}avLst', nsmap=_nsmap_a)
+
+def _CT_PresetGeometry2D_insert_avLst(obj, child):
+    'Return the passed ``<a:avLst>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_PresetGeometry2D_add_avLst(obj, **attrs):
+    'Add a new ``<a:avLst>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_avLst()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_avLst(child)
+    return child
+
+def _CT_PresetGeometry2D_get_or_add_avLst(obj):
+    'Return the ``<a:avLst>`` child element, newly added if not present.'
+    child = obj.avLst
+    if child is None:
+        child = obj._add_avLst()
+    return child
+
+def _CT_PresetGeometry2D_remove_avLst(obj):
+    'Remove all ``<a:avLst>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}avLst'):
+        obj.remove(child)
+
+def _CT_PresetGeometry2D_prst_get(obj):
+    'MSO_AUTO_SHAPE_TYPE type-converted value of ``prst`` attribute.'
+    attr_str_value = obj.get('prst')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'prst' attribute not present on element %s" % obj.tag
+        )
+    return MSO_AUTO_SHAPE_TYPE.from_xml(attr_str_value)
+
+def _CT_PresetGeometry2D_prst_set(obj, value):
+    str_value = MSO_AUTO_SHAPE_TYPE.to_xml(value)
+    obj.set('prst', str_value)
+
+
+members['pptx.oxml.shapes.autoshape.CT_PresetGeometry2D'] = (
+    ('set', 'avLst', property(_CT_PresetGeometry2D_avLst, None, None)),
+    ('add', '_new_avLst', _CT_PresetGeometry2D_new_avLst),
+    ('add', '_insert_avLst', _CT_PresetGeometry2D_insert_avLst),
+    ('add', '_add_avLst', _CT_PresetGeometry2D_add_avLst),
+    ('add', 'get_or_add_avLst', _CT_PresetGeometry2D_get_or_add_avLst),
+    ('add', '_remove_avLst', _CT_PresetGeometry2D_remove_avLst),
+    ('set', 'prst', property(_CT_PresetGeometry2D_prst_get, _CT_PresetGeometry2D_prst_set, None)),
+)
+
+
+# pptx.oxml.shapes.autoshape.CT_Shape ---------------------------------------
+
+def _CT_Shape_nvSpPr(obj):
+    'Required ``<p:nvSpPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}nvSpPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:nvSpPr>`` child element not present'
+        )
+    return child
+
+def _CT_Shape_spPr(obj):
+    'Required ``<p:spPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}spPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:spPr>`` child element not present'
+        )
+    return child
+
+def _CT_Shape_txBody(obj):
+    '``<p:txBody>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}txBody')
+
+def _CT_Shape_new_txBody(obj):
+    'Return a "loose", newly created ``<p:txBody>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/presentationml/2006/main}txBody', nsmap=_nsmap_p)
+
+def _CT_Shape_insert_txBody(obj, child):
+    'Return the passed ``<p:txBody>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/presentationml/2006/main}extLst',))
+    return child
+
+def _CT_Shape_add_txBody(obj, **attrs):
+    'Add a new ``<p:txBody>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_txBody()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_txBody(child)
+    return child
+
+def _CT_Shape_get_or_add_txBody(obj):
+    'Return the ``<p:txBody>`` child element, newly added if not present.'
+    child = obj.txBody
+    if child is None:
+        child = obj._add_txBody()
+    return child
+
+def _CT_Shape_remove_txBody(obj):
+    'Remove all ``<p:txBody>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/presentationml/2006/main}txBody'):
+        obj.remove(child)
+
+
+members['pptx.oxml.shapes.autoshape.CT_Shape'] = (
+    ('set', 'nvSpPr', property(_CT_Shape_nvSpPr, None, None)),
+    ('set', 'spPr', property(_CT_Shape_spPr, None, None)),
+    ('set', 'txBody', property(_CT_Shape_txBody, None, None)),
+    ('add', '_new_txBody', _CT_Shape_new_txBody),
+    ('add', '_insert_txBody', _CT_Shape_insert_txBody),
+    ('add', '_add_txBody', _CT_Shape_add_txBody),
+    ('add', 'get_or_add_txBody', _CT_Shape_get_or_add_txBody),
+    ('add', '_remove_txBody', _CT_Shape_remove_txBody),
+)
+
+
+# pptx.oxml.shapes.autoshape.CT_ShapeNonVisual ------------------------------
+
+def _CT_ShapeNonVisual_cNvPr(obj):
+    'Required ``<p:cNvPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}cNvPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:cNvPr>`` child element not present'
+        )
+    return child
+
+def _CT_ShapeNonVisual_cNvSpPr(obj):
+    'Required ``<p:cNvSpPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}cNvSpPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:cNvSpPr>`` child element not present'
+        )
+    return child
+
+def _CT_ShapeNonVisual_nvPr(obj):
+    'Required ``<p:nvPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}nvPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:nvPr>`` child element not present'
+        )
+    return child
+
+
+members['pptx.oxml.shapes.autoshape.CT_ShapeNonVisual'] = (
+    ('set', 'cNvPr', property(_CT_ShapeNonVisual_cNvPr, None, None)),
+    ('set', 'cNvSpPr', property(_CT_ShapeNonVisual_cNvSpPr, None, None)),
+    ('set', 'nvPr', property(_CT_ShapeNonVisual_nvPr, None, None)),
+)
+
+
+# pptx.oxml.shapes.connector.CT_Connection ----------------------------------
+
+def _CT_Connection_id_get(obj):
+    'ST_DrawingElementId type-converted value of ``id`` attribute.'
+    attr_str_value = obj.get('id')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'id' attribute not present on element %s" % obj.tag
+        )
+    return ST_DrawingElementId.from_xml(attr_str_value)
+
+def _CT_Connection_id_set(obj, value):
+    str_value = ST_DrawingElementId.to_xml(value)
+    obj.set('id', str_value)
+
+def _CT_Connection_idx_get(obj):
+    'XsdUnsignedInt type-converted value of ``idx`` attribute.'
+    attr_str_value = obj.get('idx')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'idx' attribute not present on element %s" % obj.tag
+        )
+    return XsdUnsignedInt.from_xml(attr_str_value)
+
+def _CT_Connection_idx_set(obj, value):
+    str_value = XsdUnsignedInt.to_xml(value)
+    obj.set('idx', str_value)
+
+
+members['pptx.oxml.shapes.connector.CT_Connection'] = (
+    ('set', 'id', property(_CT_Connection_id_get, _CT_Connection_id_set, None)),
+    ('set', 'idx', property(_CT_Connection_idx_get, _CT_Connection_idx_set, None)),
+)
+
+
+# pptx.oxml.shapes.connector.CT_Connector -----------------------------------
+
+def _CT_Connector_nvCxnSpPr(obj):
+    'Required ``<p:nvCxnSpPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}nvCxnSpPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:nvCxnSpPr>`` child element not present'
+        )
+    return child
+
+def _CT_Connector_spPr(obj):
+    'Required ``<p:spPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}spPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:spPr>`` child element not present'
+        )
+    return child
+
+
+members['pptx.oxml.shapes.connector.CT_Connector'] = (
+    ('set', 'nvCxnSpPr', property(_CT_Connector_nvCxnSpPr, None, None)),
+    ('set', 'spPr', property(_CT_Connector_spPr, None, None)),
+)
+
+
+# pptx.oxml.shapes.connector.CT_ConnectorNonVisual --------------------------
+
+def _CT_ConnectorNonVisual_cNvPr(obj):
+    'Required ``<p:cNvPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}cNvPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:cNvPr>`` child element not present'
+        )
+    return child
+
+def _CT_ConnectorNonVisual_cNvCxnSpPr(obj):
+    'Required ``<p:cNvCxnSpPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}cNvCxnSpPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:cNvCxnSpPr>`` child element not present'
+        )
+    return child
+
+def _CT_ConnectorNonVisual_nvPr(obj):
+    'Required ``<p:nvPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}nvPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:nvPr>`` child element not present'
+        )
+    return child
+
+
+members['pptx.oxml.shapes.connector.CT_ConnectorNonVisual'] = (
+    ('set', 'cNvPr', property(_CT_ConnectorNonVisual_cNvPr, None, None)),
+    ('set', 'cNvCxnSpPr', property(_CT_ConnectorNonVisual_cNvCxnSpPr, None, None)),
+    ('set', 'nvPr', property(_CT_ConnectorNonVisual_nvPr, None, None)),
+)
+
+
+# pptx.oxml.shapes.connector.CT_NonVisualConnectorProperties ----------------
+
+def _CT_NonVisualConnectorProperties_stCxn(obj):
+    '``<a:stCxn>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}stCxn')
+
+def _CT_NonVisualConnectorProperties_new_stCxn(obj):
+    'Return a "loose", newly created ``<a:stCxn>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}stCxn', nsmap=_nsmap_a)
+
+def _CT_NonVisualConnectorProperties_insert_stCxn(obj, child):
+    'Return the passed ``<a:stCxn>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}endCxn', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_NonVisualConnectorProperties_add_stCxn(obj, **attrs):
+    'Add a new ``<a:stCxn>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_stCxn()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_stCxn(child)
+    return child
+
+def _CT_NonVisualConnectorProperties_get_or_add_stCxn(obj):
+    'Return the ``<a:stCxn>`` child element, newly added if not present.'
+    child = obj.stCxn
+    if child is None:
+        child = obj._add_stCxn()
+    return child
+
+def _CT_NonVisualConnectorProperties_remove_stCxn(obj):
+    'Remove all ``<a:stCxn>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}stCxn'):
+        obj.remove(child)
+
+def _CT_NonVisualConnectorProperties_endCxn(obj):
+    '``<a:endCxn>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}endCxn')
+
+def _CT_NonVisualConnectorProperties_new_endCxn(obj):
+    'Return a "loose", newly created ``<a:endCxn>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}endCxn', nsmap=_nsmap_a)
+
+def _CT_NonVisualConnectorProperties_insert_endCxn(obj, child):
+    'Return the passed ``<a:endCxn>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}extLst',))
+    return child
+
+def _CT_NonVisualConnectorProperties_add_endCxn(obj, **attrs):
+    'Add a new ``<a:endCxn>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_endCxn()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_endCxn(child)
+    return child
+
+def _CT_NonVisualConnectorProperties_get_or_add_endCxn(obj):
+    'Return the ``<a:endCxn>`` child element, newly added if not present.'
+    child = obj.endCxn
+    if child is None:
+        child = obj._add_endCxn()
+    return child
+
+def _CT_NonVisualConnectorProperties_remove_endCxn(obj):
+    'Remove all ``<a:endCxn>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}endCxn'):
+        obj.remove(child)
+
+
+members['pptx.oxml.shapes.connector.CT_NonVisualConnectorProperties'] = (
+    ('set', 'stCxn', property(_CT_NonVisualConnectorProperties_stCxn, None, None)),
+    ('add', '_new_stCxn', _CT_NonVisualConnectorProperties_new_stCxn),
+    ('add', '_insert_stCxn', _CT_NonVisualConnectorProperties_insert_stCxn),
+    ('add', '_add_stCxn', _CT_NonVisualConnectorProperties_add_stCxn),
+    ('add', 'get_or_add_stCxn', _CT_NonVisualConnectorProperties_get_or_add_stCxn),
+    ('add', '_remove_stCxn', _CT_NonVisualConnectorProperties_remove_stCxn),
+    ('set', 'endCxn', property(_CT_NonVisualConnectorProperties_endCxn, None, None)),
+    ('add', '_new_endCxn', _CT_NonVisualConnectorProperties_new_endCxn),
+    ('add', '_insert_endCxn', _CT_NonVisualConnectorProperties_insert_endCxn),
+    ('add', '_add_endCxn', _CT_NonVisualConnectorProperties_add_endCxn),
+    ('add', 'get_or_add_endCxn', _CT_NonVisualConnectorProperties_get_or_add_endCxn),
+    ('add', '_remove_endCxn', _CT_NonVisualConnectorProperties_remove_endCxn),
+)
+
+
+# pptx.oxml.shapes.graphfrm.CT_GraphicalObject ------------------------------
+
+def _CT_GraphicalObject_graphicData(obj):
+    'Required ``<a:graphicData>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}graphicData')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<a:graphicData>`` child element not present'
+        )
+    return child
+
+
+members['pptx.oxml.shapes.graphfrm.CT_GraphicalObject'] = (
+    ('set', 'graphicData', property(_CT_GraphicalObject_graphicData, None, None)),
+)
+
+
+# pptx.oxml.shapes.graphfrm.CT_GraphicalObjectData --------------------------
+
+def _CT_GraphicalObjectData_chart(obj):
+    '``<c:chart>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/chart}chart')
+
+def _CT_GraphicalObjectData_new_chart(obj):
+    'Return a "loose", newly created ``<c:chart>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/chart}chart', nsmap=_nsmap_c)
+
+def _CT_GraphicalObjectData_insert_chart(obj, child):
+    'Return the passed ``<c:chart>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_GraphicalObjectData_add_chart(obj, **attrs):
+    'Add a new ``<c:chart>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_chart()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_chart(child)
+    return child
+
+def _CT_GraphicalObjectData_get_or_add_chart(obj):
+    'Return the ``<c:chart>`` child element, newly added if not present.'
+    child = obj.chart
+    if child is None:
+        child = obj._add_chart()
+    return child
+
+def _CT_GraphicalObjectData_remove_chart(obj):
+    'Remove all ``<c:chart>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/chart}chart'):
+        obj.remove(child)
+
+def _CT_GraphicalObjectData_tbl(obj):
+    '``<a:tbl>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}tbl')
+
+def _CT_GraphicalObjectData_new_tbl(obj):
+    'Return a "loose", newly created ``<a:tbl>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}tbl', nsmap=_nsmap_a)
+
+def _CT_GraphicalObjectData_insert_tbl(obj, child):
+    'Return the passed ``<a:tbl>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_GraphicalObjectData_add_tbl(obj, **attrs):
+    'Add a new ``<a:tbl>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_tbl()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_tbl(child)
+    return child
+
+def _CT_GraphicalObjectData_get_or_add_tbl(obj):
+    'Return the ``<a:tbl>`` child element, newly added if not present.'
+    child = obj.tbl
+    if child is None:
+        child = obj._add_tbl()
+    return child
+
+def _CT_GraphicalObjectData_remove_tbl(obj):
+    'Remove all ``<a:tbl>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}tbl'):
+        obj.remove(child)
+
+def _CT_GraphicalObjectData_uri_get(obj):
+    'XsdString type-converted value of ``uri`` attribute.'
+    attr_str_value = obj.get('uri')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'uri' attribute not present on element %s" % obj.tag
+        )
+    return XsdString.from_xml(attr_str_value)
+
+def _CT_GraphicalObjectData_uri_set(obj, value):
+    str_value = XsdString.to_xml(value)
+    obj.set('uri', str_value)
+
+
+members['pptx.oxml.shapes.graphfrm.CT_GraphicalObjectData'] = (
+    ('set', 'chart', property(_CT_GraphicalObjectData_chart, None, None)),
+    ('add', '_new_chart', _CT_GraphicalObjectData_new_chart),
+    ('add', '_insert_chart', _CT_GraphicalObjectData_insert_chart),
+    ('add', '_add_chart', _CT_GraphicalObjectData_add_chart),
+    ('add', 'get_or_add_chart', _CT_GraphicalObjectData_get_or_add_chart),
+    ('add', '_remove_chart', _CT_GraphicalObjectData_remove_chart),
+    ('set', 'tbl', property(_CT_GraphicalObjectData_tbl, None, None)),
+    ('add', '_new_tbl', _CT_GraphicalObjectData_new_tbl),
+    ('add', '_insert_tbl', _CT_GraphicalObjectData_insert_tbl),
+    ('add', '_add_tbl', _CT_GraphicalObjectData_add_tbl),
+    ('add', 'get_or_add_tbl', _CT_GraphicalObjectData_get_or_add_tbl),
+    ('add', '_remove_tbl', _CT_GraphicalObjectData_remove_tbl),
+    ('set', 'uri', property(_CT_GraphicalObjectData_uri_get, _CT_GraphicalObjectData_uri_set, None)),
+)
+
+
+# pptx.oxml.shapes.graphfrm.CT_GraphicalObjectFrame -------------------------
+
+def _CT_GraphicalObjectFrame_nvGraphicFramePr(obj):
+    'Required ``<p:nvGraphicFramePr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}nvGraphicFramePr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:nvGraphicFramePr>`` child element not present'
+        )
+    return child
+
+def _CT_GraphicalObjectFrame_xfrm(obj):
+    'Required ``<p:xfrm>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}xfrm')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:xfrm>`` child element not present'
+        )
+    return child
+
+def _CT_GraphicalObjectFrame_graphic(obj):
+    'Required ``<a:graphic>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}graphic')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<a:graphic>`` child element not present'
+        )
+    return child
+
+
+members['pptx.oxml.shapes.graphfrm.CT_GraphicalObjectFrame'] = (
+    ('set', 'nvGraphicFramePr', property(_CT_GraphicalObjectFrame_nvGraphicFramePr, None, None)),
+    ('set', 'xfrm', property(_CT_GraphicalObjectFrame_xfrm, None, None)),
+    ('set', 'graphic', property(_CT_GraphicalObjectFrame_graphic, None, None)),
+)
+
+
+# pptx.oxml.shapes.graphfrm.CT_GraphicalObjectFrameNonVisual ----------------
+
+def _CT_GraphicalObjectFrameNonVisual_cNvPr(obj):
+    'Required ``<p:cNvPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}cNvPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:cNvPr>`` child element not present'
+        )
+    return child
+
+def _CT_GraphicalObjectFrameNonVisual_nvPr(obj):
+    'Required ``<p:nvPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}nvPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:nvPr>`` child element not present'
+        )
+    return child
+
+
+members['pptx.oxml.shapes.graphfrm.CT_GraphicalObjectFrameNonVisual'] = (
+    ('set', 'cNvPr', property(_CT_GraphicalObjectFrameNonVisual_cNvPr, None, None)),
+    ('set', 'nvPr', property(_CT_GraphicalObjectFrameNonVisual_nvPr, None, None)),
+)
+
+
+# pptx.oxml.shapes.groupshape.CT_GroupShape ---------------------------------
+
+def _CT_GroupShape_nvGrpSpPr(obj):
+    'Required ``<p:nvGrpSpPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}nvGrpSpPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:nvGrpSpPr>`` child element not present'
+        )
+    return child
+
+def _CT_GroupShape_grpSpPr(obj):
+    'Required ``<p:grpSpPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}grpSpPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:grpSpPr>`` child element not present'
+        )
+    return child
+
+
+members['pptx.oxml.shapes.groupshape.CT_GroupShape'] = (
+    ('set', 'nvGrpSpPr', property(_CT_GroupShape_nvGrpSpPr, None, None)),
+    ('set', 'grpSpPr', property(_CT_GroupShape_grpSpPr, None, None)),
+)
+
+
+# pptx.oxml.shapes.groupshape.CT_GroupShapeNonVisual ------------------------
+
+def _CT_GroupShapeNonVisual_cNvPr(obj):
+    'Required ``<p:cNvPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}cNvPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:cNvPr>`` child element not present'
+        )
+    return child
+
+
+members['pptx.oxml.shapes.groupshape.CT_GroupShapeNonVisual'] = (
+    ('set', 'cNvPr', property(_CT_GroupShapeNonVisual_cNvPr, None, None)),
+)
+
+
+# pptx.oxml.shapes.groupshape.CT_GroupShapeProperties -----------------------
+
+def _CT_GroupShapeProperties_xfrm(obj):
+    '``<a:xfrm>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}xfrm')
+
+def _CT_GroupShapeProperties_new_xfrm(obj):
+    'Return a "loose", newly created ``<a:xfrm>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}xfrm', nsmap=_nsmap_a)
+
+def _CT_GroupShapeProperties_insert_xfrm(obj, child):
+    'Return the passed ``<a:xfrm>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}scene3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_GroupShapeProperties_add_xfrm(obj, **attrs):
+    'Add a new ``<a:xfrm>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_xfrm()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_xfrm(child)
+    return child
+
+def _CT_GroupShapeProperties_get_or_add_xfrm(obj):
+    'Return the ``<a:xfrm>`` child element, newly added if not present.'
+    child = obj.xfrm
+    if child is None:
+        child = obj._add_xfrm()
+    return child
+
+def _CT_GroupShapeProperties_remove_xfrm(obj):
+    'Remove all ``<a:xfrm>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}xfrm'):
+        obj.remove(child)
+
+def _CT_GroupShapeProperties_effectLst(obj):
+    '``<a:effectLst>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst')
+
+def _CT_GroupShapeProperties_new_effectLst(obj):
+    'Return a "loose", newly created ``<a:effectLst>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', nsmap=_nsmap_a)
+
+def _CT_GroupShapeProperties_insert_effectLst(obj, child):
+    'Return the passed ``<a:effectLst>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}scene3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_GroupShapeProperties_add_effectLst(obj, **attrs):
+    'Add a new ``<a:effectLst>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_effectLst()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_effectLst(child)
+    return child
+
+def _CT_GroupShapeProperties_get_or_add_effectLst(obj):
+    'Return the ``<a:effectLst>`` child element, newly added if not present.'
+    child = obj.effectLst
+    if child is None:
+        child = obj._add_effectLst()
+    return child
+
+def _CT_GroupShapeProperties_remove_effectLst(obj):
+    'Remove all ``<a:effectLst>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst'):
+        obj.remove(child)
+
+
+members['pptx.oxml.shapes.groupshape.CT_GroupShapeProperties'] = (
+    ('set', 'xfrm', property(_CT_GroupShapeProperties_xfrm, None, None)),
+    ('add', '_new_xfrm', _CT_GroupShapeProperties_new_xfrm),
+    ('add', '_insert_xfrm', _CT_GroupShapeProperties_insert_xfrm),
+    ('add', '_add_xfrm', _CT_GroupShapeProperties_add_xfrm),
+    ('add', 'get_or_add_xfrm', _CT_GroupShapeProperties_get_or_add_xfrm),
+    ('add', '_remove_xfrm', _CT_GroupShapeProperties_remove_xfrm),
+    ('set', 'effectLst', property(_CT_GroupShapeProperties_effectLst, None, None)),
+    ('add', '_new_effectLst', _CT_GroupShapeProperties_new_effectLst),
+    ('add', '_insert_effectLst', _CT_GroupShapeProperties_insert_effectLst),
+    ('add', '_add_effectLst', _CT_GroupShapeProperties_add_effectLst),
+    ('add', 'get_or_add_effectLst', _CT_GroupShapeProperties_get_or_add_effectLst),
+    ('add', '_remove_effectLst', _CT_GroupShapeProperties_remove_effectLst),
+)
+
+
+# pptx.oxml.shapes.picture.CT_Picture ---------------------------------------
+
+def _CT_Picture_nvPicPr(obj):
+    'Required ``<p:nvPicPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}nvPicPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:nvPicPr>`` child element not present'
+        )
+    return child
+
+def _CT_Picture_blipFill(obj):
+    'Required ``<p:blipFill>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}blipFill')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:blipFill>`` child element not present'
+        )
+    return child
+
+def _CT_Picture_spPr(obj):
+    'Required ``<p:spPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}spPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:spPr>`` child element not present'
+        )
+    return child
+
+
+members['pptx.oxml.shapes.picture.CT_Picture'] = (
+    ('set', 'nvPicPr', property(_CT_Picture_nvPicPr, None, None)),
+    ('set', 'blipFill', property(_CT_Picture_blipFill, None, None)),
+    ('set', 'spPr', property(_CT_Picture_spPr, None, None)),
+)
+
+
+# pptx.oxml.shapes.picture.CT_PictureNonVisual ------------------------------
+
+def _CT_PictureNonVisual_cNvPr(obj):
+    'Required ``<p:cNvPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}cNvPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:cNvPr>`` child element not present'
+        )
+    return child
+
+def _CT_PictureNonVisual_nvPr(obj):
+    'Required ``<p:nvPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}nvPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:nvPr>`` child element not present'
+        )
+    return child
+
+
+members['pptx.oxml.shapes.picture.CT_PictureNonVisual'] = (
+    ('set', 'cNvPr', property(_CT_PictureNonVisual_cNvPr, None, None)),
+    ('set', 'nvPr', property(_CT_PictureNonVisual_nvPr, None, None)),
+)
+
+
+# pptx.oxml.shapes.shared.CT_ApplicationNonVisualDrawingProps ---------------
+
+def _CT_ApplicationNonVisualDrawingProps_ph(obj):
+    '``<p:ph>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}ph')
+
+def _CT_ApplicationNonVisualDrawingProps_new_ph(obj):
+    'Return a "loose", newly created ``<p:ph>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/presentationml/2006/main}ph', nsmap=_nsmap_p)
+
+def _CT_ApplicationNonVisualDrawingProps_insert_ph(obj, child):
+    'Return the passed ``<p:ph>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}audioCd', '{http://schemas.openxmlformats.org/drawingml/2006/main}wavAudioFile', '{http://schemas.openxmlformats.org/drawingml/2006/main}audioFile', '{http://schemas.openxmlformats.org/drawingml/2006/main}videoFile', '{http://schemas.openxmlformats.org/drawingml/2006/main}quickTimeFile', '{http://schemas.openxmlformats.org/presentationml/2006/main}custDataLst', '{http://schemas.openxmlformats.org/presentationml/2006/main}extLst'))
+    return child
+
+def _CT_ApplicationNonVisualDrawingProps_add_ph(obj, **attrs):
+    'Add a new ``<p:ph>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_ph()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_ph(child)
+    return child
+
+def _CT_ApplicationNonVisualDrawingProps_get_or_add_ph(obj):
+    'Return the ``<p:ph>`` child element, newly added if not present.'
+    child = obj.ph
+    if child is None:
+        child = obj._add_ph()
+    return child
+
+def _CT_ApplicationNonVisualDrawingProps_remove_ph(obj):
+    'Remove all ``<p:ph>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/presentationml/2006/main}ph'):
+        obj.remove(child)
+
+
+members['pptx.oxml.shapes.shared.CT_ApplicationNonVisualDrawingProps'] = (
+    ('set', 'ph', property(_CT_ApplicationNonVisualDrawingProps_ph, None, None)),
+    ('add', '_new_ph', _CT_ApplicationNonVisualDrawingProps_new_ph),
+    ('add', '_insert_ph', _CT_ApplicationNonVisualDrawingProps_insert_ph),
+    ('add', '_add_ph', _CT_ApplicationNonVisualDrawingProps_add_ph),
+    ('add', 'get_or_add_ph', _CT_ApplicationNonVisualDrawingProps_get_or_add_ph),
+    ('add', '_remove_ph', _CT_ApplicationNonVisualDrawingProps_remove_ph),
+)
+
+
+# pptx.oxml.shapes.shared.CT_LineProperties ---------------------------------
+
+def _CT_LineProperties_eg_lineFillProperties(obj):
+    'Return the child element belonging to this element group, or |None| if no member child is present.'
+    for clark_name in ('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill'):
+        child = obj.find(clark_name)
+        if child is not None:
+            return child
+    return None
+
+def _CT_LineProperties_noFill(obj):
+    '``<a:noFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill')
+
+def _CT_LineProperties_new_noFill(obj):
+    'Return a "loose", newly created ``<a:noFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill', nsmap=_nsmap_a)
+
+def _CT_LineProperties_insert_noFill(obj, child):
+    'Return the passed ``<a:noFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}prstDash', '{http://schemas.openxmlformats.org/drawingml/2006/main}custDash', '{http://schemas.openxmlformats.org/drawingml/2006/main}round', '{http://schemas.openxmlformats.org/drawingml/2006/main}bevel', '{http://schemas.openxmlformats.org/drawingml/2006/main}miter', '{http://schemas.openxmlformats.org/drawingml/2006/main}headEnd', '{http://schemas.openxmlformats.org/drawingml/2006/main}tailEnd', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_LineProperties_add_noFill(obj, **attrs):
+    'Add a new ``<a:noFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_noFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_noFill(child)
+    return child
+
+def _CT_LineProperties_get_or_change_to_noFill(obj):
+    'Return the ``<a:noFill>`` child, replacing any other group element if found.'
+    child = obj.noFill
+    if child is not None:
+        return child
+    obj._remove_eg_lineFillProperties()
+    child = obj._add_noFill()
+    return child
+
+def _CT_LineProperties_solidFill(obj):
+    '``<a:solidFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill')
+
+def _CT_LineProperties_new_solidFill(obj):
+    'Return a "loose", newly created ``<a:solidFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill', nsmap=_nsmap_a)
+
+def _CT_LineProperties_insert_solidFill(obj, child):
+    'Return the passed ``<a:solidFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}prstDash', '{http://schemas.openxmlformats.org/drawingml/2006/main}custDash', '{http://schemas.openxmlformats.org/drawingml/2006/main}round', '{http://schemas.openxmlformats.org/drawingml/2006/main}bevel', '{http://schemas.openxmlformats.org/drawingml/2006/main}miter', '{http://schemas.openxmlformats.org/drawingml/2006/main}headEnd', '{http://schemas.openxmlformats.org/drawingml/2006/main}tailEnd', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_LineProperties_add_solidFill(obj, **attrs):
+    'Add a new ``<a:solidFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_solidFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_solidFill(child)
+    return child
+
+def _CT_LineProperties_get_or_change_to_solidFill(obj):
+    'Return the ``<a:solidFill>`` child, replacing any other group element if found.'
+    child = obj.solidFill
+    if child is not None:
+        return child
+    obj._remove_eg_lineFillProperties()
+    child = obj._add_solidFill()
+    return child
+
+def _CT_LineProperties_gradFill(obj):
+    '``<a:gradFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill')
+
+def _CT_LineProperties_new_gradFill(obj):
+    'Return a "loose", newly created ``<a:gradFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill', nsmap=_nsmap_a)
+
+def _CT_LineProperties_insert_gradFill(obj, child):
+    'Return the passed ``<a:gradFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}prstDash', '{http://schemas.openxmlformats.org/drawingml/2006/main}custDash', '{http://schemas.openxmlformats.org/drawingml/2006/main}round', '{http://schemas.openxmlformats.org/drawingml/2006/main}bevel', '{http://schemas.openxmlformats.org/drawingml/2006/main}miter', '{http://schemas.openxmlformats.org/drawingml/2006/main}headEnd', '{http://schemas.openxmlformats.org/drawingml/2006/main}tailEnd', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_LineProperties_add_gradFill(obj, **attrs):
+    'Add a new ``<a:gradFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_gradFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_gradFill(child)
+    return child
+
+def _CT_LineProperties_get_or_change_to_gradFill(obj):
+    'Return the ``<a:gradFill>`` child, replacing any other group element if found.'
+    child = obj.gradFill
+    if child is not None:
+        return child
+    obj._remove_eg_lineFillProperties()
+    child = obj._add_gradFill()
+    return child
+
+def _CT_LineProperties_pattFill(obj):
+    '``<a:pattFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill')
+
+def _CT_LineProperties_new_pattFill(obj):
+    'Return a "loose", newly created ``<a:pattFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill', nsmap=_nsmap_a)
+
+def _CT_LineProperties_insert_pattFill(obj, child):
+    'Return the passed ``<a:pattFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}prstDash', '{http://schemas.openxmlformats.org/drawingml/2006/main}custDash', '{http://schemas.openxmlformats.org/drawingml/2006/main}round', '{http://schemas.openxmlformats.org/drawingml/2006/main}bevel', '{http://schemas.openxmlformats.org/drawingml/2006/main}miter', '{http://schemas.openxmlformats.org/drawingml/2006/main}headEnd', '{http://schemas.openxmlformats.org/drawingml/2006/main}tailEnd', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_LineProperties_add_pattFill(obj, **attrs):
+    'Add a new ``<a:pattFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_pattFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_pattFill(child)
+    return child
+
+def _CT_LineProperties_get_or_change_to_pattFill(obj):
+    'Return the ``<a:pattFill>`` child, replacing any other group element if found.'
+    child = obj.pattFill
+    if child is not None:
+        return child
+    obj._remove_eg_lineFillProperties()
+    child = obj._add_pattFill()
+    return child
+
+def _CT_LineProperties_remove_eg_lineFillProperties(obj):
+    'Remove the current choice group child element if present.'
+    for clark_name in ('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill'):
+        for child in obj.findall(clark_name):
+            obj.remove(child)
+
+def _CT_LineProperties_prstDash(obj):
+    '``<a:prstDash>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}prstDash')
+
+def _CT_LineProperties_new_prstDash(obj):
+    'Return a "loose", newly created ``<a:prstDash>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}prstDash', nsmap=_nsmap_a)
+
+def _CT_LineProperties_insert_prstDash(obj, child):
+    'Return the passed ``<a:prstDash>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}custDash', '{http://schemas.openxmlformats.org/drawingml/2006/main}round', '{http://schemas.openxmlformats.org/drawingml/2006/main}bevel', '{http://schemas.openxmlformats.org/drawingml/2006/main}miter', '{http://schemas.openxmlformats.org/drawingml/2006/main}headEnd', '{http://schemas.openxmlformats.org/drawingml/2006/main}tailEnd', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_LineProperties_add_prstDash(obj, **attrs):
+    'Add a new ``<a:prstDash>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_prstDash()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_prstDash(child)
+    return child
+
+def _CT_LineProperties_get_or_add_prstDash(obj):
+    'Return the ``<a:prstDash>`` child element, newly added if not present.'
+    child = obj.prstDash
+    if child is None:
+        child = obj._add_prstDash()
+    return child
+
+def _CT_LineProperties_remove_prstDash(obj):
+    'Remove all ``<a:prstDash>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}prstDash'):
+        obj.remove(child)
+
+def _CT_LineProperties_custDash(obj):
+    '``<a:custDash>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}custDash')
+
+def _CT_LineProperties_new_custDash(obj):
+    'Return a "loose", newly created ``<a:custDash>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}custDash', nsmap=_nsmap_a)
+
+def _CT_LineProperties_insert_custDash(obj, child):
+    'Return the passed ``<a:custDash>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}round', '{http://schemas.openxmlformats.org/drawingml/2006/main}bevel', '{http://schemas.openxmlformats.org/drawingml/2006/main}miter', '{http://schemas.openxmlformats.org/drawingml/2006/main}headEnd', '{http://schemas.openxmlformats.org/drawingml/2006/main}tailEnd', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_LineProperties_add_custDash(obj, **attrs):
+    'Add a new ``<a:custDash>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_custDash()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_custDash(child)
+    return child
+
+def _CT_LineProperties_get_or_add_custDash(obj):
+    'Return the ``<a:custDash>`` child element, newly added if not present.'
+    child = obj.custDash
+    if child is None:
+        child = obj._add_custDash()
+    return child
+
+def _CT_LineProperties_remove_custDash(obj):
+    'Remove all ``<a:custDash>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}custDash'):
+        obj.remove(child)
+
+_CT_LineProperties_w_default = Emu(0)
+
+def _CT_LineProperties_w_get(obj):
+    'ST_LineWidth type-converted value of ``w`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('w')
+    if attr_str_value is None:
+        return _CT_LineProperties_w_default
+    return ST_LineWidth.from_xml(attr_str_value)
+
+def _CT_LineProperties_w_set(obj, value):
+    if value == _CT_LineProperties_w_default:
+        if 'w' in obj.attrib:
+            del obj.attrib['w']
+        return
+    str_value = ST_LineWidth.to_xml(value)
+    obj.set('w', str_value)
+
+
+members['pptx.oxml.shapes.shared.CT_LineProperties'] = (
+    ('set', 'eg_lineFillProperties', property(_CT_LineProperties_eg_lineFillProperties, None, None)),
+    ('set', 'noFill', property(_CT_LineProperties_noFill, None, None)),
+    ('add', '_new_noFill', _CT_LineProperties_new_noFill),
+    ('add', '_insert_noFill', _CT_LineProperties_insert_noFill),
+    ('add', '_add_noFill', _CT_LineProperties_add_noFill),
+    ('add', 'get_or_change_to_noFill', _CT_LineProperties_get_or_change_to_noFill),
+    ('set', 'solidFill', property(_CT_LineProperties_solidFill, None, None)),
+    ('add', '_new_solidFill', _CT_LineProperties_new_solidFill),
+    ('add', '_insert_solidFill', _CT_LineProperties_insert_solidFill),
+    ('add', '_add_solidFill', _CT_LineProperties_add_solidFill),
+    ('add', 'get_or_change_to_solidFill', _CT_LineProperties_get_or_change_to_solidFill),
+    ('set', 'gradFill', property(_CT_LineProperties_gradFill, None, None)),
+    ('add', '_new_gradFill', _CT_LineProperties_new_gradFill),
+    ('add', '_insert_gradFill', _CT_LineProperties_insert_gradFill),
+    ('add', '_add_gradFill', _CT_LineProperties_add_gradFill),
+    ('add', 'get_or_change_to_gradFill', _CT_LineProperties_get_or_change_to_gradFill),
+    ('set', 'pattFill', property(_CT_LineProperties_pattFill, None, None)),
+    ('add', '_new_pattFill', _CT_LineProperties_new_pattFill),
+    ('add', '_insert_pattFill', _CT_LineProperties_insert_pattFill),
+    ('add', '_add_pattFill', _CT_LineProperties_add_pattFill),
+    ('add', 'get_or_change_to_pattFill', _CT_LineProperties_get_or_change_to_pattFill),
+    ('add', '_remove_eg_lineFillProperties', _CT_LineProperties_remove_eg_lineFillProperties),
+    ('set', 'prstDash', property(_CT_LineProperties_prstDash, None, None)),
+    ('add', '_new_prstDash', _CT_LineProperties_new_prstDash),
+    ('add', '_insert_prstDash', _CT_LineProperties_insert_prstDash),
+    ('add', '_add_prstDash', _CT_LineProperties_add_prstDash),
+    ('add', 'get_or_add_prstDash', _CT_LineProperties_get_or_add_prstDash),
+    ('add', '_remove_prstDash', _CT_LineProperties_remove_prstDash),
+    ('set', 'custDash', property(_CT_LineProperties_custDash, None, None)),
+    ('add', '_new_custDash', _CT_LineProperties_new_custDash),
+    ('add', '_insert_custDash', _CT_LineProperties_insert_custDash),
+    ('add', '_add_custDash', _CT_LineProperties_add_custDash),
+    ('add', 'get_or_add_custDash', _CT_LineProperties_get_or_add_custDash),
+    ('add', '_remove_custDash', _CT_LineProperties_remove_custDash),
+    ('set', 'w', property(_CT_LineProperties_w_get, _CT_LineProperties_w_set, None)),
+)
+
+
+# pptx.oxml.shapes.shared.CT_NonVisualDrawingProps --------------------------
+
+def _CT_NonVisualDrawingProps_hlinkClick(obj):
+    '``<a:hlinkClick>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkClick')
+
+def _CT_NonVisualDrawingProps_new_hlinkClick(obj):
+    'Return a "loose", newly created ``<a:hlinkClick>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkClick', nsmap=_nsmap_a)
+
+def _CT_NonVisualDrawingProps_insert_hlinkClick(obj, child):
+    'Return the passed ``<a:hlinkClick>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkHover', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_NonVisualDrawingProps_add_hlinkClick(obj, **attrs):
+    'Add a new ``<a:hlinkClick>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_hlinkClick()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_hlinkClick(child)
+    return child
+
+def _CT_NonVisualDrawingProps_get_or_add_hlinkClick(obj):
+    'Return the ``<a:hlinkClick>`` child element, newly added if not present.'
+    child = obj.hlinkClick
+    if child is None:
+        child = obj._add_hlinkClick()
+    return child
+
+def _CT_NonVisualDrawingProps_remove_hlinkClick(obj):
+    'Remove all ``<a:hlinkClick>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkClick'):
+        obj.remove(child)
+
+def _CT_NonVisualDrawingProps_hlinkHover(obj):
+    '``<a:hlinkHover>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkHover')
+
+def _CT_NonVisualDrawingProps_new_hlinkHover(obj):
+    'Return a "loose", newly created ``<a:hlinkHover>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkHover', nsmap=_nsmap_a)
+
+def _CT_NonVisualDrawingProps_insert_hlinkHover(obj, child):
+    'Return the passed ``<a:hlinkHover>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}extLst',))
+    return child
+
+def _CT_NonVisualDrawingProps_add_hlinkHover(obj, **attrs):
+    'Add a new ``<a:hlinkHover>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_hlinkHover()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_hlinkHover(child)
+    return child
+
+def _CT_NonVisualDrawingProps_get_or_add_hlinkHover(obj):
+    'Return the ``<a:hlinkHover>`` child element, newly added if not present.'
+    child = obj.hlinkHover
+    if child is None:
+        child = obj._add_hlinkHover()
+    return child
+
+def _CT_NonVisualDrawingProps_remove_hlinkHover(obj):
+    'Remove all ``<a:hlinkHover>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkHover'):
+        obj.remove(child)
+
+def _CT_NonVisualDrawingProps_id_get(obj):
+    'ST_DrawingElementId type-converted value of ``id`` attribute.'
+    attr_str_value = obj.get('id')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'id' attribute not present on element %s" % obj.tag
+        )
+    return ST_DrawingElementId.from_xml(attr_str_value)
+
+def _CT_NonVisualDrawingProps_id_set(obj, value):
+    str_value = ST_DrawingElementId.to_xml(value)
+    obj.set('id', str_value)
+
+def _CT_NonVisualDrawingProps_name_get(obj):
+    'XsdString type-converted value of ``name`` attribute.'
+    attr_str_value = obj.get('name')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'name' attribute not present on element %s" % obj.tag
+        )
+    return XsdString.from_xml(attr_str_value)
+
+def _CT_NonVisualDrawingProps_name_set(obj, value):
+    str_value = XsdString.to_xml(value)
+    obj.set('name', str_value)
+
+
+members['pptx.oxml.shapes.shared.CT_NonVisualDrawingProps'] = (
+    ('set', 'hlinkClick', property(_CT_NonVisualDrawingProps_hlinkClick, None, None)),
+    ('add', '_new_hlinkClick', _CT_NonVisualDrawingProps_new_hlinkClick),
+    ('add', '_insert_hlinkClick', _CT_NonVisualDrawingProps_insert_hlinkClick),
+    ('add', '_add_hlinkClick', _CT_NonVisualDrawingProps_add_hlinkClick),
+    ('add', 'get_or_add_hlinkClick', _CT_NonVisualDrawingProps_get_or_add_hlinkClick),
+    ('add', '_remove_hlinkClick', _CT_NonVisualDrawingProps_remove_hlinkClick),
+    ('set', 'hlinkHover', property(_CT_NonVisualDrawingProps_hlinkHover, None, None)),
+    ('add', '_new_hlinkHover', _CT_NonVisualDrawingProps_new_hlinkHover),
+    ('add', '_insert_hlinkHover', _CT_NonVisualDrawingProps_insert_hlinkHover),
+    ('add', '_add_hlinkHover', _CT_NonVisualDrawingProps_add_hlinkHover),
+    ('add', 'get_or_add_hlinkHover', _CT_NonVisualDrawingProps_get_or_add_hlinkHover),
+    ('add', '_remove_hlinkHover', _CT_NonVisualDrawingProps_remove_hlinkHover),
+    ('set', 'id', property(_CT_NonVisualDrawingProps_id_get, _CT_NonVisualDrawingProps_id_set, None)),
+    ('set', 'name', property(_CT_NonVisualDrawingProps_name_get, _CT_NonVisualDrawingProps_name_set, None)),
+)
+
+
+# pptx.oxml.shapes.shared.CT_Placeholder ------------------------------------
+
+_CT_Placeholder_type_default = PP_PLACEHOLDER_TYPE.OBJECT
+
+def _CT_Placeholder_type_get(obj):
+    'PP_PLACEHOLDER_TYPE type-converted value of ``type`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('type')
+    if attr_str_value is None:
+        return _CT_Placeholder_type_default
+    return PP_PLACEHOLDER_TYPE.from_xml(attr_str_value)
+
+def _CT_Placeholder_type_set(obj, value):
+    if value == _CT_Placeholder_type_default:
+        if 'type' in obj.attrib:
+            del obj.attrib['type']
+        return
+    str_value = PP_PLACEHOLDER_TYPE.to_xml(value)
+    obj.set('type', str_value)
+
+def _CT_Placeholder_orient_get(obj):
+    'ST_Direction type-converted value of ``orient`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('orient')
+    if attr_str_value is None:
+        return 'horz'
+    return ST_Direction.from_xml(attr_str_value)
+
+def _CT_Placeholder_orient_set(obj, value):
+    if value == 'horz':
+        if 'orient' in obj.attrib:
+            del obj.attrib['orient']
+        return
+    str_value = ST_Direction.to_xml(value)
+    obj.set('orient', str_value)
+
+def _CT_Placeholder_sz_get(obj):
+    'ST_PlaceholderSize type-converted value of ``sz`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('sz')
+    if attr_str_value is None:
+        return 'full'
+    return ST_PlaceholderSize.from_xml(attr_str_value)
+
+def _CT_Placeholder_sz_set(obj, value):
+    if value == 'full':
+        if 'sz' in obj.attrib:
+            del obj.attrib['sz']
+        return
+    str_value = ST_PlaceholderSize.to_xml(value)
+    obj.set('sz', str_value)
+
+def _CT_Placeholder_idx_get(obj):
+    'XsdUnsignedInt type-converted value of ``idx`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('idx')
+    if attr_str_value is None:
+        return 0
+    return XsdUnsignedInt.from_xml(attr_str_value)
+
+def _CT_Placeholder_idx_set(obj, value):
+    if value == 0:
+        if 'idx' in obj.attrib:
+            del obj.attrib['idx']
+        return
+    str_value = XsdUnsignedInt.to_xml(value)
+    obj.set('idx', str_value)
+
+
+members['pptx.oxml.shapes.shared.CT_Placeholder'] = (
+    ('set', 'type', property(_CT_Placeholder_type_get, _CT_Placeholder_type_set, None)),
+    ('set', 'orient', property(_CT_Placeholder_orient_get, _CT_Placeholder_orient_set, None)),
+    ('set', 'sz', property(_CT_Placeholder_sz_get, _CT_Placeholder_sz_set, None)),
+    ('set', 'idx', property(_CT_Placeholder_idx_get, _CT_Placeholder_idx_set, None)),
+)
+
+
+# pptx.oxml.shapes.shared.CT_Point2D ----------------------------------------
+
+def _CT_Point2D_x_get(obj):
+    'ST_Coordinate type-converted value of ``x`` attribute.'
+    attr_str_value = obj.get('x')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'x' attribute not present on element %s" % obj.tag
+        )
+    return ST_Coordinate.from_xml(attr_str_value)
+
+def _CT_Point2D_x_set(obj, value):
+    str_value = ST_Coordinate.to_xml(value)
+    obj.set('x', str_value)
+
+def _CT_Point2D_y_get(obj):
+    'ST_Coordinate type-converted value of ``y`` attribute.'
+    attr_str_value = obj.get('y')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'y' attribute not present on element %s" % obj.tag
+        )
+    return ST_Coordinate.from_xml(attr_str_value)
+
+def _CT_Point2D_y_set(obj, value):
+    str_value = ST_Coordinate.to_xml(value)
+    obj.set('y', str_value)
+
+
+members['pptx.oxml.shapes.shared.CT_Point2D'] = (
+    ('set', 'x', property(_CT_Point2D_x_get, _CT_Point2D_x_set, None)),
+    ('set', 'y', property(_CT_Point2D_y_get, _CT_Point2D_y_set, None)),
+)
+
+
+# pptx.oxml.shapes.shared.CT_PositiveSize2D ---------------------------------
+
+def _CT_PositiveSize2D_cx_get(obj):
+    'ST_PositiveCoordinate type-converted value of ``cx`` attribute.'
+    attr_str_value = obj.get('cx')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'cx' attribute not present on element %s" % obj.tag
+        )
+    return ST_PositiveCoordinate.from_xml(attr_str_value)
+
+def _CT_PositiveSize2D_cx_set(obj, value):
+    str_value = ST_PositiveCoordinate.to_xml(value)
+    obj.set('cx', str_value)
+
+def _CT_PositiveSize2D_cy_get(obj):
+    'ST_PositiveCoordinate type-converted value of ``cy`` attribute.'
+    attr_str_value = obj.get('cy')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'cy' attribute not present on element %s" % obj.tag
+        )
+    return ST_PositiveCoordinate.from_xml(attr_str_value)
+
+def _CT_PositiveSize2D_cy_set(obj, value):
+    str_value = ST_PositiveCoordinate.to_xml(value)
+    obj.set('cy', str_value)
+
+
+members['pptx.oxml.shapes.shared.CT_PositiveSize2D'] = (
+    ('set', 'cx', property(_CT_PositiveSize2D_cx_get, _CT_PositiveSize2D_cx_set, None)),
+    ('set', 'cy', property(_CT_PositiveSize2D_cy_get, _CT_PositiveSize2D_cy_set, None)),
+)
+
+
+# pptx.oxml.shapes.shared.CT_ShapeProperties --------------------------------
+
+def _CT_ShapeProperties_xfrm(obj):
+    '``<a:xfrm>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}xfrm')
+
+def _CT_ShapeProperties_new_xfrm(obj):
+    'Return a "loose", newly created ``<a:xfrm>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}xfrm', nsmap=_nsmap_a)
+
+def _CT_ShapeProperties_insert_xfrm(obj, child):
+    'Return the passed ``<a:xfrm>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}custGeom', '{http://schemas.openxmlformats.org/drawingml/2006/main}prstGeom', '{http://schemas.openxmlformats.org/drawingml/2006/main}noFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}ln', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}scene3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}sp3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_ShapeProperties_add_xfrm(obj, **attrs):
+    'Add a new ``<a:xfrm>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_xfrm()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_xfrm(child)
+    return child
+
+def _CT_ShapeProperties_get_or_add_xfrm(obj):
+    'Return the ``<a:xfrm>`` child element, newly added if not present.'
+    child = obj.xfrm
+    if child is None:
+        child = obj._add_xfrm()
+    return child
+
+def _CT_ShapeProperties_remove_xfrm(obj):
+    'Remove all ``<a:xfrm>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}xfrm'):
+        obj.remove(child)
+
+def _CT_ShapeProperties_custGeom(obj):
+    '``<a:custGeom>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}custGeom')
+
+def _CT_ShapeProperties_new_custGeom(obj):
+    'Return a "loose", newly created ``<a:custGeom>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}custGeom', nsmap=_nsmap_a)
+
+def _CT_ShapeProperties_insert_custGeom(obj, child):
+    'Return the passed ``<a:custGeom>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}prstGeom', '{http://schemas.openxmlformats.org/drawingml/2006/main}noFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}ln', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}scene3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}sp3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_ShapeProperties_add_custGeom(obj, **attrs):
+    'Add a new ``<a:custGeom>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_custGeom()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_custGeom(child)
+    return child
+
+def _CT_ShapeProperties_get_or_add_custGeom(obj):
+    'Return the ``<a:custGeom>`` child element, newly added if not present.'
+    child = obj.custGeom
+    if child is None:
+        child = obj._add_custGeom()
+    return child
+
+def _CT_ShapeProperties_remove_custGeom(obj):
+    'Remove all ``<a:custGeom>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}custGeom'):
+        obj.remove(child)
+
+def _CT_ShapeProperties_prstGeom(obj):
+    '``<a:prstGeom>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}prstGeom')
+
+def _CT_ShapeProperties_new_prstGeom(obj):
+    'Return a "loose", newly created ``<a:prstGeom>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}prstGeom', nsmap=_nsmap_a)
+
+def _CT_ShapeProperties_insert_prstGeom(obj, child):
+    'Return the passed ``<a:prstGeom>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}ln', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}scene3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}sp3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_ShapeProperties_add_prstGeom(obj, **attrs):
+    'Add a new ``<a:prstGeom>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_prstGeom()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_prstGeom(child)
+    return child
+
+def _CT_ShapeProperties_get_or_add_prstGeom(obj):
+    'Return the ``<a:prstGeom>`` child element, newly added if not present.'
+    child = obj.prstGeom
+    if child is None:
+        child = obj._add_prstGeom()
+    return child
+
+def _CT_ShapeProperties_remove_prstGeom(obj):
+    'Remove all ``<a:prstGeom>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}prstGeom'):
+        obj.remove(child)
+
+def _CT_ShapeProperties_eg_fillProperties(obj):
+    'Return the child element belonging to this element group, or |None| if no member child is present.'
+    for clark_name in ('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill'):
+        child = obj.find(clark_name)
+        if child is not None:
+            return child
+    return None
+
+def _CT_ShapeProperties_noFill(obj):
+    '``<a:noFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill')
+
+def _CT_ShapeProperties_new_noFill(obj):
+    'Return a "loose", newly created ``<a:noFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill', nsmap=_nsmap_a)
+
+def _CT_ShapeProperties_insert_noFill(obj, child):
+    'Return the passed ``<a:noFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}ln', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}scene3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}sp3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_ShapeProperties_add_noFill(obj, **attrs):
+    'Add a new ``<a:noFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_noFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_noFill(child)
+    return child
+
+def _CT_ShapeProperties_get_or_change_to_noFill(obj):
+    'Return the ``<a:noFill>`` child, replacing any other group element if found.'
+    child = obj.noFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_noFill()
+    return child
+
+def _CT_ShapeProperties_solidFill(obj):
+    '``<a:solidFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill')
+
+def _CT_ShapeProperties_new_solidFill(obj):
+    'Return a "loose", newly created ``<a:solidFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill', nsmap=_nsmap_a)
+
+def _CT_ShapeProperties_insert_solidFill(obj, child):
+    'Return the passed ``<a:solidFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}ln', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}scene3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}sp3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_ShapeProperties_add_solidFill(obj, **attrs):
+    'Add a new ``<a:solidFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_solidFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_solidFill(child)
+    return child
+
+def _CT_ShapeProperties_get_or_change_to_solidFill(obj):
+    'Return the ``<a:solidFill>`` child, replacing any other group element if found.'
+    child = obj.solidFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_solidFill()
+    return child
+
+def _CT_ShapeProperties_gradFill(obj):
+    '``<a:gradFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill')
+
+def _CT_ShapeProperties_new_gradFill(obj):
+    'Return a "loose", newly created ``<a:gradFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill', nsmap=_nsmap_a)
+
+def _CT_ShapeProperties_insert_gradFill(obj, child):
+    'Return the passed ``<a:gradFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}ln', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}scene3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}sp3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_ShapeProperties_add_gradFill(obj, **attrs):
+    'Add a new ``<a:gradFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_gradFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_gradFill(child)
+    return child
+
+def _CT_ShapeProperties_get_or_change_to_gradFill(obj):
+    'Return the ``<a:gradFill>`` child, replacing any other group element if found.'
+    child = obj.gradFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_gradFill()
+    return child
+
+def _CT_ShapeProperties_blipFill(obj):
+    '``<a:blipFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill')
+
+def _CT_ShapeProperties_new_blipFill(obj):
+    'Return a "loose", newly created ``<a:blipFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill', nsmap=_nsmap_a)
+
+def _CT_ShapeProperties_insert_blipFill(obj, child):
+    'Return the passed ``<a:blipFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}ln', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}scene3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}sp3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_ShapeProperties_add_blipFill(obj, **attrs):
+    'Add a new ``<a:blipFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_blipFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_blipFill(child)
+    return child
+
+def _CT_ShapeProperties_get_or_change_to_blipFill(obj):
+    'Return the ``<a:blipFill>`` child, replacing any other group element if found.'
+    child = obj.blipFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_blipFill()
+    return child
+
+def _CT_ShapeProperties_pattFill(obj):
+    '``<a:pattFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill')
+
+def _CT_ShapeProperties_new_pattFill(obj):
+    'Return a "loose", newly created ``<a:pattFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill', nsmap=_nsmap_a)
+
+def _CT_ShapeProperties_insert_pattFill(obj, child):
+    'Return the passed ``<a:pattFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}ln', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}scene3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}sp3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_ShapeProperties_add_pattFill(obj, **attrs):
+    'Add a new ``<a:pattFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_pattFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_pattFill(child)
+    return child
+
+def _CT_ShapeProperties_get_or_change_to_pattFill(obj):
+    'Return the ``<a:pattFill>`` child, replacing any other group element if found.'
+    child = obj.pattFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_pattFill()
+    return child
+
+def _CT_ShapeProperties_grpFill(obj):
+    '``<a:grpFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill')
+
+def _CT_ShapeProperties_new_grpFill(obj):
+    'Return a "loose", newly created ``<a:grpFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill', nsmap=_nsmap_a)
+
+def _CT_ShapeProperties_insert_grpFill(obj, child):
+    'Return the passed ``<a:grpFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}ln', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}scene3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}sp3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_ShapeProperties_add_grpFill(obj, **attrs):
+    'Add a new ``<a:grpFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_grpFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_grpFill(child)
+    return child
+
+def _CT_ShapeProperties_get_or_change_to_grpFill(obj):
+    'Return the ``<a:grpFill>`` child, replacing any other group element if found.'
+    child = obj.grpFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_grpFill()
+    return child
+
+def _CT_ShapeProperties_remove_eg_fillProperties(obj):
+    'Remove the current choice group child element if present.'
+    for clark_name in ('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill'):
+        for child in obj.findall(clark_name):
+            obj.remove(child)
+
+def _CT_ShapeProperties_ln(obj):
+    '``<a:ln>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}ln')
+
+def _CT_ShapeProperties_new_ln(obj):
+    'Return a "loose", newly created ``<a:ln>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}ln', nsmap=_nsmap_a)
+
+def _CT_ShapeProperties_insert_ln(obj, child):
+    'Return the passed ``<a:ln>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}scene3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}sp3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_ShapeProperties_add_ln(obj, **attrs):
+    'Add a new ``<a:ln>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_ln()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_ln(child)
+    return child
+
+def _CT_ShapeProperties_get_or_add_ln(obj):
+    'Return the ``<a:ln>`` child element, newly added if not present.'
+    child = obj.ln
+    if child is None:
+        child = obj._add_ln()
+    return child
+
+def _CT_ShapeProperties_remove_ln(obj):
+    'Remove all ``<a:ln>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}ln'):
+        obj.remove(child)
+
+def _CT_ShapeProperties_effectLst(obj):
+    '``<a:effectLst>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst')
+
+def _CT_ShapeProperties_new_effectLst(obj):
+    'Return a "loose", newly created ``<a:effectLst>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', nsmap=_nsmap_a)
+
+def _CT_ShapeProperties_insert_effectLst(obj, child):
+    'Return the passed ``<a:effectLst>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}scene3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}sp3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_ShapeProperties_add_effectLst(obj, **attrs):
+    'Add a new ``<a:effectLst>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_effectLst()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_effectLst(child)
+    return child
+
+def _CT_ShapeProperties_get_or_add_effectLst(obj):
+    'Return the ``<a:effectLst>`` child element, newly added if not present.'
+    child = obj.effectLst
+    if child is None:
+        child = obj._add_effectLst()
+    return child
+
+def _CT_ShapeProperties_remove_effectLst(obj):
+    'Remove all ``<a:effectLst>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst'):
+        obj.remove(child)
+
+
+members['pptx.oxml.shapes.shared.CT_ShapeProperties'] = (
+    ('set', 'xfrm', property(_CT_ShapeProperties_xfrm, None, None)),
+    ('add', '_new_xfrm', _CT_ShapeProperties_new_xfrm),
+    ('add', '_insert_xfrm', _CT_ShapeProperties_insert_xfrm),
+    ('add', '_add_xfrm', _CT_ShapeProperties_add_xfrm),
+    ('add', 'get_or_add_xfrm', _CT_ShapeProperties_get_or_add_xfrm),
+    ('add', '_remove_xfrm', _CT_ShapeProperties_remove_xfrm),
+    ('set', 'custGeom', property(_CT_ShapeProperties_custGeom, None, None)),
+    ('add', '_new_custGeom', _CT_ShapeProperties_new_custGeom),
+    ('add', '_insert_custGeom', _CT_ShapeProperties_insert_custGeom),
+    ('add', '_add_custGeom', _CT_ShapeProperties_add_custGeom),
+    ('add', 'get_or_add_custGeom', _CT_ShapeProperties_get_or_add_custGeom),
+    ('add', '_remove_custGeom', _CT_ShapeProperties_remove_custGeom),
+    ('set', 'prstGeom', property(_CT_ShapeProperties_prstGeom, None, None)),
+    ('add', '_new_prstGeom', _CT_ShapeProperties_new_prstGeom),
+    ('add', '_insert_prstGeom', _CT_ShapeProperties_insert_prstGeom),
+    ('add', '_add_prstGeom', _CT_ShapeProperties_add_prstGeom),
+    ('add', 'get_or_add_prstGeom', _CT_ShapeProperties_get_or_add_prstGeom),
+    ('add', '_remove_prstGeom', _CT_ShapeProperties_remove_prstGeom),
+    ('set', 'eg_fillProperties', property(_CT_ShapeProperties_eg_fillProperties, None, None)),
+    ('set', 'noFill', property(_CT_ShapeProperties_noFill, None, None)),
+    ('add', '_new_noFill', _CT_ShapeProperties_new_noFill),
+    ('add', '_insert_noFill', _CT_ShapeProperties_insert_noFill),
+    ('add', '_add_noFill', _CT_ShapeProperties_add_noFill),
+    ('add', 'get_or_change_to_noFill', _CT_ShapeProperties_get_or_change_to_noFill),
+    ('set', 'solidFill', property(_CT_ShapeProperties_solidFill, None, None)),
+    ('add', '_new_solidFill', _CT_ShapeProperties_new_solidFill),
+    ('add', '_insert_solidFill', _CT_ShapeProperties_insert_solidFill),
+    ('add', '_add_solidFill', _CT_ShapeProperties_add_solidFill),
+    ('add', 'get_or_change_to_solidFill', _CT_ShapeProperties_get_or_change_to_solidFill),
+    ('set', 'gradFill', property(_CT_ShapeProperties_gradFill, None, None)),
+    ('add', '_new_gradFill', _CT_ShapeProperties_new_gradFill),
+    ('add', '_insert_gradFill', _CT_ShapeProperties_insert_gradFill),
+    ('add', '_add_gradFill', _CT_ShapeProperties_add_gradFill),
+    ('add', 'get_or_change_to_gradFill', _CT_ShapeProperties_get_or_change_to_gradFill),
+    ('set', 'blipFill', property(_CT_ShapeProperties_blipFill, None, None)),
+    ('add', '_new_blipFill', _CT_ShapeProperties_new_blipFill),
+    ('add', '_insert_blipFill', _CT_ShapeProperties_insert_blipFill),
+    ('add', '_add_blipFill', _CT_ShapeProperties_add_blipFill),
+    ('add', 'get_or_change_to_blipFill', _CT_ShapeProperties_get_or_change_to_blipFill),
+    ('set', 'pattFill', property(_CT_ShapeProperties_pattFill, None, None)),
+    ('add', '_new_pattFill', _CT_ShapeProperties_new_pattFill),
+    ('add', '_insert_pattFill', _CT_ShapeProperties_insert_pattFill),
+    ('add', '_add_pattFill', _CT_ShapeProperties_add_pattFill),
+    ('add', 'get_or_change_to_pattFill', _CT_ShapeProperties_get_or_change_to_pattFill),
+    ('set', 'grpFill', property(_CT_ShapeProperties_grpFill, None, None)),
+    ('add', '_new_grpFill', _CT_ShapeProperties_new_grpFill),
+    ('add', '_insert_grpFill', _CT_ShapeProperties_insert_grpFill),
+    ('add', '_add_grpFill', _CT_ShapeProperties_add_grpFill),
+    ('add', 'get_or_change_to_grpFill', _CT_ShapeProperties_get_or_change_to_grpFill),
+    ('add', '_remove_eg_fillProperties', _CT_ShapeProperties_remove_eg_fillProperties),
+    ('set', 'ln', property(_CT_ShapeProperties_ln, None, None)),
+    ('add', '_new_ln', _CT_ShapeProperties_new_ln),
+    ('add', '_insert_ln', _CT_ShapeProperties_insert_ln),
+    ('add', '_add_ln', _CT_ShapeProperties_add_ln),
+    ('add', 'get_or_add_ln', _CT_ShapeProperties_get_or_add_ln),
+    ('add', '_remove_ln', _CT_ShapeProperties_remove_ln),
+    ('set', 'effectLst', property(_CT_ShapeProperties_effectLst, None, None)),
+    ('add', '_new_effectLst', _CT_ShapeProperties_new_effectLst),
+    ('add', '_insert_effectLst', _CT_ShapeProperties_insert_effectLst),
+    ('add', '_add_effectLst', _CT_ShapeProperties_add_effectLst),
+    ('add', 'get_or_add_effectLst', _CT_ShapeProperties_get_or_add_effectLst),
+    ('add', '_remove_effectLst', _CT_ShapeProperties_remove_effectLst),
+)
+
+
+# pptx.oxml.shapes.shared.CT_Transform2D ------------------------------------
+
+def _CT_Transform2D_off(obj):
+    '``<a:off>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}off')
+
+def _CT_Transform2D_new_off(obj):
+    'Return a "loose", newly created ``<a:off>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}off', nsmap=_nsmap_a)
+
+def _CT_Transform2D_insert_off(obj, child):
+    'Return the passed ``<a:off>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}ext', '{http://schemas.openxmlformats.org/drawingml/2006/main}chOff', '{http://schemas.openxmlformats.org/drawingml/2006/main}chExt'))
+    return child
+
+def _CT_Transform2D_add_off(obj, **attrs):
+    'Add a new ``<a:off>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_off()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_off(child)
+    return child
+
+def _CT_Transform2D_get_or_add_off(obj):
+    'Return the ``<a:off>`` child element, newly added if not present.'
+    child = obj.off
+    if child is None:
+        child = obj._add_off()
+    return child
+
+def _CT_Transform2D_remove_off(obj):
+    'Remove all ``<a:off>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}off'):
+        obj.remove(child)
+
+def _CT_Transform2D_ext(obj):
+    '``<a:ext>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}ext')
+
+def _CT_Transform2D_new_ext(obj):
+    'Return a "loose", newly created ``<a:ext>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}ext', nsmap=_nsmap_a)
+
+def _CT_Transform2D_insert_ext(obj, child):
+    'Return the passed ``<a:ext>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}chOff', '{http://schemas.openxmlformats.org/drawingml/2006/main}chExt'))
+    return child
+
+def _CT_Transform2D_add_ext(obj, **attrs):
+    'Add a new ``<a:ext>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_ext()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_ext(child)
+    return child
+
+def _CT_Transform2D_get_or_add_ext(obj):
+    'Return the ``<a:ext>`` child element, newly added if not present.'
+    child = obj.ext
+    if child is None:
+        child = obj._add_ext()
+    return child
+
+def _CT_Transform2D_remove_ext(obj):
+    'Remove all ``<a:ext>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}ext'):
+        obj.remove(child)
+
+def _CT_Transform2D_chOff(obj):
+    '``<a:chOff>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}chOff')
+
+def _CT_Transform2D_new_chOff(obj):
+    'Return a "loose", newly created ``<a:chOff>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}chOff', nsmap=_nsmap_a)
+
+def _CT_Transform2D_insert_chOff(obj, child):
+    'Return the passed ``<a:chOff>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}chExt',))
+    return child
+
+def _CT_Transform2D_add_chOff(obj, **attrs):
+    'Add a new ``<a:chOff>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_chOff()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_chOff(child)
+    return child
+
+def _CT_Transform2D_get_or_add_chOff(obj):
+    'Return the ``<a:chOff>`` child element, newly added if not present.'
+    child = obj.chOff
+    if child is None:
+        child = obj._add_chOff()
+    return child
+
+def _CT_Transform2D_remove_chOff(obj):
+    'Remove all ``<a:chOff>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}chOff'):
+        obj.remove(child)
+
+def _CT_Transform2D_chExt(obj):
+    '``<a:chExt>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}chExt')
+
+def _CT_Transform2D_new_chExt(obj):
+    'Return a "loose", newly created ``<a:chExt>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}chExt', nsmap=_nsmap_a)
+
+def _CT_Transform2D_insert_chExt(obj, child):
+    'Return the passed ``<a:chExt>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Transform2D_add_chExt(obj, **attrs):
+    'Add a new ``<a:chExt>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_chExt()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_chExt(child)
+    return child
+
+def _CT_Transform2D_get_or_add_chExt(obj):
+    'Return the ``<a:chExt>`` child element, newly added if not present.'
+    child = obj.chExt
+    if child is None:
+        child = obj._add_chExt()
+    return child
+
+def _CT_Transform2D_remove_chExt(obj):
+    'Remove all ``<a:chExt>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}chExt'):
+        obj.remove(child)
+
+def _CT_Transform2D_rot_get(obj):
+    'ST_Angle type-converted value of ``rot`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('rot')
+    if attr_str_value is None:
+        return 0.0
+    return ST_Angle.from_xml(attr_str_value)
+
+def _CT_Transform2D_rot_set(obj, value):
+    if value == 0.0:
+        if 'rot' in obj.attrib:
+            del obj.attrib['rot']
+        return
+    str_value = ST_Angle.to_xml(value)
+    obj.set('rot', str_value)
+
+def _CT_Transform2D_flipH_get(obj):
+    'XsdBoolean type-converted value of ``flipH`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('flipH')
+    if attr_str_value is None:
+        return False
+    return XsdBoolean.from_xml(attr_str_value)
+
+def _CT_Transform2D_flipH_set(obj, value):
+    if value == False:
+        if 'flipH' in obj.attrib:
+            del obj.attrib['flipH']
+        return
+    str_value = XsdBoolean.to_xml(value)
+    obj.set('flipH', str_value)
+
+def _CT_Transform2D_flipV_get(obj):
+    'XsdBoolean type-converted value of ``flipV`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('flipV')
+    if attr_str_value is None:
+        return False
+    return XsdBoolean.from_xml(attr_str_value)
+
+def _CT_Transform2D_flipV_set(obj, value):
+    if value == False:
+        if 'flipV' in obj.attrib:
+            del obj.attrib['flipV']
+        return
+    str_value = XsdBoolean.to_xml(value)
+    obj.set('flipV', str_value)
+
+
+members['pptx.oxml.shapes.shared.CT_Transform2D'] = (
+    ('set', 'off', property(_CT_Transform2D_off, None, None)),
+    ('add', '_new_off', _CT_Transform2D_new_off),
+    ('add', '_insert_off', _CT_Transform2D_insert_off),
+    ('add', '_add_off', _CT_Transform2D_add_off),
+    ('add', 'get_or_add_off', _CT_Transform2D_get_or_add_off),
+    ('add', '_remove_off', _CT_Transform2D_remove_off),
+    ('set', 'ext', property(_CT_Transform2D_ext, None, None)),
+    ('add', '_new_ext', _CT_Transform2D_new_ext),
+    ('add', '_insert_ext', _CT_Transform2D_insert_ext),
+    ('add', '_add_ext', _CT_Transform2D_add_ext),
+    ('add', 'get_or_add_ext', _CT_Transform2D_get_or_add_ext),
+    ('add', '_remove_ext', _CT_Transform2D_remove_ext),
+    ('set', 'chOff', property(_CT_Transform2D_chOff, None, None)),
+    ('add', '_new_chOff', _CT_Transform2D_new_chOff),
+    ('add', '_insert_chOff', _CT_Transform2D_insert_chOff),
+    ('add', '_add_chOff', _CT_Transform2D_add_chOff),
+    ('add', 'get_or_add_chOff', _CT_Transform2D_get_or_add_chOff),
+    ('add', '_remove_chOff', _CT_Transform2D_remove_chOff),
+    ('set', 'chExt', property(_CT_Transform2D_chExt, None, None)),
+    ('add', '_new_chExt', _CT_Transform2D_new_chExt),
+    ('add', '_insert_chExt', _CT_Transform2D_insert_chExt),
+    ('add', '_add_chExt', _CT_Transform2D_add_chExt),
+    ('add', 'get_or_add_chExt', _CT_Transform2D_get_or_add_chExt),
+    ('add', '_remove_chExt', _CT_Transform2D_remove_chExt),
+    ('set', 'rot', property(_CT_Transform2D_rot_get, _CT_Transform2D_rot_set, None)),
+    ('set', 'flipH', property(_CT_Transform2D_flipH_get, _CT_Transform2D_flipH_set, None)),
+    ('set', 'flipV', property(_CT_Transform2D_flipV_get, _CT_Transform2D_flipV_set, None)),
+)
+
+
+# pptx.oxml.slide.CT_Background ---------------------------------------------
+
+def _CT_Background_bgPr(obj):
+    '``<p:bgPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}bgPr')
+
+def _CT_Background_new_bgPr(obj):
+    'Return a "loose", newly created ``<p:bgPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/presentationml/2006/main}bgPr', nsmap=_nsmap_p)
+
+def _CT_Background_insert_bgPr(obj, child):
+    'Return the passed ``<p:bgPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Background_add_bgPr(obj, **attrs):
+    'Add a new ``<p:bgPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_bgPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_bgPr(child)
+    return child
+
+def _CT_Background_get_or_add_bgPr(obj):
+    'Return the ``<p:bgPr>`` child element, newly added if not present.'
+    child = obj.bgPr
+    if child is None:
+        child = obj._add_bgPr()
+    return child
+
+def _CT_Background_remove_bgPr(obj):
+    'Remove all ``<p:bgPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/presentationml/2006/main}bgPr'):
+        obj.remove(child)
+
+def _CT_Background_bgRef(obj):
+    '``<p:bgRef>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}bgRef')
+
+def _CT_Background_new_bgRef(obj):
+    'Return a "loose", newly created ``<p:bgRef>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/presentationml/2006/main}bgRef', nsmap=_nsmap_p)
+
+def _CT_Background_insert_bgRef(obj, child):
+    'Return the passed ``<p:bgRef>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Background_add_bgRef(obj, **attrs):
+    'Add a new ``<p:bgRef>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_bgRef()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_bgRef(child)
+    return child
+
+def _CT_Background_get_or_add_bgRef(obj):
+    'Return the ``<p:bgRef>`` child element, newly added if not present.'
+    child = obj.bgRef
+    if child is None:
+        child = obj._add_bgRef()
+    return child
+
+def _CT_Background_remove_bgRef(obj):
+    'Remove all ``<p:bgRef>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/presentationml/2006/main}bgRef'):
+        obj.remove(child)
+
+
+members['pptx.oxml.slide.CT_Background'] = (
+    ('set', 'bgPr', property(_CT_Background_bgPr, None, None)),
+    ('add', '_new_bgPr', _CT_Background_new_bgPr),
+    ('add', '_insert_bgPr', _CT_Background_insert_bgPr),
+    ('add', '_add_bgPr', _CT_Background_add_bgPr),
+    ('add', 'get_or_add_bgPr', _CT_Background_get_or_add_bgPr),
+    ('add', '_remove_bgPr', _CT_Background_remove_bgPr),
+    ('set', 'bgRef', property(_CT_Background_bgRef, None, None)),
+    ('add', '_new_bgRef', _CT_Background_new_bgRef),
+    ('add', '_insert_bgRef', _CT_Background_insert_bgRef),
+    ('add', '_add_bgRef', _CT_Background_add_bgRef),
+    ('add', 'get_or_add_bgRef', _CT_Background_get_or_add_bgRef),
+    ('add', '_remove_bgRef', _CT_Background_remove_bgRef),
+)
+
+
+# pptx.oxml.slide.CT_BackgroundProperties -----------------------------------
+
+def _CT_BackgroundProperties_eg_fillProperties(obj):
+    'Return the child element belonging to this element group, or |None| if no member child is present.'
+    for clark_name in ('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill'):
+        child = obj.find(clark_name)
+        if child is not None:
+            return child
+    return None
+
+def _CT_BackgroundProperties_noFill(obj):
+    '``<a:noFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill')
+
+def _CT_BackgroundProperties_new_noFill(obj):
+    'Return a "loose", newly created ``<a:noFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill', nsmap=_nsmap_a)
+
+def _CT_BackgroundProperties_insert_noFill(obj, child):
+    'Return the passed ``<a:noFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_BackgroundProperties_add_noFill(obj, **attrs):
+    'Add a new ``<a:noFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_noFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_noFill(child)
+    return child
+
+def _CT_BackgroundProperties_get_or_change_to_noFill(obj):
+    'Return the ``<a:noFill>`` child, replacing any other group element if found.'
+    child = obj.noFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_noFill()
+    return child
+
+def _CT_BackgroundProperties_solidFill(obj):
+    '``<a:solidFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill')
+
+def _CT_BackgroundProperties_new_solidFill(obj):
+    'Return a "loose", newly created ``<a:solidFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill', nsmap=_nsmap_a)
+
+def _CT_BackgroundProperties_insert_solidFill(obj, child):
+    'Return the passed ``<a:solidFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_BackgroundProperties_add_solidFill(obj, **attrs):
+    'Add a new ``<a:solidFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_solidFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_solidFill(child)
+    return child
+
+def _CT_BackgroundProperties_get_or_change_to_solidFill(obj):
+    'Return the ``<a:solidFill>`` child, replacing any other group element if found.'
+    child = obj.solidFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_solidFill()
+    return child
+
+def _CT_BackgroundProperties_gradFill(obj):
+    '``<a:gradFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill')
+
+def _CT_BackgroundProperties_new_gradFill(obj):
+    'Return a "loose", newly created ``<a:gradFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill', nsmap=_nsmap_a)
+
+def _CT_BackgroundProperties_insert_gradFill(obj, child):
+    'Return the passed ``<a:gradFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_BackgroundProperties_add_gradFill(obj, **attrs):
+    'Add a new ``<a:gradFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_gradFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_gradFill(child)
+    return child
+
+def _CT_BackgroundProperties_get_or_change_to_gradFill(obj):
+    'Return the ``<a:gradFill>`` child, replacing any other group element if found.'
+    child = obj.gradFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_gradFill()
+    return child
+
+def _CT_BackgroundProperties_blipFill(obj):
+    '``<a:blipFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill')
+
+def _CT_BackgroundProperties_new_blipFill(obj):
+    'Return a "loose", newly created ``<a:blipFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill', nsmap=_nsmap_a)
+
+def _CT_BackgroundProperties_insert_blipFill(obj, child):
+    'Return the passed ``<a:blipFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_BackgroundProperties_add_blipFill(obj, **attrs):
+    'Add a new ``<a:blipFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_blipFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_blipFill(child)
+    return child
+
+def _CT_BackgroundProperties_get_or_change_to_blipFill(obj):
+    'Return the ``<a:blipFill>`` child, replacing any other group element if found.'
+    child = obj.blipFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_blipFill()
+    return child
+
+def _CT_BackgroundProperties_pattFill(obj):
+    '``<a:pattFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill')
+
+def _CT_BackgroundProperties_new_pattFill(obj):
+    'Return a "loose", newly created ``<a:pattFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill', nsmap=_nsmap_a)
+
+def _CT_BackgroundProperties_insert_pattFill(obj, child):
+    'Return the passed ``<a:pattFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_BackgroundProperties_add_pattFill(obj, **attrs):
+    'Add a new ``<a:pattFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_pattFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_pattFill(child)
+    return child
+
+def _CT_BackgroundProperties_get_or_change_to_pattFill(obj):
+    'Return the ``<a:pattFill>`` child, replacing any other group element if found.'
+    child = obj.pattFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_pattFill()
+    return child
+
+def _CT_BackgroundProperties_grpFill(obj):
+    '``<a:grpFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill')
+
+def _CT_BackgroundProperties_new_grpFill(obj):
+    'Return a "loose", newly created ``<a:grpFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill', nsmap=_nsmap_a)
+
+def _CT_BackgroundProperties_insert_grpFill(obj, child):
+    'Return the passed ``<a:grpFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_BackgroundProperties_add_grpFill(obj, **attrs):
+    'Add a new ``<a:grpFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_grpFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_grpFill(child)
+    return child
+
+def _CT_BackgroundProperties_get_or_change_to_grpFill(obj):
+    'Return the ``<a:grpFill>`` child, replacing any other group element if found.'
+    child = obj.grpFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_grpFill()
+    return child
+
+def _CT_BackgroundProperties_remove_eg_fillProperties(obj):
+    'Remove the current choice group child element if present.'
+    for clark_name in ('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill'):
+        for child in obj.findall(clark_name):
+            obj.remove(child)
+
+
+members['pptx.oxml.slide.CT_BackgroundProperties'] = (
+    ('set', 'eg_fillProperties', property(_CT_BackgroundProperties_eg_fillProperties, None, None)),
+    ('set', 'noFill', property(_CT_BackgroundProperties_noFill, None, None)),
+    ('add', '_new_noFill', _CT_BackgroundProperties_new_noFill),
+    ('add', '_insert_noFill', _CT_BackgroundProperties_insert_noFill),
+    ('add', '_add_noFill', _CT_BackgroundProperties_add_noFill),
+    ('add', 'get_or_change_to_noFill', _CT_BackgroundProperties_get_or_change_to_noFill),
+    ('set', 'solidFill', property(_CT_BackgroundProperties_solidFill, None, None)),
+    ('add', '_new_solidFill', _CT_BackgroundProperties_new_solidFill),
+    ('add', '_insert_solidFill', _CT_BackgroundProperties_insert_solidFill),
+    ('add', '_add_solidFill', _CT_BackgroundProperties_add_solidFill),
+    ('add', 'get_or_change_to_solidFill', _CT_BackgroundProperties_get_or_change_to_solidFill),
+    ('set', 'gradFill', property(_CT_BackgroundProperties_gradFill, None, None)),
+    ('add', '_new_gradFill', _CT_BackgroundProperties_new_gradFill),
+    ('add', '_insert_gradFill', _CT_BackgroundProperties_insert_gradFill),
+    ('add', '_add_gradFill', _CT_BackgroundProperties_add_gradFill),
+    ('add', 'get_or_change_to_gradFill', _CT_BackgroundProperties_get_or_change_to_gradFill),
+    ('set', 'blipFill', property(_CT_BackgroundProperties_blipFill, None, None)),
+    ('add', '_new_blipFill', _CT_BackgroundProperties_new_blipFill),
+    ('add', '_insert_blipFill', _CT_BackgroundProperties_insert_blipFill),
+    ('add', '_add_blipFill', _CT_BackgroundProperties_add_blipFill),
+    ('add', 'get_or_change_to_blipFill', _CT_BackgroundProperties_get_or_change_to_blipFill),
+    ('set', 'pattFill', property(_CT_BackgroundProperties_pattFill, None, None)),
+    ('add', '_new_pattFill', _CT_BackgroundProperties_new_pattFill),
+    ('add', '_insert_pattFill', _CT_BackgroundProperties_insert_pattFill),
+    ('add', '_add_pattFill', _CT_BackgroundProperties_add_pattFill),
+    ('add', 'get_or_change_to_pattFill', _CT_BackgroundProperties_get_or_change_to_pattFill),
+    ('set', 'grpFill', property(_CT_BackgroundProperties_grpFill, None, None)),
+    ('add', '_new_grpFill', _CT_BackgroundProperties_new_grpFill),
+    ('add', '_insert_grpFill', _CT_BackgroundProperties_insert_grpFill),
+    ('add', '_add_grpFill', _CT_BackgroundProperties_add_grpFill),
+    ('add', 'get_or_change_to_grpFill', _CT_BackgroundProperties_get_or_change_to_grpFill),
+    ('add', '_remove_eg_fillProperties', _CT_BackgroundProperties_remove_eg_fillProperties),
+)
+
+
+# pptx.oxml.slide.CT_CommonSlideData ----------------------------------------
+
+def _CT_CommonSlideData_bg(obj):
+    '``<p:bg>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}bg')
+
+def _CT_CommonSlideData_new_bg(obj):
+    'Return a "loose", newly created ``<p:bg>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/presentationml/2006/main}bg', nsmap=_nsmap_p)
+
+def _CT_CommonSlideData_insert_bg(obj, child):
+    'Return the passed ``<p:bg>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/presentationml/2006/main}spTree', '{http://schemas.openxmlformats.org/presentationml/2006/main}custDataLst', '{http://schemas.openxmlformats.org/presentationml/2006/main}controls', '{http://schemas.openxmlformats.org/presentationml/2006/main}extLst'))
+    return child
+
+def _CT_CommonSlideData_add_bg(obj, **attrs):
+    'Add a new ``<p:bg>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_bg()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_bg(child)
+    return child
+
+def _CT_CommonSlideData_get_or_add_bg(obj):
+    'Return the ``<p:bg>`` child element, newly added if not present.'
+    child = obj.bg
+    if child is None:
+        child = obj._add_bg()
+    return child
+
+def _CT_CommonSlideData_remove_bg(obj):
+    'Remove all ``<p:bg>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/presentationml/2006/main}bg'):
+        obj.remove(child)
+
+def _CT_CommonSlideData_spTree(obj):
+    'Required ``<p:spTree>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}spTree')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:spTree>`` child element not present'
+        )
+    return child
+
+def _CT_CommonSlideData_name_get(obj):
+    'XsdString type-converted value of ``name`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('name')
+    if attr_str_value is None:
+        return ''
+    return XsdString.from_xml(attr_str_value)
+
+def _CT_CommonSlideData_name_set(obj, value):
+    if value == '':
+        if 'name' in obj.attrib:
+            del obj.attrib['name']
+        return
+    str_value = XsdString.to_xml(value)
+    obj.set('name', str_value)
+
+
+members['pptx.oxml.slide.CT_CommonSlideData'] = (
+    ('set', 'bg', property(_CT_CommonSlideData_bg, None, None)),
+    ('add', '_new_bg', _CT_CommonSlideData_new_bg),
+    ('add', '_insert_bg', _CT_CommonSlideData_insert_bg),
+    ('add', '_add_bg', _CT_CommonSlideData_add_bg),
+    ('add', 'get_or_add_bg', _CT_CommonSlideData_get_or_add_bg),
+    ('add', '_remove_bg', _CT_CommonSlideData_remove_bg),
+    ('set', 'spTree', property(_CT_CommonSlideData_spTree, None, None)),
+    ('set', 'name', property(_CT_CommonSlideData_name_get, _CT_CommonSlideData_name_set, None)),
+)
+
+
+# pptx.oxml.slide.CT_NotesMaster --------------------------------------------
+
+def _CT_NotesMaster_cSld(obj):
+    'Required ``<p:cSld>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}cSld')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:cSld>`` child element not present'
+        )
+    return child
+
+
+members['pptx.oxml.slide.CT_NotesMaster'] = (
+    ('set', 'cSld', property(_CT_NotesMaster_cSld, None, None)),
+)
+
+
+# pptx.oxml.slide.CT_NotesSlide ---------------------------------------------
+
+def _CT_NotesSlide_cSld(obj):
+    'Required ``<p:cSld>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}cSld')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:cSld>`` child element not present'
+        )
+    return child
+
+
+members['pptx.oxml.slide.CT_NotesSlide'] = (
+    ('set', 'cSld', property(_CT_NotesSlide_cSld, None, None)),
+)
+
+
+# pptx.oxml.slide.CT_Slide --------------------------------------------------
+
+def _CT_Slide_cSld(obj):
+    'Required ``<p:cSld>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}cSld')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:cSld>`` child element not present'
+        )
+    return child
+
+def _CT_Slide_clrMapOvr(obj):
+    '``<p:clrMapOvr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}clrMapOvr')
+
+def _CT_Slide_new_clrMapOvr(obj):
+    'Return a "loose", newly created ``<p:clrMapOvr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/presentationml/2006/main}clrMapOvr', nsmap=_nsmap_p)
+
+def _CT_Slide_insert_clrMapOvr(obj, child):
+    'Return the passed ``<p:clrMapOvr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/presentationml/2006/main}transition', '{http://schemas.openxmlformats.org/presentationml/2006/main}timing', '{http://schemas.openxmlformats.org/presentationml/2006/main}extLst'))
+    return child
+
+def _CT_Slide_add_clrMapOvr(obj, **attrs):
+    'Add a new ``<p:clrMapOvr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_clrMapOvr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_clrMapOvr(child)
+    return child
+
+def _CT_Slide_get_or_add_clrMapOvr(obj):
+    'Return the ``<p:clrMapOvr>`` child element, newly added if not present.'
+    child = obj.clrMapOvr
+    if child is None:
+        child = obj._add_clrMapOvr()
+    return child
+
+def _CT_Slide_remove_clrMapOvr(obj):
+    'Remove all ``<p:clrMapOvr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/presentationml/2006/main}clrMapOvr'):
+        obj.remove(child)
+
+def _CT_Slide_timing(obj):
+    '``<p:timing>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}timing')
+
+def _CT_Slide_new_timing(obj):
+    'Return a "loose", newly created ``<p:timing>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/presentationml/2006/main}timing', nsmap=_nsmap_p)
+
+def _CT_Slide_insert_timing(obj, child):
+    'Return the passed ``<p:timing>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/presentationml/2006/main}extLst',))
+    return child
+
+def _CT_Slide_add_timing(obj, **attrs):
+    'Add a new ``<p:timing>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_timing()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_timing(child)
+    return child
+
+def _CT_Slide_get_or_add_timing(obj):
+    'Return the ``<p:timing>`` child element, newly added if not present.'
+    child = obj.timing
+    if child is None:
+        child = obj._add_timing()
+    return child
+
+def _CT_Slide_remove_timing(obj):
+    'Remove all ``<p:timing>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/presentationml/2006/main}timing'):
+        obj.remove(child)
+
+
+members['pptx.oxml.slide.CT_Slide'] = (
+    ('set', 'cSld', property(_CT_Slide_cSld, None, None)),
+    ('set', 'clrMapOvr', property(_CT_Slide_clrMapOvr, None, None)),
+    ('add', '_new_clrMapOvr', _CT_Slide_new_clrMapOvr),
+    ('add', '_insert_clrMapOvr', _CT_Slide_insert_clrMapOvr),
+    ('add', '_add_clrMapOvr', _CT_Slide_add_clrMapOvr),
+    ('add', 'get_or_add_clrMapOvr', _CT_Slide_get_or_add_clrMapOvr),
+    ('add', '_remove_clrMapOvr', _CT_Slide_remove_clrMapOvr),
+    ('set', 'timing', property(_CT_Slide_timing, None, None)),
+    ('add', '_new_timing', _CT_Slide_new_timing),
+    ('add', '_insert_timing', _CT_Slide_insert_timing),
+    ('add', '_add_timing', _CT_Slide_add_timing),
+    ('add', 'get_or_add_timing', _CT_Slide_get_or_add_timing),
+    ('add', '_remove_timing', _CT_Slide_remove_timing),
+)
+
+
+# pptx.oxml.slide.CT_SlideLayout --------------------------------------------
+
+def _CT_SlideLayout_cSld(obj):
+    'Required ``<p:cSld>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}cSld')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:cSld>`` child element not present'
+        )
+    return child
+
+
+members['pptx.oxml.slide.CT_SlideLayout'] = (
+    ('set', 'cSld', property(_CT_SlideLayout_cSld, None, None)),
+)
+
+
+# pptx.oxml.slide.CT_SlideLayoutIdList --------------------------------------
+
+def _CT_SlideLayoutIdList_sldLayoutId_lst(obj):
+    'A list containing each of the ``<p:sldLayoutId>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/presentationml/2006/main}sldLayoutId')
+
+def _CT_SlideLayoutIdList_new_sldLayoutId(obj):
+    'Return a "loose", newly created ``<p:sldLayoutId>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/presentationml/2006/main}sldLayoutId', nsmap=_nsmap_p)
+
+def _CT_SlideLayoutIdList_insert_sldLayoutId(obj, child):
+    'Return the passed ``<p:sldLayoutId>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_SlideLayoutIdList_add_sldLayoutId(obj, **attrs):
+    'Add a new ``<p:sldLayoutId>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_sldLayoutId()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_sldLayoutId(child)
+    return child
+
+
+members['pptx.oxml.slide.CT_SlideLayoutIdList'] = (
+    ('set', 'sldLayoutId_lst', property(_CT_SlideLayoutIdList_sldLayoutId_lst, None, None)),
+    ('add', '_new_sldLayoutId', _CT_SlideLayoutIdList_new_sldLayoutId),
+    ('add', '_insert_sldLayoutId', _CT_SlideLayoutIdList_insert_sldLayoutId),
+    ('add', '_add_sldLayoutId', _CT_SlideLayoutIdList_add_sldLayoutId),
+    ('del', 'sldLayoutId'),
+)
+
+
+# pptx.oxml.slide.CT_SlideLayoutIdListEntry ---------------------------------
+
+def _CT_SlideLayoutIdListEntry_rId_get(obj):
+    'XsdString type-converted value of ``r:id`` attribute.'
+    attr_str_value = obj.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'r:id' attribute not present on element %s" % obj.tag
+        )
+    return XsdString.from_xml(attr_str_value)
+
+def _CT_SlideLayoutIdListEntry_rId_set(obj, value):
+    str_value = XsdString.to_xml(value)
+    obj.set('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id', str_value)
+
+
+members['pptx.oxml.slide.CT_SlideLayoutIdListEntry'] = (
+    ('set', 'rId', property(_CT_SlideLayoutIdListEntry_rId_get, _CT_SlideLayoutIdListEntry_rId_set, None)),
+)
+
+
+# pptx.oxml.slide.CT_SlideMaster --------------------------------------------
+
+def _CT_SlideMaster_cSld(obj):
+    'Required ``<p:cSld>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}cSld')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:cSld>`` child element not present'
+        )
+    return child
+
+def _CT_SlideMaster_sldLayoutIdLst(obj):
+    '``<p:sldLayoutIdLst>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}sldLayoutIdLst')
+
+def _CT_SlideMaster_new_sldLayoutIdLst(obj):
+    'Return a "loose", newly created ``<p:sldLayoutIdLst>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/presentationml/2006/main}sldLayoutIdLst', nsmap=_nsmap_p)
+
+def _CT_SlideMaster_insert_sldLayoutIdLst(obj, child):
+    'Return the passed ``<p:sldLayoutIdLst>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/presentationml/2006/main}transition', '{http://schemas.openxmlformats.org/presentationml/2006/main}timing', '{http://schemas.openxmlformats.org/presentationml/2006/main}hf', '{http://schemas.openxmlformats.org/presentationml/2006/main}txStyles', '{http://schemas.openxmlformats.org/presentationml/2006/main}extLst'))
+    return child
+
+def _CT_SlideMaster_add_sldLayoutIdLst(obj, **attrs):
+    'Add a new ``<p:sldLayoutIdLst>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_sldLayoutIdLst()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_sldLayoutIdLst(child)
+    return child
+
+def _CT_SlideMaster_get_or_add_sldLayoutIdLst(obj):
+    'Return the ``<p:sldLayoutIdLst>`` child element, newly added if not present.'
+    child = obj.sldLayoutIdLst
+    if child is None:
+        child = obj._add_sldLayoutIdLst()
+    return child
+
+def _CT_SlideMaster_remove_sldLayoutIdLst(obj):
+    'Remove all ``<p:sldLayoutIdLst>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/presentationml/2006/main}sldLayoutIdLst'):
+        obj.remove(child)
+
+
+members['pptx.oxml.slide.CT_SlideMaster'] = (
+    ('set', 'cSld', property(_CT_SlideMaster_cSld, None, None)),
+    ('set', 'sldLayoutIdLst', property(_CT_SlideMaster_sldLayoutIdLst, None, None)),
+    ('add', '_new_sldLayoutIdLst', _CT_SlideMaster_new_sldLayoutIdLst),
+    ('add', '_insert_sldLayoutIdLst', _CT_SlideMaster_insert_sldLayoutIdLst),
+    ('add', '_add_sldLayoutIdLst', _CT_SlideMaster_add_sldLayoutIdLst),
+    ('add', 'get_or_add_sldLayoutIdLst', _CT_SlideMaster_get_or_add_sldLayoutIdLst),
+    ('add', '_remove_sldLayoutIdLst', _CT_SlideMaster_remove_sldLayoutIdLst),
+)
+
+
+# pptx.oxml.slide.CT_SlideTiming --------------------------------------------
+
+def _CT_SlideTiming_tnLst(obj):
+    '``<p:tnLst>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}tnLst')
+
+def _CT_SlideTiming_new_tnLst(obj):
+    'Return a "loose", newly created ``<p:tnLst>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/presentationml/2006/main}tnLst', nsmap=_nsmap_p)
+
+def _CT_SlideTiming_insert_tnLst(obj, child):
+    'Return the passed ``<p:tnLst>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/presentationml/2006/main}bldLst', '{http://schemas.openxmlformats.org/presentationml/2006/main}extLst'))
+    return child
+
+def _CT_SlideTiming_add_tnLst(obj, **attrs):
+    'Add a new ``<p:tnLst>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_tnLst()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_tnLst(child)
+    return child
+
+def _CT_SlideTiming_get_or_add_tnLst(obj):
+    'Return the ``<p:tnLst>`` child element, newly added if not present.'
+    child = obj.tnLst
+    if child is None:
+        child = obj._add_tnLst()
+    return child
+
+def _CT_SlideTiming_remove_tnLst(obj):
+    'Remove all ``<p:tnLst>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/presentationml/2006/main}tnLst'):
+        obj.remove(child)
+
+
+members['pptx.oxml.slide.CT_SlideTiming'] = (
+    ('set', 'tnLst', property(_CT_SlideTiming_tnLst, None, None)),
+    ('add', '_new_tnLst', _CT_SlideTiming_new_tnLst),
+    ('add', '_insert_tnLst', _CT_SlideTiming_insert_tnLst),
+    ('add', '_add_tnLst', _CT_SlideTiming_add_tnLst),
+    ('add', 'get_or_add_tnLst', _CT_SlideTiming_get_or_add_tnLst),
+    ('add', '_remove_tnLst', _CT_SlideTiming_remove_tnLst),
+)
+
+
+# pptx.oxml.slide.CT_TLMediaNodeVideo ---------------------------------------
+
+def _CT_TLMediaNodeVideo_cMediaNode(obj):
+    'Required ``<p:cMediaNode>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/presentationml/2006/main}cMediaNode')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<p:cMediaNode>`` child element not present'
+        )
+    return child
+
+
+members['pptx.oxml.slide.CT_TLMediaNodeVideo'] = (
+    ('set', 'cMediaNode', property(_CT_TLMediaNodeVideo_cMediaNode, None, None)),
+)
+
+
+# pptx.oxml.table.CT_Table --------------------------------------------------
+
+def _CT_Table_tblPr(obj):
+    '``<a:tblPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}tblPr')
+
+def _CT_Table_new_tblPr(obj):
+    'Return a "loose", newly created ``<a:tblPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}tblPr', nsmap=_nsmap_a)
+
+def _CT_Table_insert_tblPr(obj, child):
+    'Return the passed ``<a:tblPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}tblGrid', '{http://schemas.openxmlformats.org/drawingml/2006/main}tr'))
+    return child
+
+def _CT_Table_add_tblPr(obj, **attrs):
+    'Add a new ``<a:tblPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_tblPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_tblPr(child)
+    return child
+
+def _CT_Table_get_or_add_tblPr(obj):
+    'Return the ``<a:tblPr>`` child element, newly added if not present.'
+    child = obj.tblPr
+    if child is None:
+        child = obj._add_tblPr()
+    return child
+
+def _CT_Table_remove_tblPr(obj):
+    'Remove all ``<a:tblPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}tblPr'):
+        obj.remove(child)
+
+def _CT_Table_tblGrid(obj):
+    'Required ``<a:tblGrid>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}tblGrid')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<a:tblGrid>`` child element not present'
+        )
+    return child
+
+def _CT_Table_tr_lst(obj):
+    'A list containing each of the ``<a:tr>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}tr')
+
+def _CT_Table_new_tr(obj):
+    'Return a "loose", newly created ``<a:tr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}tr', nsmap=_nsmap_a)
+
+def _CT_Table_insert_tr(obj, child):
+    'Return the passed ``<a:tr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_Table_add_tr(obj, **attrs):
+    'Add a new ``<a:tr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_tr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_tr(child)
+    return child
+
+
+members['pptx.oxml.table.CT_Table'] = (
+    ('set', 'tblPr', property(_CT_Table_tblPr, None, None)),
+    ('add', '_new_tblPr', _CT_Table_new_tblPr),
+    ('add', '_insert_tblPr', _CT_Table_insert_tblPr),
+    ('add', '_add_tblPr', _CT_Table_add_tblPr),
+    ('add', 'get_or_add_tblPr', _CT_Table_get_or_add_tblPr),
+    ('add', '_remove_tblPr', _CT_Table_remove_tblPr),
+    ('set', 'tblGrid', property(_CT_Table_tblGrid, None, None)),
+    ('set', 'tr_lst', property(_CT_Table_tr_lst, None, None)),
+    ('add', '_new_tr', _CT_Table_new_tr),
+    ('add', '_insert_tr', _CT_Table_insert_tr),
+    ('add', '_add_tr', _CT_Table_add_tr),
+    ('del', 'tr'),
+)
+
+
+# pptx.oxml.table.CT_TableCell ----------------------------------------------
+
+def _CT_TableCell_txBody(obj):
+    '``<a:txBody>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}txBody')
+
+def _CT_TableCell_new_txBody(obj):
+    'Return a "loose", newly created ``<a:txBody>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}txBody', nsmap=_nsmap_a)
+
+def _CT_TableCell_insert_txBody(obj, child):
+    'Return the passed ``<a:txBody>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}tcPr', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TableCell_add_txBody(obj, **attrs):
+    'Add a new ``<a:txBody>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_txBody()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_txBody(child)
+    return child
+
+def _CT_TableCell_get_or_add_txBody(obj):
+    'Return the ``<a:txBody>`` child element, newly added if not present.'
+    child = obj.txBody
+    if child is None:
+        child = obj._add_txBody()
+    return child
+
+def _CT_TableCell_remove_txBody(obj):
+    'Remove all ``<a:txBody>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}txBody'):
+        obj.remove(child)
+
+def _CT_TableCell_tcPr(obj):
+    '``<a:tcPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}tcPr')
+
+def _CT_TableCell_new_tcPr(obj):
+    'Return a "loose", newly created ``<a:tcPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}tcPr', nsmap=_nsmap_a)
+
+def _CT_TableCell_insert_tcPr(obj, child):
+    'Return the passed ``<a:tcPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}extLst',))
+    return child
+
+def _CT_TableCell_add_tcPr(obj, **attrs):
+    'Add a new ``<a:tcPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_tcPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_tcPr(child)
+    return child
+
+def _CT_TableCell_get_or_add_tcPr(obj):
+    'Return the ``<a:tcPr>`` child element, newly added if not present.'
+    child = obj.tcPr
+    if child is None:
+        child = obj._add_tcPr()
+    return child
+
+def _CT_TableCell_remove_tcPr(obj):
+    'Remove all ``<a:tcPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}tcPr'):
+        obj.remove(child)
+
+def _CT_TableCell_gridSpan_get(obj):
+    'XsdInt type-converted value of ``gridSpan`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('gridSpan')
+    if attr_str_value is None:
+        return 1
+    return XsdInt.from_xml(attr_str_value)
+
+def _CT_TableCell_gridSpan_set(obj, value):
+    if value == 1:
+        if 'gridSpan' in obj.attrib:
+            del obj.attrib['gridSpan']
+        return
+    str_value = XsdInt.to_xml(value)
+    obj.set('gridSpan', str_value)
+
+def _CT_TableCell_rowSpan_get(obj):
+    'XsdInt type-converted value of ``rowSpan`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('rowSpan')
+    if attr_str_value is None:
+        return 1
+    return XsdInt.from_xml(attr_str_value)
+
+def _CT_TableCell_rowSpan_set(obj, value):
+    if value == 1:
+        if 'rowSpan' in obj.attrib:
+            del obj.attrib['rowSpan']
+        return
+    str_value = XsdInt.to_xml(value)
+    obj.set('rowSpan', str_value)
+
+def _CT_TableCell_hMerge_get(obj):
+    'XsdBoolean type-converted value of ``hMerge`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('hMerge')
+    if attr_str_value is None:
+        return False
+    return XsdBoolean.from_xml(attr_str_value)
+
+def _CT_TableCell_hMerge_set(obj, value):
+    if value == False:
+        if 'hMerge' in obj.attrib:
+            del obj.attrib['hMerge']
+        return
+    str_value = XsdBoolean.to_xml(value)
+    obj.set('hMerge', str_value)
+
+def _CT_TableCell_vMerge_get(obj):
+    'XsdBoolean type-converted value of ``vMerge`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('vMerge')
+    if attr_str_value is None:
+        return False
+    return XsdBoolean.from_xml(attr_str_value)
+
+def _CT_TableCell_vMerge_set(obj, value):
+    if value == False:
+        if 'vMerge' in obj.attrib:
+            del obj.attrib['vMerge']
+        return
+    str_value = XsdBoolean.to_xml(value)
+    obj.set('vMerge', str_value)
+
+
+members['pptx.oxml.table.CT_TableCell'] = (
+    ('set', 'txBody', property(_CT_TableCell_txBody, None, None)),
+    ('add', '_new_txBody', _CT_TableCell_new_txBody),
+    ('add', '_insert_txBody', _CT_TableCell_insert_txBody),
+    ('add', '_add_txBody', _CT_TableCell_add_txBody),
+    ('add', 'get_or_add_txBody', _CT_TableCell_get_or_add_txBody),
+    ('add', '_remove_txBody', _CT_TableCell_remove_txBody),
+    ('set', 'tcPr', property(_CT_TableCell_tcPr, None, None)),
+    ('add', '_new_tcPr', _CT_TableCell_new_tcPr),
+    ('add', '_insert_tcPr', _CT_TableCell_insert_tcPr),
+    ('add', '_add_tcPr', _CT_TableCell_add_tcPr),
+    ('add', 'get_or_add_tcPr', _CT_TableCell_get_or_add_tcPr),
+    ('add', '_remove_tcPr', _CT_TableCell_remove_tcPr),
+    ('set', 'gridSpan', property(_CT_TableCell_gridSpan_get, _CT_TableCell_gridSpan_set, None)),
+    ('set', 'rowSpan', property(_CT_TableCell_rowSpan_get, _CT_TableCell_rowSpan_set, None)),
+    ('set', 'hMerge', property(_CT_TableCell_hMerge_get, _CT_TableCell_hMerge_set, None)),
+    ('set', 'vMerge', property(_CT_TableCell_vMerge_get, _CT_TableCell_vMerge_set, None)),
+)
+
+
+# pptx.oxml.table.CT_TableCellProperties ------------------------------------
+
+def _CT_TableCellProperties_eg_fillProperties(obj):
+    'Return the child element belonging to this element group, or |None| if no member child is present.'
+    for clark_name in ('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill'):
+        child = obj.find(clark_name)
+        if child is not None:
+            return child
+    return None
+
+def _CT_TableCellProperties_noFill(obj):
+    '``<a:noFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill')
+
+def _CT_TableCellProperties_new_noFill(obj):
+    'Return a "loose", newly created ``<a:noFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill', nsmap=_nsmap_a)
+
+def _CT_TableCellProperties_insert_noFill(obj, child):
+    'Return the passed ``<a:noFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}headers', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TableCellProperties_add_noFill(obj, **attrs):
+    'Add a new ``<a:noFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_noFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_noFill(child)
+    return child
+
+def _CT_TableCellProperties_get_or_change_to_noFill(obj):
+    'Return the ``<a:noFill>`` child, replacing any other group element if found.'
+    child = obj.noFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_noFill()
+    return child
+
+def _CT_TableCellProperties_solidFill(obj):
+    '``<a:solidFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill')
+
+def _CT_TableCellProperties_new_solidFill(obj):
+    'Return a "loose", newly created ``<a:solidFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill', nsmap=_nsmap_a)
+
+def _CT_TableCellProperties_insert_solidFill(obj, child):
+    'Return the passed ``<a:solidFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}headers', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TableCellProperties_add_solidFill(obj, **attrs):
+    'Add a new ``<a:solidFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_solidFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_solidFill(child)
+    return child
+
+def _CT_TableCellProperties_get_or_change_to_solidFill(obj):
+    'Return the ``<a:solidFill>`` child, replacing any other group element if found.'
+    child = obj.solidFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_solidFill()
+    return child
+
+def _CT_TableCellProperties_gradFill(obj):
+    '``<a:gradFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill')
+
+def _CT_TableCellProperties_new_gradFill(obj):
+    'Return a "loose", newly created ``<a:gradFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill', nsmap=_nsmap_a)
+
+def _CT_TableCellProperties_insert_gradFill(obj, child):
+    'Return the passed ``<a:gradFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}headers', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TableCellProperties_add_gradFill(obj, **attrs):
+    'Add a new ``<a:gradFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_gradFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_gradFill(child)
+    return child
+
+def _CT_TableCellProperties_get_or_change_to_gradFill(obj):
+    'Return the ``<a:gradFill>`` child, replacing any other group element if found.'
+    child = obj.gradFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_gradFill()
+    return child
+
+def _CT_TableCellProperties_blipFill(obj):
+    '``<a:blipFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill')
+
+def _CT_TableCellProperties_new_blipFill(obj):
+    'Return a "loose", newly created ``<a:blipFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill', nsmap=_nsmap_a)
+
+def _CT_TableCellProperties_insert_blipFill(obj, child):
+    'Return the passed ``<a:blipFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}headers', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TableCellProperties_add_blipFill(obj, **attrs):
+    'Add a new ``<a:blipFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_blipFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_blipFill(child)
+    return child
+
+def _CT_TableCellProperties_get_or_change_to_blipFill(obj):
+    'Return the ``<a:blipFill>`` child, replacing any other group element if found.'
+    child = obj.blipFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_blipFill()
+    return child
+
+def _CT_TableCellProperties_pattFill(obj):
+    '``<a:pattFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill')
+
+def _CT_TableCellProperties_new_pattFill(obj):
+    'Return a "loose", newly created ``<a:pattFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill', nsmap=_nsmap_a)
+
+def _CT_TableCellProperties_insert_pattFill(obj, child):
+    'Return the passed ``<a:pattFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}headers', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TableCellProperties_add_pattFill(obj, **attrs):
+    'Add a new ``<a:pattFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_pattFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_pattFill(child)
+    return child
+
+def _CT_TableCellProperties_get_or_change_to_pattFill(obj):
+    'Return the ``<a:pattFill>`` child, replacing any other group element if found.'
+    child = obj.pattFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_pattFill()
+    return child
+
+def _CT_TableCellProperties_grpFill(obj):
+    '``<a:grpFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill')
+
+def _CT_TableCellProperties_new_grpFill(obj):
+    'Return a "loose", newly created ``<a:grpFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill', nsmap=_nsmap_a)
+
+def _CT_TableCellProperties_insert_grpFill(obj, child):
+    'Return the passed ``<a:grpFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}headers', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TableCellProperties_add_grpFill(obj, **attrs):
+    'Add a new ``<a:grpFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_grpFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_grpFill(child)
+    return child
+
+def _CT_TableCellProperties_get_or_change_to_grpFill(obj):
+    'Return the ``<a:grpFill>`` child, replacing any other group element if found.'
+    child = obj.grpFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_grpFill()
+    return child
+
+def _CT_TableCellProperties_remove_eg_fillProperties(obj):
+    'Remove the current choice group child element if present.'
+    for clark_name in ('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill'):
+        for child in obj.findall(clark_name):
+            obj.remove(child)
+
+def _CT_TableCellProperties_anchor_get(obj):
+    'MSO_VERTICAL_ANCHOR type-converted value of ``anchor`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('anchor')
+    if attr_str_value is None:
+        return None
+    return MSO_VERTICAL_ANCHOR.from_xml(attr_str_value)
+
+def _CT_TableCellProperties_anchor_set(obj, value):
+    if value == None:
+        if 'anchor' in obj.attrib:
+            del obj.attrib['anchor']
+        return
+    str_value = MSO_VERTICAL_ANCHOR.to_xml(value)
+    obj.set('anchor', str_value)
+
+def _CT_TableCellProperties_marL_get(obj):
+    'ST_Coordinate32 type-converted value of ``marL`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('marL')
+    if attr_str_value is None:
+        return None
+    return ST_Coordinate32.from_xml(attr_str_value)
+
+def _CT_TableCellProperties_marL_set(obj, value):
+    if value == None:
+        if 'marL' in obj.attrib:
+            del obj.attrib['marL']
+        return
+    str_value = ST_Coordinate32.to_xml(value)
+    obj.set('marL', str_value)
+
+def _CT_TableCellProperties_marR_get(obj):
+    'ST_Coordinate32 type-converted value of ``marR`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('marR')
+    if attr_str_value is None:
+        return None
+    return ST_Coordinate32.from_xml(attr_str_value)
+
+def _CT_TableCellProperties_marR_set(obj, value):
+    if value == None:
+        if 'marR' in obj.attrib:
+            del obj.attrib['marR']
+        return
+    str_value = ST_Coordinate32.to_xml(value)
+    obj.set('marR', str_value)
+
+def _CT_TableCellProperties_marT_get(obj):
+    'ST_Coordinate32 type-converted value of ``marT`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('marT')
+    if attr_str_value is None:
+        return None
+    return ST_Coordinate32.from_xml(attr_str_value)
+
+def _CT_TableCellProperties_marT_set(obj, value):
+    if value == None:
+        if 'marT' in obj.attrib:
+            del obj.attrib['marT']
+        return
+    str_value = ST_Coordinate32.to_xml(value)
+    obj.set('marT', str_value)
+
+def _CT_TableCellProperties_marB_get(obj):
+    'ST_Coordinate32 type-converted value of ``marB`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('marB')
+    if attr_str_value is None:
+        return None
+    return ST_Coordinate32.from_xml(attr_str_value)
+
+def _CT_TableCellProperties_marB_set(obj, value):
+    if value == None:
+        if 'marB' in obj.attrib:
+            del obj.attrib['marB']
+        return
+    str_value = ST_Coordinate32.to_xml(value)
+    obj.set('marB', str_value)
+
+
+members['pptx.oxml.table.CT_TableCellProperties'] = (
+    ('set', 'eg_fillProperties', property(_CT_TableCellProperties_eg_fillProperties, None, None)),
+    ('set', 'noFill', property(_CT_TableCellProperties_noFill, None, None)),
+    ('add', '_new_noFill', _CT_TableCellProperties_new_noFill),
+    ('add', '_insert_noFill', _CT_TableCellProperties_insert_noFill),
+    ('add', '_add_noFill', _CT_TableCellProperties_add_noFill),
+    ('add', 'get_or_change_to_noFill', _CT_TableCellProperties_get_or_change_to_noFill),
+    ('set', 'solidFill', property(_CT_TableCellProperties_solidFill, None, None)),
+    ('add', '_new_solidFill', _CT_TableCellProperties_new_solidFill),
+    ('add', '_insert_solidFill', _CT_TableCellProperties_insert_solidFill),
+    ('add', '_add_solidFill', _CT_TableCellProperties_add_solidFill),
+    ('add', 'get_or_change_to_solidFill', _CT_TableCellProperties_get_or_change_to_solidFill),
+    ('set', 'gradFill', property(_CT_TableCellProperties_gradFill, None, None)),
+    ('add', '_new_gradFill', _CT_TableCellProperties_new_gradFill),
+    ('add', '_insert_gradFill', _CT_TableCellProperties_insert_gradFill),
+    ('add', '_add_gradFill', _CT_TableCellProperties_add_gradFill),
+    ('add', 'get_or_change_to_gradFill', _CT_TableCellProperties_get_or_change_to_gradFill),
+    ('set', 'blipFill', property(_CT_TableCellProperties_blipFill, None, None)),
+    ('add', '_new_blipFill', _CT_TableCellProperties_new_blipFill),
+    ('add', '_insert_blipFill', _CT_TableCellProperties_insert_blipFill),
+    ('add', '_add_blipFill', _CT_TableCellProperties_add_blipFill),
+    ('add', 'get_or_change_to_blipFill', _CT_TableCellProperties_get_or_change_to_blipFill),
+    ('set', 'pattFill', property(_CT_TableCellProperties_pattFill, None, None)),
+    ('add', '_new_pattFill', _CT_TableCellProperties_new_pattFill),
+    ('add', '_insert_pattFill', _CT_TableCellProperties_insert_pattFill),
+    ('add', '_add_pattFill', _CT_TableCellProperties_add_pattFill),
+    ('add', 'get_or_change_to_pattFill', _CT_TableCellProperties_get_or_change_to_pattFill),
+    ('set', 'grpFill', property(_CT_TableCellProperties_grpFill, None, None)),
+    ('add', '_new_grpFill', _CT_TableCellProperties_new_grpFill),
+    ('add', '_insert_grpFill', _CT_TableCellProperties_insert_grpFill),
+    ('add', '_add_grpFill', _CT_TableCellProperties_add_grpFill),
+    ('add', 'get_or_change_to_grpFill', _CT_TableCellProperties_get_or_change_to_grpFill),
+    ('add', '_remove_eg_fillProperties', _CT_TableCellProperties_remove_eg_fillProperties),
+    ('set', 'anchor', property(_CT_TableCellProperties_anchor_get, _CT_TableCellProperties_anchor_set, None)),
+    ('set', 'marL', property(_CT_TableCellProperties_marL_get, _CT_TableCellProperties_marL_set, None)),
+    ('set', 'marR', property(_CT_TableCellProperties_marR_get, _CT_TableCellProperties_marR_set, None)),
+    ('set', 'marT', property(_CT_TableCellProperties_marT_get, _CT_TableCellProperties_marT_set, None)),
+    ('set', 'marB', property(_CT_TableCellProperties_marB_get, _CT_TableCellProperties_marB_set, None)),
+)
+
+
+# pptx.oxml.table.CT_TableCol -----------------------------------------------
+
+def _CT_TableCol_w_get(obj):
+    'ST_Coordinate type-converted value of ``w`` attribute.'
+    attr_str_value = obj.get('w')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'w' attribute not present on element %s" % obj.tag
+        )
+    return ST_Coordinate.from_xml(attr_str_value)
+
+def _CT_TableCol_w_set(obj, value):
+    str_value = ST_Coordinate.to_xml(value)
+    obj.set('w', str_value)
+
+
+members['pptx.oxml.table.CT_TableCol'] = (
+    ('set', 'w', property(_CT_TableCol_w_get, _CT_TableCol_w_set, None)),
+)
+
+
+# pptx.oxml.table.CT_TableGrid ----------------------------------------------
+
+def _CT_TableGrid_gridCol_lst(obj):
+    'A list containing each of the ``<a:gridCol>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}gridCol')
+
+def _CT_TableGrid_new_gridCol(obj):
+    'Return a "loose", newly created ``<a:gridCol>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}gridCol', nsmap=_nsmap_a)
+
+def _CT_TableGrid_insert_gridCol(obj, child):
+    'Return the passed ``<a:gridCol>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_TableGrid_add_gridCol(obj, **attrs):
+    'Add a new ``<a:gridCol>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_gridCol()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_gridCol(child)
+    return child
+
+
+members['pptx.oxml.table.CT_TableGrid'] = (
+    ('set', 'gridCol_lst', property(_CT_TableGrid_gridCol_lst, None, None)),
+    ('add', '_new_gridCol', _CT_TableGrid_new_gridCol),
+    ('add', '_insert_gridCol', _CT_TableGrid_insert_gridCol),
+    ('add', '_add_gridCol', _CT_TableGrid_add_gridCol),
+    ('del', 'gridCol'),
+)
+
+
+# pptx.oxml.table.CT_TableProperties ----------------------------------------
+
+def _CT_TableProperties_bandRow_get(obj):
+    'XsdBoolean type-converted value of ``bandRow`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('bandRow')
+    if attr_str_value is None:
+        return False
+    return XsdBoolean.from_xml(attr_str_value)
+
+def _CT_TableProperties_bandRow_set(obj, value):
+    if value == False:
+        if 'bandRow' in obj.attrib:
+            del obj.attrib['bandRow']
+        return
+    str_value = XsdBoolean.to_xml(value)
+    obj.set('bandRow', str_value)
+
+def _CT_TableProperties_bandCol_get(obj):
+    'XsdBoolean type-converted value of ``bandCol`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('bandCol')
+    if attr_str_value is None:
+        return False
+    return XsdBoolean.from_xml(attr_str_value)
+
+def _CT_TableProperties_bandCol_set(obj, value):
+    if value == False:
+        if 'bandCol' in obj.attrib:
+            del obj.attrib['bandCol']
+        return
+    str_value = XsdBoolean.to_xml(value)
+    obj.set('bandCol', str_value)
+
+def _CT_TableProperties_firstRow_get(obj):
+    'XsdBoolean type-converted value of ``firstRow`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('firstRow')
+    if attr_str_value is None:
+        return False
+    return XsdBoolean.from_xml(attr_str_value)
+
+def _CT_TableProperties_firstRow_set(obj, value):
+    if value == False:
+        if 'firstRow' in obj.attrib:
+            del obj.attrib['firstRow']
+        return
+    str_value = XsdBoolean.to_xml(value)
+    obj.set('firstRow', str_value)
+
+def _CT_TableProperties_firstCol_get(obj):
+    'XsdBoolean type-converted value of ``firstCol`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('firstCol')
+    if attr_str_value is None:
+        return False
+    return XsdBoolean.from_xml(attr_str_value)
+
+def _CT_TableProperties_firstCol_set(obj, value):
+    if value == False:
+        if 'firstCol' in obj.attrib:
+            del obj.attrib['firstCol']
+        return
+    str_value = XsdBoolean.to_xml(value)
+    obj.set('firstCol', str_value)
+
+def _CT_TableProperties_lastRow_get(obj):
+    'XsdBoolean type-converted value of ``lastRow`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('lastRow')
+    if attr_str_value is None:
+        return False
+    return XsdBoolean.from_xml(attr_str_value)
+
+def _CT_TableProperties_lastRow_set(obj, value):
+    if value == False:
+        if 'lastRow' in obj.attrib:
+            del obj.attrib['lastRow']
+        return
+    str_value = XsdBoolean.to_xml(value)
+    obj.set('lastRow', str_value)
+
+def _CT_TableProperties_lastCol_get(obj):
+    'XsdBoolean type-converted value of ``lastCol`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('lastCol')
+    if attr_str_value is None:
+        return False
+    return XsdBoolean.from_xml(attr_str_value)
+
+def _CT_TableProperties_lastCol_set(obj, value):
+    if value == False:
+        if 'lastCol' in obj.attrib:
+            del obj.attrib['lastCol']
+        return
+    str_value = XsdBoolean.to_xml(value)
+    obj.set('lastCol', str_value)
+
+
+members['pptx.oxml.table.CT_TableProperties'] = (
+    ('set', 'bandRow', property(_CT_TableProperties_bandRow_get, _CT_TableProperties_bandRow_set, None)),
+    ('set', 'bandCol', property(_CT_TableProperties_bandCol_get, _CT_TableProperties_bandCol_set, None)),
+    ('set', 'firstRow', property(_CT_TableProperties_firstRow_get, _CT_TableProperties_firstRow_set, None)),
+    ('set', 'firstCol', property(_CT_TableProperties_firstCol_get, _CT_TableProperties_firstCol_set, None)),
+    ('set', 'lastRow', property(_CT_TableProperties_lastRow_get, _CT_TableProperties_lastRow_set, None)),
+    ('set', 'lastCol', property(_CT_TableProperties_lastCol_get, _CT_TableProperties_lastCol_set, None)),
+)
+
+
+# pptx.oxml.table.CT_TableRow -----------------------------------------------
+
+def _CT_TableRow_tc_lst(obj):
+    'A list containing each of the ``<a:tc>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}tc')
+
+def _CT_TableRow_new_tc(obj):
+    'Return a "loose", newly created ``<a:tc>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}tc', nsmap=_nsmap_a)
+
+def _CT_TableRow_insert_tc(obj, child):
+    'Return the passed ``<a:tc>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}extLst',))
+    return child
+
+def _CT_TableRow_add_tc(obj, **attrs):
+    'Add a new ``<a:tc>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_tc()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_tc(child)
+    return child
+
+def _CT_TableRow_h_get(obj):
+    'ST_Coordinate type-converted value of ``h`` attribute.'
+    attr_str_value = obj.get('h')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'h' attribute not present on element %s" % obj.tag
+        )
+    return ST_Coordinate.from_xml(attr_str_value)
+
+def _CT_TableRow_h_set(obj, value):
+    str_value = ST_Coordinate.to_xml(value)
+    obj.set('h', str_value)
+
+
+members['pptx.oxml.table.CT_TableRow'] = (
+    ('set', 'tc_lst', property(_CT_TableRow_tc_lst, None, None)),
+    ('add', '_new_tc', _CT_TableRow_new_tc),
+    ('add', '_insert_tc', _CT_TableRow_insert_tc),
+    ('add', '_add_tc', _CT_TableRow_add_tc),
+    ('del', 'tc'),
+    ('set', 'h', property(_CT_TableRow_h_get, _CT_TableRow_h_set, None)),
+)
+
+
+# pptx.oxml.text.CT_RegularTextRun ------------------------------------------
+
+def _CT_RegularTextRun_rPr(obj):
+    '``<a:rPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}rPr')
+
+def _CT_RegularTextRun_new_rPr(obj):
+    'Return a "loose", newly created ``<a:rPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}rPr', nsmap=_nsmap_a)
+
+def _CT_RegularTextRun_insert_rPr(obj, child):
+    'Return the passed ``<a:rPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}t',))
+    return child
+
+def _CT_RegularTextRun_add_rPr(obj, **attrs):
+    'Add a new ``<a:rPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_rPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_rPr(child)
+    return child
+
+def _CT_RegularTextRun_get_or_add_rPr(obj):
+    'Return the ``<a:rPr>`` child element, newly added if not present.'
+    child = obj.rPr
+    if child is None:
+        child = obj._add_rPr()
+    return child
+
+def _CT_RegularTextRun_remove_rPr(obj):
+    'Remove all ``<a:rPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}rPr'):
+        obj.remove(child)
+
+def _CT_RegularTextRun_t(obj):
+    'Required ``<a:t>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}t')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<a:t>`` child element not present'
+        )
+    return child
+
+
+members['pptx.oxml.text.CT_RegularTextRun'] = (
+    ('set', 'rPr', property(_CT_RegularTextRun_rPr, None, None)),
+    ('add', '_new_rPr', _CT_RegularTextRun_new_rPr),
+    ('add', '_insert_rPr', _CT_RegularTextRun_insert_rPr),
+    ('add', '_add_rPr', _CT_RegularTextRun_add_rPr),
+    ('add', 'get_or_add_rPr', _CT_RegularTextRun_get_or_add_rPr),
+    ('add', '_remove_rPr', _CT_RegularTextRun_remove_rPr),
+    ('set', 't', property(_CT_RegularTextRun_t, None, None)),
+)
+
+
+# pptx.oxml.text.CT_TextBody ------------------------------------------------
+
+def _CT_TextBody_bodyPr(obj):
+    'Required ``<a:bodyPr>`` child element.'
+    child = obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}bodyPr')
+    if child is None:
+        raise InvalidXmlError(
+            'required ``<a:bodyPr>`` child element not present'
+        )
+    return child
+
+def _CT_TextBody_p_lst(obj):
+    'A list containing each of the ``<a:p>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}p')
+
+def _CT_TextBody_new_p(obj):
+    'Return a "loose", newly created ``<a:p>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}p', nsmap=_nsmap_a)
+
+def _CT_TextBody_insert_p(obj, child):
+    'Return the passed ``<a:p>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_TextBody_add_p(obj, **attrs):
+    'Add a new ``<a:p>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_p()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_p(child)
+    return child
+
+def _CT_TextBody_add_p_2(obj):
+    'Add a new ``<a:p>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._add_p()
+    return child
+
+
+members['pptx.oxml.text.CT_TextBody'] = (
+    ('set', 'bodyPr', property(_CT_TextBody_bodyPr, None, None)),
+    ('set', 'p_lst', property(_CT_TextBody_p_lst, None, None)),
+    ('add', '_new_p', _CT_TextBody_new_p),
+    ('add', '_insert_p', _CT_TextBody_insert_p),
+    ('add', '_add_p', _CT_TextBody_add_p),
+    ('add', 'add_p', _CT_TextBody_add_p_2),
+    ('del', 'p'),
+)
+
+
+# pptx.oxml.text.CT_TextBodyProperties --------------------------------------
+
+def _CT_TextBodyProperties_eg_textAutoFit(obj):
+    'Return the child element belonging to this element group, or |None| if no member child is present.'
+    for clark_name in ('{http://schemas.openxmlformats.org/drawingml/2006/main}noAutofit', '{http://schemas.openxmlformats.org/drawingml/2006/main}normAutofit', '{http://schemas.openxmlformats.org/drawingml/2006/main}spAutoFit'):
+        child = obj.find(clark_name)
+        if child is not None:
+            return child
+    return None
+
+def _CT_TextBodyProperties_noAutofit(obj):
+    '``<a:noAutofit>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}noAutofit')
+
+def _CT_TextBodyProperties_new_noAutofit(obj):
+    'Return a "loose", newly created ``<a:noAutofit>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}noAutofit', nsmap=_nsmap_a)
+
+def _CT_TextBodyProperties_insert_noAutofit(obj, child):
+    'Return the passed ``<a:noAutofit>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}scene3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}sp3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}flatTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TextBodyProperties_add_noAutofit(obj, **attrs):
+    'Add a new ``<a:noAutofit>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_noAutofit()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_noAutofit(child)
+    return child
+
+def _CT_TextBodyProperties_get_or_change_to_noAutofit(obj):
+    'Return the ``<a:noAutofit>`` child, replacing any other group element if found.'
+    child = obj.noAutofit
+    if child is not None:
+        return child
+    obj._remove_eg_textAutoFit()
+    child = obj._add_noAutofit()
+    return child
+
+def _CT_TextBodyProperties_normAutofit(obj):
+    '``<a:normAutofit>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}normAutofit')
+
+def _CT_TextBodyProperties_new_normAutofit(obj):
+    'Return a "loose", newly created ``<a:normAutofit>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}normAutofit', nsmap=_nsmap_a)
+
+def _CT_TextBodyProperties_insert_normAutofit(obj, child):
+    'Return the passed ``<a:normAutofit>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}scene3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}sp3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}flatTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TextBodyProperties_add_normAutofit(obj, **attrs):
+    'Add a new ``<a:normAutofit>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_normAutofit()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_normAutofit(child)
+    return child
+
+def _CT_TextBodyProperties_get_or_change_to_normAutofit(obj):
+    'Return the ``<a:normAutofit>`` child, replacing any other group element if found.'
+    child = obj.normAutofit
+    if child is not None:
+        return child
+    obj._remove_eg_textAutoFit()
+    child = obj._add_normAutofit()
+    return child
+
+def _CT_TextBodyProperties_spAutoFit(obj):
+    '``<a:spAutoFit>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}spAutoFit')
+
+def _CT_TextBodyProperties_new_spAutoFit(obj):
+    'Return a "loose", newly created ``<a:spAutoFit>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}spAutoFit', nsmap=_nsmap_a)
+
+def _CT_TextBodyProperties_insert_spAutoFit(obj, child):
+    'Return the passed ``<a:spAutoFit>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}scene3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}sp3d', '{http://schemas.openxmlformats.org/drawingml/2006/main}flatTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TextBodyProperties_add_spAutoFit(obj, **attrs):
+    'Add a new ``<a:spAutoFit>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_spAutoFit()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_spAutoFit(child)
+    return child
+
+def _CT_TextBodyProperties_get_or_change_to_spAutoFit(obj):
+    'Return the ``<a:spAutoFit>`` child, replacing any other group element if found.'
+    child = obj.spAutoFit
+    if child is not None:
+        return child
+    obj._remove_eg_textAutoFit()
+    child = obj._add_spAutoFit()
+    return child
+
+def _CT_TextBodyProperties_remove_eg_textAutoFit(obj):
+    'Remove the current choice group child element if present.'
+    for clark_name in ('{http://schemas.openxmlformats.org/drawingml/2006/main}noAutofit', '{http://schemas.openxmlformats.org/drawingml/2006/main}normAutofit', '{http://schemas.openxmlformats.org/drawingml/2006/main}spAutoFit'):
+        for child in obj.findall(clark_name):
+            obj.remove(child)
+
+_CT_TextBodyProperties_lIns_default = Emu(91440)
+
+def _CT_TextBodyProperties_lIns_get(obj):
+    'ST_Coordinate32 type-converted value of ``lIns`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('lIns')
+    if attr_str_value is None:
+        return _CT_TextBodyProperties_lIns_default
+    return ST_Coordinate32.from_xml(attr_str_value)
+
+def _CT_TextBodyProperties_lIns_set(obj, value):
+    if value == _CT_TextBodyProperties_lIns_default:
+        if 'lIns' in obj.attrib:
+            del obj.attrib['lIns']
+        return
+    str_value = ST_Coordinate32.to_xml(value)
+    obj.set('lIns', str_value)
+
+_CT_TextBodyProperties_tIns_default = Emu(45720)
+
+def _CT_TextBodyProperties_tIns_get(obj):
+    'ST_Coordinate32 type-converted value of ``tIns`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('tIns')
+    if attr_str_value is None:
+        return _CT_TextBodyProperties_tIns_default
+    return ST_Coordinate32.from_xml(attr_str_value)
+
+def _CT_TextBodyProperties_tIns_set(obj, value):
+    if value == _CT_TextBodyProperties_tIns_default:
+        if 'tIns' in obj.attrib:
+            del obj.attrib['tIns']
+        return
+    str_value = ST_Coordinate32.to_xml(value)
+    obj.set('tIns', str_value)
+
+_CT_TextBodyProperties_rIns_default = Emu(91440)
+
+def _CT_TextBodyProperties_rIns_get(obj):
+    'ST_Coordinate32 type-converted value of ``rIns`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('rIns')
+    if attr_str_value is None:
+        return _CT_TextBodyProperties_rIns_default
+    return ST_Coordinate32.from_xml(attr_str_value)
+
+def _CT_TextBodyProperties_rIns_set(obj, value):
+    if value == _CT_TextBodyProperties_rIns_default:
+        if 'rIns' in obj.attrib:
+            del obj.attrib['rIns']
+        return
+    str_value = ST_Coordinate32.to_xml(value)
+    obj.set('rIns', str_value)
+
+_CT_TextBodyProperties_bIns_default = Emu(45720)
+
+def _CT_TextBodyProperties_bIns_get(obj):
+    'ST_Coordinate32 type-converted value of ``bIns`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('bIns')
+    if attr_str_value is None:
+        return _CT_TextBodyProperties_bIns_default
+    return ST_Coordinate32.from_xml(attr_str_value)
+
+def _CT_TextBodyProperties_bIns_set(obj, value):
+    if value == _CT_TextBodyProperties_bIns_default:
+        if 'bIns' in obj.attrib:
+            del obj.attrib['bIns']
+        return
+    str_value = ST_Coordinate32.to_xml(value)
+    obj.set('bIns', str_value)
+
+def _CT_TextBodyProperties_anchor_get(obj):
+    'MSO_VERTICAL_ANCHOR type-converted value of ``anchor`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('anchor')
+    if attr_str_value is None:
+        return None
+    return MSO_VERTICAL_ANCHOR.from_xml(attr_str_value)
+
+def _CT_TextBodyProperties_anchor_set(obj, value):
+    if value == None:
+        if 'anchor' in obj.attrib:
+            del obj.attrib['anchor']
+        return
+    str_value = MSO_VERTICAL_ANCHOR.to_xml(value)
+    obj.set('anchor', str_value)
+
+def _CT_TextBodyProperties_wrap_get(obj):
+    'ST_TextWrappingType type-converted value of ``wrap`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('wrap')
+    if attr_str_value is None:
+        return None
+    return ST_TextWrappingType.from_xml(attr_str_value)
+
+def _CT_TextBodyProperties_wrap_set(obj, value):
+    if value == None:
+        if 'wrap' in obj.attrib:
+            del obj.attrib['wrap']
+        return
+    str_value = ST_TextWrappingType.to_xml(value)
+    obj.set('wrap', str_value)
+
+
+members['pptx.oxml.text.CT_TextBodyProperties'] = (
+    ('set', 'eg_textAutoFit', property(_CT_TextBodyProperties_eg_textAutoFit, None, None)),
+    ('set', 'noAutofit', property(_CT_TextBodyProperties_noAutofit, None, None)),
+    ('add', '_new_noAutofit', _CT_TextBodyProperties_new_noAutofit),
+    ('add', '_insert_noAutofit', _CT_TextBodyProperties_insert_noAutofit),
+    ('add', '_add_noAutofit', _CT_TextBodyProperties_add_noAutofit),
+    ('add', 'get_or_change_to_noAutofit', _CT_TextBodyProperties_get_or_change_to_noAutofit),
+    ('set', 'normAutofit', property(_CT_TextBodyProperties_normAutofit, None, None)),
+    ('add', '_new_normAutofit', _CT_TextBodyProperties_new_normAutofit),
+    ('add', '_insert_normAutofit', _CT_TextBodyProperties_insert_normAutofit),
+    ('add', '_add_normAutofit', _CT_TextBodyProperties_add_normAutofit),
+    ('add', 'get_or_change_to_normAutofit', _CT_TextBodyProperties_get_or_change_to_normAutofit),
+    ('set', 'spAutoFit', property(_CT_TextBodyProperties_spAutoFit, None, None)),
+    ('add', '_new_spAutoFit', _CT_TextBodyProperties_new_spAutoFit),
+    ('add', '_insert_spAutoFit', _CT_TextBodyProperties_insert_spAutoFit),
+    ('add', '_add_spAutoFit', _CT_TextBodyProperties_add_spAutoFit),
+    ('add', 'get_or_change_to_spAutoFit', _CT_TextBodyProperties_get_or_change_to_spAutoFit),
+    ('add', '_remove_eg_textAutoFit', _CT_TextBodyProperties_remove_eg_textAutoFit),
+    ('set', 'lIns', property(_CT_TextBodyProperties_lIns_get, _CT_TextBodyProperties_lIns_set, None)),
+    ('set', 'tIns', property(_CT_TextBodyProperties_tIns_get, _CT_TextBodyProperties_tIns_set, None)),
+    ('set', 'rIns', property(_CT_TextBodyProperties_rIns_get, _CT_TextBodyProperties_rIns_set, None)),
+    ('set', 'bIns', property(_CT_TextBodyProperties_bIns_get, _CT_TextBodyProperties_bIns_set, None)),
+    ('set', 'anchor', property(_CT_TextBodyProperties_anchor_get, _CT_TextBodyProperties_anchor_set, None)),
+    ('set', 'wrap', property(_CT_TextBodyProperties_wrap_get, _CT_TextBodyProperties_wrap_set, None)),
+)
+
+
+# pptx.oxml.text.CT_TextCharacterProperties ---------------------------------
+
+def _CT_TextCharacterProperties_eg_fillProperties(obj):
+    'Return the child element belonging to this element group, or |None| if no member child is present.'
+    for clark_name in ('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill'):
+        child = obj.find(clark_name)
+        if child is not None:
+            return child
+    return None
+
+def _CT_TextCharacterProperties_noFill(obj):
+    '``<a:noFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill')
+
+def _CT_TextCharacterProperties_new_noFill(obj):
+    'Return a "loose", newly created ``<a:noFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill', nsmap=_nsmap_a)
+
+def _CT_TextCharacterProperties_insert_noFill(obj, child):
+    'Return the passed ``<a:noFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}highlight', '{http://schemas.openxmlformats.org/drawingml/2006/main}uLnTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}uLn', '{http://schemas.openxmlformats.org/drawingml/2006/main}uFillTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}uFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}latin', '{http://schemas.openxmlformats.org/drawingml/2006/main}ea', '{http://schemas.openxmlformats.org/drawingml/2006/main}cs', '{http://schemas.openxmlformats.org/drawingml/2006/main}sym', '{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkClick', '{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkMouseOver', '{http://schemas.openxmlformats.org/drawingml/2006/main}rtl', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TextCharacterProperties_add_noFill(obj, **attrs):
+    'Add a new ``<a:noFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_noFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_noFill(child)
+    return child
+
+def _CT_TextCharacterProperties_get_or_change_to_noFill(obj):
+    'Return the ``<a:noFill>`` child, replacing any other group element if found.'
+    child = obj.noFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_noFill()
+    return child
+
+def _CT_TextCharacterProperties_solidFill(obj):
+    '``<a:solidFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill')
+
+def _CT_TextCharacterProperties_new_solidFill(obj):
+    'Return a "loose", newly created ``<a:solidFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill', nsmap=_nsmap_a)
+
+def _CT_TextCharacterProperties_insert_solidFill(obj, child):
+    'Return the passed ``<a:solidFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}highlight', '{http://schemas.openxmlformats.org/drawingml/2006/main}uLnTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}uLn', '{http://schemas.openxmlformats.org/drawingml/2006/main}uFillTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}uFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}latin', '{http://schemas.openxmlformats.org/drawingml/2006/main}ea', '{http://schemas.openxmlformats.org/drawingml/2006/main}cs', '{http://schemas.openxmlformats.org/drawingml/2006/main}sym', '{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkClick', '{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkMouseOver', '{http://schemas.openxmlformats.org/drawingml/2006/main}rtl', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TextCharacterProperties_add_solidFill(obj, **attrs):
+    'Add a new ``<a:solidFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_solidFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_solidFill(child)
+    return child
+
+def _CT_TextCharacterProperties_get_or_change_to_solidFill(obj):
+    'Return the ``<a:solidFill>`` child, replacing any other group element if found.'
+    child = obj.solidFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_solidFill()
+    return child
+
+def _CT_TextCharacterProperties_gradFill(obj):
+    '``<a:gradFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill')
+
+def _CT_TextCharacterProperties_new_gradFill(obj):
+    'Return a "loose", newly created ``<a:gradFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill', nsmap=_nsmap_a)
+
+def _CT_TextCharacterProperties_insert_gradFill(obj, child):
+    'Return the passed ``<a:gradFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}highlight', '{http://schemas.openxmlformats.org/drawingml/2006/main}uLnTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}uLn', '{http://schemas.openxmlformats.org/drawingml/2006/main}uFillTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}uFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}latin', '{http://schemas.openxmlformats.org/drawingml/2006/main}ea', '{http://schemas.openxmlformats.org/drawingml/2006/main}cs', '{http://schemas.openxmlformats.org/drawingml/2006/main}sym', '{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkClick', '{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkMouseOver', '{http://schemas.openxmlformats.org/drawingml/2006/main}rtl', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TextCharacterProperties_add_gradFill(obj, **attrs):
+    'Add a new ``<a:gradFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_gradFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_gradFill(child)
+    return child
+
+def _CT_TextCharacterProperties_get_or_change_to_gradFill(obj):
+    'Return the ``<a:gradFill>`` child, replacing any other group element if found.'
+    child = obj.gradFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_gradFill()
+    return child
+
+def _CT_TextCharacterProperties_blipFill(obj):
+    '``<a:blipFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill')
+
+def _CT_TextCharacterProperties_new_blipFill(obj):
+    'Return a "loose", newly created ``<a:blipFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill', nsmap=_nsmap_a)
+
+def _CT_TextCharacterProperties_insert_blipFill(obj, child):
+    'Return the passed ``<a:blipFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}highlight', '{http://schemas.openxmlformats.org/drawingml/2006/main}uLnTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}uLn', '{http://schemas.openxmlformats.org/drawingml/2006/main}uFillTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}uFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}latin', '{http://schemas.openxmlformats.org/drawingml/2006/main}ea', '{http://schemas.openxmlformats.org/drawingml/2006/main}cs', '{http://schemas.openxmlformats.org/drawingml/2006/main}sym', '{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkClick', '{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkMouseOver', '{http://schemas.openxmlformats.org/drawingml/2006/main}rtl', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TextCharacterProperties_add_blipFill(obj, **attrs):
+    'Add a new ``<a:blipFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_blipFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_blipFill(child)
+    return child
+
+def _CT_TextCharacterProperties_get_or_change_to_blipFill(obj):
+    'Return the ``<a:blipFill>`` child, replacing any other group element if found.'
+    child = obj.blipFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_blipFill()
+    return child
+
+def _CT_TextCharacterProperties_pattFill(obj):
+    '``<a:pattFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill')
+
+def _CT_TextCharacterProperties_new_pattFill(obj):
+    'Return a "loose", newly created ``<a:pattFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill', nsmap=_nsmap_a)
+
+def _CT_TextCharacterProperties_insert_pattFill(obj, child):
+    'Return the passed ``<a:pattFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}highlight', '{http://schemas.openxmlformats.org/drawingml/2006/main}uLnTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}uLn', '{http://schemas.openxmlformats.org/drawingml/2006/main}uFillTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}uFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}latin', '{http://schemas.openxmlformats.org/drawingml/2006/main}ea', '{http://schemas.openxmlformats.org/drawingml/2006/main}cs', '{http://schemas.openxmlformats.org/drawingml/2006/main}sym', '{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkClick', '{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkMouseOver', '{http://schemas.openxmlformats.org/drawingml/2006/main}rtl', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TextCharacterProperties_add_pattFill(obj, **attrs):
+    'Add a new ``<a:pattFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_pattFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_pattFill(child)
+    return child
+
+def _CT_TextCharacterProperties_get_or_change_to_pattFill(obj):
+    'Return the ``<a:pattFill>`` child, replacing any other group element if found.'
+    child = obj.pattFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_pattFill()
+    return child
+
+def _CT_TextCharacterProperties_grpFill(obj):
+    '``<a:grpFill>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill')
+
+def _CT_TextCharacterProperties_new_grpFill(obj):
+    'Return a "loose", newly created ``<a:grpFill>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill', nsmap=_nsmap_a)
+
+def _CT_TextCharacterProperties_insert_grpFill(obj, child):
+    'Return the passed ``<a:grpFill>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}effectLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}effectDag', '{http://schemas.openxmlformats.org/drawingml/2006/main}highlight', '{http://schemas.openxmlformats.org/drawingml/2006/main}uLnTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}uLn', '{http://schemas.openxmlformats.org/drawingml/2006/main}uFillTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}uFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}latin', '{http://schemas.openxmlformats.org/drawingml/2006/main}ea', '{http://schemas.openxmlformats.org/drawingml/2006/main}cs', '{http://schemas.openxmlformats.org/drawingml/2006/main}sym', '{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkClick', '{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkMouseOver', '{http://schemas.openxmlformats.org/drawingml/2006/main}rtl', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TextCharacterProperties_add_grpFill(obj, **attrs):
+    'Add a new ``<a:grpFill>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_grpFill()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_grpFill(child)
+    return child
+
+def _CT_TextCharacterProperties_get_or_change_to_grpFill(obj):
+    'Return the ``<a:grpFill>`` child, replacing any other group element if found.'
+    child = obj.grpFill
+    if child is not None:
+        return child
+    obj._remove_eg_fillProperties()
+    child = obj._add_grpFill()
+    return child
+
+def _CT_TextCharacterProperties_remove_eg_fillProperties(obj):
+    'Remove the current choice group child element if present.'
+    for clark_name in ('{http://schemas.openxmlformats.org/drawingml/2006/main}noFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}gradFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}blipFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}pattFill', '{http://schemas.openxmlformats.org/drawingml/2006/main}grpFill'):
+        for child in obj.findall(clark_name):
+            obj.remove(child)
+
+def _CT_TextCharacterProperties_latin(obj):
+    '``<a:latin>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}latin')
+
+def _CT_TextCharacterProperties_new_latin(obj):
+    'Return a "loose", newly created ``<a:latin>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}latin', nsmap=_nsmap_a)
+
+def _CT_TextCharacterProperties_insert_latin(obj, child):
+    'Return the passed ``<a:latin>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}ea', '{http://schemas.openxmlformats.org/drawingml/2006/main}cs', '{http://schemas.openxmlformats.org/drawingml/2006/main}sym', '{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkClick', '{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkMouseOver', '{http://schemas.openxmlformats.org/drawingml/2006/main}rtl', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TextCharacterProperties_add_latin(obj, **attrs):
+    'Add a new ``<a:latin>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_latin()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_latin(child)
+    return child
+
+def _CT_TextCharacterProperties_get_or_add_latin(obj):
+    'Return the ``<a:latin>`` child element, newly added if not present.'
+    child = obj.latin
+    if child is None:
+        child = obj._add_latin()
+    return child
+
+def _CT_TextCharacterProperties_remove_latin(obj):
+    'Remove all ``<a:latin>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}latin'):
+        obj.remove(child)
+
+def _CT_TextCharacterProperties_hlinkClick(obj):
+    '``<a:hlinkClick>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkClick')
+
+def _CT_TextCharacterProperties_new_hlinkClick(obj):
+    'Return a "loose", newly created ``<a:hlinkClick>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkClick', nsmap=_nsmap_a)
+
+def _CT_TextCharacterProperties_insert_hlinkClick(obj, child):
+    'Return the passed ``<a:hlinkClick>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkMouseOver', '{http://schemas.openxmlformats.org/drawingml/2006/main}rtl', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TextCharacterProperties_add_hlinkClick(obj, **attrs):
+    'Add a new ``<a:hlinkClick>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_hlinkClick()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_hlinkClick(child)
+    return child
+
+def _CT_TextCharacterProperties_get_or_add_hlinkClick(obj):
+    'Return the ``<a:hlinkClick>`` child element, newly added if not present.'
+    child = obj.hlinkClick
+    if child is None:
+        child = obj._add_hlinkClick()
+    return child
+
+def _CT_TextCharacterProperties_remove_hlinkClick(obj):
+    'Remove all ``<a:hlinkClick>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}hlinkClick'):
+        obj.remove(child)
+
+def _CT_TextCharacterProperties_lang_get(obj):
+    'MSO_LANGUAGE_ID type-converted value of ``lang`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('lang')
+    if attr_str_value is None:
+        return None
+    return MSO_LANGUAGE_ID.from_xml(attr_str_value)
+
+def _CT_TextCharacterProperties_lang_set(obj, value):
+    if value == None:
+        if 'lang' in obj.attrib:
+            del obj.attrib['lang']
+        return
+    str_value = MSO_LANGUAGE_ID.to_xml(value)
+    obj.set('lang', str_value)
+
+def _CT_TextCharacterProperties_sz_get(obj):
+    'ST_TextFontSize type-converted value of ``sz`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('sz')
+    if attr_str_value is None:
+        return None
+    return ST_TextFontSize.from_xml(attr_str_value)
+
+def _CT_TextCharacterProperties_sz_set(obj, value):
+    if value == None:
+        if 'sz' in obj.attrib:
+            del obj.attrib['sz']
+        return
+    str_value = ST_TextFontSize.to_xml(value)
+    obj.set('sz', str_value)
+
+def _CT_TextCharacterProperties_b_get(obj):
+    'XsdBoolean type-converted value of ``b`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('b')
+    if attr_str_value is None:
+        return None
+    return XsdBoolean.from_xml(attr_str_value)
+
+def _CT_TextCharacterProperties_b_set(obj, value):
+    if value == None:
+        if 'b' in obj.attrib:
+            del obj.attrib['b']
+        return
+    str_value = XsdBoolean.to_xml(value)
+    obj.set('b', str_value)
+
+def _CT_TextCharacterProperties_i_get(obj):
+    'XsdBoolean type-converted value of ``i`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('i')
+    if attr_str_value is None:
+        return None
+    return XsdBoolean.from_xml(attr_str_value)
+
+def _CT_TextCharacterProperties_i_set(obj, value):
+    if value == None:
+        if 'i' in obj.attrib:
+            del obj.attrib['i']
+        return
+    str_value = XsdBoolean.to_xml(value)
+    obj.set('i', str_value)
+
+def _CT_TextCharacterProperties_u_get(obj):
+    'MSO_TEXT_UNDERLINE_TYPE type-converted value of ``u`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('u')
+    if attr_str_value is None:
+        return None
+    return MSO_TEXT_UNDERLINE_TYPE.from_xml(attr_str_value)
+
+def _CT_TextCharacterProperties_u_set(obj, value):
+    if value == None:
+        if 'u' in obj.attrib:
+            del obj.attrib['u']
+        return
+    str_value = MSO_TEXT_UNDERLINE_TYPE.to_xml(value)
+    obj.set('u', str_value)
+
+
+members['pptx.oxml.text.CT_TextCharacterProperties'] = (
+    ('set', 'eg_fillProperties', property(_CT_TextCharacterProperties_eg_fillProperties, None, None)),
+    ('set', 'noFill', property(_CT_TextCharacterProperties_noFill, None, None)),
+    ('add', '_new_noFill', _CT_TextCharacterProperties_new_noFill),
+    ('add', '_insert_noFill', _CT_TextCharacterProperties_insert_noFill),
+    ('add', '_add_noFill', _CT_TextCharacterProperties_add_noFill),
+    ('add', 'get_or_change_to_noFill', _CT_TextCharacterProperties_get_or_change_to_noFill),
+    ('set', 'solidFill', property(_CT_TextCharacterProperties_solidFill, None, None)),
+    ('add', '_new_solidFill', _CT_TextCharacterProperties_new_solidFill),
+    ('add', '_insert_solidFill', _CT_TextCharacterProperties_insert_solidFill),
+    ('add', '_add_solidFill', _CT_TextCharacterProperties_add_solidFill),
+    ('add', 'get_or_change_to_solidFill', _CT_TextCharacterProperties_get_or_change_to_solidFill),
+    ('set', 'gradFill', property(_CT_TextCharacterProperties_gradFill, None, None)),
+    ('add', '_new_gradFill', _CT_TextCharacterProperties_new_gradFill),
+    ('add', '_insert_gradFill', _CT_TextCharacterProperties_insert_gradFill),
+    ('add', '_add_gradFill', _CT_TextCharacterProperties_add_gradFill),
+    ('add', 'get_or_change_to_gradFill', _CT_TextCharacterProperties_get_or_change_to_gradFill),
+    ('set', 'blipFill', property(_CT_TextCharacterProperties_blipFill, None, None)),
+    ('add', '_new_blipFill', _CT_TextCharacterProperties_new_blipFill),
+    ('add', '_insert_blipFill', _CT_TextCharacterProperties_insert_blipFill),
+    ('add', '_add_blipFill', _CT_TextCharacterProperties_add_blipFill),
+    ('add', 'get_or_change_to_blipFill', _CT_TextCharacterProperties_get_or_change_to_blipFill),
+    ('set', 'pattFill', property(_CT_TextCharacterProperties_pattFill, None, None)),
+    ('add', '_new_pattFill', _CT_TextCharacterProperties_new_pattFill),
+    ('add', '_insert_pattFill', _CT_TextCharacterProperties_insert_pattFill),
+    ('add', '_add_pattFill', _CT_TextCharacterProperties_add_pattFill),
+    ('add', 'get_or_change_to_pattFill', _CT_TextCharacterProperties_get_or_change_to_pattFill),
+    ('set', 'grpFill', property(_CT_TextCharacterProperties_grpFill, None, None)),
+    ('add', '_new_grpFill', _CT_TextCharacterProperties_new_grpFill),
+    ('add', '_insert_grpFill', _CT_TextCharacterProperties_insert_grpFill),
+    ('add', '_add_grpFill', _CT_TextCharacterProperties_add_grpFill),
+    ('add', 'get_or_change_to_grpFill', _CT_TextCharacterProperties_get_or_change_to_grpFill),
+    ('add', '_remove_eg_fillProperties', _CT_TextCharacterProperties_remove_eg_fillProperties),
+    ('set', 'latin', property(_CT_TextCharacterProperties_latin, None, None)),
+    ('add', '_new_latin', _CT_TextCharacterProperties_new_latin),
+    ('add', '_insert_latin', _CT_TextCharacterProperties_insert_latin),
+    ('add', '_add_latin', _CT_TextCharacterProperties_add_latin),
+    ('add', 'get_or_add_latin', _CT_TextCharacterProperties_get_or_add_latin),
+    ('add', '_remove_latin', _CT_TextCharacterProperties_remove_latin),
+    ('set', 'hlinkClick', property(_CT_TextCharacterProperties_hlinkClick, None, None)),
+    ('add', '_new_hlinkClick', _CT_TextCharacterProperties_new_hlinkClick),
+    ('add', '_insert_hlinkClick', _CT_TextCharacterProperties_insert_hlinkClick),
+    ('add', '_add_hlinkClick', _CT_TextCharacterProperties_add_hlinkClick),
+    ('add', 'get_or_add_hlinkClick', _CT_TextCharacterProperties_get_or_add_hlinkClick),
+    ('add', '_remove_hlinkClick', _CT_TextCharacterProperties_remove_hlinkClick),
+    ('set', 'lang', property(_CT_TextCharacterProperties_lang_get, _CT_TextCharacterProperties_lang_set, None)),
+    ('set', 'sz', property(_CT_TextCharacterProperties_sz_get, _CT_TextCharacterProperties_sz_set, None)),
+    ('set', 'b', property(_CT_TextCharacterProperties_b_get, _CT_TextCharacterProperties_b_set, None)),
+    ('set', 'i', property(_CT_TextCharacterProperties_i_get, _CT_TextCharacterProperties_i_set, None)),
+    ('set', 'u', property(_CT_TextCharacterProperties_u_get, _CT_TextCharacterProperties_u_set, None)),
+)
+
+
+# pptx.oxml.text.CT_TextField -----------------------------------------------
+
+def _CT_TextField_rPr(obj):
+    '``<a:rPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}rPr')
+
+def _CT_TextField_new_rPr(obj):
+    'Return a "loose", newly created ``<a:rPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}rPr', nsmap=_nsmap_a)
+
+def _CT_TextField_insert_rPr(obj, child):
+    'Return the passed ``<a:rPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}pPr', '{http://schemas.openxmlformats.org/drawingml/2006/main}t'))
+    return child
+
+def _CT_TextField_add_rPr(obj, **attrs):
+    'Add a new ``<a:rPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_rPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_rPr(child)
+    return child
+
+def _CT_TextField_get_or_add_rPr(obj):
+    'Return the ``<a:rPr>`` child element, newly added if not present.'
+    child = obj.rPr
+    if child is None:
+        child = obj._add_rPr()
+    return child
+
+def _CT_TextField_remove_rPr(obj):
+    'Remove all ``<a:rPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}rPr'):
+        obj.remove(child)
+
+def _CT_TextField_t(obj):
+    '``<a:t>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}t')
+
+def _CT_TextField_new_t(obj):
+    'Return a "loose", newly created ``<a:t>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}t', nsmap=_nsmap_a)
+
+def _CT_TextField_insert_t(obj, child):
+    'Return the passed ``<a:t>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_TextField_add_t(obj, **attrs):
+    'Add a new ``<a:t>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_t()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_t(child)
+    return child
+
+def _CT_TextField_get_or_add_t(obj):
+    'Return the ``<a:t>`` child element, newly added if not present.'
+    child = obj.t
+    if child is None:
+        child = obj._add_t()
+    return child
+
+def _CT_TextField_remove_t(obj):
+    'Remove all ``<a:t>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}t'):
+        obj.remove(child)
+
+
+members['pptx.oxml.text.CT_TextField'] = (
+    ('set', 'rPr', property(_CT_TextField_rPr, None, None)),
+    ('add', '_new_rPr', _CT_TextField_new_rPr),
+    ('add', '_insert_rPr', _CT_TextField_insert_rPr),
+    ('add', '_add_rPr', _CT_TextField_add_rPr),
+    ('add', 'get_or_add_rPr', _CT_TextField_get_or_add_rPr),
+    ('add', '_remove_rPr', _CT_TextField_remove_rPr),
+    ('set', 't', property(_CT_TextField_t, None, None)),
+    ('add', '_new_t', _CT_TextField_new_t),
+    ('add', '_insert_t', _CT_TextField_insert_t),
+    ('add', '_add_t', _CT_TextField_add_t),
+    ('add', 'get_or_add_t', _CT_TextField_get_or_add_t),
+    ('add', '_remove_t', _CT_TextField_remove_t),
+)
+
+
+# pptx.oxml.text.CT_TextFont ------------------------------------------------
+
+def _CT_TextFont_typeface_get(obj):
+    'ST_TextTypeface type-converted value of ``typeface`` attribute.'
+    attr_str_value = obj.get('typeface')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'typeface' attribute not present on element %s" % obj.tag
+        )
+    return ST_TextTypeface.from_xml(attr_str_value)
+
+def _CT_TextFont_typeface_set(obj, value):
+    str_value = ST_TextTypeface.to_xml(value)
+    obj.set('typeface', str_value)
+
+
+members['pptx.oxml.text.CT_TextFont'] = (
+    ('set', 'typeface', property(_CT_TextFont_typeface_get, _CT_TextFont_typeface_set, None)),
+)
+
+
+# pptx.oxml.text.CT_TextLineBreak -------------------------------------------
+
+def _CT_TextLineBreak_rPr(obj):
+    '``<a:rPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}rPr')
+
+def _CT_TextLineBreak_new_rPr(obj):
+    'Return a "loose", newly created ``<a:rPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}rPr', nsmap=_nsmap_a)
+
+def _CT_TextLineBreak_insert_rPr(obj, child):
+    'Return the passed ``<a:rPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_TextLineBreak_add_rPr(obj, **attrs):
+    'Add a new ``<a:rPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_rPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_rPr(child)
+    return child
+
+def _CT_TextLineBreak_get_or_add_rPr(obj):
+    'Return the ``<a:rPr>`` child element, newly added if not present.'
+    child = obj.rPr
+    if child is None:
+        child = obj._add_rPr()
+    return child
+
+def _CT_TextLineBreak_remove_rPr(obj):
+    'Remove all ``<a:rPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}rPr'):
+        obj.remove(child)
+
+
+members['pptx.oxml.text.CT_TextLineBreak'] = (
+    ('set', 'rPr', property(_CT_TextLineBreak_rPr, None, None)),
+    ('add', '_new_rPr', _CT_TextLineBreak_new_rPr),
+    ('add', '_insert_rPr', _CT_TextLineBreak_insert_rPr),
+    ('add', '_add_rPr', _CT_TextLineBreak_add_rPr),
+    ('add', 'get_or_add_rPr', _CT_TextLineBreak_get_or_add_rPr),
+    ('add', '_remove_rPr', _CT_TextLineBreak_remove_rPr),
+)
+
+
+# pptx.oxml.text.CT_TextNormalAutofit ---------------------------------------
+
+def _CT_TextNormalAutofit_fontScale_get(obj):
+    'ST_TextFontScalePercentOrPercentString type-converted value of ``fontScale`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('fontScale')
+    if attr_str_value is None:
+        return 100.0
+    return ST_TextFontScalePercentOrPercentString.from_xml(attr_str_value)
+
+def _CT_TextNormalAutofit_fontScale_set(obj, value):
+    if value == 100.0:
+        if 'fontScale' in obj.attrib:
+            del obj.attrib['fontScale']
+        return
+    str_value = ST_TextFontScalePercentOrPercentString.to_xml(value)
+    obj.set('fontScale', str_value)
+
+
+members['pptx.oxml.text.CT_TextNormalAutofit'] = (
+    ('set', 'fontScale', property(_CT_TextNormalAutofit_fontScale_get, _CT_TextNormalAutofit_fontScale_set, None)),
+)
+
+
+# pptx.oxml.text.CT_TextParagraph -------------------------------------------
+
+def _CT_TextParagraph_pPr(obj):
+    '``<a:pPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}pPr')
+
+def _CT_TextParagraph_new_pPr(obj):
+    'Return a "loose", newly created ``<a:pPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}pPr', nsmap=_nsmap_a)
+
+def _CT_TextParagraph_insert_pPr(obj, child):
+    'Return the passed ``<a:pPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}r', '{http://schemas.openxmlformats.org/drawingml/2006/main}br', '{http://schemas.openxmlformats.org/drawingml/2006/main}fld', '{http://schemas.openxmlformats.org/drawingml/2006/main}endParaRPr'))
+    return child
+
+def _CT_TextParagraph_add_pPr(obj, **attrs):
+    'Add a new ``<a:pPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_pPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_pPr(child)
+    return child
+
+def _CT_TextParagraph_get_or_add_pPr(obj):
+    'Return the ``<a:pPr>`` child element, newly added if not present.'
+    child = obj.pPr
+    if child is None:
+        child = obj._add_pPr()
+    return child
+
+def _CT_TextParagraph_remove_pPr(obj):
+    'Remove all ``<a:pPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}pPr'):
+        obj.remove(child)
+
+def _CT_TextParagraph_r_lst(obj):
+    'A list containing each of the ``<a:r>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}r')
+
+def _CT_TextParagraph_new_r(obj):
+    'Return a "loose", newly created ``<a:r>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}r', nsmap=_nsmap_a)
+
+def _CT_TextParagraph_insert_r(obj, child):
+    'Return the passed ``<a:r>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}endParaRPr',))
+    return child
+
+def _CT_TextParagraph_add_r(obj, **attrs):
+    'Add a new ``<a:r>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_r()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_r(child)
+    return child
+
+def _CT_TextParagraph_br_lst(obj):
+    'A list containing each of the ``<a:br>`` child elements, in the order they appear.'
+    return obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}br')
+
+def _CT_TextParagraph_new_br(obj):
+    'Return a "loose", newly created ``<a:br>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}br', nsmap=_nsmap_a)
+
+def _CT_TextParagraph_insert_br(obj, child):
+    'Return the passed ``<a:br>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}endParaRPr',))
+    return child
+
+def _CT_TextParagraph_add_br(obj, **attrs):
+    'Add a new ``<a:br>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_br()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_br(child)
+    return child
+
+def _CT_TextParagraph_endParaRPr(obj):
+    '``<a:endParaRPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}endParaRPr')
+
+def _CT_TextParagraph_new_endParaRPr(obj):
+    'Return a "loose", newly created ``<a:endParaRPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}endParaRPr', nsmap=_nsmap_a)
+
+def _CT_TextParagraph_insert_endParaRPr(obj, child):
+    'Return the passed ``<a:endParaRPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_TextParagraph_add_endParaRPr(obj, **attrs):
+    'Add a new ``<a:endParaRPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_endParaRPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_endParaRPr(child)
+    return child
+
+def _CT_TextParagraph_get_or_add_endParaRPr(obj):
+    'Return the ``<a:endParaRPr>`` child element, newly added if not present.'
+    child = obj.endParaRPr
+    if child is None:
+        child = obj._add_endParaRPr()
+    return child
+
+def _CT_TextParagraph_remove_endParaRPr(obj):
+    'Remove all ``<a:endParaRPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}endParaRPr'):
+        obj.remove(child)
+
+
+members['pptx.oxml.text.CT_TextParagraph'] = (
+    ('set', 'pPr', property(_CT_TextParagraph_pPr, None, None)),
+    ('add', '_new_pPr', _CT_TextParagraph_new_pPr),
+    ('add', '_insert_pPr', _CT_TextParagraph_insert_pPr),
+    ('add', '_add_pPr', _CT_TextParagraph_add_pPr),
+    ('add', 'get_or_add_pPr', _CT_TextParagraph_get_or_add_pPr),
+    ('add', '_remove_pPr', _CT_TextParagraph_remove_pPr),
+    ('set', 'r_lst', property(_CT_TextParagraph_r_lst, None, None)),
+    ('add', '_new_r', _CT_TextParagraph_new_r),
+    ('add', '_insert_r', _CT_TextParagraph_insert_r),
+    ('add', '_add_r', _CT_TextParagraph_add_r),
+    ('del', 'r'),
+    ('set', 'br_lst', property(_CT_TextParagraph_br_lst, None, None)),
+    ('add', '_new_br', _CT_TextParagraph_new_br),
+    ('add', '_insert_br', _CT_TextParagraph_insert_br),
+    ('add', '_add_br', _CT_TextParagraph_add_br),
+    ('del', 'br'),
+    ('set', 'endParaRPr', property(_CT_TextParagraph_endParaRPr, None, None)),
+    ('add', '_new_endParaRPr', _CT_TextParagraph_new_endParaRPr),
+    ('add', '_insert_endParaRPr', _CT_TextParagraph_insert_endParaRPr),
+    ('add', '_add_endParaRPr', _CT_TextParagraph_add_endParaRPr),
+    ('add', 'get_or_add_endParaRPr', _CT_TextParagraph_get_or_add_endParaRPr),
+    ('add', '_remove_endParaRPr', _CT_TextParagraph_remove_endParaRPr),
+)
+
+
+# pptx.oxml.text.CT_TextParagraphProperties ---------------------------------
+
+def _CT_TextParagraphProperties_lnSpc(obj):
+    '``<a:lnSpc>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}lnSpc')
+
+def _CT_TextParagraphProperties_new_lnSpc(obj):
+    'Return a "loose", newly created ``<a:lnSpc>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}lnSpc', nsmap=_nsmap_a)
+
+def _CT_TextParagraphProperties_insert_lnSpc(obj, child):
+    'Return the passed ``<a:lnSpc>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}spcBef', '{http://schemas.openxmlformats.org/drawingml/2006/main}spcAft', '{http://schemas.openxmlformats.org/drawingml/2006/main}buClrTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}buClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}buSzTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}buSzPct', '{http://schemas.openxmlformats.org/drawingml/2006/main}buSzPts', '{http://schemas.openxmlformats.org/drawingml/2006/main}buFontTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}buFont', '{http://schemas.openxmlformats.org/drawingml/2006/main}buNone', '{http://schemas.openxmlformats.org/drawingml/2006/main}buAutoNum', '{http://schemas.openxmlformats.org/drawingml/2006/main}buChar', '{http://schemas.openxmlformats.org/drawingml/2006/main}buBlip', '{http://schemas.openxmlformats.org/drawingml/2006/main}tabLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}defRPr', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TextParagraphProperties_add_lnSpc(obj, **attrs):
+    'Add a new ``<a:lnSpc>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_lnSpc()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_lnSpc(child)
+    return child
+
+def _CT_TextParagraphProperties_get_or_add_lnSpc(obj):
+    'Return the ``<a:lnSpc>`` child element, newly added if not present.'
+    child = obj.lnSpc
+    if child is None:
+        child = obj._add_lnSpc()
+    return child
+
+def _CT_TextParagraphProperties_remove_lnSpc(obj):
+    'Remove all ``<a:lnSpc>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}lnSpc'):
+        obj.remove(child)
+
+def _CT_TextParagraphProperties_spcBef(obj):
+    '``<a:spcBef>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}spcBef')
+
+def _CT_TextParagraphProperties_new_spcBef(obj):
+    'Return a "loose", newly created ``<a:spcBef>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}spcBef', nsmap=_nsmap_a)
+
+def _CT_TextParagraphProperties_insert_spcBef(obj, child):
+    'Return the passed ``<a:spcBef>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}spcAft', '{http://schemas.openxmlformats.org/drawingml/2006/main}buClrTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}buClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}buSzTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}buSzPct', '{http://schemas.openxmlformats.org/drawingml/2006/main}buSzPts', '{http://schemas.openxmlformats.org/drawingml/2006/main}buFontTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}buFont', '{http://schemas.openxmlformats.org/drawingml/2006/main}buNone', '{http://schemas.openxmlformats.org/drawingml/2006/main}buAutoNum', '{http://schemas.openxmlformats.org/drawingml/2006/main}buChar', '{http://schemas.openxmlformats.org/drawingml/2006/main}buBlip', '{http://schemas.openxmlformats.org/drawingml/2006/main}tabLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}defRPr', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TextParagraphProperties_add_spcBef(obj, **attrs):
+    'Add a new ``<a:spcBef>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_spcBef()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_spcBef(child)
+    return child
+
+def _CT_TextParagraphProperties_get_or_add_spcBef(obj):
+    'Return the ``<a:spcBef>`` child element, newly added if not present.'
+    child = obj.spcBef
+    if child is None:
+        child = obj._add_spcBef()
+    return child
+
+def _CT_TextParagraphProperties_remove_spcBef(obj):
+    'Remove all ``<a:spcBef>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}spcBef'):
+        obj.remove(child)
+
+def _CT_TextParagraphProperties_spcAft(obj):
+    '``<a:spcAft>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}spcAft')
+
+def _CT_TextParagraphProperties_new_spcAft(obj):
+    'Return a "loose", newly created ``<a:spcAft>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}spcAft', nsmap=_nsmap_a)
+
+def _CT_TextParagraphProperties_insert_spcAft(obj, child):
+    'Return the passed ``<a:spcAft>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}buClrTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}buClr', '{http://schemas.openxmlformats.org/drawingml/2006/main}buSzTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}buSzPct', '{http://schemas.openxmlformats.org/drawingml/2006/main}buSzPts', '{http://schemas.openxmlformats.org/drawingml/2006/main}buFontTx', '{http://schemas.openxmlformats.org/drawingml/2006/main}buFont', '{http://schemas.openxmlformats.org/drawingml/2006/main}buNone', '{http://schemas.openxmlformats.org/drawingml/2006/main}buAutoNum', '{http://schemas.openxmlformats.org/drawingml/2006/main}buChar', '{http://schemas.openxmlformats.org/drawingml/2006/main}buBlip', '{http://schemas.openxmlformats.org/drawingml/2006/main}tabLst', '{http://schemas.openxmlformats.org/drawingml/2006/main}defRPr', '{http://schemas.openxmlformats.org/drawingml/2006/main}extLst'))
+    return child
+
+def _CT_TextParagraphProperties_add_spcAft(obj, **attrs):
+    'Add a new ``<a:spcAft>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_spcAft()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_spcAft(child)
+    return child
+
+def _CT_TextParagraphProperties_get_or_add_spcAft(obj):
+    'Return the ``<a:spcAft>`` child element, newly added if not present.'
+    child = obj.spcAft
+    if child is None:
+        child = obj._add_spcAft()
+    return child
+
+def _CT_TextParagraphProperties_remove_spcAft(obj):
+    'Remove all ``<a:spcAft>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}spcAft'):
+        obj.remove(child)
+
+def _CT_TextParagraphProperties_defRPr(obj):
+    '``<a:defRPr>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}defRPr')
+
+def _CT_TextParagraphProperties_new_defRPr(obj):
+    'Return a "loose", newly created ``<a:defRPr>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}defRPr', nsmap=_nsmap_a)
+
+def _CT_TextParagraphProperties_insert_defRPr(obj, child):
+    'Return the passed ``<a:defRPr>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ('{http://schemas.openxmlformats.org/drawingml/2006/main}extLst',))
+    return child
+
+def _CT_TextParagraphProperties_add_defRPr(obj, **attrs):
+    'Add a new ``<a:defRPr>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_defRPr()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_defRPr(child)
+    return child
+
+def _CT_TextParagraphProperties_get_or_add_defRPr(obj):
+    'Return the ``<a:defRPr>`` child element, newly added if not present.'
+    child = obj.defRPr
+    if child is None:
+        child = obj._add_defRPr()
+    return child
+
+def _CT_TextParagraphProperties_remove_defRPr(obj):
+    'Remove all ``<a:defRPr>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}defRPr'):
+        obj.remove(child)
+
+def _CT_TextParagraphProperties_lvl_get(obj):
+    'ST_TextIndentLevelType type-converted value of ``lvl`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('lvl')
+    if attr_str_value is None:
+        return 0
+    return ST_TextIndentLevelType.from_xml(attr_str_value)
+
+def _CT_TextParagraphProperties_lvl_set(obj, value):
+    if value == 0:
+        if 'lvl' in obj.attrib:
+            del obj.attrib['lvl']
+        return
+    str_value = ST_TextIndentLevelType.to_xml(value)
+    obj.set('lvl', str_value)
+
+def _CT_TextParagraphProperties_algn_get(obj):
+    'PP_PARAGRAPH_ALIGNMENT type-converted value of ``algn`` attribute, or |None| (or specified default value) if not present. Assigning the default value causes the attribute to be removed from the element.'
+    attr_str_value = obj.get('algn')
+    if attr_str_value is None:
+        return None
+    return PP_PARAGRAPH_ALIGNMENT.from_xml(attr_str_value)
+
+def _CT_TextParagraphProperties_algn_set(obj, value):
+    if value == None:
+        if 'algn' in obj.attrib:
+            del obj.attrib['algn']
+        return
+    str_value = PP_PARAGRAPH_ALIGNMENT.to_xml(value)
+    obj.set('algn', str_value)
+
+
+members['pptx.oxml.text.CT_TextParagraphProperties'] = (
+    ('set', 'lnSpc', property(_CT_TextParagraphProperties_lnSpc, None, None)),
+    ('add', '_new_lnSpc', _CT_TextParagraphProperties_new_lnSpc),
+    ('add', '_insert_lnSpc', _CT_TextParagraphProperties_insert_lnSpc),
+    ('add', '_add_lnSpc', _CT_TextParagraphProperties_add_lnSpc),
+    ('add', 'get_or_add_lnSpc', _CT_TextParagraphProperties_get_or_add_lnSpc),
+    ('add', '_remove_lnSpc', _CT_TextParagraphProperties_remove_lnSpc),
+    ('set', 'spcBef', property(_CT_TextParagraphProperties_spcBef, None, None)),
+    ('add', '_new_spcBef', _CT_TextParagraphProperties_new_spcBef),
+    ('add', '_insert_spcBef', _CT_TextParagraphProperties_insert_spcBef),
+    ('add', '_add_spcBef', _CT_TextParagraphProperties_add_spcBef),
+    ('add', 'get_or_add_spcBef', _CT_TextParagraphProperties_get_or_add_spcBef),
+    ('add', '_remove_spcBef', _CT_TextParagraphProperties_remove_spcBef),
+    ('set', 'spcAft', property(_CT_TextParagraphProperties_spcAft, None, None)),
+    ('add', '_new_spcAft', _CT_TextParagraphProperties_new_spcAft),
+    ('add', '_insert_spcAft', _CT_TextParagraphProperties_insert_spcAft),
+    ('add', '_add_spcAft', _CT_TextParagraphProperties_add_spcAft),
+    ('add', 'get_or_add_spcAft', _CT_TextParagraphProperties_get_or_add_spcAft),
+    ('add', '_remove_spcAft', _CT_TextParagraphProperties_remove_spcAft),
+    ('set', 'defRPr', property(_CT_TextParagraphProperties_defRPr, None, None)),
+    ('add', '_new_defRPr', _CT_TextParagraphProperties_new_defRPr),
+    ('add', '_insert_defRPr', _CT_TextParagraphProperties_insert_defRPr),
+    ('add', '_add_defRPr', _CT_TextParagraphProperties_add_defRPr),
+    ('add', 'get_or_add_defRPr', _CT_TextParagraphProperties_get_or_add_defRPr),
+    ('add', '_remove_defRPr', _CT_TextParagraphProperties_remove_defRPr),
+    ('set', 'lvl', property(_CT_TextParagraphProperties_lvl_get, _CT_TextParagraphProperties_lvl_set, None)),
+    ('set', 'algn', property(_CT_TextParagraphProperties_algn_get, _CT_TextParagraphProperties_algn_set, None)),
+)
+
+
+# pptx.oxml.text.CT_TextSpacing ---------------------------------------------
+
+def _CT_TextSpacing_spcPct(obj):
+    '``<a:spcPct>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}spcPct')
+
+def _CT_TextSpacing_new_spcPct(obj):
+    'Return a "loose", newly created ``<a:spcPct>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}spcPct', nsmap=_nsmap_a)
+
+def _CT_TextSpacing_insert_spcPct(obj, child):
+    'Return the passed ``<a:spcPct>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_TextSpacing_add_spcPct(obj, **attrs):
+    'Add a new ``<a:spcPct>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_spcPct()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_spcPct(child)
+    return child
+
+def _CT_TextSpacing_get_or_add_spcPct(obj):
+    'Return the ``<a:spcPct>`` child element, newly added if not present.'
+    child = obj.spcPct
+    if child is None:
+        child = obj._add_spcPct()
+    return child
+
+def _CT_TextSpacing_remove_spcPct(obj):
+    'Remove all ``<a:spcPct>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}spcPct'):
+        obj.remove(child)
+
+def _CT_TextSpacing_spcPts(obj):
+    '``<a:spcPts>`` child element or |None| if not present.'
+    return obj.find('{http://schemas.openxmlformats.org/drawingml/2006/main}spcPts')
+
+def _CT_TextSpacing_new_spcPts(obj):
+    'Return a "loose", newly created ``<a:spcPts>`` element having no attributes, text, or children.'
+    return oxml_parser.makeelement('{http://schemas.openxmlformats.org/drawingml/2006/main}spcPts', nsmap=_nsmap_a)
+
+def _CT_TextSpacing_insert_spcPts(obj, child):
+    'Return the passed ``<a:spcPts>`` element after inserting it as a child in the correct sequence.'
+    obj._insert_before_first_of(child, ())
+    return child
+
+def _CT_TextSpacing_add_spcPts(obj, **attrs):
+    'Add a new ``<a:spcPts>`` child element unconditionally, inserted in the correct sequence.'
+    child = obj._new_spcPts()
+    for key, value in attrs.items():
+        setattr(child, key, value)
+    obj._insert_spcPts(child)
+    return child
+
+def _CT_TextSpacing_get_or_add_spcPts(obj):
+    'Return the ``<a:spcPts>`` child element, newly added if not present.'
+    child = obj.spcPts
+    if child is None:
+        child = obj._add_spcPts()
+    return child
+
+def _CT_TextSpacing_remove_spcPts(obj):
+    'Remove all ``<a:spcPts>`` child elements.'
+    for child in obj.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}spcPts'):
+        obj.remove(child)
+
+
+members['pptx.oxml.text.CT_TextSpacing'] = (
+    ('set', 'spcPct', property(_CT_TextSpacing_spcPct, None, None)),
+    ('add', '_new_spcPct', _CT_TextSpacing_new_spcPct),
+    ('add', '_insert_spcPct', _CT_TextSpacing_insert_spcPct),
+    ('add', '_add_spcPct', _CT_TextSpacing_add_spcPct),
+    ('add', 'get_or_add_spcPct', _CT_TextSpacing_get_or_add_spcPct),
+    ('add', '_remove_spcPct', _CT_TextSpacing_remove_spcPct),
+    ('set', 'spcPts', property(_CT_TextSpacing_spcPts, None, None)),
+    ('add', '_new_spcPts', _CT_TextSpacing_new_spcPts),
+    ('add', '_insert_spcPts', _CT_TextSpacing_insert_spcPts),
+    ('add', '_add_spcPts', _CT_TextSpacing_add_spcPts),
+    ('add', 'get_or_add_spcPts', _CT_TextSpacing_get_or_add_spcPts),
+    ('add', '_remove_spcPts', _CT_TextSpacing_remove_spcPts),
+)
+
+
+# pptx.oxml.text.CT_TextSpacingPercent --------------------------------------
+
+def _CT_TextSpacingPercent_val_get(obj):
+    'ST_TextSpacingPercentOrPercentString type-converted value of ``val`` attribute.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'val' attribute not present on element %s" % obj.tag
+        )
+    return ST_TextSpacingPercentOrPercentString.from_xml(attr_str_value)
+
+def _CT_TextSpacingPercent_val_set(obj, value):
+    str_value = ST_TextSpacingPercentOrPercentString.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.text.CT_TextSpacingPercent'] = (
+    ('set', 'val', property(_CT_TextSpacingPercent_val_get, _CT_TextSpacingPercent_val_set, None)),
+)
+
+
+# pptx.oxml.text.CT_TextSpacingPoint ----------------------------------------
+
+def _CT_TextSpacingPoint_val_get(obj):
+    'ST_TextSpacingPoint type-converted value of ``val`` attribute.'
+    attr_str_value = obj.get('val')
+    if attr_str_value is None:
+        raise InvalidXmlError(
+            "required 'val' attribute not present on element %s" % obj.tag
+        )
+    return ST_TextSpacingPoint.from_xml(attr_str_value)
+
+def _CT_TextSpacingPoint_val_set(obj, value):
+    str_value = ST_TextSpacingPoint.to_xml(value)
+    obj.set('val', str_value)
+
+
+members['pptx.oxml.text.CT_TextSpacingPoint'] = (
+    ('set', 'val', property(_CT_TextSpacingPoint_val_get, _CT_TextSpacingPoint_val_set, None)),
+)
@@ -149,7 +149,7 @@ class CT_DLbls(BaseOxmlElement):
         Return the `c:dLbl` child representing the label for the data point
         at index *idx*.
         """
-        matches = self.xpath('c:dLbl[c:idx[@val="%d"]]' % idx)
+        matches = self.xpath('c:dLbl[c:idx[@val=$idx]]', idx='%d' % idx)
         if matches:
             return matches[0]
         return None
@@ -159,7 +159,7 @@ class CT_DLbls(BaseOxmlElement):
         Return the `c:dLbl` element representing the label of the point at
         index *idx*.
         """
-        matches = self.xpath('c:dLbl[c:idx[@val="%d"]]' % idx)
+        matches = self.xpath('c:dLbl[c:idx[@val=$idx]]', idx='%d' % idx)
         if matches:
             return matches[0]
         return self._insert_dLbl_in_sequence(idx)
@@ -0,0 +1,578 @@
+# encoding: utf-8
+
+"""
+Build step that writes the pre-generated members of custom element classes.
+
+The declarative ``ZeroOrOne``, ``OptionalAttribute``, etc. descriptors in
+|pptx.oxml.xmlchemy| build their accessors as closures when each ``CT_*``
+class is created. This module renders those same accessors as flat Python
+source into |pptx.oxml._accessors|, which the metaclass installs instead
+for each class it has an entry for. With compiled bytecode cached, this
+takes a cold ``import pptx`` from about 88 ms to 78 ms on CPython 3.8, the
+time otherwise spent building the closures of some 150 classes.
+
+Nothing is checked at import time, so regenerate after changing any
+declaration with::
+
+    python -m pptx.oxml.codegen
+
+``python -m pptx.oxml.codegen --check`` (``make accessors-check``) confirms
+the committed module still matches the declarations. The test suite runs
+the same check, so a stale module fails the tests.
+"""
+
+from __future__ import absolute_import, print_function
+
+import ast
+import io
+import os
+import sys
+
+from .ns import NamespacePrefixedTag, qn
+from .xmlchemy import BaseOxmlElement
+from ..enum.base import EnumValue
+from ..util import Length
+
+
+ACCESSORS_PATH = os.path.join(os.path.dirname(__file__), '_accessors.py')
+
+_header = '''\
+# encoding: utf-8
+# flake8: noqa
+
+"""
+Pre-generated members for the custom element classes in |pptx.oxml|.
+
+GENERATED by ``python -m pptx.oxml.codegen``; do not edit by hand. Each
+entry in ``members`` maps a custom element class to the member operations
+that reproduce what the |MetaOxmlElement| metaclass would otherwise build
+from its declarations.
+"""
+
+from __future__ import absolute_import, print_function
+'''
+
+
+class UngeneratableDeclaration(Exception):
+    """
+    Raised when a declaration refers to a value that cannot be rendered as
+    source, causing its class to be left to the metaclass.
+    """
+
+
+def generate_accessors_source():
+    """
+    Return the source text of the |pptx.oxml._accessors| module for all
+    custom element classes currently defined in the |pptx| package.
+    """
+    writer = _ModuleWriter()
+    for element_cls in _element_classes():
+        writer.add_class(element_cls)
+    return writer.source
+
+
+def is_accessors_module_current(path=ACCESSORS_PATH):
+    """
+    Return |True| if the accessors module at *path* matches what would be
+    generated from the current declarations.
+    """
+    with io.open(path, encoding='utf-8') as f:
+        committed = f.read()
+    return committed == generate_accessors_source()
+
+
+def stale_accessors_message(path=ACCESSORS_PATH):
+    """
+    Return the error reported by ``--check`` when the accessors module at
+    *path* is stale, or |None| when it is current.
+    """
+    if is_accessors_module_current(path):
+        return None
+    return (
+        '%s is stale, regenerate it with `make accessors`'
+        % os.path.relpath(path)
+    )
+
+
+def write_accessors_module(path=ACCESSORS_PATH):
+    """
+    Write the pre-generated accessors module to *path*.
+    """
+    source = generate_accessors_source()
+    with open(path, 'w') as f:
+        f.write(source)
+
+
+def _element_classes():
+    """
+    Generate each custom element class in the |pptx| package having
+    declarations, sorted by qualified name so the output is stable.
+    """
+    # ---importing the package defines and registers every oxml class---
+    import pptx  # noqa
+
+    def iter_subclasses(cls):
+        for subclass in cls.__subclasses__():
+            yield subclass
+            for descendant in iter_subclasses(subclass):
+                yield descendant
+
+    classes = set(
+        cls for cls in iter_subclasses(BaseOxmlElement)
+        if cls.__module__.startswith('pptx.')
+        and cls.__dict__.get('_xmlchemy_declarations')
+    )
+    return sorted(classes, key=lambda cls: (cls.__module__, cls.__name__))
+
+
+class _ModuleWriter(object):
+    """
+    Accumulates the source for each custom element class and renders the
+    complete module, including the imports those classes need.
+    """
+
+    # ---modules a generated value may be imported from without creating an
+    # ---import cycle back into the custom element class modules
+    _importable_modules = ('pptx.oxml.simpletypes', 'pptx.util')
+
+    def __init__(self):
+        self._imports = {
+            'pptx.exc': set(['InvalidXmlError']),
+            'pptx.oxml': set(['oxml_parser']),
+        }
+        self._nsmap_prefixes = set()
+        self._blocks = []
+        self._used_names = set()
+
+    def add_class(self, element_cls):
+        """
+        Render the members of *element_cls* and add them to the module. A
+        class having a declaration that cannot be rendered is skipped.
+        """
+        writer = _ClassWriter(self, element_cls)
+        try:
+            block = writer.render()
+        except UngeneratableDeclaration:
+            return
+        self._add_imports(writer.imports)
+        self._blocks.append(block)
+
+    def import_name(self, obj):
+        """
+        Return the name by which *obj*, a class defined at module level,
+        can be referenced from generated code, scheduling its import.
+        Raises |UngeneratableDeclaration| if it cannot be safely imported.
+        """
+        module_name, name = obj.__module__, obj.__name__
+        importable = (
+            module_name in self._importable_modules or
+            module_name.startswith('pptx.enum.')
+        )
+        module = sys.modules.get(module_name)
+        if not importable or getattr(module, name, None) is not obj:
+            raise UngeneratableDeclaration(
+                'cannot import %s.%s' % (module_name, name)
+            )
+        return module_name, name
+
+    def nsmap_name(self, prefix):
+        """
+        Return the module-level name of the single-entry nsmap dict for
+        namespace *prefix*.
+        """
+        self._nsmap_prefixes.add(prefix)
+        return '_nsmap_%s' % prefix
+
+    def unique_name(self, name):
+        """
+        Return *name*, suffixed if necessary to be unique in the module.
+        """
+        candidate, n = name, 2
+        while candidate in self._used_names:
+            candidate = '%s_%d' % (name, n)
+            n += 1
+        self._used_names.add(candidate)
+        return candidate
+
+    @property
+    def source(self):
+        lines = [_header]
+        for module_name in sorted(self._imports):
+            names = sorted(self._imports[module_name])
+            lines.extend(_wrap_import(module_name, names))
+        lines.append('')
+        for prefix in sorted(self._nsmap_prefixes):
+            uri = NamespacePrefixedTag('%s:x' % prefix).nsmap[prefix]
+            lines.append('_nsmap_%s = {%r: %r}' % (prefix, prefix, uri))
+        lines.append('')
+        lines.append('members = {}')
+        for block in self._blocks:
+            lines.append('')
+            lines.append('')
+            lines.extend(block)
+        return '\n'.join(lines) + '\n'
+
+    def _add_imports(self, imports):
+        for module_name, name in imports:
+            self._imports.setdefault(module_name, set()).add(name)
+
+
+def _wrap_import(module_name, names):
+    """
+    Return the source lines of a ``from ... import ...`` statement for
+    *names*, wrapped in parentheses when it would run long.
+    """
+    line = 'from %s import %s' % (module_name, ', '.join(names))
+    if len(line) <= 79:
+        return [line]
+    lines = ['from %s import (' % module_name]
+    current = '   '
+    for name in names:
+        if len(current) + len(name) + 2 > 79:
+            lines.append(current.rstrip())
+            current = '   '
+        current += ' %s,' % name
+    lines.append(current.rstrip(','))
+    lines.append(')')
+    return lines
+
+
+class _ClassWriter(object):
+    """
+    Renders the generated members of a single custom element class.
+    """
+    def __init__(self, module_writer, element_cls):
+        self._module = module_writer
+        self._cls = element_cls
+        self._definitions = []
+        self._operations = []
+        self.imports = []
+
+    def render(self):
+        """
+        Return the source lines for this class; its functions followed by
+        its ``members`` entry.
+        """
+        declarations = self._cls._xmlchemy_declarations
+        for prop_name, descriptor in declarations:
+            render = getattr(self, '_render_%s' % type(descriptor).__name__)
+            render(prop_name, descriptor)
+        key = '%s.%s' % (self._cls.__module__, self._cls.__name__)
+        lines = ['# %s %s' % (key, '-' * max(3, 74 - len(key)))]
+        for definition in self._definitions:
+            lines.append('')
+            lines.extend(definition)
+        lines.append('')
+        lines.append('')
+        lines.append('members[%r] = (' % key)
+        lines.extend('    %s,' % op for op in self._operations)
+        lines.append(')')
+        return lines
+
+    # attribute declarations ---------------------------------------
+
+    def _render_OptionalAttribute(self, prop_name, descriptor):
+        simple_type = self._import(descriptor._simple_type)
+        clark_name = self._attr_clark_name(descriptor)
+        default = self._default_expr(prop_name, descriptor)
+        getter = self._function('%s_get' % prop_name, ['obj'], (
+            '%s type-converted value of ``%s`` attribute, or |None| (or spec'
+            'ified default value) if not present. Assigning the default valu'
+            'e causes the attribute to be removed from the element.' %
+            (descriptor._simple_type.__name__, descriptor._attr_name)
+        ), [
+            'attr_str_value = obj.get(%r)' % clark_name,
+            'if attr_str_value is None:',
+            '    return %s' % default,
+            'return %s.from_xml(attr_str_value)' % simple_type,
+        ])
+        setter = self._function('%s_set' % prop_name, ['obj', 'value'], None, [
+            'if value == %s:' % default,
+            '    if %r in obj.attrib:' % clark_name,
+            '        del obj.attrib[%r]' % clark_name,
+            '    return',
+            'str_value = %s.to_xml(value)' % simple_type,
+            'obj.set(%r, str_value)' % clark_name,
+        ])
+        self._set(prop_name, 'property(%s, %s, None)' % (getter, setter))
+
+    def _render_RequiredAttribute(self, prop_name, descriptor):
+        simple_type = self._import(descriptor._simple_type)
+        clark_name = self._attr_clark_name(descriptor)
+        getter = self._function('%s_get' % prop_name, ['obj'], (
+            '%s type-converted value of ``%s`` attribute.' %
+            (descriptor._simple_type.__name__, descriptor._attr_name)
+        ), [
+            'attr_str_value = obj.get(%r)' % clark_name,
+            'if attr_str_value is None:',
+            '    raise InvalidXmlError(',
+            '        %r %% obj.tag' % (
+                "required '%s' attribute not present on element %%s" %
+                descriptor._attr_name
+            ),
+            '    )',
+            'return %s.from_xml(attr_str_value)' % simple_type,
+        ])
+        setter = self._function('%s_set' % prop_name, ['obj', 'value'], None, [
+            'str_value = %s.to_xml(value)' % simple_type,
+            'obj.set(%r, str_value)' % clark_name,
+        ])
+        self._set(prop_name, 'property(%s, %s, None)' % (getter, setter))
+
+    # child element declarations -----------------------------------
+
+    def _render_OneAndOnlyOne(self, prop_name, descriptor):
+        tag = descriptor._nsptagname
+        getter = self._function(prop_name, ['obj'], (
+            'Required ``<%s>`` child element.' % tag
+        ), [
+            'child = obj.find(%r)' % qn(tag),
+            'if child is None:',
+            '    raise InvalidXmlError(',
+            '        %r' % (
+                'required ``<%s>`` child element not present' % tag
+            ),
+            '    )',
+            'return child',
+        ])
+        self._set(prop_name, 'property(%s, None, None)' % getter)
+
+    def _render_OneOrMore(self, prop_name, descriptor):
+        self._render_ZeroOrMore(prop_name, descriptor, public_adder=True)
+
+    def _render_ZeroOrMore(self, prop_name, descriptor, public_adder=False):
+        tag = descriptor._nsptagname
+        list_getter = self._function('%s_lst' % prop_name, ['obj'], (
+            'A list containing each of the ``<%s>`` child elements, in the o'
+            'rder they appear.' % tag
+        ), [
+            'return obj.findall(%r)' % qn(tag),
+        ])
+        self._set('%s_lst' % prop_name, 'property(%s, None, None)' % (
+            list_getter
+        ))
+        self._add_creator(prop_name, tag)
+        self._add_inserter(prop_name, tag, descriptor._successors)
+        self._add_adder(prop_name, tag)
+        if public_adder:
+            self._add('add_%s' % prop_name, self._function(
+                'add_%s' % prop_name, ['obj'], (
+                    'Add a new ``<%s>`` child element unconditionally, insert'
+                    'ed in the correct sequence.' % tag
+                ), [
+                    'child = obj._add_%s()' % prop_name,
+                    'return child',
+                ]
+            ))
+        self._operations.append('(%r, %r)' % ('del', prop_name))
+
+    def _render_ZeroOrOne(self, prop_name, descriptor):
+        tag = descriptor._nsptagname
+        self._add_getter(prop_name, tag)
+        self._add_creator(prop_name, tag)
+        self._add_inserter(prop_name, tag, descriptor._successors)
+        self._add_adder(prop_name, tag)
+        self._add('get_or_add_%s' % prop_name, self._function(
+            'get_or_add_%s' % prop_name, ['obj'], (
+                'Return the ``<%s>`` child element, newly added if not prese'
+                'nt.' % tag
+            ), [
+                'child = obj.%s' % prop_name,
+                'if child is None:',
+                '    child = obj._add_%s()' % prop_name,
+                'return child',
+            ]
+        ))
+        self._add('_remove_%s' % prop_name, self._function(
+            '_remove_%s' % prop_name, ['obj'], (
+                'Remove all ``<%s>`` child elements.' % tag
+            ), [
+                'for child in obj.findall(%r):' % qn(tag),
+                '    obj.remove(child)',
+            ]
+        ))
+
+    def _render_ZeroOrOneChoice(self, prop_name, descriptor):
+        member_tags = tuple(descriptor._member_nsptagnames)
+        choice_getter = self._function(prop_name, ['obj'], (
+            'Return the child element belonging to this element group, or '
+            '|None| if no member child is present.'
+        ), [
+            'for clark_name in %s:' % _tuple_expr(qn(t) for t in member_tags),
+            '    child = obj.find(clark_name)',
+            '    if child is not None:',
+            '        return child',
+            'return None',
+        ])
+        self._set(prop_name, 'property(%s, None, None)' % choice_getter)
+        for choice in descriptor._choices:
+            tag = choice.nsptagname
+            choice_prop = choice._prop_name
+            self._add_getter(choice_prop, tag)
+            self._add_creator(choice_prop, tag)
+            self._add_inserter(choice_prop, tag, descriptor._successors)
+            self._add_adder(choice_prop, tag)
+            self._add('get_or_change_to_%s' % choice_prop, self._function(
+                'get_or_change_to_%s' % choice_prop, ['obj'], (
+                    'Return the ``<%s>`` child, replacing any other group ele'
+                    'ment if found.' % tag
+                ), [
+                    'child = obj.%s' % choice_prop,
+                    'if child is not None:',
+                    '    return child',
+                    'obj._remove_%s()' % prop_name,
+                    'child = obj._add_%s()' % choice_prop,
+                    'return child',
+                ]
+            ))
+        self._add('_remove_%s' % prop_name, self._function(
+            '_remove_%s' % prop_name, ['obj'], (
+                'Remove the current choice group child element if present.'
+            ), [
+                'for clark_name in %s:' % _tuple_expr(
+                    qn(t) for t in member_tags
+                ),
+                '    for child in obj.findall(clark_name):',
+                '        obj.remove(child)',
+            ]
+        ))
+
+    # shared member renderers --------------------------------------
+
+    def _add_adder(self, prop_name, tag):
+        self._add('_add_%s' % prop_name, self._function(
+            '_add_%s' % prop_name, ['obj', '**attrs'], (
+                'Add a new ``<%s>`` child element unconditionally, inserted i'
+                'n the correct sequence.' % tag
+            ), [
+                'child = obj._new_%s()' % prop_name,
+                'for key, value in attrs.items():',
+                '    setattr(child, key, value)',
+                'obj._insert_%s(child)' % prop_name,
+                'return child',
+            ]
+        ))
+
+    def _add_creator(self, prop_name, tag):
+        prefix = tag.split(':')[0]
+        self._add('_new_%s' % prop_name, self._function(
+            '_new_%s' % prop_name, ['obj'], (
+                'Return a "loose", newly created ``<%s>`` element having no a'
+                'ttributes, text, or children.' % tag
+            ), [
+                'return oxml_parser.makeelement(%r, nsmap=%s)' % (
+                    qn(tag), self._module.nsmap_name(prefix)
+                ),
+            ]
+        ))
+
+    def _add_getter(self, prop_name, tag):
+        getter = self._function(prop_name, ['obj'], (
+            '``<%s>`` child element or |None| if not present.' % tag
+        ), [
+            'return obj.find(%r)' % qn(tag),
+        ])
+        self._set(prop_name, 'property(%s, None, None)' % getter)
+
+    def _add_inserter(self, prop_name, tag, successors):
+        self._add('_insert_%s' % prop_name, self._function(
+            '_insert_%s' % prop_name, ['obj', 'child'], (
+                'Return the passed ``<%s>`` element after inserting it as a c'
+                'hild in the correct sequence.' % tag
+            ), [
+                'obj._insert_before_first_of(child, %s)' % _tuple_expr(
+                    qn(t) for t in successors or ()
+                ),
+                'return child',
+            ]
+        ))
+
+    # helpers ------------------------------------------------------
+
+    def _add(self, name, function_name):
+        """Schedule *function_name* to be added as *name* if not present."""
+        self._operations.append('(%r, %r, %s)' % ('add', name, function_name))
+
+    def _attr_clark_name(self, descriptor):
+        attr_name = descriptor._attr_name
+        return qn(attr_name) if ':' in attr_name else attr_name
+
+    def _default_expr(self, prop_name, descriptor):
+        """
+        Return a source expression for the default value of *descriptor*,
+        adding a module-level constant for it when it is not a plain
+        literal.
+        """
+        default = descriptor._default
+        if _is_literal(default):
+            return repr(default)
+        if isinstance(default, EnumValue):
+            enum_cls = descriptor._simple_type
+            if getattr(enum_cls, default._member_name, None) is not default:
+                raise UngeneratableDeclaration(
+                    'cannot locate enumeration for %s' % default
+                )
+            expr = '%s.%s' % (self._import(enum_cls), default._member_name)
+        elif isinstance(default, Length):
+            expr = '%s(%d)' % (self._import(type(default)), default)
+        else:
+            raise UngeneratableDeclaration(
+                'cannot render default %r' % (default,)
+            )
+        name = self._module.unique_name(
+            '_%s_%s_default' % (self._cls.__name__, prop_name)
+        )
+        self._definitions.append(['%s = %s' % (name, expr)])
+        return name
+
+    def _function(self, member_name, params, docstring, body):
+        """
+        Add a module-level function definition and return its name.
+        """
+        name = self._module.unique_name(
+            '_%s_%s' % (self._cls.__name__, member_name.lstrip('_'))
+        )
+        lines = ['def %s(%s):' % (name, ', '.join(params))]
+        if docstring is not None:
+            lines.append('    %r' % str(docstring))
+        lines.extend('    %s' % line for line in body)
+        self._definitions.append(lines)
+        return name
+
+    def _import(self, obj):
+        module_name, name = self._module.import_name(obj)
+        self.imports.append((module_name, name))
+        return name
+
+    def _set(self, name, expr):
+        """Schedule *expr* to be assigned as *name* unconditionally."""
+        self._operations.append('(%r, %r, %s)' % ('set', name, expr))
+
+
+def _is_literal(value):
+    """
+    Return |True| if ``repr(value)`` evaluates back to an equal value of
+    the same type, such that it can be rendered as a plain literal.
+    """
+    try:
+        literal = ast.literal_eval(repr(value))
+    except (ValueError, SyntaxError):
+        return False
+    return type(literal) is type(value) and literal == value
+
+
+def _tuple_expr(strs):
+    """
+    Return the source for a tuple literal of the strings in *strs*.
+    """
+    items = [repr(str(item)) for item in strs]
+    if len(items) == 1:
+        return '(%s,)' % items[0]
+    return '(%s)' % ', '.join(items)
+
+
+if __name__ == '__main__':
+    if '--check' in sys.argv[1:]:
+        sys.exit(stale_accessors_message())
+    write_accessors_module()
+    print('wrote %s' % os.path.relpath(ACCESSORS_PATH))
@@ -183,3 +183,14 @@ class CT_SolidColorFillProperties(BaseOxmlElement):
         Choice('a:sysClr'), Choice('a:schemeClr'), Choice('a:prstClr')),
         successors=()
     )
+
+    @classmethod
+    def new_srgb_solidFill(cls, rgb):
+        """Return newly-created "loose" `a:solidFill` subtree of color *rgb*.
+
+        *rgb* is a hex RGB string like 'FF0000'.
+        """
+        return parse_xml(
+            '<a:solidFill %s><a:srgbClr val="%s"/></a:solidFill>' %
+            (nsdecls('a'), rgb)
+        )
@@ -132,5 +132,12 @@ def qn(namespace_prefixed_tag):
     *qualified name*. As an example, ``qn('p:cSld')`` returns
     ``'{http://schemas.../main}cSld'``.
     """
-    nsptag = NamespacePrefixedTag(namespace_prefixed_tag)
-    return nsptag.clark_name
+    clark_name = _qn_cache.get(namespace_prefixed_tag)
+    if clark_name is None:
+        nsptag = NamespacePrefixedTag(namespace_prefixed_tag)
+        clark_name = _qn_cache[namespace_prefixed_tag] = nsptag.clark_name
+    return clark_name
+
+
+#: Memo of Clark names already computed by qn(), keyed by prefixed tag.
+_qn_cache = {}
@@ -7,9 +7,9 @@ lxml custom element classes for shape-related XML elements.
 from __future__ import absolute_import
 
 from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE, PP_PLACEHOLDER
-from pptx.oxml import parse_xml
+from pptx.oxml import clone_prototype, escape_xml, parse_xml
 from pptx.oxml.ns import nsdecls
-from pptx.oxml.shapes.shared import BaseShapeElement
+from pptx.oxml.shapes.shared import BaseShapeElement, set_new_shape_attrs
 from pptx.oxml.simpletypes import (
     ST_Coordinate, ST_PositiveCoordinate, XsdBoolean, XsdString
 )
@@ -86,6 +86,21 @@ class CT_Path2D(BaseOxmlElement):
         pt.x, pt.y = x, y
         return lnTo
 
+    def add_lnTos(self, xs, ys):
+        """Append an `a:lnTo` subtree for each end point in *xs* and *ys*.
+
+        *xs* and *ys* are equal-length sequences of integral x and y values.
+        The new elements are produced with a single parser invocation, which
+        is much faster than adding them one at a time when there are many.
+        """
+        container = parse_xml(
+            '<a:path %s>%s</a:path>' % (nsdecls('a'), ''.join(
+                '<a:lnTo><a:pt x="%d" y="%d"/></a:lnTo>' % (x, y)
+                for x, y in zip(xs, ys)
+            ))
+        )
+        self.extend(list(container))
+
     def add_moveTo(self, x, y):
         """Return a newly created `a:moveTo` subtree with point *(x, y)*.
 
@@ -219,14 +234,31 @@ class CT_Shape(BaseShapeElement):
         """
         return self.spPr.ln
 
+    @staticmethod
+    def autoshape_sp_xml(id_, name, prst, left, top, width, height,
+                         spPr_xml='', p_xml=''):
+        """
+        Return XML text for a ``<p:sp>`` element configured as a base auto
+        shape. *spPr_xml* is inserted after the ``<a:prstGeom>`` element,
+        e.g. fill and line properties, and *p_xml* is the content of its
+        (single) paragraph.
+        """
+        tmpl = CT_Shape._autoshape_sp_tmpl()
+        return tmpl % (
+            id_, escape_xml(name), left, top, width, height,
+            prst, spPr_xml, p_xml
+        )
+
     @staticmethod
     def new_autoshape_sp(id_, name, prst, left, top, width, height):
         """
         Return a new ``<p:sp>`` element tree configured as a base auto shape.
         """
-        tmpl = CT_Shape._autoshape_sp_tmpl()
-        xml = tmpl % (id_, name, left, top, width, height, prst)
-        sp = parse_xml(xml)
+        sp = clone_prototype(
+            ('p:sp', 'autoshape', prst),
+            lambda: CT_Shape.autoshape_sp_xml(0, '', prst, 0, 0, 0, 0)
+        )
+        set_new_shape_attrs(sp, id_, name, left, top, width, height)
         return sp
 
     @staticmethod
@@ -236,9 +268,11 @@ class CT_Shape(BaseShapeElement):
         The returned shape has a `a:custGeom` subtree but no paths in its
         path list.
         """
-        tmpl = CT_Shape._freeform_sp_tmpl()
-        xml = tmpl % (shape_id, name, x, y, cx, cy)
-        sp = parse_xml(xml)
+        sp = clone_prototype(
+            ('p:sp', 'freeform'),
+            lambda: CT_Shape._freeform_sp_tmpl() % (0, '', 0, 0, 0, 0)
+        )
+        set_new_shape_attrs(sp, shape_id, name, x, y, cx, cy)
         return sp
 
     @staticmethod
@@ -247,9 +281,10 @@ class CT_Shape(BaseShapeElement):
         Return a new ``<p:sp>`` element tree configured as a placeholder
         shape.
         """
-        tmpl = CT_Shape._ph_sp_tmpl()
-        xml = tmpl % (id_, name)
-        sp = parse_xml(xml)
+        sp = clone_prototype(
+            ('p:sp', 'placeholder'), lambda: CT_Shape._ph_sp_tmpl() % (0, '')
+        )
+        set_new_shape_attrs(sp, id_, name)
 
         ph = sp.nvSpPr.nvPr.get_or_add_ph()
         ph.type = ph_type
@@ -274,11 +309,27 @@ class CT_Shape(BaseShapeElement):
         Return a new ``<p:sp>`` element tree configured as a base textbox
         shape.
         """
-        tmpl = CT_Shape._textbox_sp_tmpl()
-        xml = tmpl % (id_, name, left, top, width, height)
-        sp = parse_xml(xml)
+        sp = clone_prototype(
+            ('p:sp', 'textbox'),
+            lambda: CT_Shape.textbox_sp_xml(0, '', 0, 0, 0, 0)
+        )
+        set_new_shape_attrs(sp, id_, name, left, top, width, height)
         return sp
 
+    @staticmethod
+    def textbox_sp_xml(id_, name, left, top, width, height,
+                       spPr_xml='<a:noFill/>', p_xml=''):
+        """
+        Return XML text for a ``<p:sp>`` element configured as a base
+        textbox shape. *spPr_xml* follows the ``<a:prstGeom>`` element and
+        *p_xml* is the content of its (single) paragraph.
+        """
+        tmpl = CT_Shape._textbox_sp_tmpl()
+        return tmpl % (
+            id_, escape_xml(name), left, top, width, height,
+            spPr_xml, p_xml
+        )
+
     @property
     def prst(self):
         """
@@ -314,7 +365,7 @@ class CT_Shape(BaseShapeElement):
             '    </a:xfrm>\n'
             '    <a:prstGeom prst="%s">\n'
             '      <a:avLst/>\n'
-            '    </a:prstGeom>\n'
+            '    </a:prstGeom>%s\n'
             '  </p:spPr>\n'
             '  <p:style>\n'
             '    <a:lnRef idx="1">\n'
@@ -334,11 +385,13 @@ class CT_Shape(BaseShapeElement):
             '    <a:bodyPr rtlCol="0" anchor="ctr"/>\n'
             '    <a:lstStyle/>\n'
             '    <a:p>\n'
-            '      <a:pPr algn="ctr"/>\n'
+            '      <a:pPr algn="ctr"/>%s\n'
             '    </a:p>\n'
             '  </p:txBody>\n'
-            '</p:sp>' %
-            (nsdecls('a', 'p'), '%d', '%s', '%d', '%d', '%d', '%d', '%s')
+            '</p:sp>' % (
+                nsdecls('a', 'p'), '%d', '%s', '%d', '%d', '%d', '%d', '%s',
+                '%s', '%s'
+            )
         )
 
     @staticmethod
@@ -424,17 +477,19 @@ class CT_Shape(BaseShapeElement):
             '    <a:prstGeom prst="rect">\n'
             '      <a:avLst/>\n'
             '    </a:prstGeom>\n'
-            '    <a:noFill/>\n'
+            '    %s\n'
             '  </p:spPr>\n'
             '  <p:txBody>\n'
             '    <a:bodyPr wrap="none">\n'
             '      <a:spAutoFit/>\n'
             '    </a:bodyPr>\n'
             '    <a:lstStyle/>\n'
-            '    <a:p/>\n'
+            '    <a:p>%s</a:p>\n'
             '  </p:txBody>\n'
-            '</p:sp>' %
-            (nsdecls('a', 'p'), '%d', '%s', '%d', '%d', '%d', '%d')
+            '</p:sp>' % (
+                nsdecls('a', 'p'), '%d', '%s', '%d', '%d', '%d', '%d', '%s',
+                '%s'
+            )
         )
 
 
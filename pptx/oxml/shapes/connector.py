@@ -6,9 +6,9 @@ lxml custom element classes for shape-related XML elements.
 
 from __future__ import absolute_import
 
-from .. import parse_xml
+from .. import clone_prototype, escape_xml
 from ..ns import nsdecls
-from .shared import BaseShapeElement
+from .shared import BaseShapeElement, set_new_shape_attrs
 from ..simpletypes import ST_DrawingElementId, XsdUnsignedInt
 from ..xmlchemy import (
     BaseOxmlElement, OneAndOnlyOne, RequiredAttribute, ZeroOrOne
@@ -36,27 +36,42 @@ class CT_Connector(BaseShapeElement):
     del _tag_seq
 
     @classmethod
-    def new_cxnSp(cls, id_, name, prst, x, y, cx, cy, flipH, flipV):
+    def cxnSp_xml(cls, id_, name, prst, x, y, cx, cy, flipH, flipV,
+                  spPr_xml=''):
         """
-        Return a new ``<p:cxnSp>`` element tree configured as a base
-        connector.
+        Return XML text for a ``<p:cxnSp>`` element configured as a base
+        connector. *spPr_xml*, e.g. line properties, is inserted after the
+        ``<a:prstGeom>`` element.
         """
         tmpl = cls._cxnSp_tmpl()
         flip = (
             (' flipH="1"' if flipH else '') + (' flipV="1"' if flipV else '')
         )
-        xml = tmpl.format(**{
-            'nsdecls': nsdecls('a', 'p'),
-            'id':      id_,
-            'name':    name,
-            'x':       x,
-            'y':       y,
-            'cx':      cx,
-            'cy':      cy,
-            'prst':    prst,
-            'flip':    flip,
+        return tmpl.format(**{
+            'nsdecls':  nsdecls('a', 'p'),
+            'id':       id_,
+            'name':     escape_xml(name),
+            'x':        x,
+            'y':        y,
+            'cx':       cx,
+            'cy':       cy,
+            'prst':     prst,
+            'flip':     flip,
+            'spPr_xml': spPr_xml,
         })
-        return parse_xml(xml)
+
+    @classmethod
+    def new_cxnSp(cls, id_, name, prst, x, y, cx, cy, flipH, flipV):
+        """
+        Return a new ``<p:cxnSp>`` element tree configured as a base
+        connector.
+        """
+        cxnSp = clone_prototype(
+            ('p:cxnSp', prst, bool(flipH), bool(flipV)),
+            lambda: cls.cxnSp_xml(0, '', prst, 0, 0, 0, 0, flipH, flipV)
+        )
+        set_new_shape_attrs(cxnSp, id_, name, x, y, cx, cy)
+        return cxnSp
 
     @staticmethod
     def _cxnSp_tmpl():
@@ -74,7 +89,7 @@ class CT_Connector(BaseShapeElement):
             '    </a:xfrm>\n'
             '    <a:prstGeom prst="{prst}">\n'
             '      <a:avLst/>\n'
-            '    </a:prstGeom>\n'
+            '    </a:prstGeom>{spPr_xml}\n'
             '  </p:spPr>\n'
             '  <p:style>\n'
             '    <a:lnRef idx="2">\n'
@@ -6,10 +6,10 @@ lxml custom element class for CT_GraphicalObjectFrame XML element.
 
 from __future__ import absolute_import
 
-from .. import parse_xml
+from .. import clone_prototype
 from ..chart.chart import CT_Chart
 from ..ns import nsdecls
-from .shared import BaseShapeElement
+from .shared import BaseShapeElement, set_new_shape_attrs
 from ..simpletypes import XsdString
 from ...spec import GRAPHIC_DATA_URI_CHART, GRAPHIC_DATA_URI_TABLE
 from ..table import CT_Table
@@ -112,8 +112,11 @@ class CT_GraphicalObjectFrame(BaseShapeElement):
         containing a table or chart. Note that a graphicFrame element is not
         a valid shape until it contains a graphical object such as a table.
         """
-        xml = cls._graphicFrame_tmpl() % (id_, name, x, y, cx, cy)
-        graphicFrame = parse_xml(xml)
+        graphicFrame = clone_prototype(
+            'p:graphicFrame',
+            lambda: cls._graphicFrame_tmpl() % (0, '', 0, 0, 0, 0)
+        )
+        set_new_shape_attrs(graphicFrame, id_, name, x, y, cx, cy)
         return graphicFrame
 
     @classmethod
@@ -129,6 +132,21 @@ class CT_GraphicalObjectFrame(BaseShapeElement):
         )
         return graphicFrame
 
+    @classmethod
+    def new_text_table_graphicFrame(cls, id_, name, texts, x, y, cx, cy,
+                                    first_row=True):
+        """
+        Return a ``<p:graphicFrame>`` element tree populated with a table
+        element having a cell for each string in *texts*, a sequence of
+        rows each having one string per column.
+        """
+        graphicFrame = cls.new_graphicFrame(id_, name, x, y, cx, cy)
+        graphicFrame.graphic.graphicData.uri = GRAPHIC_DATA_URI_TABLE
+        graphicFrame.graphic.graphicData.append(
+            CT_Table.new_tbl_from_texts(texts, cx, cy, first_row)
+        )
+        return graphicFrame
+
     @classmethod
     def _graphicFrame_tmpl(cls):
         return (
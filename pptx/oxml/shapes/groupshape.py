@@ -7,21 +7,86 @@ from __future__ import (
 )
 
 from pptx.enum.shapes import MSO_CONNECTOR_TYPE
-from pptx.oxml import parse_xml
+from pptx.oxml import clone_prototype, parse_xml
 from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.oxml.shapes.connector import CT_Connector
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.oxml.shapes.picture import CT_Picture
-from pptx.oxml.shapes.shared import BaseShapeElement
+from pptx.oxml.shapes.shared import (
+    BaseShapeElement, discard_cached_shape_elms, set_new_shape_attrs
+)
 from pptx.oxml.xmlchemy import BaseOxmlElement, OneAndOnlyOne, ZeroOrOne
-from pptx.util import Emu
+from pptx.util import Deferral, Emu
+
+
+def _recalculate_deferred_extents(grpSps):
+    """
+    Recalculate the extents of each group element in *grpSps* and of each of
+    its ancestor groups, each once, deepest groups first so every group sees
+    the final extents of the groups it contains.
+    """
+    affected = {}
+    for grpSp in set(grpSps):
+        ancestors = list(grpSp.iterancestors())
+        affected[grpSp] = len(ancestors)
+        for depth, ancestor in enumerate(reversed(ancestors)):
+            if ancestor.tag == grpSp.tag:
+                affected[ancestor] = depth
+    for grpSp in sorted(affected, key=affected.get, reverse=True):
+        grpSp._update_extents()
+
+
+_deferred_extents = Deferral(flush=_recalculate_deferred_extents)
+
+
+def deferred_extents():
+    """
+    Return a context manager that postpones group extents recalculation in
+    the current thread until the ``with`` block exits.
+
+    Each group shape whose extents would have been recalculated in the block
+    is recorded instead, and on exit each recorded group and each of its
+    ancestor groups is recalculated exactly once, innermost first. Blocks
+    can be nested; only the outermost one recalculates, and only when it
+    exits normally.
+    """
+    return _deferred_extents.deferring()
+
+
+def _shape_elms_cache(f):
+    """
+    Like |lazyproperty|, but the cached value is discarded when the children
+    of the group element appear to have changed since it was computed.
+    """
+    cache_attr_name = '_%s' % f.__name__
+
+    def get_prop_value(obj):
+        obj._discard_cached_shape_elms_if_changed()
+        try:
+            return getattr(obj, cache_attr_name)
+        except AttributeError:
+            value = f(obj)
+            setattr(obj, cache_attr_name, value)
+            return value
+
+    return property(get_prop_value, doc=f.__doc__)
 
 
 class CT_GroupShape(BaseShapeElement):
     """
     Used for the shape tree (``<p:spTree>``) element as well as the group
     shape (``<p:grpSp>``) element.
+
+    The sequence of shape child elements is cached on the element (proxy)
+    and discarded on any change to its children, whether made through one of
+    the child-mutating methods of this element or through :meth:`addnext` or
+    :meth:`addprevious` on a shape child. Other lxml mutations, such as
+    ``grpSpPr.addnext(sp)`` or :func:`lxml.etree.strip_elements`, are
+    detected on the next access by comparing the number of children and the
+    identity of the last child with those seen when the cache was filled. A
+    change preserving both, like swapping two shapes using lxml directly,
+    is not detected; call :meth:`discard_cached_shape_elms` after one.
     """
     nvGrpSpPr = OneAndOnlyOne('p:nvGrpSpPr')
     grpSpPr = OneAndOnlyOne('p:grpSpPr')
@@ -31,6 +96,15 @@ class CT_GroupShape(BaseShapeElement):
         qn('p:pic'), qn('p:contentPart')
     )
 
+    def __delitem__(self, index):
+        discard_cached_shape_elms(self)
+        super(CT_GroupShape, self).__delitem__(index)
+
+    def __setitem__(self, index, value):
+        elms = value if isinstance(index, slice) else (value,)
+        discard_cached_shape_elms(self, *[e.getparent() for e in elms])
+        super(CT_GroupShape, self).__setitem__(index, value)
+
     def add_autoshape(self, id_, name, prst, x, y, cx, cy):
         """
         Append a new ``<p:sp>`` shape to the group/shapetree having the
@@ -52,23 +126,19 @@ class CT_GroupShape(BaseShapeElement):
         self.insert_element_before(cxnSp, 'p:extLst')
         return cxnSp
 
-    def add_freeform_sp(self, x, y, cx, cy):
+    def add_freeform_sp(self, id_, name, x, y, cx, cy):
         """Append a new freeform `p:sp` with specified position and size."""
-        shape_id = self._next_shape_id
-        name = 'Freeform %d' % (shape_id-1,)
-        sp = CT_Shape.new_freeform_sp(shape_id, name, x, y, cx, cy)
+        sp = CT_Shape.new_freeform_sp(id_, name, x, y, cx, cy)
         self.insert_element_before(sp, 'p:extLst')
         return sp
 
-    def add_grpSp(self):
+    def add_grpSp(self, id_, name):
         """Return `p:grpSp` element newly appended to this shape tree.
 
-        The element contains no sub-shapes, is positioned at (0, 0), and has
-        width and height of zero.
+        The element has *id_* and *name*, contains no sub-shapes, is
+        positioned at (0, 0), and has width and height of zero.
         """
-        shape_id = self._next_shape_id
-        name = 'Group %d' % (shape_id-1,)
-        grpSp = CT_GroupShape.new_grpSp(shape_id, name)
+        grpSp = CT_GroupShape.new_grpSp(id_, name)
         self.insert_element_before(grpSp, 'p:extLst')
         return grpSp
 
@@ -92,6 +162,27 @@ class CT_GroupShape(BaseShapeElement):
         self.insert_element_before(sp, 'p:extLst')
         return sp
 
+    def add_shapes_from_xml(self, shape_xmls):
+        """
+        Return list of the shape elements parsed from the XML text items in
+        *shape_xmls*, inserted in that order before any ``<p:extLst>``
+        child. All the items are parsed with a single parser invocation.
+        """
+        container = parse_xml(
+            '<p:spTree %s>%s</p:spTree>' % (
+                nsdecls('a', 'p', 'r'), ''.join(shape_xmls)
+            )
+        )
+        shape_elms = list(container)
+        discard_cached_shape_elms(self)
+        extLst = self.find(qn('p:extLst'))
+        if extLst is None:
+            self.extend(shape_elms)
+        else:
+            for shape_elm in shape_elms:
+                extLst.addprevious(shape_elm)
+        return shape_elms
+
     def add_table(self, id_, name, rows, cols, x, y, cx, cy):
         """
         Append a ``<p:graphicFrame>`` shape containing a table as specified
@@ -103,6 +194,18 @@ class CT_GroupShape(BaseShapeElement):
         self.insert_element_before(graphicFrame, 'p:extLst')
         return graphicFrame
 
+    def add_text_table(self, id_, name, texts, x, y, cx, cy,
+                       first_row=True):
+        """
+        Append a ``<p:graphicFrame>`` shape containing a table having
+        a cell for each string in *texts*, a sequence of rows of strings.
+        """
+        graphicFrame = CT_GraphicalObjectFrame.new_text_table_graphicFrame(
+            id_, name, texts, x, y, cx, cy, first_row
+        )
+        self.insert_element_before(graphicFrame, 'p:extLst')
+        return graphicFrame
+
     def add_textbox(self, id_, name, x, y, cx, cy):
         """
         Append a newly-created textbox ``<p:sp>`` shape having the specified
@@ -112,6 +215,10 @@ class CT_GroupShape(BaseShapeElement):
         self.insert_element_before(sp, 'p:extLst')
         return sp
 
+    def append(self, element):
+        discard_cached_shape_elms(self, element.getparent())
+        super(CT_GroupShape, self).append(element)
+
     @property
     def chExt(self):
         """Descendent `p:grpSpPr/a:xfrm/a:chExt` element."""
@@ -122,6 +229,74 @@ class CT_GroupShape(BaseShapeElement):
         """Descendent `p:grpSpPr/a:xfrm/a:chOff` element."""
         return self.grpSpPr.get_or_add_xfrm().get_or_add_chOff()
 
+    @property
+    def child_transform(self):
+        """(sx, sy, dx, dy) tuple mapping child coordinates to slide space.
+
+        A point (x, y) in the coordinate space of the shapes in this group
+        is at (sx * x + dx, sy * y + dy) on the slide, taking the child
+        offset and extents of this group and of each of its ancestor groups
+        into account. The mapping is the identity for the shape tree itself.
+        Rotation and flipping of groups is not reflected.
+        """
+        if not self.tag == qn('p:grpSp'):
+            return 1.0, 1.0, 0, 0
+
+        sx, sy, dx, dy = self.getparent().child_transform
+        xfrm = self.xfrm
+        if xfrm is None:
+            return sx, sy, dx, dy
+        off, ext, chOff, chExt = xfrm.off, xfrm.ext, xfrm.chOff, xfrm.chExt
+        if off is None or ext is None or chOff is None or chExt is None:
+            return sx, sy, dx, dy
+
+        scale_x = ext.cx / chExt.cx if chExt.cx else 1.0
+        scale_y = ext.cy / chExt.cy if chExt.cy else 1.0
+        return (
+            sx * scale_x, sy * scale_y,
+            sx * (off.x - chOff.x * scale_x) + dx,
+            sy * (off.y - chOff.y * scale_y) + dy,
+        )
+
+    def clear(self):
+        discard_cached_shape_elms(self)
+        super(CT_GroupShape, self).clear()
+
+    def discard_cached_shape_elms(self):
+        """Drop the cached shape and placeholder element sequences."""
+        cache_attr_names = ('_shape_elms', '_ph_elms', '_ph_elm_index')
+        for cache_attr_name in cache_attr_names:
+            try:
+                delattr(self, cache_attr_name)
+            except AttributeError:
+                pass
+
+    def extend(self, elements):
+        elements = list(elements)
+        discard_cached_shape_elms(self, *[e.getparent() for e in elements])
+        super(CT_GroupShape, self).extend(elements)
+
+    def find_ph_elm(self, idx=None, ph_type=None):
+        """
+        Return the first placeholder child element having *idx* or, when
+        *idx* is |None|, having *ph_type*. Returns |None| if there is no such
+        placeholder.
+
+        Placeholders are looked up in :attr:`ph_elm_index`. The element found
+        is checked against its current ``<p:ph>`` attributes, and the index
+        rebuilt when it doesn't match or nothing is found, so a placeholder
+        whose idx or type was changed in place is still found.
+        """
+        key = ('type', ph_type) if idx is None else ('idx', idx)
+        ph_elm, ph = self.ph_elm_index.get(key, (None, None))
+        if ph is not None and key in self._ph_keys(ph):
+            return ph_elm
+        try:
+            delattr(self, '_ph_elm_index')
+        except AttributeError:
+            pass
+        return self.ph_elm_index.get(key, (None, None))[0]
+
     def get_or_add_xfrm(self):
         """
         Return the ``<a:xfrm>`` grandchild element, newly-added if not
@@ -129,6 +304,10 @@ class CT_GroupShape(BaseShapeElement):
         """
         return self.grpSpPr.get_or_add_xfrm()
 
+    def insert(self, index, element):
+        discard_cached_shape_elms(self, element.getparent())
+        super(CT_GroupShape, self).insert(index, element)
+
     def iter_ph_elms(self):
         """
         Generate each placeholder shape child element in document order.
@@ -164,26 +343,33 @@ class CT_GroupShape(BaseShapeElement):
     @classmethod
     def new_grpSp(cls, id_, name):
         """Return new "loose" `p:grpSp` element having *id_* and *name*."""
-        xml = (
-            '<p:grpSp %s>\n'
-            '  <p:nvGrpSpPr>\n'
-            '    <p:cNvPr id="%%d" name="%%s"/>\n'
-            '    <p:cNvGrpSpPr/>\n'
-            '    <p:nvPr/>\n'
-            '  </p:nvGrpSpPr>\n'
-            '  <p:grpSpPr>\n'
-            '    <a:xfrm>\n'
-            '      <a:off x="0" y="0"/>\n'
-            '      <a:ext cx="0" cy="0"/>\n'
-            '      <a:chOff x="0" y="0"/>\n'
-            '      <a:chExt cx="0" cy="0"/>\n'
-            '    </a:xfrm>\n'
-            '  </p:grpSpPr>\n'
-            '</p:grpSp>' % nsdecls('a', 'p', 'r')
-        ) % (id_, name)
-        grpSp = parse_xml(xml)
+        grpSp = clone_prototype('p:grpSp', cls._grpSp_tmpl)
+        set_new_shape_attrs(grpSp, id_, name)
         return grpSp
 
+    @_shape_elms_cache
+    def ph_elms(self):
+        """
+        Tuple of the placeholder shape child elements in document order,
+        cached like :attr:`shape_elms`.
+        """
+        return tuple(e for e in self.shape_elms if e.has_ph_elm)
+
+    @_shape_elms_cache
+    def ph_elm_index(self):
+        """
+        Dict mapping ``('idx', idx)`` and ``('type', ph_type)`` keys to
+        a ``(ph_elm, ph)`` pair for the first placeholder child element having
+        that idx or type, *ph* being its ``<p:ph>`` element. Cached like
+        :attr:`ph_elms`.
+        """
+        index = {}
+        for ph_elm in self.ph_elms:
+            ph = ph_elm.ph
+            for key in self._ph_keys(ph):
+                index.setdefault(key, (ph_elm, ph))
+        return index
+
     def recalculate_extents(self):
         """Adjust x, y, cx, and cy to incorporate all contained shapes.
 
@@ -191,19 +377,37 @@ class CT_GroupShape(BaseShapeElement):
         removed, or its position or size updated.
 
         This method is recursive "upwards" since a change in a group shape
-        can change the position and size of its containing group.
+        can change the position and size of its containing group. Inside
+        a :func:`deferred_extents` block the group is only recorded, to be
+        recalculated once when the block exits.
         """
         if not self.tag == qn('p:grpSp'):
             return
 
-        x, y, cx, cy = self._child_extents
+        if _deferred_extents.record(self):
+            return
 
-        self.chOff.x = self.x = x
-        self.chOff.y = self.y = y
-        self.chExt.cx = self.cx = cx
-        self.chExt.cy = self.cy = cy
+        self._update_extents()
         self.getparent().recalculate_extents()
 
+    def remove(self, element):
+        discard_cached_shape_elms(self)
+        super(CT_GroupShape, self).remove(element)
+
+    def replace(self, old_element, new_element):
+        discard_cached_shape_elms(self, new_element.getparent())
+        super(CT_GroupShape, self).replace(old_element, new_element)
+
+    @_shape_elms_cache
+    def shape_elms(self):
+        """
+        Tuple of the child elements of this ``<p:spTree>`` element that
+        correspond to a shape, in document order. The tuple is cached until
+        the children of this element change, so indexed access and |len| on
+        a shape collection don't rescan the shape tree.
+        """
+        return tuple(self.iter_shape_elms())
+
     @property
     def xfrm(self):
         """
@@ -211,6 +415,22 @@ class CT_GroupShape(BaseShapeElement):
         """
         return self.grpSpPr.xfrm
 
+    def _discard_cached_shape_elms_if_changed(self):
+        """
+        Discard the cached shape sequences when the count of children or the
+        last child differs from when they were cached, as it does after most
+        changes made with lxml methods this class doesn't override.
+        """
+        child_count = len(self)
+        last_child = self[-1] if child_count else None
+        seen = getattr(self, '_children_seen', None)
+        if seen is not None:
+            seen_count, seen_last_child = seen
+            if seen_count == child_count and seen_last_child is last_child:
+                return
+        self.discard_cached_shape_elms()
+        self._children_seen = (child_count, last_child)
+
     @property
     def _child_extents(self):
         """(x, y, cx, cy) tuple representing net position and size.
@@ -234,20 +454,45 @@ class CT_GroupShape(BaseShapeElement):
 
         return x, y, cx, cy
 
-    @property
-    def _next_shape_id(self):
-        """Return unique shape id suitable for use with a new shape element.
+    @classmethod
+    def _grpSp_tmpl(cls):
+        return (
+            '<p:grpSp %s>\n'
+            '  <p:nvGrpSpPr>\n'
+            '    <p:cNvPr id="0" name=""/>\n'
+            '    <p:cNvGrpSpPr/>\n'
+            '    <p:nvPr/>\n'
+            '  </p:nvGrpSpPr>\n'
+            '  <p:grpSpPr>\n'
+            '    <a:xfrm>\n'
+            '      <a:off x="0" y="0"/>\n'
+            '      <a:ext cx="0" cy="0"/>\n'
+            '      <a:chOff x="0" y="0"/>\n'
+            '      <a:chExt cx="0" cy="0"/>\n'
+            '    </a:xfrm>\n'
+            '  </p:grpSpPr>\n'
+            '</p:grpSp>' % nsdecls('a', 'p', 'r')
+        )
 
-        The returned id is the next available positive integer drawing object
-        id in shape tree, starting from 1 and making use of any gaps in
-        numbering. In practice, the minimum id is 2 because the spTree
-        element itself is always assigned id="1".
-        """
-        id_str_lst = self.xpath('//@id')
-        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
-        for n in range(1, len(used_ids)+2):
-            if n not in used_ids:
-                return n
+    @staticmethod
+    def _ph_keys(ph):
+        """Return the two `ph_elm_index` keys for `p:ph` element *ph*."""
+        return ('idx', ph.idx), ('type', ph.type)
+
+    def _insert_before_first_of(self, elm, clark_names):
+        discard_cached_shape_elms(self, elm.getparent())
+        return super(CT_GroupShape, self)._insert_before_first_of(
+            elm, clark_names
+        )
+
+    def _update_extents(self):
+        """Set position and size of this group from its child shapes."""
+        x, y, cx, cy = self._child_extents
+
+        self.chOff.x = self.x = x
+        self.chOff.y = self.y = y
+        self.chExt.cx = self.cx = cx
+        self.chExt.cy = self.cy = cy
 
 
 class CT_GroupShapeNonVisual(BaseShapeElement):
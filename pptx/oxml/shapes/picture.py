@@ -6,9 +6,9 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
-from .. import parse_xml
-from ..ns import nsdecls
-from .shared import BaseShapeElement
+from .. import clone_prototype, parse_xml
+from ..ns import nsdecls, qn
+from .shared import BaseShapeElement, set_new_shape_attrs
 from ..xmlchemy import BaseOxmlElement, OneAndOnlyOne
 
 
@@ -59,9 +59,12 @@ class CT_Picture(BaseShapeElement):
         Return a new `p:pic` placeholder element populated with the supplied
         parameters.
         """
-        return parse_xml(
-            cls._pic_ph_tmpl() % (id_, name, desc, rId)
+        pic = clone_prototype(
+            ('p:pic', 'placeholder'),
+            lambda: cls._pic_ph_tmpl() % (0, '', '', '')
         )
+        cls._set_new_pic_attrs(pic, id_, name, desc, rId)
+        return pic
 
     @classmethod
     def new_pic(cls, id_, name, desc, rId, left, top, width, height):
@@ -69,10 +72,11 @@ class CT_Picture(BaseShapeElement):
         Return a new ``<p:pic>`` element tree configured with the supplied
         parameters.
         """
-        xml = cls._pic_tmpl() % (
-            id_, name, desc, rId, left, top, width, height
+        pic = clone_prototype(
+            'p:pic', lambda: cls._pic_tmpl() % (0, '', '', '', 0, 0, 0, 0)
         )
-        pic = parse_xml(xml)
+        cls._set_new_pic_attrs(pic, id_, name, desc, rId, left, top, width,
+                               height)
         return pic
 
     @classmethod
@@ -233,6 +237,16 @@ class CT_Picture(BaseShapeElement):
             '</p:pic>' % nsdecls('a', 'p', 'r')
         )
 
+    @staticmethod
+    def _set_new_pic_attrs(pic, id_, name, desc, rId, x=None, y=None,
+                           cx=None, cy=None):
+        """
+        Set the variable attributes of *pic*, a copy of a picture prototype.
+        """
+        set_new_shape_attrs(pic, id_, name, x, y, cx, cy)
+        pic.nvPicPr.cNvPr.set('descr', desc)
+        pic.blipFill.blip.set(qn('r:embed'), rId)
+
     def _srcRect_x(self, attr_name):
         """
         Value of `p:blipFill/a:srcRect/@{attr_name}` or 0.0 if not present.
@@ -10,9 +10,9 @@ from pptx.dml.fill import CT_GradientFillProperties
 from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.oxml.ns import qn
 from pptx.oxml.simpletypes import (
-    ST_Angle, ST_Coordinate, ST_Direction, ST_DrawingElementId, ST_LineWidth,
-    ST_PlaceholderSize, ST_PositiveCoordinate, XsdBoolean, XsdString,
-    XsdUnsignedInt
+    ST_Angle, ST_Coordinate, ST_Direction, ST_DrawingElementId,
+    ST_HexColorRGB, ST_LineWidth, ST_PlaceholderSize, ST_PositiveCoordinate,
+    XsdBoolean, XsdString, XsdUnsignedInt
 )
 from pptx.oxml.xmlchemy import (
     BaseOxmlElement, Choice, OptionalAttribute, OxmlElement,
@@ -21,11 +21,36 @@ from pptx.oxml.xmlchemy import (
 from pptx.util import Emu
 
 
+class _ShapeGeometry(object):
+    """
+    Process-wide count of shape geometry changes. *generation* is incremented
+    whenever a shape is moved or resized through its shape element or the
+    shapes in a shape tree change, so a value computed from shape geometry
+    can be cached until the generation moves on.
+    """
+    generation = 0
+
+
+def shape_geometry_generation():
+    """Return the current shape geometry generation, an int."""
+    return _ShapeGeometry.generation
+
+
 class BaseShapeElement(BaseOxmlElement):
     """
     Provides common behavior for shape element classes like CT_Shape,
     CT_Picture, etc.
     """
+    def addnext(self, element):
+        """Override keeping shape sequences cached on the parents current."""
+        discard_cached_shape_elms(self.getparent(), element.getparent())
+        super(BaseShapeElement, self).addnext(element)
+
+    def addprevious(self, element):
+        """Override keeping shape sequences cached on the parents current."""
+        discard_cached_shape_elms(self.getparent(), element.getparent())
+        super(BaseShapeElement, self).addprevious(element)
+
     @property
     def cx(self):
         return self._get_xfrm_attr('cx')
@@ -42,6 +67,14 @@ class BaseShapeElement(BaseOxmlElement):
     def cy(self, value):
         self._set_xfrm_attr('cy', value)
 
+    def discard_cached_shape_elms(self):
+        """Drop any cached sequence of child shape elements.
+
+        Only a shape tree or group shape caches its shape elements, so this
+        does nothing for other shapes; CT_GroupShape overrides it.
+        """
+        pass
+
     @property
     def flipH(self):
         return bool(self._get_xfrm_attr('flipH'))
@@ -204,10 +237,47 @@ class BaseShapeElement(BaseOxmlElement):
         return getattr(xfrm, name)
 
     def _set_xfrm_attr(self, name, value):
+        _ShapeGeometry.generation += 1
         xfrm = self.get_or_add_xfrm()
         setattr(xfrm, name, value)
 
 
+def discard_cached_shape_elms(*elms):
+    """Drop the shape sequences cached on each shape element in *elms*.
+
+    Called before a structural change to the children of the elements, such
+    as adding, removing, or moving a shape. Items in *elms* that are |None|
+    or are not shape elements are ignored.
+    """
+    _ShapeGeometry.generation += 1
+    for elm in elms:
+        if isinstance(elm, BaseShapeElement):
+            elm.discard_cached_shape_elms()
+
+
+def set_new_shape_attrs(shape_elm, id_, name, x=None, y=None, cx=None,
+                        cy=None):
+    """Set the id and name of *shape_elm*, a copy of a prototype shape.
+
+    When *x* is not |None|, the offset and extents of the first transform in
+    *shape_elm* are also set from *x*, *y*, *cx* and *cy*. The attributes are
+    set directly, skipping simple-type validation, so values must already be
+    valid, as they are when they come from a new-shape constructor.
+    """
+    # ---cNvPr is the first child of the first child in every shape type---
+    cNvPr = shape_elm[0][0]
+    cNvPr.set('id', '%d' % id_)
+    cNvPr.set('name', name)
+    if x is None:
+        return
+    off = next(shape_elm.iter(qn('a:off')))
+    off.set('x', '%d' % x)
+    off.set('y', '%d' % y)
+    ext = off.getnext()
+    ext.set('cx', '%d' % cx)
+    ext.set('cy', '%d' % cy)
+
+
 class CT_ApplicationNonVisualDrawingProps(BaseOxmlElement):
     """
     ``<p:nvPr>`` element
@@ -352,6 +422,31 @@ class CT_ShapeProperties(BaseOxmlElement):
             return None
         return Emu(cy_str_lst[0])
 
+    @staticmethod
+    def ln_xml(rgb=None, width=None):
+        """
+        Return XML text for an ``<a:ln>`` element having a solid fill of
+        hex RGB color *rgb*, e.g. 'FF0000', and width *width* in EMU. Either
+        may be |None|, in which case it is omitted and so inherited. Raises
+        |ValueError| if *rgb* is not a valid hex RGB string.
+        """
+        w = '' if width is None else ' w="%d"' % width
+        fill = '' if rgb is None else CT_ShapeProperties.solidFill_xml(rgb)
+        return '<a:ln%s>%s</a:ln>' % (w, fill)
+
+    @staticmethod
+    def solidFill_xml(rgb):
+        """
+        Return XML text for an ``<a:solidFill>`` element of hex RGB color
+        *rgb*, e.g. 'FF0000'. Raises |ValueError| if *rgb* is not a valid
+        hex RGB string.
+        """
+        ST_HexColorRGB.validate(rgb)
+        return (
+            '<a:solidFill><a:srgbClr val="%s"/></a:solidFill>'
+            % ST_HexColorRGB.convert_to_xml(rgb)
+        )
+
     @property
     def x(self):
         """
@@ -10,8 +10,48 @@ from __future__ import absolute_import, print_function
 
 import numbers
 
+from contextlib import contextmanager
+
 from pptx.exc import InvalidXmlError
-from pptx.util import Centipoints, Emu
+from pptx.util import Centipoints, Deferral, Emu
+
+
+def _validate_written_values(written):
+    """
+    Validate each (simple_type, value) pair in *written*, raising the
+    exception for the first invalid value.
+    """
+    for simple_type, value in written:
+        simple_type.validate(value)
+
+
+# ---validation is suspended while _fast_writes is deferring, and values
+# ---written while _validate_after is also deferring are validated on exit
+_fast_writes = Deferral()
+_validate_after = Deferral(flush=_validate_written_values)
+
+
+@contextmanager
+def fast_writes(validate_after=False):
+    """
+    Context manager that skips simple-type validation of attribute values
+    written in the current thread for the duration of the ``with`` block.
+    Intended for bulk builds from trusted values, where validating each
+    value as it is assigned is pure overhead. Values are still converted to
+    their XML string form, so an invalid value can produce invalid XML.
+
+    When *validate_after* is |True|, each value written in the block is
+    recorded and validated once when the outermost such block exits,
+    raising the |TypeError| or |ValueError| for the first invalid value
+    found. The values are already in the XML at that point. They are not
+    validated when the block exits by raising an exception.
+    """
+    with _fast_writes.deferring():
+        if not validate_after:
+            yield
+            return
+        with _validate_after.deferring():
+            yield
 
 
 class BaseSimpleType(object):
@@ -22,7 +62,10 @@ class BaseSimpleType(object):
 
     @classmethod
     def to_xml(cls, value):
-        cls.validate(value)
+        if not _fast_writes.depth:
+            cls.validate(value)
+        elif _validate_after.depth:
+            _validate_after.record((cls, value))
         str_value = cls.convert_to_xml(value)
         return str_value
 
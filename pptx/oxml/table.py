@@ -7,13 +7,13 @@ from __future__ import (
 )
 
 from pptx.enum.text import MSO_VERTICAL_ANCHOR
-from pptx.oxml import parse_xml
+from pptx.oxml import clone_prototype, parse_xml
 from pptx.oxml.dml.fill import CT_GradientFillProperties
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.simpletypes import (
     ST_Coordinate, ST_Coordinate32, XsdBoolean, XsdInt
 )
-from pptx.oxml.text import CT_TextBody
+from pptx.oxml.text import CT_TextBody, CT_TextParagraph
 from pptx.oxml.xmlchemy import (
     BaseOxmlElement, Choice, OneAndOnlyOne, OptionalAttribute,
     RequiredAttribute, ZeroOrMore, ZeroOrOne, ZeroOrOneChoice
@@ -21,8 +21,69 @@ from pptx.oxml.xmlchemy import (
 from pptx.util import Emu, lazyproperty
 
 
-class CT_Table(BaseOxmlElement):
-    """`a:tbl` custom element class"""
+class _BaseTableStructureElement(BaseOxmlElement):
+    """Base class for `a:tbl` and `a:tr`, the elements whose children make
+    up the row and cell structure of a table.
+
+    A change to the children of one of these elements through any of the
+    methods below discards the cell grid cached on the containing `a:tbl`
+    element, as does moving a row or cell with :meth:`addnext` or
+    :meth:`addprevious`.
+    """
+
+    def __delitem__(self, index):
+        discard_tc_grid(self)
+        super(_BaseTableStructureElement, self).__delitem__(index)
+
+    def __setitem__(self, index, value):
+        elms = value if isinstance(index, slice) else (value,)
+        discard_tc_grid(self, *[e.getparent() for e in elms])
+        super(_BaseTableStructureElement, self).__setitem__(index, value)
+
+    def append(self, element):
+        discard_tc_grid(self, element.getparent())
+        super(_BaseTableStructureElement, self).append(element)
+
+    def clear(self):
+        discard_tc_grid(self)
+        super(_BaseTableStructureElement, self).clear()
+
+    def extend(self, elements):
+        elements = list(elements)
+        discard_tc_grid(self, *[e.getparent() for e in elements])
+        super(_BaseTableStructureElement, self).extend(elements)
+
+    def insert(self, index, element):
+        discard_tc_grid(self, element.getparent())
+        super(_BaseTableStructureElement, self).insert(index, element)
+
+    def remove(self, element):
+        discard_tc_grid(self)
+        super(_BaseTableStructureElement, self).remove(element)
+
+    def replace(self, old_element, new_element):
+        discard_tc_grid(self, new_element.getparent())
+        super(_BaseTableStructureElement, self).replace(
+            old_element, new_element
+        )
+
+    def _insert_before_first_of(self, elm, clark_names):
+        discard_tc_grid(self, elm.getparent())
+        return super(_BaseTableStructureElement, self)._insert_before_first_of(
+            elm, clark_names
+        )
+
+
+class CT_Table(_BaseTableStructureElement):
+    """`a:tbl` custom element class
+
+    The rows and cells of the table are indexed in a grid cached on the
+    element (proxy), providing constant-time access to a cell by its
+    position and to the position of a cell. The grid is discarded on any
+    structural change, see :class:`_BaseTableStructureElement`, and rebuilt
+    when a row change made with lxml directly is detected, see
+    :attr:`tc_grid`.
+    """
 
     _tag_seq = ('a:tblPr', 'a:tblGrid', 'a:tr')
     tblPr = ZeroOrOne('a:tblPr', successors=_tag_seq[1:])
@@ -69,12 +130,19 @@ class CT_Table(BaseOxmlElement):
     def firstRow(self, value):
         self._set_boolean_property('firstRow', value)
 
+    def discard_tc_grid(self):
+        """Drop the cached cell grid of this table."""
+        try:
+            delattr(self, '_tc_grid')
+        except AttributeError:
+            pass
+
     def iter_tcs(self):
         """Generate each `a:tc` element in this tbl.
 
         tc elements are generated left-to-right, top-to-bottom.
         """
-        return (tc for tr in self.tr_lst for tc in tr.tc_lst)
+        return (tc for tcs in self.tc_grid.rows for tc in tcs)
 
     @property
     def lastCol(self):
@@ -99,8 +167,8 @@ class CT_Table(BaseOxmlElement):
         if tableStyleId is None:
             tableStyleId = '{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}'
 
-        xml = cls._tbl_tmpl() % (tableStyleId)
-        tbl = parse_xml(xml)
+        tbl = clone_prototype('a:tbl', cls._tbl_tmpl)
+        tbl.tblPr[0].text = tableStyleId
 
         # add specified number of rows and columns
         rowheight = height//rows
@@ -122,9 +190,70 @@ class CT_Table(BaseOxmlElement):
 
         return tbl
 
+    @classmethod
+    def new_tbl_from_texts(cls, texts, width, height, first_row=True,
+                           tableStyleId=None):
+        """Return a new `a:tbl` element tree with a cell for each text.
+
+        *texts* is a sequence of rows, each a sequence of (unicode) strings
+        having one item per column. Each string becomes the text of its
+        cell as it would when assigned to `cell.text`. Width and height are
+        distributed as in :meth:`new_tbl`. The XML for the whole table is
+        generated as text and parsed once.
+        """
+        if tableStyleId is None:
+            tableStyleId = '{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}'
+
+        rows, cols = len(texts), len(texts[0])
+        rowheight, colwidth = height//rows, width//cols
+        col_widths = [colwidth] * (cols-1) + [width - (cols-1) * colwidth]
+        row_heights = [rowheight] * (rows-1) + [height - (rows-1) * rowheight]
+
+        append_text_xml = CT_TextParagraph.append_text_xml
+        tc_tmpl = (
+            '<a:tc><a:txBody><a:bodyPr/><a:lstStyle/><a:p>%s</a:p>'
+            '</a:txBody><a:tcPr/></a:tc>'
+        )
+        tr_xmls = [
+            '<a:tr h="%d">%s</a:tr>' % (
+                h, ''.join(tc_tmpl % append_text_xml(t) for t in row_texts)
+            )
+            for h, row_texts in zip(row_heights, texts)
+        ]
+
+        return parse_xml(
+            '<a:tbl %s><a:tblPr%s bandRow="1"><a:tableStyleId>%s'
+            '</a:tableStyleId></a:tblPr><a:tblGrid>%s</a:tblGrid>%s'
+            '</a:tbl>' % (
+                nsdecls('a'), ' firstRow="1"' if first_row else '',
+                tableStyleId,
+                ''.join('<a:gridCol w="%d"/>' % w for w in col_widths),
+                ''.join(tr_xmls)
+            )
+        )
+
     def tc(self, row_idx, col_idx):
         """Return `a:tc` element at *row_idx*, *col_idx*."""
-        return self.tr_lst[row_idx].tc_lst[col_idx]
+        return self.tc_grid.rows[row_idx][col_idx]
+
+    @property
+    def tc_grid(self):
+        """|_TcGrid| index of the rows and cells of this table.
+
+        Cached until the row or cell structure of the table changes. Rows
+        added or removed with lxml methods this class doesn't override, such
+        as :func:`lxml.etree.strip_elements`, are detected on the next access
+        by comparing the number of children and the identity of the last
+        child with those seen when the grid was built. Other changes made
+        with lxml directly, such as removing a cell, are not detected; call
+        :meth:`discard_tc_grid` after one.
+        """
+        child_count = len(self)
+        children_seen = (child_count, self[-1] if child_count else None)
+        tc_grid = getattr(self, '_tc_grid', None)
+        if tc_grid is None or not tc_grid.matches(children_seen):
+            tc_grid = self._tc_grid = _TcGrid(self, children_seen)
+        return tc_grid
 
     def _get_boolean_property(self, propname):
         """
@@ -164,16 +293,26 @@ class CT_Table(BaseOxmlElement):
         return (
             '<a:tbl %s>\n'
             '  <a:tblPr firstRow="1" bandRow="1">\n'
-            '    <a:tableStyleId>%s</a:tableStyleId>\n'
+            '    <a:tableStyleId/>\n'
             '  </a:tblPr>\n'
             '  <a:tblGrid/>\n'
-            '</a:tbl>' % (nsdecls('a'), '%s')
+            '</a:tbl>' % nsdecls('a')
         )
 
 
 class CT_TableCell(BaseOxmlElement):
     """`a:tc` custom element class"""
 
+    def addnext(self, element):
+        """Override discarding the cell grid cached on the table."""
+        discard_tc_grid(self.getparent(), element.getparent())
+        super(CT_TableCell, self).addnext(element)
+
+    def addprevious(self, element):
+        """Override discarding the cell grid cached on the table."""
+        discard_tc_grid(self.getparent(), element.getparent())
+        super(CT_TableCell, self).addprevious(element)
+
     _tag_seq = ('a:txBody', 'a:tcPr', 'a:extLst')
     txBody = ZeroOrOne('a:txBody', successors=_tag_seq[1:])
     tcPr = ZeroOrOne('a:tcPr', successors=_tag_seq[2:])
@@ -233,8 +372,8 @@ class CT_TableCell(BaseOxmlElement):
     @property
     def col_idx(self):
         """Offset of this cell's column in its table."""
-        # ---tc elements come before any others in `a:tr` element---
-        return self.getparent().index(self)
+        tbl = self.getparent().getparent()
+        return tbl.tc_grid.tc_positions[self][1]
 
     @property
     def is_merge_origin(self):
@@ -303,14 +442,13 @@ class CT_TableCell(BaseOxmlElement):
     @classmethod
     def new(cls):
         """Return a new `a:tc` element subtree."""
-        xml = cls._tc_tmpl()
-        tc = parse_xml(xml)
-        return tc
+        return clone_prototype('a:tc', cls._tc_tmpl)
 
     @property
     def row_idx(self):
         """Offset of this cell's row in its table."""
-        return self.getparent().row_idx
+        tbl = self.getparent().getparent()
+        return tbl.tc_grid.tc_positions[self][0]
 
     @property
     def tbl(self):
@@ -413,13 +551,23 @@ class CT_TableProperties(BaseOxmlElement):
     lastCol = OptionalAttribute('lastCol', XsdBoolean, default=False)
 
 
-class CT_TableRow(BaseOxmlElement):
+class CT_TableRow(_BaseTableStructureElement):
     """
     ``<a:tr>`` custom element class
     """
     tc = ZeroOrMore('a:tc', successors=('a:extLst',))
     h = RequiredAttribute('h', ST_Coordinate)
 
+    def addnext(self, element):
+        """Override discarding the cell grid cached on the table."""
+        discard_tc_grid(self.getparent(), element.getparent())
+        super(CT_TableRow, self).addnext(element)
+
+    def addprevious(self, element):
+        """Override discarding the cell grid cached on the table."""
+        discard_tc_grid(self.getparent(), element.getparent())
+        super(CT_TableRow, self).addprevious(element)
+
     def add_tc(self):
         """
         Return a reference to a newly added minimal valid ``<a:tc>`` child
@@ -430,7 +578,7 @@ class CT_TableRow(BaseOxmlElement):
     @property
     def row_idx(self):
         """Offset of this row in its table."""
-        return self.getparent().tr_lst.index(self)
+        return self.getparent().tc_grid.row_idxs[self]
 
     def _new_tc(self):
         return CT_TableCell.new()
@@ -490,21 +638,21 @@ class TcRange(object):
 
     def iter_except_left_col_tcs(self):
         """Generate each `a:tc` element not in leftmost column of range."""
-        for tr in self._tbl.tr_lst[self._top:self._bottom]:
-            for tc in tr.tc_lst[self._left + 1:self._right]:
+        for tcs in self._rows:
+            for tc in tcs[self._left + 1:self._right]:
                 yield tc
 
     def iter_except_top_row_tcs(self):
         """Generate each `a:tc` element in non-first rows of range."""
-        for tr in self._tbl.tr_lst[self._top + 1:self._bottom]:
-            for tc in tr.tc_lst[self._left:self._right]:
+        for tcs in self._rows[1:]:
+            for tc in tcs[self._left:self._right]:
                 yield tc
 
     def iter_left_col_tcs(self):
         """Generate each `a:tc` element in leftmost column of range."""
         col_idx = self._left
-        for tr in self._tbl.tr_lst[self._top:self._bottom]:
-            yield tr.tc_lst[col_idx]
+        for tcs in self._rows:
+            yield tcs[col_idx]
 
     def iter_tcs(self):
         """Generate each `a:tc` element in this range.
@@ -512,15 +660,12 @@ class TcRange(object):
         Cell elements are generated left-to-right, top-to-bottom.
         """
         return (
-            tc
-            for tr in self._tbl.tr_lst[self._top:self._bottom]
-            for tc in tr.tc_lst[self._left:self._right]
+            tc for tcs in self._rows for tc in tcs[self._left:self._right]
         )
 
     def iter_top_row_tcs(self):
         """Generate each `a:tc` element in topmost row of range."""
-        tr = self._tbl.tr_lst[self._top]
-        for tc in tr.tc_lst[self._left:self._right]:
+        for tc in self._rows[0][self._left:self._right]:
             yield tc
 
     def move_content_to_origin(self):
@@ -568,6 +713,11 @@ class TcRange(object):
         left, _, width, _ = self._extents
         return left + width
 
+    @lazyproperty
+    def _rows(self):
+        """Sequence of the `a:tc` sequences of the table rows in range"""
+        return self._tbl.tc_grid.rows[self._top:self._bottom]
+
     @lazyproperty
     def _tbl(self):
         """`a:tbl` element containing this cell range"""
@@ -578,3 +728,50 @@ class TcRange(object):
         """Index of topmost row in range"""
         _, top, _, _ = self._extents
         return top
+
+
+class _TcGrid(object):
+    """Index of the rows and cells of an `a:tbl` element.
+
+    Built in a single pass over the table and cached on the `a:tbl` element
+    until the table structure changes. *rows* is a tuple of tuples, the
+    `a:tc` elements of each row in document order; *trs* is a tuple of the
+    `a:tr` elements. *row_idxs* maps each `a:tr` element to its offset and
+    *tc_positions* maps each `a:tc` element to its (row_idx, col_idx) pair.
+    *children_seen* is the (child_count, last_child) pair of the `a:tbl`
+    element when the grid is built, used by :meth:`matches`.
+    """
+
+    def __init__(self, tbl, children_seen):
+        self._children_seen = children_seen
+        self.trs = tuple(tbl.tr_lst)
+        self.rows = tuple(tuple(tr.tc_lst) for tr in self.trs)
+        self.row_idxs = dict((tr, idx) for idx, tr in enumerate(self.trs))
+        self.tc_positions = dict(
+            (tc, (row_idx, col_idx))
+            for row_idx, tcs in enumerate(self.rows)
+            for col_idx, tc in enumerate(tcs)
+        )
+
+    def matches(self, children_seen):
+        """
+        Return |True| if *children_seen*, the (child_count, last_child) pair
+        of the `a:tbl` element, is the same as when this grid was built.
+        """
+        child_count, last_child = children_seen
+        seen_count, seen_last_child = self._children_seen
+        return child_count == seen_count and last_child is seen_last_child
+
+
+def discard_tc_grid(*elms):
+    """Drop the cell grid cached on the table of each element in *elms*.
+
+    Called before a structural change to the rows or cells of a table. Each
+    item in *elms* can be an `a:tbl` or `a:tr` element; other items,
+    including |None|, are ignored.
+    """
+    for elm in elms:
+        if isinstance(elm, CT_TableRow):
+            elm = elm.getparent()
+        if isinstance(elm, CT_Table):
+            elm.discard_tc_grid()
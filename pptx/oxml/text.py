@@ -13,13 +13,14 @@ from pptx.enum.text import (
     PP_PARAGRAPH_ALIGNMENT
 )
 from pptx.exc import InvalidXmlError
-from pptx.oxml import parse_xml
+from pptx.oxml import clone_prototype, escape_xml, parse_xml
 from pptx.oxml.dml.fill import CT_GradientFillProperties
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.simpletypes import (
-    ST_Coordinate32, ST_TextFontScalePercentOrPercentString, ST_TextFontSize,
-    ST_TextIndentLevelType, ST_TextSpacingPercentOrPercentString,
-    ST_TextSpacingPoint, ST_TextTypeface, ST_TextWrappingType, XsdBoolean
+    ST_Coordinate32, ST_HexColorRGB, ST_TextFontScalePercentOrPercentString,
+    ST_TextFontSize, ST_TextIndentLevelType,
+    ST_TextSpacingPercentOrPercentString, ST_TextSpacingPoint, ST_TextTypeface,
+    ST_TextWrappingType, XsdBoolean
 )
 from pptx.oxml.xmlchemy import (
     BaseOxmlElement, Choice, OneAndOnlyOne, OneOrMore, OptionalAttribute,
@@ -91,9 +92,7 @@ class CT_TextBody(BaseOxmlElement):
         """
         Return a new ``<p:txBody>`` element tree
         """
-        xml = cls._txBody_tmpl()
-        txBody = parse_xml(xml)
-        return txBody
+        return clone_prototype('p:txBody', cls._txBody_tmpl)
 
     @classmethod
     def new_a_txBody(cls):
@@ -101,9 +100,7 @@ class CT_TextBody(BaseOxmlElement):
         Return a new ``<a:txBody>`` element tree, suitable for use in a table
         cell and possibly other situations.
         """
-        xml = cls._a_txBody_tmpl()
-        txBody = parse_xml(xml)
-        return txBody
+        return clone_prototype('a:txBody', cls._a_txBody_tmpl)
 
     @classmethod
     def new_p_txBody(cls):
@@ -111,8 +108,9 @@ class CT_TextBody(BaseOxmlElement):
         Return a new ``<p:txBody>`` element tree, suitable for use in an
         ``<p:sp>`` element.
         """
-        xml = cls._p_txBody_tmpl()
-        return parse_xml(xml)
+        return clone_prototype(
+            ('p:txBody', 'no lstStyle'), cls._p_txBody_tmpl
+        )
 
     @classmethod
     def new_txPr(cls):
@@ -120,19 +118,25 @@ class CT_TextBody(BaseOxmlElement):
         Return a ``<c:txPr>`` element tree suitable for use in a chart object
         like data labels or tick labels.
         """
-        xml = (
-            '<c:txPr %s>\n'
-            '  <a:bodyPr/>\n'
-            '  <a:lstStyle/>\n'
-            '  <a:p>\n'
-            '    <a:pPr>\n'
-            '      <a:defRPr/>\n'
-            '    </a:pPr>\n'
-            '  </a:p>\n'
-            '</c:txPr>\n'
-        ) % nsdecls('c', 'a')
-        txPr = parse_xml(xml)
-        return txPr
+        return clone_prototype('c:txPr', cls._txPr_tmpl)
+
+    def replace_p_xml(self, p_xml):
+        """Replace all `a:p` children with the paragraphs in *p_xml*.
+
+        *p_xml* is XML text for zero or more `a:p` elements, as produced by
+        :meth:`CT_TextParagraph.rich_text_xml`, and is parsed in a single
+        call. A single empty paragraph remains when *p_xml* contains none.
+        """
+        # ---only declare r: when a hyperlink uses it, so no unused
+        # ---declaration is carried into the txBody
+        prefixes = ('a', 'r') if ' r:id="' in p_xml else ('a',)
+        container = parse_xml(
+            '<a:txBody %s>%s</a:txBody>' % (nsdecls(*prefixes), p_xml)
+        )
+        self.clear_content()
+        for p in list(container):
+            self.append(p)
+        self.unclear_content()
 
     def unclear_content(self):
         """Ensure p:txBody has at least one a:p child.
@@ -172,6 +176,20 @@ class CT_TextBody(BaseOxmlElement):
             '</p:txBody>\n' % (nsdecls('a', 'p'))
         )
 
+    @classmethod
+    def _txPr_tmpl(cls):
+        return (
+            '<c:txPr %s>\n'
+            '  <a:bodyPr/>\n'
+            '  <a:lstStyle/>\n'
+            '  <a:p>\n'
+            '    <a:pPr>\n'
+            '      <a:defRPr/>\n'
+            '    </a:pPr>\n'
+            '  </a:p>\n'
+            '</c:txPr>\n' % nsdecls('c', 'a')
+        )
+
 
 class CT_TextBodyProperties(BaseOxmlElement):
     """
@@ -253,6 +271,39 @@ class CT_TextCharacterProperties(BaseOxmlElement):
     def _new_gradFill(self):
         return CT_GradientFillProperties.new_gradFill()
 
+    @staticmethod
+    def rPr_xml(sz=None, b=None, i=None, rgb=None, rId=None):
+        """Return XML text for an `a:rPr` element having these properties.
+
+        *sz* is the font size in centipoints, *rgb* a hex color string such
+        as 'FF0000' and *rId* the relationship id of a hyperlink. A property
+        is omitted when its value is |None|, so the empty string is returned
+        when all of them are. Values are validated like the equivalent
+        attribute assignments.
+        """
+        attrs = ''.join(
+            ' %s="%s"' % (name, ST.to_xml(value))
+            for name, ST, value in (
+                ('sz', ST_TextFontSize, sz), ('b', XsdBoolean, b),
+                ('i', XsdBoolean, i),
+            )
+            if value is not None
+        )
+        children = ''
+        if rgb is not None:
+            ST_HexColorRGB.validate(rgb)
+            children += (
+                '<a:solidFill><a:srgbClr val="%s"/></a:solidFill>'
+                % ST_HexColorRGB.convert_to_xml(rgb)
+            )
+        if rId is not None:
+            children += '<a:hlinkClick r:id="%s"/>' % escape_xml(rId)
+        if not (attrs or children):
+            return ''
+        if not children:
+            return '<a:rPr%s/>' % attrs
+        return '<a:rPr%s>%s</a:rPr>' % (attrs, children)
+
     def add_hlinkClick(self, rId):
         """
         Add an <a:hlinkClick> child element with r:id attribute set to *rId*.
@@ -352,6 +403,42 @@ class CT_TextParagraph(BaseOxmlElement):
             if r_str:
                 self.add_r(r_str)
 
+    @staticmethod
+    def append_text_xml(text):
+        """Return XML text for the `a:r` and `a:br` elements for *text*.
+
+        The elements are the same ones :meth:`append_text` would add for
+        *text*, for use when generating a paragraph as XML text.
+        """
+        return '<a:br/>'.join(
+            '<a:r><a:t>%s</a:t></a:r>' % escape_xml(r_str) if r_str else ''
+            for r_str in text.split('\n')
+        )
+
+    @staticmethod
+    def rich_text_xml(lvl, runs):
+        """Return XML text for an `a:p` element at indent level *lvl*.
+
+        *runs* is a sequence of (text, rPr_xml) pairs, where *rPr_xml* is the
+        XML text of the run properties for *text* as produced by
+        :meth:`CT_TextCharacterProperties.rPr_xml`. Like :meth:`append_text`,
+        each `\n` character in *text* becomes an `a:br` element, taking the
+        same run properties, and runs that would be empty are not added.
+        """
+        pPr_xml = (
+            '<a:pPr lvl="%s"/>' % ST_TextIndentLevelType.to_xml(lvl)
+            if lvl else ''
+        )
+        content = []
+        for text, rPr_xml in runs:
+            br_xml = '<a:br>%s</a:br>' % rPr_xml if rPr_xml else '<a:br/>'
+            content.append(br_xml.join(
+                '<a:r>%s<a:t>%s</a:t></a:r>' % (rPr_xml, escape_xml(r_str))
+                if r_str else ''
+                for r_str in text.split('\n')
+            ))
+        return '<a:p>%s%s</a:p>' % (pPr_xml, ''.join(content))
+
     @property
     def content_children(self):
         """
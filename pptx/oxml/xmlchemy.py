@@ -113,9 +113,44 @@ class MetaOxmlElement(type):
             OneAndOnlyOne, OneOrMore, OptionalAttribute, RequiredAttribute,
             ZeroOrMore, ZeroOrOne, ZeroOrOneChoice
         )
-        for key, value in clsdict.items():
-            if isinstance(value, dispatchable):
-                value.populate_class_members(cls, key)
+        declarations = tuple(
+            (key, value) for key, value in clsdict.items()
+            if isinstance(value, dispatchable)
+        )
+        cls._xmlchemy_declarations = declarations
+        if not declarations:
+            return
+        if _install_pregenerated_members(cls):
+            return
+        for key, value in declarations:
+            value.populate_class_members(cls, key)
+
+
+def _install_pregenerated_members(element_cls):
+    """
+    Install the pre-generated members for *element_cls* from
+    |pptx.oxml._accessors| and return |True|. Return |False| without
+    changing *element_cls* when there is no pre-generated entry for it, such
+    that the metaclass must populate the class from its declarations
+    instead. Entries are trusted as-is; whether they still match the
+    declarations is checked by ``make accessors-check`` and the test suite,
+    not on every import.
+    """
+    try:
+        from . import _accessors
+    except ImportError:
+        return False
+    key = '%s.%s' % (element_cls.__module__, element_cls.__name__)
+    operations = _accessors.members.get(key)
+    if operations is None:
+        return False
+    for operation in operations:
+        op, name = operation[:2]
+        if op == 'del':
+            delattr(element_cls, name)
+        elif op == 'set' or not hasattr(element_cls, name):
+            setattr(element_cls, name, operation[2])
+    return True
 
 
 class BaseAttribute(object):
@@ -320,8 +355,10 @@ class _BaseChildElement(object):
         Add an ``_insert_x()`` method to the element class for this child
         element.
         """
+        successors = self._successor_clark_names
+
         def _insert_child(obj, child):
-            obj.insert_element_before(child, *self._successors)
+            obj._insert_before_first_of(child, successors)
             return child
 
         _insert_child.__doc__ = (
@@ -343,6 +380,15 @@ class _BaseChildElement(object):
     def _add_method_name(self):
         return '_add_%s' % self._prop_name
 
+    @lazyproperty
+    def _clark_name(self):
+        """
+        Clark-notation tag name of this child element, e.g.
+        '{http://schemas.../main}prstGeom', computed once when the class is
+        created rather than on each access.
+        """
+        return qn(self._nsptagname)
+
     def _add_to_class(self, name, method):
         """
         Add *method* to the target class as *name*, unless *name* is already
@@ -369,8 +415,10 @@ class _BaseChildElement(object):
         descriptor. This default getter returns the child element with
         matching tag name or |None| if not present.
         """
+        clark_name = self._clark_name
+
         def get_child_element(obj):
-            return obj.find(qn(self._nsptagname))
+            return obj.find(clark_name)
         get_child_element.__doc__ = (
             '``<%s>`` child element or |None| if not present.'
             % self._nsptagname
@@ -387,8 +435,10 @@ class _BaseChildElement(object):
         Return a function object suitable for the "get" side of a list
         property descriptor.
         """
+        clark_name = self._clark_name
+
         def get_child_element_list(obj):
-            return obj.findall(qn(self._nsptagname))
+            return obj.findall(clark_name)
         get_child_element_list.__doc__ = (
             'A list containing each of the ``<%s>`` child elements, in the o'
             'rder they appear.' % self._nsptagname
@@ -403,6 +453,14 @@ class _BaseChildElement(object):
     def _new_method_name(self):
         return '_new_%s' % self._prop_name
 
+    @lazyproperty
+    def _successor_clark_names(self):
+        """
+        Tuple of the Clark-notation tag names of the elements that may
+        follow this child element in its parent.
+        """
+        return tuple(qn(tagname) for tagname in self._successors or ())
+
 
 class Choice(_BaseChildElement):
     """
@@ -495,8 +553,10 @@ class OneAndOnlyOne(_BaseChildElement):
         Return a function object suitable for the "get" side of the property
         descriptor.
         """
+        clark_name = self._clark_name
+
         def get_child_element(obj):
-            child = obj.find(qn(self._nsptagname))
+            child = obj.find(clark_name)
             if child is None:
                 raise InvalidXmlError(
                     "required ``<%s>`` child element not present" %
@@ -611,8 +671,11 @@ class ZeroOrOne(_BaseChildElement):
         Add a ``_remove_x()`` method to the element class for this child
         element.
         """
+        clark_name = self._clark_name
+
         def _remove_child(obj):
-            obj.remove_all(self._nsptagname)
+            for child in obj.findall(clark_name):
+                obj.remove(child)
         _remove_child.__doc__ = (
             'Remove all ``<%s>`` child elements.'
         ) % self._nsptagname
@@ -661,9 +724,12 @@ class ZeroOrOneChoice(_BaseChildElement):
         Add a ``_remove_eg_x()`` method to the element class for this choice
         group.
         """
+        clark_names = self._member_clark_names
+
         def _remove_choice_group(obj):
-            for tagname in self._member_nsptagnames:
-                obj.remove_all(tagname)
+            for clark_name in clark_names:
+                for child in obj.findall(clark_name):
+                    obj.remove(child)
 
         _remove_choice_group.__doc__ = (
             'Remove the current choice group child element if present.'
@@ -678,14 +744,28 @@ class ZeroOrOneChoice(_BaseChildElement):
         Return a function object suitable for the "get" side of the property
         descriptor.
         """
+        clark_names = self._member_clark_names
+
         def get_group_member_element(obj):
-            return obj.first_child_found_in(*self._member_nsptagnames)
+            for clark_name in clark_names:
+                child = obj.find(clark_name)
+                if child is not None:
+                    return child
+            return None
         get_group_member_element.__doc__ = (
             'Return the child element belonging to this element group, or '
             '|None| if no member child is present.'
         )
         return get_group_member_element
 
+    @lazyproperty
+    def _member_clark_names(self):
+        """
+        Tuple of the Clark-notation tag names of the member elements of this
+        choice group, computed once when the class is created.
+        """
+        return tuple(qn(tagname) for tagname in self._member_nsptagnames)
+
     @lazyproperty
     def _member_nsptagnames(self):
         """
@@ -699,6 +779,71 @@ class ZeroOrOneChoice(_BaseChildElement):
         return '_remove_%s' % self._prop_name
 
 
+class XPathCache(object):
+    """
+    Cache of compiled ``etree.XPath`` objects keyed by expression string,
+    using the standard Open XML namespace mapping. Keeps hit and miss counts
+    so its effectiveness can be observed. The cache is cleared once it holds
+    *maxsize* expressions, which bounds its size when a caller formats
+    values into expressions rather than passing them as XPath variables.
+    """
+    def __init__(self, maxsize=512):
+        super(XPathCache, self).__init__()
+        self._maxsize = maxsize
+        self._compiled = {}
+        self._hits = 0
+        self._misses = 0
+
+    def clear(self):
+        """
+        Discard all compiled expressions and reset the hit/miss counts.
+        """
+        self._compiled.clear()
+        self._hits = self._misses = 0
+
+    def compiled(self, xpath_str):
+        """
+        Return the compiled ``etree.XPath`` object for *xpath_str*,
+        compiling and caching it on first use.
+        """
+        xpath = self._compiled.get(xpath_str)
+        if xpath is not None:
+            self._hits += 1
+            return xpath
+        self._misses += 1
+        if len(self._compiled) >= self._maxsize:
+            self._compiled.clear()
+        xpath = self._compiled[xpath_str] = etree.XPath(
+            xpath_str, namespaces=_nsmap
+        )
+        return xpath
+
+    @property
+    def currsize(self):
+        """
+        The number of compiled expressions currently cached.
+        """
+        return len(self._compiled)
+
+    @property
+    def hits(self):
+        """
+        The number of lookups satisfied by an already-compiled expression.
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        The number of lookups that required an expression to be compiled.
+        """
+        return self._misses
+
+
+#: The |XPathCache| shared by all custom element classes.
+xpath_cache = XPathCache()
+
+
 class _OxmlElementBase(etree.ElementBase):
     """
     Provides common behavior for oxml element classes
@@ -729,12 +874,13 @@ class _OxmlElementBase(etree.ElementBase):
         return None
 
     def insert_element_before(self, elm, *tagnames):
-        successor = self.first_child_found_in(*tagnames)
-        if successor is not None:
-            successor.addprevious(elm)
-        else:
-            self.append(elm)
-        return elm
+        """
+        Insert *elm* as a child of this element, before the first existing
+        child having a tag in *tagnames*, or as the last child if there is
+        none.
+        """
+        clark_names = tuple(qn(tagname) for tagname in tagnames)
+        return self._insert_before_first_of(elm, clark_names)
 
     def remove_all(self, tagname):
         """
@@ -762,14 +908,32 @@ class _OxmlElementBase(etree.ElementBase):
         """
         return serialize_for_reading(self)
 
-    def xpath(self, xpath_str):
+    def xpath(self, xpath_str, **variables):
         """
         Override of ``lxml`` _Element.xpath() method to provide standard Open
-        XML namespace mapping in centralized location.
+        XML namespace mapping in centralized location. The expression is
+        compiled once and reused from |xpath_cache| on later calls. Values
+        that vary between calls, such as an index, should be passed as
+        keyword *variables* and referenced as ``$name`` in *xpath_str* so
+        the compiled expression can be reused.
         """
-        return super(BaseOxmlElement, self).xpath(
-            xpath_str, namespaces=_nsmap
+        return xpath_cache.compiled(xpath_str)(self, **variables)
+
+    def _insert_before_first_of(self, elm, clark_names):
+        """
+        Insert *elm* before the first child having a Clark-notation tag name
+        in *clark_names*, or append it when there is no such child. The
+        successor is located in a single scan of the children.
+        """
+        successor = (
+            next(self.iterchildren(*clark_names), None) if clark_names
+            else None
         )
+        if successor is not None:
+            successor.addprevious(elm)
+        else:
+            self.append(elm)
+        return elm
 
 
 BaseOxmlElement = MetaOxmlElement(
@@ -6,7 +6,6 @@ Chart part objects, including Chart and Charts
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-from ..chart.chart import Chart
 from .embeddedpackage import EmbeddedXlsxPart
 from ..opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from ..opc.package import XmlPart
@@ -39,6 +38,9 @@ class ChartPart(XmlPart):
         """
         The |Chart| object representing the chart in this part.
         """
+        # ---the chart proxy subsystem is loaded on first chart access---
+        from ..chart.chart import Chart
+
         return Chart(self._element, self)
 
     @lazyproperty
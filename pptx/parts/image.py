@@ -9,11 +9,6 @@ from __future__ import (
 import hashlib
 import os
 
-try:
-    from PIL import Image as PIL_Image
-except ImportError:
-    import Image as PIL_Image
-
 from ..compat import BytesIO, is_string
 from ..opc.package import Part
 from ..opc.spec import image_content_types
@@ -280,7 +275,15 @@ class Image(object):
         """
         A tuple containing useful image properties extracted from this image
         using Pillow (Python Imaging Library, or 'PIL').
+
+        Pillow is imported here rather than at module load so that
+        ``import pptx`` does not pay its startup cost.
         """
+        try:
+            from PIL import Image as PIL_Image
+        except ImportError:
+            import Image as PIL_Image
+
         stream = BytesIO(self._blob)
         pil_image = PIL_Image.open(stream)
         format = pil_image.format
@@ -13,6 +13,7 @@ from ..opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from ..opc.package import XmlPart
 from ..opc.packuri import PackURI
 from ..oxml.slide import CT_NotesMaster, CT_NotesSlide, CT_Slide
+from ..oxml.shapes.shared import BaseShapeElement
 from ..oxml.theme import CT_OfficeStyleSheet
 from ..slide import NotesMaster, NotesSlide, Slide, SlideLayout, SlideMaster
 from ..util import lazyproperty
@@ -50,6 +51,59 @@ class BaseSlidePart(XmlPart):
         """
         return self._element.cSld.name
 
+    def next_shape_id(self):
+        """Return a unique int id suitable for use with a new shape.
+
+        Ids are allocated from a single sequence per part, shared by every
+        shape collection (including those of group shapes) that adds shapes
+        to this slide, so no two of them can hand out the same id. The XML
+        is scanned for the ids already in use the first time an id is
+        requested, and again only when the shape tree has changed other
+        than by adding shapes through this API, as described for
+        |_ShapeIdSequence|.
+        """
+        self._sync_shape_indexes()
+        return self._shape_ids.next_id()
+
+    def notify_shape_renamed(self, name):
+        """Record *name*, just assigned to a shape in this part, as used."""
+        self._shape_names.add(name)
+
+    def unique_shape_name(self, basename, numpart):
+        """Return a shape name not yet used in this part, like 'Title 3'.
+
+        The name is *basename* suffixed with the first integer not less than
+        *numpart* that produces a name not already in use. The returned name
+        is recorded as used. Names are looked up in an index built from the
+        part XML, which is rebuilt when the shape tree has changed other than
+        through this API. Names assigned with ``shape.name`` are added to it
+        as they are set.
+        """
+        self._sync_shape_indexes()
+        return self._shape_names.unique_name(basename, numpart)
+
+    @lazyproperty
+    def _shape_ids(self):
+        """|_ShapeIdSequence| allocating the shape ids of this part."""
+        return _ShapeIdSequence(self._element.cSld.spTree)
+
+    @lazyproperty
+    def _shape_names(self):
+        """|_ShapeNameIndex| of the shape names used in this part."""
+        return _ShapeNameIndex(self._element.xpath('//p:cNvPr/@name'))
+
+    def _sync_shape_indexes(self):
+        """
+        Discard the shape name index when the shape tree has changed other
+        than by adding shapes through this API, the shape id sequence having
+        reseeded itself.
+        """
+        if self._shape_ids.sync():
+            try:
+                delattr(self, '__shape_names')
+            except AttributeError:
+                pass
+
 
 class NotesMasterPart(BaseSlidePart):
     """
@@ -290,3 +344,97 @@ class SlideMasterPart(BaseSlidePart):
         The |SlideMaster| object representing this part.
         """
         return SlideMaster(self._element, self)
+
+
+class _ShapeIdSequence(object):
+    """Allocates the shape ids of a slide part, in order.
+
+    Seeded from the maximum @id in the part XML. Before an id is handed out,
+    the number of children of the shape tree is compared with the number
+    last seen. Growth by no more than the ids handed out since, with the
+    last shape child having the last id handed out, is what adding shapes
+    through the API produces and needs no rescan. Any other change, such as
+    a shape inserted or removed using lxml, reseeds the sequence from the
+    XML so no id in use is handed out. A shape inserted using lxml into
+    a group shape, or a change that keeps the number of shape tree children,
+    isn't noticed.
+    """
+
+    def __init__(self, spTree):
+        self._spTree = spTree
+        self._next_id = spTree.max_shape_id + 1
+        self._seen_count = len(spTree)
+        self._unseen_ids = 0
+        self._last_id = None
+
+    def next_id(self):
+        """Return the next unused shape id, an int."""
+        id_ = self._next_id
+        self._next_id += 1
+        self._unseen_ids += 1
+        self._last_id = id_
+        return id_
+
+    def sync(self):
+        """
+        Reseed this sequence from the XML and return |True| when the shape
+        tree has changed other than by adding shapes having ids from this
+        sequence. Return |False| otherwise.
+        """
+        spTree = self._spTree
+        count = len(spTree)
+        added = count - self._seen_count
+        if not added:
+            return False
+        self._seen_count = count
+        unseen_ids, self._unseen_ids = self._unseen_ids, 0
+        if 0 < added <= unseen_ids and self._last_shape_id == self._last_id:
+            return False
+        self._next_id = max(self._next_id, spTree.max_shape_id + 1)
+        return True
+
+    @property
+    def _last_shape_id(self):
+        """Id of the last shape child of the shape tree, |None| if none."""
+        for elm in self._spTree.iterchildren(reversed=True):
+            if isinstance(elm, BaseShapeElement):
+                return elm.shape_id
+        return None
+
+
+class _ShapeNameIndex(object):
+    """Index of the shape names used in a slide part.
+
+    Allows a unique name to be found without rescanning the part XML. In
+    addition to the set of names in use, the run of consecutive numbers most
+    recently found to be taken is remembered for each basename, so stamping
+    out many same-named shapes doesn't re-test the same candidates on each
+    call.
+    """
+
+    def __init__(self, names):
+        self._names = set(names)
+        self._taken_runs = {}
+
+    def add(self, name):
+        """Record *name* as used."""
+        self._names.add(name)
+
+    def unique_name(self, basename, numpart):
+        """Return name '<basename> <n>' for the first unused n >= *numpart*.
+
+        The returned name is added to the names in use.
+        """
+        first, last = self._taken_runs.get(basename, (numpart, numpart - 1))
+        if not first <= numpart <= last + 1:
+            first, last = numpart, numpart - 1
+
+        n = max(numpart, last + 1)
+        name = '%s %d' % (basename, n)
+        while name in self._names:
+            n += 1
+            name = '%s %d' % (basename, n)
+
+        self._names.add(name)
+        self._taken_runs[basename] = (first, n)
+        return name
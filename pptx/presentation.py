@@ -10,6 +10,7 @@ from __future__ import (
 
 from .shared import PartElementProxy
 from .slide import SlideMasters, Slides
+from .text.replace import TextReplacer
 from .util import lazyproperty
 
 
@@ -38,6 +39,28 @@ class Presentation(PartElementProxy):
         """
         return self.part.notes_master
 
+    def replace_text(self, find, replace=None):
+        """
+        Replace text in the runs of every slide in this presentation and
+        return a list containing the number of replacements made on each
+        slide, in slide order.
+
+        *find* is either a mapping of each string to find to its
+        replacement, a compiled regular expression, or a single string to
+        find. When *find* is a regular expression, *replace* is a string
+        expanded as by :func:`re.sub` or a function taking the match object
+        and returning the replacement string. When *find* is a string,
+        *replace* is its literal replacement. All strings in a mapping are
+        found in a single pass over each slide.
+
+        Text is matched across adjacent runs in the same paragraph, so
+        a token split into several runs, as PowerPoint often does, is still
+        found. The replacement takes the formatting of the run in which the
+        match starts. Text in fields and line breaks is not matched.
+        """
+        replacer = TextReplacer.new(find, replace)
+        return [replacer.replace(slide._element) for slide in self.slides]
+
     def save(self, file):
         """
         Save this presentation to *file*, where *file* can be either a path
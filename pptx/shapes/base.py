@@ -133,6 +133,7 @@ class BaseShape(object):
     @name.setter
     def name(self, value):
         self._element._nvXxPr.cNvPr.name = value
+        self.part.notify_shape_renamed(value)
 
     @property
     def part(self):
@@ -6,6 +6,7 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from array import array
 from collections import Sequence
 
 from pptx.util import lazyproperty
@@ -71,6 +72,32 @@ class FreeformBuilder(Sequence):
             self._add_close()
         return self
 
+    def add_polyline(self, vertices, close=True):
+        """Add a straight line segment to each point in *vertices*, compactly.
+
+        This has the same effect as :meth:`add_line_segments` but the points
+        are stored in a single drawing operation backed by arrays rather than
+        one operation object per point, and its `a:lnTo` elements are
+        produced in one pass, which is much faster for paths having
+        thousands of points, such as map outlines or sparklines. The points
+        form a single item in this builder's sequence of operations.
+
+        *vertices* is an iterable of (x, y) pairs, or a NumPy array of shape
+        (n, 2), in which case the values are rounded by NumPy. Each x and
+        y value is rounded to the nearest integer before use. The optional
+        *close* parameter determines whether the resulting contour is
+        *closed* or left *open*.
+
+        Returns this |FreeformBuilder| object so it can be used in chained
+        calls.
+        """
+        polyline = _Polyline.new(self, vertices)
+        if polyline.xs:
+            self._drawing_operations.append(polyline)
+        if close:
+            self._add_close()
+        return self
+
     def convert_to_shape(self, origin_x=0, origin_y=0):
         """Return new freeform shape positioned relative to specified offset.
 
@@ -104,11 +131,7 @@ class FreeformBuilder(Sequence):
         shape, in local coordinates. Note that the bounding box of the shape
         need not start at the local origin.
         """
-        min_x = self._start_x
-        for drawing_operation in self:
-            if hasattr(drawing_operation, 'x'):
-                min_x = min(min_x, drawing_operation.x)
-        return min_x
+        return self._extents('x')[0]
 
     @property
     def shape_offset_y(self):
@@ -118,11 +141,7 @@ class FreeformBuilder(Sequence):
         shape, in local coordinates. Note that the bounding box of the shape
         need not start at the local origin.
         """
-        min_y = self._start_y
-        for drawing_operation in self:
-            if hasattr(drawing_operation, 'y'):
-                min_y = min(min_y, drawing_operation.y)
-        return min_y
+        return self._extents('y')[0]
 
     def _add_close(self):
         """Add a close |_Close| operation to the drawing sequence."""
@@ -135,7 +154,10 @@ class FreeformBuilder(Sequence):
         represent the location of the local coordinates origin on the slide.
         """
         spTree = self._shapes._spTree
+        shape_id = self._shapes._next_shape_id
+        name = 'Freeform %d' % (shape_id-1)
         return spTree.add_freeform_sp(
+            shape_id, name,
             origin_x + self._left,
             origin_y + self._top,
             self._width,
@@ -146,6 +168,11 @@ class FreeformBuilder(Sequence):
         """Add a |_LineSegment| operation to the drawing sequence."""
         self._drawing_operations.append(_LineSegment.new(self, x, y))
 
+    @lazyproperty
+    def _cached_extents(self):
+        """Return dict of (op_count, min, max) tuples, keyed by axis."""
+        return {}
+
     @lazyproperty
     def _drawing_operations(self):
         """Return the sequence of drawing operation objects for freeform."""
@@ -154,23 +181,36 @@ class FreeformBuilder(Sequence):
     @property
     def _dx(self):
         """Return integer width of this shape's path in local units."""
-        min_x = max_x = self._start_x
-        for drawing_operation in self:
-            if hasattr(drawing_operation, 'x'):
-                min_x = min(min_x, drawing_operation.x)
-                max_x = max(max_x, drawing_operation.x)
+        min_x, max_x = self._extents('x')
         return max_x - min_x
 
     @property
     def _dy(self):
         """Return integer height of this shape's path in local units."""
-        min_y = max_y = self._start_y
-        for drawing_operation in self:
-            if hasattr(drawing_operation, 'y'):
-                min_y = min(min_y, drawing_operation.y)
-                max_y = max(max_y, drawing_operation.y)
+        min_y, max_y = self._extents('y')
         return max_y - min_y
 
+    def _extents(self, axis):
+        """Return (min, max) pair of pen locations along *axis*, 'x' or 'y'.
+
+        Drawing operations are only ever appended, so the pair is cached
+        along with the operation count and only operations added since are
+        examined. This keeps the shape offset, which each operation needs
+        when it is applied, from costing a pass over all operations.
+        """
+        start = self._start_x if axis == 'x' else self._start_y
+        count, low, high = self._cached_extents.get(axis, (0, start, start))
+        drawing_operations = self._drawing_operations
+        for drawing_operation in drawing_operations[count:]:
+            if isinstance(drawing_operation, _Polyline):
+                op_low, op_high = drawing_operation.extents(axis)
+                low, high = min(low, op_low), max(high, op_high)
+            elif hasattr(drawing_operation, axis):
+                value = getattr(drawing_operation, axis)
+                low, high = min(low, value), max(high, value)
+        self._cached_extents[axis] = len(drawing_operations), low, high
+        return low, high
+
     @property
     def _height(self):
         """Return vertical size of this shape's path in slide coordinates.
@@ -308,6 +348,51 @@ class _LineSegment(_BaseDrawingOperation):
         )
 
 
+class _Polyline(object):
+    """Specifies straight line segments ending at each of many points.
+
+    The points are stored in a pair of arrays, *xs* and *ys*, rather than as
+    an operation object per point.
+    """
+
+    def __init__(self, freeform_builder, xs, ys):
+        super(_Polyline, self).__init__()
+        self._freeform_builder = freeform_builder
+        self.xs = xs
+        self.ys = ys
+
+    @classmethod
+    def new(cls, freeform_builder, vertices):
+        """Return a new _Polyline object through the points in *vertices*.
+
+        *vertices* is an iterable of (x, y) pairs or a NumPy array of shape
+        (n, 2). Each value is rounded to the nearest integer before use.
+        """
+        if getattr(vertices, 'ndim', None) == 2:
+            rounded = vertices.round()
+            xs = array('d', rounded[:, 0].tolist())
+            ys = array('d', rounded[:, 1].tolist())
+        else:
+            xs, ys = array('d'), array('d')
+            for x, y in vertices:
+                xs.append(int(round(x)))
+                ys.append(int(round(y)))
+        return cls(freeform_builder, xs, ys)
+
+    def apply_operation_to(self, path):
+        """Add an `a:lnTo` element to *path* for each point, in one pass."""
+        offset_x = self._freeform_builder.shape_offset_x
+        offset_y = self._freeform_builder.shape_offset_y
+        path.add_lnTos(
+            [x - offset_x for x in self.xs], [y - offset_y for y in self.ys]
+        )
+
+    def extents(self, axis):
+        """Return (min, max) integer pair of locations along *axis*."""
+        values = self.xs if axis == 'x' else self.ys
+        return int(min(values)), int(max(values))
+
+
 class _MoveTo(_BaseDrawingOperation):
     """Specifies a new pen position."""
 
@@ -6,14 +6,23 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
-from pptx.compat import BytesIO
-from pptx.enum.shapes import PP_PLACEHOLDER
-from pptx.media import SPEAKER_IMAGE_BYTES, Video
+from collections import Sequence
+from numbers import Number
+
+from pptx.compat import BytesIO, is_string, to_unicode, Unicode
+from pptx.enum.shapes import MSO_CONNECTOR_TYPE, PP_PLACEHOLDER
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.oxml.ns import qn
+from pptx.oxml.shapes.autoshape import CT_Shape
+from pptx.oxml.shapes.connector import CT_Connector
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
+from pptx.oxml.shapes.groupshape import deferred_extents
 from pptx.oxml.shapes.picture import CT_Picture
+from pptx.oxml.shapes.shared import (
+    BaseShapeElement, CT_ShapeProperties, shape_geometry_generation
+)
 from pptx.oxml.simpletypes import ST_Direction
+from pptx.oxml.text import CT_TextParagraph
 from pptx.shapes.autoshape import AutoShapeType, Shape
 from pptx.shapes.base import BaseShape
 from pptx.shapes.connector import Connector
@@ -26,7 +35,7 @@ from pptx.shapes.placeholder import (
     NotesSlidePlaceholder, PicturePlaceholder, PlaceholderGraphicFrame,
     PlaceholderPicture, SlidePlaceholder, TablePlaceholder
 )
-from pptx.shared import ParentedElementProxy
+from pptx.shared import ParentedElementProxy, cached_proxy
 from pptx.util import lazyproperty
 
 # +-- _BaseShapes
@@ -63,15 +72,14 @@ class _BaseShapes(ParentedElementProxy):
     def __init__(self, spTree, parent):
         super(_BaseShapes, self).__init__(spTree, parent)
         self._spTree = spTree
-        self._cached_max_shape_id = None
+        self._cached_spatial_index = None, None
 
     def __getitem__(self, idx):
         """
         Return shape at *idx* in sequence, e.g. ``shapes[2]``.
         """
-        shape_elms = list(self._iter_member_elms())
         try:
-            shape_elm = shape_elms[idx]
+            shape_elm = self._member_elms[idx]
         except IndexError:
             raise IndexError('shape index out of range')
         return self._shape_factory(shape_elm)
@@ -89,8 +97,7 @@ class _BaseShapes(ParentedElementProxy):
         1 to the total, without regard to the number of shapes contained in
         the group.
         """
-        shape_elms = list(self._iter_member_elms())
-        return len(shape_elms)
+        return len(self._member_elms)
 
     def clone_placeholder(self, placeholder):
         """
@@ -104,6 +111,40 @@ class _BaseShapes(ParentedElementProxy):
         name = self._next_ph_name(ph_type, id_, orient)
         self._spTree.add_placeholder(id_, name, ph_type, orient, sz, idx)
 
+    def overflowing(self, rect):
+        """Return a list of the shapes in this collection extending past *rect*.
+
+        *rect* is a ``(left, top, width, height)`` tuple in EMU, in slide
+        coordinates. A shape is included when any part of its bounding box
+        lies outside *rect*. Shapes are listed in document (z) order. See
+        :meth:`within` for how shape bounds are determined.
+        """
+        index = self._spatial_index
+        inside = set(index.contained_by(_rect_box(rect)))
+        return [
+            self._shape_factory(shape_elm) for shape_elm in index.items
+            if shape_elm not in inside
+        ]
+
+    def overlapping(self, shape):
+        """Return a list of the shapes in this collection overlapping *shape*.
+
+        A shape is included when its bounding box and that of *shape* share
+        some area, or when a line-like shape of zero width or height crosses
+        the other. Shapes that only touch along an edge do not overlap.
+        *shape* itself is never included, and need not belong to this
+        collection. Shapes are listed in document (z) order. See
+        :meth:`within` for how shape bounds are determined.
+        """
+        box = self._shape_box(shape.element, shape)
+        if box is None:
+            return []
+        return [
+            self._shape_factory(shape_elm)
+            for shape_elm in self._spatial_index.intersecting(box)
+            if shape_elm is not shape.element
+        ]
+
     def ph_basename(self, ph_type):
         """
         Return the base name for a placeholder of *ph_type* in this shape
@@ -131,34 +172,46 @@ class _BaseShapes(ParentedElementProxy):
 
     @property
     def turbo_add_enabled(self):
-        """True if "turbo-add" mode is enabled. Read/Write.
+        """Always True. Read/Write, assignment is ignored.
 
-        EXPERIMENTAL: This feature can radically improve performance when
-        adding large numbers (hundreds of shapes) to a slide. It works by
-        caching the last shape ID used and incrementing that value to assign
-        the next shape id. This avoids repeatedly searching all shape ids in
-        the slide each time a new ID is required.
-
-        Performance is not noticeably improved for a slide with a relatively
-        small number of shapes, but because the search time rises with the
-        square of the shape count, this option can be useful for optimizing
-        generation of a slide composed of many shapes.
-
-        Shape-id collisions can occur (causing a repair error on load) if
-        more than one |Slide| object is used to interact with the same slide
-        in the presentation. Note that the |Slides| collection creates a new
-        |Slide| object each time a slide is accessed
-        (e.g. `slide = prs.slides[0]`, so you must be careful to limit use to
-        a single |Slide| object.
+        DEPRECATED: Shape ids are now allocated by the slide part from
+        a single cached sequence shared by every shape collection on the
+        slide, so adding a new shape never searches the existing shape ids.
+        The "turbo-add" performance this option used to enable is always
+        on, without the risk of shape-id collisions. This property is
+        retained only for backward compatibility.
         """
-        return self._cached_max_shape_id is not None
+        return True
 
     @turbo_add_enabled.setter
     def turbo_add_enabled(self, value):
-        enable = bool(value)
-        self._cached_max_shape_id = (
-            self._spTree.max_shape_id if enable else None
-        )
+        pass
+
+    def within(self, rect):
+        """Return a list of the shapes in this collection lying inside *rect*.
+
+        *rect* is a ``(left, top, width, height)`` tuple in EMU, in slide
+        coordinates. A shape is included when its bounding box is entirely
+        inside *rect*, touching edges included. Shapes are listed in document
+        (z) order.
+
+        The bounding box of a shape is its unrotated position and size on the
+        slide, including the transforms of any groups containing it, so
+        shapes in a group collection are compared in slide coordinates too.
+        A group shape is a single shape in its containing collection. Shapes
+        without a position, such as a placeholder inheriting none, are never
+        included.
+
+        Shape bounds are kept in a grid-based spatial index, so a query only
+        examines shapes near *rect*. The index is reused by later queries on
+        this collection until a shape anywhere is added, removed, moved, or
+        resized through the shape API.
+        """
+        index = self._spatial_index
+        return [
+            self._shape_factory(shape_elm)
+            for shape_elm in index.contained_by(_rect_box(rect))
+        ]
 
     @staticmethod
     def _is_member_elm(shape_elm):
@@ -177,6 +230,15 @@ class _BaseShapes(ParentedElementProxy):
             if self._is_member_elm(shape_elm):
                 yield shape_elm
 
+    @property
+    def _member_elms(self):
+        """
+        Sequence of the shape elements that are members of this collection,
+        in document order. The sequence is cached on the ``<p:spTree>``
+        element until its children change.
+        """
+        return self._spTree.shape_elms
+
     def _next_ph_name(self, ph_type, id, orient):
         """
         Next unique placeholder name for placeholder shape of type *ph_type*,
@@ -184,7 +246,7 @@ class _BaseShapes(ParentedElementProxy):
         placeholder root name suffixed with id-1, e.g.
         _next_ph_name(ST_PlaceholderType.TBL, 4, 'horz') ==>
         'Table Placeholder 3'. The number is incremented as necessary to make
-        the name unique within the collection. If *orient* is ``'vert'``, the
+        the name unique within the slide. If *orient* is ``'vert'``, the
         placeholder name is prefixed with ``'Vertical '``.
         """
         basename = self.ph_basename(ph_type)
@@ -193,31 +255,38 @@ class _BaseShapes(ParentedElementProxy):
         if orient == ST_Direction.VERT:
             basename = 'Vertical %s' % basename
 
-        # increment numpart as necessary to make name unique
-        numpart = id - 1
-        names = self._spTree.xpath('//p:cNvPr/@name')
-        while True:
-            name = '%s %d' % (basename, numpart)
-            if name not in names:
-                break
-            numpart += 1
-
-        return name
+        return self.part.unique_shape_name(basename, id - 1)
 
     @property
     def _next_shape_id(self):
         """Return a unique shape id suitable for use with a new shape.
 
-        The returned id is 1 greater than the maximum shape id used so far.
-        In practice, the minimum id is 2 because the spTree element is always
-        assigned id="1".
-        """
-        # ---presence of cached-max-shape-id indicates turbo mode is on---
-        if self._cached_max_shape_id is not None:
-            self._cached_max_shape_id += 1
-            return self._cached_max_shape_id
-
-        return self._spTree.max_shape_id + 1
+        The id is allocated by the part containing this shape tree, so shape
+        collections on the same slide, including those of group shapes,
+        share a single id sequence. In practice, the minimum id is 2 because
+        the spTree element is always assigned id="1".
+        """
+        return self.part.next_shape_id()
+
+    def _shape_box(self, shape_elm, shape=None):
+        """
+        Return the ``(left, top, right, bottom)`` bounding box of *shape_elm*
+        in slide coordinates, or |None| if it has no position and size.
+        *shape* is the shape proxy for *shape_elm*, constructed when needed to
+        resolve inherited placeholder geometry.
+        """
+        if not isinstance(shape_elm, BaseShapeElement):
+            return None
+        x, y, cx, cy = shape_elm.x, shape_elm.y, shape_elm.cx, shape_elm.cy
+        if x is None or y is None or cx is None or cy is None:
+            if shape is None:
+                shape = self._shape_factory(shape_elm)
+            x, y, cx, cy = shape.left, shape.top, shape.width, shape.height
+            if x is None or y is None or cx is None or cy is None:
+                return None
+        sx, sy, dx, dy = shape_elm.getparent().child_transform
+        left, top = sx * x + dx, sy * y + dy
+        return left, top, left + sx * cx, top + sy * cy
 
     def _shape_factory(self, shape_elm):
         """
@@ -226,6 +295,28 @@ class _BaseShapes(ParentedElementProxy):
         """
         return BaseShapeFactory(shape_elm, self)
 
+    @property
+    def _spatial_index(self):
+        """
+        |_SpatialIndex| of the member shape elements of this collection by
+        their bounding box in slide coordinates. The index is cached until the
+        shape geometry generation changes.
+        """
+        generation, index = self._cached_spatial_index
+        if index is not None and generation == shape_geometry_generation():
+            return index
+        generation = shape_geometry_generation()
+        shape_elms, boxes = [], []
+        for shape_elm in self._member_elms:
+            box = self._shape_box(shape_elm)
+            if box is None:
+                continue
+            shape_elms.append(shape_elm)
+            boxes.append(box)
+        index = _SpatialIndex(shape_elms, boxes)
+        self._cached_spatial_index = generation, index
+        return index
+
 
 class _BaseGroupShapes(_BaseShapes):
     """Base class for shape-trees that can add shapes."""
@@ -275,13 +366,45 @@ class _BaseGroupShapes(_BaseShapes):
         it contains; its position and extents are recalculated each time
         a shape is added to it.
         """
-        grpSp = self._element.add_grpSp()
+        id_ = self._next_shape_id
+        name = 'Group %d' % (id_-1)
+        grpSp = self._element.add_grpSp(id_, name)
         for shape in shapes:
             grpSp.insert_element_before(shape._element, 'p:extLst')
         if shapes:
             grpSp.recalculate_extents()
         return self._shape_factory(grpSp)
 
+    def add_many(self, specs):
+        """Return a sequence of the shapes newly appended to this shape tree.
+
+        A shape is added for each item in *specs*, an iterable of mappings
+        (dicts, for example), each describing one shape using the argument
+        names of the method that adds that kind of shape:
+
+        * ``autoshape_type_id``, ``left``, ``top``, ``width``, and
+          ``height`` add an auto shape, as :meth:`add_shape` does.
+        * ``connector_type``, ``begin_x``, ``begin_y``, ``end_x``, and
+          ``end_y`` add a connector, as :meth:`add_connector` does.
+        * ``left``, ``top``, ``width``, and ``height`` alone add a text box,
+          as :meth:`add_textbox` does.
+
+        A spec can also have any of these optional items: ``name``, to
+        override the default shape name; ``text``, a string assigned as
+        with `text_frame.text`; ``fill``, an |RGBColor| solid fill color;
+        ``line``, an |RGBColor| line color; and ``line_width``, a |Length|.
+        ``text`` and ``fill`` are ignored for a connector.
+
+        Shape ids and names are allocated up front and the new shape
+        elements are produced with a single XML parser invocation, so this
+        is much faster than adding the same shapes one at a time. A shape
+        object in the returned sequence is only constructed when accessed.
+        """
+        shape_xmls = [self._shape_xml(spec) for spec in specs]
+        shape_elms = self._element.add_shapes_from_xml(shape_xmls)
+        self._recalculate_extents()
+        return _LazyShapeSequence(shape_elms, self._shape_factory)
+
     def add_picture(self, image_file, left, top, width=None, height=None):
         """Add picture shape displaying image in *image_file*.
 
@@ -348,13 +471,34 @@ class _BaseGroupShapes(_BaseShapes):
 
         return FreeformBuilder.new(self, start_x, start_y, x_scale, y_scale)
 
+    def deferred_layout(self):
+        """Return a context manager deferring group extents recalculation.
+
+        Normally the position and size of a group shape are recalculated from
+        all of its shapes each time a shape is added to it, and again for
+        each group containing it, which makes building a large group slow.
+        Within a ``with shapes.deferred_layout():`` block that recalculation
+        is postponed; when the block exits, each group shape affected in the
+        block is recalculated once::
+
+            group = slide.shapes.add_group_shape()
+            with group.shapes.deferred_layout():
+                for left in range(0, Inches(10), Inches(1)):
+                    group.shapes.add_shape(MSO_SHAPE.OVAL, left, 0, 99, 99)
+
+        Deferral applies to every group changed in the current thread during
+        the block, not just the group this shape tree belongs to. Position
+        and size of a group are stale until the block exits, and stay stale
+        when the block exits by raising an exception.
+        """
+        return deferred_extents()
+
     def index(self, shape):
         """Return the index of *shape* in this sequence.
 
         Raises |ValueError| if *shape* is not in the collection.
         """
-        shape_elms = list(self._element.iter_shape_elms())
-        return shape_elms.index(shape.element)
+        return self._element.shape_elms.index(shape.element)
 
     def _add_chart_graphicFrame(self, rId, x, y, cx, cy):
         """Return new `p:graphicFrame` element appended to this shape tree.
@@ -438,6 +582,62 @@ class _BaseGroupShapes(_BaseShapes):
         #    produce the distinctive behavior of groups and subgroups.---
         pass
 
+    def _shape_xml(self, spec):
+        """Return XML text for a new shape element described by *spec*.
+
+        *spec* is a mapping as described in :meth:`add_many`. A shape id is
+        allocated for the shape on each call.
+        """
+        id_ = self._next_shape_id
+        fill, line = spec.get('fill'), spec.get('line')
+        line_width, text = spec.get('line_width'), spec.get('text')
+
+        fill_xml = (
+            '' if fill is None else
+            CT_ShapeProperties.solidFill_xml(str(fill))
+        )
+        ln_xml = (
+            '' if line is None and line_width is None else
+            CT_ShapeProperties.ln_xml(
+                None if line is None else str(line), line_width
+            )
+        )
+        p_xml = (
+            '' if text is None else
+            CT_TextParagraph.append_text_xml(to_unicode(text))
+        )
+
+        if 'connector_type' in spec:
+            begin_x, begin_y = spec['begin_x'], spec['begin_y']
+            end_x, end_y = spec['end_x'], spec['end_y']
+            name = spec.get('name', 'Connector %d' % (id_-1))
+            return CT_Connector.cxnSp_xml(
+                id_, name, MSO_CONNECTOR_TYPE.to_xml(spec['connector_type']),
+                min(begin_x, end_x), min(begin_y, end_y),
+                abs(end_x - begin_x), abs(end_y - begin_y),
+                begin_x > end_x, begin_y > end_y, ln_xml
+            )
+
+        x, y, cx, cy = (
+            spec['left'], spec['top'], spec['width'], spec['height']
+        )
+
+        if 'autoshape_type_id' in spec:
+            autoshape_type = AutoShapeType(spec['autoshape_type_id'])
+            name = spec.get(
+                'name', '%s %d' % (autoshape_type.basename, id_-1)
+            )
+            return CT_Shape.autoshape_sp_xml(
+                id_, name, autoshape_type.prst, x, y, cx, cy,
+                fill_xml + ln_xml, p_xml
+            )
+
+        name = spec.get('name', 'TextBox %d' % (id_-1))
+        return CT_Shape.textbox_sp_xml(
+            id_, name, x, y, cx, cy, (fill_xml or '<a:noFill/>') + ln_xml,
+            p_xml
+        )
+
 
 class GroupShapes(_BaseGroupShapes):
     """The sequence of child shapes belonging to a group shape.
@@ -506,6 +706,40 @@ class SlideShapes(_BaseGroupShapes):
         graphic_frame = self._shape_factory(graphicFrame)
         return graphic_frame
 
+    def add_table_from_data(self, data, left, top, width, height,
+                            header=None, number_formats=None):
+        """Return a |GraphicFrame| containing a table filled from *data*.
+
+        *data* is an iterable of rows, each an iterable of cell values; for
+        example a list of lists, a generator of tuples or a two-dimensional
+        NumPy array. A pandas-like data frame (an object having ``columns``
+        and ``itertuples()``) is also accepted, in which case its column
+        labels are used as *header* when none is specified.
+
+        When *header* is a sequence of strings, it is added as the first
+        row of the table and the table is formatted with the first-row
+        (header) style of the table style. Otherwise the table has no
+        header row styling. *number_formats*, when specified, is a sequence
+        with an item for each column, either |None| or a format spec like
+        ``',.2f'`` or ``'.1%'`` as understood by the built-in `format()`
+        function, which is applied to the numeric values in that column.
+        Other values are converted to text with `str()` and |None| produces
+        an empty cell. A row shorter than the widest row is padded with
+        empty cells.
+
+        Position, size and distribution of *width* and *height* are as for
+        :meth:`add_table`. The table XML, including its text, is generated
+        and parsed in a single pass, so this is much faster than adding
+        a table and then assigning the text of each cell.
+        """
+        texts, first_row = _table_texts(data, header, number_formats)
+        id_ = self._next_shape_id
+        graphicFrame = self._spTree.add_text_table(
+            id_, 'Table %d' % (id_-1), texts, left, top, width, height,
+            first_row
+        )
+        return self._shape_factory(graphicFrame)
+
     def clone_layout_placeholders(self, slide_layout):
         """
         Add placeholder shapes based on those in *slide_layout*. Z-order of
@@ -636,6 +870,14 @@ class BasePlaceholders(_BaseShapes):
         """
         return shape_elm.has_ph_elm
 
+    @property
+    def _member_elms(self):
+        """
+        Sequence of the placeholder shape elements in this collection, in
+        document order, cached on the ``<p:spTree>`` element.
+        """
+        return self._spTree.ph_elms
+
 
 class LayoutPlaceholders(BasePlaceholders):
     """
@@ -647,10 +889,10 @@ class LayoutPlaceholders(BasePlaceholders):
         Return the first placeholder shape with matching *idx* value, or
         *default* if not found.
         """
-        for placeholder in self:
-            if placeholder.element.ph_idx == idx:
-                return placeholder
-        return default
+        ph_elm = self._spTree.find_ph_elm(idx=idx)
+        if ph_elm is None:
+            return default
+        return self._shape_factory(ph_elm)
 
     def _shape_factory(self, shape_elm):
         """
@@ -671,10 +913,10 @@ class MasterPlaceholders(BasePlaceholders):
         or *default* if no such placeholder shape is present in the
         collection.
         """
-        for placeholder in self:
-            if placeholder.ph_type == ph_type:
-                return placeholder
-        return default
+        ph_elm = self._spTree.find_ph_elm(ph_type=ph_type)
+        if ph_elm is None:
+            return default
+        return self._shape_factory(ph_elm)
 
     def _shape_factory(self, shape_elm):
         """
@@ -712,7 +954,7 @@ class SlidePlaceholders(ParentedElementProxy):
         |KeyError| if no placeholder with that idx value is in the
         collection.
         """
-        for e in self._element.iter_ph_elms():
+        for e in self._element.ph_elms:
             if e.ph_idx == idx:
                 return SlideShapeFactory(e, self)
         raise KeyError('no placeholder on this slide with idx == %d' % idx)
@@ -730,9 +972,198 @@ class SlidePlaceholders(ParentedElementProxy):
         """
         Return count of placeholder shapes.
         """
-        return len(list(self._element.iter_ph_elms()))
+        return len(self._element.ph_elms)
+
+
+class _LazyShapeSequence(Sequence):
+    """
+    Immutable sequence of shapes, each constructed from its shape element
+    by *shape_factory* only when it is accessed.
+    """
+
+    def __init__(self, shape_elms, shape_factory):
+        super(_LazyShapeSequence, self).__init__()
+        self._shape_elms = shape_elms
+        self._shape_factory = shape_factory
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self._shape_factory(e) for e in self._shape_elms[idx]]
+        return self._shape_factory(self._shape_elms[idx])
+
+    def __len__(self):
+        return len(self._shape_elms)
+
+
+class _SpatialIndex(object):
+    """
+    Uniform-grid spatial index of *items* by their bounding box in *boxes*.
+
+    Each box is a ``(left, top, right, bottom)`` tuple. The grid cell size is
+    the mean box width and height, so a typical box occupies only a few cells
+    and a query only examines the boxes in the cells it covers. A box
+    covering more than `_MAX_CELLS` cells, such as a full-slide background
+    picture, is kept aside and examined by every query instead.
+    """
+
+    _MAX_CELLS = 64
+
+    def __init__(self, items, boxes):
+        super(_SpatialIndex, self).__init__()
+        self.items = items
+        self._boxes = boxes
+        sizes = [box[2] - box[0] for box in boxes]
+        sizes.extend(box[3] - box[1] for box in boxes)
+        self._cell_size = max(sum(sizes) / len(sizes), 1) if sizes else 1
+        self._cells = {}
+        self._large = []
+        for i, box in enumerate(boxes):
+            cells = self._cells_of(box)
+            if len(cells) > self._MAX_CELLS:
+                self._large.append(i)
+                continue
+            for cell in cells:
+                self._cells.setdefault(cell, []).append(i)
+
+    def contained_by(self, box):
+        """Return the items whose box is inside *box*, in original order."""
+        left, top, right, bottom = box
+        return [
+            self.items[i] for i in self._candidates(box)
+            if left <= self._boxes[i][0] and self._boxes[i][2] <= right and
+            top <= self._boxes[i][1] and self._boxes[i][3] <= bottom
+        ]
+
+    def intersecting(self, box):
+        """Return the items whose box intersects *box*, in original order.
+
+        Boxes intersect when they share some area or when a box of zero
+        width or height crosses the other, but not when they only touch.
+        """
+        left, top, right, bottom = box
+        return [
+            self.items[i] for i in self._candidates(box)
+            if self._boxes[i][0] < right and left < self._boxes[i][2] and
+            self._boxes[i][1] < bottom and top < self._boxes[i][3]
+        ]
+
+    def _candidates(self, box):
+        """
+        Return sorted list of the indices of items whose box might touch
+        *box*, those in a grid cell *box* covers plus the large ones.
+        """
+        col_0, row_0, col_1, row_1 = self._cell_span(box)
+        candidates = set(self._large)
+        cells = self._cells
+        if (col_1 - col_0 + 1) * (row_1 - row_0 + 1) > len(cells):
+            for (col, row), idxs in cells.items():
+                if col_0 <= col <= col_1 and row_0 <= row <= row_1:
+                    candidates.update(idxs)
+        else:
+            for col in range(col_0, col_1 + 1):
+                for row in range(row_0, row_1 + 1):
+                    candidates.update(cells.get((col, row), ()))
+        return sorted(candidates)
+
+    def _cell_span(self, box):
+        """
+        Return (col_0, row_0, col_1, row_1) tuple of the first and last grid
+        column and row covered by *box*.
+        """
+        left, top, right, bottom = box
+        size = self._cell_size
+        return (
+            int(left // size), int(top // size),
+            int(right // size), int(bottom // size)
+        )
+
+    def _cells_of(self, box):
+        """
+        Return list of the (col, row) grid cells covered by *box*, stopping
+        early once there are more than `_MAX_CELLS` of them.
+        """
+        col_0, row_0, col_1, row_1 = self._cell_span(box)
+        cells = []
+        for col in range(col_0, col_1 + 1):
+            for row in range(row_0, row_1 + 1):
+                cells.append((col, row))
+            if len(cells) > self._MAX_CELLS:
+                break
+        return cells
+
+
+def _rect_box(rect):
+    """
+    Return ``(left, top, right, bottom)`` box equivalent to *rect*, a
+    ``(left, top, width, height)`` tuple.
+    """
+    left, top, width, height = rect
+    return left, top, left + width, top + height
 
 
+def _table_texts(data, header, number_formats):
+    """Return (texts, has_header) pair for table *data*.
+
+    *texts* is a list of rows, each a list of cell strings, all the same
+    length. *has_header* is True when a header row was added. See
+    :meth:`SlideShapes.add_table_from_data` for the meaning of the
+    arguments.
+    """
+    if hasattr(data, 'itertuples') and hasattr(data, 'columns'):
+        if header is None:
+            header = [Unicode(label) for label in data.columns]
+        rows = data.itertuples(index=False, name=None)
+    elif hasattr(data, 'tolist'):
+        # ---NumPy-like array, tolist() produces native Python values---
+        rows = data.tolist()
+    else:
+        rows = data
+
+    formats = list(number_formats) if number_formats is not None else []
+
+    def cell_text(value, number_format):
+        if value is None:
+            return ''
+        if is_string(value):
+            return to_unicode(value)
+        if (number_format is not None and isinstance(value, Number) and
+                not isinstance(value, bool)):
+            return format(value, number_format)
+        return Unicode(value)
+
+    texts = [] if header is None else [[cell_text(h, None) for h in header]]
+    for row in rows:
+        row = list(row)
+        row_formats = formats + [None] * (len(row) - len(formats))
+        texts.append([
+            cell_text(value, number_format)
+            for value, number_format in zip(row, row_formats)
+        ])
+
+    cols = max(len(row_texts) for row_texts in texts) if texts else 0
+    if cols == 0:
+        raise ValueError('table data must have at least one cell')
+    for row_texts in texts:
+        row_texts.extend([''] * (cols - len(row_texts)))
+
+    return texts, header is not None
+
+
+def _cached_shape(shape_factory):
+    """
+    Return a shape factory that gets its shape from *shape_factory* unless
+    a shape proxy for the shape element is cached, see |cached_proxies|.
+    """
+    def factory(shape_elm, parent):
+        return cached_proxy(
+            shape_elm, 'shape', shape_factory, shape_elm, parent
+        )
+    factory.__name__ = shape_factory.__name__
+    factory.__doc__ = shape_factory.__doc__
+    return factory
+
+
+@_cached_shape
 def BaseShapeFactory(shape_elm, parent):
     """
     Return an instance of the appropriate shape proxy class for *shape_elm*.
@@ -755,6 +1186,7 @@ def BaseShapeFactory(shape_elm, parent):
     return shape_cls(shape_elm, parent)
 
 
+@_cached_shape
 def _LayoutShapeFactory(shape_elm, parent):
     """
     Return an instance of the appropriate shape proxy class for *shape_elm*
@@ -766,6 +1198,7 @@ def _LayoutShapeFactory(shape_elm, parent):
     return BaseShapeFactory(shape_elm, parent)
 
 
+@_cached_shape
 def _MasterShapeFactory(shape_elm, parent):
     """
     Return an instance of the appropriate shape proxy class for *shape_elm*
@@ -777,6 +1210,7 @@ def _MasterShapeFactory(shape_elm, parent):
     return BaseShapeFactory(shape_elm, parent)
 
 
+@_cached_shape
 def _NotesSlideShapeFactory(shape_elm, parent):
     """
     Return an instance of the appropriate shape proxy class for *shape_elm*
@@ -809,6 +1243,7 @@ def _SlidePlaceholderFactory(shape_elm, parent):
     return Constructor(shape_elm, parent)
 
 
+@_cached_shape
 def SlideShapeFactory(shape_elm, parent):
     """
     Return an instance of the appropriate shape proxy class for *shape_elm*
@@ -881,6 +1316,8 @@ class _MoviePicElementCreator(object):
         """
         poster_frame_file = self._poster_frame_file
         if poster_frame_file is None:
+            from pptx.media import SPEAKER_IMAGE_BYTES
+
             return BytesIO(SPEAKER_IMAGE_BYTES)
         return poster_frame_file
 
@@ -912,6 +1349,9 @@ class _MoviePicElementCreator(object):
     @lazyproperty
     def _video(self):
         """Return a |Video| object containing the movie file."""
+        # ---pptx.media is only needed once a movie is actually added---
+        from pptx.media import Video
+
         return Video.from_path_or_file_like(
             self._movie_file, self._mime_type
         )
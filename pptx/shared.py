@@ -8,6 +8,11 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import threading
+import weakref
+
+from contextlib import contextmanager
+
 
 class ElementProxy(object):
     """
@@ -95,3 +100,67 @@ class PartElementProxy(ElementProxy):
         The package part containing this object
         """
         return self._part
+
+
+class _ProxyCache(threading.local):
+    """
+    Per-thread record of whether proxy objects are being cached, see
+    :func:`cached_proxies`.
+    """
+    enabled = False
+
+
+_proxy_cache = _ProxyCache()
+
+
+@contextmanager
+def cached_proxies():
+    """
+    Context manager that makes repeated access to the same shape or text
+    frame in the current thread return the same proxy object for the
+    duration of the ``with`` block, rather than a new proxy object each
+    time::
+
+        with pptx.cached_proxies():
+            assert slide.shapes[0] is slide.shapes[0]
+
+    Each proxy is held by weak reference from the element it proxies, so it
+    is constructed again once no longer referenced. Blocks can be nested.
+    Slide objects are always the same object for the same slide and are not
+    affected.
+    """
+    saved = _proxy_cache.enabled
+    _proxy_cache.enabled = True
+    try:
+        yield
+    finally:
+        _proxy_cache.enabled = saved
+
+
+def cached_proxy(element, kind, proxy_factory, *args):
+    """
+    Return the *kind* proxy object for *element*, a string like ``'shape'``,
+    produced by calling *proxy_factory* with *args*.
+
+    Inside a :func:`cached_proxies` block, a proxy of that kind still alive
+    for *element* is returned instead of a new one, and a new one is recorded
+    on *element* by weak reference. An element that can't record it, such as
+    one not having a custom element class, is never cached.
+    """
+    if not _proxy_cache.enabled:
+        return proxy_factory(*args)
+
+    proxy_refs = getattr(element, '_proxy_refs', None)
+    if proxy_refs is None:
+        proxy_refs = {}
+        try:
+            element._proxy_refs = proxy_refs
+        except AttributeError:
+            return proxy_factory(*args)
+
+    proxy_ref = proxy_refs.get(kind)
+    proxy = None if proxy_ref is None else proxy_ref()
+    if proxy is None:
+        proxy = proxy_factory(*args)
+        proxy_refs[kind] = weakref.ref(proxy)
+    return proxy
@@ -193,6 +193,22 @@ class Slide(_BaseSlide):
         """
         return self._element.bg is None
 
+    def find_overflowing(self):
+        """Return a list of the shapes on this slide extending past its edges.
+
+        A shape is included when any part of its bounding box lies outside
+        the slide, as determined by the slide size of the presentation.
+        A group shape is checked as a whole. Shapes are listed in z-order.
+        An empty list is returned when the presentation defines no slide
+        size. See :meth:`.SlideShapes.within` for how shape bounds are
+        determined.
+        """
+        presentation = self.part.package.presentation_part.presentation
+        width, height = presentation.slide_width, presentation.slide_height
+        if width is None or height is None:
+            return []
+        return self.shapes.overflowing((0, 0, width, height))
+
     @property
     def has_notes_slide(self):
         """
@@ -6,12 +6,57 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
-from pptx.compat import is_integer, to_unicode
+from copy import deepcopy
+
+from pptx.compat import is_integer, is_string, to_unicode
 from pptx.dml.fill import FillFormat
+from pptx.oxml.dml.fill import CT_SolidColorFillProperties
+from pptx.dml.color import RGBColor
+from pptx.oxml.simpletypes import (
+    ST_HexColorRGB, ST_TextFontSize, XsdBoolean
+)
 from pptx.oxml.table import TcRange
 from pptx.shapes import Subshape
+from pptx.shared import cached_proxy
 from pptx.text.text import TextFrame
-from pptx.util import lazyproperty
+from pptx.util import Deferral, Emu, lazyproperty
+
+
+def _resize_graphicFrames(pending):
+    """
+    Resize each ``<p:graphicFrame>`` element recorded in *pending* as
+    a (graphicFrame, extent) pair to fit its table, setting its *extent*,
+    'cx' or 'cy', once however many times it was recorded.
+    """
+    for graphicFrame, extent in set(pending):
+        tbl = graphicFrame.graphic.graphicData.tbl
+        if extent == 'cx':
+            graphicFrame.cx = _table_width(tbl)
+        else:
+            graphicFrame.cy = _table_height(tbl)
+
+
+def _table_height(tbl):
+    """Return the sum of the row heights of *tbl*."""
+    return sum(tr.h for tr in tbl.tc_grid.trs)
+
+
+def _table_width(tbl):
+    """Return the sum of the column widths of *tbl*."""
+    return sum(gridCol.w for gridCol in tbl.tblGrid.gridCol_lst)
+
+
+_deferred_resize = Deferral(flush=_resize_graphicFrames)
+
+
+def deferred_resize():
+    """
+    Return a context manager that postpones resizing of table graphic
+    frames in the current thread until the ``with`` block exits. Blocks can
+    be nested; only the outermost one resizes, each affected frame once,
+    and only when it exits normally.
+    """
+    return _deferred_resize.deferring()
 
 
 class Table(object):
@@ -43,6 +88,31 @@ class Table(object):
         """
         return _ColumnCollection(self._tbl, self)
 
+    def deferred_layout(self):
+        """Return a context manager deferring graphic frame resizing.
+
+        Normally each assignment to a row height or column width sums the
+        heights of all the rows, or widths of all the columns, to resize the
+        graphic frame containing the table, which makes resizing every row
+        or column of a large table slow. Within a ``with
+        table.deferred_layout():`` block that resizing is postponed; when
+        the block exits, the graphic frame of each table changed in the
+        block is resized once::
+
+            with table.deferred_layout():
+                for column, width in zip(table.columns, widths):
+                    column.width = width
+
+        Only the dimension that changed is resized, so a graphic frame
+        height set taller than its rows is kept when only column widths
+        change. Tables other than this one resized in the same thread during
+        the block are deferred too, and reading the width or height of the
+        graphic frame of any of them in the block gives its size from before
+        the block. No frame is resized when the block exits by raising an
+        exception.
+        """
+        return deferred_resize()
+
     @property
     def first_col(self):
         """
@@ -118,8 +188,10 @@ class Table(object):
         Called by a row when its height changes, triggering the graphic frame
         to recalculate its total height (as the sum of the row heights).
         """
-        new_table_height = sum([row.height for row in self.rows])
-        self._graphic_frame.height = new_table_height
+        graphicFrame = self._graphic_frame.element
+        if _deferred_resize.record((graphicFrame, 'cy')):
+            return
+        self._graphic_frame.height = _table_height(self._tbl)
 
     def notify_width_changed(self):
         """
@@ -127,8 +199,10 @@ class Table(object):
         frame to recalculate its total width (as the sum of the column
         widths).
         """
-        new_table_width = sum([col.width for col in self.columns])
-        self._graphic_frame.width = new_table_width
+        graphicFrame = self._graphic_frame.element
+        if _deferred_resize.record((graphicFrame, 'cx')):
+            return
+        self._graphic_frame.width = _table_width(self._tbl)
 
     @property
     def part(self):
@@ -137,6 +211,23 @@ class Table(object):
         """
         return self._graphic_frame.part
 
+    def range(self, row_idx, col_idx, other_row_idx, other_col_idx):
+        """Return |_CellRange| of the cells in a rectangular block.
+
+        The cells at (*row_idx*, *col_idx*) and (*other_row_idx*,
+        *other_col_idx*) are opposite corners of the block, in either order,
+        and are both included in it. Raises |IndexError| when either corner
+        is outside the table.
+        """
+        self._tbl.tc(row_idx, col_idx)
+        self._tbl.tc(other_row_idx, other_col_idx)
+        return _CellRange(
+            self._tbl,
+            min(row_idx, other_row_idx), min(col_idx, other_col_idx),
+            max(row_idx, other_row_idx) + 1, max(col_idx, other_col_idx) + 1,
+            self
+        )
+
     @lazyproperty
     def rows(self):
         """
@@ -146,6 +237,43 @@ class Table(object):
         """
         return _RowCollection(self._tbl, self)
 
+    def set_column_widths(self, widths):
+        """Set the width of each column to the corresponding item of *widths*.
+
+        *widths* is a sequence of |Length| values with one item for each
+        column, left to right. The graphic frame is resized once. Raises
+        |ValueError| when the number of widths does not match the number of
+        columns.
+        """
+        gridCols = self._tbl.tblGrid.gridCol_lst
+        widths = list(widths)
+        if len(widths) != len(gridCols):
+            raise ValueError(
+                'expected %d column widths, got %d' %
+                (len(gridCols), len(widths))
+            )
+        for gridCol, width in zip(gridCols, widths):
+            gridCol.w = width
+        self.notify_width_changed()
+
+    def set_row_heights(self, heights):
+        """Set the height of each row to the corresponding item of *heights*.
+
+        *heights* is a sequence of |Length| values with one item for each
+        row, top to bottom. The graphic frame is resized once. Raises
+        |ValueError| when the number of heights does not match the number of
+        rows.
+        """
+        trs = self._tbl.tc_grid.trs
+        heights = list(heights)
+        if len(heights) != len(trs):
+            raise ValueError(
+                'expected %d row heights, got %d' % (len(trs), len(heights))
+            )
+        for tr, height in zip(trs, heights):
+            tr.h = height
+        self.notify_height_changed()
+
     @property
     def vert_banding(self):
         """
@@ -361,7 +489,7 @@ class _Cell(Subshape):
         |TextFrame| instance containing the text that appears in the cell.
         """
         txBody = self._tc.get_or_add_txBody()
-        return TextFrame(txBody, self)
+        return cached_proxy(txBody, 'text_frame', TextFrame, txBody, self)
 
     @property
     def vertical_anchor(self):
@@ -393,6 +521,165 @@ class _Cell(Subshape):
             raise TypeError(tmpl % margin_value)
 
 
+class _BaseCellRange(Subshape):
+    """Base class for a block of table cells that can be formatted together.
+
+    Each formatting method applies its settings to every cell in the block
+    in a single pass over the `a:tc` elements. Fill and font color elements
+    are built once per color and copied into each cell, and no |_Cell| or
+    |Font| proxy is constructed.
+    """
+
+    def set_fill_color(self, color):
+        """Give each cell in this range a solid fill of *color*.
+
+        *color* is an |RGBColor| value or a callable taking the
+        (row_idx, col_idx) table position of a cell and returning an
+        |RGBColor| value, or |None| to leave that cell unchanged. A callable
+        makes conditional coloring or zebra striping a single call, e.g.
+        ``cells.set_fill_color(lambda row, col: GRAY if row % 2 else None)``.
+        A hex RGB string such as 'FF0000' is accepted in place of an
+        |RGBColor| value. Any other value raises |ValueError|.
+        """
+        get_color = color if callable(color) else (lambda row, col: color)
+        solidFills = {}
+
+        for row_idx, col_idx, tc in self._iter_positioned_tcs():
+            rgb = get_color(row_idx, col_idx)
+            if rgb is None:
+                continue
+            rgb = self._rgb_str(rgb)
+            if rgb not in solidFills:
+                solidFills[rgb] = (
+                    CT_SolidColorFillProperties.new_srgb_solidFill(rgb)
+                )
+            tcPr = tc.get_or_add_tcPr()
+            tcPr._remove_eg_fillProperties()
+            tcPr._insert_solidFill(deepcopy(solidFills[rgb]))
+
+    def set_font(self, name=None, size=None, bold=None, italic=None,
+                 color=None):
+        """Set font properties of all the text in each cell of this range.
+
+        Only the properties that are specified are changed. *name* is
+        a typeface name, *size* a |Length| value such as ``Pt(12)``, *bold*
+        and *italic* are |True| or |False| and *color* is an |RGBColor|
+        value or a hex RGB string such as 'FF0000'. The properties are applied to each run and to the
+        end-of-paragraph properties of each paragraph, so they also apply
+        to text later typed into an empty cell.
+        """
+        attrs = [
+            (attr_name, simple_type.to_xml(value))
+            for attr_name, simple_type, value in (
+                ('sz', ST_TextFontSize,
+                 None if size is None else Emu(size).centipoints),
+                ('b', XsdBoolean, bold), ('i', XsdBoolean, italic),
+            ) if value is not None
+        ]
+        solidFill = (
+            None if color is None else
+            CT_SolidColorFillProperties.new_srgb_solidFill(
+                self._rgb_str(color)
+            )
+        )
+
+        for _, _, tc in self._iter_positioned_tcs():
+            for p in tc.get_or_add_txBody().p_lst:
+                rPrs = [elm.get_or_add_rPr() for elm in p.content_children]
+                rPrs.append(p.get_or_add_endParaRPr())
+                for rPr in rPrs:
+                    for attr_name, str_value in attrs:
+                        rPr.set(attr_name, str_value)
+                    if solidFill is not None:
+                        rPr._remove_eg_fillProperties()
+                        rPr._insert_solidFill(deepcopy(solidFill))
+                    if name is not None:
+                        rPr.get_or_add_latin().typeface = name
+
+    def set_margins(self, left=None, top=None, right=None, bottom=None):
+        """Set the margins of each cell in this range.
+
+        Each margin is a |Length| value; a margin that is not specified is
+        left unchanged. Raises |TypeError| on a margin that is not an
+        integer value.
+        """
+        margins = [
+            (marX, value) for marX, value in (
+                ('marL', left), ('marT', top), ('marR', right),
+                ('marB', bottom)
+            ) if value is not None
+        ]
+        for _, value in margins:
+            _Cell._validate_margin_value(value)
+
+        for _, _, tc in self._iter_positioned_tcs():
+            tcPr = tc.get_or_add_tcPr()
+            for marX, value in margins:
+                setattr(tcPr, marX, value)
+
+    def set_vertical_anchor(self, mso_anchor_idx):
+        """Set the vertical alignment of each cell in this range.
+
+        *mso_anchor_idx* is a member of :ref:`MsoVerticalAnchor` or |None|,
+        which removes any explicit setting, as for
+        :attr:`_Cell.vertical_anchor`.
+        """
+        for _, _, tc in self._iter_positioned_tcs():
+            tc.anchor = mso_anchor_idx
+
+    def _iter_positioned_tcs(self):
+        """Generate a (row_idx, col_idx, tc) triple for each cell in range.
+
+        Must be implemented by each subclass.
+        """
+        raise NotImplementedError(
+            '_iter_positioned_tcs() must be implemented by subclass'
+        )
+
+    @staticmethod
+    def _rgb_str(color):
+        """Return the hex RGB string, like 'FF0000', of *color*.
+
+        Raise ValueError if *color* is neither an |RGBColor| value nor a valid
+        hex RGB string.
+        """
+        if isinstance(color, RGBColor):
+            return str(color)
+        if not is_string(color):
+            raise ValueError(
+                'color must be RGBColor or hex RGB string, got %r' % (color,)
+            )
+        ST_HexColorRGB.validate(color)
+        return ST_HexColorRGB.convert_to_xml(color)
+
+
+class _CellRange(_BaseCellRange):
+    """Rectangular block of cells in a table, such as all those in a column.
+
+    Obtained using :meth:`Table.range` or :attr:`_Column.cells`.
+    """
+
+    def __init__(self, tbl, top, left, bottom, right, parent):
+        super(_CellRange, self).__init__(parent)
+        self._tbl = tbl
+        self._top, self._left = top, left
+        self._bottom, self._right = bottom, right
+
+    def iter_cells(self):
+        """Generate |_Cell| object for each cell in this range.
+
+        Cells are generated in left-to-right, top-to-bottom order.
+        """
+        return (_Cell(tc, self) for _, _, tc in self._iter_positioned_tcs())
+
+    def _iter_positioned_tcs(self):
+        rows = self._tbl.tc_grid.rows[self._top:self._bottom]
+        for row_idx, tcs in enumerate(rows, self._top):
+            for col_idx, tc in enumerate(
+                    tcs[self._left:self._right], self._left):
+                yield row_idx, col_idx, tc
+
+
 class _Column(Subshape):
     """Table column"""
 
@@ -400,6 +687,18 @@ class _Column(Subshape):
         super(_Column, self).__init__(parent)
         self._gridCol = gridCol
 
+    @property
+    def cells(self):
+        """
+        |_CellRange| of the cells in this column, from top to bottom.
+        """
+        tblGrid = self._gridCol.getparent()
+        col_idx = tblGrid.gridCol_lst.index(self._gridCol)
+        tbl = tblGrid.getparent()
+        return _CellRange(
+            tbl, 0, col_idx, len(tbl.tc_grid.rows), col_idx + 1, self
+        )
+
     @property
     def width(self):
         """
@@ -441,8 +740,12 @@ class _Row(Subshape):
         self._parent.notify_height_changed()
 
 
-class _CellCollection(Subshape):
-    """Horizontal sequence of row cells"""
+class _CellCollection(_BaseCellRange):
+    """Horizontal sequence of row cells
+
+    Also provides the range formatting methods, such as `set_fill_color()`,
+    applied to each cell in the row.
+    """
 
     def __init__(self, tr, parent):
         super(_CellCollection, self).__init__(parent)
@@ -463,6 +766,11 @@ class _CellCollection(Subshape):
         """Supports len() function (e.g. 'len(cells) == 1')."""
         return len(self._tr.tc_lst)
 
+    def _iter_positioned_tcs(self):
+        row_idx = self._tr.row_idx
+        for col_idx, tc in enumerate(self._tr.tc_lst):
+            yield row_idx, col_idx, tc
+
 
 class _ColumnCollection(Subshape):
     """Sequence of table columns."""
@@ -507,13 +815,13 @@ class _RowCollection(Subshape):
         if idx < 0 or idx >= len(self):
             msg = "row index [%d] out of range" % idx
             raise IndexError(msg)
-        return _Row(self._tbl.tr_lst[idx], self)
+        return _Row(self._tbl.tc_grid.trs[idx], self)
 
     def __len__(self):
         """
         Supports len() function (e.g. 'len(rows) == 1').
         """
-        return len(self._tbl.tr_lst)
+        return len(self._tbl.tc_grid.trs)
 
     def notify_height_changed(self):
         """
@@ -0,0 +1,9 @@
+# encoding: utf-8
+
+"""
+Text-related objects and operations, such as fitting text to its shape.
+"""
+
+from __future__ import absolute_import
+
+from .text import fit_many  # noqa: F401
@@ -6,10 +6,12 @@ Objects related to system font file lookup.
 
 from __future__ import absolute_import, print_function
 
+import json
 import os
 import sys
+import tempfile
 
-from struct import calcsize, unpack_from
+from struct import calcsize, error as StructError, unpack_from
 
 from ..util import lazyproperty
 
@@ -31,17 +33,52 @@ class FontFiles(object):
             cls._font_files = cls._installed_fonts()
         return cls._font_files[(family_name, is_bold, is_italic)]
 
+    @classmethod
+    def _font_index_path(cls):
+        """
+        Return the path of the on-disk font index file for the current user,
+        in the per-user cache directory of the platform.
+        """
+        if sys.platform.startswith('win32'):
+            cache_dir = os.environ.get('LOCALAPPDATA')
+        elif sys.platform.startswith('darwin'):
+            cache_dir = os.path.expanduser(
+                os.path.join('~', 'Library', 'Caches')
+            )
+        else:
+            cache_dir = (
+                os.environ.get('XDG_CACHE_HOME') or
+                os.path.expanduser(os.path.join('~', '.cache'))
+            )
+        if not cache_dir:
+            cache_dir = tempfile.gettempdir()
+        return os.path.join(cache_dir, 'python-pptx', 'font-index.json')
+
     @classmethod
     def _installed_fonts(cls):
         """
         Return a dict mapping a font descriptor to its font file path,
         containing all the font files resident on the current machine. The
         font descriptor is a (family_name, is_bold, is_italic) 3-tuple.
+
+        The catalog is loaded from the on-disk font index when no font
+        directory has changed since the index was saved. Otherwise the font
+        files are scanned and the index is saved for the next process.
         """
+        directories = cls._font_directories()
+        font_index = _FontIndex(cls._font_index_path())
+
+        fonts = font_index.load(directories)
+        if fonts is not None:
+            return fonts
+
+        # ---taken before the scan so a font added during it is not missed---
+        dir_mtimes = _FontIndex.directory_mtimes(directories)
         fonts = {}
-        for d in cls._font_directories():
+        for d in directories:
             for key, path in cls._iter_font_files_in(d):
                 fonts[key] = path
+        font_index.save(directories, dir_mtimes, fonts)
         return fonts
 
     @classmethod
@@ -54,6 +91,8 @@ class FontFiles(object):
             return cls._os_x_font_directories()
         if sys.platform.startswith('win32'):
             return cls._windows_font_directories()
+        if sys.platform.startswith('linux'):
+            return cls._linux_font_directories()
         raise OSError('unsupported operating system')
 
     @classmethod
@@ -70,8 +109,36 @@ class FontFiles(object):
                 if file_ext.lower() not in ('.otf', '.ttf'):
                     continue
                 path = os.path.abspath(os.path.join(root, filename))
-                with _Font.open(path) as f:
-                    yield ((f.family_name, f.is_bold, f.is_italic), path)
+                try:
+                    with _Font.open(path) as f:
+                        key = (f.family_name, f.is_bold, f.is_italic)
+                except (EnvironmentError, KeyError, StructError, ValueError):
+                    # ---skip an unreadable or malformed font file---
+                    continue
+                yield key, path
+
+    @classmethod
+    def _linux_font_directories(cls):
+        """
+        Return a sequence of directory paths on Linux in which fonts are
+        likely to be located, the `fonts` directory in each of the XDG base
+        data directories searched by fontconfig plus the legacy `~/.fonts`.
+        Directories are ordered from least to most preferred, so a font in
+        the user's own directories overrides a system font of the same name
+        and style.
+        """
+        home = os.environ.get('HOME', os.path.expanduser('~'))
+        data_dirs = (
+            os.environ.get('XDG_DATA_DIRS') or '/usr/local/share:/usr/share'
+        ).split(':')
+        data_home = (
+            os.environ.get('XDG_DATA_HOME') or
+            os.path.join(home, '.local', 'share')
+        )
+        return (
+            [os.path.join(d, 'fonts') for d in reversed(data_dirs) if d] +
+            [os.path.join(data_home, 'fonts'), os.path.join(home, '.fonts')]
+        )
 
     @classmethod
     def _os_x_font_directories(cls):
@@ -101,6 +168,100 @@ class FontFiles(object):
         return [r'C:\Windows\Fonts']
 
 
+class _FontIndex(object):
+    """
+    On-disk cache of the installed font catalog produced by
+    :meth:`FontFiles._installed_fonts`, stored as JSON at *path*.
+
+    The index records the modification time of each font directory and of
+    each directory below it. Adding, removing, or renaming a font file
+    changes the modification time of the directory containing it, so an
+    index is only used when all of those times are unchanged. Failure to
+    read or write the index is not an error; the fonts are simply scanned.
+    """
+
+    _version = 1
+
+    def __init__(self, path):
+        self._path = path
+
+    @staticmethod
+    def directory_mtimes(directories):
+        """
+        Return a dict mapping each existing directory in and under the
+        directories in *directories* to its modification time.
+        """
+        mtimes = {}
+        for directory in directories:
+            for root, dirs, files in os.walk(directory):
+                try:
+                    mtimes[root] = os.stat(root).st_mtime
+                except OSError:
+                    continue
+        return mtimes
+
+    def load(self, directories):
+        """
+        Return the font catalog dict saved in this index, or |None| if there
+        is no index, it can't be read, or it is stale for *directories*.
+        """
+        try:
+            with open(self._path) as f:
+                index = json.load(f)
+            if index['version'] != self._version:
+                return None
+            if index['directories'] != list(directories):
+                return None
+            if self.directory_mtimes(directories) != index['mtimes']:
+                return None
+            return dict(
+                ((family_name, is_bold, is_italic), path)
+                for family_name, is_bold, is_italic, path in index['fonts']
+            )
+        except (EnvironmentError, KeyError, TypeError, ValueError):
+            return None
+
+    def save(self, directories, dir_mtimes, fonts):
+        """
+        Write the font catalog dict *fonts*, scanned from *directories*
+        having modification times *dir_mtimes*, to this index. The index
+        file is replaced atomically so a concurrent process never reads
+        a partial index.
+        """
+        index = {
+            'version': self._version,
+            'directories': list(directories),
+            'mtimes': dir_mtimes,
+            'fonts': [
+                [family_name, is_bold, is_italic, path]
+                for (family_name, is_bold, is_italic), path
+                in sorted(fonts.items(), key=lambda item: item[1])
+            ],
+        }
+        index_dir = os.path.dirname(self._path)
+        try:
+            if not os.path.isdir(index_dir):
+                os.makedirs(index_dir)
+            fd, tmp_path = tempfile.mkstemp(dir=index_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(index, f)
+            _replace(tmp_path, self._path)
+        except EnvironmentError:
+            pass
+
+
+def _replace(src, dst):
+    """Move file *src* to *dst*, replacing *dst* if it exists."""
+    replace = getattr(os, 'replace', None)
+    if replace is not None:
+        replace(src, dst)
+    else:
+        # ---Python 2; rename() replaces the destination on POSIX only---
+        if os.path.exists(dst) and sys.platform.startswith('win32'):
+            os.remove(dst)
+        os.rename(src, dst)
+
+
 class _Font(object):
     """
     A wrapper around an OTF/TTF font file stream that knows how to parse it
@@ -154,6 +315,23 @@ class _Font(object):
         """
         return self._tables['name'].family_name
 
+    @property
+    def glyph_metrics(self):
+        """
+        A |_GlyphMetrics| object containing the horizontal metrics of the
+        glyphs in this font. Raises |KeyError| when a table required to
+        measure text, such as 'cmap' or 'hmtx', is not present.
+        """
+        tables = self._tables
+        hhea = tables['hhea']
+        kern = tables.get('kern')
+        return _GlyphMetrics(
+            tables['head'].units_per_em, hhea.ascender, hhea.descender,
+            tables['cmap'].glyph_ids,
+            tables['hmtx'].advance_widths(hhea.num_h_metrics),
+            kern.pairs if kern is not None else {},
+        )
+
     @lazyproperty
     def _fields(self):
         """
@@ -195,6 +373,83 @@ class _Font(object):
         return self._fields[1]
 
 
+class _GlyphMetrics(object):
+    """
+    The horizontal metrics of a font needed to measure a line of text,
+    loaded once from the font file and afterward computed arithmetically.
+
+    Advance widths and kerning values are in font design units, so the width
+    of a string is computed once and scaled linearly to any point size.
+    """
+
+    _cache = {}
+
+    def __init__(self, units_per_em, ascender, descender, glyph_ids,
+                 advance_widths, kerning_pairs):
+        self._units_per_em = float(units_per_em)
+        self._ascender = ascender
+        self._descender = descender
+        self._glyph_ids = glyph_ids
+        self._advance_widths = advance_widths
+        self._kerning_pairs = kerning_pairs
+        self._text_units = {}
+
+    @classmethod
+    def from_path(cls, font_file_path):
+        """
+        Return the |_GlyphMetrics| object for the font file at
+        *font_file_path*, loading it only on first use. Raises
+        |EnvironmentError|, |KeyError|, |ValueError|, or a struct error when
+        the file cannot be read or lacks the tables needed to measure text.
+        """
+        metrics = cls._cache.get(font_file_path)
+        if metrics is None:
+            with _Font.open(font_file_path) as f:
+                metrics = f.glyph_metrics
+            cls._cache[font_file_path] = metrics
+        return metrics
+
+    def line_height(self, point_size):
+        """
+        The height in points of a line of text in this font rendered at
+        *point_size*, from the top of the ascender to the bottom of the
+        descender.
+        """
+        units = self._ascender - self._descender
+        return units * point_size / self._units_per_em
+
+    def text_width(self, text, point_size, kerning=False):
+        """
+        The width in points of *text* rendered on a single line in this font
+        at *point_size*. The space between adjacent glyphs is adjusted by the
+        font's kerning pairs when *kerning* is |True|. PowerPoint only kerns
+        runs having the `kern` attribute set, so kerning is off by default.
+        """
+        key = (text, kerning)
+        units = self._text_units.get(key)
+        if units is None:
+            units = self._measure(text, kerning)
+            if len(self._text_units) >= 16384:
+                self._text_units.clear()
+            self._text_units[key] = units
+        return units * point_size / self._units_per_em
+
+    def _measure(self, text, kerning):
+        """
+        Return the width of *text* in font design units.
+        """
+        glyph_ids, advance_widths = self._glyph_ids, self._advance_widths
+        last_idx = len(advance_widths) - 1
+        gids = [glyph_ids.get(ord(c), 0) for c in text]
+        units = sum(advance_widths[min(gid, last_idx)] for gid in gids)
+        kerning_pairs = self._kerning_pairs
+        if kerning and kerning_pairs:
+            units += sum(
+                kerning_pairs.get(pair, 0) for pair in zip(gids, gids[1:])
+            )
+        return units
+
+
 class _Stream(object):
     """
     A thin wrapper around a file that facilitates reading C-struct values
@@ -275,6 +530,14 @@ class _HeadTable(_BaseTable):
         """
         return self._stream.read_fields('>4s4sLLHHqqhhhhHHHHH', self._offset)
 
+    @property
+    def units_per_em(self):
+        """
+        The number of font design units per em, the scale in which all other
+        glyph metrics in the font are expressed, e.g. 2048.
+        """
+        return self._fields[5]
+
     @property
     def _macStyle(self):
         """
@@ -283,6 +546,212 @@ class _HeadTable(_BaseTable):
         return self._fields[12]
 
 
+class _CmapTable(_BaseTable):
+    """
+    OpenType font table having the tag 'cmap' and mapping character codes
+    to the glyph ids used to look up glyph metrics.
+    """
+    def __init__(self, tag, stream, offset, length):
+        super(_CmapTable, self).__init__(tag, stream, offset, length)
+
+    # ---(platform_id, encoding_id) of Unicode subtables, most preferred
+    # ---first; a full-repertoire subtable is preferred to a BMP-only one
+    _preferred_encodings = (
+        (3, 10), (0, 6), (0, 4), (3, 1), (0, 3), (0, 2), (0, 1), (0, 0),
+        (3, 0),
+    )
+
+    @lazyproperty
+    def glyph_ids(self):
+        """
+        A dict mapping each character code point mapped by this font to its
+        glyph id. Raises |KeyError| if the font has no Unicode subtable in
+        a supported format.
+        """
+        bufr = self._table_bytes
+        subtable_offsets = self._subtable_offsets
+        for encoding in self._preferred_encodings:
+            offset = subtable_offsets.get(encoding)
+            if offset is None:
+                continue
+            format_ = unpack_from('>H', bufr, offset)[0]
+            if format_ == 4:
+                return self._read_format_4(bufr, offset)
+            if format_ == 12:
+                return self._read_format_12(bufr, offset)
+        raise KeyError('no supported Unicode cmap subtable')
+
+    @staticmethod
+    def _read_format_4(bufr, offset):
+        """
+        Return the code point to glyph id mapping in the format 4
+        (segment mapping to delta values) subtable at *offset* in *bufr*.
+        """
+        seg_count = unpack_from('>H', bufr, offset+6)[0] // 2
+        tmpl = '>%dH' % seg_count
+        ends_offset = offset + 14
+        starts_offset = ends_offset + seg_count*2 + 2
+        deltas_offset = starts_offset + seg_count*2
+        range_offsets_offset = deltas_offset + seg_count*2
+        ends = unpack_from(tmpl, bufr, ends_offset)
+        starts = unpack_from(tmpl, bufr, starts_offset)
+        deltas = unpack_from(tmpl, bufr, deltas_offset)
+        range_offsets = unpack_from(tmpl, bufr, range_offsets_offset)
+
+        glyph_ids = {}
+        for idx in range(seg_count):
+            start, end = starts[idx], min(ends[idx], 0xFFFE)
+            delta, range_offset = deltas[idx], range_offsets[idx]
+            if range_offset == 0:
+                for code in range(start, end+1):
+                    glyph_ids[code] = (code + delta) & 0xFFFF
+                continue
+            # ---idRangeOffset is relative to its own position in the table---
+            glyph_id_offset = range_offsets_offset + idx*2 + range_offset
+            count = end - start + 1
+            if count <= 0:
+                continue
+            gids = unpack_from('>%dH' % count, bufr, glyph_id_offset)
+            for code, gid in zip(range(start, end+1), gids):
+                if gid:
+                    glyph_ids[code] = (gid + delta) & 0xFFFF
+        return glyph_ids
+
+    @staticmethod
+    def _read_format_12(bufr, offset):
+        """
+        Return the code point to glyph id mapping in the format 12
+        (segmented coverage) subtable at *offset* in *bufr*.
+        """
+        group_count = unpack_from('>L', bufr, offset+12)[0]
+        glyph_ids = {}
+        for idx in range(group_count):
+            start, end, start_gid = unpack_from(
+                '>LLL', bufr, offset + 16 + idx*12
+            )
+            for code in range(start, end+1):
+                glyph_ids[code] = start_gid + code - start
+        return glyph_ids
+
+    @property
+    def _subtable_offsets(self):
+        """
+        A dict mapping the (platform_id, encoding_id) pair of each encoding
+        record in this table to the offset of its subtable.
+        """
+        bufr = self._table_bytes
+        count = unpack_from('>H', bufr, 2)[0]
+        offsets = {}
+        for idx in range(count):
+            platform_id, encoding_id, offset = unpack_from(
+                '>HHL', bufr, 4 + idx*8
+            )
+            offsets.setdefault((platform_id, encoding_id), offset)
+        return offsets
+
+    @lazyproperty
+    def _table_bytes(self):
+        """
+        The binary contents of this cmap table.
+        """
+        return self._stream.read(self._offset, self._length)
+
+
+class _HheaTable(_BaseTable):
+    """
+    OpenType font table having the tag 'hhea' and containing the header
+    information for the font's horizontal layout metrics.
+    """
+    def __init__(self, tag, stream, offset, length):
+        super(_HheaTable, self).__init__(tag, stream, offset, length)
+
+    @property
+    def ascender(self):
+        """
+        The distance from the baseline to the top of the tallest glyph, in
+        font design units.
+        """
+        return self._fields[1]
+
+    @property
+    def descender(self):
+        """
+        The distance from the baseline to the bottom of the lowest glyph, in
+        font design units. This value is negative.
+        """
+        return self._fields[2]
+
+    @property
+    def num_h_metrics(self):
+        """
+        The number of advance widths recorded in the 'hmtx' table.
+        """
+        return self._fields[16]
+
+    @lazyproperty
+    def _fields(self):
+        """
+        A 17-tuple containing the fields in this table.
+        """
+        return self._stream.read_fields('>4shhhH11hH', self._offset)
+
+
+class _HmtxTable(_BaseTable):
+    """
+    OpenType font table having the tag 'hmtx' and containing the advance
+    width of each glyph in the font.
+    """
+    def __init__(self, tag, stream, offset, length):
+        super(_HmtxTable, self).__init__(tag, stream, offset, length)
+
+    def advance_widths(self, count):
+        """
+        Return a tuple of the first *count* advance widths in this table,
+        indexed by glyph id. Glyphs past the end share the last width.
+        """
+        if count < 1:
+            raise ValueError('font has no horizontal metrics')
+        bufr = self._stream.read(self._offset, count*4)
+        return unpack_from('>' + 'Hxx'*count, bufr)
+
+
+class _KernTable(_BaseTable):
+    """
+    OpenType font table having the tag 'kern' and containing the kerning
+    value for pairs of glyphs.
+    """
+    def __init__(self, tag, stream, offset, length):
+        super(_KernTable, self).__init__(tag, stream, offset, length)
+
+    @lazyproperty
+    def pairs(self):
+        """
+        A dict mapping a (left_glyph_id, right_glyph_id) pair to the
+        adjustment in font design units to the space between the two glyphs
+        when they are adjacent. Only horizontal format 0 subtables of the
+        OpenType version of this table are read; kerning in any other form
+        is not reflected.
+        """
+        bufr = self._stream.read(self._offset, self._length)
+        version, subtable_count = unpack_from('>HH', bufr)
+        if version != 0:
+            return {}
+
+        pairs = {}
+        offset = 4
+        for _ in range(subtable_count):
+            length, coverage = unpack_from('>HH', bufr, offset+2)
+            # ---format 0 in high byte, horizontal kerning values only---
+            if coverage & 0xFF07 == 0x0001:
+                pair_count = unpack_from('>H', bufr, offset+6)[0]
+                values = unpack_from('>' + 'HHh'*pair_count, bufr, offset+14)
+                for idx in range(0, len(values), 3):
+                    left, right, value = values[idx:idx+3]
+                    pairs[(left, right)] = value
+            offset += length
+        return pairs
+
+
 class _NameTable(_BaseTable):
     """
     An OpenType font table having the tag 'name' and containing the
@@ -415,7 +884,11 @@ def _TableFactory(tag, stream, offset, length):
     *font_file* with content of *length* starting at *offset*.
     """
     TableClass = {
+        'cmap': _CmapTable,
         'head': _HeadTable,
+        'hhea': _HheaTable,
+        'hmtx': _HmtxTable,
+        'kern': _KernTable,
         'name': _NameTable,
     }.get(tag, _BaseTable)
     return TableClass(tag, stream, offset, length)
@@ -6,7 +6,18 @@ Objects related to layout of rendered text, such as TextFitter.
 
 from __future__ import absolute_import, print_function
 
-from PIL import ImageFont
+from struct import error as StructError
+
+from ..util import lazyproperty
+from .fonts import _GlyphMetrics
+
+
+_EMU_PER_PT = 12700
+
+# ---fewest unique jobs for which best_fit_font_sizes() uses a pool by
+# ---default. A batch smaller than this fits serially in well under the time
+# ---it takes to start the worker processes.
+_POOL_MIN_JOBS = 500
 
 
 class TextFitter(tuple):
@@ -28,6 +39,70 @@ class TextFitter(tuple):
         text_fitter = cls(line_source, extents, font_file)
         return text_fitter._best_fit_font_size(max_size)
 
+    @classmethod
+    def best_fit_font_sizes(cls, jobs, max_size, font_file, workers=None,
+                            use_threads=False):
+        """
+        Return a list containing the best-fit font size of each (text,
+        extents) pair in *jobs*, in the same order, as computed by
+        :meth:`best_fit_font_size`. The sizes are computed in a pool of
+        *workers* processes, or threads when *use_threads* is |True|. When
+        *workers* is 1 the sizes are computed serially in the calling
+        process. When it is |None|, the default, they are computed serially
+        unless there are at least 500 unique jobs and more than one CPU, in
+        which case a pool of one worker per CPU is used. Identical jobs are
+        only computed once.
+        """
+        unique_jobs = list(set(jobs))
+        args = [
+            (text, extents, max_size, font_file)
+            for text, extents in unique_jobs
+        ]
+        if workers is None:
+            workers = cls._default_workers(len(args))
+        if workers == 1 or len(args) < 2:
+            sizes = [_best_fit_font_size(arg) for arg in args]
+        else:
+            sizes = cls._pool_map(args, font_file, workers, use_threads)
+        size_by_job = dict(zip(unique_jobs, sizes))
+        return [size_by_job[job] for job in jobs]
+
+    @staticmethod
+    def _default_workers(job_count):
+        """
+        Return the number of workers to compute *job_count* unique jobs
+        with when none is specified; 1 when a pool isn't worth starting.
+        """
+        if job_count < _POOL_MIN_JOBS:
+            return 1
+        import multiprocessing
+        try:
+            return multiprocessing.cpu_count()
+        except NotImplementedError:
+            return 1
+
+    @staticmethod
+    def _pool_map(args, font_file, workers, use_threads):
+        """
+        Return the result of calling _best_fit_font_size() on each item in
+        *args*, computed in a pool of *workers* processes or threads.
+        """
+        import multiprocessing
+        from multiprocessing.pool import ThreadPool
+
+        # ---load glyph metrics before the pool starts, so threads share
+        # ---them and forked worker processes inherit them
+        _Fonts.metrics(font_file)
+
+        chunksize = max(1, len(args) // (workers * 4))
+        Pool = ThreadPool if use_threads else multiprocessing.Pool
+        pool = Pool(workers)
+        try:
+            return pool.map(_best_fit_font_size, args, chunksize)
+        finally:
+            pool.close()
+            pool.join()
+
     def _best_fit_font_size(self, max_size):
         """
         Return the largest whole-number point size less than or equal to
@@ -39,32 +114,6 @@ class TextFitter(tuple):
         )
         return sizes.find_max(predicate)
 
-    def _break_line(self, line_source, point_size):
-        """
-        Return a (line, remainder) pair where *line* is the longest line in
-        *line_source* that will fit in this fitter's width and *remainder* is
-        a |_LineSource| object containing the text following the break point.
-        """
-        lines = _BinarySearchTree.from_ordered_sequence(line_source)
-        predicate = self._fits_in_width_predicate(point_size)
-        return lines.find_max(predicate)
-
-    def _fits_in_width_predicate(self, point_size):
-        """
-        Return a function taking a text string value and returns |True| if
-        that text fits in this fitter when rendered at *point_size*. Used as
-        predicate for _break_line()
-        """
-        def predicate(line):
-            """
-            Return |True| if *line* fits in this fitter when rendered at
-            *point_size*.
-            """
-            cx = _rendered_size(line.text, point_size, self._font_file)[0]
-            return cx <= self._width
-
-        return predicate
-
     @property
     def _fits_inside_predicate(self):
         """
@@ -78,9 +127,10 @@ class TextFitter(tuple):
             entirely within *extents* when rendered at *point_size* using the
             font defined in *font_file*.
             """
-            text_lines = self._wrap_lines(self._line_source, point_size)
             cy = _rendered_size('Ty', point_size, self._font_file)[1]
-            return (cy * len(text_lines)) <= self._height
+            max_lines = self._height // cy
+            text_lines = self._wrap_lines(point_size, max_lines)
+            return text_lines is not None and len(text_lines) <= max_lines
 
         return predicate
 
@@ -96,20 +146,72 @@ class TextFitter(tuple):
     def _line_source(self):
         return self[0]
 
+    @lazyproperty
+    def _unit_widths(self):
+        """
+        A (prefix_widths, space_width) pair in EMU for the words in this
+        fitter's line source rendered at one point, or |None| when the glyph
+        metrics of the font can't be read. Item *n* of *prefix_widths* is the
+        width of the first *n* words, each followed by a space.
+        """
+        metrics = _Fonts.metrics(self._font_file)
+        if metrics is None:
+            return None
+        words = self._line_source.words
+        widths = [metrics.text_width(word, 1) * _EMU_PER_PT for word in words]
+        space_width = metrics.text_width(' ', 1) * _EMU_PER_PT
+        return _prefix_sums(widths, space_width), space_width
+
     @property
     def _width(self):
         return self[1]
 
-    def _wrap_lines(self, line_source, point_size):
-        """
-        Return a sequence of str values representing the text in
-        *line_source* wrapped within this fitter when rendered at
-        *point_size*.
-        """
-        text, remainder = self._break_line(line_source, point_size)
-        lines = [text]
-        if remainder:
-            lines.extend(self._wrap_lines(remainder, point_size))
+    def _word_widths(self, point_size):
+        """
+        Return a (prefix_widths, space_width, max_width) 3-tuple used to
+        measure a line of words at *point_size*. Glyph metrics scale
+        linearly, so the widths at one point are reused for every size and
+        *max_width* is scaled instead. Without glyph metrics, each word is
+        rendered at *point_size*.
+        """
+        unit_widths = self._unit_widths
+        if unit_widths is not None:
+            prefix_widths, space_width = unit_widths
+            return prefix_widths, space_width, float(self._width) / point_size
+
+        font_file = self._font_file
+        widths = [
+            _rendered_size(word, point_size, font_file)[0]
+            for word in self._line_source.words
+        ]
+        space_width = _rendered_size(' ', point_size, font_file)[0]
+        prefix_widths = _prefix_sums(widths, space_width)
+        return prefix_widths, space_width, self._width
+
+    def _wrap_lines(self, point_size, max_lines=None):
+        """
+        Return a list of str values representing the text in this fitter's
+        line source wrapped within its width when rendered at *point_size*,
+        or |None| if a single word is too wide to fit on a line. Wrapping
+        stops as soon as the line count exceeds *max_lines*, when specified.
+        """
+        words = self._line_source.words
+        prefix_widths, space_width, max_width = self._word_widths(point_size)
+        word_count = len(words)
+        lines = []
+        start = 0
+        while start < word_count:
+            base = prefix_widths[start] + space_width
+            if prefix_widths[start+1] - base > max_width:
+                return None
+            end = start + 1
+            while (end < word_count and
+                    prefix_widths[end+1] - base <= max_width):
+                end += 1
+            lines.append(' '.join(words[start:end]))
+            if max_lines is not None and len(lines) > max_lines:
+                break
+            start = end
         return lines
 
 
@@ -166,7 +268,7 @@ class _BinarySearchTree(object):
         A string representation of the tree rooted in this node, useful for
         debugging purposes.
         """
-        text = '%s%s\n' % (prefix, self.value.text)
+        text = '%s%s\n' % (prefix, self.value)
         prefix = '%s└── ' % ('    ' * level)
         if self._lesser:
             text += self._lesser.tree(level+1, prefix)
@@ -210,11 +312,10 @@ class _BinarySearchTree(object):
 
 class _LineSource(object):
     """
-    Generates all the possible even-word line breaks in a string of text,
-    each in the form of a (line, remainder) 2-tuple where *line* contains the
-    text before the break and *remainder* the text after as a |_LineSource|
-    object. Its boolean value is |True| when it contains text, |False| when
-    its text is the empty string or whitespace only.
+    The text to be wrapped into lines by a |TextFitter|, segmented once into
+    the words at which lines can be broken. Its boolean value is |True| when
+    it contains text, |False| when its text is the empty string or whitespace
+    only.
     """
     def __init__(self, text):
         self._text = text
@@ -229,19 +330,6 @@ class _LineSource(object):
     def __eq__(self, other):
         return self._text == other._text
 
-    def __iter__(self):
-        """
-        Generate a (text, remainder) pair for each possible even-word line
-        break in this line source, where *text* is a str value and remainder
-        is a |_LineSource| value.
-        """
-        words = self._text.split()
-        for idx in range(1, len(words)+1):
-            line_text = ' '.join(words[:idx])
-            remainder_text = ' '.join(words[idx:])
-            remainder = _LineSource(remainder_text)
-            yield _Line(line_text, remainder)
-
     def __nonzero__(self):
         """
         Gives this object boolean behaviors (in Python 2). bool(line_source)
@@ -252,65 +340,96 @@ class _LineSource(object):
     def __repr__(self):
         return "<_LineSource('%s')>" % self._text
 
-
-class _Line(tuple):
-    """
-    A candidate line broken at an even word boundary from a string of text,
-    and a |_LineSource| value containing the text that remains after the line
-    is broken at this spot.
-    """
-    def __new__(cls, text, remainder):
-        return tuple.__new__(cls, (text, remainder))
-
-    def __gt__(self, other):
-        return len(self.text) > len(other.text)
-
-    def __lt__(self, other):
-        return not self.__gt__(other)
-
-    def __len__(self):
-        return len(self.text)
-
-    def __repr__(self):
-        return "'%s' => '%s'" % (self.text, self.remainder)
-
-    @property
-    def remainder(self):
-        return self[1]
-
-    @property
-    def text(self):
-        return self[0]
+    @lazyproperty
+    def words(self):
+        """
+        A list of the whitespace-separated words in this line source, in
+        order. Each possible line is a run of consecutive words.
+        """
+        return self._text.split()
 
 
 class _Fonts(object):
     """
-    A memoizing cache for ImageFont objects.
+    A memoizing cache for ImageFont and |_GlyphMetrics| objects.
     """
     fonts = {}
+    glyph_metrics = {}
 
     @classmethod
     def font(cls, font_path, point_size):
+        # ---Pillow is only needed once text is actually measured---
+        from PIL import ImageFont
+
         if (font_path, point_size) not in cls.fonts:
             cls.fonts[(font_path, point_size)] = ImageFont.truetype(
                 font_path, point_size
             )
         return cls.fonts[(font_path, point_size)]
 
+    @classmethod
+    def metrics(cls, font_path):
+        """
+        Return the |_GlyphMetrics| object for the font file at *font_path*,
+        or |None| if the file can't be measured that way, e.g. a TrueType
+        collection or a font lacking a Unicode 'cmap' subtable.
+        """
+        if font_path not in cls.glyph_metrics:
+            try:
+                metrics = _GlyphMetrics.from_path(font_path)
+            except (EnvironmentError, KeyError, StructError, ValueError):
+                metrics = None
+            cls.glyph_metrics[font_path] = metrics
+        return cls.glyph_metrics[font_path]
+
 
 def _rendered_size(text, point_size, font_file):
     """
     Return a (width, height) pair representing the size of *text* in English
     Metric Units (EMU) when rendered at *point_size* in the font defined in
     *font_file*.
+
+    The size is computed from the font's glyph metrics, which are loaded once
+    per font file. Pillow is only used to render the text when those metrics
+    can't be read from *font_file*.
     """
     emu_per_inch = 914400
     px_per_inch = 72.0
 
-    font = _Fonts.font(font_file, point_size)
-    px_width, px_height = font.getsize(text)
+    metrics = _Fonts.metrics(font_file)
+    if metrics is not None:
+        px_width = metrics.text_width(text, point_size)
+        px_height = metrics.line_height(point_size)
+    else:
+        font = _Fonts.font(font_file, point_size)
+        px_width, px_height = font.getsize(text)
 
     emu_width = int(px_width / px_per_inch * emu_per_inch)
     emu_height = int(px_height / px_per_inch * emu_per_inch)
 
     return emu_width, emu_height
+
+
+def _best_fit_font_size(args):
+    """
+    Return the best-fit font size for the (text, extents, max_size,
+    font_file) 4-tuple *args*. Defined at module level so it can be sent to
+    a worker process.
+    """
+    text, extents, max_size, font_file = args
+    return TextFitter.best_fit_font_size(text, extents, max_size, font_file)
+
+
+def _prefix_sums(widths, space_width):
+    """
+    Return a list of running totals of *widths*, starting with zero, where
+    each width is followed by *space_width*. The width of the line formed by
+    words *start* up to *end* is then ``sums[end] - sums[start] -
+    space_width``.
+    """
+    sums = [0]
+    total = 0
+    for width in widths:
+        total += width + space_width
+        sums.append(total)
+    return sums
@@ -0,0 +1,148 @@
+# encoding: utf-8
+
+"""
+Objects related to finding and replacing text across the runs of a part,
+such as TextReplacer.
+"""
+
+from __future__ import absolute_import, print_function
+
+import re
+
+from bisect import bisect_right
+
+from ..oxml.ns import qn
+
+
+_A_R = qn('a:r')
+_A_T = qn('a:t')
+
+
+class TextReplacer(object):
+    """
+    Replaces each match of a compiled regular expression in the text of the
+    runs below an element. Adjacent runs in a paragraph are matched as one
+    string, so a match can span runs.
+    """
+    def __init__(self, pattern, replacement):
+        self._pattern = pattern
+        self._replacement = replacement
+
+    @classmethod
+    def new(cls, find, replace=None):
+        """
+        Return a |TextReplacer| object for *find* and *replace*. *find* is
+        either a mapping of each string to find to its replacement string,
+        a compiled regular expression, or a single string to find. When
+        *find* is a regular expression, *replace* can be a string, which is
+        expanded as by :func:`re.sub`, or a function taking the match object
+        and returning the replacement string. When *find* is a string,
+        *replace* is the literal replacement string.
+        """
+        if hasattr(find, 'items'):
+            return cls._from_mapping(find)
+        if hasattr(find, 'finditer'):
+            if replace is None:
+                raise TypeError('replace is required when find is a regex')
+            if callable(replace):
+                return cls(find, replace)
+            return cls(find, lambda match: match.expand(replace))
+        if not find:
+            raise ValueError('text to find must not be empty')
+        if replace is None:
+            raise TypeError('replace is required when find is a string')
+        return cls(re.compile(re.escape(find)), lambda match: replace)
+
+    def replace(self, element):
+        """
+        Replace each match in the text of the runs below *element* and
+        return the number of replacements made. The replacement text takes
+        the formatting of the run in which its match starts; the remaining
+        matched text is removed from the runs it spans.
+        """
+        search = self._pattern.search
+        count = 0
+        for ts in self._iter_run_groups(element):
+            texts = [t.text or '' for t in ts]
+            joined = ''.join(texts)
+            if search(joined) is None:
+                continue
+            new_texts, match_count = self._replace_in_group(joined, texts)
+            for t, text, new_text in zip(ts, texts, new_texts):
+                if new_text != text:
+                    # ---an emptied run serializes as `<a:t/>`---
+                    t.text = new_text or None
+            count += match_count
+        return count
+
+    @classmethod
+    def _from_mapping(cls, mapping):
+        """
+        Return a |TextReplacer| object matching any of the keys of *mapping*
+        with a single compiled alternation, longest key first so a key is
+        never preempted by one of its prefixes.
+        """
+        if not mapping:
+            return cls(re.compile('(?!)'), None)
+        if any(not key for key in mapping):
+            raise ValueError('text to find must not be empty')
+        keys = sorted(mapping, key=len, reverse=True)
+        pattern = re.compile('|'.join(re.escape(key) for key in keys))
+        return cls(pattern, lambda match: mapping[match.group(0)])
+
+    @staticmethod
+    def _iter_run_groups(element):
+        """
+        Generate a list of the `a:t` elements of each run of adjacent `a:r`
+        elements below *element*, in document order. A line break or field
+        between runs starts a new group, as do the boundaries of a
+        paragraph.
+        """
+        group, prior_r = [], None
+        for t in element.iter(_A_T):
+            r = t.getparent()
+            # ---a:t also appears in a:fld, whose text is generated---
+            if r.tag != _A_R:
+                continue
+            if prior_r is None or r.getprevious() is not prior_r:
+                if group:
+                    yield group
+                group = []
+            group.append(t)
+            prior_r = r
+        if group:
+            yield group
+
+    def _replace_in_group(self, joined, texts):
+        """
+        Return a (new_texts, count) pair where *new_texts* is a list of the
+        text of each run in *texts* after replacing each match in *joined*,
+        the text of those runs concatenated, and *count* is the number of
+        matches replaced.
+        """
+        starts, offset = [], 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text)
+        parts = [[] for _ in texts]
+
+        def copy(begin, end):
+            """Copy the text in *joined* from *begin* to *end* to its runs."""
+            idx = bisect_right(starts, begin) - 1
+            while begin < end:
+                run_end = starts[idx] + len(texts[idx])
+                if run_end > begin:
+                    parts[idx].append(joined[begin:min(end, run_end)])
+                    begin = run_end
+                idx += 1
+
+        count, pos = 0, 0
+        for match in self._pattern.finditer(joined):
+            begin, end = match.span()
+            copy(pos, begin)
+            idx = bisect_right(starts, begin) - 1
+            parts[idx].append(self._replacement(match))
+            pos = end
+            count += 1
+        copy(pos, len(joined))
+        return [''.join(p) for p in parts], count
@@ -6,15 +6,17 @@ Text-related objects such as TextFrame and Paragraph.
 
 from __future__ import absolute_import, print_function
 
-from ..compat import to_unicode
+import re
+
+from ..compat import is_string, to_unicode
+from ..dml.color import RGBColor
 from ..dml.fill import FillFormat
 from ..enum.dml import MSO_FILL
 from ..enum.lang import MSO_LANGUAGE_ID
 from ..enum.text import MSO_AUTO_SIZE, MSO_UNDERLINE
-from .fonts import FontFiles
-from .layout import TextFitter
 from ..opc.constants import RELATIONSHIP_TYPE as RT
 from ..oxml.simpletypes import ST_TextWrappingType
+from ..oxml.text import CT_TextCharacterProperties, CT_TextParagraph
 from ..shapes import Subshape
 from ..util import Centipoints, Emu, lazyproperty, Pt
 
@@ -74,7 +76,8 @@ class TextFrame(Subshape):
         metrics. If *font_file* is |None|, best efforts are made to locate
         a font file with matchhing *font_family*, *bold*, and *italic*
         installed on the current system (usually succeeds if the font is
-        installed).
+        installed). Raises |ValueError|, leaving the text frame unchanged,
+        if the text doesn't fit at 1 point.
         """
         # ---no-op when empty as fit behavior not defined for that case---
         if self.text == '':
@@ -83,6 +86,8 @@ class TextFrame(Subshape):
         font_size = self._best_fit_font_size(
             font_family, max_size, bold, italic, font_file
         )
+        if font_size is None:
+            raise ValueError('text does not fit at any size')
         self._apply_fit(font_family, font_size, bold, italic)
 
     @property
@@ -140,6 +145,40 @@ class TextFrame(Subshape):
         """
         return tuple([_Paragraph(p, self) for p in self._txBody.p_lst])
 
+    def set_rich_text(self, spec):
+        """Replace all text in this text frame with formatted paragraphs.
+
+        *spec* is a sequence with one item per paragraph. A paragraph is
+        either a markup string or a ``(level, runs)`` 2-tuple.
+
+        In a markup string, each leading tab character indents the paragraph
+        one level, text between ``**`` markers is bold, text between ``*``
+        markers is italic, and ``[text](url)`` is a hyperlink. A backslash
+        escapes one of the characters ``*[]\\``.
+
+        In a 2-tuple, *level* is the indent level from 0 to 8 and *runs* is
+        either a markup string, without leading tabs, or a sequence of runs.
+        A run is either a string of plain text or a ``(text, properties)``
+        2-tuple, where *properties* is a dict that can have the keys
+        ``'bold'``, ``'italic'``, ``'size'`` (a |Length| such as ``Pt(14)``),
+        ``'color'`` (an |RGBColor| or hex string such as ``'1F497D'``) and
+        ``'hyperlink'`` (a URL). For example::
+
+            text_frame.set_rich_text([
+                'Results for **Q3**',
+                '\\tSee [the report](https://example.com/q3)',
+                (1, [('Revenue ', {'bold': True}),
+                     ('up 12%', {'color': '00B050', 'size': Pt(14)})]),
+            ])
+
+        Each line feed character in text becomes a line break. The
+        paragraphs are generated as XML text and parsed in a single step,
+        which is much faster than adding paragraphs and runs one at a time
+        and setting their font properties.
+        """
+        p_xml = _RichTextWriter(self).p_xml(spec)
+        self._txBody.replace_p_xml(p_xml)
+
     @property
     def text(self):
         """
@@ -222,6 +261,11 @@ class TextFrame(Subshape):
         *italic*. If *font_file* is specified, it is used to calculate the
         fit, whether or not it matches *family*, *bold*, and *italic*.
         """
+        # ---font lookup and text measurement are only needed once text is
+        # ---actually fitted
+        from .fonts import FontFiles
+        from .layout import TextFitter
+
         if font_file is None:
             font_file = FontFiles.find(family, bold, italic)
         return TextFitter.best_fit_font_size(
@@ -686,3 +730,173 @@ class _Run(Subshape):
         Set the text of this run to *str*.
         """
         self._r.t.text = to_unicode(str)
+
+
+class _RichTextWriter(object):
+    """
+    Generates the paragraph XML for |TextFrame.set_rich_text|, producing the
+    run properties XML only once for each distinct set of properties.
+    """
+
+    _markup_tokens = re.compile(
+        r'\\([\\*\[\]])|(\*\*|\*)|\[([^\]]*)\]\(([^)]*)\)'
+    )
+    _property_names = frozenset(
+        ('bold', 'italic', 'size', 'color', 'hyperlink')
+    )
+
+    def __init__(self, parent):
+        self._parent = parent
+        self._rPr_xml_cache = {}
+
+    def p_xml(self, spec):
+        """
+        Return the XML text of the `a:p` elements for the paragraphs in
+        *spec*.
+        """
+        return ''.join(
+            self._paragraph_xml(paragraph) for paragraph in spec
+        )
+
+    def _paragraph_xml(self, paragraph):
+        """
+        Return the XML text of the `a:p` element for *paragraph*, a markup
+        string or a (level, runs) pair.
+        """
+        if is_string(paragraph):
+            paragraph = to_unicode(paragraph)
+            markup = paragraph.lstrip('\t')
+            level, runs = len(paragraph) - len(markup), self._parse(markup)
+        else:
+            level, runs = paragraph
+            if is_string(runs):
+                runs = self._parse(to_unicode(runs))
+        return CT_TextParagraph.rich_text_xml(
+            level, [self._run(run) for run in runs]
+        )
+
+    def _parse(self, markup):
+        """
+        Return a list of (text, properties) pairs for the runs in the
+        single-paragraph *markup* string.
+        """
+        runs, text, style = [], [], {'bold': False, 'italic': False}
+
+        def add_run(run_text, **properties):
+            if run_text:
+                properties.update((k, True) for k, v in style.items() if v)
+                runs.append((run_text, properties))
+
+        pos = 0
+        for match in self._markup_tokens.finditer(markup):
+            text.append(markup[pos:match.start()])
+            pos = match.end()
+            escaped, marker, link_text, url = match.groups()
+            if escaped is not None:
+                text.append(escaped)
+                continue
+            add_run(''.join(text))
+            text = []
+            if marker is not None:
+                name = 'bold' if marker == '**' else 'italic'
+                style[name] = not style[name]
+            else:
+                add_run(link_text, hyperlink=url)
+        text.append(markup[pos:])
+        add_run(''.join(text))
+        return runs
+
+    def _rPr_xml(self, properties):
+        """
+        Return the `a:rPr` XML text for the run *properties* dict, generated
+        only once for each distinct dict.
+        """
+        key = tuple(sorted(properties.items()))
+        rPr_xml = self._rPr_xml_cache.get(key)
+        if rPr_xml is not None:
+            return rPr_xml
+
+        unknown = set(properties) - self._property_names
+        if unknown:
+            raise ValueError(
+                'unsupported run properties: %s' % ', '.join(sorted(unknown))
+            )
+        size, color, url = (
+            properties.get('size'), properties.get('color'),
+            properties.get('hyperlink')
+        )
+        rPr_xml = CT_TextCharacterProperties.rPr_xml(
+            sz=None if size is None else Emu(size).centipoints,
+            b=properties.get('bold'), i=properties.get('italic'),
+            rgb=None if color is None else str(
+                RGBColor.from_string(color) if is_string(color) else color
+            ),
+            rId=None if url is None else self._parent.part.relate_to(
+                url, RT.HYPERLINK, is_external=True
+            ),
+        )
+        self._rPr_xml_cache[key] = rPr_xml
+        return rPr_xml
+
+    def _run(self, run):
+        """
+        Return the (text, rPr_xml) pair for *run*, a string or a (text,
+        properties) pair.
+        """
+        if is_string(run):
+            return to_unicode(run), ''
+        text, properties = run
+        return to_unicode(text), self._rPr_xml(properties)
+
+
+def fit_many(text_frames, font_family='Calibri', max_size=18, bold=False,
+             italic=False, font_file=None, workers=None, use_threads=False):
+    """
+    Fit the text of each text frame in *text_frames* entirely within the
+    bounds of its shape, with the same result as calling
+    :meth:`TextFrame.fit_text` on each in turn. Return a list containing the
+    font size applied to each text frame, |None| for a frame having no text.
+
+    The text and extents of each frame are read first, and the best-fit font
+    sizes are then computed before being applied to the frames here. The
+    sizes are computed in a pool of *workers* processes, or threads when
+    *use_threads* is |True|, or serially in this process when *workers* is
+    1. By default a pool is only used for a batch of at least 500 distinct
+    texts on a machine having more than one CPU. The font file is located
+    once for the whole batch.
+
+    Raises |ValueError| if the text of any frame doesn't fit at 1 point. No
+    frame is changed in that case.
+    """
+    text_frames = list(text_frames)
+    font_sizes = [None] * len(text_frames)
+
+    # ---no-op for empty frames as fit behavior not defined for that case---
+    fit_idxs, jobs = [], []
+    for idx, text_frame in enumerate(text_frames):
+        text = text_frame.text
+        if text == '':
+            continue
+        fit_idxs.append(idx)
+        jobs.append((text, text_frame._extents))
+    if not jobs:
+        return font_sizes
+
+    from .fonts import FontFiles
+    from .layout import TextFitter
+
+    if font_file is None:
+        font_file = FontFiles.find(font_family, bold, italic)
+    sizes = TextFitter.best_fit_font_sizes(
+        jobs, max_size, font_file, workers, use_threads
+    )
+
+    for idx, font_size in zip(fit_idxs, sizes):
+        if font_size is None:
+            raise ValueError(
+                'text of text frame %d does not fit at any size' % idx
+            )
+    for idx, font_size in zip(fit_idxs, sizes):
+        text_frames[idx]._apply_fit(font_family, font_size, bold, italic)
+        font_sizes[idx] = font_size
+    return font_sizes
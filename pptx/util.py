@@ -6,6 +6,57 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import threading
+
+from contextlib import contextmanager
+
+
+class Deferral(threading.local):
+    """
+    Per-thread record of work postponed while one or more nested
+    :meth:`deferring` blocks are open. *depth* is the number of blocks open
+    in the current thread. Items recorded inside a block are collected in
+    order and passed as a list to *flush* when the outermost block exits
+    normally. They are discarded when it exits by raising, so the exception
+    propagates unchanged rather than being replaced by one raised while
+    flushing.
+    """
+    depth = 0
+
+    def __init__(self, flush=None):
+        super(Deferral, self).__init__()
+        self._flush = flush
+        self._pending = []
+
+    @contextmanager
+    def deferring(self):
+        """
+        Context manager postponing the work recorded in the current thread
+        until the outermost ``with`` block exits.
+        """
+        self.depth += 1
+        completed = False
+        try:
+            yield
+            completed = True
+        finally:
+            self.depth -= 1
+            if not self.depth:
+                pending, self._pending = self._pending, []
+                if pending and completed:
+                    self._flush(pending)
+
+    def record(self, item):
+        """
+        Return |True| after adding *item* to the pending work when called
+        inside a :meth:`deferring` block in this thread. Otherwise return
+        |False|, meaning the caller should do the work right away.
+        """
+        if not self.depth:
+            return False
+        self._pending.append(item)
+        return True
+
 
 class Length(int):
     """
@@ -54,6 +54,20 @@ class DescribeCT_GraphicalObjectFrame(object):
         )
         assert graphicFrame.xml == expected_xml
 
+    def it_can_construct_a_new_text_table_graphicFrame(self):
+        graphicFrame = CT_GraphicalObjectFrame.new_text_table_graphicFrame(
+            42, 'foobar', [['baz']], 1, 2, 3, 4
+        )
+        assert graphicFrame.xml == xml(
+            'p:graphicFrame/(p:nvGraphicFramePr/(p:cNvPr{id=42,name=foobar},'
+            'p:cNvGraphicFramePr/a:graphicFrameLocks{noGrp=1},p:nvPr),p:xfrm'
+            '/(a:off{x=1,y=2},a:ext{cx=3,cy=4}),a:graphic/a:graphicData{uri='
+            '%s}/a:tbl/(a:tblPr{firstRow=1,bandRow=1}/a:tableStyleId"{5C2254'
+            '4A-7EE6-4342-B048-85BDC9FD1C3A}",a:tblGrid/a:gridCol{w=3},a:tr{'
+            'h=4}/a:tc/(a:txBody/(a:bodyPr,a:lstStyle,a:p/a:r/a:t"baz"),a:tc'
+            'Pr)))' % TABLE_URI
+        )
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
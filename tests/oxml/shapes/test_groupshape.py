@@ -8,9 +8,13 @@ from __future__ import (
 
 import pytest
 
+from lxml import etree
+
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
-from pptx.oxml.shapes.groupshape import CT_GroupShape
+from pptx.oxml.shapes.groupshape import CT_GroupShape, deferred_extents
 from pptx.oxml.shapes.picture import CT_Picture
 
 from ...unitutil.cxml import element, xml
@@ -37,14 +41,40 @@ class DescribeCT_GroupShape(object):
         )
         assert graphicFrame is graphicFrame_
 
+    def it_can_add_a_graphicFrame_element_containing_a_text_table(
+            self, spTree, CT_GraphicalObjectFrame_, insert_element_before_,
+            graphicFrame_):
+        texts = [['a', 'b']]
+
+        graphicFrame = spTree.add_text_table(42, 'name', texts, 5, 4, 3, 2)
+
+        new_text_table_graphicFrame_ = (
+            CT_GraphicalObjectFrame_.new_text_table_graphicFrame
+        )
+        new_text_table_graphicFrame_.assert_called_once_with(
+            42, 'name', texts, 5, 4, 3, 2, True
+        )
+        insert_element_before_.assert_called_once_with(
+            graphicFrame_, 'p:extLst'
+        )
+        assert graphicFrame is graphicFrame_
+
     def it_can_add_a_grpSp_element(self, add_grpSp_fixture):
         spTree, expected_grpSp_xml, expected_xml = add_grpSp_fixture
 
-        grpSp = spTree.add_grpSp()
+        grpSp = spTree.add_grpSp(1, 'Group 0')
 
         assert grpSp.xml == expected_grpSp_xml
         assert spTree.xml == expected_xml
 
+    def it_can_add_shapes_from_xml(self, add_from_xml_fixture):
+        spTree, shape_xmls, expected_xml = add_from_xml_fixture
+
+        shape_elms = spTree.add_shapes_from_xml(shape_xmls)
+
+        assert spTree.xml == expected_xml
+        assert shape_elms == list(spTree.iter_shape_elms())[-2:]
+
     def it_can_add_a_pic_element_representing_a_picture(self, add_pic_fixt):
         spTree, id_, name, desc, rId, x, y, cx, cy = add_pic_fixt[:9]
         CT_Picture_, insert_element_before_, pic_ = add_pic_fixt[9:]
@@ -99,6 +129,92 @@ class DescribeCT_GroupShape(object):
         x, y, cx, cy = xSp._child_extents
         assert (x, y, cx, cy) == expected_values
 
+    def it_knows_its_child_transform(self, child_transform_fixture):
+        grpSp, expected_value = child_transform_fixture
+        assert grpSp.child_transform == expected_value
+
+    def it_can_defer_recalculating_its_extents(self, defer_fixture):
+        spTree, expected_xml = defer_fixture
+        inner = spTree[0][1]
+        before_xml = spTree.xml
+
+        with deferred_extents():
+            inner.recalculate_extents()
+            with deferred_extents():
+                inner.recalculate_extents()
+            assert spTree.xml == before_xml
+
+        assert spTree.xml == expected_xml
+
+    def it_recalculates_each_deferred_group_once_innermost_first(
+            self, defer_fixture, _update_extents_):
+        spTree, _ = defer_fixture
+        outer, inner = spTree[0], spTree[0][1]
+
+        with deferred_extents():
+            inner.recalculate_extents()
+            outer.recalculate_extents()
+            inner.recalculate_extents()
+
+        assert _update_extents_.call_args_list == [call(inner), call(outer)]
+
+    def it_caches_its_shape_elements(self):
+        spTree = element('p:spTree/(p:nvGrpSpPr,p:sp,p:grpSpPr,p:pic)')
+        shape_elms = spTree.shape_elms
+        assert shape_elms == (spTree[1], spTree[3])
+        assert spTree.shape_elms is shape_elms
+
+    def it_caches_its_placeholder_elements(self):
+        spTree = element(
+            'p:spTree/(p:sp,p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},p:pic)'
+        )
+        ph_elms = spTree.ph_elms
+        assert ph_elms == (spTree[1],)
+        assert spTree.ph_elms is ph_elms
+
+    def it_can_find_a_placeholder_element(self, find_ph_fixture):
+        spTree, kwargs, expected_offset = find_ph_fixture
+        ph_elm = spTree.find_ph_elm(**kwargs)
+        expected_value = (
+            None if expected_offset is None else spTree[expected_offset]
+        )
+        assert ph_elm is expected_value
+
+    def it_finds_a_placeholder_whose_idx_was_changed(self):
+        spTree = element(
+            'p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{idx=1},p:sp/p:nvSpPr/p:nvPr'
+            '/p:ph{idx=2})'
+        )
+        assert spTree.find_ph_elm(idx=1) is spTree[0]
+
+        spTree[0].ph.idx, spTree[1].ph.idx = 2, 1
+
+        assert spTree.find_ph_elm(idx=1) is spTree[1]
+        assert spTree.find_ph_elm(idx=2) is spTree[0]
+
+    def it_discards_its_cached_elements_when_its_children_change(
+            self, mutate_fixture):
+        spTree, grpSp, mutate, expected_count = mutate_fixture
+        spTree.shape_elms, grpSp.shape_elms, spTree.ph_elms
+
+        mutate(spTree, grpSp)
+
+        assert spTree.shape_elms == tuple(spTree.iter_shape_elms())
+        assert len(spTree.shape_elms) == expected_count
+        assert grpSp.shape_elms == tuple(grpSp.iter_shape_elms())
+        assert spTree.ph_elms == tuple(spTree.iter_ph_elms())
+
+    def but_it_must_be_told_when_its_children_are_only_reordered(self):
+        spTree = element('p:spTree/(p:sp,p:pic,p:extLst)')
+        sp, pic = spTree.shape_elms
+        # ---same count and last child, bypassing the overrides---
+        etree.ElementBase.insert(spTree, 0, pic)
+        assert spTree.shape_elms == (sp, pic)
+
+        spTree.discard_cached_shape_elms()
+
+        assert spTree.shape_elms == (pic, sp)
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -111,6 +227,52 @@ class DescribeCT_GroupShape(object):
             insert_element_before_, sp_
         )
 
+    @pytest.fixture(params=[
+        (lambda spTree, grpSp: spTree.append(element('p:sp')),         4),
+        (lambda spTree, grpSp: spTree.insert(0, element('p:cxnSp')),   4),
+        (lambda spTree, grpSp: spTree.extend([element('p:pic')]),      4),
+        (lambda spTree, grpSp: spTree.remove(spTree[0]),               2),
+        (lambda spTree, grpSp: spTree.__delitem__(0),                  2),
+        (lambda spTree, grpSp: spTree.replace(spTree[0], grpSp[0]),    3),
+        (lambda spTree, grpSp: spTree.clear(),                         0),
+        (lambda spTree, grpSp: spTree[0].addnext(element('p:sp')),     4),
+        (lambda spTree, grpSp: spTree[0].addprevious(grpSp[0]),        4),
+        (lambda spTree, grpSp: grpSp.append(spTree[0]),                2),
+        (lambda spTree, grpSp: spTree.insert_element_before(
+            element('p:sp'), 'p:extLst'),                              4),
+        # ---lxml mutations not routed through a shape element---
+        (lambda spTree, grpSp: spTree[3].addprevious(element('p:sp')), 4),
+        (lambda spTree, grpSp: spTree[3].addnext(element('p:pic')),    4),
+        (lambda spTree, grpSp: etree.strip_elements(
+            spTree, qn('p:grpSp')),                                    2),
+        (lambda spTree, grpSp: etree.strip_elements(
+            spTree, qn('p:pic')),                                      3),
+    ])
+    def mutate_fixture(self, request):
+        mutate, expected_count = request.param
+        spTree = element(
+            'p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},p:grpSp/(p:sp,p'
+            ':pic),p:sp,p:extLst)'
+        )
+        grpSp = spTree[1]
+        return spTree, grpSp, mutate, expected_count
+
+    @pytest.fixture(params=[
+        ('p:spTree/p:sp{id=1}',
+         'p:spTree/(p:sp{id=1},p:sp{id=2},p:cxnSp{id=3})'),
+        ('p:spTree/(p:sp{id=1},p:extLst)',
+         'p:spTree/(p:sp{id=1},p:sp{id=2},p:cxnSp{id=3},p:extLst)'),
+    ])
+    def add_from_xml_fixture(self, request):
+        spTree_cxml, expected_cxml = request.param
+        spTree = element(spTree_cxml)
+        spTree.shape_elms
+        shape_xmls = [
+            '<p:sp %s id="2"/>' % nsdecls('p'),
+            '<p:cxnSp %s id="3"/>' % nsdecls('p'),
+        ]
+        return spTree, shape_xmls, xml(expected_cxml)
+
     @pytest.fixture
     def add_grpSp_fixture(self):
         spTree = element('p:spTree{a:b=c,r:s=t}')
@@ -194,6 +356,63 @@ class DescribeCT_GroupShape(object):
         xSp = element(xSp_cxml)
         return xSp, expected_values
 
+    @pytest.fixture(params=[
+        ('p:spTree/p:grpSpPr/a:xfrm/(a:off{x=5,y=5},a:ext{cx=9,cy=9},a:chOf'
+         'f{x=0,y=0},a:chExt{cx=3,cy=3})', (1.0, 1.0, 0, 0)),
+        ('p:spTree/p:grpSp/p:grpSpPr', (1.0, 1.0, 0, 0)),
+        ('p:spTree/p:grpSp/p:grpSpPr/a:xfrm/(a:off{x=100,y=200},a:ext{cx=50'
+         ',cy=60},a:chOff{x=100,y=200},a:chExt{cx=50,cy=60})',
+         (1.0, 1.0, 0.0, 0.0)),
+        ('p:spTree/p:grpSp/p:grpSpPr/a:xfrm/(a:off{x=100,y=200},a:ext{cx=50'
+         ',cy=60},a:chOff{x=10,y=20},a:chExt{cx=25,cy=120})',
+         (2.0, 0.5, 80.0, 190.0)),
+        ('p:spTree/p:grpSp/p:grpSpPr/a:xfrm/(a:off{x=100,y=200},a:ext{cx=50'
+         ',cy=60},a:chOff{x=10,y=20},a:chExt{cx=0,cy=0})',
+         (1.0, 1.0, 90.0, 180.0)),
+        ('p:spTree/p:grpSp/(p:grpSpPr/a:xfrm/(a:off{x=100,y=100},a:ext{cx=2'
+         '00,cy=200},a:chOff{x=0,y=0},a:chExt{cx=100,cy=100}),p:grpSp/p:grp'
+         'SpPr/a:xfrm/(a:off{x=10,y=10},a:ext{cx=10,cy=10},a:chOff{x=0,y=0}'
+         ',a:chExt{cx=20,cy=20}))', (1.0, 1.0, 120.0, 120.0)),
+    ])
+    def child_transform_fixture(self, request):
+        spTree_cxml, expected_value = request.param
+        spTree = element(spTree_cxml)
+        grpSps = spTree.xpath('//p:grpSp')
+        grpSp = grpSps[-1] if grpSps else spTree
+        return grpSp, expected_value
+
+    @pytest.fixture
+    def defer_fixture(self):
+        spTree = element(
+            'p:spTree/p:grpSp/(p:grpSpPr/a:xfrm,p:grpSp/(p:grpSpPr/a:xfrm,p:s'
+            'p/p:spPr/a:xfrm/(a:off{x=10,y=20},a:ext{cx=30,cy=40})))'
+        )
+        expected_xml = xml(
+            'p:spTree/p:grpSp/(p:grpSpPr/a:xfrm/(a:off{x=10,y=20},a:ext{cx=3'
+            '0,cy=40},a:chOff{x=10,y=20},a:chExt{cx=30,cy=40}),p:grpSp/(p:grp'
+            'SpPr/a:xfrm/(a:off{x=10,y=20},a:ext{cx=30,cy=40},a:chOff{x=10,y='
+            '20},a:chExt{cx=30,cy=40}),p:sp/p:spPr/a:xfrm/(a:off{x=10,y=20},a'
+            ':ext{cx=30,cy=40})))'
+        )
+        return spTree, expected_xml
+
+    @pytest.fixture(params=[
+        ({'idx': 0}, 0),
+        ({'idx': 1}, 1),
+        ({'idx': 3}, None),
+        ({'ph_type': PP_PLACEHOLDER.TITLE}, 0),
+        ({'ph_type': PP_PLACEHOLDER.BODY}, 1),
+        ({'ph_type': PP_PLACEHOLDER.DATE}, None),
+    ])
+    def find_ph_fixture(self, request):
+        kwargs, expected_offset = request.param
+        spTree = element(
+            'p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},p:sp/p:nvSpPr/p:'
+            'nvPr/p:ph{type=body,idx=1},p:sp,p:sp/p:nvSpPr/p:nvPr/p:ph{type=b'
+            'ody,idx=2})'
+        )
+        return spTree, kwargs, expected_offset
+
     @pytest.fixture(params=[
         ('p:spTree', None, [], 'p:spTree'),
         ('p:grpSp/p:grpSpPr/a:xfrm', (1, 2, 3, 4), [call()],
@@ -224,6 +443,9 @@ class DescribeCT_GroupShape(object):
         CT_GraphicalObjectFrame_.new_table_graphicFrame.return_value = (
             graphicFrame_
         )
+        CT_GraphicalObjectFrame_.new_text_table_graphicFrame.return_value = (
+            graphicFrame_
+        )
         return CT_GraphicalObjectFrame_
 
     @pytest.fixture
@@ -271,3 +493,9 @@ class DescribeCT_GroupShape(object):
     @pytest.fixture
     def spTree(self):
         return element('p:spTree')
+
+    @pytest.fixture
+    def _update_extents_(self, request):
+        return method_mock(
+            request, CT_GroupShape, '_update_extents', autospec=True
+        )
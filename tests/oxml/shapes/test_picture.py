@@ -33,7 +33,7 @@ class DescribeCT_Picture(object):
 
     @pytest.fixture
     def pic_fixture(self):
-        shape_id, name, desc, rId = 9, 'Diam. > 1 mm', 'desc', 'rId1'
+        shape_id, name, desc, rId = 9, 'Diam. > 1 mm', 'a & b.png', 'rId1'
         x, y, cx, cy = 1, 2, 3, 4
         expected_xml = (
             '<p:pic %s>\n  <p:nvPicPr>\n    <p:cNvPr id="%d" name="%s" descr'
@@ -44,8 +44,8 @@ class DescribeCT_Picture(object):
             ':xfrm>\n      <a:off x="%d" y="%d"/>\n      <a:ext cx="%d" cy="'
             '%d"/>\n    </a:xfrm>\n    <a:prstGeom prst="rect">\n      <a:av'
             'Lst/>\n    </a:prstGeom>\n  </p:spPr>\n</p:pic>\n' % (
-                nsdecls('a', 'p', 'r'), shape_id, 'Diam. &gt; 1 mm', desc,
-                rId, x, y, cx, cy
+                nsdecls('a', 'p', 'r'), shape_id, 'Diam. &gt; 1 mm',
+                'a &amp; b.png', rId, x, y, cx, cy
             )
         )
         return shape_id, name, desc, rId, x, y, cx, cy, expected_xml
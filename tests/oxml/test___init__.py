@@ -11,7 +11,8 @@ import pytest
 from lxml import etree
 
 from pptx.oxml import (
-    oxml_parser, parse_xml, register_element_cls
+    clone_prototype, escape_xml, oxml_parser, parse_from_template, parse_xml,
+    register_element_cls
 )
 from pptx.oxml.ns import qn
 from pptx.oxml.xmlchemy import BaseOxmlElement
@@ -19,6 +20,49 @@ from pptx.oxml.xmlchemy import BaseOxmlElement
 from ..unitutil.mock import function_mock, loose_mock, var_mock
 
 
+class DescribeClonePrototype(object):
+
+    def it_parses_the_xml_only_on_first_use(self, factory_fixture):
+        key, xml_factory, calls = factory_fixture
+        foo = clone_prototype(key, xml_factory)
+        foo_2 = clone_prototype(key, xml_factory)
+        assert calls == [key]
+        assert etree.tostring(foo) == etree.tostring(foo_2)
+
+    def it_returns_a_new_copy_each_time(self, factory_fixture):
+        key, xml_factory, _ = factory_fixture
+        foo = clone_prototype(key, xml_factory)
+        foo.remove(foo[0])
+        foo_2 = clone_prototype(key, xml_factory)
+        assert foo_2 is not foo
+        assert len(foo_2) == 1
+
+    def it_can_load_an_element_from_a_template_file(self):
+        notes = parse_from_template('notes')
+        notes_2 = parse_from_template('notes')
+        assert notes.tag == qn('p:notes')
+        assert notes_2 is not notes
+        assert etree.tostring(notes_2) == etree.tostring(notes)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def factory_fixture(self, request, xml_bytes):
+        key, calls = ('a:foo', request.node.name), []
+
+        def xml_factory():
+            calls.append(key)
+            return xml_bytes
+
+        return key, xml_factory, calls
+
+
+class DescribeEscapeXml(object):
+
+    def it_escapes_markup_characters(self):
+        assert escape_xml('a & <b> "c"') == 'a &amp; &lt;b&gt; &quot;c&quot;'
+
+
 class DescribeOxmlParser(object):
 
     def it_strips_whitespace_between_elements(self, foo, stripped_xml_bytes):
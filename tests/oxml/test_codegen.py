@@ -0,0 +1,83 @@
+# encoding: utf-8
+
+"""
+Test suite for the pptx.oxml.codegen module and the pre-generated custom
+element class members it writes.
+"""
+
+from __future__ import absolute_import, print_function
+
+import pytest
+
+from pptx.oxml import _accessors
+from pptx.oxml.codegen import stale_accessors_message
+from pptx.oxml.ns import qn
+from pptx.oxml.shapes.autoshape import CT_Shape
+from pptx.oxml.simpletypes import XsdString
+from pptx.oxml.xmlchemy import (
+    BaseOxmlElement, MetaOxmlElement, OptionalAttribute, ZeroOrOne
+)
+
+
+class DescribeGeneratedAccessors(object):
+
+    def it_is_up_to_date_with_the_element_class_declarations(self):
+        # ---the same check as `make accessors-check`---
+        message = stale_accessors_message()
+        assert message is None, message
+
+    def it_reports_a_stale_accessors_module(self, tmpdir):
+        path = tmpdir.join('_accessors.py')
+        path.write('members = {}\n')
+        assert 'is stale' in stale_accessors_message(str(path))
+
+    def it_provides_the_members_of_each_element_class(self):
+        for key, operations in _accessors.members.items():
+            module_name, cls_name = key.rsplit('.', 1)
+            module = __import__(module_name, fromlist=[cls_name])
+            element_cls = getattr(module, cls_name)
+            for operation in operations:
+                if operation[0] == 'set':
+                    name, value = operation[1:]
+                    assert element_cls.__dict__[name] is value
+
+    def it_generates_equivalent_child_accessors(self):
+        sp = CT_Shape.new_autoshape_sp(
+            42, 'Rectangle 41', 'rect', 1, 2, 3, 4
+        )
+        assert sp.nvSpPr is sp.find(qn('p:nvSpPr'))
+        assert sp.spPr.get_or_add_ln() is sp.spPr.ln
+        assert sp.spPr.prstGeom.getnext() is sp.spPr.ln
+        assert sp.txBody is sp.find(qn('p:txBody'))
+
+    def it_installs_the_entry_for_a_class_without_checking_it(
+            self, entry_fixture):
+        name, sentinel = entry_fixture
+
+        element_cls = MetaOxmlElement(name, (BaseOxmlElement,), {
+            '__module__': __name__,
+            'foo': ZeroOrOne('a:foo'),
+        })
+
+        assert element_cls.foo is sentinel
+        assert not hasattr(element_cls, 'get_or_add_foo')
+
+    def but_the_metaclass_populates_a_class_without_an_entry(self):
+        element_cls = MetaOxmlElement('CT_Unlisted', (BaseOxmlElement,), {
+            '__module__': __name__,
+            'foo': ZeroOrOne('a:foo'),
+            'bar': OptionalAttribute('bar', XsdString),
+        })
+
+        assert element_cls.foo.fget.__module__ == 'pptx.oxml.xmlchemy'
+        assert hasattr(element_cls, 'get_or_add_foo')
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def entry_fixture(self, request):
+        name, sentinel = 'CT_ListedFoo', object()
+        key = '%s.%s' % (__name__, name)
+        _accessors.members[key] = (('set', 'foo', sentinel),)
+        request.addfinalizer(lambda: _accessors.members.pop(key))
+        return name, sentinel
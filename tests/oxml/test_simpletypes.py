@@ -12,7 +12,8 @@ from __future__ import absolute_import, print_function
 import pytest
 
 from pptx.oxml.simpletypes import (
-    BaseIntType, BaseSimpleType, ST_Coordinate, ST_HexColorRGB, ST_Percentage
+    BaseIntType, BaseSimpleType, fast_writes, ST_Coordinate, ST_HexColorRGB,
+    ST_Percentage
 )
 
 from ..unitutil.mock import method_mock, instance_mock
@@ -250,6 +251,32 @@ class DescribeST_Percentage(object):
         return str_value, expected_value
 
 
+class DescribeFastWrites(object):
+
+    def it_skips_validation_inside_the_block(self):
+        with fast_writes():
+            str_value = ST_Percentage.to_xml(99999.0)
+        assert str_value == '9999900000'
+
+    def it_restores_validation_when_the_block_exits(self):
+        with fast_writes():
+            pass
+        with pytest.raises(ValueError):
+            ST_Percentage.to_xml(99999.0)
+
+    def it_can_validate_the_written_values_afterward(self):
+        with pytest.raises(ValueError):
+            with fast_writes(validate_after=True):
+                ST_Percentage.to_xml(0.5)
+                ST_Percentage.to_xml(99999.0)
+
+    def and_it_defers_nested_block_values_to_the_outer_check(self):
+        with pytest.raises(TypeError):
+            with fast_writes(validate_after=True):
+                with fast_writes():
+                    ST_Coordinate.to_xml('42')
+
+
 # --------------------------------------------------------------------
 # static fixture
 # --------------------------------------------------------------------
@@ -8,10 +8,14 @@ from __future__ import (
 
 import pytest
 
-from pptx.oxml.ns import nsdecls
+from copy import deepcopy
+
+from lxml import etree
+
+from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.table import CT_Table, TcRange
 
-from ..unitutil.cxml import element
+from ..unitutil.cxml import element, xml
 
 
 class DescribeCT_Table(object):
@@ -45,6 +49,20 @@ class DescribeCT_Table(object):
         tbl = CT_Table.new_tbl(2, 3, 334, 445)
         assert tbl.xml == expected_xml
 
+    def it_can_create_a_new_tbl_element_tree_from_texts(self):
+        tbl = CT_Table.new_tbl_from_texts(
+            [['a', 'b & c'], ['d\ne', '']], 334, 445, first_row=False
+        )
+        assert tbl.xml == xml(
+            'a:tbl/(a:tblPr{bandRow=1}/a:tableStyleId"{5C22544A-7EE6-4342-B04'
+            '8-85BDC9FD1C3A}",a:tblGrid/(a:gridCol{w=167},a:gridCol{w=167}),a'
+            ':tr{h=222}/(a:tc/(a:txBody/(a:bodyPr,a:lstStyle,a:p/a:r/a:t"a"),'
+            'a:tcPr),a:tc/(a:txBody/(a:bodyPr,a:lstStyle,a:p/a:r/a:t"b &amp; '
+            'c"),a:tcPr)),a:tr{h=223}/(a:tc/(a:txBody/(a:bodyPr,a:lstStyle,a:'
+            'p/(a:r/a:t"d",a:br,a:r/a:t"e")),a:tcPr),a:tc/(a:txBody/(a:bodyPr'
+            ',a:lstStyle,a:p),a:tcPr)))'
+        )
+
     def it_provides_access_to_its_tc_elements(self):
         tbl_cxml = 'a:tbl/(a:tr/(a:tc,a:tc),a:tr/(a:tc,a:tc))'
         tbl = element(tbl_cxml)
@@ -55,6 +73,84 @@ class DescribeCT_Table(object):
         assert tbl.tc(1, 0) is tcs[2]
         assert tbl.tc(1, 1) is tcs[3]
 
+    def it_knows_the_position_of_each_of_its_cells(self):
+        tbl = element('a:tbl/(a:tr/(a:tc,a:tc),a:tr/(a:tc,a:tc))')
+        trs = tbl.xpath('a:tr')
+        tcs = tbl.xpath('.//a:tc')
+
+        assert [tr.row_idx for tr in trs] == [0, 1]
+        assert [(tc.row_idx, tc.col_idx) for tc in tcs] == [
+            (0, 0), (0, 1), (1, 0), (1, 1)
+        ]
+        assert list(tbl.iter_tcs()) == tcs
+
+    def it_caches_its_cell_grid(self):
+        tbl = element('a:tbl/a:tr/(a:tc,a:tc)')
+        assert tbl.tc_grid is tbl.tc_grid
+
+    def it_discards_its_cell_grid_on_structural_change(self, change_fixture):
+        tbl, change, expected_cxml = change_fixture
+        tbl.tc_grid
+
+        change(tbl)
+
+        expected_tbl = element(expected_cxml)
+        assert tbl.tc_grid.rows == tuple(
+            tuple(tr.tc_lst) for tr in tbl.tr_lst
+        )
+        assert [
+            [(tc.row_idx, tc.col_idx) for tc in tr.tc_lst]
+            for tr in tbl.tr_lst
+        ] == [
+            [(r, c) for c, _ in enumerate(tr.tc_lst)]
+            for r, tr in enumerate(expected_tbl.tr_lst)
+        ]
+
+    def it_rebuilds_its_cell_grid_after_a_row_change_using_lxml(
+            self, lxml_change_fixture):
+        tbl, change, expected_rows = lxml_change_fixture
+        tbl.tc_grid
+
+        change(tbl)
+
+        assert tbl.tc_grid.rows == tuple(
+            tuple(tr.tc_lst) for tr in tbl.tr_lst
+        )
+        assert [len(tcs) for tcs in tbl.tc_grid.rows] == expected_rows
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        (lambda tbl: tbl.add_tr(42).add_tc(),
+         'a:tbl/(a:tr/(a:tc,a:tc),a:tr/a:tc)'),
+        (lambda tbl: tbl.tr_lst[0].add_tc(),
+         'a:tbl/a:tr/(a:tc,a:tc,a:tc)'),
+        (lambda tbl: tbl.tr_lst[0].remove(tbl.tc(0, 0)),
+         'a:tbl/a:tr/a:tc'),
+        (lambda tbl: tbl.tc(0, 1).addnext(element('a:tc')),
+         'a:tbl/a:tr/(a:tc,a:tc,a:tc)'),
+        (lambda tbl: tbl.tr_lst[0].addprevious(element('a:tr/a:tc')),
+         'a:tbl/(a:tr/a:tc,a:tr/(a:tc,a:tc))'),
+        (lambda tbl: tbl.remove(tbl.tr_lst[0]),
+         'a:tbl'),
+    ])
+    def change_fixture(self, request):
+        change, expected_cxml = request.param
+        tbl = element('a:tbl/a:tr/(a:tc,a:tc)')
+        return tbl, change, expected_cxml
+
+    @pytest.fixture(params=[
+        (lambda tbl: etree.strip_elements(tbl, qn('a:tr')), []),
+        (lambda tbl: etree.SubElement(tbl, qn('a:tr')), [2, 1, 0]),
+        (lambda tbl: etree.ElementBase.append(tbl, deepcopy(tbl[0])),
+         [2, 1, 2]),
+        (lambda tbl: etree.ElementBase.remove(tbl, tbl[1]), [2]),
+    ])
+    def lxml_change_fixture(self, request):
+        change, expected_rows = request.param
+        tbl = element('a:tbl/(a:tr/(a:tc,a:tc),a:tr/a:tc)')
+        return tbl, change, expected_rows
+
 
 class DescribeTcRange(object):
 
@@ -16,12 +16,51 @@ from pptx.oxml.ns import qn
 from pptx.oxml.simpletypes import BaseIntType
 from pptx.oxml.xmlchemy import (
     BaseOxmlElement, Choice, OneAndOnlyOne, OneOrMore, OptionalAttribute,
-    RequiredAttribute, ZeroOrMore, ZeroOrOne, ZeroOrOneChoice
+    RequiredAttribute, XPathCache, ZeroOrMore, ZeroOrOne, ZeroOrOneChoice
 )
 
 from ..unitdata import BaseBuilder
 
 
+class DescribeBaseOxmlElement(object):
+
+    def it_inserts_a_child_before_its_first_successor(self, insert_fixture):
+        parent, tagnames, expected_idx = insert_fixture
+        oomChild = an_oomChild().with_nsdecls().element
+
+        parent.insert_element_before(oomChild, *tagnames)
+
+        assert parent.index(oomChild) == expected_idx
+
+    def it_can_evaluate_a_parameterized_xpath_expression(self):
+        parent = (
+            a_parent().with_nsdecls().with_child(
+                a_zomChild()).with_child(
+                a_zooChild())
+        ).element
+
+        matches = parent.xpath('./*[local-name() = $name]', name='zooChild')
+
+        assert matches == [parent[1]]
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        (('p:oooChild', 'p:zooChild', 'p:zomChild'), 0),
+        (('p:zooChild',),                            1),
+        (('p:oooChild',),                            2),
+        ((),                                         2),
+    ])
+    def insert_fixture(self, request):
+        tagnames, expected_idx = request.param
+        parent = (
+            a_parent().with_nsdecls().with_child(
+                a_zomChild()).with_child(
+                a_zooChild())
+        ).element
+        return parent, tagnames, expected_idx
+
+
 class DescribeCustomElementClass(object):
 
     def it_has_the_MetaOxmlElement_metaclass(self):
@@ -308,6 +347,34 @@ class DescribeRequiredAttribute(object):
         return parent, value, expected_xml
 
 
+class DescribeXPathCache(object):
+
+    def it_compiles_each_expression_only_once(self):
+        cache = XPathCache()
+
+        first = cache.compiled('./p:zooChild')
+        second = cache.compiled('./p:zooChild')
+
+        assert second is first
+        assert (cache.hits, cache.misses, cache.currsize) == (1, 1, 1)
+
+    def it_starts_over_when_it_reaches_its_maximum_size(self):
+        cache = XPathCache(maxsize=2)
+        for expr in ('./p:a', './p:b', './p:c'):
+            cache.compiled(expr)
+        assert cache.currsize == 1
+        assert cache.misses == 3
+
+    def it_can_be_cleared(self):
+        cache = XPathCache()
+        cache.compiled('./p:a')
+        cache.compiled('./p:a')
+
+        cache.clear()
+
+        assert (cache.hits, cache.misses, cache.currsize) == (0, 0, 0)
+
+
 class DescribeZeroOrMore(object):
 
     def it_adds_a_getter_property_for_the_child_element_list(
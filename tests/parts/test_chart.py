@@ -93,7 +93,7 @@ class DescribeChartPart(object):
     @pytest.fixture
     def Chart_(self, request, chart_):
         return class_mock(
-            request, 'pptx.parts.chart.Chart', return_value=chart_
+            request, 'pptx.chart.chart.Chart', return_value=chart_
         )
 
     @pytest.fixture
@@ -25,7 +25,7 @@ from pptx.parts.media import MediaPart
 from pptx.parts.presentation import PresentationPart
 from pptx.parts.slide import (
     BaseSlidePart, NotesMasterPart, NotesSlidePart, SlideLayoutPart,
-    SlideMasterPart, SlidePart
+    SlideMasterPart, SlidePart, _ShapeNameIndex
 )
 from pptx.slide import (
     NotesMaster, NotesSlide, Slide, SlideLayout, SlideMaster
@@ -61,6 +61,67 @@ class DescribeBaseSlidePart(object):
         assert image_part is image_part_
         assert rId is rId_
 
+    def it_allocates_unique_shape_ids(self, next_id_fixture):
+        base_slide, expected_value = next_id_fixture
+        assert base_slide.next_shape_id() == expected_value
+        assert base_slide.next_shape_id() == expected_value + 1
+
+    def it_notices_shapes_added_using_lxml(self):
+        sld = element(
+            'p:sld/p:cSld/p:spTree/(p:sp/p:nvSpPr/p:cNvPr{id=5},p:extLst)'
+        )
+        spTree = sld.cSld.spTree
+        base_slide = BaseSlidePart(None, None, sld, None)
+
+        id_ = base_slide.next_shape_id()
+        spTree.insert_element_before(
+            element('p:sp/p:nvSpPr/p:cNvPr{id=%d}' % id_), 'p:extLst'
+        )
+        spTree.insert_element_before(
+            element('p:sp/p:nvSpPr/p:cNvPr{id=9}'), 'p:extLst'
+        )
+
+        assert id_ == 6
+        assert base_slide.next_shape_id() == 10
+
+    def it_can_find_a_unique_shape_name(self):
+        sld = element(
+            'p:sld/p:cSld/p:spTree/(p:cNvPr{name=Title 1},p:cNvPr{name=Title'
+            ' 2},p:cNvPr{name=Title 4})'
+        )
+        base_slide = BaseSlidePart(None, None, sld, None)
+
+        names = [
+            base_slide.unique_shape_name('Title', 1),
+            base_slide.unique_shape_name('Title', 1),
+            base_slide.unique_shape_name('Title', 0),
+            base_slide.unique_shape_name('Subtitle', 1),
+        ]
+
+        assert names == ['Title 3', 'Title 5', 'Title 0', 'Subtitle 1']
+
+    def it_notices_shape_names_added_using_lxml(self):
+        sld = element(
+            'p:sld/p:cSld/p:spTree/p:sp/p:nvSpPr/p:cNvPr{id=2,name=Oval 1}'
+        )
+        base_slide = BaseSlidePart(None, None, sld, None)
+        assert base_slide.unique_shape_name('Oval', 1) == 'Oval 2'
+
+        sld.cSld.spTree.append(
+            element('p:sp/p:nvSpPr/p:cNvPr{id=3,name=Oval 3}')
+        )
+
+        assert base_slide.unique_shape_name('Oval', 3) == 'Oval 4'
+
+    def it_notices_shape_names_assigned_after_indexing(self):
+        sld = element('p:sld/p:cSld/p:spTree')
+        base_slide = BaseSlidePart(None, None, sld, None)
+        assert base_slide.unique_shape_name('Oval', 1) == 'Oval 1'
+
+        base_slide.notify_shape_renamed('Oval 2')
+
+        assert base_slide.unique_shape_name('Oval', 1) == 'Oval 3'
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -80,6 +141,23 @@ class DescribeBaseSlidePart(object):
         relate_to_.return_value = rId
         return slide, image_file, image_part_, rId
 
+    @pytest.fixture(params=[
+        ('p:spTree/p:nvSpPr',                                 1),
+        ('p:spTree/p:nvSpPr/p:cNvPr{id=0}',                   1),
+        ('p:spTree/p:nvSpPr/p:cNvPr{id=1}',                   2),
+        ('p:spTree/p:nvSpPr/p:cNvPr{id=2}',                   3),
+        ('p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=3})',   4),
+        ('p:spTree/p:nvSpPr/(p:cNvPr{id=foo},p:cNvPr{id=2})', 3),
+        ('p:spTree/p:nvSpPr/(p:cNvPr{id=1fo},p:cNvPr{id=2})', 3),
+        ('p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=1},p:'
+         'cNvPr{id=1},p:cNvPr{id=4})',                        5),
+    ])
+    def next_id_fixture(self, request):
+        spTree_cxml, expected_value = request.param
+        sld = element('p:sld/p:cSld/%s' % spTree_cxml)
+        base_slide = BaseSlidePart(None, None, sld, None)
+        return base_slide, expected_value
+
     @pytest.fixture
     def name_fixture(self):
         sld_cxml, expected_value = 'p:sld/p:cSld{name=Foobar}', 'Foobar'
@@ -114,6 +192,36 @@ class DescribeBaseSlidePart(object):
         return property_mock(request, BaseSlidePart, 'related_parts')
 
 
+class Describe_ShapeNameIndex(object):
+
+    def it_finds_the_first_unused_name_at_or_above_numpart(
+            self, unique_name_fixture):
+        names, basename, numpart, expected_value = unique_name_fixture
+        shape_names = _ShapeNameIndex(names)
+        assert shape_names.unique_name(basename, numpart) == expected_value
+
+    def it_remembers_the_names_it_hands_out(self):
+        shape_names = _ShapeNameIndex(['Oval 2', 'Oval 3'])
+        names = [shape_names.unique_name('Oval', 2) for _ in range(3)]
+        assert names == ['Oval 4', 'Oval 5', 'Oval 6']
+        assert shape_names.unique_name('Oval', 1) == 'Oval 1'
+        assert shape_names.unique_name('Oval', 3) == 'Oval 7'
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ((),                        'Title', 1, 'Title 1'),
+        (('Title 1',),              'Title', 1, 'Title 2'),
+        (('Title 1',),              'Title', 2, 'Title 2'),
+        (('Title 1', 'Title 2'),    'Title', 1, 'Title 3'),
+        (('Title 1', 'Title 3'),    'Title', 1, 'Title 2'),
+        (('Vertical Title 1',),     'Title', 1, 'Title 1'),
+    ])
+    def unique_name_fixture(self, request):
+        names, basename, numpart, expected_value = request.param
+        return names, basename, numpart, expected_value
+
+
 class DescribeNotesMasterPart(object):
 
     def it_can_create_a_notes_master_part(self, create_fixture):
@@ -16,6 +16,7 @@ from pptx.oxml.shapes.autoshape import CT_PresetGeometry2D, CT_Shape
 from pptx.shapes.autoshape import (
     Adjustment, AdjustmentCollection, AutoShapeType, Shape
 )
+from pptx.shared import cached_proxies
 from pptx.text.text import TextFrame
 
 from ..oxml.unitdata.shape import (
@@ -375,6 +376,14 @@ class DescribeShape(object):
         TextFrame_.assert_called_once_with(txBody, shape)
         assert text_frame is text_frame_
 
+    def it_can_return_the_same_text_frame_each_time(self):
+        shape = Shape(element('p:sp/p:txBody'), None)
+        assert shape.text_frame is not shape.text_frame
+        with cached_proxies():
+            text_frame = shape.text_frame
+            assert shape.text_frame is text_frame
+            assert text_frame._parent is shape
+
     def it_creates_a_txBody_if_needed(self, txBody_fixture):
         shape, expected_xml = txBody_fixture
         text_frame = shape.text_frame
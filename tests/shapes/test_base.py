@@ -13,6 +13,7 @@ from pptx.dml.effect import ShadowFormat
 from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.oxml.shapes.shared import BaseShapeElement
 from pptx.oxml.text import CT_TextBody
+from pptx.parts.slide import BaseSlidePart
 from pptx.shapes import Subshape
 from pptx.shapes.autoshape import Shape
 from pptx.shapes.base import BaseShape, _PlaceholderFormat
@@ -47,9 +48,10 @@ class DescribeBaseShape(object):
         assert shape.name == name
 
     def it_can_change_its_name(self, name_set_fixture):
-        shape, new_value, expected_xml = name_set_fixture
+        shape, new_value, expected_xml, part_ = name_set_fixture
         shape.name = new_value
         assert shape._element.xml == expected_xml
+        part_.notify_shape_renamed.assert_called_once_with(new_value)
 
     def it_has_a_position(self, position_get_fixture):
         shape, expected_left, expected_top = position_get_fixture
@@ -209,11 +211,12 @@ class DescribeBaseShape(object):
         ('p:pic/p:nvPicPr/p:cNvPr{id=5,name=far}',     Picture,   'Shape5',
          'p:pic/p:nvPicPr/p:cNvPr{id=5,name=Shape5}'),
     ])
-    def name_set_fixture(self, request):
+    def name_set_fixture(self, request, shapes_):
         xSp_cxml, ShapeCls, new_value, expected_xSp_cxml = request.param
-        shape = ShapeCls(element(xSp_cxml), None)
+        shapes_.part = part_ = instance_mock(request, BaseSlidePart)
+        shape = ShapeCls(element(xSp_cxml), shapes_)
         expected_xml = xml(expected_xSp_cxml)
-        return shape, new_value, expected_xml
+        return shape, new_value, expected_xml, part_
 
     @pytest.fixture
     def part_fixture(self, shapes_):
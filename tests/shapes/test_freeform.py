@@ -8,11 +8,17 @@ from __future__ import (
 
 import pytest
 
+from array import array
+
 from pptx.shapes.autoshape import Shape
 from pptx.shapes.freeform import (
-    _BaseDrawingOperation, _Close, FreeformBuilder, _LineSegment, _MoveTo
+    _BaseDrawingOperation, _Close, FreeformBuilder, _LineSegment, _MoveTo,
+    _Polyline
 )
+from pptx.oxml.ns import qn
+from pptx.parts.slide import SlidePart
 from pptx.shapes.shapetree import SlideShapes
+from pptx.slide import Slide
 
 from ..unitutil.cxml import element, xml
 from ..unitutil.file import snippet_seq
@@ -21,6 +27,27 @@ from ..unitutil.mock import (
 )
 
 
+class _ArrayOfPairs(object):
+    """Minimal stand-in for a NumPy array of shape (n, 2)."""
+
+    ndim = 2
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def __getitem__(self, key):
+        _, col = key
+        return _ArrayOfPairs([row[col] for row in self._rows])
+
+    def round(self):
+        return _ArrayOfPairs(
+            [tuple(float(round(v)) for v in row) for row in self._rows]
+        )
+
+    def tolist(self):
+        return list(self._rows)
+
+
 class DescribeFreeformBuilder(object):
 
     def it_provides_a_constructor(self, new_fixture):
@@ -45,6 +72,41 @@ class DescribeFreeformBuilder(object):
         assert builder._add_close.call_args_list == close_calls
         assert return_value is builder
 
+    def it_can_add_a_polyline(self, add_polyline_fixture):
+        builder, vertices, close, _Polyline_new_, polyline_ = (
+            add_polyline_fixture[:5]
+        )
+        expected_ops, close_calls = add_polyline_fixture[5:]
+
+        return_value = builder.add_polyline(vertices, close)
+
+        _Polyline_new_.assert_called_once_with(builder, vertices)
+        assert builder._drawing_operations == expected_ops
+        assert builder._add_close.call_args_list == close_calls
+        assert return_value is builder
+
+    def it_can_build_a_shape_from_a_polyline(self):
+        sld = element('p:sld/p:cSld/p:spTree')
+        spTree = sld.cSld.spTree
+        shapes = SlideShapes(spTree, Slide(sld, SlidePart(None, None, sld)))
+        builder = FreeformBuilder(shapes, 10, 20, 1.0, 2.0)
+        builder.add_polyline(((30, 40), (10.4, 60.6)))
+        builder.move_to(0, 0).add_polyline([(5, 5)], close=False)
+
+        shape = builder.convert_to_shape()
+
+        assert (shape.left, shape.top, shape.width, shape.height) == (
+            0, 0, 30, 122
+        )
+        path = spTree.xpath('//a:path')[0]
+        assert (path.w, path.h) == (30, 61)
+        assert [child.tag for child in path] == [
+            qn('a:moveTo'), qn('a:lnTo'), qn('a:lnTo'), qn('a:close'),
+            qn('a:moveTo'), qn('a:lnTo'),
+        ]
+        assert path.xpath('.//a:pt/@x') == ['10', '30', '10', '0', '5']
+        assert path.xpath('.//a:pt/@y') == ['20', '40', '61', '0', '5']
+
     def it_can_move_the_pen_location(self, move_to_fixture):
         builder, x, y, _MoveTo_new_, move_to_ = move_to_fixture
 
@@ -163,6 +225,23 @@ class DescribeFreeformBuilder(object):
         builder = FreeformBuilder(None, None, None, None, None)
         return builder, x, y, _LineSegment_new_, line_segment_
 
+    @pytest.fixture(params=[
+        (True,  (1, 2),  [call()]),
+        (False, (1, 2),  []),
+        (True,  (),      [call()]),
+    ])
+    def add_polyline_fixture(self, request, _Polyline_new_, _add_close_):
+        close, xs, close_calls = request.param
+        vertices = ((1, 2), (3, 4))
+        polyline_ = _Polyline(None, array('d', xs), array('d', xs))
+        _Polyline_new_.return_value = polyline_
+        builder = FreeformBuilder(None, None, None, None, None)
+        expected_ops = [polyline_] if xs else []
+        return (
+            builder, vertices, close, _Polyline_new_, polyline_,
+            expected_ops, close_calls
+        )
+
     @pytest.fixture(params=[
         (True,  [call()]),
         (False, []),
@@ -196,9 +275,10 @@ class DescribeFreeformBuilder(object):
         )
 
     @pytest.fixture(params=[
-        (0,  (1, None, 2, 3),      3),
-        (6,  (1, None, 2, 3),      5),
-        (50, (150, -5, None, 100), 155),
+        (0,  (1, None, 2, 3),        3),
+        (6,  (1, None, 2, 3),        5),
+        (50, (150, -5, None, 100),   155),
+        (50, (150, (-5, 80), None),  155),
     ])
     def dx_fixture(self, request):
         start_x, xs, expected_value = request.param
@@ -206,6 +286,8 @@ class DescribeFreeformBuilder(object):
         for x in xs:
             if x is None:
                 drawing_ops.append(_Close())
+            elif isinstance(x, tuple):
+                drawing_ops.append(_Polyline(None, array('d', x), None))
             else:
                 drawing_ops.append(_BaseDrawingOperation(None, x, None))
 
@@ -319,11 +401,12 @@ class DescribeFreeformBuilder(object):
         return builder, expected_value
 
     @pytest.fixture
-    def sp_fixture(self, _left_prop_, _top_prop_, _width_prop_,
+    def sp_fixture(self, request, _left_prop_, _top_prop_, _width_prop_,
                    _height_prop_):
         origin_x, origin_y = 42, 24
         spTree = element('p:spTree')
         shapes = SlideShapes(spTree, None)
+        property_mock(request, SlideShapes, '_next_shape_id', return_value=1)
         _left_prop_.return_value, _top_prop_.return_value = 12, 34
         _width_prop_.return_value, _height_prop_.return_value = 56, 78
 
@@ -440,6 +523,10 @@ class DescribeFreeformBuilder(object):
     def _MoveTo_new_(self, request):
         return method_mock(request, _MoveTo, 'new')
 
+    @pytest.fixture
+    def _Polyline_new_(self, request):
+        return method_mock(request, _Polyline, 'new')
+
     @pytest.fixture
     def shape_(self, request):
         return instance_mock(request, Shape)
@@ -628,3 +715,51 @@ class Describe_MoveTo(object):
     @pytest.fixture
     def _init_(self, request):
         return initializer_mock(request, _MoveTo, autospec=True)
+
+
+class Describe_Polyline(object):
+
+    def it_provides_a_constructor(self, new_fixture):
+        builder_, vertices, expected_xs, expected_ys = new_fixture
+
+        polyline = _Polyline.new(builder_, vertices)
+
+        assert isinstance(polyline, _Polyline)
+        assert polyline.xs == array('d', expected_xs)
+        assert polyline.ys == array('d', expected_ys)
+
+    def it_knows_its_extents(self):
+        polyline = _Polyline(None, array('d', (4, -2, 9)), array('d', (7,)))
+        assert polyline.extents('x') == (-2, 9)
+        assert polyline.extents('y') == (7, 7)
+
+    def it_can_add_its_line_segments_to_a_path(self, builder_):
+        path = element('a:path/a:moveTo/a:pt{x=0,y=0}')
+        builder_.shape_offset_x, builder_.shape_offset_y = 100, 200
+        polyline = _Polyline(
+            builder_, array('d', (420, 100)), array('d', (240, 200))
+        )
+
+        polyline.apply_operation_to(path)
+
+        assert path.xml == xml(
+            'a:path/(a:moveTo/a:pt{x=0,y=0},a:lnTo/a:pt{x=320,y=40},a:lnTo/a'
+            ':pt{x=0,y=0})'
+        )
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        (((99.51, 200.49), (-1.6, 3)), (100, -2), (200, 3)),
+        (_ArrayOfPairs(((99.51, 200.49), (-1.6, 3))), (100, -2), (200, 3)),
+        ((), (), ()),
+    ])
+    def new_fixture(self, request, builder_):
+        vertices, expected_xs, expected_ys = request.param
+        return builder_, vertices, expected_xs, expected_ys
+
+    # fixture components -----------------------------------
+
+    @pytest.fixture
+    def builder_(self, request):
+        return instance_mock(request, FreeformBuilder)
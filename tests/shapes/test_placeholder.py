@@ -564,12 +564,12 @@ class DescribePicturePlaceholder(object):
         sp = element(sp_cxml)
         picture_ph = PicturePlaceholder(sp, None)
         image_file = 'foobar.png'
-        _get_or_add_image_.return_value = 42, 'bar', image_size
+        _get_or_add_image_.return_value = 'rId42', 'bar', image_size
         expected_xml = xml(
             'p:pic/(p:nvPicPr/(p:cNvPr{id=2,name=foo,descr=bar},p:cNvPicPr/a'
             ':picLocks{noGrp=1,noChangeAspect=1},p:nvPr),p:blipFill/(a:blip{'
-            'r:embed=42},a:srcRect{%s=12500,%s=12500},a:stretch/a:fillRect),'
-            'p:spPr)' % crop_attr_names
+            'r:embed=rId42},a:srcRect{%s=12500,%s=12500},a:stretch/a:fillRect'
+            '),p:spPr)' % crop_attr_names
         )
         return picture_ph, image_file, expected_xml
 
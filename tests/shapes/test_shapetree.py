@@ -10,10 +10,12 @@ import pytest
 
 from pptx.compat import BytesIO
 from pptx.chart.data import ChartData
+from pptx.dml.color import RGBColor
 from pptx.enum.shapes import (
     MSO_AUTO_SHAPE_TYPE, MSO_CONNECTOR, PP_PLACEHOLDER
 )
 from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
 from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.oxml.shapes.groupshape import CT_GroupShape
 from pptx.oxml.shapes.picture import CT_Picture
@@ -37,10 +39,11 @@ from pptx.shapes.shapetree import (
     GroupShapes, LayoutPlaceholders, _LayoutShapeFactory, LayoutShapes,
     MasterPlaceholders, _MasterShapeFactory, MasterShapes,
     _MoviePicElementCreator, NotesSlidePlaceholders, _NotesSlideShapeFactory,
-    NotesSlideShapes, _SlidePlaceholderFactory, SlidePlaceholders,
-    SlideShapeFactory, SlideShapes
+    NotesSlideShapes, _LazyShapeSequence, _SlidePlaceholderFactory,
+    SlidePlaceholders, SlideShapeFactory, SlideShapes
 )
-from pptx.slide import SlideLayout, SlideMaster
+from pptx.shared import cached_proxies
+from pptx.slide import Slide, SlideLayout, SlideMaster
 from pptx.table import Table
 
 from ..oxml.unitdata.shape import a_ph, a_pic, an_nvPr, an_nvSpPr, an_sp
@@ -108,6 +111,16 @@ class Describe_BaseShapes(object):
         BaseShapeFactory_.assert_called_once_with(sp, shapes)
         assert shape is shape_
 
+    def it_can_return_the_same_shape_object_each_time(self):
+        spTree = element('p:spTree/(p:sp,p:pic)')
+        shapes = _BaseShapes(spTree, None)
+        assert shapes[0] is not shapes[0]
+        with cached_proxies():
+            shape = shapes[1]
+            assert shapes[1] is shape
+            assert list(shapes)[1] is shape
+            assert shapes[0] is not shape
+
     def it_raises_on_shape_index_out_of_range(self, getitem_raises_fixture):
         shapes = getitem_raises_fixture
         with pytest.raises(IndexError):
@@ -118,29 +131,106 @@ class Describe_BaseShapes(object):
         shapes.clone_placeholder(placeholder_)
         assert shapes._element.xml == expected_xml
 
-    def it_knows_if_turbo_add_is_enabled(self, turbo_fixture):
-        shapes, expected_value = turbo_fixture
-        turbo_add_enabled = shapes.turbo_add_enabled
-        assert turbo_add_enabled == expected_value
-
-    def it_can_change_turbo_add_enabled(self, turbo_set_fixture):
-        shapes, value, expected_value = turbo_set_fixture
-        shapes.turbo_add_enabled = value
-        assert shapes.turbo_add_enabled == expected_value
+    def it_always_has_turbo_add_enabled(self):
+        shapes = _BaseShapes(None, None)
+        shapes.turbo_add_enabled = False
+        assert shapes.turbo_add_enabled is True
 
-    def it_finds_the_next_shape_id_to_help(self, next_id_fixture):
-        shapes, expected_value = next_id_fixture
-        assert shapes._next_shape_id == expected_value
+    def it_gets_the_next_shape_id_from_its_part(self, next_id_fixture):
+        shapes, slide_part_, expected_value = next_id_fixture
+        shape_id = shapes._next_shape_id
+        slide_part_.next_shape_id.assert_called_once_with()
+        assert shape_id == expected_value
 
     def it_finds_the_next_placeholder_name_to_help(self, ph_name_fixture):
         shapes, ph_type, sp_id, orient, expected_value = ph_name_fixture
         assert shapes._next_ph_name(ph_type, sp_id, orient) == expected_value
 
+    def it_can_find_the_shapes_within_a_rectangle(self, within_fixture):
+        shapes, rect, expected_names = within_fixture
+        assert [s.name for s in shapes.within(rect)] == expected_names
+
+    def it_can_find_the_shapes_overlapping_a_shape(self, overlapping_fixture):
+        shapes, shape, expected_names = overlapping_fixture
+        assert [s.name for s in shapes.overlapping(shape)] == expected_names
+
+    def it_can_find_the_shapes_extending_past_a_rectangle(self):
+        shapes = _BaseShapes(self._spTree(
+            (0, 0, 100, 100), (90, 0, 20, 20), (-5, 50, 10, 10),
+            (0, 100, 100, 0)
+        ), None)
+        names = [s.name for s in shapes.overflowing((0, 0, 100, 100))]
+        assert names == ['Shape 2', 'Shape 3']
+
+    def it_reuses_its_spatial_index_until_a_shape_moves(self):
+        shapes = _BaseShapes(self._spTree((0, 0, 10, 10)), None)
+        index = shapes._spatial_index
+        assert shapes._spatial_index is index
+
+        shapes[0].left = 50
+
+        assert shapes._spatial_index is not index
+        assert [s.name for s in shapes.within((0, 0, 20, 20))] == []
+        assert [s.name for s in shapes.within((50, 0, 10, 10))] == [
+            'Shape 1'
+        ]
+
+    def it_compares_group_members_in_slide_coordinates(self):
+        spTree = element(
+            'p:spTree/p:grpSp/(p:grpSpPr/a:xfrm/(a:off{x=1000,y=2000},a:ext'
+            '{cx=200,cy=100},a:chOff{x=0,y=0},a:chExt{cx=100,cy=100}),p:sp/'
+            '(p:nvSpPr/p:cNvPr{id=3,name=Child},p:spPr/a:xfrm/(a:off{x=50,y=5'
+            '0},a:ext{cx=50,cy=50})))'
+        )
+        shapes = _BaseShapes(spTree[0], None)
+        assert [s.name for s in shapes.within((1100, 2050, 100, 50))] == [
+            'Child'
+        ]
+        assert shapes.within((50, 50, 50, 50)) == []
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture(params=[
+        ((0, 0, 100, 100), 'Shape 4', ['Shape 1', 'Shape 2']),
+        ((150, 0, 100, 100), 'Shape 1', ['Shape 3']),
+        ((100, 100, 100, 100), 'Shape 3', ['Shape 2']),
+        ((0, 240, 50, 50), 'Shape 1', ['Shape 4', 'Shape 5']),
+    ])
+    def overlapping_fixture(self, request):
+        box, name, expected_names = request.param
+        spTree = self._spTree(
+            (0, 0, 100, 100), (50, 50, 100, 100), (100, 0, 100, 100),
+            (0, 200, 1000, 1000), (0, 250, 10000, 0)
+        )
+        shapes = _BaseShapes(spTree, None)
+        shape = [s for s in shapes if s.name == name][0]
+        shape.left, shape.top, shape.width, shape.height = box
+        return shapes, shape, expected_names
+
+    @pytest.fixture(params=[
+        ((0, 0, 100, 100), ['Shape 1', 'Shape 4']),
+        ((0, 0, 200, 200), ['Shape 1', 'Shape 2', 'Shape 4']),
+        ((50, 50, 100, 100), ['Shape 2']),
+        ((-10000, -10000, 20000, 20000), [
+            'Shape 1', 'Shape 2', 'Shape 3', 'Shape 4'
+        ]),
+        ((5000, 5000, 10, 10), []),
+    ])
+    def within_fixture(self, request):
+        rect, expected_names = request.param
+        spTree = self._spTree(
+            (0, 0, 100, 100), (50, 50, 100, 100), (-100, 0, 10000, 100),
+            (0, 100, 100, 0)
+        )
+        spTree.append(element('p:sp/p:spPr'))
+        shapes = _BaseShapes(spTree, None)
+        return shapes, rect, expected_names
+
     @pytest.fixture
     def clone_ph_fixture(self, placeholder_):
-        shapes = SlideShapes(element('p:spTree{a:b=c}'), None)
+        sld = element('p:sld/p:cSld/p:spTree{a:b=c}')
+        slide = Slide(sld, SlidePart(None, None, sld, None))
+        shapes = SlideShapes(sld.cSld.spTree, slide)
         expected_xml = xml(
             'p:spTree{a:b=c}/p:sp/(p:nvSpPr/(p:cNvPr{id=1,name=Vertical Char'
             't Placeholder 0},p:cNvSpPr/a:spLocks{noGrp=1},p:nvPr/p:ph{type='
@@ -189,21 +279,12 @@ class Describe_BaseShapes(object):
         expected_count = 2
         return shapes, expected_count
 
-    @pytest.fixture(params=[
-        ('p:spTree/p:nvSpPr',                                 1),
-        ('p:spTree/p:nvSpPr/p:cNvPr{id=0}',                   1),
-        ('p:spTree/p:nvSpPr/p:cNvPr{id=1}',                   2),
-        ('p:spTree/p:nvSpPr/p:cNvPr{id=2}',                   3),
-        ('p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=3})',   4),
-        ('p:spTree/p:nvSpPr/(p:cNvPr{id=foo},p:cNvPr{id=2})', 3),
-        ('p:spTree/p:nvSpPr/(p:cNvPr{id=1fo},p:cNvPr{id=2})', 3),
-        ('p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=1},p:'
-         'cNvPr{id=1},p:cNvPr{id=4})',                        5),
-    ])
-    def next_id_fixture(self, request):
-        spTree_cxml, expected_value = request.param
-        shapes = _BaseShapes(element(spTree_cxml), None)
-        return shapes, expected_value
+    @pytest.fixture
+    def next_id_fixture(self, request, slide_part_):
+        slide_ = instance_mock(request, Slide, part=slide_part_)
+        shapes = _BaseShapes(None, slide_)
+        slide_part_.next_shape_id.return_value = 42
+        return shapes, slide_part_, 42
 
     @pytest.fixture(params=[
         (PP_PLACEHOLDER.OBJECT, 3, ST_Direction.HORZ,
@@ -217,37 +298,14 @@ class Describe_BaseShapes(object):
     ])
     def ph_name_fixture(self, request):
         ph_type, sp_id, orient, expected_name = request.param
-        spTree = element(
-            'p:spTree/(p:cNvPr{name=Title 1},p:cNvPr{name=Table Placeholder '
-            '3})'
+        sld = element(
+            'p:sld/p:cSld/p:spTree/(p:cNvPr{name=Title 1},p:cNvPr{name=Table '
+            'Placeholder 3})'
         )
-        shapes = SlideShapes(spTree, None)
+        slide = Slide(sld, SlidePart(None, None, sld, None))
+        shapes = SlideShapes(sld.cSld.spTree, slide)
         return shapes, ph_type, sp_id, orient, expected_name
 
-    @pytest.fixture(params=[
-        (None, False),
-        (42, True),
-    ])
-    def turbo_fixture(self, request):
-        cached_max_shape_id, expected_value = request.param
-        shapes = _BaseShapes(None, None)
-        if cached_max_shape_id:
-            shapes._cached_max_shape_id = cached_max_shape_id
-        return shapes, expected_value
-
-    @pytest.fixture(params=[
-        ('p:spTree/p:nvSpPr',                                 True),
-        ('p:spTree/p:nvSpPr/p:cNvPr{id=2}',                   True),
-        ('p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=3})',   False),
-        ('p:spTree/p:nvSpPr/(p:cNvPr{id=1},p:cNvPr{id=1},p:'
-         'cNvPr{id=1},p:cNvPr{id=4})',                        True),
-    ])
-    def turbo_set_fixture(self, request):
-        spTree_cxml, value = request.param
-        shapes = _BaseShapes(element(spTree_cxml), None)
-        expected_value = value
-        return shapes, value, expected_value
-
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -265,6 +323,19 @@ class Describe_BaseShapes(object):
     def shape_(self, request):
         return instance_mock(request, BaseShape)
 
+    @pytest.fixture
+    def slide_part_(self, request):
+        return instance_mock(request, SlidePart)
+
+    @staticmethod
+    def _spTree(*rects):
+        """Return `p:spTree` with a `p:sp` named 'Shape n' for each rect."""
+        return element('p:spTree/(%s)' % ','.join(
+            'p:sp/(p:nvSpPr/p:cNvPr{id=%d,name=Shape %d},p:spPr/a:xfrm/(a:o'
+            'ff{x=%d,y=%d},a:ext{cx=%d,cy=%d}))' % ((n, n) + rect)
+            for n, rect in enumerate(rects, 1)
+        ))
+
 
 class Describe_BaseGroupShapes(object):
 
@@ -318,10 +389,40 @@ class Describe_BaseGroupShapes(object):
 
         group_shape = shapes.add_group_shape()
 
-        spTree.add_grpSp.assert_called_once_with(spTree)
+        spTree.add_grpSp.assert_called_once_with(spTree, 42, 'Group 41')
         shapes._shape_factory.assert_called_once_with(shapes, grpSp)
         assert group_shape is group_shape_
 
+    def it_can_add_many_shapes(self, add_many_fixture):
+        shapes, specs, expected_xml = add_many_fixture
+        spTree = shapes._element
+
+        added_shapes = shapes.add_many(specs)
+
+        shapes._recalculate_extents.assert_called_once_with(shapes)
+        assert spTree[0].xml == expected_xml
+        assert spTree[1].tag == qn('p:extLst')
+        assert shapes._shape_factory.call_count == 0
+        assert len(added_shapes) == 1
+        assert added_shapes[0] is shapes._shape_factory.return_value
+        shapes._shape_factory.assert_called_once_with(shapes, spTree[0])
+
+    def it_escapes_a_shape_name_given_in_a_spec(self, _next_shape_id_prop_):
+        shapes = _BaseGroupShapes(element('p:spTree'), None)
+        _next_shape_id_prop_.return_value = 2
+        name = 'Foo & "Bar" <Baz>'
+
+        shapes.add_many([{'left': 1, 'top': 2, 'width': 3, 'height': 4,
+                          'name': name}])
+
+        assert shapes._element[0].shape_name == name
+
+    def it_raises_on_a_bad_color_in_a_spec(self, bad_color_fixture):
+        shapes, spec = bad_color_fixture
+        with pytest.raises(ValueError):
+            shapes.add_many([spec])
+        assert len(shapes._element) == 0
+
     def it_can_add_a_picture(self, picture_fixture):
         shapes, image_file, x, y, cx, cy = picture_fixture[:6]
         image_part_, rId, pic, picture_ = picture_fixture[6:]
@@ -437,9 +538,44 @@ class Describe_BaseGroupShapes(object):
             graphicFrame, graphic_frame_
         )
 
+    @pytest.fixture(params=[
+        ({'autoshape_type_id': MSO_AUTO_SHAPE_TYPE.RECTANGLE, 'left': 1,
+          'top': 2, 'width': 3, 'height': 4, 'text': 'foo\nbar',
+          'fill': RGBColor(0x12, 0x34, 0x56)},
+         'p:sp/(p:nvSpPr/(p:cNvPr{id=42,name=Rectangle 41},p:cNvSpPr,p:nvPr'
+         '),p:spPr/(a:xfrm/(a:off{x=1,y=2},a:ext{cx=3,cy=4}),a:prstGeom{prs'
+         't=rect}/a:avLst,a:solidFill/a:srgbClr{val=123456}),p:style/(a:lnR'
+         'ef{idx=1}/a:schemeClr{val=accent1},a:fillRef{idx=3}/a:schemeClr{v'
+         'al=accent1},a:effectRef{idx=2}/a:schemeClr{val=accent1},a:fontRef'
+         '{idx=minor}/a:schemeClr{val=lt1}),p:txBody/(a:bodyPr{rtlCol=0,anc'
+         'hor=ctr},a:lstStyle,a:p/(a:pPr{algn=ctr},a:r/a:t"foo",a:br,a:r/a:'
+         't"bar")))'),
+        ({'left': 1, 'top': 2, 'width': 3, 'height': 4, 'text': 'foo',
+          'line_width': 12700, 'name': 'Foo'},
+         'p:sp/(p:nvSpPr/(p:cNvPr{id=42,name=Foo},p:cNvSpPr{txBox=1},p:nvPr'
+         '),p:spPr/(a:xfrm/(a:off{x=1,y=2},a:ext{cx=3,cy=4}),a:prstGeom{prs'
+         't=rect}/a:avLst,a:noFill,a:ln{w=12700}),p:txBody/(a:bodyPr{wrap=n'
+         'one}/a:spAutoFit,a:lstStyle,a:p/a:r/a:t"foo"))'),
+        ({'connector_type': MSO_CONNECTOR.STRAIGHT, 'begin_x': 9,
+          'begin_y': 8, 'end_x': 2, 'end_y': 3, 'line': RGBColor(1, 2, 3)},
+         'p:cxnSp/(p:nvCxnSpPr/(p:cNvPr{id=42,name=Connector 41},p:cNvCxnSp'
+         'Pr,p:nvPr),p:spPr/(a:xfrm{flipH=1,flipV=1}/(a:off{x=2,y=3},a:ext{'
+         'cx=7,cy=5}),a:prstGeom{prst=line}/a:avLst,a:ln/a:solidFill/a:srgb'
+         'Clr{val=010203}),p:style/(a:lnRef{idx=2}/a:schemeClr{val=accent1}'
+         ',a:fillRef{idx=0}/a:schemeClr{val=accent1},a:effectRef{idx=1}/a:s'
+         'chemeClr{val=accent1},a:fontRef{idx=minor}/a:schemeClr{val=tx1}))'),
+    ])
+    def add_many_fixture(self, request, _next_shape_id_prop_,
+                         _recalculate_extents_, _shape_factory_):
+        spec, expected_cxml = request.param
+        shapes = _BaseGroupShapes(element('p:spTree/p:extLst'), None)
+        _next_shape_id_prop_.return_value = 42
+        return shapes, [spec], xml(expected_cxml)
+
     @pytest.fixture
-    def add_cht_gr_frm_fixture(self):
+    def add_cht_gr_frm_fixture(self, _next_shape_id_prop_):
         shapes = _BaseGroupShapes(element('p:spTree'), None)
+        _next_shape_id_prop_.return_value = 1
         rId, x, y, cx, cy = 'rId42', 1, 2, 3, 4
         expected_xml = (
             '<p:spTree xmlns:p="http://schemas.openxmlformats.org/presentati'
@@ -468,9 +604,10 @@ class Describe_BaseGroupShapes(object):
         (9, 8, 2, 3,
          'p:spPr/(a:xfrm{flipH=1,flipV=1}/(a:off{x=2,y=3},a:ext{cx=7,cy=5})'),
     ])
-    def add_cxnSp_fixture(self, request):
+    def add_cxnSp_fixture(self, request, _next_shape_id_prop_):
         begin_x, begin_y, end_x, end_y, spPr_cxml = request.param
         shapes = _BaseGroupShapes(element('p:spTree'), None)
+        _next_shape_id_prop_.return_value = 1
         connector_type = MSO_CONNECTOR.STRAIGHT
         tmpl_cxml = (
             'p:cxnSp/(p:nvCxnSpPr/(p:cNvPr{id=1,name=Connector 0},p:cNvCxnSp'
@@ -562,6 +699,14 @@ class Describe_BaseGroupShapes(object):
         )
         return shapes, x, y, cx, cy, expected_xml
 
+    @pytest.fixture(params=['fill', 'line'])
+    def bad_color_fixture(self, request, _next_shape_id_prop_):
+        shapes = _BaseGroupShapes(element('p:spTree'), None)
+        _next_shape_id_prop_.return_value = 2
+        spec = {'left': 1, 'top': 2, 'width': 3, 'height': 4,
+                request.param: '"/><a:'}
+        return shapes, spec
+
     @pytest.fixture
     def connector_fixture(self, _add_cxnSp_, _shape_factory_,
                           _recalculate_extents_, connector_):
@@ -594,11 +739,12 @@ class Describe_BaseGroupShapes(object):
 
     @pytest.fixture
     def group_fixture(self, CT_GroupShape_add_grpSp_, _shape_factory_,
-                      group_shape_):
+                      group_shape_, _next_shape_id_prop_):
         spTree = element('p:spTree{id=2e838acdc755e83113ed03904d2fe081f}')
         grpSp = element('p:grpSp{id=052874e154b48f9bec4266f80913cae38f}')
         shapes = _BaseGroupShapes(spTree, None)
 
+        _next_shape_id_prop_.return_value = 42
         CT_GroupShape_add_grpSp_.return_value = grpSp
         _shape_factory_.return_value = group_shape_
 
@@ -787,6 +933,23 @@ class Describe_BaseGroupShapes(object):
 
 class DescribeGroupShapes(object):
 
+    def it_can_defer_recalculating_group_extents(self):
+        spTree = element(
+            'p:spTree/p:grpSp/(p:grpSpPr/a:xfrm,p:sp/p:spPr/a:xfrm/(a:off{x=1'
+            ',y=2},a:ext{cx=3,cy=4}))'
+        )
+        shapes = GroupShapes(spTree[0], None)
+
+        with shapes.deferred_layout():
+            shapes._recalculate_extents()
+            assert spTree[0].xfrm.off is None
+
+        assert spTree[0].xml == xml(
+            'p:grpSp/(p:grpSpPr/a:xfrm/(a:off{x=1,y=2},a:ext{cx=3,cy=4},a:chO'
+            'ff{x=1,y=2},a:chExt{cx=3,cy=4}),p:sp/p:spPr/a:xfrm/(a:off{x=1,y='
+            '2},a:ext{cx=3,cy=4}))'
+        )
+
     def it_recalculates_its_extents_to_help(self, recalc_fixture):
         shapes = recalc_fixture
         shapes._recalculate_extents()
@@ -988,6 +1151,27 @@ class DescribeSlidePlaceholders(object):
         )
 
 
+class Describe_LazyShapeSequence(object):
+
+    def it_constructs_a_shape_only_when_it_is_accessed(self, shape_factory_):
+        shape_elms = [element('p:sp'), element('p:cxnSp')]
+        shapes = _LazyShapeSequence(shape_elms, shape_factory_)
+
+        assert len(shapes) == 2
+        assert shape_factory_.call_count == 0
+        assert shapes[1] is shape_factory_.return_value
+        shape_factory_.assert_called_once_with(shape_elms[1])
+        assert shapes[:1] == [shape_factory_.return_value]
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def shape_factory_(self, request):
+        return function_mock(
+            request, 'pptx.shapes.shapetree.BaseShapeFactory'
+        )
+
+
 class Describe_SlidePlaceholderFactory(object):
 
     def it_constructs_the_right_type_of_placeholder(self, factory_fixture):
@@ -1127,6 +1311,19 @@ class DescribeSlideShapeFactory(object):
 
 class DescribeSlideShapes(object):
 
+    def it_shares_shape_ids_with_other_proxies_of_the_slide(self):
+        sld = element('p:sld/p:cSld/p:spTree/p:nvGrpSpPr/p:cNvPr{id=1}')
+        slide_part = SlidePart(None, None, sld, None)
+        shapes = SlideShapes(sld.cSld.spTree, Slide(sld, slide_part))
+        other_shapes = SlideShapes(sld.cSld.spTree, Slide(sld, slide_part))
+
+        shape_ids = [
+            shapes._next_shape_id, other_shapes._next_shape_id,
+            shapes._next_shape_id
+        ]
+
+        assert shape_ids == [2, 3, 4]
+
     def it_provides_access_to_its_shape_factory(self, factory_fixture):
         shapes, sp, SlideShapeFactory_, shape_ = factory_fixture
         shape = shapes._shape_factory(sp)
@@ -1168,6 +1365,29 @@ class DescribeSlideShapes(object):
         assert table is table_
         assert shapes._element.xml == expected_xml
 
+    def it_can_add_a_table_from_data(self, table_data_fixture):
+        shapes, data, header, number_formats = table_data_fixture[:4]
+        table_, expected_texts, expected_first_row = table_data_fixture[4:]
+
+        table = shapes.add_table_from_data(
+            data, 10, 11, 120, 130, header, number_formats
+        )
+
+        graphicFrame = shapes._element.xpath('p:graphicFrame')[0]
+        tbl = graphicFrame.graphic.graphicData.tbl
+        shapes._shape_factory.assert_called_once_with(shapes, graphicFrame)
+        assert table is table_
+        assert graphicFrame.shape_name == 'Table 0'
+        assert [[tc.text for tc in tr.tc_lst] for tr in tbl.tr_lst] == (
+            expected_texts
+        )
+        assert tbl.firstRow is expected_first_row
+
+    def but_it_raises_on_table_data_having_no_cells(self):
+        shapes = SlideShapes(element('p:spTree'), None)
+        with pytest.raises(ValueError):
+            shapes.add_table_from_data([[], []], 10, 11, 120, 130)
+
     def it_can_clone_placeholder_shapes_from_a_layout(self, clone_fixture):
         shapes, slide_layout_, calls = clone_fixture
         shapes.clone_layout_placeholders(slide_layout_)
@@ -1226,9 +1446,33 @@ class DescribeSlideShapes(object):
             _add_video_timing_, _shape_factory_, movie_
         )
 
+    @pytest.fixture(params=[
+        (lambda: [['a', 'b'], ['c\nd', None]], None, None,
+         [['a', 'b'], ['c\nd', '']], False),
+        (lambda: iter([(1, 2.5), (3,)]), ['x', 'y'], ['d', '.2f'],
+         [['x', 'y'], ['1', '2.50'], ['3', '']], True),
+        (lambda: [[1234.5, True, 'n']], None, [',.1f', 'd', '.1f'],
+         [['1,234.5', 'True', 'n']], False),
+        (lambda: _DataFrame(['x', 'y'], [(1, 0.25)]), None, [None, '.0%'],
+         [['x', 'y'], ['1', '25%']], True),
+        (lambda: _Array([[1, 2]]), None, None, [['1', '2']], False),
+    ])
+    def table_data_fixture(self, request, table_, _shape_factory_,
+                           _next_shape_id_prop_):
+        data_factory, header, number_formats = request.param[:3]
+        expected_texts, expected_first_row = request.param[3:]
+        shapes = SlideShapes(element('p:spTree'), None)
+        _next_shape_id_prop_.return_value = 1
+        _shape_factory_.return_value = table_
+        return (
+            shapes, data_factory(), header, number_formats, table_,
+            expected_texts, expected_first_row
+        )
+
     @pytest.fixture
-    def table_fixture(self, table_, _shape_factory_):
+    def table_fixture(self, table_, _shape_factory_, _next_shape_id_prop_):
         shapes = SlideShapes(element('p:spTree'), None)
+        _next_shape_id_prop_.return_value = 1
         rows, cols, x, y, cx, cy = 1, 2, 10, 11, 12, 13
         _shape_factory_.return_value = table_
         expected_xml = (
@@ -1435,8 +1679,13 @@ class DescribeLayoutPlaceholders(object):
         assert placeholder is placeholder_
 
     def it_can_find_a_placeholder_by_idx_value(self, get_fixture):
-        placeholders, idx, placeholder_ = get_fixture
-        assert placeholders.get(idx) is placeholder_
+        placeholders, idx, ph_elm, _LayoutShapeFactory_ = get_fixture[:4]
+        placeholder_ = get_fixture[4]
+
+        placeholder = placeholders.get(idx)
+
+        _LayoutShapeFactory_.assert_called_once_with(ph_elm, placeholders)
+        assert placeholder is placeholder_
 
     def it_returns_default_on_ph_idx_not_found(self, default_fixture):
         placeholders, default = default_fixture
@@ -1445,8 +1694,9 @@ class DescribeLayoutPlaceholders(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def default_fixture(self, _iter_):
-        placeholders = LayoutPlaceholders(None, None)
+    def default_fixture(self):
+        spTree = element('p:spTree/p:sp/p:nvSpPr/p:nvPr/p:ph{idx=1}')
+        placeholders = LayoutPlaceholders(spTree, None)
         default = 'barfoo'
         return placeholders, default
 
@@ -1457,22 +1707,18 @@ class DescribeLayoutPlaceholders(object):
         return placeholders, sp, _LayoutShapeFactory_, placeholder_
 
     @pytest.fixture(params=[0, 1])
-    def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
+    def get_fixture(self, request, _LayoutShapeFactory_, placeholder_):
         idx = request.param
-        layout_placeholders = LayoutPlaceholders(None, None)
-        _placeholder_ = (placeholder_, placeholder_2_)[idx]
-        placeholder_.element.ph_idx, placeholder_2_.element.ph_idx = 0, 1
-        return layout_placeholders, idx, _placeholder_
+        spTree = element(
+            'p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},p:sp/p:nvSpPr/p:'
+            'nvPr/p:ph{idx=1})'
+        )
+        placeholders = LayoutPlaceholders(spTree, None)
+        ph_elm = spTree[idx]
+        return placeholders, idx, ph_elm, _LayoutShapeFactory_, placeholder_
 
     # fixture components ---------------------------------------------
 
-    @pytest.fixture
-    def _iter_(self, request, placeholder_, placeholder_2_):
-        return method_mock(
-            request, LayoutPlaceholders, '__iter__',
-            return_value=iter([placeholder_, placeholder_2_])
-        )
-
     @pytest.fixture
     def _LayoutShapeFactory_(self, request, placeholder_):
         return function_mock(
@@ -1488,10 +1734,6 @@ class DescribeLayoutPlaceholders(object):
     def placeholder_(self, request):
         return instance_mock(request, LayoutPlaceholder)
 
-    @pytest.fixture
-    def placeholder_2_(self, request):
-        return instance_mock(request, LayoutPlaceholder)
-
 
 class Describe_MasterShapeFactory(object):
 
@@ -1593,8 +1835,13 @@ class DescribeMasterPlaceholders(object):
         assert placeholder is placeholder_
 
     def it_can_find_a_placeholder_by_type(self, get_fixture):
-        placeholders, ph_type, placeholder_ = get_fixture
-        assert placeholders.get(ph_type) is placeholder_
+        placeholders, ph_type, ph_elm, _MasterShapeFactory_ = get_fixture[:4]
+        placeholder_ = get_fixture[4]
+
+        placeholder = placeholders.get(ph_type)
+
+        _MasterShapeFactory_.assert_called_once_with(ph_elm, placeholders)
+        assert placeholder is placeholder_
 
     def it_returns_default_on_ph_type_not_found(self, default_fixture):
         placeholders, default = default_fixture
@@ -1603,8 +1850,9 @@ class DescribeMasterPlaceholders(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def default_fixture(self, _iter_):
-        placeholders = MasterPlaceholders(None, None)
+    def default_fixture(self):
+        spTree = element('p:spTree/p:sp/p:nvSpPr/p:nvPr/p:ph{type=title}')
+        placeholders = MasterPlaceholders(spTree, None)
         default = 'barfoo'
         return placeholders, default
 
@@ -1614,24 +1862,25 @@ class DescribeMasterPlaceholders(object):
         sp = element('p:sp')
         return placeholders, sp, _MasterShapeFactory_, placeholder_
 
-    @pytest.fixture(params=['title', 'body'])
-    def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
-        ph_type = request.param
-        placeholders = MasterPlaceholders(None, None)
-        _placeholder_ = {
-            'title': placeholder_, 'body': placeholder_2_
-        }[ph_type]
-        return placeholders, ph_type, _placeholder_
+    @pytest.fixture(params=[
+        (PP_PLACEHOLDER.TITLE, 0),
+        (PP_PLACEHOLDER.BODY,  1),
+    ])
+    def get_fixture(self, request, _MasterShapeFactory_, placeholder_):
+        ph_type, ph_offset = request.param
+        spTree = element(
+            'p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},p:sp/p:nvSpPr/p:'
+            'nvPr/p:ph{type=body,idx=1},p:sp/p:nvSpPr/p:nvPr/p:ph{type=body,i'
+            'dx=2})'
+        )
+        placeholders = MasterPlaceholders(spTree, None)
+        ph_elm = spTree[ph_offset]
+        return (
+            placeholders, ph_type, ph_elm, _MasterShapeFactory_, placeholder_
+        )
 
     # fixture components ---------------------------------------------
 
-    @pytest.fixture
-    def _iter_(self, request, placeholder_, placeholder_2_):
-        return method_mock(
-            request, MasterPlaceholders, '__iter__',
-            return_value=iter([placeholder_, placeholder_2_])
-        )
-
     @pytest.fixture
     def _MasterShapeFactory_(self, request, placeholder_):
         return function_mock(
@@ -1641,11 +1890,7 @@ class DescribeMasterPlaceholders(object):
 
     @pytest.fixture
     def placeholder_(self, request):
-        return instance_mock(request, MasterPlaceholder, ph_type='title')
-
-    @pytest.fixture
-    def placeholder_2_(self, request):
-        return instance_mock(request, MasterPlaceholder, ph_type='body')
+        return instance_mock(request, MasterPlaceholder)
 
 
 class Describe_MoviePicElementCreator(object):
@@ -1980,3 +2225,29 @@ class Describe_NotesSlideShapeFactory(object):
     @pytest.fixture
     def shapes_(self, request):
         return instance_mock(request, _BaseShapes)
+
+
+# ===========================================================================
+# fixture objects
+# ===========================================================================
+
+class _Array(object):
+    """NumPy-like array stand-in, having only `.tolist()`."""
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def tolist(self):
+        return self._rows
+
+
+class _DataFrame(object):
+    """pandas-like data frame stand-in."""
+
+    def __init__(self, columns, rows):
+        self.columns = columns
+        self._rows = rows
+
+    def itertuples(self, index=True, name='Pandas'):
+        assert (index, name) == (False, None)
+        return iter(self._rows)
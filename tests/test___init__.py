@@ -0,0 +1,76 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.__init__.py module, primarily import-time behavior.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+# ---seconds allowed for a cold `import pptx` in a fresh interpreter. This is
+# ---deliberately generous so it only trips on a real regression, such as
+# ---a heavy dependency creeping back onto the import path. Wall-clock time
+# ---is unreliable on a loaded machine, so the check only runs when the
+# ---PPTX_BENCHMARK environment variable is set, e.g.:
+# ---    PPTX_BENCHMARK=1 py.test tests/test___init__.py
+IMPORT_TIME_BUDGET = 1.5
+
+benchmark = pytest.mark.skipif(
+    not os.environ.get('PPTX_BENCHMARK'),
+    reason='timing check, set PPTX_BENCHMARK=1 to run'
+)
+
+_probe = (
+    'import json, sys\n'
+    'import pptx\n'
+    'print(json.dumps(list(sys.modules)))\n'
+)
+
+_timing_probe = (
+    'import time\n'
+    't0 = time.time()\n'
+    'import pptx\n'
+    'print(time.time() - t0)\n'
+)
+
+
+class DescribePackageImport(object):
+
+    def it_does_not_load_modules_it_does_not_need_yet(
+            self, module_name, cold_import_modules):
+        assert module_name not in cold_import_modules
+
+    @benchmark
+    def it_imports_within_its_time_budget(self):
+        # ---best of three, so a single slow start doesn't fail the check---
+        command = [sys.executable, '-c', _timing_probe]
+        elapsed = min(
+            float(subprocess.check_output(command)) for _ in range(3)
+        )
+        assert elapsed < IMPORT_TIME_BUDGET
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(scope='class')
+    def cold_import_modules(self):
+        output = subprocess.check_output([sys.executable, '-c', _probe])
+        return json.loads(output.decode('utf-8'))
+
+    @pytest.fixture(params=[
+        # ---third-party packages only needed for images and charts---
+        'PIL', 'xlsxwriter',
+        # ---stdlib modules pulled in by e.g. xml.sax.saxutils---
+        'urllib.request', 'ssl', 'xml.sax.saxutils',
+        # ---package modules only needed once the feature is used---
+        'pptx.chart.chart', 'pptx.media', 'pptx.text.fonts',
+        'pptx.text.layout',
+    ])
+    def module_name(self, request):
+        return request.param
@@ -14,10 +14,14 @@ from pptx.parts.coreprops import CorePropertiesPart
 from pptx.parts.presentation import PresentationPart
 from pptx.parts.slide import NotesMasterPart
 from pptx.presentation import Presentation
-from pptx.slide import SlideLayouts, SlideMaster, SlideMasters, Slides
+from pptx.slide import (
+    Slide, SlideLayouts, SlideMaster, SlideMasters, Slides
+)
 
 from .unitutil.cxml import element, xml
-from .unitutil.mock import class_mock, instance_mock, property_mock
+from .unitutil.mock import (
+    call, class_mock, instance_mock, property_mock
+)
 
 
 class DescribePresentation(object):
@@ -82,6 +86,17 @@ class DescribePresentation(object):
         assert slide_masters is slide_masters_
         assert prs._element.xml == expected_xml
 
+    def it_can_replace_text_on_its_slides(self, replace_fixture):
+        prs, TextReplacer_, replacer_, slides = replace_fixture
+
+        counts = prs.replace_text({'{a}': 'b'})
+
+        TextReplacer_.new.assert_called_once_with({'{a}': 'b'}, None)
+        assert replacer_.replace.call_args_list == [
+            call(slides[0]._element), call(slides[1]._element)
+        ]
+        assert counts == [2, 0]
+
     def it_can_save_the_presentation_to_a_file(self, save_fixture):
         prs, file_, prs_part_ = save_fixture
         prs.save(file_)
@@ -133,6 +148,16 @@ class DescribePresentation(object):
         prs = Presentation(None, prs_part_)
         return prs, prs_part_
 
+    @pytest.fixture
+    def replace_fixture(self, request, slides_prop_):
+        prs = Presentation(None, None)
+        slides = [Slide(element('p:sld'), None) for _ in range(2)]
+        slides_prop_.return_value = slides
+        TextReplacer_ = class_mock(request, 'pptx.presentation.TextReplacer')
+        replacer_ = TextReplacer_.new.return_value
+        replacer_.replace.side_effect = [2, 0]
+        return prs, TextReplacer_, replacer_, slides
+
     @pytest.fixture
     def save_fixture(self, prs_part_):
         prs = Presentation(None, prs_part_)
@@ -237,6 +262,10 @@ class DescribePresentation(object):
     def slide_masters_(self, request):
         return instance_mock(request, SlideMasters)
 
+    @pytest.fixture
+    def slides_prop_(self, request):
+        return property_mock(request, Presentation, 'slides')
+
     @pytest.fixture
     def Slides_(self, request, slides_):
         return class_mock(
@@ -8,15 +8,53 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import gc
 import pytest
 
+from lxml import etree
+
 from pptx.opc.package import XmlPart
-from pptx.shared import ElementProxy, ParentedElementProxy
+from pptx.shared import (
+    cached_proxies, cached_proxy, ElementProxy, ParentedElementProxy
+)
 
 from .unitutil.cxml import element
 from .unitutil.mock import instance_mock
 
 
+class DescribeCachedProxy(object):
+
+    def it_constructs_a_new_proxy_each_time_by_default(self):
+        sp = element('p:sp')
+        proxy = cached_proxy(sp, 'shape', _Proxy, sp)
+        assert cached_proxy(sp, 'shape', _Proxy, sp) is not proxy
+        assert proxy.args == (sp,)
+
+    def it_returns_the_same_proxy_inside_a_cached_proxies_block(self):
+        sp = element('p:sp')
+        with cached_proxies():
+            proxy = cached_proxy(sp, 'shape', _Proxy, sp)
+            with cached_proxies():
+                assert cached_proxy(sp, 'shape', _Proxy, sp) is proxy
+            assert cached_proxy(sp, 'shape', _Proxy, sp) is proxy
+            assert cached_proxy(sp, 'other', _Proxy, sp) is not proxy
+        assert cached_proxy(sp, 'shape', _Proxy, sp) is not proxy
+
+    def it_constructs_a_new_proxy_once_the_old_one_is_gone(self):
+        sp = element('p:sp')
+        with cached_proxies():
+            cached_proxy(sp, 'shape', _Proxy, sp, 1)
+            gc.collect()
+            proxy = cached_proxy(sp, 'shape', _Proxy, sp, 2)
+        assert proxy.args == (sp, 2)
+
+    def but_it_does_not_cache_a_proxy_for_a_plain_element(self):
+        foo = etree.Element('foo')
+        with cached_proxies():
+            proxy = cached_proxy(foo, 'shape', _Proxy, foo)
+            assert cached_proxy(foo, 'shape', _Proxy, foo) is not proxy
+
+
 class DescribeElementProxy(object):
 
     def it_raises_on_assign_to_undefined_attr(self):
@@ -90,3 +128,10 @@ class DescribeParentedElementProxy(object):
     @pytest.fixture
     def part_(self, request):
         return instance_mock(request, XmlPart)
+
+
+class _Proxy(object):
+    """Minimal weak-referenceable proxy recording its constructor args."""
+
+    def __init__(self, *args):
+        self.args = args
@@ -332,6 +332,13 @@ class DescribeSlide(object):
         follows = slide.follow_master_background
         assert follows is expected_value
 
+    def it_can_find_the_shapes_overflowing_it(self, overflowing_fixture):
+        slide, shapes_, expected_value = overflowing_fixture
+        shapes = slide.find_overflowing()
+        if expected_value:
+            shapes_.overflowing.assert_called_once_with((0, 0, 400, 300))
+        assert shapes == expected_value
+
     def it_knows_whether_it_has_a_notes_slide(self, has_notes_slide_fixture):
         slide, expected_value = has_notes_slide_fixture
         assert slide.has_notes_slide is expected_value
@@ -398,6 +405,20 @@ class DescribeSlide(object):
         slide_part_.notes_slide = notes_slide_
         return slide, notes_slide_
 
+    @pytest.fixture(params=[
+        (400, 300,  ['shape']),
+        (None, 300, []),
+    ])
+    def overflowing_fixture(self, request, part_prop_, slide_part_,
+                            shapes_prop_, shapes_):
+        slide_width, slide_height, expected_value = request.param
+        slide = Slide(None, None)
+        presentation = slide_part_.package.presentation_part.presentation
+        presentation.slide_width = slide_width
+        presentation.slide_height = slide_height
+        shapes_.overflowing.return_value = expected_value
+        return slide, shapes_, expected_value
+
     @pytest.fixture
     def placeholders_fixture(self, SlidePlaceholders_, placeholders_):
         sld = element('p:sld/p:cSld/p:spTree')
@@ -464,6 +485,10 @@ class DescribeSlide(object):
     def shapes_(self, request):
         return instance_mock(request, SlideShapes)
 
+    @pytest.fixture
+    def shapes_prop_(self, request, shapes_):
+        return property_mock(request, Slide, 'shapes', return_value=shapes_)
+
     @pytest.fixture
     def slide_layout_(self, request):
         return instance_mock(request, SlideLayout)
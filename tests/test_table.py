@@ -8,19 +8,21 @@ from __future__ import (
 
 import pytest
 
+from pptx.dml.color import RGBColor
 from pptx.dml.fill import FillFormat
 from pptx.enum.text import MSO_ANCHOR
 from pptx.oxml.ns import qn
+from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.oxml.table import CT_Table, CT_TableCell, TcRange
 from pptx.shapes.graphfrm import GraphicFrame
 from pptx.table import (
-    _Cell, _CellCollection, _Column, _ColumnCollection, _Row, _RowCollection,
-    Table
+    _Cell, _CellCollection, _CellRange, _Column, _ColumnCollection, _Row,
+    _RowCollection, Table
 )
 from pptx.util import Inches, Length, Pt
 
 from .unitutil.cxml import element, xml
-from .unitutil.mock import call, class_mock, instance_mock
+from .unitutil.mock import call, class_mock, instance_mock, property_mock
 
 
 class DescribeTable(object):
@@ -57,6 +59,22 @@ class DescribeTable(object):
             call(tc, table) for tc in expected_tcs
         ]
 
+    def it_provides_access_to_a_range_of_its_cells(self, range_fixture):
+        table, corners, expected_idxs = range_fixture
+        tcs = table._tbl.xpath('.//a:tc')
+
+        cell_range = table.range(*corners)
+
+        assert isinstance(cell_range, _CellRange)
+        assert [cell._tc for cell in cell_range.iter_cells()] == [
+            tcs[idx] for idx in expected_idxs
+        ]
+
+    def it_raises_on_a_range_outside_the_table(self):
+        table = Table(element('a:tbl/a:tr/(a:tc,a:tc)'), None)
+        with pytest.raises(IndexError):
+            table.range(0, 0, 1, 1)
+
     def it_provides_access_to_its_rows(self, rows_fixture):
         table, expected_rows_ = rows_fixture
         assert table.rows is expected_rows_
@@ -71,6 +89,65 @@ class DescribeTable(object):
         table.notify_height_changed()
         assert table._graphic_frame.height == expected_height
 
+    def it_can_defer_graphic_frame_resizing(self):
+        graphicFrame = CT_GraphicalObjectFrame.new_table_graphicFrame(
+            1, 'Table 0', 2, 2, 0, 0, 3, 7
+        )
+        tbl = graphicFrame.graphic.graphicData.tbl
+        table = Table(tbl, GraphicFrame(graphicFrame, None))
+
+        with table.deferred_layout():
+            with table.deferred_layout():
+                table.columns[0].width = 10
+                table.columns[1].width = 20
+            table.rows[0].height = 30
+            table.rows[1].height = 40
+            assert (graphicFrame.cx, graphicFrame.cy) == (3, 7)
+
+        assert (graphicFrame.cx, graphicFrame.cy) == (30, 70)
+
+    def but_it_only_resizes_the_dimension_that_changed(self):
+        graphicFrame = CT_GraphicalObjectFrame.new_table_graphicFrame(
+            1, 'Table 0', 2, 2, 0, 0, 3, 7
+        )
+        tbl = graphicFrame.graphic.graphicData.tbl
+        table = Table(tbl, GraphicFrame(graphicFrame, None))
+        # ---frame taller than the sum of its row heights---
+        graphicFrame.cy = 99
+
+        with table.deferred_layout():
+            table.columns[0].width = 10
+
+        assert (graphicFrame.cx, graphicFrame.cy) == (12, 99)
+
+    def it_can_set_all_its_column_widths(self, graphic_frame_):
+        tbl = element('a:tbl/a:tblGrid/(a:gridCol{w=1},a:gridCol{w=2})')
+        table = Table(tbl, graphic_frame_)
+
+        table.set_column_widths([Inches(1), 42])
+
+        assert tbl.xml == xml(
+            'a:tbl/a:tblGrid/(a:gridCol{w=914400},a:gridCol{w=42})'
+        )
+        assert table._graphic_frame.width == 914442
+
+    def it_can_set_all_its_row_heights(self, graphic_frame_):
+        tbl = element('a:tbl/(a:tr{h=1}/a:tc,a:tr{h=2}/a:tc)')
+        table = Table(tbl, graphic_frame_)
+
+        table.set_row_heights(iter([24, 42]))
+
+        assert tbl.xml == xml('a:tbl/(a:tr{h=24}/a:tc,a:tr{h=42}/a:tc)')
+        assert table._graphic_frame.height == 66
+
+    def it_raises_when_sizes_dont_match_rows_or_columns(self):
+        tbl = element('a:tbl/(a:tblGrid/a:gridCol{w=1},a:tr{h=1}/a:tc)')
+        table = Table(tbl, None)
+        with pytest.raises(ValueError):
+            table.set_column_widths([1, 2])
+        with pytest.raises(ValueError):
+            table.set_row_heights([])
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -92,6 +169,20 @@ class DescribeTable(object):
         expected_height = 300
         return table, expected_height
 
+    @pytest.fixture(params=[
+        ((0, 0, 0, 0), [0]),
+        ((0, 0, 1, 2), [0, 1, 2, 3, 4, 5]),
+        ((1, 2, 0, 1), [1, 2, 4, 5]),
+        ((0, 1, 1, 1), [1, 4]),
+    ])
+    def range_fixture(self, request):
+        corners, expected_idxs = request.param
+        table = Table(
+            element('a:tbl/(a:tr/(a:tc,a:tc,a:tc),a:tr/(a:tc,a:tc,a:tc))'),
+            None
+        )
+        return table, corners, expected_idxs
+
     @pytest.fixture
     def rows_fixture(self, table, rows_):
         table._rows = rows_
@@ -545,6 +636,19 @@ class Describe_CellCollection(object):
         with pytest.raises(IndexError):
             cells[9]
 
+    def it_can_format_all_the_cells_in_the_row(self):
+        tbl = element('a:tbl/(a:tr/a:tc,a:tr/(a:tc,a:tc))')
+        cells = _CellCollection(tbl.tr_lst[1], None)
+
+        cells.set_fill_color(
+            lambda row_idx, col_idx: RGBColor(row_idx, col_idx, 0)
+        )
+
+        assert tbl.xml == xml(
+            'a:tbl/(a:tr/a:tc,a:tr/(a:tc/a:tcPr/a:solidFill/a:srgbClr{val=01'
+            '0000},a:tc/a:tcPr/a:solidFill/a:srgbClr{val=010100}))'
+        )
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
@@ -584,6 +688,115 @@ class Describe_CellCollection(object):
         return instance_mock(request, _Cell)
 
 
+class Describe_CellRange(object):
+
+    def it_can_set_the_fill_color_of_its_cells(self, fill_fixture):
+        cell_range, color, tbl, expected_xml = fill_fixture
+        cell_range.set_fill_color(color)
+        assert tbl.xml == expected_xml
+
+    def it_can_set_the_font_of_its_cells(self, font_fixture):
+        cell_range, kwargs, tbl, expected_xml = font_fixture
+        cell_range.set_font(**kwargs)
+        assert tbl.xml == expected_xml
+
+    def it_raises_on_a_color_other_than_RGBColor_or_hex_str(
+            self, bad_color_fixture):
+        method_name, kwargs = bad_color_fixture
+        tbl = element('a:tbl/a:tr/a:tc/a:txBody/a:p')
+        cell_range = _CellRange(tbl, 0, 0, 1, 1, None)
+        expected_xml = tbl.xml
+
+        with pytest.raises(ValueError):
+            getattr(cell_range, method_name)(**kwargs)
+
+        assert tbl.xml == expected_xml
+
+    def it_can_set_the_margins_of_its_cells(self, margins_fixture):
+        cell_range, kwargs, tbl, expected_xml = margins_fixture
+        cell_range.set_margins(**kwargs)
+        assert tbl.xml == expected_xml
+
+    def it_raises_on_margin_assigned_other_than_int(self):
+        tbl = element('a:tbl/a:tr/a:tc')
+        cell_range = _CellRange(tbl, 0, 0, 1, 1, None)
+        with pytest.raises(TypeError):
+            cell_range.set_margins(top=1.5)
+
+    def it_can_set_the_vertical_anchor_of_its_cells(self):
+        tbl = element('a:tbl/a:tr/(a:tc,a:tc/a:tcPr{anchor=b})')
+        cell_range = _CellRange(tbl, 0, 0, 1, 2, None)
+
+        cell_range.set_vertical_anchor(MSO_ANCHOR.MIDDLE)
+
+        assert tbl.xml == xml(
+            'a:tbl/a:tr/(a:tc/a:tcPr{anchor=ctr},a:tc/a:tcPr{anchor=ctr})'
+        )
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('set_fill_color', {'color': 0xFF0000}),
+        ('set_fill_color', {'color': 'FF00'}),
+        ('set_fill_color', {'color': lambda row_idx, col_idx: '"/><a:'}),
+        ('set_font', {'color': (255, 0, 0)}),
+        ('set_font', {'color': 'red'}),
+    ])
+    def bad_color_fixture(self, request):
+        return request.param
+
+    @pytest.fixture(params=[
+        (RGBColor(1, 2, 3),
+         'a:tbl/(a:tr/(a:tc,a:tc),a:tr/(a:tc/a:tcPr/a:solidFill/a:srgbClr{v'
+         'al=010203},a:tc/a:tcPr/a:solidFill/a:srgbClr{val=010203}))'),
+        (lambda row_idx, col_idx: RGBColor(9, 9, 9) if col_idx else None,
+         'a:tbl/(a:tr/(a:tc,a:tc),a:tr/(a:tc/a:tcPr/a:noFill,a:tc/a:tcPr/a:'
+         'solidFill/a:srgbClr{val=090909}))'),
+        ('f0f0f0',
+         'a:tbl/(a:tr/(a:tc,a:tc),a:tr/(a:tc/a:tcPr/a:solidFill/a:srgbClr{v'
+         'al=F0F0F0},a:tc/a:tcPr/a:solidFill/a:srgbClr{val=F0F0F0}))'),
+    ])
+    def fill_fixture(self, request):
+        color, expected_cxml = request.param
+        tbl = element(
+            'a:tbl/(a:tr/(a:tc,a:tc),a:tr/(a:tc/a:tcPr/a:noFill,a:tc/a:tcPr'
+            '/a:noFill))'
+        )
+        cell_range = _CellRange(tbl, 1, 0, 2, 2, None)
+        return cell_range, color, tbl, xml(expected_cxml)
+
+    @pytest.fixture(params=[
+        ({'size': Pt(12), 'bold': True},
+         'a:p/(a:r/(a:rPr{sz=1200,b=1},a:t"foo"),a:endParaRPr{sz=1200,b=1})'),
+        ({'italic': False, 'name': 'Arial'},
+         'a:p/(a:r/(a:rPr{i=0}/a:latin{typeface=Arial},a:t"foo"),a:endParaR'
+         'Pr{i=0}/a:latin{typeface=Arial})'),
+        ({'color': RGBColor(0xFF, 0, 0)},
+         'a:p/(a:r/(a:rPr/a:solidFill/a:srgbClr{val=FF0000},a:t"foo"),a:end'
+         'ParaRPr/a:solidFill/a:srgbClr{val=FF0000})'),
+    ])
+    def font_fixture(self, request):
+        kwargs, expected_p_cxml = request.param
+        tbl = element('a:tbl/a:tr/a:tc/a:txBody/a:p/a:r/a:t"foo"')
+        cell_range = _CellRange(tbl, 0, 0, 1, 1, None)
+        expected_xml = xml('a:tbl/a:tr/a:tc/a:txBody/%s' % expected_p_cxml)
+        return cell_range, kwargs, tbl, expected_xml
+
+    @pytest.fixture(params=[
+        ({'left': 42}, 'a:tcPr{marL=42}'),
+        ({'top': 1, 'right': 2, 'bottom': 3},
+         'a:tcPr{marT=1,marR=2,marB=3}'),
+    ])
+    def margins_fixture(self, request):
+        kwargs, expected_tcPr_cxml = request.param
+        tbl = element('a:tbl/(a:tr/a:tc,a:tr/a:tc)')
+        cell_range = _CellRange(tbl, 0, 0, 1, 1, None)
+        expected_xml = xml(
+            'a:tbl/(a:tr/a:tc/%s,a:tr/a:tc)' % expected_tcPr_cxml
+        )
+        return cell_range, kwargs, tbl, expected_xml
+
+
 class Describe_Column(object):
 
     def it_knows_its_width(self, width_get_fixture):
@@ -598,6 +811,19 @@ class Describe_Column(object):
         assert column._gridCol.xml == expected_xml
         parent_.notify_width_changed.assert_called_once_with()
 
+    def it_provides_access_to_its_cells(self):
+        tbl = element(
+            'a:tbl/(a:tblGrid/(a:gridCol,a:gridCol),a:tr/(a:tc,a:tc),a:tr/(a'
+            ':tc,a:tc))'
+        )
+        tcs = tbl.xpath('.//a:tc')
+        column = _Column(tbl.tblGrid.gridCol_lst[1], None)
+
+        cells = column.cells
+
+        assert isinstance(cells, _CellRange)
+        assert [cell._tc for cell in cells.iter_cells()] == [tcs[1], tcs[3]]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
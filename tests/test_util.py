@@ -6,10 +6,14 @@ Test suite for pptx.util module.
 
 from __future__ import absolute_import
 
+import threading
+
 import pytest
 
 from pptx.compat import to_unicode
-from pptx.util import Length, Centipoints, Cm, Emu, Inches, Mm, Pt
+from pptx.util import (
+    Deferral, Length, Centipoints, Cm, Emu, Inches, Mm, Pt
+)
 
 
 def test_to_unicode_raises_on_non_string():
@@ -18,6 +22,69 @@ def test_to_unicode_raises_on_non_string():
         to_unicode(999)
 
 
+class DescribeDeferral(object):
+
+    def it_does_the_work_now_outside_a_block(self):
+        flushed = []
+        deferral = Deferral(flush=flushed.append)
+        assert deferral.record('a') is False
+        assert flushed == []
+
+    def it_flushes_the_recorded_work_when_the_outermost_block_exits(self):
+        flushed = []
+        deferral = Deferral(flush=flushed.append)
+
+        with deferral.deferring():
+            with deferral.deferring():
+                assert deferral.record('a') is True
+            assert flushed == []
+            deferral.record('b')
+            deferral.record('a')
+
+        assert flushed == [['a', 'b', 'a']]
+        assert deferral.depth == 0
+
+    def but_it_discards_the_recorded_work_when_the_block_raises(self):
+        flushed = []
+        deferral = Deferral(flush=flushed.append)
+
+        with pytest.raises(KeyError):
+            with deferral.deferring():
+                deferral.record('a')
+                raise KeyError
+
+        assert flushed == []
+        assert deferral.record('b') is False
+
+        with deferral.deferring():
+            deferral.record('c')
+
+        assert flushed == [['c']]
+
+    def it_does_not_replace_the_exception_raised_in_the_block(self):
+        def flush(pending):
+            raise ValueError
+
+        deferral = Deferral(flush=flush)
+
+        with pytest.raises(KeyError):
+            with deferral.deferring():
+                deferral.record('a')
+                raise KeyError
+
+    def it_keeps_separate_work_for_each_thread(self):
+        flushed = []
+        deferral = Deferral(flush=flushed.append)
+
+        with deferral.deferring():
+            deferral.record('a')
+            thread = threading.Thread(target=deferral.record, args=('b',))
+            thread.start()
+            thread.join()
+
+        assert flushed == [['a']]
+
+
 class DescribeLength(object):
 
     def it_can_construct_from_convenient_units(self, construct_fixture):
@@ -7,13 +7,16 @@ Test suite for pptx.text.fonts module
 from __future__ import absolute_import, print_function, unicode_literals
 
 import io
+import json
+import os
 import pytest
 
-from struct import calcsize
+from struct import calcsize, pack
 
 from pptx.compat import BytesIO
 from pptx.text.fonts import (
-    _BaseTable, _Font, FontFiles, _HeadTable, _NameTable, _Stream,
+    _BaseTable, _CmapTable, _Font, FontFiles, _FontIndex, _GlyphMetrics,
+    _HeadTable, _HheaTable, _HmtxTable, _KernTable, _NameTable, _Stream,
     _TableFactory
 )
 
@@ -32,11 +35,20 @@ class DescribeFontFiles(object):
         assert path == expected_path
 
     def it_catalogs_the_system_fonts_to_help_find(self, installed_fixture):
-        expected_call_args, expected_values = installed_fixture
+        expected_call_args, font_index_, expected_values = installed_fixture
         installed_fonts = FontFiles._installed_fonts()
         assert FontFiles._iter_font_files_in.call_args_list == (
             expected_call_args
         )
+        font_index_.save.assert_called_once_with(
+            ['d', 'd_2'], {'d': 42.0}, expected_values
+        )
+        assert installed_fonts == expected_values
+
+    def but_it_uses_the_font_index_when_current(self, index_fixture):
+        expected_values = index_fixture
+        installed_fonts = FontFiles._installed_fonts()
+        assert FontFiles._iter_font_files_in.call_count == 0
         assert installed_fonts == expected_values
 
     def it_generates_font_dirs_to_help_find(self, font_dirs_fixture):
@@ -54,6 +66,11 @@ class DescribeFontFiles(object):
         font_dirs = FontFiles._windows_font_directories()
         assert font_dirs == expected_dirs
 
+    def it_knows_linux_font_dirs_to_help_find(self, linux_dirs_fixture):
+        expected_dirs = linux_dirs_fixture
+        font_dirs = FontFiles._linux_font_directories()
+        assert font_dirs == expected_dirs
+
     def it_iterates_over_fonts_in_dir_to_help_find(self, iter_fixture):
         directory, _Font_, expected_calls, expected_paths = iter_fixture
         paths = list(FontFiles._iter_font_files_in(directory))
@@ -63,6 +80,11 @@ class DescribeFontFiles(object):
         assert _Font_.open.call_args_list == expected_calls
         assert paths == expected_paths
 
+    def it_skips_unreadable_font_files_to_help_find(self, _Font_):
+        _Font_.open.side_effect = ValueError('not a font file')
+        paths = list(FontFiles._iter_font_files_in(test_file_dir))
+        assert paths == []
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(params=[
@@ -77,14 +99,16 @@ class DescribeFontFiles(object):
     @pytest.fixture(params=[
         ('darwin', ['a', 'b']),
         ('win32',  ['c', 'd']),
+        ('linux',  ['e', 'f']),
     ])
     def font_dirs_fixture(
-            self, request, _os_x_font_directories_,
+            self, request, _linux_font_directories_, _os_x_font_directories_,
             _windows_font_directories_):
         platform, expected_dirs = request.param
         dirs_meth_mock = {
             'darwin': _os_x_font_directories_,
             'win32':  _windows_font_directories_,
+            'linux':  _linux_font_directories_,
         }[platform]
         sys_ = var_mock(request, 'pptx.text.fonts.sys')
         sys_.platform = platform
@@ -92,8 +116,20 @@ class DescribeFontFiles(object):
         return expected_dirs
 
     @pytest.fixture
-    def installed_fixture(self, _iter_font_files_in_, _font_directories_):
+    def index_fixture(
+            self, _iter_font_files_in_, _font_directories_, _FontIndex_):
+        _font_directories_.return_value = ['d']
+        fonts = {('A', True, False): 'a.ttf'}
+        _FontIndex_.return_value.load.return_value = fonts
+        return fonts
+
+    @pytest.fixture
+    def installed_fixture(
+            self, _iter_font_files_in_, _font_directories_, _FontIndex_):
         _font_directories_.return_value = ['d', 'd_2']
+        font_index_ = _FontIndex_.return_value
+        font_index_.load.return_value = None
+        _FontIndex_.directory_mtimes.return_value = {'d': 42.0}
         _iter_font_files_in_.side_effect = [
             [(('A', True,  False), 'a.ttf')],
             [(('B', False, True),  'b.ttf')],
@@ -103,7 +139,7 @@ class DescribeFontFiles(object):
             ('A', True,  False): 'a.ttf',
             ('B', False, True):  'b.ttf',
         }
-        return expected_call_args, expected_values
+        return expected_call_args, font_index_, expected_values
 
     @pytest.fixture
     def iter_fixture(self, _Font_):
@@ -115,6 +151,21 @@ class DescribeFontFiles(object):
         expected_paths = [(('Arial', True, True), font_file_path)]
         return directory, _Font_, expected_calls, expected_paths
 
+    @pytest.fixture
+    def linux_dirs_fixture(self, request):
+        os_ = var_mock(request, 'pptx.text.fonts.os')
+        os_.path = os.path
+        os_.environ = {
+            'HOME': '/home/fbar',
+            'XDG_DATA_DIRS': '/usr/share:/opt/share',
+        }
+        return [
+            '/opt/share/fonts',
+            '/usr/share/fonts',
+            '/home/fbar/.local/share/fonts',
+            '/home/fbar/.fonts',
+        ]
+
     @pytest.fixture
     def osx_dirs_fixture(self, request):
         import os
@@ -143,6 +194,11 @@ class DescribeFontFiles(object):
     def _font_directories_(self, request):
         return method_mock(request, FontFiles, '_font_directories')
 
+    @pytest.fixture
+    def _FontIndex_(self, request):
+        method_mock(request, FontFiles, '_font_index_path')
+        return class_mock(request, 'pptx.text.fonts._FontIndex')
+
     @pytest.fixture
     def _installed_fonts_(self, request):
         _installed_fonts_ = method_mock(
@@ -159,6 +215,10 @@ class DescribeFontFiles(object):
     def _iter_font_files_in_(self, request):
         return method_mock(request, FontFiles, '_iter_font_files_in')
 
+    @pytest.fixture
+    def _linux_font_directories_(self, request):
+        return method_mock(request, FontFiles, '_linux_font_directories')
+
     @pytest.fixture
     def _os_x_font_directories_(self, request):
         return method_mock(request, FontFiles, '_os_x_font_directories')
@@ -168,6 +228,73 @@ class DescribeFontFiles(object):
         return method_mock(request, FontFiles, '_windows_font_directories')
 
 
+class Describe_FontIndex(object):
+
+    def it_can_save_and_load_a_font_catalog(self, tmpdir):
+        font_dir = str(tmpdir.mkdir('fonts'))
+        index_path = str(tmpdir.join('cache', 'font-index.json'))
+        fonts = {
+            ('Foo', True, False): '/fonts/foob.ttf',
+            ('Bar', False, True): '/fonts/bari.ttf',
+        }
+        font_index = _FontIndex(index_path)
+
+        font_index.save(
+            [font_dir], _FontIndex.directory_mtimes([font_dir]), fonts
+        )
+
+        assert font_index.load([font_dir]) == fonts
+
+    def it_records_the_mtime_of_each_font_directory(self, tmpdir):
+        font_dir = tmpdir.mkdir('fonts')
+        font_dir.mkdir('truetype')
+        mtimes = _FontIndex.directory_mtimes([str(font_dir), '/no/such/dir'])
+        assert sorted(mtimes.keys()) == [
+            str(font_dir), str(font_dir.join('truetype'))
+        ]
+
+    def it_ignores_a_stale_index(self, stale_fixture):
+        font_index, directories = stale_fixture
+        assert font_index.load(directories) is None
+
+    def it_ignores_a_missing_or_corrupt_index(self, tmpdir):
+        index_file = tmpdir.join('font-index.json')
+        font_index = _FontIndex(str(index_file))
+        assert font_index.load([]) is None
+        index_file.write('{"version": 1, "direc')
+        assert font_index.load([]) is None
+
+    def it_does_not_raise_when_the_index_cannot_be_saved(self, tmpdir):
+        blocker = tmpdir.join('blocker')
+        blocker.write('')
+        font_index = _FontIndex(str(blocker.join('font-index.json')))
+        font_index.save([], {}, {})
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture(params=['version', 'dirs', 'mtime', 'subdir'])
+    def stale_fixture(self, request, tmpdir):
+        font_dir = tmpdir.mkdir('fonts')
+        directories = [str(font_dir)]
+        index_file = tmpdir.join('font-index.json')
+        font_index = _FontIndex(str(index_file))
+        font_index.save(
+            directories, _FontIndex.directory_mtimes(directories), {}
+        )
+        index = json.loads(index_file.read())
+        change = request.param
+        if change == 'version':
+            index['version'] = 0
+        elif change == 'dirs':
+            directories = directories + [str(tmpdir.mkdir('more_fonts'))]
+        elif change == 'mtime':
+            index['mtimes'][str(font_dir)] -= 10.0
+        elif change == 'subdir':
+            index['mtimes'][str(font_dir.join('gone'))] = 1.0
+        index_file.write(json.dumps(index))
+        return font_index, directories
+
+
 class Describe_Font(object):
 
     def it_can_construct_from_a_font_file_path(self, open_fixture):
@@ -211,6 +338,14 @@ class Describe_Font(object):
         font._stream.read_fields.assert_called_once_with('>4sHHHH', 0)
         assert fields == expected_values
 
+    def it_provides_its_glyph_metrics(self):
+        with _Font.open(testfile('calibriz.ttf')) as font:
+            glyph_metrics = font.glyph_metrics
+        assert glyph_metrics._units_per_em == 2048
+        assert glyph_metrics._glyph_ids[ord('T')] == 100
+        assert glyph_metrics._advance_widths[100] == 1014
+        assert glyph_metrics._kerning_pairs[(100, 455)] == -55
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(params=[
@@ -345,6 +480,52 @@ class Describe_Font(object):
         return property_mock(request, _Font, '_tables')
 
 
+class Describe_GlyphMetrics(object):
+
+    def it_computes_the_width_of_a_line_of_text(self, width_fixture):
+        glyph_metrics, text, point_size, kerning, expected_value = (
+            width_fixture
+        )
+        width = glyph_metrics.text_width(text, point_size, kerning)
+        assert width == expected_value
+
+    def it_computes_the_line_height(self, glyph_metrics):
+        assert glyph_metrics.line_height(10) == 10.0
+        assert glyph_metrics.line_height(24) == 24.0
+
+    def it_loads_the_metrics_once_per_font_file(self, request):
+        var_mock(request, 'pptx.text.fonts._GlyphMetrics._cache', new={})
+        path = testfile('calibriz.ttf')
+        glyph_metrics = _GlyphMetrics.from_path(path)
+        assert isinstance(glyph_metrics, _GlyphMetrics)
+        assert _GlyphMetrics.from_path(path) is glyph_metrics
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture(params=[
+        ('AV',  10, False, 13.0),
+        ('AV',  20, False, 26.0),
+        ('AV',  10, True,  12.2),
+        ('A?V', 10, False, 18.0),
+        ('AW',  10, False, 13.0),
+        ('',    10, False, 0.0),
+    ])
+    def width_fixture(self, request, glyph_metrics):
+        text, point_size, kerning, expected_value = request.param
+        return glyph_metrics, text, point_size, kerning, expected_value
+
+    # fixture components -----------------------------------
+
+    @pytest.fixture
+    def glyph_metrics(self):
+        glyph_ids = {ord('A'): 1, ord('V'): 2, ord('W'): 3}
+        advance_widths = (500, 600, 700)
+        kerning_pairs = {(1, 2): -80}
+        return _GlyphMetrics(
+            1000, 800, -200, glyph_ids, advance_widths, kerning_pairs
+        )
+
+
 class Describe_Stream(object):
 
     def it_can_construct_from_a_path(self, open_fixture):
@@ -427,13 +608,19 @@ class Describe_TableFactory(object):
 
     # fixtures ---------------------------------------------
 
-    @pytest.fixture(params=['name', 'head', 'foob'])
+    @pytest.fixture(params=[
+        'name', 'head', 'cmap', 'hhea', 'hmtx', 'kern', 'foob'
+    ])
     def fixture(self, request, stream_):
         tag = request.param
         offset, length = 42, 21
         TableClass, target = {
             'name': (_NameTable, 'pptx.text.fonts._NameTable'),
             'head': (_HeadTable, 'pptx.text.fonts._HeadTable'),
+            'cmap': (_CmapTable, 'pptx.text.fonts._CmapTable'),
+            'hhea': (_HheaTable, 'pptx.text.fonts._HheaTable'),
+            'hmtx': (_HmtxTable, 'pptx.text.fonts._HmtxTable'),
+            'kern': (_KernTable, 'pptx.text.fonts._KernTable'),
             'foob': (_BaseTable, 'pptx.text.fonts._BaseTable'),
         }[tag]
         TableClass_ = class_mock(request, target)
@@ -500,6 +687,97 @@ class Describe_HeadTable(object):
         return property_mock(request, _HeadTable, '_macStyle')
 
 
+class Describe_CmapTable(object):
+
+    def it_maps_code_points_to_glyph_ids(self, glyph_ids_fixture):
+        cmap_table, expected_value = glyph_ids_fixture
+        assert cmap_table.glyph_ids == expected_value
+
+    def but_it_raises_when_no_unicode_subtable(self):
+        bytes_ = pack('>HHHHL', 0, 1, 1, 1, 12) + pack('>HHH', 6, 10, 0)
+        stream = _Stream(BytesIO(bytes_))
+        cmap_table = _CmapTable(None, stream, 0, len(bytes_))
+        with pytest.raises(KeyError):
+            cmap_table.glyph_ids
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture(params=['format_4', 'format_12'])
+    def glyph_ids_fixture(self, request):
+        if request.param == 'format_4':
+            # ---segments A-C by delta, x-y by glyph id array, and end mark---
+            subtable = (
+                pack('>HHHHHHH', 4, 0, 0, 6, 0, 0, 0) +
+                pack('>HHH', 0x43, 0x79, 0xFFFF) + b'\x00\x00' +
+                pack('>HHH', 0x41, 0x78, 0xFFFF) +
+                pack('>HHH', 0xFFFF - 0x41 + 5, 0, 1) +
+                pack('>HHH', 0, 4, 0) +
+                pack('>HH', 42, 0)
+            )
+            expected_value = {0x41: 4, 0x42: 5, 0x43: 6, 0x78: 42}
+        else:
+            subtable = (
+                pack('>HHLLL', 12, 0, 0, 0, 2) +
+                pack('>LLL', 0x41, 0x42, 7) +
+                pack('>LLL', 0x1F600, 0x1F600, 9)
+            )
+            expected_value = {0x41: 7, 0x42: 8, 0x1F600: 9}
+        bytes_ = pack('>HHHHL', 0, 1, 3, 1, 12) + subtable
+        stream = _Stream(BytesIO(bytes_))
+        cmap_table = _CmapTable(None, stream, 0, len(bytes_))
+        return cmap_table, expected_value
+
+
+class Describe_HheaTable(object):
+
+    def it_knows_its_horizontal_metrics_fields(self):
+        bytes_ = pack('>4shhhH11hH', b'\x00\x01\x00\x00', 1950, -550, 0,
+                      2720, *([0]*11 + [3913]))
+        stream = _Stream(BytesIO(bytes_))
+        hhea_table = _HheaTable(None, stream, 0, len(bytes_))
+        assert hhea_table.ascender == 1950
+        assert hhea_table.descender == -550
+        assert hhea_table.num_h_metrics == 3913
+
+
+class Describe_HmtxTable(object):
+
+    def it_reads_the_advance_widths(self):
+        bytes_ = pack('>HhHhHh', 1000, 10, 1200, -5, 600, 0) + pack('>h', 3)
+        stream = _Stream(BytesIO(bytes_))
+        hmtx_table = _HmtxTable(None, stream, 0, len(bytes_))
+        assert hmtx_table.advance_widths(3) == (1000, 1200, 600)
+
+    def but_it_raises_when_there_are_no_metrics(self):
+        hmtx_table = _HmtxTable(None, None, 0, 0)
+        with pytest.raises(ValueError):
+            hmtx_table.advance_widths(0)
+
+
+class Describe_KernTable(object):
+
+    def it_reads_the_kerning_pairs(self, pairs_fixture):
+        kern_table, expected_value = pairs_fixture
+        assert kern_table.pairs == expected_value
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture(params=[
+        (0, 0x0001, {(1, 2): -80, (3, 4): 15}),
+        (0, 0x0003, {}),
+        (0, 0x0201, {}),
+        (1, 0x0001, {}),
+    ])
+    def pairs_fixture(self, request):
+        version, coverage, expected_value = request.param
+        pairs = pack('>HHh', 1, 2, -80) + pack('>HHh', 3, 4, 15)
+        subtable = pack('>HHHHHHH', 0, 14 + len(pairs), coverage, 2, 0, 0, 0)
+        bytes_ = pack('>HH', version, 1) + subtable + pairs
+        stream = _Stream(BytesIO(bytes_))
+        kern_table = _KernTable(None, stream, 0, len(bytes_))
+        return kern_table, expected_value
+
+
 class Describe_NameTable(object):
 
     def it_knows_the_font_family_name(self, family_fixture):
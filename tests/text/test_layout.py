@@ -9,9 +9,12 @@ from __future__ import absolute_import, print_function, unicode_literals
 import pytest
 
 from pptx.text.layout import (
-    _BinarySearchTree, _Line, _LineSource, TextFitter
+    _BinarySearchTree, _Fonts, _LineSource, _prefix_sums, _rendered_size,
+    TextFitter
 )
 
+from ..unitutil.file import testfile
+
 from ..unitutil.mock import (
     call, class_mock, function_mock, initializer_mock, instance_mock,
     method_mock, property_mock
@@ -34,6 +37,27 @@ class DescribeTextFitter(object):
         _best_fit_font_size_.assert_called_once_with(max_size)
         assert font_size is font_size_
 
+    def it_can_determine_the_best_fit_font_size_of_many_texts(
+            self, sizes_fixture):
+        jobs, workers, use_threads = sizes_fixture
+        font_file = testfile('calibriz.ttf')
+        expected_value = [
+            TextFitter.best_fit_font_size(text, extents, 42, font_file)
+            for text, extents in jobs
+        ]
+
+        font_sizes = TextFitter.best_fit_font_sizes(
+            jobs, 42, font_file, workers, use_threads
+        )
+
+        assert font_sizes == expected_value
+
+    def it_uses_a_pool_by_default_only_for_a_large_batch(
+            self, default_workers_fixture):
+        job_count, expected_value = default_workers_fixture
+        workers = TextFitter._default_workers(job_count)
+        assert workers == expected_value
+
     def it_finds_best_fit_font_size_to_help_best_fit(self, _best_fit_fixture):
         text_fitter, max_size, _BinarySearchTree_ = _best_fit_fixture[:3]
         sizes_, predicate_, font_size_ = _best_fit_fixture[3:]
@@ -47,57 +71,64 @@ class DescribeTextFitter(object):
         assert font_size is font_size_
 
     def it_provides_a_fits_inside_predicate_fn(self, fits_pred_fixture):
-        text_fitter, point_size = fits_pred_fixture[:2]
-        _rendered_size_, expected_bool_value = fits_pred_fixture[2:]
+        text_fitter, point_size, max_lines = fits_pred_fixture[:3]
+        _rendered_size_, expected_bool_value = fits_pred_fixture[3:]
 
         predicate = text_fitter._fits_inside_predicate
         result = predicate(point_size)
 
-        text_fitter._wrap_lines.assert_called_once_with(
-            text_fitter._line_source, point_size
-        )
         _rendered_size_.assert_called_once_with(
             'Ty', point_size, text_fitter._font_file
         )
+        text_fitter._wrap_lines.assert_called_once_with(
+            point_size, max_lines
+        )
         assert result is expected_bool_value
 
-    def it_provides_a_fits_in_width_predicate_fn(self, fits_cx_pred_fixture):
-        text_fitter, point_size, line = fits_cx_pred_fixture[:3]
-        _rendered_size_, expected_value = fits_cx_pred_fixture[3:]
-
-        predicate = text_fitter._fits_in_width_predicate(point_size)
-        result = predicate(line)
-
-        _rendered_size_.assert_called_once_with(
-            line.text, point_size, text_fitter._font_file
+    def it_wraps_lines_to_help_best_fit(self, wrap_fixture):
+        text_fitter, point_size, max_lines, expected_value = wrap_fixture
+        lines = text_fitter._wrap_lines(point_size, max_lines)
+        text_fitter._word_widths.assert_called_once_with(point_size)
+        assert lines == expected_value
+
+    def it_scales_glyph_metric_word_widths_by_point_size(self, _Fonts_):
+        _Fonts_.metrics.return_value.text_width.side_effect = (
+            lambda text, point_size: len(text) * point_size
         )
-        assert result is expected_value
+        line_source = _LineSource('foo ba')
+        text_fitter = TextFitter(line_source, (1270000, None), 'foo.ttf')
 
-    def it_wraps_lines_to_help_best_fit(self, wrap_fixture):
-        text_fitter, line_source, point_size, remainder = wrap_fixture
+        word_widths = text_fitter._word_widths(10)
 
-        text_fitter._wrap_lines(line_source, point_size)
+        _Fonts_.metrics.assert_called_once_with('foo.ttf')
+        assert word_widths == ([0, 50800, 88900], 12700, 127000.0)
+        assert text_fitter._word_widths(20)[:2] == word_widths[:2]
+        assert _Fonts_.metrics.call_count == 1
 
-        assert text_fitter._break_line.call_args_list == [
-            call(line_source, point_size),
-            call(remainder, point_size)
-        ]
+    def but_it_renders_word_widths_without_glyph_metrics(
+            self, _Fonts_, _rendered_size_):
+        _Fonts_.metrics.return_value = None
+        _rendered_size_.side_effect = lambda text, point_size, font_file: (
+            len(text) * point_size, None
+        )
+        line_source = _LineSource('foo ba')
+        text_fitter = TextFitter(line_source, (100, None), 'foo.ttf')
 
-    def it_breaks_off_a_line_to_help_wrap(self, break_fixture):
-        text_fitter, line_source_, point_size = break_fixture[:3]
-        _BinarySearchTree_, bst_, predicate_ = break_fixture[3:6]
-        max_value_ = break_fixture[6]
+        word_widths = text_fitter._word_widths(2)
 
-        value = text_fitter._break_line(line_source_, point_size)
+        assert _rendered_size_.call_args_list == [
+            call('foo', 2, 'foo.ttf'),
+            call('ba', 2, 'foo.ttf'),
+            call(' ', 2, 'foo.ttf'),
+        ]
+        assert word_widths == ([0, 8, 14], 2, 100)
 
-        _BinarySearchTree_.from_ordered_sequence.assert_called_once_with(
-            line_source_
-        )
-        text_fitter._fits_in_width_predicate.assert_called_once_with(
-            point_size
-        )
-        bst_.find_max.assert_called_once_with(predicate_)
-        assert value is max_value_
+    def it_fits_text_using_the_font_glyph_metrics(self):
+        text = 'The quick brown fox jumps over the lazy dog. ' * 4
+        extents = (2743200, 914400)
+        font_file = testfile('calibriz.ttf')
+        font_size = TextFitter.best_fit_font_size(text, extents, 42, font_file)
+        assert font_size == 11
 
     # fixtures ---------------------------------------------
 
@@ -124,34 +155,25 @@ class DescribeTextFitter(object):
             font_size_
         )
 
-    @pytest.fixture
-    def break_fixture(
-            self, line_source_, _BinarySearchTree_, bst_,
-            _fits_in_width_predicate_):
-        text_fitter = TextFitter(None, (None, None), None)
-        point_size = 21
-        _BinarySearchTree_.from_ordered_sequence.return_value = bst_
-        predicate_ = _fits_in_width_predicate_.return_value
-        max_value_ = bst_.find_max.return_value
-        return (
-            text_fitter, line_source_, point_size, _BinarySearchTree_, bst_,
-            predicate_, max_value_
-        )
-
-    @pytest.fixture(params=[(49, True), (50, True), (51, False)])
-    def fits_cx_pred_fixture(self, request, _rendered_size_):
-        rendered_width, expected_value = request.param
-        text_fitter = TextFitter(None, (50, None), 'foobar.ttf')
-        point_size, line = 12, _Line('foobar', None)
-        _rendered_size_.return_value = (rendered_width, None)
-        return (
-            text_fitter, point_size, line, _rendered_size_, expected_value
+    @pytest.fixture(params=[
+        (1,   1, 1),
+        (499, 4, 1),
+        (500, 4, 4),
+        (500, 1, 1),
+    ])
+    def default_workers_fixture(self, request):
+        job_count, cpu_count, expected_value = request.param
+        function_mock(
+            request, 'multiprocessing.cpu_count', return_value=cpu_count
         )
+        return job_count, expected_value
 
     @pytest.fixture(params=[
         ((66,  99), 6, ('foo', 'bar'), False),
         ((66, 100), 6, ('foo', 'bar'), True),
         ((66, 101), 6, ('foo', 'bar'), True),
+        ((66, 100), 6, ('foo', 'bar', 'baz'), False),
+        ((66, 100), 6, None, False),
     ])
     def fits_pred_fixture(
             self, request, line_source_, _wrap_lines_, _rendered_size_):
@@ -159,18 +181,47 @@ class DescribeTextFitter(object):
         text_fitter = TextFitter(line_source_, extents, 'foobar.ttf')
         _wrap_lines_.return_value = text_lines
         _rendered_size_.return_value = (None, 50)
-        return text_fitter, point_size, _rendered_size_, expected_value
+        max_lines = extents[1] // 50
+        return (
+            text_fitter, point_size, max_lines, _rendered_size_,
+            expected_value
+        )
 
-    @pytest.fixture
-    def wrap_fixture(self, _break_line_):
-        text_fitter = TextFitter(None, (None, None), None)
-        point_size = 21
-        line_source, remainder = _LineSource('foo bar'), _LineSource('bar')
-        _break_line_.side_effect = [
-            ('foo', remainder),
-            ('bar', _LineSource('')),
+    @pytest.fixture(params=[
+        (1,    False),
+        (2,    True),
+        (2,    False),
+        (None, True),
+    ])
+    def sizes_fixture(self, request):
+        workers, use_threads = request.param
+        text = 'The quick brown fox jumps over the lazy dog. '
+        jobs = [
+            (text,     (2743200, 914400)),
+            (text * 4, (2743200, 914400)),
+            (text,     (2743200, 914400)),
+            (text * 4, (914400, 2743200)),
         ]
-        return text_fitter, line_source, point_size, remainder
+        return jobs, workers, use_threads
+
+    @pytest.fixture(params=[
+        ('foo bar baz', 100, None, ['foo bar', 'baz']),
+        ('foo bar baz', 140, None, ['foo bar baz']),
+        ('foo bar baz',  40, None, ['foo', 'bar', 'baz']),
+        ('foo bar baz',  40, 1,    ['foo', 'bar']),
+        ('foo bar baz',  39, None, None),
+        ('',             40, None, []),
+    ])
+    def wrap_fixture(self, request, _word_widths_):
+        text, max_width, max_lines, expected_value = request.param
+        line_source = _LineSource(text)
+        text_fitter = TextFitter(line_source, (None, None), None)
+        point_size = 21
+        widths = [40] * len(line_source.words)
+        _word_widths_.return_value = (
+            _prefix_sums(widths, 10), 10, max_width
+        )
+        return text_fitter, point_size, max_lines, expected_value
 
     # fixture components -----------------------------------
 
@@ -182,22 +233,14 @@ class DescribeTextFitter(object):
     def _BinarySearchTree_(self, request):
         return class_mock(request, 'pptx.text.layout._BinarySearchTree')
 
-    @pytest.fixture
-    def _break_line_(self, request):
-        return method_mock(request, TextFitter, '_break_line')
-
-    @pytest.fixture
-    def bst_(self, request):
-        return instance_mock(request, _BinarySearchTree)
-
-    @pytest.fixture
-    def _fits_in_width_predicate_(self, request):
-        return method_mock(request, TextFitter, '_fits_in_width_predicate')
-
     @pytest.fixture
     def _fits_inside_predicate_(self, request):
         return property_mock(request, TextFitter, '_fits_inside_predicate')
 
+    @pytest.fixture
+    def _Fonts_(self, request):
+        return class_mock(request, 'pptx.text.layout._Fonts')
+
     @pytest.fixture
     def _init_(self, request):
         return initializer_mock(request, TextFitter)
@@ -217,6 +260,10 @@ class DescribeTextFitter(object):
     def _rendered_size_(self, request):
         return function_mock(request, 'pptx.text.layout._rendered_size')
 
+    @pytest.fixture
+    def _word_widths_(self, request):
+        return method_mock(request, TextFitter, '_word_widths')
+
     @pytest.fixture
     def _wrap_lines_(self, request):
         return method_mock(request, TextFitter, '_wrap_lines')
@@ -264,34 +311,37 @@ class Describe_BinarySearchTree(object):
 
 class Describe_LineSource(object):
 
-    def it_generates_text_remainder_pairs(self):
-        line_source = _LineSource('foo bar baz')
-        expected = (
-            ('foo',         _LineSource('bar baz')),
-            ('foo bar',     _LineSource('baz')),
-            ('foo bar baz', _LineSource('')),
-        )
-        assert all((a == b) for a, b in zip(expected, line_source))
+    def it_segments_its_text_into_words(self):
+        line_source = _LineSource(' foo  bar\tbaz ')
+        assert line_source.words == ['foo', 'bar', 'baz']
 
 
-# produces different results on Linux, fails Travis-CI
+class Describe_rendered_size(object):
 
-# from pptx.text.layout import _rendered_size
-# from ..unitutil.file import testfile
-# class Describe_rendered_size(object):
+    def it_calculates_the_rendered_size_of_text_at_point_size(self, fixture):
+        text, point_size, font_file, expected_value = fixture
+        extents = _rendered_size(text, point_size, font_file)
+        assert extents == expected_value
 
-#     def it_calculates_the_rendered_size_of_text_at_point_size(self, fixture):
-#         text, point_size, font_file, expected_value = fixture
-#         extents = _rendered_size(text, point_size, font_file)
-#         assert extents == expected_value
+    def but_it_renders_with_Pillow_when_glyph_metrics_are_unavailable(
+            self, request):
+        method_mock(request, _Fonts, 'metrics', return_value=None)
+        font_ = method_mock(request, _Fonts, 'font').return_value
+        font_.getsize.return_value = (72, 18)
 
-#     # fixtures ---------------------------------------------
+        extents = _rendered_size('foobar', 12, 'foo.ttc')
 
-#     @pytest.fixture(params=[
-#         ('Typical',     18, (673100, 254000)),
-#         ('foo bar baz', 12, (698500, 165100)),
-#     ])
-#     def fixture(self, request):
-#         text, point_size, expected_value = request.param
-#         font_file = testfile('calibriz.ttf')
-#         return text, point_size, font_file, expected_value
+        _Fonts.font.assert_called_once_with('foo.ttc', 12)
+        font_.getsize.assert_called_once_with('foobar')
+        assert extents == (914400, 228600)
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture(params=[
+        ('Typical',     18, (668387, 279052)),
+        ('foo bar baz', 12, (713854, 186035)),
+    ])
+    def fixture(self, request):
+        text, point_size, expected_value = request.param
+        font_file = testfile('calibriz.ttf')
+        return text, point_size, font_file, expected_value
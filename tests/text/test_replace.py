@@ -0,0 +1,100 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.text.replace module
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import re
+
+import pytest
+
+from pptx.text.replace import TextReplacer
+
+from ..unitutil.cxml import element, xml
+
+
+class DescribeTextReplacer(object):
+
+    def it_replaces_text_in_the_runs_below_an_element(self, replace_fixture):
+        replacer, txBody, expected_count, expected_xml = replace_fixture
+        count = replacer.replace(txBody)
+        assert count == expected_count
+        assert txBody.xml == expected_xml
+
+    def it_can_replace_regex_matches(self, regex_fixture):
+        find, replace, expected_cxml = regex_fixture
+        txBody = element('p:txBody/a:p/(a:r/a:t"x=1, ",a:r/a:t"y=22")')
+        replacer = TextReplacer.new(find, replace)
+
+        count = replacer.replace(txBody)
+
+        assert count == 2
+        assert txBody.xml == xml(expected_cxml)
+
+    def it_can_replace_a_literal_string(self):
+        txBody = element('p:txBody/a:p/a:r/a:t"a.b a.b"')
+        replacer = TextReplacer.new('a.b', r'\1')
+        count = replacer.replace(txBody)
+        assert count == 2
+        assert txBody.xml == xml('p:txBody/a:p/a:r/a:t"\\1 \\1"')
+
+    def it_raises_on_an_invalid_find_or_replace(self, raises_fixture):
+        find, replace, exception_type = raises_fixture
+        with pytest.raises(exception_type):
+            TextReplacer.new(find, replace)
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture(params=[
+        # ---token within a single run---
+        ('p:txBody/a:p/a:r/a:t"Hi {name}!"', 1,
+         'p:txBody/a:p/a:r/a:t"Hi Bob!"'),
+        # ---no match leaves text untouched---
+        ('p:txBody/a:p/a:r/a:t"Hi {other}"', 0,
+         'p:txBody/a:p/a:r/a:t"Hi {other}"'),
+        # ---token split across runs takes format of run where it starts---
+        ('p:txBody/a:p/(a:r/(a:rPr{b=1},a:t"Hi {na"),a:r/a:t"me}!")', 1,
+         'p:txBody/a:p/(a:r/(a:rPr{b=1},a:t"Hi Bob"),a:r/a:t"!")'),
+        # ---token spanning three runs empties the middle one---
+        ('p:txBody/a:p/(a:r/a:t"{n",a:r/a:t"am",a:r/a:t"e}.")', 1,
+         'p:txBody/a:p/(a:r/a:t"Bob",a:r/a:t,a:r/a:t".")'),
+        # ---several tokens, longest key found first---
+        ('p:txBody/(a:p/a:r/a:t"{name}{n}",a:p/a:r/a:t"{name}")', 3,
+         'p:txBody/(a:p/a:r/a:t"BobN",a:p/a:r/a:t"Bob")'),
+        # ---a line break separates runs---
+        ('p:txBody/a:p/(a:r/a:t"{na",a:br,a:r/a:t"me}")', 0,
+         'p:txBody/a:p/(a:r/a:t"{na",a:br,a:r/a:t"me}")'),
+        # ---paragraphs are matched separately---
+        ('p:txBody/(a:p/a:r/a:t"{na",a:p/a:r/a:t"me}")', 0,
+         'p:txBody/(a:p/a:r/a:t"{na",a:p/a:r/a:t"me}")'),
+        # ---field text is not matched---
+        ('p:txBody/a:p/a:fld/a:t"{name}"', 0,
+         'p:txBody/a:p/a:fld/a:t"{name}"'),
+    ])
+    def replace_fixture(self, request):
+        txBody_cxml, expected_count, expected_cxml = request.param
+        replacer = TextReplacer.new({'{name}': 'Bob', '{n}': 'N'})
+        txBody = element(txBody_cxml)
+        expected_xml = xml(expected_cxml)
+        return replacer, txBody, expected_count, expected_xml
+
+    @pytest.fixture(params=[
+        (r'(\w)=(\d+)', r'\2=\1',
+         'p:txBody/a:p/(a:r/a:t"1=x, ",a:r/a:t"22=y")'),
+        (r'\d+', lambda match: str(len(match.group(0))),
+         'p:txBody/a:p/(a:r/a:t"x=1, ",a:r/a:t"y=2")'),
+    ])
+    def regex_fixture(self, request):
+        pattern, replace, expected_cxml = request.param
+        return re.compile(pattern), replace, expected_cxml
+
+    @pytest.fixture(params=[
+        ({'': 'foo'},     None,  ValueError),
+        ('',              'foo', ValueError),
+        ('foo',           None,  TypeError),
+        (re.compile('f'), None,  TypeError),
+    ])
+    def raises_fixture(self, request):
+        return request.param
@@ -9,14 +9,16 @@ from __future__ import absolute_import, print_function
 import pytest
 
 from pptx.compat import is_unicode
-from pptx.dml.color import ColorFormat
+from pptx.dml.color import ColorFormat, RGBColor
 from pptx.dml.fill import FillFormat
 from pptx.enum.lang import MSO_LANGUAGE_ID
 from pptx.enum.text import MSO_ANCHOR, MSO_AUTO_SIZE, MSO_UNDERLINE, PP_ALIGN
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.package import Part
 from pptx.shapes.autoshape import Shape
-from pptx.text.text import Font, _Hyperlink, _Paragraph, _Run, TextFrame
+from pptx.text.text import (
+    fit_many, Font, _Hyperlink, _Paragraph, _Run, TextFrame
+)
 from pptx.util import Inches, Pt
 
 from ..oxml.unitdata.text import a_p, a_t, an_hlinkClick, an_r, an_rPr
@@ -87,6 +89,35 @@ class DescribeTextFrame(object):
         text_frame.text = text
         assert text_frame._element.xml == expected_xml
 
+    def it_can_set_its_text_from_a_rich_text_spec(self, rich_text_fixture):
+        text_frame, spec, expected_xml = rich_text_fixture
+        text_frame.set_rich_text(spec)
+        assert text_frame._txBody.xml == expected_xml
+
+    def it_adds_a_hyperlink_relationship_once_per_rich_text_url(
+            self, request):
+        part_ = instance_mock(request, Part)
+        part_.relate_to.return_value = 'rId9'
+        property_mock(request, TextFrame, 'part', return_value=part_)
+        text_frame = TextFrame(element('p:txBody/(a:bodyPr,a:p)'), None)
+
+        text_frame.set_rich_text(['[a](http://x) [b](http://x)'])
+
+        part_.relate_to.assert_called_once_with(
+            'http://x', RT.HYPERLINK, is_external=True
+        )
+        hlinkClicks = text_frame._txBody.xpath('a:p/a:r/a:rPr/a:hlinkClick')
+        assert [hlinkClick.rId for hlinkClick in hlinkClicks] == [
+            'rId9', 'rId9'
+        ]
+        assert text_frame.text == 'a b'
+
+    def it_raises_on_an_invalid_rich_text_spec(self, rich_raises_fixture):
+        spec, exception_type = rich_raises_fixture
+        text_frame = TextFrame(element('p:txBody/(a:bodyPr,a:p)'), None)
+        with pytest.raises(exception_type):
+            text_frame.set_rich_text(spec)
+
     def it_raises_on_attempt_to_set_margin_to_non_int(self):
         text_frame = TextFrame(element('p:txBody/a:bodyPr'), None)
         with pytest.raises(TypeError):
@@ -115,6 +146,18 @@ class DescribeTextFrame(object):
             family, font_size, bold, italic
         )
 
+    def but_it_raises_when_the_text_does_not_fit_at_any_size(
+            self, text_prop_, _best_fit_font_size_, _apply_fit_):
+        text_prop_.return_value = 'some text'
+        _best_fit_font_size_.return_value = None
+        text_frame = TextFrame(None, None)
+
+        with pytest.raises(ValueError) as e:
+            text_frame.fit_text()
+
+        assert str(e.value) == 'text does not fit at any size'
+        assert _apply_fit_.call_count == 0
+
     def it_calculates_its_best_fit_font_size_to_help_fit_text(
             self, size_font_fixture):
         text_frame, family, max_size, bold, italic = size_font_fixture[:5]
@@ -276,6 +319,44 @@ class DescribeTextFrame(object):
         ps = txBody.xpath('.//a:p')
         return text_frame, ps
 
+    @pytest.fixture(params=[
+        ([], 'p:txBody/(a:bodyPr,a:p)'),
+        (['foo', 'bar\nbaz'],
+         'p:txBody/(a:bodyPr,a:p/a:r/a:t"foo",a:p/(a:r/a:t"bar",a:br,a:r/a:t"'
+         'baz"))'),
+        (['a **b** *c* \\*d'],
+         'p:txBody/(a:bodyPr,a:p/(a:r/a:t"a ",a:r/(a:rPr{b=1},a:t"b"),a:r/a'
+         ':t" ",a:r/(a:rPr{i=1},a:t"c"),a:r/a:t" *d"))'),
+        (['**bold *both***'],
+         'p:txBody/(a:bodyPr,a:p/(a:r/(a:rPr{b=1},a:t"bold "),a:r/(a:rPr{b='
+         '1,i=1},a:t"both")))'),
+        (['\t\tfoo', (1, '*bar*'), (0, ['baz'])],
+         'p:txBody/(a:bodyPr,a:p/(a:pPr{lvl=2},a:r/a:t"foo"),a:p/(a:pPr{lvl'
+         '=1},a:r/(a:rPr{i=1},a:t"bar")),a:p/a:r/a:t"baz")'),
+        ([(0, [('foo', {'size': Pt(14), 'color': RGBColor(1, 2, 3)}),
+               ('bar', {'bold': False, 'color': 'F0F0F0'}),
+               ('baz', {})])],
+         'p:txBody/(a:bodyPr,a:p/(a:r/(a:rPr{sz=1400}/a:solidFill/a:srgbClr'
+         '{val=010203},a:t"foo"),a:r/(a:rPr{b=0}/a:solidFill/a:srgbClr{val='
+         'F0F0F0},a:t"bar"),a:r/a:t"baz"))'),
+    ])
+    def rich_text_fixture(self, request):
+        spec, expected_cxml = request.param
+        txBody = element('p:txBody/(a:bodyPr,a:p/a:r/a:t"old",a:p)')
+        text_frame = TextFrame(txBody, None)
+        expected_xml = xml(expected_cxml)
+        return text_frame, spec, expected_xml
+
+    @pytest.fixture(params=[
+        ([(9, 'foo')],                        ValueError),
+        ([(0, [('foo', {'underline': 1})])],  ValueError),
+        ([(0, [('foo', {'size': Pt(0.5)})])], ValueError),
+        ([(0, [('foo', {'color': 'F0F0'})])], ValueError),
+        ([(0, [('foo', {'color': 0xF0F0F0})])], ValueError),
+    ])
+    def rich_raises_fixture(self, request):
+        return request.param
+
     @pytest.fixture(params=[
         ('p:txBody/(a:bodyPr,a:p/a:r)', True, False,
          'p:txBody/(a:bodyPr,a:p/(a:r/a:rPr{sz=600,b=1,i=0}/a:latin{typeface'
@@ -373,7 +454,7 @@ class DescribeTextFrame(object):
 
     @pytest.fixture
     def FontFiles_(self, request):
-        return class_mock(request, 'pptx.text.text.FontFiles')
+        return class_mock(request, 'pptx.text.fonts.FontFiles')
 
     @pytest.fixture
     def _set_font_(self, request):
@@ -381,7 +462,7 @@ class DescribeTextFrame(object):
 
     @pytest.fixture
     def TextFitter_(self, request):
-        return class_mock(request, 'pptx.text.text.TextFitter')
+        return class_mock(request, 'pptx.text.layout.TextFitter')
 
     @pytest.fixture
     def text_frame_with_parent_(self, request):
@@ -394,6 +475,71 @@ class DescribeTextFrame(object):
         return property_mock(request, TextFrame, 'text')
 
 
+class DescribeFitMany(object):
+
+    def it_fits_the_text_of_each_text_frame(self, request, FontFiles_,
+                                            TextFitter_):
+        text_frames = [
+            TextFrame(element(cxml), None) for cxml in (
+                'p:txBody/(a:bodyPr,a:p/a:r/a:t"foo")',
+                'p:txBody/(a:bodyPr,a:p)',
+                'p:txBody/(a:bodyPr,a:p/a:r/a:t"bar")',
+            )
+        ]
+        property_mock(request, TextFrame, '_extents', return_value=(4, 2))
+        FontFiles_.find.return_value = 'f.ttf'
+        TextFitter_.best_fit_font_sizes.return_value = [12, 9]
+
+        font_sizes = fit_many(text_frames, 'Family', 42, True, False,
+                              workers=3)
+
+        FontFiles_.find.assert_called_once_with('Family', True, False)
+        TextFitter_.best_fit_font_sizes.assert_called_once_with(
+            [('foo', (4, 2)), ('bar', (4, 2))], 42, 'f.ttf', 3, False
+        )
+        assert [tf._txBody.xml for tf in text_frames] == [
+            xml('p:txBody/(a:bodyPr{wrap=square}/a:noAutofit,a:p/(a:r/(a:rPr'
+                '{sz=1200,b=1,i=0}/a:latin{typeface=Family},a:t"foo"),a:endPa'
+                'raRPr{sz=1200,b=1,i=0}/a:latin{typeface=Family}))'),
+            xml('p:txBody/(a:bodyPr,a:p)'),
+            xml('p:txBody/(a:bodyPr{wrap=square}/a:noAutofit,a:p/(a:r/(a:rPr'
+                '{sz=900,b=1,i=0}/a:latin{typeface=Family},a:t"bar"),a:endPar'
+                'aRPr{sz=900,b=1,i=0}/a:latin{typeface=Family}))'),
+        ]
+        assert font_sizes == [12, None, 9]
+
+    def but_it_changes_no_frame_when_the_text_of_one_does_not_fit(
+            self, request, FontFiles_, TextFitter_):
+        cxml = 'p:txBody/(a:bodyPr,a:p/a:r/a:t"foo")'
+        text_frames = [TextFrame(element(cxml), None) for _ in range(3)]
+        property_mock(request, TextFrame, '_extents', return_value=(4, 2))
+        TextFitter_.best_fit_font_sizes.return_value = [12, None, 9]
+
+        with pytest.raises(ValueError) as e:
+            fit_many(text_frames)
+
+        assert str(e.value) == 'text of text frame 1 does not fit at any size'
+        assert [tf._txBody.xml for tf in text_frames] == [xml(cxml)] * 3
+
+    def but_it_does_nothing_when_no_text_frame_has_text(
+            self, FontFiles_, TextFitter_):
+        text_frame = TextFrame(element('p:txBody/(a:bodyPr,a:p)'), None)
+        font_sizes = fit_many([text_frame])
+        assert FontFiles_.find.call_count == 0
+        assert TextFitter_.best_fit_font_sizes.call_count == 0
+        assert font_sizes == [None]
+
+    # fixture components -----------------------------------
+
+    @pytest.fixture
+    def FontFiles_(self, request):
+        return class_mock(request, 'pptx.text.fonts.FontFiles')
+
+    @pytest.fixture
+    def TextFitter_(self, request):
+        return class_mock(request, 'pptx.text.layout.TextFitter')
+
+
 class DescribeFont(object):
 
     def it_knows_its_bold_setting(self, bold_get_fixture):